@@ -34,6 +34,8 @@ from .exceptions import (
     MalformedRequest,
     RateLimitError,
     RateLimitWarning,
+    ReplayError,
+    TaskError,
     VersionError,
     dnacentersdkException,
 )
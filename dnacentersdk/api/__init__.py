@@ -23,6 +23,9 @@ SOFTWARE.
 """
 
 
+import importlib
+import threading
+
 from dnacentersdk.config import (
     DEFAULT_DEBUG,
     DEFAULT_VERSION,
@@ -31,370 +34,344 @@ from dnacentersdk.config import (
     DEFAULT_WAIT_ON_RATE_LIMIT,
     DEFAULT_VERIFY,
     DEFAULT_VERIFY_USER_AGENT,
+    DEFAULT_VALIDATION,
+    DEFAULT_JSON_DECODER,
+    DEFAULT_POOL_BLOCK,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_TOKEN_REFRESH_MARGIN,
+    VALIDATION_MODES,
 )
 import dnacentersdk.environment as dnacenter_environment
 from dnacentersdk.exceptions import AccessTokenError, VersionError
 from dnacentersdk.models.mydict import mydict_data_factory
-from dnacentersdk.models.schema_validator import SchemaValidator
+from dnacentersdk.models.schema_cache import set_schema_cache_dir
+from dnacentersdk.models.schema_validator import (
+    SchemaValidator,
+    no_op_json_schema_validate,
+)
+from dnacentersdk.metrics import MetricsHook
+from dnacentersdk.rate_limiter import RateLimiter
 from dnacentersdk.restsession import RestSession
+from dnacentersdk.retry import RetryPolicy
+from dnacentersdk.tasks import TaskWaiter
+from dnacentersdk.token_store import FileTokenStore, TokenStore
 from dnacentersdk.utils import check_type
 
 from .authentication import Authentication
-
-from .v2_3_5_3.application_policy import ApplicationPolicy as ApplicationPolicy_v2_3_5_3
-from .v2_3_5_3.applications import Applications as Applications_v2_3_5_3
-from .v2_3_5_3.authentication_management import (
-    AuthenticationManagement as AuthenticationManagement_v2_3_5_3,
-)
-from .v2_3_5_3.cisco_dna_center_system import (
-    CiscoDnaCenterSystem as CiscoDnaCenterSystem_v2_3_5_3,
-)
-from .v2_3_5_3.clients import Clients as Clients_v2_3_5_3
-from .v2_3_5_3.command_runner import CommandRunner as CommandRunner_v2_3_5_3
-from .v2_3_5_3.compliance import Compliance as Compliance_v2_3_5_3
-from .v2_3_5_3.configuration_archive import (
-    ConfigurationArchive as ConfigurationArchive_v2_3_5_3,
-)
-from .v2_3_5_3.configuration_templates import (
-    ConfigurationTemplates as ConfigurationTemplates_v2_3_5_3,
-)
-from .v2_3_5_3.device_onboarding_pnp import (
-    DeviceOnboardingPnp as DeviceOnboardingPnp_v2_3_5_3,
-)
-from .v2_3_5_3.device_replacement import DeviceReplacement as DeviceReplacement_v2_3_5_3
-from .v2_3_5_3.devices import Devices as Devices_v2_3_5_3
-from .v2_3_5_3.discovery import Discovery as Discovery_v2_3_5_3
-from .v2_3_5_3.eox import Eox as Eox_v2_3_5_3
-from .v2_3_5_3.event_management import EventManagement as EventManagement_v2_3_5_3
-from .v2_3_5_3.fabric_wireless import FabricWireless as FabricWireless_v2_3_5_3
-from .v2_3_5_3.file import File as File_v2_3_5_3
-from .v2_3_5_3.health_and_performance import (
-    HealthAndPerformance as HealthAndPerformance_v2_3_5_3,
-)
-from .v2_3_5_3.itsm import Itsm as Itsm_v2_3_5_3
-from .v2_3_5_3.itsm_integration import ItsmIntegration as ItsmIntegration_v2_3_5_3
-from .v2_3_5_3.issues import Issues as Issues_v2_3_5_3
-from .v2_3_5_3.lan_automation import LanAutomation as LanAutomation_v2_3_5_3
-from .v2_3_5_3.licenses import Licenses as Licenses_v2_3_5_3
-from .v2_3_5_3.network_settings import NetworkSettings as NetworkSettings_v2_3_5_3
-from .v2_3_5_3.path_trace import PathTrace as PathTrace_v2_3_5_3
-from .v2_3_5_3.platform import Platform as Platform_v2_3_5_3
-from .v2_3_5_3.reports import Reports as Reports_v2_3_5_3
-from .v2_3_5_3.sda import Sda as Sda_v2_3_5_3
-from .v2_3_5_3.security_advisories import (
-    SecurityAdvisories as SecurityAdvisories_v2_3_5_3,
-)
-from .v2_3_5_3.sensors import Sensors as Sensors_v2_3_5_3
-from .v2_3_5_3.site_design import SiteDesign as SiteDesign_v2_3_5_3
-from .v2_3_5_3.sites import Sites as Sites_v2_3_5_3
-from .v2_3_5_3.software_image_management_swim import (
-    SoftwareImageManagementSwim as SoftwareImageManagementSwim_v2_3_5_3,
-)
-from .v2_3_5_3.system_settings import SystemSettings as SystemSettings_v2_3_5_3
-from .v2_3_5_3.tag import Tag as Tag_v2_3_5_3
-from .v2_3_5_3.task import Task as Task_v2_3_5_3
-from .v2_3_5_3.topology import Topology as Topology_v2_3_5_3
-from .v2_3_5_3.user_and_roles import UserandRoles as UserandRoles_v2_3_5_3
-from .v2_3_5_3.users import Users as Users_v2_3_5_3
-from .v2_3_5_3.wireless import Wireless as Wireless_v2_3_5_3
-
-from .v2_3_7_6.ai_endpoint_analytics import (
-    AIEndpointAnalytics as AIEndpointAnalytics_v2_3_7_6,
-)
-from .v2_3_7_6.application_policy import ApplicationPolicy as ApplicationPolicy_v2_3_7_6
-from .v2_3_7_6.applications import Applications as Applications_v2_3_7_6
-from .v2_3_7_6.cisco_trusted_certificates import (
-    CiscoTrustedCertificates as CiscoTrustedCertificates_v2_3_7_6,
-)
-from .v2_3_7_6.clients import Clients as Clients_v2_3_7_6
-from .v2_3_7_6.command_runner import CommandRunner as CommandRunner_v2_3_7_6
-from .v2_3_7_6.compliance import Compliance as Compliance_v2_3_7_6
-from .v2_3_7_6.configuration_archive import (
-    ConfigurationArchive as ConfigurationArchive_v2_3_7_6,
-)
-from .v2_3_7_6.configuration_templates import (
-    ConfigurationTemplates as ConfigurationTemplates_v2_3_7_6,
-)
-from .v2_3_7_6.device_onboarding_pnp import (
-    DeviceOnboardingPnp as DeviceOnboardingPnp_v2_3_7_6,
-)
-from .v2_3_7_6.device_replacement import DeviceReplacement as DeviceReplacement_v2_3_7_6
-from .v2_3_7_6.devices import Devices as Devices_v2_3_7_6
-from .v2_3_7_6.authentication_management import (
-    AuthenticationManagement as AuthenticationManagement_v2_3_7_6,
-)
-from .v2_3_7_6.disaster_recovery import DisasterRecovery as DisasterRecovery_v2_3_7_6
-from .v2_3_7_6.discovery import Discovery as Discovery_v2_3_7_6
-from .v2_3_7_6.eox import EoX as EoX_v2_3_7_6
-from .v2_3_7_6.event_management import EventManagement as EventManagement_v2_3_7_6
-from .v2_3_7_6.fabric_wireless import FabricWireless as FabricWireless_v2_3_7_6
-from .v2_3_7_6.file import File as File_v2_3_7_6
-from .v2_3_7_6.health_and_performance import (
-    HealthAndPerformance as HealthAndPerformance_v2_3_7_6,
-)
-from .v2_3_7_6.itsm import Itsm as Itsm_v2_3_7_6
-from .v2_3_7_6.itsm_integration import ItsmIntegration as ItsmIntegration_v2_3_7_6
-from .v2_3_7_6.issues import Issues as Issues_v2_3_7_6
-from .v2_3_7_6.lan_automation import LanAutomation as LanAutomation_v2_3_7_6
-from .v2_3_7_6.licenses import Licenses as Licenses_v2_3_7_6
-from .v2_3_7_6.network_settings import NetworkSettings as NetworkSettings_v2_3_7_6
-from .v2_3_7_6.path_trace import PathTrace as PathTrace_v2_3_7_6
-from .v2_3_7_6.platform import Platform as Platform_v2_3_7_6
-from .v2_3_7_6.reports import Reports as Reports_v2_3_7_6
-from .v2_3_7_6.sda import Sda as Sda_v2_3_7_6
-from .v2_3_7_6.security_advisories import (
-    SecurityAdvisories as SecurityAdvisories_v2_3_7_6,
-)
-from .v2_3_7_6.sensors import Sensors as Sensors_v2_3_7_6
-from .v2_3_7_6.site_design import SiteDesign as SiteDesign_v2_3_7_6
-from .v2_3_7_6.sites import Sites as Sites_v2_3_7_6
-from .v2_3_7_6.software_image_management_swim import (
-    SoftwareImageManagementSwim as SoftwareImageManagementSwim_v2_3_7_6,
-)
-from .v2_3_7_6.system_settings import SystemSettings as SystemSettings_v2_3_7_6
-from .v2_3_7_6.tag import Tag as Tag_v2_3_7_6
-from .v2_3_7_6.task import Task as Task_v2_3_7_6
-from .v2_3_7_6.topology import Topology as Topology_v2_3_7_6
-from .v2_3_7_6.user_and_roles import UserandRoles as UserandRoles_v2_3_7_6
-from .v2_3_7_6.users import Users as Users_v2_3_7_6
-from .v2_3_7_6.wireless import Wireless as Wireless_v2_3_7_6
-from .v2_3_7_9.ai_endpoint_analytics import (
-    AIEndpointAnalytics as AIEndpointAnalytics_v2_3_7_9,
-)
-from .v2_3_7_9.application_policy import ApplicationPolicy as ApplicationPolicy_v2_3_7_9
-from .v2_3_7_9.applications import Applications as Applications_v2_3_7_9
-from .v2_3_7_9.authentication_management import (
-    AuthenticationManagement as AuthenticationManagement_v2_3_7_9,
-)
-from .v2_3_7_9.backup import Backup as Backup_v2_3_7_9
-from .v2_3_7_9.cisco_i_m_c import CiscoIMC as CiscoIMC_v2_3_7_9
-from .v2_3_7_9.cisco_trusted_certificates import (
-    CiscoTrustedCertificates as CiscoTrustedCertificates_v2_3_7_9,
-)
-from .v2_3_7_9.clients import Clients as Clients_v2_3_7_9
-from .v2_3_7_9.command_runner import CommandRunner as CommandRunner_v2_3_7_9
-from .v2_3_7_9.compliance import Compliance as Compliance_v2_3_7_9
-from .v2_3_7_9.configuration_archive import (
-    ConfigurationArchive as ConfigurationArchive_v2_3_7_9,
-)
-from .v2_3_7_9.configuration_templates import (
-    ConfigurationTemplates as ConfigurationTemplates_v2_3_7_9,
-)
-from .v2_3_7_9.device_onboarding_pnp import (
-    DeviceOnboardingPnp as DeviceOnboardingPnp_v2_3_7_9,
-)
-from .v2_3_7_9.device_replacement import DeviceReplacement as DeviceReplacement_v2_3_7_9
-from .v2_3_7_9.devices import Devices as Devices_v2_3_7_9
-from .v2_3_7_9.disaster_recovery import DisasterRecovery as DisasterRecovery_v2_3_7_9
-from .v2_3_7_9.discovery import Discovery as Discovery_v2_3_7_9
-from .v2_3_7_9.eox import Eox as Eox_v2_3_7_9
-from .v2_3_7_9.event_management import EventManagement as EventManagement_v2_3_7_9
-from .v2_3_7_9.fabric_wireless import FabricWireless as FabricWireless_v2_3_7_9
-from .v2_3_7_9.file import File as File_v2_3_7_9
-from .v2_3_7_9.health_and_performance import (
-    HealthAndPerformance as HealthAndPerformance_v2_3_7_9,
-)
-from .v2_3_7_9.itsm import Itsm as Itsm_v2_3_7_9
-from .v2_3_7_9.itsm_integration import ItsmIntegration as ItsmIntegration_v2_3_7_9
-from .v2_3_7_9.industrial_configuration import (
-    IndustrialConfiguration as IndustrialConfiguration_v2_3_7_9,
-)
-from .v2_3_7_9.issues import Issues as Issues_v2_3_7_9
-from .v2_3_7_9.know_your_network import KnowYourNetwork as KnowYourNetwork_v2_3_7_9
-from .v2_3_7_9.lan_automation import LanAutomation as LanAutomation_v2_3_7_9
-from .v2_3_7_9.licenses import Licenses as Licenses_v2_3_7_9
-from .v2_3_7_9.network_settings import NetworkSettings as NetworkSettings_v2_3_7_9
-from .v2_3_7_9.path_trace import PathTrace as PathTrace_v2_3_7_9
-from .v2_3_7_9.platform import Platform as Platform_v2_3_7_9
-from .v2_3_7_9.reports import Reports as Reports_v2_3_7_9
-from .v2_3_7_9.restore import Restore as Restore_v2_3_7_9
-from .v2_3_7_9.sda import Sda as Sda_v2_3_7_9
-from .v2_3_7_9.security_advisories import (
-    SecurityAdvisories as SecurityAdvisories_v2_3_7_9,
-)
-from .v2_3_7_9.sensors import Sensors as Sensors_v2_3_7_9
-from .v2_3_7_9.site_design import SiteDesign as SiteDesign_v2_3_7_9
-from .v2_3_7_9.sites import Sites as Sites_v2_3_7_9
-from .v2_3_7_9.software_image_management_swim import (
-    SoftwareImageManagementSwim as SoftwareImageManagementSwim_v2_3_7_9,
-)
-from .v2_3_7_9.system_settings import SystemSettings as SystemSettings_v2_3_7_9
-from .v2_3_7_9.tag import Tag as Tag_v2_3_7_9
-from .v2_3_7_9.task import Task as Task_v2_3_7_9
-from .v2_3_7_9.topology import Topology as Topology_v2_3_7_9
-from .v2_3_7_9.user_and_roles import UserandRoles as UserandRoles_v2_3_7_9
-from .v2_3_7_9.users import Users as Users_v2_3_7_9
-from .v2_3_7_9.wired import Wired as Wired_v2_3_7_9
-from .v2_3_7_9.wireless import Wireless as Wireless_v2_3_7_9
-from .v3_1_3_0.ai_endpoint_analytics import (
-    AIEndpointAnalytics as AIEndpointAnalytics_v3_1_3_0,
-)
-from .v3_1_3_0.application_policy import ApplicationPolicy as ApplicationPolicy_v3_1_3_0
-from .v3_1_3_0.applications import Applications as Applications_v3_1_3_0
-from .v3_1_3_0.authentication_management import (
-    AuthenticationManagement as AuthenticationManagement_v3_1_3_0,
-)
-from .v3_1_3_0.backup import Backup as Backup_v3_1_3_0
-from .v3_1_3_0.cisco_i_m_c import CiscoIMC as CiscoIMC_v3_1_3_0
-from .v3_1_3_0.cisco_trusted_certificates import (
-    CiscoTrustedCertificates as CiscoTrustedCertificates_v3_1_3_0,
-)
-from .v3_1_3_0.clients import Clients as Clients_v3_1_3_0
-from .v3_1_3_0.command_runner import CommandRunner as CommandRunner_v3_1_3_0
-from .v3_1_3_0.compliance import Compliance as Compliance_v3_1_3_0
-from .v3_1_3_0.configuration_archive import (
-    ConfigurationArchive as ConfigurationArchive_v3_1_3_0,
-)
-from .v3_1_3_0.configuration_templates import (
-    ConfigurationTemplates as ConfigurationTemplates_v3_1_3_0,
-)
-from .v3_1_3_0.device_onboarding_pnp import (
-    DeviceOnboardingPnp as DeviceOnboardingPnp_v3_1_3_0,
-)
-from .v3_1_3_0.device_replacement import DeviceReplacement as DeviceReplacement_v3_1_3_0
-from .v3_1_3_0.devices import Devices as Devices_v3_1_3_0
-from .v3_1_3_0.disaster_recovery import DisasterRecovery as DisasterRecovery_v3_1_3_0
-from .v3_1_3_0.discovery import Discovery as Discovery_v3_1_3_0
-from .v3_1_3_0.eox import Eox as Eox_v3_1_3_0
-from .v3_1_3_0.event_management import EventManagement as EventManagement_v3_1_3_0
-from .v3_1_3_0.fabric_wireless import FabricWireless as FabricWireless_v3_1_3_0
-from .v3_1_3_0.file import File as File_v3_1_3_0
-from .v3_1_3_0.health_and_performance import (
-    HealthAndPerformance as HealthAndPerformance_v3_1_3_0,
-)
-from .v3_1_3_0.itsm import Itsm as Itsm_v3_1_3_0
-from .v3_1_3_0.itsm_integration import ItsmIntegration as ItsmIntegration_v3_1_3_0
-from .v3_1_3_0.industrial_configuration import (
-    IndustrialConfiguration as IndustrialConfiguration_v3_1_3_0,
-)
-from .v3_1_3_0.issues import Issues as Issues_v3_1_3_0
-from .v3_1_3_0.know_your_network import KnowYourNetwork as KnowYourNetwork_v3_1_3_0
-from .v3_1_3_0.lan_automation import LanAutomation as LanAutomation_v3_1_3_0
-from .v3_1_3_0.licenses import Licenses as Licenses_v3_1_3_0
-from .v3_1_3_0.network_settings import NetworkSettings as NetworkSettings_v3_1_3_0
-from .v3_1_3_0.path_trace import PathTrace as PathTrace_v3_1_3_0
-from .v3_1_3_0.platform import Platform as Platform_v3_1_3_0
-from .v3_1_3_0.reports import Reports as Reports_v3_1_3_0
-from .v3_1_3_0.restore import Restore as Restore_v3_1_3_0
-from .v3_1_3_0.sda import Sda as Sda_v3_1_3_0
-from .v3_1_3_0.security_advisories import (
-    SecurityAdvisories as SecurityAdvisories_v3_1_3_0,
-)
-from .v3_1_3_0.sensors import Sensors as Sensors_v3_1_3_0
-from .v3_1_3_0.site_design import SiteDesign as SiteDesign_v3_1_3_0
-from .v3_1_3_0.sites import Sites as Sites_v3_1_3_0
-from .v3_1_3_0.software_image_management_swim import (
-    SoftwareImageManagementSwim as SoftwareImageManagementSwim_v3_1_3_0,
-)
-from .v3_1_3_0.system_settings import SystemSettings as SystemSettings_v3_1_3_0
-from .v3_1_3_0.tag import Tag as Tag_v3_1_3_0
-from .v3_1_3_0.task import Task as Task_v3_1_3_0
-from .v3_1_3_0.topology import Topology as Topology_v3_1_3_0
-from .v3_1_3_0.user_and_roles import UserandRoles as UserandRoles_v3_1_3_0
-from .v3_1_3_0.users import Users as Users_v3_1_3_0
-from .v3_1_3_0.wired import Wired as Wired_v3_1_3_0
-from .v3_1_3_0.wireless import Wireless as Wireless_v3_1_3_0
-from .v3_1_6_0.ai_endpoint_analytics import \
-    AiEndpointAnalytics as AiEndpointAnalytics_v3_1_6_0
-from .v3_1_6_0.application_policy import \
-    ApplicationPolicy as ApplicationPolicy_v3_1_6_0
-from .v3_1_6_0.applications import \
-    Applications as Applications_v3_1_6_0
-from .v3_1_6_0.authentication_management import \
-    AuthenticationManagement as AuthenticationManagement_v3_1_6_0
-from .v3_1_6_0.backup import \
-    Backup as Backup_v3_1_6_0
-from .v3_1_6_0.cisco_imc import \
-    CiscoIMC as CiscoIMC_v3_1_6_0
-from .v3_1_6_0.cisco_trusted_certificates import \
-    CiscoTrustedCertificates as CiscoTrustedCertificates_v3_1_6_0
-from .v3_1_6_0.clients import \
-    Clients as Clients_v3_1_6_0
-from .v3_1_6_0.command_runner import \
-    CommandRunner as CommandRunner_v3_1_6_0
-from .v3_1_6_0.compliance import \
-    Compliance as Compliance_v3_1_6_0
-from .v3_1_6_0.configuration_archive import \
-    ConfigurationArchive as ConfigurationArchive_v3_1_6_0
-from .v3_1_6_0.configuration_templates import \
-    ConfigurationTemplates as ConfigurationTemplates_v3_1_6_0
-from .v3_1_6_0.device_onboarding_pnp import \
-    DeviceOnboardingPnp as DeviceOnboardingPnp_v3_1_6_0
-from .v3_1_6_0.device_replacement import \
-    DeviceReplacement as DeviceReplacement_v3_1_6_0
-from .v3_1_6_0.devices import \
-    Devices as Devices_v3_1_6_0
-from .v3_1_6_0.disaster_recovery import \
-    DisasterRecovery as DisasterRecovery_v3_1_6_0
-from .v3_1_6_0.discovery import \
-    Discovery as Discovery_v3_1_6_0
-from .v3_1_6_0.eox import \
-    Eox as Eox_v3_1_6_0
-from .v3_1_6_0.event_management import \
-    EventManagement as EventManagement_v3_1_6_0
-from .v3_1_6_0.fabric_wireless import \
-    FabricWireless as FabricWireless_v3_1_6_0
-from .v3_1_6_0.file import \
-    File as File_v3_1_6_0
-from .v3_1_6_0.health_and_performance import \
-    HealthAndPerformance as HealthAndPerformance_v3_1_6_0
-from .v3_1_6_0.itsm import \
-    Itsm as Itsm_v3_1_6_0
-from .v3_1_6_0.itsm_integration import \
-    ItsmIntegration as ItsmIntegration_v3_1_6_0
-from .v3_1_6_0.industrial_configuration import \
-    IndustrialConfiguration as IndustrialConfiguration_v3_1_6_0
-from .v3_1_6_0.issues import \
-    Issues as Issues_v3_1_6_0
-from .v3_1_6_0.know_your_network import \
-    KnowYourNetwork as KnowYourNetwork_v3_1_6_0
-from .v3_1_6_0.lan_automation import \
-    LanAutomation as LanAutomation_v3_1_6_0
-from .v3_1_6_0.licenses import \
-    Licenses as Licenses_v3_1_6_0
-from .v3_1_6_0.network_settings import \
-    NetworkSettings as NetworkSettings_v3_1_6_0
-from .v3_1_6_0.path_trace import \
-    PathTrace as PathTrace_v3_1_6_0
-from .v3_1_6_0.platform import \
-    Platform as Platform_v3_1_6_0
-from .v3_1_6_0.reports import \
-    Reports as Reports_v3_1_6_0
-from .v3_1_6_0.restore import \
-    Restore as Restore_v3_1_6_0
-from .v3_1_6_0.sda import \
-    Sda as Sda_v3_1_6_0
-from .v3_1_6_0.security_advisories import \
-    SecurityAdvisories as SecurityAdvisories_v3_1_6_0
-from .v3_1_6_0.sensors import \
-    Sensors as Sensors_v3_1_6_0
-from .v3_1_6_0.site_design import \
-    SiteDesign as SiteDesign_v3_1_6_0
-from .v3_1_6_0.sites import \
-    Sites as Sites_v3_1_6_0
-from .v3_1_6_0.software_image_management_swim import \
-    SoftwareImageManagementSwim as SoftwareImageManagementSwim_v3_1_6_0
-from .v3_1_6_0.system_settings import \
-    SystemSettings as SystemSettings_v3_1_6_0
-from .v3_1_6_0.system_software_upgrade import \
-    SystemSoftwareUpgrade as SystemSoftwareUpgrade_v3_1_6_0
-from .v3_1_6_0.tag import \
-    Tag as Tag_v3_1_6_0
-from .v3_1_6_0.task import \
-    Task as Task_v3_1_6_0
-from .v3_1_6_0.topology import \
-    Topology as Topology_v3_1_6_0
-from .v3_1_6_0.user_and_roles import \
-    UserandRoles as UserandRoles_v3_1_6_0
-from .v3_1_6_0.users import \
-    Users as Users_v3_1_6_0
-from .v3_1_6_0.wired import \
-    Wired as Wired_v3_1_6_0
-from .v3_1_6_0.wireless import \
-    Wireless as Wireless_v3_1_6_0
 from .custom_caller import CustomCaller
 
 
+#: API wrappers by DNA Center version: attribute -> (module, class).
+#: Wrappers are imported and created on first access.
+_API_WRAPPERS = {
+    "2.3.5.3": {
+        "application_policy": ("application_policy", "ApplicationPolicy"),
+        "applications": ("applications", "Applications"),
+        "authentication_management": (
+            "authentication_management",
+            "AuthenticationManagement",
+        ),
+        "cisco_dna_center_system": ("cisco_dna_center_system", "CiscoDnaCenterSystem"),
+        "clients": ("clients", "Clients"),
+        "command_runner": ("command_runner", "CommandRunner"),
+        "compliance": ("compliance", "Compliance"),
+        "configuration_archive": ("configuration_archive", "ConfigurationArchive"),
+        "configuration_templates": (
+            "configuration_templates",
+            "ConfigurationTemplates",
+        ),
+        "device_onboarding_pnp": ("device_onboarding_pnp", "DeviceOnboardingPnp"),
+        "device_replacement": ("device_replacement", "DeviceReplacement"),
+        "devices": ("devices", "Devices"),
+        "discovery": ("discovery", "Discovery"),
+        "eox": ("eox", "Eox"),
+        "event_management": ("event_management", "EventManagement"),
+        "fabric_wireless": ("fabric_wireless", "FabricWireless"),
+        "file": ("file", "File"),
+        "health_and_performance": ("health_and_performance", "HealthAndPerformance"),
+        "itsm": ("itsm", "Itsm"),
+        "itsm_integration": ("itsm_integration", "ItsmIntegration"),
+        "issues": ("issues", "Issues"),
+        "lan_automation": ("lan_automation", "LanAutomation"),
+        "licenses": ("licenses", "Licenses"),
+        "network_settings": ("network_settings", "NetworkSettings"),
+        "path_trace": ("path_trace", "PathTrace"),
+        "platform": ("platform", "Platform"),
+        "platform_configuration": ("platform", "Platform"),
+        "reports": ("reports", "Reports"),
+        "sda": ("sda", "Sda"),
+        "security_advisories": ("security_advisories", "SecurityAdvisories"),
+        "sensors": ("sensors", "Sensors"),
+        "site_design": ("site_design", "SiteDesign"),
+        "sites": ("sites", "Sites"),
+        "software_image_management_swim": (
+            "software_image_management_swim",
+            "SoftwareImageManagementSwim",
+        ),
+        "system_settings": ("system_settings", "SystemSettings"),
+        "tag": ("tag", "Tag"),
+        "task": ("task", "Task"),
+        "topology": ("topology", "Topology"),
+        "user_and_roles": ("user_and_roles", "UserandRoles"),
+        "users": ("users", "Users"),
+        "wireless": ("wireless", "Wireless"),
+    },
+    "2.3.7.6": {
+        "ai_endpoint_analytics": ("ai_endpoint_analytics", "AIEndpointAnalytics"),
+        "application_policy": ("application_policy", "ApplicationPolicy"),
+        "applications": ("applications", "Applications"),
+        "authentication_management": (
+            "authentication_management",
+            "AuthenticationManagement",
+        ),
+        "cisco_trusted_certificates": (
+            "cisco_trusted_certificates",
+            "CiscoTrustedCertificates",
+        ),
+        "clients": ("clients", "Clients"),
+        "command_runner": ("command_runner", "CommandRunner"),
+        "compliance": ("compliance", "Compliance"),
+        "configuration_archive": ("configuration_archive", "ConfigurationArchive"),
+        "configuration_templates": (
+            "configuration_templates",
+            "ConfigurationTemplates",
+        ),
+        "device_onboarding_pnp": ("device_onboarding_pnp", "DeviceOnboardingPnp"),
+        "device_replacement": ("device_replacement", "DeviceReplacement"),
+        "devices": ("devices", "Devices"),
+        "disaster_recovery": ("disaster_recovery", "DisasterRecovery"),
+        "discovery": ("discovery", "Discovery"),
+        "eox": ("eox", "EoX"),
+        "event_management": ("event_management", "EventManagement"),
+        "fabric_wireless": ("fabric_wireless", "FabricWireless"),
+        "file": ("file", "File"),
+        "health_and_performance": ("health_and_performance", "HealthAndPerformance"),
+        "itsm": ("itsm", "Itsm"),
+        "itsm_integration": ("itsm_integration", "ItsmIntegration"),
+        "issues": ("issues", "Issues"),
+        "lan_automation": ("lan_automation", "LanAutomation"),
+        "licenses": ("licenses", "Licenses"),
+        "network_settings": ("network_settings", "NetworkSettings"),
+        "path_trace": ("path_trace", "PathTrace"),
+        "platform": ("platform", "Platform"),
+        "reports": ("reports", "Reports"),
+        "sda": ("sda", "Sda"),
+        "security_advisories": ("security_advisories", "SecurityAdvisories"),
+        "sensors": ("sensors", "Sensors"),
+        "site_design": ("site_design", "SiteDesign"),
+        "sites": ("sites", "Sites"),
+        "software_image_management_swim": (
+            "software_image_management_swim",
+            "SoftwareImageManagementSwim",
+        ),
+        "system_settings": ("system_settings", "SystemSettings"),
+        "tag": ("tag", "Tag"),
+        "task": ("task", "Task"),
+        "topology": ("topology", "Topology"),
+        "user_and_roles": ("user_and_roles", "UserandRoles"),
+        "users": ("users", "Users"),
+        "wireless": ("wireless", "Wireless"),
+    },
+    "2.3.7.9": {
+        "ai_endpoint_analytics": ("ai_endpoint_analytics", "AIEndpointAnalytics"),
+        "application_policy": ("application_policy", "ApplicationPolicy"),
+        "applications": ("applications", "Applications"),
+        "authentication_management": (
+            "authentication_management",
+            "AuthenticationManagement",
+        ),
+        "backup": ("backup", "Backup"),
+        "cisco_i_m_c": ("cisco_i_m_c", "CiscoIMC"),
+        "cisco_trusted_certificates": (
+            "cisco_trusted_certificates",
+            "CiscoTrustedCertificates",
+        ),
+        "clients": ("clients", "Clients"),
+        "command_runner": ("command_runner", "CommandRunner"),
+        "compliance": ("compliance", "Compliance"),
+        "configuration_archive": ("configuration_archive", "ConfigurationArchive"),
+        "configuration_templates": (
+            "configuration_templates",
+            "ConfigurationTemplates",
+        ),
+        "device_onboarding_pnp": ("device_onboarding_pnp", "DeviceOnboardingPnp"),
+        "device_replacement": ("device_replacement", "DeviceReplacement"),
+        "devices": ("devices", "Devices"),
+        "disaster_recovery": ("disaster_recovery", "DisasterRecovery"),
+        "discovery": ("discovery", "Discovery"),
+        "eox": ("eox", "Eox"),
+        "event_management": ("event_management", "EventManagement"),
+        "fabric_wireless": ("fabric_wireless", "FabricWireless"),
+        "file": ("file", "File"),
+        "health_and_performance": ("health_and_performance", "HealthAndPerformance"),
+        "itsm": ("itsm", "Itsm"),
+        "itsm_integration": ("itsm_integration", "ItsmIntegration"),
+        "industrial_configuration": (
+            "industrial_configuration",
+            "IndustrialConfiguration",
+        ),
+        "issues": ("issues", "Issues"),
+        "know_your_network": ("know_your_network", "KnowYourNetwork"),
+        "lan_automation": ("lan_automation", "LanAutomation"),
+        "licenses": ("licenses", "Licenses"),
+        "network_settings": ("network_settings", "NetworkSettings"),
+        "path_trace": ("path_trace", "PathTrace"),
+        "platform": ("platform", "Platform"),
+        "reports": ("reports", "Reports"),
+        "restore": ("restore", "Restore"),
+        "sda": ("sda", "Sda"),
+        "security_advisories": ("security_advisories", "SecurityAdvisories"),
+        "sensors": ("sensors", "Sensors"),
+        "site_design": ("site_design", "SiteDesign"),
+        "sites": ("sites", "Sites"),
+        "software_image_management_swim": (
+            "software_image_management_swim",
+            "SoftwareImageManagementSwim",
+        ),
+        "system_settings": ("system_settings", "SystemSettings"),
+        "tag": ("tag", "Tag"),
+        "task": ("task", "Task"),
+        "topology": ("topology", "Topology"),
+        "user_and_roles": ("user_and_roles", "UserandRoles"),
+        "users": ("users", "Users"),
+        "wired": ("wired", "Wired"),
+        "wireless": ("wireless", "Wireless"),
+    },
+    "3.1.3.0": {
+        "ai_endpoint_analytics": ("ai_endpoint_analytics", "AIEndpointAnalytics"),
+        "application_policy": ("application_policy", "ApplicationPolicy"),
+        "applications": ("applications", "Applications"),
+        "authentication_management": (
+            "authentication_management",
+            "AuthenticationManagement",
+        ),
+        "backup": ("backup", "Backup"),
+        "cisco_i_m_c": ("cisco_i_m_c", "CiscoIMC"),
+        "cisco_trusted_certificates": (
+            "cisco_trusted_certificates",
+            "CiscoTrustedCertificates",
+        ),
+        "clients": ("clients", "Clients"),
+        "command_runner": ("command_runner", "CommandRunner"),
+        "compliance": ("compliance", "Compliance"),
+        "configuration_archive": ("configuration_archive", "ConfigurationArchive"),
+        "configuration_templates": (
+            "configuration_templates",
+            "ConfigurationTemplates",
+        ),
+        "device_onboarding_pnp": ("device_onboarding_pnp", "DeviceOnboardingPnp"),
+        "device_replacement": ("device_replacement", "DeviceReplacement"),
+        "devices": ("devices", "Devices"),
+        "disaster_recovery": ("disaster_recovery", "DisasterRecovery"),
+        "discovery": ("discovery", "Discovery"),
+        "eox": ("eox", "Eox"),
+        "event_management": ("event_management", "EventManagement"),
+        "fabric_wireless": ("fabric_wireless", "FabricWireless"),
+        "file": ("file", "File"),
+        "health_and_performance": ("health_and_performance", "HealthAndPerformance"),
+        "itsm": ("itsm", "Itsm"),
+        "itsm_integration": ("itsm_integration", "ItsmIntegration"),
+        "industrial_configuration": (
+            "industrial_configuration",
+            "IndustrialConfiguration",
+        ),
+        "issues": ("issues", "Issues"),
+        "know_your_network": ("know_your_network", "KnowYourNetwork"),
+        "lan_automation": ("lan_automation", "LanAutomation"),
+        "licenses": ("licenses", "Licenses"),
+        "network_settings": ("network_settings", "NetworkSettings"),
+        "path_trace": ("path_trace", "PathTrace"),
+        "platform": ("platform", "Platform"),
+        "reports": ("reports", "Reports"),
+        "restore": ("restore", "Restore"),
+        "sda": ("sda", "Sda"),
+        "security_advisories": ("security_advisories", "SecurityAdvisories"),
+        "sensors": ("sensors", "Sensors"),
+        "site_design": ("site_design", "SiteDesign"),
+        "sites": ("sites", "Sites"),
+        "software_image_management_swim": (
+            "software_image_management_swim",
+            "SoftwareImageManagementSwim",
+        ),
+        "system_settings": ("system_settings", "SystemSettings"),
+        "tag": ("tag", "Tag"),
+        "task": ("task", "Task"),
+        "topology": ("topology", "Topology"),
+        "user_and_roles": ("user_and_roles", "UserandRoles"),
+        "users": ("users", "Users"),
+        "wired": ("wired", "Wired"),
+        "wireless": ("wireless", "Wireless"),
+    },
+    "3.1.6.0": {
+        "ai_endpoint_analytics": ("ai_endpoint_analytics", "AiEndpointAnalytics"),
+        "application_policy": ("application_policy", "ApplicationPolicy"),
+        "applications": ("applications", "Applications"),
+        "authentication_management": (
+            "authentication_management",
+            "AuthenticationManagement",
+        ),
+        "backup": ("backup", "Backup"),
+        "cisco_i_m_c": ("cisco_imc", "CiscoIMC"),
+        "cisco_trusted_certificates": (
+            "cisco_trusted_certificates",
+            "CiscoTrustedCertificates",
+        ),
+        "clients": ("clients", "Clients"),
+        "command_runner": ("command_runner", "CommandRunner"),
+        "compliance": ("compliance", "Compliance"),
+        "configuration_archive": ("configuration_archive", "ConfigurationArchive"),
+        "configuration_templates": (
+            "configuration_templates",
+            "ConfigurationTemplates",
+        ),
+        "device_onboarding_pnp": ("device_onboarding_pnp", "DeviceOnboardingPnp"),
+        "device_replacement": ("device_replacement", "DeviceReplacement"),
+        "devices": ("devices", "Devices"),
+        "disaster_recovery": ("disaster_recovery", "DisasterRecovery"),
+        "discovery": ("discovery", "Discovery"),
+        "eox": ("eox", "Eox"),
+        "event_management": ("event_management", "EventManagement"),
+        "fabric_wireless": ("fabric_wireless", "FabricWireless"),
+        "file": ("file", "File"),
+        "health_and_performance": ("health_and_performance", "HealthAndPerformance"),
+        "itsm": ("itsm", "Itsm"),
+        "itsm_integration": ("itsm_integration", "ItsmIntegration"),
+        "industrial_configuration": (
+            "industrial_configuration",
+            "IndustrialConfiguration",
+        ),
+        "issues": ("issues", "Issues"),
+        "know_your_network": ("know_your_network", "KnowYourNetwork"),
+        "lan_automation": ("lan_automation", "LanAutomation"),
+        "licenses": ("licenses", "Licenses"),
+        "network_settings": ("network_settings", "NetworkSettings"),
+        "path_trace": ("path_trace", "PathTrace"),
+        "platform": ("platform", "Platform"),
+        "reports": ("reports", "Reports"),
+        "restore": ("restore", "Restore"),
+        "sda": ("sda", "Sda"),
+        "security_advisories": ("security_advisories", "SecurityAdvisories"),
+        "sensors": ("sensors", "Sensors"),
+        "site_design": ("site_design", "SiteDesign"),
+        "sites": ("sites", "Sites"),
+        "software_image_management_swim": (
+            "software_image_management_swim",
+            "SoftwareImageManagementSwim",
+        ),
+        "system_settings": ("system_settings", "SystemSettings"),
+        "system_software_upgrade": ("system_software_upgrade", "SystemSoftwareUpgrade"),
+        "tag": ("tag", "Tag"),
+        "task": ("task", "Task"),
+        "topology": ("topology", "Topology"),
+        "user_and_roles": ("user_and_roles", "UserandRoles"),
+        "users": ("users", "Users"),
+        "wired": ("wired", "Wired"),
+        "wireless": ("wireless", "Wireless"),
+    },
+}
+
+
 class DNACenterAPI(object):
     """Cisco DNA Center API wrapper.
 
@@ -421,6 +398,17 @@ class DNACenterAPI(object):
         object_factory=mydict_data_factory,
         validator=SchemaValidator,
         user_agent=None,
+        schema_cache_dir=None,
+        validation=None,
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        pool_block=DEFAULT_POOL_BLOCK,
+        token_refresh_margin=DEFAULT_TOKEN_REFRESH_MARGIN,
+        token_store=None,
+        rate_limiter=None,
+        retry_policy=None,
+        json_decoder=None,
+        metrics_hook=None,
     ):
         """Create a new DNACenterAPI object.
         An access token is required to interact with the DNA Center APIs.
@@ -483,12 +471,65 @@ class DNACenterAPI(object):
                 Python objects from the returned DNA Center JSON data objects.
             validator(callable): The factory function to use to validate
                 Python objects sent in the body of the request.
+            schema_cache_dir(str): Directory where the compiled request
+                validators are cached and reused across processes.
+                Defaults to the DNA_CENTER_SCHEMA_CACHE_DIR environment
+                variable or disabled if the environment variable is not set.
+            validation(str): Controls when request payloads are validated:
+                "full" always validates, "debug" only validates when debug
+                is enabled and "none" never validates. Defaults to the
+                DNA_CENTER_VALIDATION environment variable or
+                dnacentersdk.config.DEFAULT_VALIDATION
+                if the environment variable is not set.
+            pool_connections(int): Number of hosts whose HTTP connection
+                pool is kept. Not used with an injected session.
+            pool_maxsize(int): Maximum number of HTTP connections kept open
+                per host; raise it to the number of threads sharing the
+                DNACenterAPI object. Not used with an injected session.
+            pool_block(bool): Controls whether requests wait for a free
+                connection when the pool is exhausted, instead of opening a
+                connection that is discarded afterwards.
+                Not used with an injected session.
+            token_refresh_margin(int): Seconds before the access token
+                expires when it is refreshed ahead of the next request.
+            token_store(TokenStore): Optionally share access tokens with
+                other DNACenterAPI objects and processes using the same
+                base_url and credentials, e.g. a
+                dnacentersdk.token_store.FileTokenStore. Defaults to a
+                FileTokenStore in the DNA_CENTER_TOKEN_CACHE_DIR
+                environment variable directory or no sharing if the
+                environment variable is not set.
+            rate_limiter(RateLimiter): Optionally pace the requests with
+                a global and per URL template request rates, e.g.
+                dnacentersdk.rate_limiter.RateLimiter(rate=10), before
+                the API rate-limits them.
+            retry_policy(RetryPolicy): Which failed requests are retried
+                and when, e.g. dnacentersdk.retry.RetryPolicy() retries
+                502, 503, 504 responses and failed connections of idempotent
+                requests with exponential backoff and jitter. Defaults to
+                dnacentersdk.retry.DEFAULT_RETRY_POLICY, a single immediate
+                retry of failed connections.
+            json_decoder(str,callable): The decoder of the JSON responses:
+                "auto" uses orjson if it is installed and json otherwise,
+                "orjson" and "json" use that package, "ordered" parses
+                objects as OrderedDict like former versions did; or a
+                function parsing JSON bytes. Defaults to the
+                DNA_CENTER_JSON_DECODER environment variable or
+                dnacentersdk.config.DEFAULT_JSON_DECODER
+                if the environment variable is not set.
+            metrics_hook(MetricsHook): Optionally report the start and the
+                method, URL template, status, bytes, time to first byte,
+                latency, retries and rate-limit sleeps of every request,
+                e.g. to a dnacentersdk.metrics.MetricsAggregator.
 
         Returns:
             DNACenterAPI: A new DNACenterAPI object.
 
         Raises:
             TypeError: If the parameter types are incorrect.
+            ValueError: If the validation or json_decoder value is not
+                supported.
+            ImportError: If the orjson json_decoder is not installed.
             AccessTokenError: If an access token is not provided via the
                 access_token argument or an environment variable.
             VersionError: If the version is not provided via the version
@@ -505,6 +546,24 @@ class DNACenterAPI(object):
             base_url or dnacenter_environment.get_env_base_url() or DEFAULT_BASE_URL
         )
         user_agent = user_agent or dnacenter_environment.get_env_user_agent()
+        schema_cache_dir = (
+            schema_cache_dir or dnacenter_environment.get_env_schema_cache_dir()
+        )
+        validation = (
+            validation
+            or dnacenter_environment.get_env_validation()
+            or DEFAULT_VALIDATION
+        )
+        json_decoder = (
+            json_decoder
+            or dnacenter_environment.get_env_json_decoder()
+            or DEFAULT_JSON_DECODER
+        )
+
+        if token_store is None:
+            token_cache_dir = dnacenter_environment.get_env_token_cache_dir()
+            if token_cache_dir:
+                token_store = FileTokenStore(token_cache_dir)
 
         if single_request_timeout is None:
             single_request_timeout = (
@@ -545,6 +604,16 @@ class DNACenterAPI(object):
         check_type(verify, (bool, str), may_be_none=False)
         check_type(version, str, may_be_none=False)
         check_type(user_agent, str, may_be_none=False)
+        check_type(schema_cache_dir, str, may_be_none=True)
+        check_type(validation, str, may_be_none=False)
+        check_type(pool_connections, int, may_be_none=False)
+        check_type(pool_maxsize, int, may_be_none=False)
+        check_type(pool_block, bool, may_be_none=False)
+        check_type(token_refresh_margin, int, may_be_none=False)
+        check_type(token_store, TokenStore)
+        check_type(rate_limiter, RateLimiter)
+        check_type(retry_policy, RetryPolicy)
+        check_type(metrics_hook, MetricsHook)
 
         if version not in ["2.3.5.3", "2.3.7.6", "2.3.7.9", "3.1.3.0", "3.1.6.0"]:
             raise VersionError(
@@ -554,6 +623,13 @@ class DNACenterAPI(object):
                 )
             )
 
+        if validation not in VALIDATION_MODES:
+            raise ValueError(
+                "Unknown validation mode {!r}, known modes are {}".format(
+                    validation, ", ".join(VALIDATION_MODES)
+                )
+            )
+
         if isinstance(debug, str):
             debug = "true" in debug.lower()
 
@@ -564,6 +640,7 @@ class DNACenterAPI(object):
             single_request_timeout=single_request_timeout,
             verify=verify,
             session=session,
+            token_store=token_store,
         )
 
         # Check if the user has provided the required basicAuth parameters
@@ -580,14 +657,17 @@ class DNACenterAPI(object):
 
         def get_access_token():
             return self.authentication.authentication_api(
-                username=username, password=password, encoded_auth=encoded_auth
+                username=username,
+                password=password,
+                encoded_auth=encoded_auth,
+                token_refresh_margin=token_refresh_margin,
             ).Token
 
         # Create the API session
         # All of the API calls associated with a DNACenterAPI object will
         # leverage a single RESTful 'session' connecting to the DNA Center
         # cloud.
-        self._session = RestSession(
+        self._session = self._create_session(
             get_access_token=get_access_token,
             base_url=base_url,
             single_request_timeout=single_request_timeout,
@@ -597,609 +677,110 @@ class DNACenterAPI(object):
             version=version,
             debug=debug,
             user_agent=user_agent,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            token_refresh_margin=token_refresh_margin,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            json_decoder=json_decoder,
+            metrics_hook=metrics_hook,
+            object_factory=object_factory,
         )
 
-        _validator = validator(version).json_schema_validate
-
-        # API wrappers
-        if version == "2.3.5.3":
-            self.application_policy = ApplicationPolicy_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.applications = Applications_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.authentication_management = AuthenticationManagement_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.cisco_dna_center_system = CiscoDnaCenterSystem_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.clients = Clients_v2_3_5_3(self._session, object_factory, _validator)
-            self.command_runner = CommandRunner_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.compliance = Compliance_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.configuration_archive = ConfigurationArchive_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.configuration_templates = ConfigurationTemplates_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.device_onboarding_pnp = DeviceOnboardingPnp_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.device_replacement = DeviceReplacement_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.devices = Devices_v2_3_5_3(self._session, object_factory, _validator)
-            self.discovery = Discovery_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.eox = Eox_v2_3_5_3(self._session, object_factory, _validator)
-            self.event_management = EventManagement_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.fabric_wireless = FabricWireless_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.file = File_v2_3_5_3(self._session, object_factory, _validator)
-            self.health_and_performance = HealthAndPerformance_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.itsm = Itsm_v2_3_5_3(self._session, object_factory, _validator)
-            self.itsm_integration = ItsmIntegration_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.issues = Issues_v2_3_5_3(self._session, object_factory, _validator)
-            self.lan_automation = LanAutomation_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.licenses = Licenses_v2_3_5_3(self._session, object_factory, _validator)
-            self.network_settings = NetworkSettings_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.path_trace = PathTrace_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.platform = Platform_v2_3_5_3(self._session, object_factory, _validator)
-            self.platform_configuration = Platform_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.reports = Reports_v2_3_5_3(self._session, object_factory, _validator)
-            self.sda = Sda_v2_3_5_3(self._session, object_factory, _validator)
-            self.security_advisories = SecurityAdvisories_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.sensors = Sensors_v2_3_5_3(self._session, object_factory, _validator)
-            self.site_design = SiteDesign_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.sites = Sites_v2_3_5_3(self._session, object_factory, _validator)
-            self.software_image_management_swim = SoftwareImageManagementSwim_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.system_settings = SystemSettings_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.tag = Tag_v2_3_5_3(self._session, object_factory, _validator)
-            self.task = Task_v2_3_5_3(self._session, object_factory, _validator)
-            self.topology = Topology_v2_3_5_3(self._session, object_factory, _validator)
-            self.user_and_roles = UserandRoles_v2_3_5_3(
-                self._session, object_factory, _validator
-            )
-            self.users = Users_v2_3_5_3(self._session, object_factory, _validator)
-            self.wireless = Wireless_v2_3_5_3(self._session, object_factory, _validator)
+        if schema_cache_dir is not None:
+            set_schema_cache_dir(schema_cache_dir)
 
-        if version == "2.3.7.6":
+        self._schema_validator = validator(version)
+        if validation == "full" or (validation == "debug" and debug):
+            _validator = self._schema_validator.json_schema_validate
+        else:
+            _validator = no_op_json_schema_validate
+        self._validation = validation
 
-            self.ai_endpoint_analytics = AIEndpointAnalytics_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.application_policy = ApplicationPolicy_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.applications = Applications_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.authentication_management = AuthenticationManagement_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.cisco_trusted_certificates = CiscoTrustedCertificates_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.clients = Clients_v2_3_7_6(self._session, object_factory, _validator)
-            self.command_runner = CommandRunner_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.compliance = Compliance_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.configuration_archive = ConfigurationArchive_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.configuration_templates = ConfigurationTemplates_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.device_onboarding_pnp = DeviceOnboardingPnp_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.device_replacement = DeviceReplacement_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.devices = Devices_v2_3_7_6(self._session, object_factory, _validator)
-            self.disaster_recovery = DisasterRecovery_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.discovery = Discovery_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.eox = EoX_v2_3_7_6(self._session, object_factory, _validator)
-            self.event_management = EventManagement_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.fabric_wireless = FabricWireless_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.file = File_v2_3_7_6(self._session, object_factory, _validator)
-            self.health_and_performance = HealthAndPerformance_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.itsm = Itsm_v2_3_7_6(self._session, object_factory, _validator)
-            self.itsm_integration = ItsmIntegration_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.issues = Issues_v2_3_7_6(self._session, object_factory, _validator)
-            self.lan_automation = LanAutomation_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.licenses = Licenses_v2_3_7_6(self._session, object_factory, _validator)
-            self.network_settings = NetworkSettings_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.path_trace = PathTrace_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.platform = Platform_v2_3_7_6(self._session, object_factory, _validator)
-            self.reports = Reports_v2_3_7_6(self._session, object_factory, _validator)
-            self.sda = Sda_v2_3_7_6(self._session, object_factory, _validator)
-            self.security_advisories = SecurityAdvisories_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.sensors = Sensors_v2_3_7_6(self._session, object_factory, _validator)
-            self.site_design = SiteDesign_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.sites = Sites_v2_3_7_6(self._session, object_factory, _validator)
-            self.software_image_management_swim = SoftwareImageManagementSwim_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.system_settings = SystemSettings_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.tag = Tag_v2_3_7_6(self._session, object_factory, _validator)
-            self.task = Task_v2_3_7_6(self._session, object_factory, _validator)
-            self.topology = Topology_v2_3_7_6(self._session, object_factory, _validator)
-            self.user_and_roles = UserandRoles_v2_3_7_6(
-                self._session, object_factory, _validator
-            )
-            self.users = Users_v2_3_7_6(self._session, object_factory, _validator)
-            self.wireless = Wireless_v2_3_7_6(self._session, object_factory, _validator)
+        # API wrappers of the selected version, built on first access
+        self._api_wrappers = _API_WRAPPERS[version]
+        self._api_wrappers_package = "v" + version.replace(".", "_")
+        self._api_wrappers_args = (self._session, object_factory, _validator)
+        self._api_wrappers_lock = threading.Lock()
 
-        if version == "2.3.7.9":
-            self.ai_endpoint_analytics = AIEndpointAnalytics_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.application_policy = ApplicationPolicy_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.applications = Applications_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.authentication_management = AuthenticationManagement_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.backup = Backup_v2_3_7_9(self._session, object_factory, _validator)
-            self.cisco_i_m_c = CiscoIMC_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.cisco_trusted_certificates = CiscoTrustedCertificates_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.clients = Clients_v2_3_7_9(self._session, object_factory, _validator)
-            self.command_runner = CommandRunner_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.compliance = Compliance_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.configuration_archive = ConfigurationArchive_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.configuration_templates = ConfigurationTemplates_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.device_onboarding_pnp = DeviceOnboardingPnp_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.device_replacement = DeviceReplacement_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.devices = Devices_v2_3_7_9(self._session, object_factory, _validator)
-            self.disaster_recovery = DisasterRecovery_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.discovery = Discovery_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.eox = Eox_v2_3_7_9(self._session, object_factory, _validator)
-            self.event_management = EventManagement_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.fabric_wireless = FabricWireless_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.file = File_v2_3_7_9(self._session, object_factory, _validator)
-            self.health_and_performance = HealthAndPerformance_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.itsm = Itsm_v2_3_7_9(self._session, object_factory, _validator)
-            self.itsm_integration = ItsmIntegration_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.industrial_configuration = IndustrialConfiguration_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.issues = Issues_v2_3_7_9(self._session, object_factory, _validator)
-            self.know_your_network = KnowYourNetwork_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.lan_automation = LanAutomation_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.licenses = Licenses_v2_3_7_9(self._session, object_factory, _validator)
-            self.network_settings = NetworkSettings_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.path_trace = PathTrace_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.platform = Platform_v2_3_7_9(self._session, object_factory, _validator)
-            self.reports = Reports_v2_3_7_9(self._session, object_factory, _validator)
-            self.restore = Restore_v2_3_7_9(self._session, object_factory, _validator)
-            self.sda = Sda_v2_3_7_9(self._session, object_factory, _validator)
-            self.security_advisories = SecurityAdvisories_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.sensors = Sensors_v2_3_7_9(self._session, object_factory, _validator)
-            self.site_design = SiteDesign_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.sites = Sites_v2_3_7_9(self._session, object_factory, _validator)
-            self.software_image_management_swim = SoftwareImageManagementSwim_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.system_settings = SystemSettings_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.tag = Tag_v2_3_7_9(self._session, object_factory, _validator)
-            self.task = Task_v2_3_7_9(self._session, object_factory, _validator)
-            self.topology = Topology_v2_3_7_9(self._session, object_factory, _validator)
-            self.user_and_roles = UserandRoles_v2_3_7_9(
-                self._session, object_factory, _validator
-            )
-            self.users = Users_v2_3_7_9(self._session, object_factory, _validator)
-            self.wired = Wired_v2_3_7_9(self._session, object_factory, _validator)
-            self.wireless = Wireless_v2_3_7_9(self._session, object_factory, _validator)
-        if version == "3.1.3.0":
-            self.ai_endpoint_analytics = AIEndpointAnalytics_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.application_policy = ApplicationPolicy_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.applications = Applications_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.authentication_management = AuthenticationManagement_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.backup = Backup_v3_1_3_0(self._session, object_factory, _validator)
-            self.cisco_i_m_c = CiscoIMC_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.cisco_trusted_certificates = CiscoTrustedCertificates_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.clients = Clients_v3_1_3_0(self._session, object_factory, _validator)
-            self.command_runner = CommandRunner_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.compliance = Compliance_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.configuration_archive = ConfigurationArchive_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.configuration_templates = ConfigurationTemplates_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.device_onboarding_pnp = DeviceOnboardingPnp_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.device_replacement = DeviceReplacement_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.devices = Devices_v3_1_3_0(self._session, object_factory, _validator)
-            self.disaster_recovery = DisasterRecovery_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.discovery = Discovery_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.eox = Eox_v3_1_3_0(self._session, object_factory, _validator)
-            self.event_management = EventManagement_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.fabric_wireless = FabricWireless_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.file = File_v3_1_3_0(self._session, object_factory, _validator)
-            self.health_and_performance = HealthAndPerformance_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.itsm = Itsm_v3_1_3_0(self._session, object_factory, _validator)
-            self.itsm_integration = ItsmIntegration_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.industrial_configuration = IndustrialConfiguration_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.issues = Issues_v3_1_3_0(self._session, object_factory, _validator)
-            self.know_your_network = KnowYourNetwork_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.lan_automation = LanAutomation_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.licenses = Licenses_v3_1_3_0(self._session, object_factory, _validator)
-            self.network_settings = NetworkSettings_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.path_trace = PathTrace_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.platform = Platform_v3_1_3_0(self._session, object_factory, _validator)
-            self.reports = Reports_v3_1_3_0(self._session, object_factory, _validator)
-            self.restore = Restore_v3_1_3_0(self._session, object_factory, _validator)
-            self.sda = Sda_v3_1_3_0(self._session, object_factory, _validator)
-            self.security_advisories = SecurityAdvisories_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.sensors = Sensors_v3_1_3_0(self._session, object_factory, _validator)
-            self.site_design = SiteDesign_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.sites = Sites_v3_1_3_0(self._session, object_factory, _validator)
-            self.software_image_management_swim = SoftwareImageManagementSwim_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.system_settings = SystemSettings_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.tag = Tag_v3_1_3_0(self._session, object_factory, _validator)
-            self.task = Task_v3_1_3_0(self._session, object_factory, _validator)
-            self.topology = Topology_v3_1_3_0(self._session, object_factory, _validator)
-            self.user_and_roles = UserandRoles_v3_1_3_0(
-                self._session, object_factory, _validator
-            )
-            self.users = Users_v3_1_3_0(self._session, object_factory, _validator)
-            self.wired = Wired_v3_1_3_0(self._session, object_factory, _validator)
-            self.wireless = Wireless_v3_1_3_0(self._session, object_factory, _validator)
-
-        if version == '3.1.6.0':
-            self.ai_endpoint_analytics = \
-                AiEndpointAnalytics_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.application_policy = \
-                ApplicationPolicy_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.applications = \
-                Applications_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.authentication_management = \
-                AuthenticationManagement_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.backup = \
-                Backup_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.cisco_i_m_c = \
-                CiscoIMC_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.cisco_trusted_certificates = \
-                CiscoTrustedCertificates_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.clients = \
-                Clients_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.command_runner = \
-                CommandRunner_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.compliance = \
-                Compliance_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.configuration_archive = \
-                ConfigurationArchive_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.configuration_templates = \
-                ConfigurationTemplates_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.device_onboarding_pnp = \
-                DeviceOnboardingPnp_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.device_replacement = \
-                DeviceReplacement_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.devices = \
-                Devices_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.disaster_recovery = \
-                DisasterRecovery_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.discovery = \
-                Discovery_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.eox = \
-                Eox_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.event_management = \
-                EventManagement_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.fabric_wireless = \
-                FabricWireless_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.file = \
-                File_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.health_and_performance = \
-                HealthAndPerformance_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.itsm = \
-                Itsm_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.itsm_integration = \
-                ItsmIntegration_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.industrial_configuration = \
-                IndustrialConfiguration_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.issues = \
-                Issues_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.know_your_network = \
-                KnowYourNetwork_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.lan_automation = \
-                LanAutomation_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.licenses = \
-                Licenses_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.network_settings = \
-                NetworkSettings_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.path_trace = \
-                PathTrace_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.platform = \
-                Platform_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.reports = \
-                Reports_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.restore = \
-                Restore_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.sda = \
-                Sda_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.security_advisories = \
-                SecurityAdvisories_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.sensors = \
-                Sensors_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.site_design = \
-                SiteDesign_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.sites = \
-                Sites_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.software_image_management_swim = \
-                SoftwareImageManagementSwim_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.system_settings = \
-                SystemSettings_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.system_software_upgrade = \
-                SystemSoftwareUpgrade_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.tag = \
-                Tag_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.task = \
-                Task_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.topology = \
-                Topology_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.user_and_roles = \
-                UserandRoles_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.users = \
-                Users_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.wired = \
-                Wired_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-            self.wireless = \
-                Wireless_v3_1_6_0(
-                    self._session, object_factory, _validator
-                )
-        
         self.custom_caller = \
             CustomCaller(self._session, object_factory)
 
+    def _create_session(self, **kwargs):
+        """Create the RestSession shared by all of the API wrappers."""
+        return RestSession(**kwargs)
+
+    def __getattr__(self, name):
+        """Create an API wrapper of the selected version on first access.
+
+        The wrapper module is imported, the wrapper is created and stored
+        as an instance attribute, so later accesses do not get here.
+
+        Raises:
+            AttributeError: If the name is not an API wrapper of the version.
+        """
+        api_wrappers = self.__dict__.get("_api_wrappers")
+        if api_wrappers is None or name not in api_wrappers:
+            raise AttributeError(
+                "{!r} object has no attribute {!r}".format(type(self).__name__, name)
+            )
+        with self._api_wrappers_lock:
+            if name not in self.__dict__:
+                module_name, class_name = api_wrappers[name]
+                module = importlib.import_module(
+                    ".{}.{}".format(self._api_wrappers_package, module_name),
+                    __name__,
+                )
+                wrapper_class = getattr(module, class_name)
+                self.__dict__[name] = wrapper_class(*self._api_wrappers_args)
+        return self.__dict__[name]
+
+    def __dir__(self):
+        api_wrappers = self.__dict__.get("_api_wrappers", {})
+        return sorted(set(super(DNACenterAPI, self).__dir__()) | set(api_wrappers))
+
+    def _create_task_waiter(self):
+        """Create the TaskWaiter shared by the operations of the API."""
+        return TaskWaiter(self)
+
+    @property
+    def task_waiter(self):
+        """The TaskWaiter whose background poller tracks the tasks of the
+        operations of the API, created on first access."""
+        waiter = self.__dict__.get("_task_waiter")
+        if waiter is None:
+            waiter = self.__dict__.setdefault(
+                "_task_waiter", self._create_task_waiter()
+            )
+        return waiter
+
+    def operations(self, timeout=None):
+        """Return futures for the long-running operations started in the
+        block.
+
+        In the block, the write API calls that start a task or a Business
+        API execution (e.g. `compliance.run_compliance`,
+        `discovery.start_discovery`, `configuration_templates.deploy_template_v2`
+        or `software_image_management_swim.trigger_software_image_distribution`)
+        return a concurrent.futures.Future resolved when the task or
+        execution is done, all of them tracked by the one poller of
+        `task_waiter`. See RestSession.operation_futures.
+
+        Example:
+            with api.operations():
+                futures = [
+                    api.compliance.run_compliance(deviceUuids=[uuid])
+                    for uuid in uuids
+                ]
+            for future in concurrent.futures.as_completed(futures):
+                print(future.task_id, future.exception() or "done")
+
+        Args:
+            timeout(float): Seconds to wait for every task.
+        """
+        return self._session.operation_futures(self.task_waiter, timeout=timeout)
+
     @property
     def session(self):
         """The DNA Center API session."""
@@ -1245,6 +826,31 @@ class DNACenterAPI(object):
         """The verify (TLS Certificate) for the API endpoints."""
         return self._session._verify
 
+    @property
+    def validation(self):
+        """When request payloads are validated: "full", "debug" or "none"."""
+        return self._validation
+
+    @property
+    def validation_stats(self):
+        """Request validation timing counters by model.
+
+        Returns:
+            dict: ValidationTiming(count, total_time, max_time) by model or
+            an empty dict if the validator does not keep counters.
+        """
+        stats = getattr(self._schema_validator, "validation_stats", None)
+        return stats() if stats else {}
+
+    @property
+    def pool_stats(self):
+        """Connections created, reused and discarded by the API session.
+
+        Returns:
+            ConnectionPoolStats: The connection pool counters.
+        """
+        return self._session.pool_stats
+
     @property
     def version(self):
         """The API version of DNA Center."""
@@ -1304,6 +910,9 @@ class DNACenterAPI(object):
             # ... make API calls ...
             api.close()  # Close all connections
         """
+        waiter = self.__dict__.get("_task_waiter")
+        if waiter is not None:
+            waiter.close()
         if hasattr(self, "_session") and self._session:
             self._session.close()
 
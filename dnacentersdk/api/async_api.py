@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""Cisco DNA Center asyncio API wrappers.
+
+Copyright (c) 2025 Cisco Systems.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from builtins import *
+
+from dnacentersdk.async_restsession import AsyncRestSession
+from dnacentersdk.exceptions import ApiError
+from dnacentersdk.models.mydict import mydict_data_factory
+from dnacentersdk.tasks import AsyncTaskWaiter
+from dnacentersdk.utils import apply_path_params, extract_and_parse_json
+
+from . import DNACenterAPI
+from .custom_caller import CustomCaller
+
+
+def async_object_factory(object_factory):
+    """Adapt an object factory to the awaitables returned by AsyncRestSession.
+
+    The API wrappers pass the result of the session call to the object
+    factory; with an AsyncRestSession that result is an awaitable, so the
+    adapted factory returns a coroutine that awaits it and then builds the
+    object with the original factory.
+    """
+
+    async def _build(model, json_data):
+        return object_factory(model, await json_data)
+
+    def factory(model, json_data):
+        return _build(model, json_data)
+
+    return factory
+
+
+class AsyncCustomCaller(CustomCaller):
+    """Cisco Catalyst Center CustomCaller for the asyncio API."""
+
+    async def call_api(
+        self,
+        method,
+        resource_path,
+        raise_exception=True,
+        original_response=False,
+        **kwargs
+    ):
+        """Handles the requests and response. See CustomCaller.call_api.
+
+        When raise_exception is False, the response of a failed request is
+        used instead of raising the ApiError.
+        """
+        path_params = kwargs.pop("path_params", {})
+        resource_path = apply_path_params(resource_path, path_params)
+        verify = kwargs.pop("verify", self._session.verify)
+        expected_codes = kwargs.pop("expected_codes", list(range(200, 300)))
+
+        try:
+            response = await self._session.request(
+                method, resource_path, expected_codes, 0, verify=verify, **kwargs
+            )
+        except ApiError as e:
+            if raise_exception:
+                raise
+            response = e.response
+
+        if original_response:
+            return response
+        json_data = extract_and_parse_json(response, self._session.json_loads)
+        return self._object_factory("bpm_custom", json_data)
+
+
+class AsyncDNACenterAPI(DNACenterAPI):
+    """Cisco DNA Center asyncio API wrapper.
+
+    Exposes the same API wrappers as DNACenterAPI (same endpoints,
+    parameters, validators and object factory), but every API call returns
+    an awaitable and the HTTP requests are sent with aiohttp on the running
+    event loop.
+
+    Example:
+        async with AsyncDNACenterAPI(username, password, base_url=base_url) as api:
+            devices = await api.devices.get_device_list()
+    """
+
+    def __init__(self, *args, client_session=None, **kwargs):
+        """Create a new AsyncDNACenterAPI object.
+
+        Args:
+            client_session(aiohttp.ClientSession): Optionally inject an
+                `aiohttp.ClientSession` to be used for HTTP operations.
+            *args: Passed on to DNACenterAPI.
+            **kwargs: Passed on to DNACenterAPI.
+
+        Raises:
+            ImportError: If the aiohttp package is not installed.
+        """
+        self._client_session = client_session
+        object_factory = kwargs.get("object_factory", mydict_data_factory)
+
+        super(AsyncDNACenterAPI, self).__init__(*args, **kwargs)
+
+        session, _, validator = self._api_wrappers_args
+        self._api_wrappers_args = (
+            session,
+            async_object_factory(object_factory),
+            validator,
+        )
+        self.custom_caller = AsyncCustomCaller(session, object_factory)
+
+    def _create_session(self, **kwargs):
+        """Create the AsyncRestSession shared by all of the API wrappers."""
+        return AsyncRestSession(client_session=self._client_session, **kwargs)
+
+    def _create_task_waiter(self):
+        """Create the AsyncTaskWaiter shared by the operations of the API;
+        in an operations block the write API calls return asyncio futures.
+        """
+        return AsyncTaskWaiter(self)
+
+    async def aclose(self):
+        """Close the underlying HTTP sessions."""
+        if self.__dict__.get("_session"):
+            await self._session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+        return False
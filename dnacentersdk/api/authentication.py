@@ -23,13 +23,17 @@ SOFTWARE.
 """
 
 
+import time
 import urllib.parse
 from builtins import *
 
 import requests
 
 
+from ..config import DEFAULT_TOKEN_REFRESH_MARGIN
 from ..response_codes import EXPECTED_RESPONSE_CODE
+from ..restsession import access_token_expiry
+from ..token_store import TokenStore, token_store_key
 from ..utils import (
     check_response_code,
     check_type,
@@ -54,7 +58,13 @@ class Authentication(object):
     """
 
     def __init__(
-        self, base_url, object_factory, single_request_timeout=None, verify=True, session=None
+        self,
+        base_url,
+        object_factory,
+        single_request_timeout=None,
+        verify=True,
+        session=None,
+        token_store=None,
     ):
         """Initialize an Authentication
         object with the provided RestSession.
@@ -71,6 +81,9 @@ class Authentication(object):
                 to a CA bundle to use.
             session(requests.Session): Optionally inject a `requests.Session`
                 object to be used for HTTP operations.
+            token_store(TokenStore): Optionally share the access tokens
+                with other clients of the same Catalyst Center and
+                credentials through a TokenStore.
 
         Raises:
             TypeError: If the parameter types are incorrect.
@@ -79,6 +92,7 @@ class Authentication(object):
         check_type(base_url, str, may_be_none=False)
         check_type(single_request_timeout, int)
         check_type(verify, (bool, str), may_be_none=False)
+        check_type(token_store, TokenStore)
 
         super(Authentication, self).__init__()
 
@@ -87,7 +101,9 @@ class Authentication(object):
         self._verify = verify
         self._request_kwargs = {"timeout": single_request_timeout, "verify": verify}
         self._object_factory = object_factory
-        
+        self._token_store = token_store
+        self._last_token = None
+
         # Use the injected `requests` session, build a new one if not provided
         self._session = session or requests.session()
 
@@ -104,6 +120,11 @@ class Authentication(object):
         """The base URL for the API endpoints."""
         return self._base_url
 
+    @property
+    def token_store(self):
+        """The TokenStore where access tokens are shared, if any."""
+        return self._token_store
+
     @property
     def single_request_timeout(self):
         """Timeout in seconds for the API requests."""
@@ -136,7 +157,13 @@ class Authentication(object):
             "verify": self._verify,
         }
 
-    def authentication_api(self, username, password, encoded_auth=None):
+    def authentication_api(
+        self,
+        username,
+        password,
+        encoded_auth=None,
+        token_refresh_margin=DEFAULT_TOKEN_REFRESH_MARGIN,
+    ):
         """Exchange basic auth data for an Access Token(x-auth-token)
         that can be used to invoke the APIs.
 
@@ -144,6 +171,15 @@ class Authentication(object):
             username(str): HTTP Basic Auth username.
             password(str): HTTP Basic Auth password.
             encoded_auth(str): HTTP Basic Auth base64 encoded string.
+            token_refresh_margin(int): Seconds before its expiry after which
+                a stored token is not returned, the `token_refresh_margin`
+                of the session.
+
+        With a token store, a still valid token stored by another client of
+        the same Catalyst Center and credentials is returned instead of
+        requesting a new one, and new tokens are stored. A token already
+        returned by this object is not returned again: asking again means
+        it was rejected or is about to expire.
 
         Returns:
             AccessToken: An AccessToken object with the access token provided
@@ -154,6 +190,40 @@ class Authentication(object):
             ApiError: If the Catalyst Center cloud returns an error.
 
         """
+        if self._token_store is None:
+            json_data = self._request_access_token(username, password, encoded_auth)
+            return self._object_factory("bpm_ac8ae94c4e69a09d", json_data)
+
+        key = token_store_key(self._base_url, username, password, encoded_auth)
+        with self._token_store.lock(key):
+            cached = self._token_store.get(key)
+            if (
+                cached is not None
+                and cached.token != self._last_token
+                and time.time() < cached.expiry - token_refresh_margin
+            ):
+                json_data = {"Token": cached.token}
+            else:
+                json_data = self._request_access_token(
+                    username, password, encoded_auth
+                )
+                if json_data.get("Token"):
+                    self._token_store.set(
+                        key,
+                        json_data["Token"],
+                        access_token_expiry(json_data["Token"]),
+                    )
+            self._last_token = json_data.get("Token")
+
+        # Return a access_token object created from the response JSON data
+        return self._object_factory("bpm_ac8ae94c4e69a09d", json_data)
+
+    def _request_access_token(self, username, password, encoded_auth=None):
+        """Request a new access token to the Catalyst Center.
+
+        Returns:
+            dict: The parsed JSON response.
+        """
         temp_url = "/dna/system/api/v1/auth/token"
         self._endpoint_url = urllib.parse.urljoin(self._base_url, temp_url)
 
@@ -179,7 +249,4 @@ class Authentication(object):
         )
 
         check_response_code(response, EXPECTED_RESPONSE_CODE["POST"])
-        json_data = extract_and_parse_json(response)
-
-        # Return a access_token object created from the response JSON data
-        return self._object_factory("bpm_ac8ae94c4e69a09d", json_data)
+        return extract_and_parse_json(response)
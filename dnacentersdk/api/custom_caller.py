@@ -30,11 +30,11 @@ from requests.exceptions import HTTPError
 
 from ..restsession import RestSession
 from ..utils import (
+    RequestInfo,
+    ResponseInfo,
     apply_path_params,
     check_type,
     extract_and_parse_json,
-    pprint_request_info,
-    pprint_response_info,
 )
 
 logger = logging.getLogger(__name__)
@@ -150,12 +150,17 @@ class CustomCaller(object):
         # Ensure the url is an absolute URL
         abs_url = self._session.abs_url(resource_path)
         request_headers = kwargs.pop("headers", None)
-        headers = self._session.headers
-        if request_headers:
-            headers.update(request_headers)
 
         verify = kwargs.pop("verify", self._session.verify)
-        logger.debug(pprint_request_info(abs_url, method, headers, **kwargs))
+        logger.debug(
+            RequestInfo(
+                abs_url,
+                method,
+                self._session._req_session.headers,
+                headers=request_headers,
+                **kwargs
+            )
+        )
         
         expected_codes = kwargs.pop("expected_codes", list(range(200, 300)))
 
@@ -194,9 +199,9 @@ class CustomCaller(object):
                     **request_kwargs,
                 )
 
-        logger.debug(pprint_response_info(response))
+        logger.debug(ResponseInfo(response))
         if original_response:
             return response
         else:
-            json_data = extract_and_parse_json(response)
+            json_data = extract_and_parse_json(response, self._session.json_loads)
             return self._object_factory("bpm_custom", json_data)
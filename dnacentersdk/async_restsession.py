@@ -0,0 +1,517 @@
+# -*- coding: utf-8 -*-
+"""AsyncRestSession class for asyncio connections to the DNA Center APIs.
+
+Copyright (c) 2019-2021 Cisco Systems.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import asyncio
+import datetime
+import io
+import logging
+import os
+import ssl
+import time
+import warnings
+from builtins import *
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import aiohttp
+    import yarl
+except ImportError:
+    aiohttp = None
+
+from .exceptions import (
+    ApiError,
+    DownloadFailure,
+    RateLimitError,
+    RateLimitWarning,
+    dnacentersdkException,
+)
+from .metrics import RequestMeter
+from .response_codes import EXPECTED_RESPONSE_CODE
+from .restsession import DownloadResponse, DownloadWriter, RestSession
+from .utils import (
+    RequestInfo,
+    ResponseInfo,
+    check_response_code,
+    check_type,
+    extract_and_parse_json,
+    url_template,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRestSession(RestSession):
+    """asyncio RESTful HTTP session for making calls to the DNA Center APIs.
+
+    It has the same interface as RestSession, but `request`, `download`,
+    `get`, `post`, `put`, `patch` and `delete` are coroutines. Requests are
+    prepared with `requests` (so URLs, query strings, bodies and headers
+    are identical to the synchronous session) and sent with `aiohttp`.
+
+    The access token is obtained with the synchronous `get_access_token`
+    callable in the default executor, so it does not block the event loop.
+    """
+
+    def __init__(self, get_access_token, base_url, client_session=None, **kwargs):
+        """Initialize a new AsyncRestSession object.
+
+        Args:
+            get_access_token(callable): The DNA Center method to get a new
+                access token.
+            base_url(str): The base URL that will be suffixed onto API
+                endpoint relative URLs to produce a callable absolute URL.
+            client_session(aiohttp.ClientSession): Optionally inject an
+                `aiohttp.ClientSession` to be used for HTTP operations.
+            **kwargs: Passed on to RestSession.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ImportError: If the aiohttp package is not installed.
+
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncRestSession requires the aiohttp package, install it "
+                "with: pip install dnacentersdk[async]"
+            )
+        check_type(client_session, aiohttp.ClientSession)
+
+        super(AsyncRestSession, self).__init__(get_access_token, base_url, **kwargs)
+
+        self._client_session = client_session
+        self._auth_lock = None
+
+    @property
+    def client_session(self):
+        """The aiohttp.ClientSession used for HTTP operations."""
+        if self._client_session is None or self._client_session.closed:
+            self._client_session = aiohttp.ClientSession()
+        return self._client_session
+
+    def _ssl_context(self, verify):
+        if verify is False:
+            return False
+        if isinstance(verify, str):
+            if os.path.isdir(verify):
+                return ssl.create_default_context(capath=verify)
+            return ssl.create_default_context(cafile=verify)
+        return None
+
+    async def _ensure_authenticated_async(self):
+        """Ensure that we have a valid access token.
+
+        Concurrent coroutines wait for a single call to get_access_token.
+        """
+        if self._access_token_is_valid():
+            return
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        async with self._auth_lock:
+            if not self._access_token_is_valid():
+                await self._refresh_token_async()
+
+    async def _refresh_token_async(self):
+        loop = asyncio.get_running_loop()
+        self._set_access_token(
+            await loop.run_in_executor(None, self._get_access_token)
+        )
+
+    async def _refresh_rejected_token_async(self, rejected_token):
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        async with self._auth_lock:
+            if self._access_token == rejected_token:
+                await self._refresh_token_async()
+
+    async def refresh_token_async(self):
+        """Get a new access token and update the session's auth header."""
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        async with self._auth_lock:
+            await self._refresh_token_async()
+
+    def _prepare(self, method, abs_url, kwargs):
+        """Prepare the request with requests, as the synchronous session."""
+        data = kwargs.get("data")
+        if hasattr(data, "read") and not isinstance(data, (bytes, str)):
+            # requests_toolbelt MultipartEncoder(Monitor) and file objects
+            data = data.read()
+        return self._req_session.prepare_request(
+            requests.Request(
+                method,
+                abs_url,
+                params=kwargs.get("params"),
+                json=kwargs.get("json"),
+                data=data,
+                headers=kwargs.get("headers"),
+                files=kwargs.get("files"),
+            )
+        )
+
+    async def _send(self, method, abs_url, chunk_handler=None, **kwargs):
+        """Send the request and return it as a complete requests.Response.
+
+        With a chunk_handler, the content of a successful response is
+        passed to it chunk by chunk, between its `start(headers)` and
+        `close()` calls, instead of being kept in the response.
+        """
+        prepared = self._prepare(method, abs_url, kwargs)
+        timeout = kwargs.get("timeout")
+        start = time.monotonic()
+        async with self.client_session.request(
+            prepared.method,
+            yarl.URL(prepared.url, encoded=True),
+            data=prepared.body,
+            headers=dict(prepared.headers),
+            ssl=self._ssl_context(kwargs.get("verify", self.verify)),
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            allow_redirects=kwargs.get("allow_redirects", True),
+        ) as resp:
+            elapsed = datetime.timedelta(seconds=time.monotonic() - start)
+            if chunk_handler is not None and 200 <= resp.status < 300:
+                content = b""
+                chunk_handler.start(resp.headers)
+                try:
+                    async for chunk in resp.content.iter_chunked(
+                        chunk_handler.chunk_size
+                    ):
+                        chunk_handler(chunk)
+                finally:
+                    chunk_handler.close()
+            else:
+                content = await resp.read()
+            response = requests.Response()
+            response.status_code = resp.status
+            response.reason = resp.reason
+            response.headers = CaseInsensitiveDict(resp.headers)
+            response.url = str(resp.url)
+            response.encoding = requests.utils.get_encoding_from_headers(
+                response.headers
+            )
+            response.request = prepared
+            response.elapsed = elapsed
+            response.raw = io.BytesIO(content)
+            response._content = content
+            return response
+
+    async def download(self, method, url, erc, custom_refresh, **kwargs):
+        """Download the response content.
+
+        Same arguments and behavior as RestSession.download.
+
+        Returns:
+            DownloadResponse: The DownloadResponse wrapper.
+
+        Raises:
+            DownloadFailure: If was not able to download the raw
+            response to a file.
+        """
+        save_file = kwargs.pop("save_file", False)
+        dirpath = kwargs.pop("dirpath", None)
+        filename = kwargs.pop("filename", None)
+        options = self._pop_download_options(kwargs)
+
+        if not (dirpath) or not (os.path.isdir(dirpath)):
+            dirpath = os.getcwd()
+
+        handler = _ChunkHandler(self, save_file, filename, dirpath, options)
+        resp = await self.request(method, url, erc, 0, chunk_handler=handler, **kwargs)
+        if handler.error is not None:
+            raise DownloadFailure(resp, handler.error)
+        return DownloadResponse(
+            resp,
+            handler.filepath,
+            handler.filename,
+            dirpath,
+            handler.writer.collected_data,
+        )
+
+    async def request(
+        self, method, url, erc, custom_refresh, json_null=True, chunk_handler=None, **kwargs
+    ):
+        """Abstract base coroutine for making requests to the DNA Center APIs.
+
+        Same arguments and behavior as RestSession.request: failed requests
+        are retried as the retry policy allows, rate-limited requests are
+        retried after `Retry-After` seconds and the access token is
+        refreshed once on a 401 - Unauthorized response.
+
+        A `chunk_handler` callable gets the content of a successful response
+        chunk by chunk instead of the content being kept in the response.
+
+        Returns:
+            requests.Response: The Response object, which contains a server's response to an HTTP request.
+
+        Raises:
+            ApiError: If anything other than the expected response code is
+                returned by the DNA Center API endpoint.
+
+        """
+        meter = kwargs.pop("_meter", None)
+        if meter is not None or self._metrics_hook is None:
+            return await self._request(
+                method,
+                url,
+                erc,
+                custom_refresh,
+                json_null,
+                chunk_handler,
+                meter,
+                **kwargs
+            )
+
+        meter = RequestMeter(self._metrics_hook, method, url_template(url))
+        try:
+            response = await self._request(
+                method,
+                url,
+                erc,
+                custom_refresh,
+                json_null,
+                chunk_handler,
+                meter,
+                **kwargs
+            )
+        except Exception as e:
+            meter.finish(exception=e)
+            raise
+        meter.finish(response=response)
+        return response
+
+    async def _request(
+        self,
+        method,
+        url,
+        erc,
+        custom_refresh,
+        json_null,
+        chunk_handler,
+        meter,
+        **kwargs
+    ):
+        """Send a request, retried as needed; see request."""
+        await self._ensure_authenticated_async()
+        access_token = self._access_token
+
+        abs_url = self.abs_url(url)
+
+        kwargs.setdefault("timeout", self.single_request_timeout)
+        kwargs.setdefault("verify", self.verify)
+
+        if json_null:
+            if not kwargs.get("json"):
+                kwargs.pop("json", None)
+
+        if not kwargs.get("data"):
+            kwargs.pop("data", None)
+
+        c = custom_refresh
+        attempt = 0
+        while True:
+            c += 1
+            attempt += 1
+            try:
+                logger.debug("Attempt %s", c)
+                logger.debug(
+                    RequestInfo(abs_url, method, self._req_session.headers, **kwargs)
+                )
+                if meter is not None:
+                    meter.attempt()
+                if self._rate_limiter is not None:
+                    delay = self._rate_limiter.reserve(method, abs_url)
+                    if meter is not None:
+                        meter.rate_limited(delay)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                response = await self._send(
+                    method, abs_url, chunk_handler=chunk_handler, **kwargs
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                delay = self._retry_policy.next_delay(
+                    method, abs_url, attempt, exception=e
+                )
+                if delay is None:
+                    raise dnacentersdkException("Connection error {}".format(e))
+                await asyncio.sleep(delay)
+                continue
+            delay = self._retry_policy.next_delay(
+                method, abs_url, attempt, response=response
+            )
+            if delay is not None:
+                logger.debug(ResponseInfo(response))
+                await asyncio.sleep(delay)
+                continue
+            try:
+                check_response_code(response, erc)
+            except RateLimitError as e:
+                if self.wait_on_rate_limit:
+                    warnings.warn(RateLimitWarning(response))
+                    if meter is not None:
+                        meter.rate_limited(e.retry_after)
+                    await asyncio.sleep(e.retry_after)
+                    continue
+                else:
+                    raise
+            except ApiError as e:
+                logger.debug(ResponseInfo(response))
+                if e.status_code == 401 and custom_refresh < 1:
+                    logger.debug("Refreshing access token")
+                    await self._refresh_rejected_token_async(access_token)
+                    logger.debug("Refreshed token.")
+                    return await self.request(
+                        method,
+                        url,
+                        erc,
+                        1,
+                        chunk_handler=chunk_handler,
+                        _meter=meter,
+                        **kwargs
+                    )
+                else:
+                    raise
+            else:
+                logger.debug(ResponseInfo(response))
+                return response
+
+    async def _json_request(self, method, url, erc, stream, **kwargs):
+        if stream:
+            return await self.download(method, url, erc, 0, **kwargs)
+        response = await self.request(method, url, erc, 0, **kwargs)
+        if method == "GET":
+            if response.status_code == 204:
+                return None
+            return extract_and_parse_json(response, self._json_loads)
+        return self._operation_result(
+            extract_and_parse_json(response, self._json_loads)
+        )
+
+    async def get(self, url, params=None, **kwargs):
+        """Sends a GET request. See RestSession.get."""
+        check_type(url, str, may_be_none=False)
+        check_type(params, dict)
+
+        erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["GET"])
+        stream = kwargs.pop("stream", None)
+        return await self._json_request("GET", url, erc, stream, params=params, **kwargs)
+
+    async def patch(self, url, params=None, json=None, data=None, **kwargs):
+        """Sends a PATCH request. See RestSession.patch."""
+        check_type(url, str, may_be_none=False)
+        check_type(params, dict)
+
+        erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["PATCH"])
+        stream = kwargs.pop("stream", None)
+        return await self._json_request(
+            "PATCH", url, erc, stream, params=params, json=json, data=data, **kwargs
+        )
+
+    async def post(self, url, params=None, json=None, data=None, **kwargs):
+        """Sends a POST request. See RestSession.post."""
+        check_type(url, str, may_be_none=False)
+        check_type(params, dict)
+
+        erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["POST"])
+        stream = kwargs.pop("stream", None)
+        return await self._json_request(
+            "POST", url, erc, stream, params=params, json=json, data=data, **kwargs
+        )
+
+    async def put(self, url, params=None, json=None, data=None, **kwargs):
+        """Sends a PUT request. See RestSession.put."""
+        check_type(url, str, may_be_none=False)
+        check_type(params, dict)
+
+        erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["PUT"])
+        stream = kwargs.pop("stream", None)
+        return await self._json_request(
+            "PUT", url, erc, stream, params=params, json=json, data=data, **kwargs
+        )
+
+    async def delete(self, url, params=None, **kwargs):
+        """Sends a DELETE request. See RestSession.delete."""
+        check_type(url, str, may_be_none=False)
+        check_type(params, dict)
+
+        erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["DELETE"])
+        return await self._json_request("DELETE", url, erc, False, params=params, **kwargs)
+
+    async def aclose(self):
+        """Close the aiohttp client session and the underlying session."""
+        if self._client_session is not None:
+            await self._client_session.close()
+            self._client_session = None
+        self.close()
+
+
+class _ChunkHandler(object):
+    """Writes the chunks of an AsyncRestSession download with a
+    DownloadWriter, opened once the response headers (Content-Disposition
+    and Content-Length) are known."""
+
+    def __init__(self, session, save_file, filename, dirpath, options):
+        self.session = session
+        self.chunk_size = options["chunk_size"]
+        self.save_file = save_file
+        self.filename = filename
+        self.filepath = None
+        self.dirpath = dirpath
+        self.options = options
+        self.writer = None
+        self.error = None
+
+    def start(self, headers):
+        self.error = None
+        if headers.get("Content-Disposition"):
+            try:
+                self.filename = self.filename or self.session.get_filename(
+                    headers.get("Content-Disposition")
+                )
+                self.filepath = os.path.join(self.dirpath, self.filename)
+            except Exception as e:
+                self.error = e
+        self.writer = DownloadWriter.from_options(
+            self.filepath if self.save_file else None,
+            headers.get("Content-Length"),
+            self.options,
+        )
+        try:
+            self.writer.__enter__()
+        except Exception as e:
+            self.error = e
+
+    def __call__(self, chunk):
+        if self.error is None:
+            try:
+                self.writer.write(chunk)
+            except Exception as e:
+                self.error = e
+
+    def close(self):
+        try:
+            self.writer.__exit__(None, None, None)
+        except Exception as e:
+            self.error = self.error or e
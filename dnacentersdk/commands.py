@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+"""Bulk execution of read-only CLI commands with the Command Runner API.
+
+Copyright (c) 2019-2021 Cisco Systems.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import concurrent.futures
+import json
+import logging
+import re
+from collections import namedtuple
+from builtins import *
+
+from .config import (
+    DEFAULT_CLI_BATCH_SIZE,
+    DEFAULT_CLI_MAX_COMMANDS,
+    DEFAULT_CLI_WORKERS,
+)
+from .tasks import TaskWaiter, task_id_of
+from .utils import check_type
+
+logger = logging.getLogger(__name__)
+
+#: Status of the output of a command that could not be run or collected,
+#: besides the SUCCESS, FAILURE and BLACKLISTED of the Command Runner.
+COMMAND_ERROR = "ERROR"
+
+#: The output of a command on a device. `status` is the Command Runner
+#: status (SUCCESS, FAILURE or BLACKLISTED) or COMMAND_ERROR, and `output`
+#: the output of the command, or the error.
+CommandOutput = namedtuple(
+    "CommandOutput", ["device_uuid", "command", "status", "output"]
+)
+
+_FILE_URL = re.compile(r"/file/([^/?\s]+)")
+
+
+def _chunks(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def file_id_of(task):
+    """Get the id of the file of the results of a Command Runner task: the
+    `fileId` of its `progress` JSON, or the one of its
+    `additionalStatusURL`, or None."""
+    progress = task.get("progress")
+    if isinstance(progress, str):
+        try:
+            progress = json.loads(progress)
+        except ValueError:
+            progress = None
+    if isinstance(progress, dict) and progress.get("fileId"):
+        return progress["fileId"]
+    match = _FILE_URL.search(task.get("additionalStatusURL") or "")
+    return match.group(1) if match else None
+
+
+def command_outputs(results):
+    """Get the outputs of the results file of a Command Runner task, e.g.
+    `[{"deviceUuid": "...", "commandResponses": {"SUCCESS": {"show version":
+    "..."}, "FAILURE": {}, "BLACKLISTED": {}}}]`.
+
+    Yields:
+        CommandOutput: The output of every command on every device.
+    """
+    for device in results or []:
+        responses = device.get("commandResponses") or {}
+        for status, outputs in responses.items():
+            for command, output in (outputs or {}).items():
+                yield CommandOutput(device.get("deviceUuid"), command, status, output)
+
+
+class CommandBatchRunner(object):
+    """Runs read-only CLI commands on many devices with the Command Runner
+    API and streams their outputs.
+
+    The devices are split into batches of `batch_size`, and the commands
+    into groups of `max_commands`, every batch and group making one
+    `command_runner.run_read_only_commands_on_devices` request. Up to
+    `workers` requests are in flight at once: their tasks are tracked by
+    one TaskWaiter (the `task_waiter` of the API), and their results files
+    are downloaded with `file.download_a_file_by_file_id` as soon as they
+    are done, concurrently.
+
+    The outputs are yielded batch by batch, in completion order. The
+    devices and commands of a batch that failed (request, task or
+    download) get a COMMAND_ERROR output with the error, so one failed
+    batch does not stop the run, and so do the devices and commands missing
+    from the results file of a batch.
+
+    Example:
+        runner = CommandBatchRunner(api, workers=16)
+        for output in runner.run(device_uuids, ["show running-config"]):
+            save(output.device_uuid, output.command, output.output)
+    """
+
+    def __init__(
+        self,
+        api,
+        batch_size=DEFAULT_CLI_BATCH_SIZE,
+        max_commands=DEFAULT_CLI_MAX_COMMANDS,
+        workers=DEFAULT_CLI_WORKERS,
+        timeout=None,
+        waiter=None,
+    ):
+        """Create a new CommandBatchRunner.
+
+        Args:
+            api(DNACenterAPI): The API.
+            batch_size(int): Devices per request.
+            max_commands(int): Commands per request.
+            workers(int): Maximum number of requests in flight.
+            timeout(float): Seconds to wait for the task of a request,
+                None to wait forever.
+            waiter(TaskWaiter): The waiter of the tasks. Defaults to the
+                `task_waiter` of the API.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If batch_size, max_commands or workers is not
+                positive.
+        """
+        check_type(batch_size, int, may_be_none=False)
+        check_type(max_commands, int, may_be_none=False)
+        check_type(workers, int, may_be_none=False)
+        if batch_size < 1 or max_commands < 1 or workers < 1:
+            raise ValueError("batch_size, max_commands and workers must be positive")
+
+        self.api = api
+        self.batch_size = batch_size
+        self.max_commands = max_commands
+        self.workers = workers
+        self.timeout = timeout
+        if waiter is None:
+            waiter = getattr(api, "task_waiter", None) or TaskWaiter(api)
+        self.waiter = waiter
+
+    def batches(self, device_uuids, commands):
+        """Split devices and commands into the `(device_uuids, commands)`
+        of the requests."""
+        return [
+            (devices, group)
+            for group in _chunks(list(commands), self.max_commands)
+            for devices in _chunks(list(device_uuids), self.batch_size)
+        ]
+
+    def run_batch(self, device_uuids, commands, **kwargs):
+        """Run commands on a batch of devices: make the request, wait for
+        its task and download its results.
+
+        Returns:
+            list: The CommandOutput of every command on every device, a
+            COMMAND_ERROR one for the commands missing from the results.
+
+        Raises:
+            ValueError: If the request has no task or the task no file.
+            TaskError: If the task failed.
+            TimeoutError: If the task is not done after `timeout` seconds.
+        """
+        result = self.api.command_runner.run_read_only_commands_on_devices(
+            commands=commands, deviceUuids=device_uuids, **kwargs
+        )
+        task_id = task_id_of(result)
+        if task_id is None:
+            raise ValueError("No taskId in the Command Runner response")
+        task = self.waiter.wait(task_id, timeout=self.timeout)
+        file_id = file_id_of(task)
+        if file_id is None:
+            raise ValueError("No results file in the task {}".format(task_id))
+        logger.debug(
+            "Downloading the results {} of {} devices".format(
+                file_id, len(device_uuids)
+            )
+        )
+        download = self.api.file.download_a_file_by_file_id(file_id)
+        outputs = list(command_outputs(json.loads(download.data)))
+        received = {(output.device_uuid, output.command) for output in outputs}
+        missing = "No result in the results file {}".format(file_id)
+        return outputs + [
+            CommandOutput(device_uuid, command, COMMAND_ERROR, missing)
+            for device_uuid in device_uuids
+            for command in commands
+            if (device_uuid, command) not in received
+        ]
+
+    def _failed_batch(self, device_uuids, commands, exception):
+        logger.warning(
+            "Command Runner batch of {} devices failed: {}".format(
+                len(device_uuids), exception
+            )
+        )
+        return [
+            CommandOutput(device_uuid, command, COMMAND_ERROR, str(exception))
+            for device_uuid in device_uuids
+            for command in commands
+        ]
+
+    def run(self, device_uuids, commands, **kwargs):
+        """Run commands on devices and iterate over their outputs.
+
+        Args:
+            device_uuids(list): The ids of the devices.
+            commands(list): The commands.
+            **kwargs: Passed on to run_read_only_commands_on_devices, e.g.
+                `name` or `timeout` (of the commands on the devices).
+
+        Yields:
+            CommandOutput: The output of every command on every device,
+            batch by batch as they complete.
+        """
+        check_type(device_uuids, list, may_be_none=False)
+        check_type(commands, list, may_be_none=False)
+        batches = iter(self.batches(device_uuids, commands))
+        executor = concurrent.futures.ThreadPoolExecutor(self.workers)
+        running = {}
+
+        def start():
+            batch = next(batches, None)
+            if batch is None:
+                return False
+            running[executor.submit(self.run_batch, *batch, **kwargs)] = batch
+            return True
+
+        try:
+            while len(running) < self.workers and start():
+                pass
+            while running:
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    batch = running.pop(future)
+                    start()
+                    try:
+                        outputs = future.result()
+                    except Exception as e:
+                        outputs = self._failed_batch(*batch, exception=e)
+                    for output in outputs:
+                        yield output
+        finally:
+            for future in running:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+
+def run_commands(api, device_uuids, commands, **kwargs):
+    """Run read-only CLI commands on devices and iterate over their
+    outputs.
+
+    Shortcut for CommandBatchRunner(api).run(device_uuids, commands,
+    **kwargs).
+
+    Example:
+        for output in run_commands(api, device_uuids, ["show version"]):
+            print(output.device_uuid, output.status)
+    """
+    return CommandBatchRunner(api).run(device_uuids, commands, **kwargs)
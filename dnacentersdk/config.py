@@ -47,3 +47,146 @@ DEFAULT_VERIFY = True
 #: **user_agent** default value.
 #: Identifies the client using the SDK, providing useful data such as the SDK version and operating system
 DEFAULT_VERIFY_USER_AGENT = ""
+
+#: **validation** default value.
+#: Controls when request payloads are validated against their JSON schema:
+#: "full" (always), "debug" (only when debug is enabled) or "none".
+DEFAULT_VALIDATION = "full"
+
+#: Accepted **validation** values.
+VALIDATION_MODES = ("full", "debug", "none")
+
+#: **json_decoder** default value.
+#: Decoder of the JSON responses: "auto" (orjson if installed, else json),
+#: "orjson", "json" or "ordered" (json with OrderedDict objects).
+DEFAULT_JSON_DECODER = "auto"
+
+#: Accepted **json_decoder** names.
+JSON_DECODERS = ("auto", "orjson", "json", "ordered")
+
+#: **pool_connections** default value.
+#: Number of hosts whose HTTP connection pool is kept.
+DEFAULT_POOL_CONNECTIONS = 10
+
+#: **pool_maxsize** default value.
+#: Maximum number of HTTP connections kept open per host.
+DEFAULT_POOL_MAXSIZE = 10
+
+#: **pool_block** default value.
+#: Controls whether requests wait for a free connection when the pool of a
+#: host is exhausted instead of opening a connection that is discarded later.
+DEFAULT_POOL_BLOCK = False
+
+#: **access token lifetime** default value.
+#: Lifetime (in seconds) assumed for access tokens whose expiry can't be
+#: read from the token itself.
+DEFAULT_ACCESS_TOKEN_LIFETIME = 3600
+
+#: **token_refresh_margin** default value.
+#: Seconds before the access token expires when it is refreshed
+#: proactively, so requests don't get a 401 - Unauthorized response.
+DEFAULT_TOKEN_REFRESH_MARGIN = 60
+
+#: **RetryPolicy max_attempts** default value.
+#: Maximum number of attempts of a request, including the first one.
+DEFAULT_RETRY_MAX_ATTEMPTS = 3
+
+#: **RetryPolicy backoff_factor** default value.
+#: Seconds of the first backoff, doubled after every attempt.
+DEFAULT_RETRY_BACKOFF_FACTOR = 0.5
+
+#: **RetryPolicy max_backoff** default value.
+#: Maximum backoff (in seconds) between two attempts.
+DEFAULT_RETRY_MAX_BACKOFF = 30
+
+#: **RetryPolicy retry_statuses** default value.
+#: Response codes of transient errors that are retried.
+DEFAULT_RETRY_STATUSES = (502, 503, 504)
+
+#: **download chunk_size** default value.
+#: Bytes read at a time from the response of a download.
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+#: **download segment_size** default value.
+#: Bytes of the byte-range segments of a ranged download.
+DEFAULT_DOWNLOAD_SEGMENT_SIZE = 8 * 1024 * 1024
+
+#: Number of attempts to fetch a segment of a ranged download, each one
+#: resuming from the last byte received.
+DEFAULT_DOWNLOAD_SEGMENT_ATTEMPTS = 3
+
+#: **QueryRunner offset_base** default value: the first record of the
+#: assurance queries is numbered 1.
+DEFAULT_PAGINATION_OFFSET_BASE = 1
+
+#: **PrefetchPaginator workers** default value.
+#: Maximum number of pages requested at once.
+DEFAULT_PAGINATION_WORKERS = 4
+
+#: **MetricsAggregator buckets** default value.
+#: Upper bounds (in seconds) of the latency histograms.
+DEFAULT_METRICS_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60
+)
+
+#: Maximum characters of a request or response body in the debug logs;
+#: longer bodies are truncated.
+DEFAULT_DEBUG_BODY_LIMIT = 4096
+
+#: Headers whose values are replaced by "<redacted>" in the debug logs.
+DEBUG_REDACTED_HEADERS = ("X-Auth-Token", "Authorization")
+
+#: **TaskWaiter interval** default value.
+#: Seconds between the first status checks of the tracked tasks.
+DEFAULT_TASK_POLL_INTERVAL = 1
+
+#: **TaskWaiter max_interval** default value.
+#: Maximum seconds between status checks.
+DEFAULT_TASK_POLL_MAX_INTERVAL = 30
+
+#: **TaskWaiter backoff** default value.
+#: Factor of the interval after a check without any completed task.
+DEFAULT_TASK_POLL_BACKOFF = 1.5
+
+#: Seconds subtracted from the start of the time window of the bulk task
+#: status queries, for the clock skew between the client and DNA Center.
+DEFAULT_TASK_CLOCK_SKEW = 300
+
+#: **QueryRunner concurrency** default value.
+#: Maximum number of assurance queries submitted and polled at once.
+DEFAULT_QUERY_CONCURRENCY = 8
+
+#: **QueryRunner page_size** default value.
+#: Rows per page of the submitted assurance queries.
+DEFAULT_QUERY_PAGE_SIZE = 500
+
+#: **QueryRunner buffer_size** default value.
+#: Maximum rows received by QueryRunner.stream and not consumed yet; the
+#: queries wait while it is full.
+DEFAULT_QUERY_BUFFER_SIZE = 1000
+
+#: **CommandBatchRunner batch_size** default value.
+#: Devices per Command Runner request.
+DEFAULT_CLI_BATCH_SIZE = 100
+
+#: **CommandBatchRunner max_commands** default value.
+#: Commands per Command Runner request, the maximum the API accepts.
+DEFAULT_CLI_MAX_COMMANDS = 5
+
+#: **CommandBatchRunner workers** default value.
+#: Maximum number of Command Runner requests in flight.
+DEFAULT_CLI_WORKERS = 8
+
+#: **InventorySync version_fields** default value.
+#: Fields of a device that change when it is updated, the first one
+#: present being compared between refreshes.
+DEFAULT_INVENTORY_VERSION_FIELDS = ("lastUpdateTime", "lastUpdated")
+
+#: **InventorySync volatile_fields** default value.
+#: Fields of a device left out of the comparison of its content, when it
+#: has no version field, because they change all the time.
+DEFAULT_INVENTORY_VOLATILE_FIELDS = ("upTime", "uptimeSeconds")
+
+#: **InventorySync full_every** default value.
+#: With incremental refreshes, every how many refreshes one is a full one.
+DEFAULT_INVENTORY_FULL_EVERY = 10
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""HTTP connection pooling for the DNA Center APIs.
+
+Copyright (c) 2019-2021 Cisco Systems.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import queue
+import threading
+from collections import namedtuple
+from builtins import *
+
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+#: Snapshot of the connection pool counters of a session.
+#: `created` connections were opened, `reused` checkouts got an already
+#: open connection and `discarded` connections were closed because the
+#: pool of their host was full.
+ConnectionPoolStats = namedtuple(
+    "ConnectionPoolStats", ["created", "reused", "discarded"]
+)
+
+
+class PoolStats(object):
+    """Thread-safe counters of connection pool events."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._checkouts = 0
+        self._created = 0
+        self._discarded = 0
+
+    def _checkout(self):
+        with self._lock:
+            self._checkouts += 1
+
+    def _create(self):
+        with self._lock:
+            self._created += 1
+
+    def _discard(self):
+        with self._lock:
+            self._discarded += 1
+
+    def snapshot(self):
+        """Get the current counters.
+
+        Returns:
+            ConnectionPoolStats: The created, reused and discarded counts.
+        """
+        with self._lock:
+            return ConnectionPoolStats(
+                created=self._created,
+                reused=max(self._checkouts - self._created, 0),
+                discarded=self._discarded,
+            )
+
+
+class _PoolStatsQueue(queue.LifoQueue):
+    """Queue of the connections of a pool that counts the connections
+    discarded because it is full."""
+
+    pool_stats = None
+
+    def put(self, item, block=True, timeout=None):
+        try:
+            super(_PoolStatsQueue, self).put(item, block=block, timeout=timeout)
+        except queue.Full:
+            # The pool closes the connection that could not be put back
+            if item is not None:
+                self.pool_stats._discard()
+            raise
+
+
+class _PoolStatsMixin(object):
+    """Connection pool that reports its events to `pool_stats`."""
+
+    pool_stats = None
+
+    def _get_conn(self, timeout=None):
+        self.pool_stats._checkout()
+        return super(_PoolStatsMixin, self)._get_conn(timeout=timeout)
+
+    def _new_conn(self):
+        self.pool_stats._create()
+        return super(_PoolStatsMixin, self)._new_conn()
+
+
+class PoolStatsHTTPAdapter(HTTPAdapter):
+    """requests HTTPAdapter that counts created, reused and discarded
+    connections of its pools.
+
+    `pool_connections` is the number of hosts whose pool is kept,
+    `pool_maxsize` is the number of connections kept per host and
+    `pool_block` makes requests wait for a free connection of the host
+    instead of opening (and later discarding) an extra one.
+    """
+
+    def __init__(self, pool_stats=None, **kwargs):
+        """Create a new PoolStatsHTTPAdapter.
+
+        Args:
+            pool_stats(PoolStats): The counters to update, a new PoolStats
+                is created if not provided.
+            **kwargs: Passed on to requests.adapters.HTTPAdapter.
+        """
+        self.pool_stats = pool_stats or PoolStats()
+        super(PoolStatsHTTPAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        super(PoolStatsHTTPAdapter, self).init_poolmanager(
+            connections, maxsize, block=block, **pool_kwargs
+        )
+        pool_stats = self.__dict__.setdefault("pool_stats", PoolStats())
+        queue_class = type(
+            "LifoQueue", (_PoolStatsQueue,), {"pool_stats": pool_stats}
+        )
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": type(
+                "HTTPConnectionPool",
+                (_PoolStatsMixin, HTTPConnectionPool),
+                {"pool_stats": pool_stats, "QueueCls": queue_class},
+            ),
+            "https": type(
+                "HTTPSConnectionPool",
+                (_PoolStatsMixin, HTTPSConnectionPool),
+                {"pool_stats": pool_stats, "QueueCls": queue_class},
+            ),
+        }
@@ -55,6 +55,18 @@ VERIFY_ENVIRONMENT_VARIABLE = "DNA_CENTER_VERIFY"
 #: name of the environment user agent variable
 USER_AGENT_ENVIRONMENT_VARIABLE = "DNA_CENTER_USER_AGENT"
 
+#: name of the environment schema_cache_dir variable
+SCHEMA_CACHE_DIR_ENVIRONMENT_VARIABLE = "DNA_CENTER_SCHEMA_CACHE_DIR"
+
+#: name of the environment validation variable
+VALIDATION_ENVIRONMENT_VARIABLE = "DNA_CENTER_VALIDATION"
+
+#: name of the environment JSON decoder variable
+JSON_DECODER_ENVIRONMENT_VARIABLE = "DNA_CENTER_JSON_DECODER"
+
+#: name of the environment token_cache_dir variable
+TOKEN_CACHE_DIR_ENVIRONMENT_VARIABLE = "DNA_CENTER_TOKEN_CACHE_DIR"
+
 
 def _is_bool(value):
     if isinstance(value, str):
@@ -125,3 +137,23 @@ def get_env_wait_on_rate_limit():
 def get_env_verify():
     DNA_CENTER_VERIFY = _get_env_value(VERIFY_ENVIRONMENT_VARIABLE, bool, _is_bool)
     return DNA_CENTER_VERIFY
+
+
+def get_env_schema_cache_dir():
+    DNA_CENTER_SCHEMA_CACHE_DIR = os.getenv(SCHEMA_CACHE_DIR_ENVIRONMENT_VARIABLE)
+    return DNA_CENTER_SCHEMA_CACHE_DIR
+
+
+def get_env_token_cache_dir():
+    DNA_CENTER_TOKEN_CACHE_DIR = os.getenv(TOKEN_CACHE_DIR_ENVIRONMENT_VARIABLE)
+    return DNA_CENTER_TOKEN_CACHE_DIR
+
+
+def get_env_validation():
+    DNA_CENTER_VALIDATION = os.getenv(VALIDATION_ENVIRONMENT_VARIABLE)
+    return DNA_CENTER_VALIDATION
+
+
+def get_env_json_decoder():
+    DNA_CENTER_JSON_DECODER = os.getenv(JSON_DECODER_ENVIRONMENT_VARIABLE)
+    return DNA_CENTER_JSON_DECODER
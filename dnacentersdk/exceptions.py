@@ -232,3 +232,31 @@ class MalformedRequest(dnacentersdkException):
     """Raised when a malformed request is received from DNA Center user."""
 
     pass
+
+
+class TaskError(dnacentersdkException):
+    """Raised when a DNA Center task ends with an error.
+
+    The task is available in the `task` attribute.
+    """
+
+    def __init__(self, task_id, task=None, message=None):
+        self.task_id = task_id
+        """The id of the task."""
+
+        self.task = task
+        """The task, as returned by the task APIs."""
+
+        if message is None:
+            reason = None
+            if task is not None:
+                reason = task.get("failureReason") or task.get("progress")
+            message = "Task {} failed: {}".format(task_id, reason)
+        super(TaskError, self).__init__(message)
+
+
+class ReplayError(dnacentersdkException):
+    """Raised when no recorded exchange matches a request sent through a
+    dnacentersdk.transport.ReplayAdapter."""
+
+    pass
@@ -0,0 +1,441 @@
+# -*- coding: utf-8 -*-
+"""Incremental sync of the device inventory of DNA Center to a local snapshot.
+
+Copyright (c) 2019-2021 Cisco Systems.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import hashlib
+import inspect
+import json
+import logging
+import sqlite3
+from collections import namedtuple
+from builtins import *
+
+from .config import (
+    DEFAULT_INVENTORY_FULL_EVERY,
+    DEFAULT_INVENTORY_VERSION_FIELDS,
+    DEFAULT_INVENTORY_VOLATILE_FIELDS,
+)
+from .pagination import Paginator, count_method, total_count
+from .utils import check_type
+
+logger = logging.getLogger(__name__)
+
+#: The changes of the inventory found by a refresh: the `added` and
+#: `changed` devices, as returned by the API, and the `removed` devices,
+#: as they were in the snapshot.
+InventoryDelta = namedtuple("InventoryDelta", ["added", "changed", "removed"])
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS devices (
+    id TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    number INTEGER PRIMARY KEY,
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _dumps(data):
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+
+def _digest(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _stable(device, volatile_fields):
+    return {
+        name: value for name, value in device.items() if name not in volatile_fields
+    }
+
+
+def device_fingerprint(
+    device,
+    version_fields=DEFAULT_INVENTORY_VERSION_FIELDS,
+    volatile_fields=DEFAULT_INVENTORY_VOLATILE_FIELDS,
+):
+    """Get what tells whether a device changed: the value of its first
+    version field (e.g. `lastUpdateTime`), or else the digest of its
+    content without the volatile fields (e.g. `upTime`)."""
+    for name in version_fields:
+        if device.get(name) is not None:
+            return "{}={}".format(name, device[name])
+    return _digest(_dumps(_stable(device, volatile_fields)))
+
+
+class InventorySnapshot(object):
+    """The devices of the inventory stored in a SQLite database, keyed by
+    their id, with their fingerprints, the digests of the pages of the
+    last full refresh and the state of the sync."""
+
+    def __init__(self, path):
+        """Open (or create) a snapshot.
+
+        Args:
+            path(str): The SQLite database file, or ":memory:".
+        """
+        self.path = path
+        self._db = sqlite3.connect(path)
+        with self._db:
+            self._db.executescript(_SCHEMA)
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM devices").fetchone()[0]
+
+    def get(self, device_id):
+        """Get a device of the snapshot, or None."""
+        row = self._db.execute(
+            "SELECT data FROM devices WHERE id = ?", (device_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def devices(self):
+        """Iterate over the devices of the snapshot."""
+        for (data,) in self._db.execute("SELECT data FROM devices ORDER BY id"):
+            yield json.loads(data)
+
+    def fingerprints(self):
+        """Get the fingerprints of the devices by their id."""
+        return dict(self._db.execute("SELECT id, fingerprint FROM devices"))
+
+    def page_digests(self):
+        """Get the digests of the pages of the last full refresh by their
+        number."""
+        return dict(self._db.execute("SELECT number, digest FROM pages"))
+
+    def meta(self, key, default=None):
+        """Get a value of the state of the sync."""
+        row = self._db.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def save(self, devices, removed_ids=(), page_digests=None, **meta):
+        """Store the changes of a refresh in one transaction.
+
+        Args:
+            devices(dict): The `(fingerprint, device)` of the added and
+                changed devices by their id.
+            removed_ids(iterable): The ids of the removed devices.
+            page_digests(dict): The digests of the pages by their number,
+                which replace the stored ones, or None to keep them.
+            **meta: Values of the state of the sync.
+        """
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO devices VALUES (?, ?, ?)",
+                (
+                    (device_id, fingerprint, json.dumps(device, separators=(",", ":")))
+                    for device_id, (fingerprint, device) in devices.items()
+                ),
+            )
+            self._db.executemany(
+                "DELETE FROM devices WHERE id = ?",
+                ((device_id,) for device_id in removed_ids),
+            )
+            if page_digests is not None:
+                self._db.execute("DELETE FROM pages")
+                self._db.executemany(
+                    "INSERT INTO pages VALUES (?, ?)", page_digests.items()
+                )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                ((key, json.dumps(value)) for key, value in meta.items()),
+            )
+
+    def close(self):
+        self._db.close()
+
+
+class InventorySync(object):
+    """Keeps a local snapshot of the device inventory up to date and gets
+    the added, changed and removed devices of every refresh.
+
+    A device changed when its fingerprint changed: the value of its first
+    version field (`lastUpdateTime` or `lastUpdated` by default), or else
+    the digest of its content.
+
+    A full refresh pages through the list endpoint. Pages whose digest is
+    the one of the same page at the previous full refresh are skipped,
+    without comparing their devices; the devices of the snapshot missing
+    from all the pages were removed.
+
+    With `changed_by`, a field the list endpoint sorts by (it must take
+    `sort_by` and `order`) and that grows when a device changes (e.g.
+    `resyncEndTime` for retrieve_network_devices), a refresh only requests
+    the pages of the devices changed since the last refresh, sorted by it
+    in descending order, and checks the count endpoint: when the number of
+    devices is the one of the snapshot plus the new devices, none was
+    removed and the refresh is done. Otherwise it falls back to a full
+    refresh. The check misses a device removed while another one was
+    added without a newer `changed_by` (e.g. not resynced yet): the count
+    is the expected one and both are only found by a full refresh, so
+    every `full_every` refresh is a full one.
+
+    The snapshot is a SQLite database, so the next process starts from it
+    instead of loading the whole inventory again.
+
+    Example:
+        sync = InventorySync(api.devices.get_device_list, "inventory.db")
+        delta = sync.refresh()
+        for device in delta.added + delta.changed:
+            print(device["hostname"])
+
+        sync = InventorySync(
+            api.devices.retrieve_network_devices,
+            "inventory.db",
+            count=api.devices.count_the_number_of_network_devices,
+            changed_by="resyncEndTime",
+            views="BASIC,RESYNC",
+        )
+    """
+
+    def __init__(
+        self,
+        method,
+        path,
+        count=None,
+        changed_by=None,
+        page_size=None,
+        version_fields=DEFAULT_INVENTORY_VERSION_FIELDS,
+        volatile_fields=DEFAULT_INVENTORY_VOLATILE_FIELDS,
+        id_key="id",
+        full_every=DEFAULT_INVENTORY_FULL_EVERY,
+        **kwargs
+    ):
+        """Create a new InventorySync.
+
+        Args:
+            method(callable): The offset/limit list endpoint of the
+                devices, e.g. api.devices.get_device_list.
+            path(str): The SQLite database file of the snapshot.
+            count(callable): The count endpoint of the devices. Defaults
+                to the one found by count_method.
+            changed_by(str): A field the list endpoint sorts by (with
+                `sort_by` and `order`) that grows when a device changes,
+                for the incremental refreshes. Requires a count endpoint.
+            page_size(int): The `limit` of the requests.
+            version_fields(tuple): Fields of a device that change when it
+                is updated.
+            volatile_fields(tuple): Fields left out of the comparison of
+                the content of the devices without version field.
+            id_key(str): The field of the id of the devices.
+            full_every(int): With `changed_by`, make every `full_every`
+                refresh a full one, to find the removed devices the count
+                check misses.
+            **kwargs: Passed on to the list endpoint, e.g. filters.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If `changed_by` is given for a list endpoint
+                without `sort_by` and `order` parameters or without a
+                count endpoint, or full_every is not positive.
+        """
+        check_type(path, str, may_be_none=False)
+        check_type(changed_by, str)
+        check_type(id_key, str, may_be_none=False)
+        check_type(full_every, int, may_be_none=False)
+        if full_every < 1:
+            raise ValueError("full_every must be positive")
+
+        self.paginator = Paginator(method, page_size=page_size)
+        self.count_method = count or count_method(method)
+        if changed_by is not None:
+            parameters = inspect.signature(method).parameters
+            if "sort_by" not in parameters or "order" not in parameters:
+                raise ValueError(
+                    "{} does not sort, it cannot be refreshed by {}".format(
+                        getattr(method, "__name__", method), changed_by
+                    )
+                )
+            if self.count_method is None:
+                raise ValueError(
+                    "No count method found for {}, pass the count endpoint "
+                    "for the incremental refreshes".format(
+                        getattr(method, "__name__", method)
+                    )
+                )
+        self.full_every = full_every
+        self.changed_by = changed_by
+        self.version_fields = tuple(version_fields)
+        self.volatile_fields = frozenset(volatile_fields)
+        self.id_key = id_key
+        self.kwargs = kwargs
+        self.snapshot = InventorySnapshot(path)
+
+    def devices(self):
+        """Iterate over the devices of the snapshot."""
+        return self.snapshot.devices()
+
+    def _fingerprint(self, device):
+        return device_fingerprint(device, self.version_fields, self.volatile_fields)
+
+    def _page_digest(self, items):
+        return _digest(_dumps([_stable(item, self.volatile_fields) for item in items]))
+
+    def count(self):
+        """Get the number of devices from the count endpoint, with the
+        filters of the list endpoint it takes, or None without one."""
+        if self.count_method is None:
+            return None
+        parameters = inspect.signature(self.count_method).parameters
+        kwargs = {
+            name: value for name, value in self.kwargs.items() if name in parameters
+        }
+        try:
+            return total_count(self.count_method(**kwargs))
+        except ValueError:
+            return None
+
+    def refresh(self, full=False):
+        """Bring the snapshot up to date.
+
+        Args:
+            full(bool): Page through the whole inventory, even if an
+                incremental refresh is possible.
+
+        Returns:
+            InventoryDelta: The added, changed and removed devices.
+        """
+        delta = None
+        incremental = self.snapshot.meta("incremental_refreshes", 0)
+        if (
+            not full
+            and self.changed_by
+            and len(self.snapshot)
+            and incremental + 1 < self.full_every
+        ):
+            delta = self._incremental_refresh(incremental + 1)
+        if delta is None:
+            delta = self._full_refresh()
+        logger.debug(
+            "Inventory refreshed: {} added, {} changed, {} removed".format(
+                len(delta.added), len(delta.changed), len(delta.removed)
+            )
+        )
+        return delta
+
+    def _compare(self, device, known, added, changed, updates):
+        fingerprint = self._fingerprint(device)
+        device_id = device[self.id_key]
+        previous = known.get(device_id)
+        if previous == fingerprint:
+            return
+        (added if previous is None else changed).append(device)
+        updates[device_id] = (fingerprint, device)
+
+    def _incremental_refresh(self, number):
+        """Request the devices changed since the last refresh, or return
+        None if devices may have been removed."""
+        watermark = self.snapshot.meta("watermark")
+        if watermark is None:
+            return None
+        known = self.snapshot.fingerprints()
+        added, changed, updates = [], [], {}
+        newest = watermark
+        pages = self.paginator.pages(
+            sort_by=self.changed_by, order="desc", **self.kwargs
+        )
+        try:
+            for items in pages:
+                done = False
+                for device in items:
+                    value = device.get(self.changed_by)
+                    if value is None:
+                        # Sorted first or last depending on the controller,
+                        # the devices without a value are compared one by one
+                        self._compare(device, known, added, changed, updates)
+                        continue
+                    try:
+                        done = value < watermark
+                    except TypeError:
+                        # The value is not comparable to the watermark
+                        return None
+                    if done:
+                        # The next devices did not change since the last refresh
+                        break
+                    newest = max(newest, value)
+                    self._compare(device, known, added, changed, updates)
+                if done:
+                    break
+        finally:
+            pages.close()
+
+        count = self.count()
+        if count is None or count != len(known) + len(added):
+            logger.debug("Inventory count changed, falling back to a full refresh")
+            return None
+        self.snapshot.save(
+            updates, watermark=newest, count=count, incremental_refreshes=number
+        )
+        return InventoryDelta(added, changed, [])
+
+    def _full_refresh(self):
+        known = self.snapshot.fingerprints()
+        digests = self.snapshot.page_digests()
+        added, changed, updates = [], [], {}
+        seen = set()
+        page_digests = {}
+        newest = None
+        for number, items in enumerate(self.paginator.pages(**self.kwargs)):
+            ids = [device[self.id_key] for device in items]
+            seen.update(ids)
+            if self.changed_by:
+                values = [
+                    device[self.changed_by]
+                    for device in items
+                    if device.get(self.changed_by) is not None
+                ]
+                try:
+                    newest = max(values + ([newest] if newest is not None else []))
+                except (TypeError, ValueError):
+                    pass
+            digest = page_digests[number] = self._page_digest(items)
+            if digests.get(number) == digest and all(i in known for i in ids):
+                continue
+            for device in items:
+                self._compare(device, known, added, changed, updates)
+
+        removed_ids = set(known) - seen
+        removed = [self.snapshot.get(device_id) for device_id in sorted(removed_ids)]
+        self.snapshot.save(
+            updates,
+            removed_ids,
+            page_digests,
+            watermark=newest,
+            count=len(seen),
+            incremental_refreshes=0,
+        )
+        return InventoryDelta(added, changed, removed)
+
+    def close(self):
+        """Close the snapshot."""
+        self.snapshot.close()
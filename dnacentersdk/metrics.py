@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+"""Metrics of the requests to the DNA Center APIs.
+
+Copyright (c) 2019-2021 Cisco Systems.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import bisect
+import threading
+import time
+from collections import namedtuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from builtins import *
+
+from .config import DEFAULT_METRICS_BUCKETS
+
+#: A request about to be sent, as reported to MetricsHook.request_started.
+RequestStarted = namedtuple("RequestStarted", ["method", "url_template"])
+
+#: A finished request, as reported to MetricsHook.request_finished.
+#: `status_code` is None when no response was received and `exception` is
+#: the error the request raised, if any. `bytes_in` is None when the size
+#: of a streamed response is unknown. `ttfb` is the time between sending
+#: the last attempt and receiving its headers, `latency` the time of the
+#: whole request, attempts and sleeps included (up to the headers of a
+#: streamed response). `retries` is the number of attempts after the first
+#: one and `rate_limit_sleep` the seconds waited for the rate limiter and
+#: 429 responses.
+RequestMetrics = namedtuple(
+    "RequestMetrics",
+    [
+        "method",
+        "url_template",
+        "status_code",
+        "bytes_out",
+        "bytes_in",
+        "ttfb",
+        "latency",
+        "retries",
+        "rate_limit_sleep",
+        "exception",
+    ],
+)
+
+
+class MetricsHook(object):
+    """Receives the start and the end of the requests of a RestSession.
+
+    The hooks are called in the thread (or task) sending the request, so
+    they must be quick and thread-safe.
+    """
+
+    def request_started(self, event):
+        """Called with a RequestStarted before a request is sent."""
+
+    def request_finished(self, metrics):
+        """Called with the RequestMetrics of a request once it is done."""
+
+
+def _body_size(body):
+    if body is None:
+        return 0
+    if isinstance(body, (bytes, str)):
+        return len(body)
+    return getattr(body, "len", None)
+
+
+def _content_size(response):
+    if getattr(response, "_content", False) is not False:
+        return len(response._content or b"")
+    try:
+        return int(response.headers.get("Content-Length"))
+    except (TypeError, ValueError):
+        return None
+
+
+class RequestMeter(object):
+    """Measures a request of a RestSession for a MetricsHook."""
+
+    def __init__(self, hook, method, url_template, clock=time.monotonic):
+        self._hook = hook
+        self._clock = clock
+        self._start = clock()
+        self.method = method.upper()
+        self.url_template = url_template
+        self.attempts = 0
+        self.rate_limit_sleep = 0.0
+        hook.request_started(RequestStarted(self.method, url_template))
+
+    def attempt(self):
+        """Count an attempt of the request."""
+        self.attempts += 1
+
+    def rate_limited(self, seconds):
+        """Count seconds waited because of rate limiting."""
+        self.rate_limit_sleep += seconds
+
+    def finish(self, response=None, exception=None):
+        """Report the request to the hook."""
+        if response is None:
+            response = getattr(exception, "response", None)
+        request = getattr(response, "request", None)
+        elapsed = getattr(response, "elapsed", None)
+        self._hook.request_finished(
+            RequestMetrics(
+                self.method,
+                self.url_template,
+                getattr(response, "status_code", None),
+                _body_size(getattr(request, "body", None)) if request else 0,
+                _content_size(response) if response is not None else 0,
+                elapsed.total_seconds() if elapsed is not None else None,
+                self._clock() - self._start,
+                max(0, self.attempts - 1),
+                self.rate_limit_sleep,
+                exception,
+            )
+        )
+
+
+class Histogram(object):
+    """Cumulative histogram with fixed upper bounds, like Prometheus'."""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self):
+        """The count of values lower or equal to every bucket, +Inf last."""
+        counts = []
+        total = 0
+        for count in self.counts:
+            total += count
+            counts.append(total)
+        return counts
+
+
+class EndpointMetrics(object):
+    """Metrics of the requests of an endpoint with a given status."""
+
+    def __init__(self, buckets):
+        self.latency = Histogram(buckets)
+        self.ttfb = Histogram(buckets)
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.retries = 0
+        self.rate_limit_sleep = 0.0
+
+    @property
+    def count(self):
+        return self.latency.count
+
+
+class MetricsAggregator(MetricsHook):
+    """In-process MetricsHook aggregating latency and time-to-first-byte
+    histograms, byte, retry and rate-limit sleep counters per endpoint
+    (method, URL template) and status ("error" when no response was
+    received).
+
+    Example:
+        metrics = MetricsAggregator()
+        api = DNACenterAPI(metrics_hook=metrics)
+        ...
+        print(prometheus_text(metrics))
+    """
+
+    def __init__(self, buckets=DEFAULT_METRICS_BUCKETS):
+        """Create a new MetricsAggregator.
+
+        Args:
+            buckets(tuple): Upper bounds (in seconds) of the histograms.
+        """
+        self._buckets = tuple(sorted(buckets))
+        self._endpoints = {}
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def buckets(self):
+        """Upper bounds (in seconds) of the histograms."""
+        return self._buckets
+
+    @property
+    def in_flight(self):
+        """Number of requests being sent."""
+        return self._in_flight
+
+    def request_started(self, event):
+        with self._lock:
+            self._in_flight += 1
+
+    def request_finished(self, metrics):
+        status = "error" if metrics.status_code is None else str(metrics.status_code)
+        key = (metrics.method, metrics.url_template, status)
+        with self._lock:
+            self._in_flight -= 1
+            endpoint = self._endpoints.get(key)
+            if endpoint is None:
+                endpoint = self._endpoints[key] = EndpointMetrics(self._buckets)
+            endpoint.latency.observe(metrics.latency)
+            if metrics.ttfb is not None:
+                endpoint.ttfb.observe(metrics.ttfb)
+            endpoint.bytes_in += metrics.bytes_in or 0
+            endpoint.bytes_out += metrics.bytes_out or 0
+            endpoint.retries += metrics.retries
+            endpoint.rate_limit_sleep += metrics.rate_limit_sleep
+
+    def endpoints(self):
+        """Get the metrics by endpoint.
+
+        Returns:
+            dict: EndpointMetrics by (method, URL template, status).
+        """
+        with self._lock:
+            return dict(self._endpoints)
+
+    def slowest(self, n=10):
+        """Get the endpoints with the largest total latency.
+
+        Returns:
+            list: (method, URL template, status, total seconds) tuples.
+        """
+        return sorted(
+            (
+                key + (endpoint.latency.sum,)
+                for key, endpoint in self.endpoints().items()
+            ),
+            key=lambda item: item[-1],
+            reverse=True,
+        )[:n]
+
+    def reset(self):
+        """Forget the metrics of the finished requests."""
+        with self._lock:
+            self._endpoints = {}
+
+
+def _label_value(value):
+    return (
+        str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+    )
+
+
+def _labels(**labels):
+    return "{" + ",".join(
+        '{}="{}"'.format(name, _label_value(value)) for name, value in labels.items()
+    ) + "}"
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def prometheus_text(aggregator, prefix="dnacentersdk"):
+    """Export the metrics of a MetricsAggregator in the Prometheus text
+    exposition format.
+
+    Args:
+        aggregator(MetricsAggregator): The metrics.
+        prefix(str): Prefix of the metric names.
+
+    Returns:
+        str: The metrics, to be served on a /metrics endpoint.
+    """
+    endpoints = sorted(aggregator.endpoints().items())
+    lines = []
+
+    def header(name, kind, description):
+        lines.append("# HELP {}_{} {}".format(prefix, name, description))
+        lines.append("# TYPE {}_{} {}".format(prefix, name, kind))
+
+    for name, attribute, description in (
+        (
+            "request_duration_seconds",
+            "latency",
+            "Latency of the requests, retries and sleeps included.",
+        ),
+        (
+            "request_ttfb_seconds",
+            "ttfb",
+            "Time to the first byte of the last attempt of the requests.",
+        ),
+    ):
+        header(name, "histogram", description)
+        for (method, template, status), endpoint in endpoints:
+            histogram = getattr(endpoint, attribute)
+            bounds = [_number(bound) for bound in histogram.buckets] + ["+Inf"]
+            for bound, count in zip(bounds, histogram.cumulative_counts()):
+                lines.append(
+                    "{}_{}_bucket{} {}".format(
+                        prefix,
+                        name,
+                        _labels(
+                            method=method, endpoint=template, status=status, le=bound
+                        ),
+                        count,
+                    )
+                )
+            labels = _labels(method=method, endpoint=template, status=status)
+            lines.append(
+                "{}_{}_sum{} {}".format(prefix, name, labels, _number(histogram.sum))
+            )
+            lines.append(
+                "{}_{}_count{} {}".format(prefix, name, labels, histogram.count)
+            )
+
+    for name, attribute, description in (
+        ("request_bytes_sent_total", "bytes_out", "Bytes of the request bodies."),
+        (
+            "request_bytes_received_total",
+            "bytes_in",
+            "Bytes of the response bodies.",
+        ),
+        ("request_retries_total", "retries", "Attempts after the first one."),
+        (
+            "rate_limit_sleep_seconds_total",
+            "rate_limit_sleep",
+            "Seconds waited for the rate limiter and 429 responses.",
+        ),
+    ):
+        header(name, "counter", description)
+        for (method, template, status), endpoint in endpoints:
+            lines.append(
+                "{}_{}{} {}".format(
+                    prefix,
+                    name,
+                    _labels(method=method, endpoint=template, status=status),
+                    _number(getattr(endpoint, attribute)),
+                )
+            )
+
+    header("requests_in_flight", "gauge", "Requests being sent.")
+    lines.append("{}_requests_in_flight {}".format(prefix, aggregator.in_flight))
+    return "\n".join(lines) + "\n"
+
+
+def serve_prometheus(aggregator, port=9464, host="127.0.0.1", prefix="dnacentersdk"):
+    """Serve the metrics of a MetricsAggregator in the Prometheus text
+    format on http://host:port/metrics, from a daemon thread.
+
+    Args:
+        aggregator(MetricsAggregator): The metrics.
+        port(int): The port to listen on, 0 for any free port.
+        host(str): The address to listen on.
+        prefix(str): Prefix of the metric names.
+
+    Returns:
+        http.server.ThreadingHTTPServer: The server, stopped with its
+        `shutdown` method.
+    """
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = prometheus_text(aggregator, prefix).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
@@ -28,6 +28,70 @@ SOFTWARE.
 import json
 
 
+def _wrap(source):
+    """Wrap a dict in a MyDict and a list in a MyList, without copying
+    their nested containers."""
+    if isinstance(source, (MyDict, MyList)):
+        return source
+
+    elif isinstance(source, dict):
+        return MyDict(source)
+
+    elif isinstance(source, list):
+        return MyList(source)
+
+    elif isinstance(source, tuple):
+        return tuple(_wrap(item) for item in source)
+
+    else:
+        # no need for transformation (int, float, str, set, ...)
+        return source
+
+
+def _unwrap(member):
+    """Get the plain data of the wrapped containers. Containers that were
+    never accessed are still the decoded ones and are returned as they are."""
+    if isinstance(member, MyDict):
+        return {k: _unwrap(v) for k, v in dict.items(member)}
+
+    elif isinstance(member, MyList):
+        return [_unwrap(a) for a in list.__iter__(member)]
+
+    elif isinstance(member, tuple):
+        return tuple(_unwrap(a) for a in member)
+
+    else:
+        return member
+
+
+class MyList(list):
+    """A **Python** _list_ subclass whose dict and list items are wrapped
+    (in MyDict and MyList) when they are accessed, by index or iterating.
+    """
+
+    def __getitem__(self, index):
+        value = super(MyList, self).__getitem__(index)
+        if isinstance(index, slice):
+            return MyList(value)
+
+        wrapped = _wrap(value)
+        if wrapped is not value:
+            super(MyList, self).__setitem__(index, wrapped)
+        return wrapped
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __reversed__(self):
+        for index in reversed(range(len(self))):
+            yield self[index]
+
+    def get_list(self):
+        """Returns a <list> of the <MyList> object"""
+        return _unwrap(self)
+
+
 class MyDict(dict):
     """A **Python** _dict_ subclass which tries to act like **JavaScript**
     objects, so you can use the **dot notation** (.) to access members of
@@ -35,38 +99,22 @@ class MyDict(dict):
     If the member doesn't exist yet then it's created when you assign
     something to it.
     Brackets notation (d['foo']) is also possible.
+
+    The source is not copied: its nested dicts and lists are kept as they
+    are and wrapped (in MyDict and MyList) when they are accessed.
     """
 
     def __init__(self, dict_source=None, **kw):
-        if dict_source and isinstance(dict_source, (dict, MyDict)):
-            for k, v in dict_source.items():
-                self[k] = self._transform(v)
-
-        for key, value in kw.items():
-            self[key] = self._transform(value)
+        if dict_source and isinstance(dict_source, dict):
+            super(MyDict, self).update(dict_source)
 
-    def _transform(self, source):
-        if isinstance(source, (dict, MyDict)):
-            return MyDict(source)
+        super(MyDict, self).update(kw)
 
-        elif isinstance(source, list):
-            return [item for item in map(self._transform, source)]
-
-        elif isinstance(source, tuple):
-            result = None
-            for item in source:
-
-                if not result:
-                    result = (self._transform(item),)
-
-                else:
-                    result = result + (self._transform(item),)
-
-            return result
-
-        else:
-            # no need for transformation (int, float, str, set, ...)
-            return source
+    def _wrap_item(self, key, value):
+        wrapped = _wrap(value)
+        if wrapped is not value:
+            super(MyDict, self).__setitem__(key, wrapped)
+        return wrapped
 
     def __getattr__(self, name):
         """
@@ -81,7 +129,7 @@ class MyDict(dict):
         Sets a field into the object in the form:
             obj.name = value
         """
-        self[name] = self._transform(value)
+        self[name] = value
 
     def __getitem__(self, name):
         """
@@ -115,7 +163,7 @@ class MyDict(dict):
 
     def get(self, key, default=None):
         if key in self:
-            return super(MyDict, self).get(key, default)
+            return self._wrap_item(key, super(MyDict, self).get(key, default))
 
         else:
             parts = str(key).split(".")
@@ -129,47 +177,27 @@ class MyDict(dict):
             else:
                 return super(MyDict, self).get(key, default)
 
+    def values(self):
+        for key, value in list(super(MyDict, self).items()):
+            self._wrap_item(key, value)
+        return super(MyDict, self).values()
+
+    def items(self):
+        for key, value in list(super(MyDict, self).items()):
+            self._wrap_item(key, value)
+        return super(MyDict, self).items()
+
     def to_json(self):
         """Returns a JSON-like string representing this instance"""
         return json.dumps(self.get_dict())
 
     def get_dict(self):
-        """Returns a <dict> of the <MyDict> object"""
-
-        def _get_dict(member):
-
-            if isinstance(member, (dict, MyDict)):
-                d = {}
-                for k, v in member.items():
-                    d[k] = _get_dict(v)
+        """Returns a <dict> of the <MyDict> object
 
-                return d
-
-            elif isinstance(member, (list,)):
-                lst = []
-                for a in member:
-                    lst.append(_get_dict(a))
-
-                return lst
-
-            elif isinstance(member, (tuple,)):
-                tpl = tuple()
-                for a in member:
-                    tpl = tpl + (_get_dict(a),)
-
-                return tpl
-
-            elif isinstance(member, (set,)):
-                st = set([])
-                for a in member:
-                    st.add(_get_dict(a))
-
-                return st
-
-            else:
-                return member
-
-        return _get_dict(self)
+        Only the members that were accessed are copied, the others are the
+        decoded data itself.
+        """
+        return _unwrap(self)
 
     def __getstate__(self):
         """
@@ -200,9 +228,8 @@ class MyDict(dict):
 
 def mydict_data_factory(model, json_data):
     """Data factory function with standard params."""
-    # Uses kw (json_data =) to handle array responses.
-    # Returns .json_data as is not important.
+    # Nested containers are wrapped when they are accessed.
     # Handle None (empty response) by returning an empty MyDict
     if json_data is None:
         return MyDict()
-    return MyDict(json_data=json_data).json_data
+    return _wrap(json_data)
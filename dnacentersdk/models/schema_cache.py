@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""On-disk cache of compiled DNA Center JSON schema validators.
+
+Compiling a JSON schema with `fastjsonschema.compile` generates and execs
+Python source on every process start. When a cache directory is configured,
+the generated source is written once, keyed by the schema and the
+fastjsonschema version, and later processes import it (and its bytecode)
+instead of compiling the schema again.
+
+Copyright (c) 2019-2021 Cisco Systems.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import tempfile
+from builtins import *
+
+import fastjsonschema
+
+logger = logging.getLogger(__name__)
+
+_schema_cache_dir = None
+
+
+def get_schema_cache_dir():
+    """The directory where compiled validators are cached, or None."""
+    return _schema_cache_dir
+
+
+def set_schema_cache_dir(cache_dir):
+    """Enable (or disable with None) the on-disk validator cache.
+
+    Args:
+        cache_dir(str): Directory where the generated validators are stored.
+            It is created if it does not exist.
+    """
+    global _schema_cache_dir
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+    _schema_cache_dir = cache_dir
+
+
+def schema_cache_key(definition):
+    """Key of a schema definition for the running fastjsonschema version."""
+    canonical = json.dumps(definition, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha256()
+    digest.update(fastjsonschema.VERSION.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(canonical.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _write_validator_code(path, definition):
+    code = fastjsonschema.compile_to_code(definition)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=".jsd_", suffix=".tmp", dir=os.path.dirname(path)
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(code)
+        # Atomic, so concurrent processes never import a partial file
+        os.replace(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+
+def _load_cached_validator(cache_dir, definition):
+    module_name = "jsd_{}".format(schema_cache_key(definition))
+    path = os.path.join(cache_dir, module_name + ".py")
+    if not os.path.isfile(path):
+        _write_validator_code(path, definition)
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.validate
+
+
+def compile_schema(definition):
+    """Compile a JSON schema, reusing the on-disk cache when enabled.
+
+    Args:
+        definition(dict): The JSON schema.
+
+    Returns:
+        callable: The fastjsonschema validation function.
+    """
+    cache_dir = _schema_cache_dir
+    if cache_dir is not None:
+        try:
+            return _load_cached_validator(cache_dir, definition)
+        except Exception as e:
+            logger.debug("Schema cache unavailable, compiling: {}".format(e))
+    return fastjsonschema.compile(definition)
@@ -28,5458 +28,21 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-
-import json
+import importlib
+import pkgutil
+import threading
+import time
 from builtins import *
+from collections import namedtuple
 
 import fastjsonschema
 from dnacentersdk.exceptions import MalformedRequest
 
 
-from .validators.v2_3_5_3.jsd_b2f15d0c54c2862a60a904289ddd import (
-    JSONSchemaValidatorB2F15D0C54C2862A60A904289Ddd as JSONSchemaValidatorB2F15D0C54C2862A60A904289Ddd_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e22c99a82f5764828810acb45e7a9e import (
-    JSONSchemaValidatorE22C99A82F5764828810Acb45E7A9E as JSONSchemaValidatorE22C99A82F5764828810Acb45E7A9E_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_97e350a7a690cdfeffa5eaca import (
-    JSONSchemaValidator97E350A7A690Cdfeffa5Eaca as JSONSchemaValidator97E350A7A690Cdfeffa5Eaca_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_fd6083b0c65d03b2d53f10b3ece59d import (
-    JSONSchemaValidatorFd6083B0C65D03B2D53F10B3Ece59D as JSONSchemaValidatorFd6083B0C65D03B2D53F10B3Ece59D_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_a0a8d545698d1d59a9be90e51 import (
-    JSONSchemaValidatorA0A8D545698D1D59A9Be90E51 as JSONSchemaValidatorA0A8D545698D1D59A9Be90E51_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d7073129453698264e7519d82991c import (
-    JSONSchemaValidatorD7073129453698264E7519D82991C as JSONSchemaValidatorD7073129453698264E7519D82991C_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_f790a930d452708353c374f5c0f90f import (
-    JSONSchemaValidatorF790A930D452708353C374F5C0F90F as JSONSchemaValidatorF790A930D452708353C374F5C0F90F_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_a544e27e18e5412af3b68d915c8ca50 import (
-    JSONSchemaValidatorA544E27E18E5412Af3B68D915C8Ca50 as JSONSchemaValidatorA544E27E18E5412Af3B68D915C8Ca50_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d999a1d36ee52babb6b619877dad734 import (
-    JSONSchemaValidatorD999A1D36Ee52BaBb6B619877Dad734 as JSONSchemaValidatorD999A1D36Ee52BaBb6B619877Dad734_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d76a951f85a7a927afc2f1ea935c8 import (
-    JSONSchemaValidatorD76A951F85A7A927AFc2F1Ea935C8 as JSONSchemaValidatorD76A951F85A7A927AFc2F1Ea935C8_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e1a76c121857a085149e62e56caadd import (
-    JSONSchemaValidatorE1A76C121857A085149E62E56Caadd as JSONSchemaValidatorE1A76C121857A085149E62E56Caadd_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_f5a13405ba69f3957b98db8663a import (
-    JSONSchemaValidatorF5A13405Ba69F3957B98Db8663A as JSONSchemaValidatorF5A13405Ba69F3957B98Db8663A_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_a3954b27e5eeb82789ed231e0557f import (
-    JSONSchemaValidatorA3954B27E5Eeb82789Ed231E0557F as JSONSchemaValidatorA3954B27E5Eeb82789Ed231E0557F_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e2202e5f7586e68778ed7772b1 import (
-    JSONSchemaValidatorE2202E5F7586E68778Ed7772B1 as JSONSchemaValidatorE2202E5F7586E68778Ed7772B1_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e3a724a35854758d65a83823c88435 import (
-    JSONSchemaValidatorE3A724A35854758D65A83823C88435 as JSONSchemaValidatorE3A724A35854758D65A83823C88435_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_f256e33af7501a8bdae2742ca9f6d6 import (
-    JSONSchemaValidatorF256E33Af7501A8BdaE2742Ca9F6D6 as JSONSchemaValidatorF256E33Af7501A8BdaE2742Ca9F6D6_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_b3323a24b275402b97c7e9ccfd78c91 import (
-    JSONSchemaValidatorB3323A24B275402B97C7E9Ccfd78C91 as JSONSchemaValidatorB3323A24B275402B97C7E9Ccfd78C91_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d1845268faf55f98bc952872259f16f import (
-    JSONSchemaValidatorD1845268Faf55F98Bc952872259F16F as JSONSchemaValidatorD1845268Faf55F98Bc952872259F16F_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_f77386a48895fa59dcddcc7dd4addb5 import (
-    JSONSchemaValidatorF77386A48895Fa59DcdDcc7Dd4Addb5 as JSONSchemaValidatorF77386A48895Fa59DcdDcc7Dd4Addb5_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_ffa347eb411567a9c793696795250a5 import (
-    JSONSchemaValidatorFfa347EB411567A9C793696795250A5 as JSONSchemaValidatorFfa347EB411567A9C793696795250A5_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_ffcaccdd9f2530abf66adc98c3f0201 import (
-    JSONSchemaValidatorFfcaccdD9F2530ABf66Adc98C3F0201 as JSONSchemaValidatorFfcaccdD9F2530ABf66Adc98C3F0201_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_fa310ab095148bdb00d7d3d5e1676 import (
-    JSONSchemaValidatorFa310Ab095148Bdb00D7D3D5E1676 as JSONSchemaValidatorFa310Ab095148Bdb00D7D3D5E1676_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_a9136d5513985f15e91a19da66c import (
-    JSONSchemaValidatorA9136D5513985F15E91A19Da66C as JSONSchemaValidatorA9136D5513985F15E91A19Da66C_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_b887c55faaca726bbe4ac2564 import (
-    JSONSchemaValidatorB887C55FaAca726Bbe4Ac2564 as JSONSchemaValidatorB887C55FaAca726Bbe4Ac2564_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_f90ae8599c8a21c98b7a1ca804 import (
-    JSONSchemaValidatorF90Ae8599C8A21C98B7A1Ca804 as JSONSchemaValidatorF90Ae8599C8A21C98B7A1Ca804_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_a94058a99acaaf8eb73c9227 import (
-    JSONSchemaValidatorA94058A99AcaAf8Eb73C9227 as JSONSchemaValidatorA94058A99AcaAf8Eb73C9227_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_cfb1d6e52878d057740de275896 import (
-    JSONSchemaValidatorCfb1D6E52878D057740De275896 as JSONSchemaValidatorCfb1D6E52878D057740De275896_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_bdc981805b5fad0a038966d52558 import (
-    JSONSchemaValidatorBdc981805B5FAd0A038966D52558 as JSONSchemaValidatorBdc981805B5FAd0A038966D52558_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_df9908ad265e83ab77d73803925678 import (
-    JSONSchemaValidatorDf9908Ad265E83Ab77D73803925678 as JSONSchemaValidatorDf9908Ad265E83Ab77D73803925678_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_a3a1bf404bf5772828f66f1e10f074d import (
-    JSONSchemaValidatorA3A1Bf404Bf5772828F66F1E10F074D as JSONSchemaValidatorA3A1Bf404Bf5772828F66F1E10F074D_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_b60f9f312235959812d49dc4c469e83 import (
-    JSONSchemaValidatorB60F9F312235959812D49Dc4C469E83 as JSONSchemaValidatorB60F9F312235959812D49Dc4C469E83_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_bb01b6bd31b53bfb12bbe327320392e import (
-    JSONSchemaValidatorBb01B6BD31B53BfB12BBe327320392E as JSONSchemaValidatorBb01B6BD31B53BfB12BBe327320392E_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e69d02d71905aecbd10b782469efbda import (
-    JSONSchemaValidatorE69D02D71905AecBd10B782469Efbda as JSONSchemaValidatorE69D02D71905AecBd10B782469Efbda_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e722e05046d5262b55c125237e9b67d import (
-    JSONSchemaValidatorE722E05046D5262B55C125237E9B67D as JSONSchemaValidatorE722E05046D5262B55C125237E9B67D_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d2bd5f05bd535a89ebadb30e2ede9e import (
-    JSONSchemaValidatorD2Bd5F05Bd535A89EbAdb30E2Ede9E as JSONSchemaValidatorD2Bd5F05Bd535A89EbAdb30E2Ede9E_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d2ece28b509b8ef80b2b8c5c5f36 import (
-    JSONSchemaValidatorD2EcE28B509B8Ef80B2B8C5C5F36 as JSONSchemaValidatorD2EcE28B509B8Ef80B2B8C5C5F36_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e31c795964b3bdf85da1b5a2a5 import (
-    JSONSchemaValidatorE31C795964B3BdF85Da1B5A2A5 as JSONSchemaValidatorE31C795964B3BdF85Da1B5A2A5_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_b8699619f95a24bd2d81f12f048235 import (
-    JSONSchemaValidatorB8699619F95A24Bd2D81F12F048235 as JSONSchemaValidatorB8699619F95A24Bd2D81F12F048235_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_c00df3623b5a74ad41e75487ed9b77 import (
-    JSONSchemaValidatorC00Df3623B5A74Ad41E75487Ed9B77 as JSONSchemaValidatorC00Df3623B5A74Ad41E75487Ed9B77_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e702d5786552992aa76b930780569 import (
-    JSONSchemaValidatorE702D5786552992Aa76B930780569 as JSONSchemaValidatorE702D5786552992Aa76B930780569_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_af29516f0c8591da2a92523b5ab3386 import (
-    JSONSchemaValidatorAf29516F0C8591DA2A92523B5Ab3386 as JSONSchemaValidatorAf29516F0C8591DA2A92523B5Ab3386_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_fdd2af215b9b8327a3e24a3dea89 import (
-    JSONSchemaValidatorFdd2Af215B9B8327A3E24A3Dea89 as JSONSchemaValidatorFdd2Af215B9B8327A3E24A3Dea89_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d9ccfce8451809129ec5de42c5048 import (
-    JSONSchemaValidatorD9CcfCe8451809129Ec5De42C5048 as JSONSchemaValidatorD9CcfCe8451809129Ec5De42C5048_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e6ea8c5d425cf9ac77006f5593725f import (
-    JSONSchemaValidatorE6Ea8C5D425Cf9Ac77006F5593725F as JSONSchemaValidatorE6Ea8C5D425Cf9Ac77006F5593725F_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_bd5b507f58a50aab614e3d7409eec4c import (
-    JSONSchemaValidatorBd5B507F58A50AaB614E3D7409Eec4C as JSONSchemaValidatorBd5B507F58A50AaB614E3D7409Eec4C_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e4f91ea42515ccdbc24549b84ca1e90 import (
-    JSONSchemaValidatorE4F91Ea42515CcdBc24549B84Ca1E90 as JSONSchemaValidatorE4F91Ea42515CcdBc24549B84Ca1E90_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_f5d13316c8f53a0b78d881c738a15c6 import (
-    JSONSchemaValidatorF5D13316C8F53A0B78D881C738A15C6 as JSONSchemaValidatorF5D13316C8F53A0B78D881C738A15C6_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_bbf7ce025bc2a291b90c37a6b898 import (
-    JSONSchemaValidatorBbf7Ce025Bc2A291B90C37A6B898 as JSONSchemaValidatorBbf7Ce025Bc2A291B90C37A6B898_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e0b654c39dc6e19cd6f5194d import (
-    JSONSchemaValidatorE0B654C39Dc6E19Cd6F5194D as JSONSchemaValidatorE0B654C39Dc6E19Cd6F5194D_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_ae7f02a3d051f2baf7cc087990d658 import (
-    JSONSchemaValidatorAe7F02A3D051F2Baf7Cc087990D658 as JSONSchemaValidatorAe7F02A3D051F2Baf7Cc087990D658_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d9227adc5f02b7cd264af7255d19 import (
-    JSONSchemaValidatorD9227Adc5F02B7Cd264Af7255D19 as JSONSchemaValidatorD9227Adc5F02B7Cd264Af7255D19_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e6ec627d3c587288978990aae75228 import (
-    JSONSchemaValidatorE6Ec627D3C587288978990Aae75228 as JSONSchemaValidatorE6Ec627D3C587288978990Aae75228_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_c380301e3e05423bdc1857ff00ae77a import (
-    JSONSchemaValidatorC380301E3E05423Bdc1857Ff00Ae77A as JSONSchemaValidatorC380301E3E05423Bdc1857Ff00Ae77A_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_f24f6c07641580ba6ed710e92c2da16 import (
-    JSONSchemaValidatorF24F6C07641580BA6Ed710E92C2Da16 as JSONSchemaValidatorF24F6C07641580BA6Ed710E92C2Da16_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_fcc151af7615a84adf48b714d146192 import (
-    JSONSchemaValidatorFcc151AF7615A84Adf48B714D146192 as JSONSchemaValidatorFcc151AF7615A84Adf48B714D146192_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_fe3ec7651e79d891fce37a0d860 import (
-    JSONSchemaValidatorFe3Ec7651E79D891Fce37A0D860 as JSONSchemaValidatorFe3Ec7651E79D891Fce37A0D860_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_b07f187b7456c8bbb6088a2f24dcee import (
-    JSONSchemaValidatorB07F187B7456C8Bbb6088A2F24Dcee as JSONSchemaValidatorB07F187B7456C8Bbb6088A2F24Dcee_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_cb7563a5058c4801eb842a74ff61c import (
-    JSONSchemaValidatorCb7563A5058C4801EB842A74Ff61C as JSONSchemaValidatorCb7563A5058C4801EB842A74Ff61C_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d39d23589e85db0a63c414057c import (
-    JSONSchemaValidatorD39D23589E85Db0A63C414057C as JSONSchemaValidatorD39D23589E85Db0A63C414057C_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_a9f5796226051218eac559ab5211384 import (
-    JSONSchemaValidatorA9F5796226051218Eac559Ab5211384 as JSONSchemaValidatorA9F5796226051218Eac559Ab5211384_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_c4befbd77a452a9b7873ffc360a1f20 import (
-    JSONSchemaValidatorC4Befbd77A452A9B7873Ffc360A1F20 as JSONSchemaValidatorC4Befbd77A452A9B7873Ffc360A1F20_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_c8d11fb9fc752ab8bb8e2b1413ccc92 import (
-    JSONSchemaValidatorC8D11Fb9Fc752Ab8Bb8E2B1413Ccc92 as JSONSchemaValidatorC8D11Fb9Fc752Ab8Bb8E2B1413Ccc92_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d82755e5e03510daf0951c1f42c2702 import (
-    JSONSchemaValidatorD82755E5E03510DAf0951C1F42C2702 as JSONSchemaValidatorD82755E5E03510DAf0951C1F42C2702_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e0bd567c1395531a7f18ab4e14110bd import (
-    JSONSchemaValidatorE0Bd567C1395531A7F18Ab4E14110Bd as JSONSchemaValidatorE0Bd567C1395531A7F18Ab4E14110Bd_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_eca62ef076b5627a85b2a5959613fb8 import (
-    JSONSchemaValidatorEca62Ef076B5627A85B2A5959613Fb8 as JSONSchemaValidatorEca62Ef076B5627A85B2A5959613Fb8_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_f6536a8f01d5863856a0a8308198e15 import (
-    JSONSchemaValidatorF6536A8F01D5863856A0A8308198E15 as JSONSchemaValidatorF6536A8F01D5863856A0A8308198E15_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_f7dd6a6cf8d57499168aae05847ad34 import (
-    JSONSchemaValidatorF7Dd6A6Cf8D57499168Aae05847Ad34 as JSONSchemaValidatorF7Dd6A6Cf8D57499168Aae05847Ad34_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_cec6c85d9bb4bcc8f61f31296b import (
-    JSONSchemaValidatorCeC6C85D9BB4BcC8F61F31296B as JSONSchemaValidatorCeC6C85D9BB4BcC8F61F31296B_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_f7cf4f24d54c6944a31ed308f8361 import (
-    JSONSchemaValidatorF7Cf4F24D54C6944A31Ed308F8361 as JSONSchemaValidatorF7Cf4F24D54C6944A31Ed308F8361_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_db7b6c4f0542aab9fe7cf5c995f83 import (
-    JSONSchemaValidatorDb7B6C4F0542AAb9FE7Cf5C995F83 as JSONSchemaValidatorDb7B6C4F0542AAb9FE7Cf5C995F83_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d7161b33157dba957ba18eda440c2 import (
-    JSONSchemaValidatorD7161B33157DbA957Ba18Eda440C2 as JSONSchemaValidatorD7161B33157DbA957Ba18Eda440C2_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_f5ebb9d50aab287f320d32181c0 import (
-    JSONSchemaValidatorF5EBb9D50AaB287F320D32181C0 as JSONSchemaValidatorF5EBb9D50AaB287F320D32181C0_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_fa27ccbaf55711849381a707e1edfa import (
-    JSONSchemaValidatorFa27CcBaf55711849381A707E1Edfa as JSONSchemaValidatorFa27CcBaf55711849381A707E1Edfa_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_f04b76067507b9384e409e9431ef3 import (
-    JSONSchemaValidatorF04B76067507B9384E409E9431Ef3 as JSONSchemaValidatorF04B76067507B9384E409E9431Ef3_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_b6581534bb321eaea272365b7 import (
-    JSONSchemaValidatorB6581534BB321Eaea272365B7 as JSONSchemaValidatorB6581534BB321Eaea272365B7_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d1608b2751c883a072ee3fb80228 import (
-    JSONSchemaValidatorD1608B2751C883A072Ee3Fb80228 as JSONSchemaValidatorD1608B2751C883A072Ee3Fb80228_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_be8cdb967555fcca03a4c1f796eee56 import (
-    JSONSchemaValidatorBe8Cdb967555FccA03A4C1F796Eee56 as JSONSchemaValidatorBe8Cdb967555FccA03A4C1F796Eee56_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_dbea7d7de125cf6b840d5032d3a5c59 import (
-    JSONSchemaValidatorDbea7D7De125Cf6B840D5032D3A5C59 as JSONSchemaValidatorDbea7D7De125Cf6B840D5032D3A5C59_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_f5645e6e819558fa08761dee45ca406 import (
-    JSONSchemaValidatorF5645E6E819558FA08761Dee45Ca406 as JSONSchemaValidatorF5645E6E819558FA08761Dee45Ca406_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_fe06867e548bba1919024b40d992 import (
-    JSONSchemaValidatorFe06867E548BBa1919024B40D992 as JSONSchemaValidatorFe06867E548BBa1919024B40D992_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_efa92557c9a6c8af0a71829c7e import (
-    JSONSchemaValidatorEfA92557C9A6C8Af0A71829C7E as JSONSchemaValidatorEfA92557C9A6C8Af0A71829C7E_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_ecc3258a5c5b8f2267a512820a59 import (
-    JSONSchemaValidatorEcc3258A5C5B8F2267A512820A59 as JSONSchemaValidatorEcc3258A5C5B8F2267A512820A59_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_f5602b2965e53b5bdda193025a3fc import (
-    JSONSchemaValidatorF5602B2965E53B5BdDa193025A3Fc as JSONSchemaValidatorF5602B2965E53B5BdDa193025A3Fc_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d16471a58805b4aa2c757209d188aed import (
-    JSONSchemaValidatorD16471A58805B4AA2C757209D188Aed as JSONSchemaValidatorD16471A58805B4AA2C757209D188Aed_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d8fc92ddeab597ebb50ea003a6d46bd import (
-    JSONSchemaValidatorD8Fc92DDeab597EBb50Ea003A6D46Bd as JSONSchemaValidatorD8Fc92DDeab597EBb50Ea003A6D46Bd_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_cf2cac6f150c9bee9ade37921b162 import (
-    JSONSchemaValidatorCf2CaC6F150C9Bee9Ade37921B162 as JSONSchemaValidatorCf2CaC6F150C9Bee9Ade37921B162_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_bc55e6552fac58cc0aaacd773a import (
-    JSONSchemaValidatorBc55E6552FAc58Cc0Aaacd773A as JSONSchemaValidatorBc55E6552FAc58Cc0Aaacd773A_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_dece7a9b353b49084a8ffa4f18c91 import (
-    JSONSchemaValidatorDece7A9B353B49084A8Ffa4F18C91 as JSONSchemaValidatorDece7A9B353B49084A8Ffa4F18C91_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_c9ea5c02b2b7368cac785f30 import (
-    JSONSchemaValidatorC9Ea5C02B2B7368Cac785F30 as JSONSchemaValidatorC9Ea5C02B2B7368Cac785F30_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_f2c120b855cb8c852806ce72e54d import (
-    JSONSchemaValidatorF2C120B855Cb8C852806Ce72E54D as JSONSchemaValidatorF2C120B855Cb8C852806Ce72E54D_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_aaebb912125213b350d7423b4f01a4 import (
-    JSONSchemaValidatorAaebb912125213B350D7423B4F01A4 as JSONSchemaValidatorAaebb912125213B350D7423B4F01A4_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_ad0cce45817862bebfc839bf5ae import (
-    JSONSchemaValidatorAd0Cce45817862BEbfc839Bf5Ae as JSONSchemaValidatorAd0Cce45817862BEbfc839Bf5Ae_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_fb5a8c0075563491622171958074bf import (
-    JSONSchemaValidatorFb5A8C0075563491622171958074Bf as JSONSchemaValidatorFb5A8C0075563491622171958074Bf_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_a764c85d8df5c30b9143619d4f9cde9 import (
-    JSONSchemaValidatorA764C85D8Df5C30B9143619D4F9Cde9 as JSONSchemaValidatorA764C85D8Df5C30B9143619D4F9Cde9_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_c991ce0b0f058a08c863a4abdfc70a6 import (
-    JSONSchemaValidatorC991Ce0B0F058A08C863A4Abdfc70A6 as JSONSchemaValidatorC991Ce0B0F058A08C863A4Abdfc70A6_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_f41eb48a0da56949cfaddeecb51ab66 import (
-    JSONSchemaValidatorF41Eb48A0Da56949CfaDdeecb51Ab66 as JSONSchemaValidatorF41Eb48A0Da56949CfaDdeecb51Ab66_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_a352f6280e445075b3ea7cbf868c2d94 import (
-    JSONSchemaValidatorA352F6280E445075B3Ea7Cbf868C2D94 as JSONSchemaValidatorA352F6280E445075B3Ea7Cbf868C2D94_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_a3b37dcbe2a150bea06d9dcde1837281 import (
-    JSONSchemaValidatorA3B37DcbE2A150BeA06D9Dcde1837281 as JSONSchemaValidatorA3B37DcbE2A150BeA06D9Dcde1837281_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_a54fce1a0c305bdabfe91a8a6161e539 import (
-    JSONSchemaValidatorA54Fce1A0C305BdaBfe91A8A6161E539 as JSONSchemaValidatorA54Fce1A0C305BdaBfe91A8A6161E539_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_a66db26df529597c84c2a15ea2d632ce import (
-    JSONSchemaValidatorA66Db26DF529597C84C2A15Ea2D632Ce as JSONSchemaValidatorA66Db26DF529597C84C2A15Ea2D632Ce_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_a73fbc67627e5bbbafe748de84d42df6 import (
-    JSONSchemaValidatorA73Fbc67627E5BbbAfe748De84D42Df6 as JSONSchemaValidatorA73Fbc67627E5BbbAfe748De84D42Df6_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_a7935eedd53a5b8c84668c903cc1c705 import (
-    JSONSchemaValidatorA7935EedD53A5B8C84668C903Cc1C705 as JSONSchemaValidatorA7935EedD53A5B8C84668C903Cc1C705_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_a7d6d604f38f5f849af79d8768bddfc1 import (
-    JSONSchemaValidatorA7D6D604F38F5F849Af79D8768Bddfc1 as JSONSchemaValidatorA7D6D604F38F5F849Af79D8768Bddfc1_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_a9b864257b965fe4bd8b0293f41f1537 import (
-    JSONSchemaValidatorA9B864257B965Fe4Bd8B0293F41F1537 as JSONSchemaValidatorA9B864257B965Fe4Bd8B0293F41F1537_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_aa11f09d28165f4ea6c81b8642e59cc4 import (
-    JSONSchemaValidatorAa11F09D28165F4EA6C81B8642E59Cc4 as JSONSchemaValidatorAa11F09D28165F4EA6C81B8642E59Cc4_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_ac6e63199fb05bcf89106a22502c2197 import (
-    JSONSchemaValidatorAc6E63199Fb05Bcf89106A22502C2197 as JSONSchemaValidatorAc6E63199Fb05Bcf89106A22502C2197_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_ad96e712f4525a128368b1bfe3afc21c import (
-    JSONSchemaValidatorAd96E712F4525A128368B1Bfe3Afc21C as JSONSchemaValidatorAd96E712F4525A128368B1Bfe3Afc21C_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_b119a4d455e35cc3b2cc6695a045cbfa import (
-    JSONSchemaValidatorB119A4D455E35Cc3B2Cc6695A045Cbfa as JSONSchemaValidatorB119A4D455E35Cc3B2Cc6695A045Cbfa_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_b11aa4de387251c794665e030fa815da import (
-    JSONSchemaValidatorB11Aa4De387251C794665E030Fa815Da as JSONSchemaValidatorB11Aa4De387251C794665E030Fa815Da_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_b2dae3b41636596aa02c3ad0a4bcb8d7 import (
-    JSONSchemaValidatorB2Dae3B41636596AA02C3Ad0A4Bcb8D7 as JSONSchemaValidatorB2Dae3B41636596AA02C3Ad0A4Bcb8D7_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_b6f2d8e46cdd5f05bb06f52cd1b26fb2 import (
-    JSONSchemaValidatorB6F2D8E46Cdd5F05Bb06F52Cd1B26Fb2 as JSONSchemaValidatorB6F2D8E46Cdd5F05Bb06F52Cd1B26Fb2_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_b7079a38844e56dd8f1b6b876880a02e import (
-    JSONSchemaValidatorB7079A38844E56Dd8F1B6B876880A02E as JSONSchemaValidatorB7079A38844E56Dd8F1B6B876880A02E_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_b95201b6a6905a10b463e036bf591166 import (
-    JSONSchemaValidatorB95201B6A6905A10B463E036Bf591166 as JSONSchemaValidatorB95201B6A6905A10B463E036Bf591166_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_bc33daf690ec5399a507829abfc4fe64 import (
-    JSONSchemaValidatorBc33Daf690Ec5399A507829Abfc4Fe64 as JSONSchemaValidatorBc33Daf690Ec5399A507829Abfc4Fe64_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_bc3cb471beaf5bfeb47201993c023068 import (
-    JSONSchemaValidatorBc3Cb471Beaf5BfeB47201993C023068 as JSONSchemaValidatorBc3Cb471Beaf5BfeB47201993C023068_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_bce8e6b307ce52dd8f5546fbd78e05ee import (
-    JSONSchemaValidatorBce8E6B307Ce52Dd8F5546Fbd78E05Ee as JSONSchemaValidatorBce8E6B307Ce52Dd8F5546Fbd78E05Ee_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_bd31fcbd1ecd5a2c8b812088b27bfcea import (
-    JSONSchemaValidatorBd31Fcbd1Ecd5A2C8B812088B27Bfcea as JSONSchemaValidatorBd31Fcbd1Ecd5A2C8B812088B27Bfcea_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_bf40cea4982c54278a52ac2e7b0c458a import (
-    JSONSchemaValidatorBf40Cea4982C54278A52Ac2E7B0C458A as JSONSchemaValidatorBf40Cea4982C54278A52Ac2E7B0C458A_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_c524f0ec199e5435bcaee56b423532e7 import (
-    JSONSchemaValidatorC524F0Ec199E5435BcaeE56B423532E7 as JSONSchemaValidatorC524F0Ec199E5435BcaeE56B423532E7_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_c5f97865727857d5b1eeaedee3dcccd2 import (
-    JSONSchemaValidatorC5F97865727857D5B1EeAedee3Dcccd2 as JSONSchemaValidatorC5F97865727857D5B1EeAedee3Dcccd2_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_c6774ff9549a53d4b41fdd2d88f1d0f5 import (
-    JSONSchemaValidatorC6774Ff9549A53D4B41FDd2D88F1D0F5 as JSONSchemaValidatorC6774Ff9549A53D4B41FDd2D88F1D0F5_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_c9b5b83e67195b649077a05e42897cc4 import (
-    JSONSchemaValidatorC9B5B83E67195B649077A05E42897Cc4 as JSONSchemaValidatorC9B5B83E67195B649077A05E42897Cc4_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_c9f995abc21b54e7860f66aef2ffbc85 import (
-    JSONSchemaValidatorC9F995AbC21B54E7860F66Aef2Ffbc85 as JSONSchemaValidatorC9F995AbC21B54E7860F66Aef2Ffbc85_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_cc19241fd92f586c8986d4d5c99c3a88 import (
-    JSONSchemaValidatorCc19241FD92F586C8986D4D5C99C3A88 as JSONSchemaValidatorCc19241FD92F586C8986D4D5C99C3A88_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_cc72e307e5df50c48ce57370f27395a0 import (
-    JSONSchemaValidatorCc72E307E5Df50C48Ce57370F27395A0 as JSONSchemaValidatorCc72E307E5Df50C48Ce57370F27395A0_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_ccbf614b4b355cac929f12cc61272c1c import (
-    JSONSchemaValidatorCcbf614B4B355Cac929F12Cc61272C1C as JSONSchemaValidatorCcbf614B4B355Cac929F12Cc61272C1C_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_cec8139f6b1c5e5991d12197206029a0 import (
-    JSONSchemaValidatorCec8139F6B1C5E5991D12197206029A0 as JSONSchemaValidatorCec8139F6B1C5E5991D12197206029A0_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_cfadc5e4c912588389f4f63d2fb6e4ed import (
-    JSONSchemaValidatorCfadc5E4C912588389F4F63D2Fb6E4Ed as JSONSchemaValidatorCfadc5E4C912588389F4F63D2Fb6E4Ed_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d045d18062ad5ae59c6f446beb17d675 import (
-    JSONSchemaValidatorD045D18062Ad5Ae59C6F446Beb17D675 as JSONSchemaValidatorD045D18062Ad5Ae59C6F446Beb17D675_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d0aab00569b258b481afedc35e6db392 import (
-    JSONSchemaValidatorD0Aab00569B258B481AfEdc35E6Db392 as JSONSchemaValidatorD0Aab00569B258B481AfEdc35E6Db392_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d1d42ef2f1895a82a2830bf1353e6baa import (
-    JSONSchemaValidatorD1D42Ef2F1895A82A2830Bf1353E6Baa as JSONSchemaValidatorD1D42Ef2F1895A82A2830Bf1353E6Baa_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d2a712eb315650618d475db5de0aabec import (
-    JSONSchemaValidatorD2A712Eb315650618D475Db5De0Aabec as JSONSchemaValidatorD2A712Eb315650618D475Db5De0Aabec_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d2ea814bfae85da1b77872d095fc8221 import (
-    JSONSchemaValidatorD2Ea814BFae85Da1B77872D095Fc8221 as JSONSchemaValidatorD2Ea814BFae85Da1B77872D095Fc8221_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d5c229546dc755f796dfcf34f1c2e290 import (
-    JSONSchemaValidatorD5C229546Dc755F796DfCf34F1C2E290 as JSONSchemaValidatorD5C229546Dc755F796DfCf34F1C2E290_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d825ae9a117f5b6bb65b7d78fd42513c import (
-    JSONSchemaValidatorD825Ae9A117F5B6BB65B7D78Fd42513C as JSONSchemaValidatorD825Ae9A117F5B6BB65B7D78Fd42513C_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_d967a378b43457ad8c6a6de7bc1845d1 import (
-    JSONSchemaValidatorD967A378B43457Ad8C6A6De7Bc1845D1 as JSONSchemaValidatorD967A378B43457Ad8C6A6De7Bc1845D1_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_da593242978c5047bb6b62b7f9475326 import (
-    JSONSchemaValidatorDa593242978C5047Bb6B62B7F9475326 as JSONSchemaValidatorDa593242978C5047Bb6B62B7F9475326_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_dc254215fdf25cd5b7ba797e8f8faebf import (
-    JSONSchemaValidatorDc254215Fdf25Cd5B7Ba797E8F8Faebf as JSONSchemaValidatorDc254215Fdf25Cd5B7Ba797E8F8Faebf_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_dcc43be0514e50fea80cfa827f13ee5c import (
-    JSONSchemaValidatorDcc43Be0514E50FeA80CFa827F13Ee5C as JSONSchemaValidatorDcc43Be0514E50FeA80CFa827F13Ee5C_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_dec1857f1585557eb39e12a9c93ef985 import (
-    JSONSchemaValidatorDec1857F1585557EB39E12A9C93Ef985 as JSONSchemaValidatorDec1857F1585557EB39E12A9C93Ef985_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_df26f516755a50b5b5477324cf5cb649 import (
-    JSONSchemaValidatorDf26F516755A50B5B5477324Cf5Cb649 as JSONSchemaValidatorDf26F516755A50B5B5477324Cf5Cb649_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_dfda5beca4cc5437876bff366493ebf0 import (
-    JSONSchemaValidatorDfda5BecA4Cc5437876BFf366493Ebf0 as JSONSchemaValidatorDfda5BecA4Cc5437876BFf366493Ebf0_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e0c7b28d55c85d49a84c1403ca14bd5f import (
-    JSONSchemaValidatorE0C7B28D55C85D49A84C1403Ca14Bd5F as JSONSchemaValidatorE0C7B28D55C85D49A84C1403Ca14Bd5F_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e11daa984f535a08bc1eb01bc84bc399 import (
-    JSONSchemaValidatorE11Daa984F535A08Bc1EB01Bc84Bc399 as JSONSchemaValidatorE11Daa984F535A08Bc1EB01Bc84Bc399_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e1781a990c6b5a4b895d56bcfda2b7cb import (
-    JSONSchemaValidatorE1781A990C6B5A4B895D56Bcfda2B7Cb as JSONSchemaValidatorE1781A990C6B5A4B895D56Bcfda2B7Cb_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e1b8c435195d56368c24a54dcce007d0 import (
-    JSONSchemaValidatorE1B8C435195D56368C24A54Dcce007D0 as JSONSchemaValidatorE1B8C435195D56368C24A54Dcce007D0_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e2f9718de3d050819cdc6355a3a43200 import (
-    JSONSchemaValidatorE2F9718DE3D050819Cdc6355A3A43200 as JSONSchemaValidatorE2F9718DE3D050819Cdc6355A3A43200_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e3934b0fb68a5ff787e65e9b7c8e6296 import (
-    JSONSchemaValidatorE3934B0FB68A5Ff787E65E9B7C8E6296 as JSONSchemaValidatorE3934B0FB68A5Ff787E65E9B7C8E6296_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e3d7ad943d3a50fb8c3be7327669e557 import (
-    JSONSchemaValidatorE3D7Ad943D3A50Fb8C3BE7327669E557 as JSONSchemaValidatorE3D7Ad943D3A50Fb8C3BE7327669E557_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e3e170003d865b9a8d76cbe1d2f268be import (
-    JSONSchemaValidatorE3E170003D865B9A8D76Cbe1D2F268Be as JSONSchemaValidatorE3E170003D865B9A8D76Cbe1D2F268Be_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e4a09bf566f35babad9e27f5eb61a86d import (
-    JSONSchemaValidatorE4A09Bf566F35BabAd9E27F5Eb61A86D as JSONSchemaValidatorE4A09Bf566F35BabAd9E27F5Eb61A86D_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e8271b05b62c54609f74b4f2f373ad5a import (
-    JSONSchemaValidatorE8271B05B62C54609F74B4F2F373Ad5A as JSONSchemaValidatorE8271B05B62C54609F74B4F2F373Ad5A_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_e85b40c5ca055f4c82281617a8f95644 import (
-    JSONSchemaValidatorE85B40C5Ca055F4C82281617A8F95644 as JSONSchemaValidatorE85B40C5Ca055F4C82281617A8F95644_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_ea59df3daf2a57a0b48044cc49c8a1ca import (
-    JSONSchemaValidatorEa59Df3DAf2A57A0B48044Cc49C8A1Ca as JSONSchemaValidatorEa59Df3DAf2A57A0B48044Cc49C8A1Ca_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_ecdb2d14c29b5bf3ad79ed2e3cc70715 import (
-    JSONSchemaValidatorEcdb2D14C29B5Bf3Ad79Ed2E3Cc70715 as JSONSchemaValidatorEcdb2D14C29B5Bf3Ad79Ed2E3Cc70715_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_ed266e6eda225aedbf581508635da822 import (
-    JSONSchemaValidatorEd266E6EDa225AedBf581508635Da822 as JSONSchemaValidatorEd266E6EDa225AedBf581508635Da822_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_eecf4323cb285985be72a7e061891059 import (
-    JSONSchemaValidatorEecf4323Cb285985Be72A7E061891059 as JSONSchemaValidatorEecf4323Cb285985Be72A7E061891059_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_f325b2c7e429566ba5ed9ae8253b5bef import (
-    JSONSchemaValidatorF325B2C7E429566BA5Ed9Ae8253B5Bef as JSONSchemaValidatorF325B2C7E429566BA5Ed9Ae8253B5Bef_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_f8b4842604b65658afb34b4f124db469 import (
-    JSONSchemaValidatorF8B4842604B65658Afb34B4F124Db469 as JSONSchemaValidatorF8B4842604B65658Afb34B4F124Db469_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_f9492367570c5f009cf8b5955790e87c import (
-    JSONSchemaValidatorF9492367570C5F009Cf8B5955790E87C as JSONSchemaValidatorF9492367570C5F009Cf8B5955790E87C_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_f99c96c3a9b45ddaabc2c75ff8efa67f import (
-    JSONSchemaValidatorF99C96C3A9B45DdaAbc2C75Ff8Efa67F as JSONSchemaValidatorF99C96C3A9B45DdaAbc2C75Ff8Efa67F_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_fc416739f3c655ed911884aec0130e83 import (
-    JSONSchemaValidatorFc416739F3C655Ed911884Aec0130E83 as JSONSchemaValidatorFc416739F3C655Ed911884Aec0130E83_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_fc8410781af357b6be17a2104ce5efb1 import (
-    JSONSchemaValidatorFc8410781Af357B6Be17A2104Ce5Efb1 as JSONSchemaValidatorFc8410781Af357B6Be17A2104Ce5Efb1_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_fd488ff002115f3b8f0ee165e5347609 import (
-    JSONSchemaValidatorFd488Ff002115F3B8F0EE165E5347609 as JSONSchemaValidatorFd488Ff002115F3B8F0EE165E5347609_v2_3_5_3,
-)
-from .validators.v2_3_5_3.jsd_fdbe4ec3e9f252a988404dc94250b80d import (
-    JSONSchemaValidatorFdbe4Ec3E9F252A988404Dc94250B80D as JSONSchemaValidatorFdbe4Ec3E9F252A988404Dc94250B80D_v2_3_5_3,
-)
-from .validators.v2_3_7_6.jsd_b2f15d0c54c2862a60a904289ddd import (
-    JSONSchemaValidatorB2F15D0C54C2862A60A904289Ddd as JSONSchemaValidatorB2F15D0C54C2862A60A904289Ddd_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e4d208b5545f66bf0f94a155c81f46 import (
-    JSONSchemaValidatorE4D208B5545F66Bf0F94A155C81F46 as JSONSchemaValidatorE4D208B5545F66Bf0F94A155C81F46_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bece53a182b45ffa4a1a435e import (
-    JSONSchemaValidatorBece53A182B45Ffa4A1A435E as JSONSchemaValidatorBece53A182B45Ffa4A1A435E_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_cdc0bafd4257e78d211a1f4120bfa9 import (
-    JSONSchemaValidatorCdc0BaFd4257E78D211A1F4120Bfa9 as JSONSchemaValidatorCdc0BaFd4257E78D211A1F4120Bfa9_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e22c99a82f5764828810acb45e7a9e import (
-    JSONSchemaValidatorE22C99A82F5764828810Acb45E7A9E as JSONSchemaValidatorE22C99A82F5764828810Acb45E7A9E_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_cfb964a2958909f7ca12d23ab2bdb import (
-    JSONSchemaValidatorCfb964A2958909F7CA12D23Ab2Bdb as JSONSchemaValidatorCfb964A2958909F7CA12D23Ab2Bdb_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ee8590b6b45048b84e814161272bee import (
-    JSONSchemaValidatorEe8590B6B45048B84E814161272Bee as JSONSchemaValidatorEe8590B6B45048B84E814161272Bee_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bb7c52e5225e9398a006fecf4da06f import (
-    JSONSchemaValidatorBb7C52E5225E9398A006Fecf4Da06F as JSONSchemaValidatorBb7C52E5225E9398A006Fecf4Da06F_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d5da0365e31972173f015ed3614 import (
-    JSONSchemaValidatorD5DA0365E31972173F015Ed3614 as JSONSchemaValidatorD5DA0365E31972173F015Ed3614_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_97e350a7a690cdfeffa5eaca import (
-    JSONSchemaValidator97E350A7A690Cdfeffa5Eaca as JSONSchemaValidator97E350A7A690Cdfeffa5Eaca_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_fd6083b0c65d03b2d53f10b3ece59d import (
-    JSONSchemaValidatorFd6083B0C65D03B2D53F10B3Ece59D as JSONSchemaValidatorFd6083B0C65D03B2D53F10B3Ece59D_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a0a8d545698d1d59a9be90e51 import (
-    JSONSchemaValidatorA0A8D545698D1D59A9Be90E51 as JSONSchemaValidatorA0A8D545698D1D59A9Be90E51_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a421626459dcbe382c43ffcbddae import (
-    JSONSchemaValidatorA421626459DcBe382C43Ffcbddae as JSONSchemaValidatorA421626459DcBe382C43Ffcbddae_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d7073129453698264e7519d82991c import (
-    JSONSchemaValidatorD7073129453698264E7519D82991C as JSONSchemaValidatorD7073129453698264E7519D82991C_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f751cc2f55767b34e4c890b3fd36e import (
-    JSONSchemaValidatorF751CC2F55767B34E4C890B3Fd36E as JSONSchemaValidatorF751CC2F55767B34E4C890B3Fd36E_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f790a930d452708353c374f5c0f90f import (
-    JSONSchemaValidatorF790A930D452708353C374F5C0F90F as JSONSchemaValidatorF790A930D452708353C374F5C0F90F_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a544e27e18e5412af3b68d915c8ca50 import (
-    JSONSchemaValidatorA544E27E18E5412Af3B68D915C8Ca50 as JSONSchemaValidatorA544E27E18E5412Af3B68D915C8Ca50_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d999a1d36ee52babb6b619877dad734 import (
-    JSONSchemaValidatorD999A1D36Ee52BaBb6B619877Dad734 as JSONSchemaValidatorD999A1D36Ee52BaBb6B619877Dad734_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e86b65311b05d29ba5eea0d5f1fd88f import (
-    JSONSchemaValidatorE86B65311B05D29Ba5EEa0D5F1Fd88F as JSONSchemaValidatorE86B65311B05D29Ba5EEa0D5F1Fd88F_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f44ddd3c38c5a9484f5cb4e125447bc import (
-    JSONSchemaValidatorF44Ddd3C38C5A9484F5Cb4E125447Bc as JSONSchemaValidatorF44Ddd3C38C5A9484F5Cb4E125447Bc_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_cd16daa50533eb0f5873b7601abb2 import (
-    JSONSchemaValidatorCd16DAa50533EB0F5873B7601Abb2 as JSONSchemaValidatorCd16DAa50533EB0F5873B7601Abb2_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c7266d89581c9601b79b7304fda3 import (
-    JSONSchemaValidatorC7266D89581C9601B79B7304Fda3 as JSONSchemaValidatorC7266D89581C9601B79B7304Fda3_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d76a951f85a7a927afc2f1ea935c8 import (
-    JSONSchemaValidatorD76A951F85A7A927AFc2F1Ea935C8 as JSONSchemaValidatorD76A951F85A7A927AFc2F1Ea935C8_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f2c49c69c53e7b4f57f2af9a6f597 import (
-    JSONSchemaValidatorF2C49C69C53E7B4F57F2Af9A6F597 as JSONSchemaValidatorF2C49C69C53E7B4F57F2Af9A6F597_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e1a76c121857a085149e62e56caadd import (
-    JSONSchemaValidatorE1A76C121857A085149E62E56Caadd as JSONSchemaValidatorE1A76C121857A085149E62E56Caadd_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ca2f659b595c0ba7c649fd8c8bdad6 import (
-    JSONSchemaValidatorCa2F659B595C0BA7C649Fd8C8Bdad6 as JSONSchemaValidatorCa2F659B595C0BA7C649Fd8C8Bdad6_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a4dab79d54829548004029a91ba1 import (
-    JSONSchemaValidatorA4DaB79D54829548004029A91Ba1 as JSONSchemaValidatorA4DaB79D54829548004029A91Ba1_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f5a13405ba69f3957b98db8663a import (
-    JSONSchemaValidatorF5A13405Ba69F3957B98Db8663A as JSONSchemaValidatorF5A13405Ba69F3957B98Db8663A_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b107800544384c1ddad7b60c237 import (
-    JSONSchemaValidatorB107800544384C1Ddad7B60C237 as JSONSchemaValidatorB107800544384C1Ddad7B60C237_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a3954b27e5eeb82789ed231e0557f import (
-    JSONSchemaValidatorA3954B27E5Eeb82789Ed231E0557F as JSONSchemaValidatorA3954B27E5Eeb82789Ed231E0557F_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e3a724a35854758d65a83823c88435 import (
-    JSONSchemaValidatorE3A724A35854758D65A83823C88435 as JSONSchemaValidatorE3A724A35854758D65A83823C88435_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a2131eae5c1d8e73cd55eebf6a83 import (
-    JSONSchemaValidatorA2131Eae5C1D8E73Cd55Eebf6A83 as JSONSchemaValidatorA2131Eae5C1D8E73Cd55Eebf6A83_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f256e33af7501a8bdae2742ca9f6d6 import (
-    JSONSchemaValidatorF256E33Af7501A8BdaE2742Ca9F6D6 as JSONSchemaValidatorF256E33Af7501A8BdaE2742Ca9F6D6_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b269afaaa855d3291b825f724fc8ea9 import (
-    JSONSchemaValidatorB269AfaAa855D3291B825F724Fc8Ea9 as JSONSchemaValidatorB269AfaAa855D3291B825F724Fc8Ea9_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b3323a24b275402b97c7e9ccfd78c91 import (
-    JSONSchemaValidatorB3323A24B275402B97C7E9Ccfd78C91 as JSONSchemaValidatorB3323A24B275402B97C7E9Ccfd78C91_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ccbaf226c685cacac29eb345955f3ad import (
-    JSONSchemaValidatorCcbaf226C685CacAc29Eb345955F3Ad as JSONSchemaValidatorCcbaf226C685CacAc29Eb345955F3Ad_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d1845268faf55f98bc952872259f16f import (
-    JSONSchemaValidatorD1845268Faf55F98Bc952872259F16F as JSONSchemaValidatorD1845268Faf55F98Bc952872259F16F_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d9bd7c527d254ecb63d2b709c428043 import (
-    JSONSchemaValidatorD9Bd7C527D254EcB63D2B709C428043 as JSONSchemaValidatorD9Bd7C527D254EcB63D2B709C428043_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f77386a48895fa59dcddcc7dd4addb5 import (
-    JSONSchemaValidatorF77386A48895Fa59DcdDcc7Dd4Addb5 as JSONSchemaValidatorF77386A48895Fa59DcdDcc7Dd4Addb5_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ffa347eb411567a9c793696795250a5 import (
-    JSONSchemaValidatorFfa347EB411567A9C793696795250A5 as JSONSchemaValidatorFfa347EB411567A9C793696795250A5_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ffcaccdd9f2530abf66adc98c3f0201 import (
-    JSONSchemaValidatorFfcaccdD9F2530ABf66Adc98C3F0201 as JSONSchemaValidatorFfcaccdD9F2530ABf66Adc98C3F0201_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bf80823752baba63a8849fd521cd import (
-    JSONSchemaValidatorBf80823752BaBa63A8849Fd521Cd as JSONSchemaValidatorBf80823752BaBa63A8849Fd521Cd_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_fa310ab095148bdb00d7d3d5e1676 import (
-    JSONSchemaValidatorFa310Ab095148Bdb00D7D3D5E1676 as JSONSchemaValidatorFa310Ab095148Bdb00D7D3D5E1676_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a9136d5513985f15e91a19da66c import (
-    JSONSchemaValidatorA9136D5513985F15E91A19Da66C as JSONSchemaValidatorA9136D5513985F15E91A19Da66C_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b887c55faaca726bbe4ac2564 import (
-    JSONSchemaValidatorB887C55FaAca726Bbe4Ac2564 as JSONSchemaValidatorB887C55FaAca726Bbe4Ac2564_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f90ae8599c8a21c98b7a1ca804 import (
-    JSONSchemaValidatorF90Ae8599C8A21C98B7A1Ca804 as JSONSchemaValidatorF90Ae8599C8A21C98B7A1Ca804_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a94058a99acaaf8eb73c9227 import (
-    JSONSchemaValidatorA94058A99AcaAf8Eb73C9227 as JSONSchemaValidatorA94058A99AcaAf8Eb73C9227_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_cfb1d6e52878d057740de275896 import (
-    JSONSchemaValidatorCfb1D6E52878D057740De275896 as JSONSchemaValidatorCfb1D6E52878D057740De275896_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bdc981805b5fad0a038966d52558 import (
-    JSONSchemaValidatorBdc981805B5FAd0A038966D52558 as JSONSchemaValidatorBdc981805B5FAd0A038966D52558_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_df9908ad265e83ab77d73803925678 import (
-    JSONSchemaValidatorDf9908Ad265E83Ab77D73803925678 as JSONSchemaValidatorDf9908Ad265E83Ab77D73803925678_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a924f763a15125a8d5beaa6dd6fa2c import (
-    JSONSchemaValidatorA924F763A15125A8D5Beaa6Dd6Fa2C as JSONSchemaValidatorA924F763A15125A8D5Beaa6Dd6Fa2C_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_de4c9b685250dfa8556ab1ec20407c import (
-    JSONSchemaValidatorDe4C9B685250DfA8556Ab1Ec20407C as JSONSchemaValidatorDe4C9B685250DfA8556Ab1Ec20407C_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a15a2f83f975a6a9964e7da79a605de import (
-    JSONSchemaValidatorA15A2F83F975A6A9964E7Da79A605De as JSONSchemaValidatorA15A2F83F975A6A9964E7Da79A605De_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a3a1bf404bf5772828f66f1e10f074d import (
-    JSONSchemaValidatorA3A1Bf404Bf5772828F66F1E10F074D as JSONSchemaValidatorA3A1Bf404Bf5772828F66F1E10F074D_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b60f9f312235959812d49dc4c469e83 import (
-    JSONSchemaValidatorB60F9F312235959812D49Dc4C469E83 as JSONSchemaValidatorB60F9F312235959812D49Dc4C469E83_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bb01b6bd31b53bfb12bbe327320392e import (
-    JSONSchemaValidatorBb01B6BD31B53BfB12BBe327320392E as JSONSchemaValidatorBb01B6BD31B53BfB12BBe327320392E_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c224ae3007d5486bbc5abb1f88e95e6 import (
-    JSONSchemaValidatorC224Ae3007D5486Bbc5Abb1F88E95E6 as JSONSchemaValidatorC224Ae3007D5486Bbc5Abb1F88E95E6_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d9ed5bba1155b9c8fe132640832f94e import (
-    JSONSchemaValidatorD9Ed5BbA1155B9C8Fe132640832F94E as JSONSchemaValidatorD9Ed5BbA1155B9C8Fe132640832F94E_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e69d02d71905aecbd10b782469efbda import (
-    JSONSchemaValidatorE69D02D71905AecBd10B782469Efbda as JSONSchemaValidatorE69D02D71905AecBd10B782469Efbda_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e722e05046d5262b55c125237e9b67d import (
-    JSONSchemaValidatorE722E05046D5262B55C125237E9B67D as JSONSchemaValidatorE722E05046D5262B55C125237E9B67D_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d77719c37558f694e5545a21406275 import (
-    JSONSchemaValidatorD77719C37558F694E5545A21406275 as JSONSchemaValidatorD77719C37558F694E5545A21406275_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d9a13d575abdc26d485af708e7 import (
-    JSONSchemaValidatorD9A13D575ABdc26D485Af708E7 as JSONSchemaValidatorD9A13D575ABdc26D485Af708E7_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c279ba052250d883ef87775a415089 import (
-    JSONSchemaValidatorC279Ba052250D883Ef87775A415089 as JSONSchemaValidatorC279Ba052250D883Ef87775A415089_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d2bd5f05bd535a89ebadb30e2ede9e import (
-    JSONSchemaValidatorD2Bd5F05Bd535A89EbAdb30E2Ede9E as JSONSchemaValidatorD2Bd5F05Bd535A89EbAdb30E2Ede9E_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d2ece28b509b8ef80b2b8c5c5f36 import (
-    JSONSchemaValidatorD2EcE28B509B8Ef80B2B8C5C5F36 as JSONSchemaValidatorD2EcE28B509B8Ef80B2B8C5C5F36_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e31c795964b3bdf85da1b5a2a5 import (
-    JSONSchemaValidatorE31C795964B3BdF85Da1B5A2A5 as JSONSchemaValidatorE31C795964B3BdF85Da1B5A2A5_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_dabd13cd5e9c928daf80d6758d62 import (
-    JSONSchemaValidatorDabd13Cd5E9C928DAf80D6758D62 as JSONSchemaValidatorDabd13Cd5E9C928DAf80D6758D62_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b46a141650debf5946262e8a0961 import (
-    JSONSchemaValidatorB46A141650DeBf5946262E8A0961 as JSONSchemaValidatorB46A141650DeBf5946262E8A0961_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b8699619f95a24bd2d81f12f048235 import (
-    JSONSchemaValidatorB8699619F95A24Bd2D81F12F048235 as JSONSchemaValidatorB8699619F95A24Bd2D81F12F048235_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c00df3623b5a74ad41e75487ed9b77 import (
-    JSONSchemaValidatorC00Df3623B5A74Ad41E75487Ed9B77 as JSONSchemaValidatorC00Df3623B5A74Ad41E75487Ed9B77_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a64bd4956649de3a61e10f0637e import (
-    JSONSchemaValidatorA64Bd4956649De3A61E10F0637E as JSONSchemaValidatorA64Bd4956649De3A61E10F0637E_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a88c7510a15578b8eb2df183a92d5d import (
-    JSONSchemaValidatorA88C7510A15578B8Eb2Df183A92D5D as JSONSchemaValidatorA88C7510A15578B8Eb2Df183A92D5D_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_cad522e57a7b96b7238935689ed import (
-    JSONSchemaValidatorCad522E57A7B96B7238935689Ed as JSONSchemaValidatorCad522E57A7B96B7238935689Ed_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e702d5786552992aa76b930780569 import (
-    JSONSchemaValidatorE702D5786552992Aa76B930780569 as JSONSchemaValidatorE702D5786552992Aa76B930780569_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_cb98464ddb5ee9ba7ebb4428443ba9 import (
-    JSONSchemaValidatorCb98464Ddb5Ee9Ba7EBb4428443Ba9 as JSONSchemaValidatorCb98464Ddb5Ee9Ba7EBb4428443Ba9_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d292147221524a96616d982b0147c0 import (
-    JSONSchemaValidatorD292147221524A96616D982B0147C0 as JSONSchemaValidatorD292147221524A96616D982B0147C0_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_af29516f0c8591da2a92523b5ab3386 import (
-    JSONSchemaValidatorAf29516F0C8591DA2A92523B5Ab3386 as JSONSchemaValidatorAf29516F0C8591DA2A92523B5Ab3386_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_de92f8ae3c15ea0bad5562452eb5c40 import (
-    JSONSchemaValidatorDe92F8AE3C15Ea0Bad5562452Eb5C40 as JSONSchemaValidatorDe92F8AE3C15Ea0Bad5562452Eb5C40_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f09c94c65c858e4b7be0b7cb3d25b7a import (
-    JSONSchemaValidatorF09C94C65C858E4B7Be0B7Cb3D25B7A as JSONSchemaValidatorF09C94C65C858E4B7Be0B7Cb3D25B7A_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f25c825ca6e58a5b1c2294b11558e7b import (
-    JSONSchemaValidatorF25C825Ca6E58A5B1C2294B11558E7B as JSONSchemaValidatorF25C825Ca6E58A5B1C2294B11558E7B_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e0ed6b9a530ea05d77a199ded4e3 import (
-    JSONSchemaValidatorE0Ed6B9A530EA05D77A199Ded4E3 as JSONSchemaValidatorE0Ed6B9A530EA05D77A199Ded4E3_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ad0cb5a12a76384ba4644e55e import (
-    JSONSchemaValidatorAD0Cb5A12A76384Ba4644E55E as JSONSchemaValidatorAD0Cb5A12A76384Ba4644E55E_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_fdd2af215b9b8327a3e24a3dea89 import (
-    JSONSchemaValidatorFdd2Af215B9B8327A3E24A3Dea89 as JSONSchemaValidatorFdd2Af215B9B8327A3E24A3Dea89_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_fee1860b4d509585956565df54a91a import (
-    JSONSchemaValidatorFee1860B4D509585956565Df54A91A as JSONSchemaValidatorFee1860B4D509585956565Df54A91A_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_fe62979a925778bdb0a974a7d86a12 import (
-    JSONSchemaValidatorFe62979A925778Bdb0A974A7D86A12 as JSONSchemaValidatorFe62979A925778Bdb0A974A7D86A12_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a602eee5a56faa64436bade8a240e import (
-    JSONSchemaValidatorA602EEe5A56FaA64436Bade8A240E as JSONSchemaValidatorA602EEe5A56FaA64436Bade8A240E_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e6ea8c5d425cf9ac77006f5593725f import (
-    JSONSchemaValidatorE6Ea8C5D425Cf9Ac77006F5593725F as JSONSchemaValidatorE6Ea8C5D425Cf9Ac77006F5593725F_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bcb1d489d735258975828f845df1769 import (
-    JSONSchemaValidatorBcb1D489D735258975828F845Df1769 as JSONSchemaValidatorBcb1D489D735258975828F845Df1769_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bd5b507f58a50aab614e3d7409eec4c import (
-    JSONSchemaValidatorBd5B507F58A50AaB614E3D7409Eec4C as JSONSchemaValidatorBd5B507F58A50AaB614E3D7409Eec4C_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e4f91ea42515ccdbc24549b84ca1e90 import (
-    JSONSchemaValidatorE4F91Ea42515CcdBc24549B84Ca1E90 as JSONSchemaValidatorE4F91Ea42515CcdBc24549B84Ca1E90_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_efa7f7a97b95f5885a00e6981b27b11 import (
-    JSONSchemaValidatorEfa7F7A97B95F5885A00E6981B27B11 as JSONSchemaValidatorEfa7F7A97B95F5885A00E6981B27B11_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f5d13316c8f53a0b78d881c738a15c6 import (
-    JSONSchemaValidatorF5D13316C8F53A0B78D881C738A15C6 as JSONSchemaValidatorF5D13316C8F53A0B78D881C738A15C6_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bbf7ce025bc2a291b90c37a6b898 import (
-    JSONSchemaValidatorBbf7Ce025Bc2A291B90C37A6B898 as JSONSchemaValidatorBbf7Ce025Bc2A291B90C37A6B898_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_effb55c158f28469762804e84633 import (
-    JSONSchemaValidatorEffb55C158F28469762804E84633 as JSONSchemaValidatorEffb55C158F28469762804E84633_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e0b654c39dc6e19cd6f5194d import (
-    JSONSchemaValidatorE0B654C39Dc6E19Cd6F5194D as JSONSchemaValidatorE0B654C39Dc6E19Cd6F5194D_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_de1b75d59b083df0ece12259ecd import (
-    JSONSchemaValidatorDe1B75D59B083Df0Ece12259Ecd as JSONSchemaValidatorDe1B75D59B083Df0Ece12259Ecd_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_fc95c917352ad8410ffe6d6e522ed import (
-    JSONSchemaValidatorFc95C917352Ad8410Ffe6D6E522Ed as JSONSchemaValidatorFc95C917352Ad8410Ffe6D6E522Ed_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ae7f02a3d051f2baf7cc087990d658 import (
-    JSONSchemaValidatorAe7F02A3D051F2Baf7Cc087990D658 as JSONSchemaValidatorAe7F02A3D051F2Baf7Cc087990D658_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c0204c665262a712caef988d7d88 import (
-    JSONSchemaValidatorC0204C665262A712Caef988D7D88 as JSONSchemaValidatorC0204C665262A712Caef988D7D88_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f50f8c552f5d2eb68d715e1318976e import (
-    JSONSchemaValidatorF50F8C552F5D2EB68D715E1318976E as JSONSchemaValidatorF50F8C552F5D2EB68D715E1318976E_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d9227adc5f02b7cd264af7255d19 import (
-    JSONSchemaValidatorD9227Adc5F02B7Cd264Af7255D19 as JSONSchemaValidatorD9227Adc5F02B7Cd264Af7255D19_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e6ec627d3c587288978990aae75228 import (
-    JSONSchemaValidatorE6Ec627D3C587288978990Aae75228 as JSONSchemaValidatorE6Ec627D3C587288978990Aae75228_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c380301e3e05423bdc1857ff00ae77a import (
-    JSONSchemaValidatorC380301E3E05423Bdc1857Ff00Ae77A as JSONSchemaValidatorC380301E3E05423Bdc1857Ff00Ae77A_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c8354b61a36524cbb2e1037bd814807 import (
-    JSONSchemaValidatorC8354B61A36524CBb2E1037Bd814807 as JSONSchemaValidatorC8354B61A36524CBb2E1037Bd814807_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f24f6c07641580ba6ed710e92c2da16 import (
-    JSONSchemaValidatorF24F6C07641580BA6Ed710E92C2Da16 as JSONSchemaValidatorF24F6C07641580BA6Ed710E92C2Da16_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f4ce55b5f235924903516ef31dc9e3c import (
-    JSONSchemaValidatorF4Ce55B5F235924903516Ef31Dc9E3C as JSONSchemaValidatorF4Ce55B5F235924903516Ef31Dc9E3C_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_fcc151af7615a84adf48b714d146192 import (
-    JSONSchemaValidatorFcc151AF7615A84Adf48B714D146192 as JSONSchemaValidatorFcc151AF7615A84Adf48B714D146192_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_fe3ec7651e79d891fce37a0d860 import (
-    JSONSchemaValidatorFe3Ec7651E79D891Fce37A0D860 as JSONSchemaValidatorFe3Ec7651E79D891Fce37A0D860_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b07f187b7456c8bbb6088a2f24dcee import (
-    JSONSchemaValidatorB07F187B7456C8Bbb6088A2F24Dcee as JSONSchemaValidatorB07F187B7456C8Bbb6088A2F24Dcee_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_cb7563a5058c4801eb842a74ff61c import (
-    JSONSchemaValidatorCb7563A5058C4801EB842A74Ff61C as JSONSchemaValidatorCb7563A5058C4801EB842A74Ff61C_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c10072541e94bd16f1aebffe32 import (
-    JSONSchemaValidatorC10072541E94Bd16F1Aebffe32 as JSONSchemaValidatorC10072541E94Bd16F1Aebffe32_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d39d23589e85db0a63c414057c import (
-    JSONSchemaValidatorD39D23589E85Db0A63C414057C as JSONSchemaValidatorD39D23589E85Db0A63C414057C_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c45c1c55d498d03a72933690098 import (
-    JSONSchemaValidatorC45C1C55D498D03A72933690098 as JSONSchemaValidatorC45C1C55D498D03A72933690098_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a9f5796226051218eac559ab5211384 import (
-    JSONSchemaValidatorA9F5796226051218Eac559Ab5211384 as JSONSchemaValidatorA9F5796226051218Eac559Ab5211384_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c4befbd77a452a9b7873ffc360a1f20 import (
-    JSONSchemaValidatorC4Befbd77A452A9B7873Ffc360A1F20 as JSONSchemaValidatorC4Befbd77A452A9B7873Ffc360A1F20_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c8d11fb9fc752ab8bb8e2b1413ccc92 import (
-    JSONSchemaValidatorC8D11Fb9Fc752Ab8Bb8E2B1413Ccc92 as JSONSchemaValidatorC8D11Fb9Fc752Ab8Bb8E2B1413Ccc92_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ccd75f80ece59f08cadda085402cef5 import (
-    JSONSchemaValidatorCcd75F80Ece59F08CadDa085402Cef5 as JSONSchemaValidatorCcd75F80Ece59F08CadDa085402Cef5_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d82755e5e03510daf0951c1f42c2702 import (
-    JSONSchemaValidatorD82755E5E03510DAf0951C1F42C2702 as JSONSchemaValidatorD82755E5E03510DAf0951C1F42C2702_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e0bd567c1395531a7f18ab4e14110bd import (
-    JSONSchemaValidatorE0Bd567C1395531A7F18Ab4E14110Bd as JSONSchemaValidatorE0Bd567C1395531A7F18Ab4E14110Bd_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e4f57e8f06856ee9a7e490d01f7f692 import (
-    JSONSchemaValidatorE4F57E8F06856Ee9A7E490D01F7F692 as JSONSchemaValidatorE4F57E8F06856Ee9A7E490D01F7F692_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_eb3b18894545315b25b94d0c0e2ec67 import (
-    JSONSchemaValidatorEb3B18894545315B25B94D0C0E2Ec67 as JSONSchemaValidatorEb3B18894545315B25B94D0C0E2Ec67_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_eca62ef076b5627a85b2a5959613fb8 import (
-    JSONSchemaValidatorEca62Ef076B5627A85B2A5959613Fb8 as JSONSchemaValidatorEca62Ef076B5627A85B2A5959613Fb8_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f486694f3da57b4921b7f2036a1b754 import (
-    JSONSchemaValidatorF486694F3Da57B4921B7F2036A1B754 as JSONSchemaValidatorF486694F3Da57B4921B7F2036A1B754_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f6536a8f01d5863856a0a8308198e15 import (
-    JSONSchemaValidatorF6536A8F01D5863856A0A8308198E15 as JSONSchemaValidatorF6536A8F01D5863856A0A8308198E15_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f7dd6a6cf8d57499168aae05847ad34 import (
-    JSONSchemaValidatorF7Dd6A6Cf8D57499168Aae05847Ad34 as JSONSchemaValidatorF7Dd6A6Cf8D57499168Aae05847Ad34_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_fdd36dd2454547096bb65df3755710f import (
-    JSONSchemaValidatorFdd36Dd2454547096Bb65Df3755710F as JSONSchemaValidatorFdd36Dd2454547096Bb65Df3755710F_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_cec6c85d9bb4bcc8f61f31296b import (
-    JSONSchemaValidatorCeC6C85D9BB4BcC8F61F31296B as JSONSchemaValidatorCeC6C85D9BB4BcC8F61F31296B_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f7cf4f24d54c6944a31ed308f8361 import (
-    JSONSchemaValidatorF7Cf4F24D54C6944A31Ed308F8361 as JSONSchemaValidatorF7Cf4F24D54C6944A31Ed308F8361_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_db7b6c4f0542aab9fe7cf5c995f83 import (
-    JSONSchemaValidatorDb7B6C4F0542AAb9FE7Cf5C995F83 as JSONSchemaValidatorDb7B6C4F0542AAb9FE7Cf5C995F83_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d7161b33157dba957ba18eda440c2 import (
-    JSONSchemaValidatorD7161B33157DbA957Ba18Eda440C2 as JSONSchemaValidatorD7161B33157DbA957Ba18Eda440C2_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f5ebb9d50aab287f320d32181c0 import (
-    JSONSchemaValidatorF5EBb9D50AaB287F320D32181C0 as JSONSchemaValidatorF5EBb9D50AaB287F320D32181C0_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_aba18f6e605ce28a112b34dcb4fe82 import (
-    JSONSchemaValidatorAba18F6E605Ce28A112B34Dcb4Fe82 as JSONSchemaValidatorAba18F6E605Ce28A112B34Dcb4Fe82_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_fa27ccbaf55711849381a707e1edfa import (
-    JSONSchemaValidatorFa27CcBaf55711849381A707E1Edfa as JSONSchemaValidatorFa27CcBaf55711849381A707E1Edfa_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f04b76067507b9384e409e9431ef3 import (
-    JSONSchemaValidatorF04B76067507B9384E409E9431Ef3 as JSONSchemaValidatorF04B76067507B9384E409E9431Ef3_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b7ae9494b05a57bf6393eaf308b1e7 import (
-    JSONSchemaValidatorB7Ae9494B05A57Bf6393Eaf308B1E7 as JSONSchemaValidatorB7Ae9494B05A57Bf6393Eaf308B1E7_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b6581534bb321eaea272365b7 import (
-    JSONSchemaValidatorB6581534BB321Eaea272365B7 as JSONSchemaValidatorB6581534BB321Eaea272365B7_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_cc59d48f8159008f52b29e08738811 import (
-    JSONSchemaValidatorCc59D48F8159008F52B29E08738811 as JSONSchemaValidatorCc59D48F8159008F52B29E08738811_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bfca373c5d7c863eef14abc654fd import (
-    JSONSchemaValidatorBfca373C5D7C863EEf14Abc654Fd as JSONSchemaValidatorBfca373C5D7C863EEf14Abc654Fd_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d1608b2751c883a072ee3fb80228 import (
-    JSONSchemaValidatorD1608B2751C883A072Ee3Fb80228 as JSONSchemaValidatorD1608B2751C883A072Ee3Fb80228_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_eea0014365ef78d30d9ba8f1752e8 import (
-    JSONSchemaValidatorEea0014365Ef78D30D9Ba8F1752E8 as JSONSchemaValidatorEea0014365Ef78D30D9Ba8F1752E8_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e73b352ff2573aab906c2ad75c5a71 import (
-    JSONSchemaValidatorE73B352Ff2573AAb906C2Ad75C5A71 as JSONSchemaValidatorE73B352Ff2573AAb906C2Ad75C5A71_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bd421c1db8c5deaa3301b8cc73dd541 import (
-    JSONSchemaValidatorBd421C1Db8C5DeaA3301B8Cc73Dd541 as JSONSchemaValidatorBd421C1Db8C5DeaA3301B8Cc73Dd541_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_be8cdb967555fcca03a4c1f796eee56 import (
-    JSONSchemaValidatorBe8Cdb967555FccA03A4C1F796Eee56 as JSONSchemaValidatorBe8Cdb967555FccA03A4C1F796Eee56_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_dbea7d7de125cf6b840d5032d3a5c59 import (
-    JSONSchemaValidatorDbea7D7De125Cf6B840D5032D3A5C59 as JSONSchemaValidatorDbea7D7De125Cf6B840D5032D3A5C59_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f019a24c5ce50f082d081bb72ff4df9 import (
-    JSONSchemaValidatorF019A24C5Ce50F082D081Bb72Ff4Df9 as JSONSchemaValidatorF019A24C5Ce50F082D081Bb72Ff4Df9_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f2b137487385de6925b7b6136d4b027 import (
-    JSONSchemaValidatorF2B137487385De6925B7B6136D4B027 as JSONSchemaValidatorF2B137487385De6925B7B6136D4B027_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f5645e6e819558fa08761dee45ca406 import (
-    JSONSchemaValidatorF5645E6E819558FA08761Dee45Ca406 as JSONSchemaValidatorF5645E6E819558FA08761Dee45Ca406_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_fe06867e548bba1919024b40d992 import (
-    JSONSchemaValidatorFe06867E548BBa1919024B40D992 as JSONSchemaValidatorFe06867E548BBa1919024B40D992_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_efa92557c9a6c8af0a71829c7e import (
-    JSONSchemaValidatorEfA92557C9A6C8Af0A71829C7E as JSONSchemaValidatorEfA92557C9A6C8Af0A71829C7E_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ecc3258a5c5b8f2267a512820a59 import (
-    JSONSchemaValidatorEcc3258A5C5B8F2267A512820A59 as JSONSchemaValidatorEcc3258A5C5B8F2267A512820A59_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f5602b2965e53b5bdda193025a3fc import (
-    JSONSchemaValidatorF5602B2965E53B5BdDa193025A3Fc as JSONSchemaValidatorF5602B2965E53B5BdDa193025A3Fc_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ba98ed72975099b39dd2dc4cb65ed8 import (
-    JSONSchemaValidatorBa98Ed72975099B39DD2Dc4Cb65Ed8 as JSONSchemaValidatorBa98Ed72975099B39DD2Dc4Cb65Ed8_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ef28900485c4e9842b4a68e483d4e import (
-    JSONSchemaValidatorEf28900485C4E9842B4A68E483D4E as JSONSchemaValidatorEf28900485C4E9842B4A68E483D4E_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ea8d75a9d8d9e6882da4a4a91 import (
-    JSONSchemaValidatorEA8D75A9D8D9E6882Da4A4A91 as JSONSchemaValidatorEA8D75A9D8D9E6882Da4A4A91_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c49a8488cd52158790aac513e7184a import (
-    JSONSchemaValidatorC49A8488Cd52158790Aac513E7184A as JSONSchemaValidatorC49A8488Cd52158790Aac513E7184A_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ae57085565e551594fc05b4db6a64af import (
-    JSONSchemaValidatorAe57085565E551594Fc05B4Db6A64Af as JSONSchemaValidatorAe57085565E551594Fc05B4Db6A64Af_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bd1c59e9be75ac4a40decaa95ee9efd import (
-    JSONSchemaValidatorBd1C59E9Be75Ac4A40DEcaa95Ee9Efd as JSONSchemaValidatorBd1C59E9Be75Ac4A40DEcaa95Ee9Efd_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bec2dde673c5b2f940d0474fed32af6 import (
-    JSONSchemaValidatorBec2Dde673C5B2F940D0474Fed32Af6 as JSONSchemaValidatorBec2Dde673C5B2F940D0474Fed32Af6_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d16471a58805b4aa2c757209d188aed import (
-    JSONSchemaValidatorD16471A58805B4AA2C757209D188Aed as JSONSchemaValidatorD16471A58805B4AA2C757209D188Aed_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d6b58f378895114839682dceed1a9b5 import (
-    JSONSchemaValidatorD6B58F378895114839682Dceed1A9B5 as JSONSchemaValidatorD6B58F378895114839682Dceed1A9B5_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d8fc92ddeab597ebb50ea003a6d46bd import (
-    JSONSchemaValidatorD8Fc92DDeab597EBb50Ea003A6D46Bd as JSONSchemaValidatorD8Fc92DDeab597EBb50Ea003A6D46Bd_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e481654675355408be8daff9a82f9a0 import (
-    JSONSchemaValidatorE481654675355408Be8Daff9A82F9A0 as JSONSchemaValidatorE481654675355408Be8Daff9A82F9A0_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ee43cac5fd65c55ab3153d3549d18c0 import (
-    JSONSchemaValidatorEe43Cac5Fd65C55Ab3153D3549D18C0 as JSONSchemaValidatorEe43Cac5Fd65C55Ab3153D3549D18C0_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c90c04b8356cf9974957e0f9516d0 import (
-    JSONSchemaValidatorC90C04B8356Cf9974957E0F9516D0 as JSONSchemaValidatorC90C04B8356Cf9974957E0F9516D0_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b4155d6f885a53ad0e47b1a4 import (
-    JSONSchemaValidatorB4155D6F885A53Ad0E47B1A4 as JSONSchemaValidatorB4155D6F885A53Ad0E47B1A4_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_cf2cac6f150c9bee9ade37921b162 import (
-    JSONSchemaValidatorCf2CaC6F150C9Bee9Ade37921B162 as JSONSchemaValidatorCf2CaC6F150C9Bee9Ade37921B162_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bc55e6552fac58cc0aaacd773a import (
-    JSONSchemaValidatorBc55E6552FAc58Cc0Aaacd773A as JSONSchemaValidatorBc55E6552FAc58Cc0Aaacd773A_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_dece7a9b353b49084a8ffa4f18c91 import (
-    JSONSchemaValidatorDece7A9B353B49084A8Ffa4F18C91 as JSONSchemaValidatorDece7A9B353B49084A8Ffa4F18C91_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c9ea5c02b2b7368cac785f30 import (
-    JSONSchemaValidatorC9Ea5C02B2B7368Cac785F30 as JSONSchemaValidatorC9Ea5C02B2B7368Cac785F30_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f4b2825561e808787a16f7e0a1f import (
-    JSONSchemaValidatorF4B2825561E808787A16F7E0A1F as JSONSchemaValidatorF4B2825561E808787A16F7E0A1F_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bc3ed6556f9b9c959e53e271d70 import (
-    JSONSchemaValidatorBc3Ed6556F9B9C959E53E271D70 as JSONSchemaValidatorBc3Ed6556F9B9C959E53E271D70_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_aac9ba55e5043b4d5e0995c566dce import (
-    JSONSchemaValidatorAac9BA55E5043B4D5E0995C566Dce as JSONSchemaValidatorAac9BA55E5043B4D5E0995C566Dce_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b818044610579a9b74ec582e7739ab import (
-    JSONSchemaValidatorB818044610579A9B74Ec582E7739Ab as JSONSchemaValidatorB818044610579A9B74Ec582E7739Ab_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bcb7a52e3c5763b246bcf438fe57c9 import (
-    JSONSchemaValidatorBcb7A52E3C5763B246Bcf438Fe57C9 as JSONSchemaValidatorBcb7A52E3C5763B246Bcf438Fe57C9_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f2c120b855cb8c852806ce72e54d import (
-    JSONSchemaValidatorF2C120B855Cb8C852806Ce72E54D as JSONSchemaValidatorF2C120B855Cb8C852806Ce72E54D_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a4d8313a955433858e0137ba7ef672 import (
-    JSONSchemaValidatorA4D8313A955433858E0137Ba7Ef672 as JSONSchemaValidatorA4D8313A955433858E0137Ba7Ef672_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_cd2e825a78b6de087e991f6fe0 import (
-    JSONSchemaValidatorCd2E825A78B6De087E991F6Fe0 as JSONSchemaValidatorCd2E825A78B6De087E991F6Fe0_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c14a815ec5938950343f6188f0785 import (
-    JSONSchemaValidatorC14A815Ec5938950343F6188F0785 as JSONSchemaValidatorC14A815Ec5938950343F6188F0785_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_aaebb912125213b350d7423b4f01a4 import (
-    JSONSchemaValidatorAaebb912125213B350D7423B4F01A4 as JSONSchemaValidatorAaebb912125213B350D7423B4F01A4_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ad0cce45817862bebfc839bf5ae import (
-    JSONSchemaValidatorAd0Cce45817862BEbfc839Bf5Ae as JSONSchemaValidatorAd0Cce45817862BEbfc839Bf5Ae_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d6d7d5c8983c1d3c9815bfd35 import (
-    JSONSchemaValidatorD6D7D5C8983C1D3C9815Bfd35 as JSONSchemaValidatorD6D7D5C8983C1D3C9815Bfd35_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_fb5a8c0075563491622171958074bf import (
-    JSONSchemaValidatorFb5A8C0075563491622171958074Bf as JSONSchemaValidatorFb5A8C0075563491622171958074Bf_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a764c85d8df5c30b9143619d4f9cde9 import (
-    JSONSchemaValidatorA764C85D8Df5C30B9143619D4F9Cde9 as JSONSchemaValidatorA764C85D8Df5C30B9143619D4F9Cde9_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c991ce0b0f058a08c863a4abdfc70a6 import (
-    JSONSchemaValidatorC991Ce0B0F058A08C863A4Abdfc70A6 as JSONSchemaValidatorC991Ce0B0F058A08C863A4Abdfc70A6_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f41eb48a0da56949cfaddeecb51ab66 import (
-    JSONSchemaValidatorF41Eb48A0Da56949CfaDdeecb51Ab66 as JSONSchemaValidatorF41Eb48A0Da56949CfaDdeecb51Ab66_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f5bfccc7e30550baa7046f74daa1ef2 import (
-    JSONSchemaValidatorF5Bfccc7E30550BAa7046F74Daa1Ef2 as JSONSchemaValidatorF5Bfccc7E30550BAa7046F74Daa1Ef2_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a0c237c8fc115b6f98b87cc7a1360dd0 import (
-    JSONSchemaValidatorA0C237C8Fc115B6F98B87Cc7A1360Dd0 as JSONSchemaValidatorA0C237C8Fc115B6F98B87Cc7A1360Dd0_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a14e71c1b98e51eea41255720025b519 import (
-    JSONSchemaValidatorA14E71C1B98E51EeA41255720025B519 as JSONSchemaValidatorA14E71C1B98E51EeA41255720025B519_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a352f6280e445075b3ea7cbf868c2d94 import (
-    JSONSchemaValidatorA352F6280E445075B3Ea7Cbf868C2D94 as JSONSchemaValidatorA352F6280E445075B3Ea7Cbf868C2D94_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a3b37dcbe2a150bea06d9dcde1837281 import (
-    JSONSchemaValidatorA3B37DcbE2A150BeA06D9Dcde1837281 as JSONSchemaValidatorA3B37DcbE2A150BeA06D9Dcde1837281_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a3d2432ae8c55fe793c5180d8d5fce25 import (
-    JSONSchemaValidatorA3D2432AE8C55Fe793C5180D8D5Fce25 as JSONSchemaValidatorA3D2432AE8C55Fe793C5180D8D5Fce25_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a41113bc28515538af4fe4d2ff707f60 import (
-    JSONSchemaValidatorA41113Bc28515538Af4FE4D2Ff707F60 as JSONSchemaValidatorA41113Bc28515538Af4FE4D2Ff707F60_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a54fce1a0c305bdabfe91a8a6161e539 import (
-    JSONSchemaValidatorA54Fce1A0C305BdaBfe91A8A6161E539 as JSONSchemaValidatorA54Fce1A0C305BdaBfe91A8A6161E539_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a66db26df529597c84c2a15ea2d632ce import (
-    JSONSchemaValidatorA66Db26DF529597C84C2A15Ea2D632Ce as JSONSchemaValidatorA66Db26DF529597C84C2A15Ea2D632Ce_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a6c4ce7aef8251a2a8646ba0b5c1826a import (
-    JSONSchemaValidatorA6C4Ce7AEf8251A2A8646Ba0B5C1826A as JSONSchemaValidatorA6C4Ce7AEf8251A2A8646Ba0B5C1826A_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a73fbc67627e5bbbafe748de84d42df6 import (
-    JSONSchemaValidatorA73Fbc67627E5BbbAfe748De84D42Df6 as JSONSchemaValidatorA73Fbc67627E5BbbAfe748De84D42Df6_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a7935eedd53a5b8c84668c903cc1c705 import (
-    JSONSchemaValidatorA7935EedD53A5B8C84668C903Cc1C705 as JSONSchemaValidatorA7935EedD53A5B8C84668C903Cc1C705_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a7d6d604f38f5f849af79d8768bddfc1 import (
-    JSONSchemaValidatorA7D6D604F38F5F849Af79D8768Bddfc1 as JSONSchemaValidatorA7D6D604F38F5F849Af79D8768Bddfc1_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a91eed12dfc85dbdaacab22e6e9f04a5 import (
-    JSONSchemaValidatorA91Eed12Dfc85DbdAacaB22E6E9F04A5 as JSONSchemaValidatorA91Eed12Dfc85DbdAacaB22E6E9F04A5_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a93d01238de0537dbb3d358f9cce0bd2 import (
-    JSONSchemaValidatorA93D01238De0537DBb3D358F9Cce0Bd2 as JSONSchemaValidatorA93D01238De0537DBb3D358F9Cce0Bd2_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a9b864257b965fe4bd8b0293f41f1537 import (
-    JSONSchemaValidatorA9B864257B965Fe4Bd8B0293F41F1537 as JSONSchemaValidatorA9B864257B965Fe4Bd8B0293F41F1537_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_a9e0722d184658c592bd130ff03e1dde import (
-    JSONSchemaValidatorA9E0722D184658C592Bd130Ff03E1Dde as JSONSchemaValidatorA9E0722D184658C592Bd130Ff03E1Dde_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_aa11f09d28165f4ea6c81b8642e59cc4 import (
-    JSONSchemaValidatorAa11F09D28165F4EA6C81B8642E59Cc4 as JSONSchemaValidatorAa11F09D28165F4EA6C81B8642E59Cc4_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_aa663ca2bd1f5a3db67c405987495112 import (
-    JSONSchemaValidatorAa663Ca2Bd1F5A3DB67C405987495112 as JSONSchemaValidatorAa663Ca2Bd1F5A3DB67C405987495112_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ac6e63199fb05bcf89106a22502c2197 import (
-    JSONSchemaValidatorAc6E63199Fb05Bcf89106A22502C2197 as JSONSchemaValidatorAc6E63199Fb05Bcf89106A22502C2197_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ac7ce690e0f55a469b0a9bfa3d2c165e import (
-    JSONSchemaValidatorAc7Ce690E0F55A469B0A9Bfa3D2C165E as JSONSchemaValidatorAc7Ce690E0F55A469B0A9Bfa3D2C165E_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ad936677c99a58f6b532359d66fe98a7 import (
-    JSONSchemaValidatorAd936677C99A58F6B532359D66Fe98A7 as JSONSchemaValidatorAd936677C99A58F6B532359D66Fe98A7_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ad96e712f4525a128368b1bfe3afc21c import (
-    JSONSchemaValidatorAd96E712F4525A128368B1Bfe3Afc21C as JSONSchemaValidatorAd96E712F4525A128368B1Bfe3Afc21C_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ada3522de8ef54729e9fc242df292547 import (
-    JSONSchemaValidatorAda3522DE8Ef54729E9FC242Df292547 as JSONSchemaValidatorAda3522DE8Ef54729E9FC242Df292547_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ae4d33eacca95f109bebc6fd0528ca48 import (
-    JSONSchemaValidatorAe4D33EaCca95F109BebC6Fd0528Ca48 as JSONSchemaValidatorAe4D33EaCca95F109BebC6Fd0528Ca48_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b08f499f995f5f46ba52e0385b54721a import (
-    JSONSchemaValidatorB08F499F995F5F46Ba52E0385B54721A as JSONSchemaValidatorB08F499F995F5F46Ba52E0385B54721A_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b0aa8e79d21f5e579908825e70aaccf6 import (
-    JSONSchemaValidatorB0Aa8E79D21F5E579908825E70Aaccf6 as JSONSchemaValidatorB0Aa8E79D21F5E579908825E70Aaccf6_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b0b146a144a65aa296b8b939c2926158 import (
-    JSONSchemaValidatorB0B146A144A65Aa296B8B939C2926158 as JSONSchemaValidatorB0B146A144A65Aa296B8B939C2926158_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b119a4d455e35cc3b2cc6695a045cbfa import (
-    JSONSchemaValidatorB119A4D455E35Cc3B2Cc6695A045Cbfa as JSONSchemaValidatorB119A4D455E35Cc3B2Cc6695A045Cbfa_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b11aa4de387251c794665e030fa815da import (
-    JSONSchemaValidatorB11Aa4De387251C794665E030Fa815Da as JSONSchemaValidatorB11Aa4De387251C794665E030Fa815Da_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b2dae3b41636596aa02c3ad0a4bcb8d7 import (
-    JSONSchemaValidatorB2Dae3B41636596AA02C3Ad0A4Bcb8D7 as JSONSchemaValidatorB2Dae3B41636596AA02C3Ad0A4Bcb8D7_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b350fb0876a25879973b0840fbb690bb import (
-    JSONSchemaValidatorB350Fb0876A25879973B0840Fbb690Bb as JSONSchemaValidatorB350Fb0876A25879973B0840Fbb690Bb_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b3ab480a3f485ecc9fef1bd2f8c9d109 import (
-    JSONSchemaValidatorB3Ab480A3F485Ecc9Fef1Bd2F8C9D109 as JSONSchemaValidatorB3Ab480A3F485Ecc9Fef1Bd2F8C9D109_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b3c4383ecc13514c85c6f3d8484f6d68 import (
-    JSONSchemaValidatorB3C4383ECc13514C85C6F3D8484F6D68 as JSONSchemaValidatorB3C4383ECc13514C85C6F3D8484F6D68_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b4f52e69ddca5b2583b28fb4c96447aa import (
-    JSONSchemaValidatorB4F52E69Ddca5B2583B28Fb4C96447Aa as JSONSchemaValidatorB4F52E69Ddca5B2583B28Fb4C96447Aa_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b6f2d8e46cdd5f05bb06f52cd1b26fb2 import (
-    JSONSchemaValidatorB6F2D8E46Cdd5F05Bb06F52Cd1B26Fb2 as JSONSchemaValidatorB6F2D8E46Cdd5F05Bb06F52Cd1B26Fb2_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b7079a38844e56dd8f1b6b876880a02e import (
-    JSONSchemaValidatorB7079A38844E56Dd8F1B6B876880A02E as JSONSchemaValidatorB7079A38844E56Dd8F1B6B876880A02E_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_b95201b6a6905a10b463e036bf591166 import (
-    JSONSchemaValidatorB95201B6A6905A10B463E036Bf591166 as JSONSchemaValidatorB95201B6A6905A10B463E036Bf591166_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ba40975123ed50daa2f9f599cdf2d911 import (
-    JSONSchemaValidatorBa40975123Ed50DaA2F9F599Cdf2D911 as JSONSchemaValidatorBa40975123Ed50DaA2F9F599Cdf2D911_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bac0c488707959c182dfef18681bceda import (
-    JSONSchemaValidatorBac0C488707959C182DfEf18681Bceda as JSONSchemaValidatorBac0C488707959C182DfEf18681Bceda_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bc33daf690ec5399a507829abfc4fe64 import (
-    JSONSchemaValidatorBc33Daf690Ec5399A507829Abfc4Fe64 as JSONSchemaValidatorBc33Daf690Ec5399A507829Abfc4Fe64_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bc3cb471beaf5bfeb47201993c023068 import (
-    JSONSchemaValidatorBc3Cb471Beaf5BfeB47201993C023068 as JSONSchemaValidatorBc3Cb471Beaf5BfeB47201993C023068_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bce8e6b307ce52dd8f5546fbd78e05ee import (
-    JSONSchemaValidatorBce8E6B307Ce52Dd8F5546Fbd78E05Ee as JSONSchemaValidatorBce8E6B307Ce52Dd8F5546Fbd78E05Ee_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bd31fcbd1ecd5a2c8b812088b27bfcea import (
-    JSONSchemaValidatorBd31Fcbd1Ecd5A2C8B812088B27Bfcea as JSONSchemaValidatorBd31Fcbd1Ecd5A2C8B812088B27Bfcea_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bdcb514ae33b571795e4a42147d11f87 import (
-    JSONSchemaValidatorBdcb514AE33B571795E4A42147D11F87 as JSONSchemaValidatorBdcb514AE33B571795E4A42147D11F87_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bf40cea4982c54278a52ac2e7b0c458a import (
-    JSONSchemaValidatorBf40Cea4982C54278A52Ac2E7B0C458A as JSONSchemaValidatorBf40Cea4982C54278A52Ac2E7B0C458A_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bfb1005f4d265f8bb340637175a5841f import (
-    JSONSchemaValidatorBfb1005F4D265F8BB340637175A5841F as JSONSchemaValidatorBfb1005F4D265F8BB340637175A5841F_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_bfd1cc1403c951a99c0fcafd59eaabf3 import (
-    JSONSchemaValidatorBfd1Cc1403C951A99C0FCafd59Eaabf3 as JSONSchemaValidatorBfd1Cc1403C951A99C0FCafd59Eaabf3_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c17432d928f755f8bb9f4edb83089d3e import (
-    JSONSchemaValidatorC17432D928F755F8Bb9F4Edb83089D3E as JSONSchemaValidatorC17432D928F755F8Bb9F4Edb83089D3E_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c524f0ec199e5435bcaee56b423532e7 import (
-    JSONSchemaValidatorC524F0Ec199E5435BcaeE56B423532E7 as JSONSchemaValidatorC524F0Ec199E5435BcaeE56B423532E7_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c5f97865727857d5b1eeaedee3dcccd2 import (
-    JSONSchemaValidatorC5F97865727857D5B1EeAedee3Dcccd2 as JSONSchemaValidatorC5F97865727857D5B1EeAedee3Dcccd2_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c6774ff9549a53d4b41fdd2d88f1d0f5 import (
-    JSONSchemaValidatorC6774Ff9549A53D4B41FDd2D88F1D0F5 as JSONSchemaValidatorC6774Ff9549A53D4B41FDd2D88F1D0F5_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c7f28c3d23ba5384be5e769ae0505d00 import (
-    JSONSchemaValidatorC7F28C3D23Ba5384Be5E769Ae0505D00 as JSONSchemaValidatorC7F28C3D23Ba5384Be5E769Ae0505D00_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c937494318f952ba92eaeb82b144c338 import (
-    JSONSchemaValidatorC937494318F952Ba92EaEb82B144C338 as JSONSchemaValidatorC937494318F952Ba92EaEb82B144C338_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c9b5b83e67195b649077a05e42897cc4 import (
-    JSONSchemaValidatorC9B5B83E67195B649077A05E42897Cc4 as JSONSchemaValidatorC9B5B83E67195B649077A05E42897Cc4_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_c9f995abc21b54e7860f66aef2ffbc85 import (
-    JSONSchemaValidatorC9F995AbC21B54E7860F66Aef2Ffbc85 as JSONSchemaValidatorC9F995AbC21B54E7860F66Aef2Ffbc85_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ca2fe989a227585086452d24d32867a6 import (
-    JSONSchemaValidatorCa2Fe989A227585086452D24D32867A6 as JSONSchemaValidatorCa2Fe989A227585086452D24D32867A6_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_cc1599012a5a59c8abdda5376b5cc583 import (
-    JSONSchemaValidatorCc1599012A5A59C8AbddA5376B5Cc583 as JSONSchemaValidatorCc1599012A5A59C8AbddA5376B5Cc583_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_cc19241fd92f586c8986d4d5c99c3a88 import (
-    JSONSchemaValidatorCc19241FD92F586C8986D4D5C99C3A88 as JSONSchemaValidatorCc19241FD92F586C8986D4D5C99C3A88_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ccbf614b4b355cac929f12cc61272c1c import (
-    JSONSchemaValidatorCcbf614B4B355Cac929F12Cc61272C1C as JSONSchemaValidatorCcbf614B4B355Cac929F12Cc61272C1C_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_cec8139f6b1c5e5991d12197206029a0 import (
-    JSONSchemaValidatorCec8139F6B1C5E5991D12197206029A0 as JSONSchemaValidatorCec8139F6B1C5E5991D12197206029A0_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_cf9d39cef5e95bb9bd48d5f86e094c99 import (
-    JSONSchemaValidatorCf9D39CeF5E95Bb9Bd48D5F86E094C99 as JSONSchemaValidatorCf9D39CeF5E95Bb9Bd48D5F86E094C99_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_cfadc5e4c912588389f4f63d2fb6e4ed import (
-    JSONSchemaValidatorCfadc5E4C912588389F4F63D2Fb6E4Ed as JSONSchemaValidatorCfadc5E4C912588389F4F63D2Fb6E4Ed_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d02614492a2251c18de2e36c097e40ff import (
-    JSONSchemaValidatorD02614492A2251C18De2E36C097E40Ff as JSONSchemaValidatorD02614492A2251C18De2E36C097E40Ff_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d045d18062ad5ae59c6f446beb17d675 import (
-    JSONSchemaValidatorD045D18062Ad5Ae59C6F446Beb17D675 as JSONSchemaValidatorD045D18062Ad5Ae59C6F446Beb17D675_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d0aab00569b258b481afedc35e6db392 import (
-    JSONSchemaValidatorD0Aab00569B258B481AfEdc35E6Db392 as JSONSchemaValidatorD0Aab00569B258B481AfEdc35E6Db392_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d1d42ef2f1895a82a2830bf1353e6baa import (
-    JSONSchemaValidatorD1D42Ef2F1895A82A2830Bf1353E6Baa as JSONSchemaValidatorD1D42Ef2F1895A82A2830Bf1353E6Baa_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d2ea814bfae85da1b77872d095fc8221 import (
-    JSONSchemaValidatorD2Ea814BFae85Da1B77872D095Fc8221 as JSONSchemaValidatorD2Ea814BFae85Da1B77872D095Fc8221_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d413a3d054ac50fa921ca8cf7fdf5449 import (
-    JSONSchemaValidatorD413A3D054Ac50Fa921CA8Cf7Fdf5449 as JSONSchemaValidatorD413A3D054Ac50Fa921CA8Cf7Fdf5449_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d5c229546dc755f796dfcf34f1c2e290 import (
-    JSONSchemaValidatorD5C229546Dc755F796DfCf34F1C2E290 as JSONSchemaValidatorD5C229546Dc755F796DfCf34F1C2E290_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d69b1cfffdda5bd1828a5a89a262cbdd import (
-    JSONSchemaValidatorD69B1CffFdda5Bd1828A5A89A262Cbdd as JSONSchemaValidatorD69B1CffFdda5Bd1828A5A89A262Cbdd_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d825ae9a117f5b6bb65b7d78fd42513c import (
-    JSONSchemaValidatorD825Ae9A117F5B6BB65B7D78Fd42513C as JSONSchemaValidatorD825Ae9A117F5B6BB65B7D78Fd42513C_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d91a3aad0fd954e7a43aa3256ce433f6 import (
-    JSONSchemaValidatorD91A3Aad0Fd954E7A43AA3256Ce433F6 as JSONSchemaValidatorD91A3Aad0Fd954E7A43AA3256Ce433F6_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_d967a378b43457ad8c6a6de7bc1845d1 import (
-    JSONSchemaValidatorD967A378B43457Ad8C6A6De7Bc1845D1 as JSONSchemaValidatorD967A378B43457Ad8C6A6De7Bc1845D1_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_da455f4be5b75126ba9970c7cc54c7db import (
-    JSONSchemaValidatorDa455F4BE5B75126Ba9970C7Cc54C7Db as JSONSchemaValidatorDa455F4BE5B75126Ba9970C7Cc54C7Db_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_da593242978c5047bb6b62b7f9475326 import (
-    JSONSchemaValidatorDa593242978C5047Bb6B62B7F9475326 as JSONSchemaValidatorDa593242978C5047Bb6B62B7F9475326_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_db0f8e07ae0d5ecc83e34d29e5e57b41 import (
-    JSONSchemaValidatorDb0F8E07Ae0D5Ecc83E34D29E5E57B41 as JSONSchemaValidatorDb0F8E07Ae0D5Ecc83E34D29E5E57B41_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_dc254215fdf25cd5b7ba797e8f8faebf import (
-    JSONSchemaValidatorDc254215Fdf25Cd5B7Ba797E8F8Faebf as JSONSchemaValidatorDc254215Fdf25Cd5B7Ba797E8F8Faebf_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_dc5d352dfaeb5b17800b0af2858c2f5c import (
-    JSONSchemaValidatorDc5D352DFaeb5B17800B0Af2858C2F5C as JSONSchemaValidatorDc5D352DFaeb5B17800B0Af2858C2F5C_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_dcc43be0514e50fea80cfa827f13ee5c import (
-    JSONSchemaValidatorDcc43Be0514E50FeA80CFa827F13Ee5C as JSONSchemaValidatorDcc43Be0514E50FeA80CFa827F13Ee5C_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_deb34387d0235811a90985711be9fe2e import (
-    JSONSchemaValidatorDeb34387D0235811A90985711Be9Fe2E as JSONSchemaValidatorDeb34387D0235811A90985711Be9Fe2E_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_dec1857f1585557eb39e12a9c93ef985 import (
-    JSONSchemaValidatorDec1857F1585557EB39E12A9C93Ef985 as JSONSchemaValidatorDec1857F1585557EB39E12A9C93Ef985_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_df26f516755a50b5b5477324cf5cb649 import (
-    JSONSchemaValidatorDf26F516755A50B5B5477324Cf5Cb649 as JSONSchemaValidatorDf26F516755A50B5B5477324Cf5Cb649_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_df9ec5aa58815a849b4853b223343e5e import (
-    JSONSchemaValidatorDf9Ec5Aa58815A849B4853B223343E5E as JSONSchemaValidatorDf9Ec5Aa58815A849B4853B223343E5E_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_dfda5beca4cc5437876bff366493ebf0 import (
-    JSONSchemaValidatorDfda5BecA4Cc5437876BFf366493Ebf0 as JSONSchemaValidatorDfda5BecA4Cc5437876BFf366493Ebf0_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e0c7b28d55c85d49a84c1403ca14bd5f import (
-    JSONSchemaValidatorE0C7B28D55C85D49A84C1403Ca14Bd5F as JSONSchemaValidatorE0C7B28D55C85D49A84C1403Ca14Bd5F_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e11daa984f535a08bc1eb01bc84bc399 import (
-    JSONSchemaValidatorE11Daa984F535A08Bc1EB01Bc84Bc399 as JSONSchemaValidatorE11Daa984F535A08Bc1EB01Bc84Bc399_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e1781a990c6b5a4b895d56bcfda2b7cb import (
-    JSONSchemaValidatorE1781A990C6B5A4B895D56Bcfda2B7Cb as JSONSchemaValidatorE1781A990C6B5A4B895D56Bcfda2B7Cb_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e1b8c435195d56368c24a54dcce007d0 import (
-    JSONSchemaValidatorE1B8C435195D56368C24A54Dcce007D0 as JSONSchemaValidatorE1B8C435195D56368C24A54Dcce007D0_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e2f9718de3d050819cdc6355a3a43200 import (
-    JSONSchemaValidatorE2F9718DE3D050819Cdc6355A3A43200 as JSONSchemaValidatorE2F9718DE3D050819Cdc6355A3A43200_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e3934b0fb68a5ff787e65e9b7c8e6296 import (
-    JSONSchemaValidatorE3934B0FB68A5Ff787E65E9B7C8E6296 as JSONSchemaValidatorE3934B0FB68A5Ff787E65E9B7C8E6296_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e3d7ad943d3a50fb8c3be7327669e557 import (
-    JSONSchemaValidatorE3D7Ad943D3A50Fb8C3BE7327669E557 as JSONSchemaValidatorE3D7Ad943D3A50Fb8C3BE7327669E557_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e3e170003d865b9a8d76cbe1d2f268be import (
-    JSONSchemaValidatorE3E170003D865B9A8D76Cbe1D2F268Be as JSONSchemaValidatorE3E170003D865B9A8D76Cbe1D2F268Be_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e4a09bf566f35babad9e27f5eb61a86d import (
-    JSONSchemaValidatorE4A09Bf566F35BabAd9E27F5Eb61A86D as JSONSchemaValidatorE4A09Bf566F35BabAd9E27F5Eb61A86D_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e4d083d956805f63b970be543c34eb0e import (
-    JSONSchemaValidatorE4D083D956805F63B970Be543C34Eb0E as JSONSchemaValidatorE4D083D956805F63B970Be543C34Eb0E_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e6eed78cb55d51a1bfe669729df25689 import (
-    JSONSchemaValidatorE6Eed78CB55D51A1Bfe669729Df25689 as JSONSchemaValidatorE6Eed78CB55D51A1Bfe669729Df25689_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e7af120721c7519a84b13bbe4a1a0362 import (
-    JSONSchemaValidatorE7Af120721C7519A84B13Bbe4A1A0362 as JSONSchemaValidatorE7Af120721C7519A84B13Bbe4A1A0362_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e8271b05b62c54609f74b4f2f373ad5a import (
-    JSONSchemaValidatorE8271B05B62C54609F74B4F2F373Ad5A as JSONSchemaValidatorE8271B05B62C54609F74B4F2F373Ad5A_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_e85b40c5ca055f4c82281617a8f95644 import (
-    JSONSchemaValidatorE85B40C5Ca055F4C82281617A8F95644 as JSONSchemaValidatorE85B40C5Ca055F4C82281617A8F95644_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ea59df3daf2a57a0b48044cc49c8a1ca import (
-    JSONSchemaValidatorEa59Df3DAf2A57A0B48044Cc49C8A1Ca as JSONSchemaValidatorEa59Df3DAf2A57A0B48044Cc49C8A1Ca_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ea5f116c0cd152bbb4a92c043738ea57 import (
-    JSONSchemaValidatorEa5F116C0Cd152BbB4A92C043738Ea57 as JSONSchemaValidatorEa5F116C0Cd152BbB4A92C043738Ea57_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_eab4d187be085cac8a53971def40bee0 import (
-    JSONSchemaValidatorEab4D187Be085Cac8A53971Def40Bee0 as JSONSchemaValidatorEab4D187Be085Cac8A53971Def40Bee0_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_eb4a05f61e475ad0b9e74f963f27ea1d import (
-    JSONSchemaValidatorEb4A05F61E475Ad0B9E74F963F27Ea1D as JSONSchemaValidatorEb4A05F61E475Ad0B9E74F963F27Ea1D_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ecdb2d14c29b5bf3ad79ed2e3cc70715 import (
-    JSONSchemaValidatorEcdb2D14C29B5Bf3Ad79Ed2E3Cc70715 as JSONSchemaValidatorEcdb2D14C29B5Bf3Ad79Ed2E3Cc70715_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ed266e6eda225aedbf581508635da822 import (
-    JSONSchemaValidatorEd266E6EDa225AedBf581508635Da822 as JSONSchemaValidatorEd266E6EDa225AedBf581508635Da822_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ed9125b257ea54b79ef2db2d8ebd9d00 import (
-    JSONSchemaValidatorEd9125B257Ea54B79Ef2Db2D8Ebd9D00 as JSONSchemaValidatorEd9125B257Ea54B79Ef2Db2D8Ebd9D00_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_eecf4323cb285985be72a7e061891059 import (
-    JSONSchemaValidatorEecf4323Cb285985Be72A7E061891059 as JSONSchemaValidatorEecf4323Cb285985Be72A7E061891059_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ef94c2c20ba15fd38e129ac75067de1e import (
-    JSONSchemaValidatorEf94C2C20Ba15Fd38E129Ac75067De1E as JSONSchemaValidatorEf94C2C20Ba15Fd38E129Ac75067De1E_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f08eb586113e597a91b1658297570934 import (
-    JSONSchemaValidatorF08Eb586113E597A91B1658297570934 as JSONSchemaValidatorF08Eb586113E597A91B1658297570934_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f0942fbb79f855e889d60777f41ea944 import (
-    JSONSchemaValidatorF0942Fbb79F855E889D60777F41Ea944 as JSONSchemaValidatorF0942Fbb79F855E889D60777F41Ea944_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f210ff2d89425b4790ce56f19da7be92 import (
-    JSONSchemaValidatorF210Ff2D89425B4790Ce56F19Da7Be92 as JSONSchemaValidatorF210Ff2D89425B4790Ce56F19Da7Be92_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f325b2c7e429566ba5ed9ae8253b5bef import (
-    JSONSchemaValidatorF325B2C7E429566BA5Ed9Ae8253B5Bef as JSONSchemaValidatorF325B2C7E429566BA5Ed9Ae8253B5Bef_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f667322836d5527482ad2100bec7feb4 import (
-    JSONSchemaValidatorF667322836D5527482Ad2100Bec7Feb4 as JSONSchemaValidatorF667322836D5527482Ad2100Bec7Feb4_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f6a4086c00f45dc5a634f0b8db5cdfd3 import (
-    JSONSchemaValidatorF6A4086C00F45Dc5A634F0B8Db5Cdfd3 as JSONSchemaValidatorF6A4086C00F45Dc5A634F0B8Db5Cdfd3_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f6f9dde38ce458fcaf27ffd4f84bfe68 import (
-    JSONSchemaValidatorF6F9Dde38Ce458FcAf27Ffd4F84Bfe68 as JSONSchemaValidatorF6F9Dde38Ce458FcAf27Ffd4F84Bfe68_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f8b4842604b65658afb34b4f124db469 import (
-    JSONSchemaValidatorF8B4842604B65658Afb34B4F124Db469 as JSONSchemaValidatorF8B4842604B65658Afb34B4F124Db469_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f9492367570c5f009cf8b5955790e87c import (
-    JSONSchemaValidatorF9492367570C5F009Cf8B5955790E87C as JSONSchemaValidatorF9492367570C5F009Cf8B5955790E87C_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f95014e3b3385f21afa39325f3508427 import (
-    JSONSchemaValidatorF95014E3B3385F21Afa39325F3508427 as JSONSchemaValidatorF95014E3B3385F21Afa39325F3508427_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_f99c96c3a9b45ddaabc2c75ff8efa67f import (
-    JSONSchemaValidatorF99C96C3A9B45DdaAbc2C75Ff8Efa67F as JSONSchemaValidatorF99C96C3A9B45DdaAbc2C75Ff8Efa67F_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_fa3975be5af25501abb40339d96917eb import (
-    JSONSchemaValidatorFa3975Be5Af25501Abb40339D96917Eb as JSONSchemaValidatorFa3975Be5Af25501Abb40339D96917Eb_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_fb5e152d4d3d59f5afd92f717f3a1eea import (
-    JSONSchemaValidatorFb5E152D4D3D59F5Afd92F717F3A1Eea as JSONSchemaValidatorFb5E152D4D3D59F5Afd92F717F3A1Eea_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_fbdd94fbecd256c08e1d9f6e1a7657ac import (
-    JSONSchemaValidatorFbdd94FbEcd256C08E1D9F6E1A7657Ac as JSONSchemaValidatorFbdd94FbEcd256C08E1D9F6E1A7657Ac_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_fc416739f3c655ed911884aec0130e83 import (
-    JSONSchemaValidatorFc416739F3C655Ed911884Aec0130E83 as JSONSchemaValidatorFc416739F3C655Ed911884Aec0130E83_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_fc8410781af357b6be17a2104ce5efb1 import (
-    JSONSchemaValidatorFc8410781Af357B6Be17A2104Ce5Efb1 as JSONSchemaValidatorFc8410781Af357B6Be17A2104Ce5Efb1_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_fd488ff002115f3b8f0ee165e5347609 import (
-    JSONSchemaValidatorFd488Ff002115F3B8F0EE165E5347609 as JSONSchemaValidatorFd488Ff002115F3B8F0EE165E5347609_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_fdbe4ec3e9f252a988404dc94250b80d import (
-    JSONSchemaValidatorFdbe4Ec3E9F252A988404Dc94250B80D as JSONSchemaValidatorFdbe4Ec3E9F252A988404Dc94250B80D_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_fdfc828270d950ecb75480fe03f7d573 import (
-    JSONSchemaValidatorFdfc828270D950EcB75480Fe03F7D573 as JSONSchemaValidatorFdfc828270D950EcB75480Fe03F7D573_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ff5bf5a67c6c5c0aa9e7ba84c088e1a6 import (
-    JSONSchemaValidatorFf5Bf5A67C6C5C0AA9E7Ba84C088E1A6 as JSONSchemaValidatorFf5Bf5A67C6C5C0AA9E7Ba84C088E1A6_v2_3_7_6,
-)
-from .validators.v2_3_7_6.jsd_ffd2fefb57d5523c87a5d941eb93ddc3 import (
-    JSONSchemaValidatorFfd2Fefb57D5523C87A5D941Eb93Ddc3 as JSONSchemaValidatorFfd2Fefb57D5523C87A5D941Eb93Ddc3_v2_3_7_6,
-)
-
-from .validators.v2_3_7_9.jsd_d5f8cf25475dc5be53f35357aca5a4 import (
-    JSONSchemaValidatorD5F8Cf25475Dc5Be53F35357Aca5A4 as JSONSchemaValidatorD5F8Cf25475Dc5Be53F35357Aca5A4_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b2f15d0c54c2862a60a904289ddd import (
-    JSONSchemaValidatorB2F15D0C54C2862A60A904289Ddd as JSONSchemaValidatorB2F15D0C54C2862A60A904289Ddd_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e4d208b5545f66bf0f94a155c81f46 import (
-    JSONSchemaValidatorE4D208B5545F66Bf0F94A155C81F46 as JSONSchemaValidatorE4D208B5545F66Bf0F94A155C81F46_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bece53a182b45ffa4a1a435e import (
-    JSONSchemaValidatorBece53A182B45Ffa4A1A435E as JSONSchemaValidatorBece53A182B45Ffa4A1A435E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_cdc0bafd4257e78d211a1f4120bfa9 import (
-    JSONSchemaValidatorCdc0BaFd4257E78D211A1F4120Bfa9 as JSONSchemaValidatorCdc0BaFd4257E78D211A1F4120Bfa9_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e22c99a82f5764828810acb45e7a9e import (
-    JSONSchemaValidatorE22C99A82F5764828810Acb45E7A9E as JSONSchemaValidatorE22C99A82F5764828810Acb45E7A9E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_cfb964a2958909f7ca12d23ab2bdb import (
-    JSONSchemaValidatorCfb964A2958909F7CA12D23Ab2Bdb as JSONSchemaValidatorCfb964A2958909F7CA12D23Ab2Bdb_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c2a16208da55e8a615348ed3d530ac import (
-    JSONSchemaValidatorC2A16208Da55E8A615348Ed3D530Ac as JSONSchemaValidatorC2A16208Da55E8A615348Ed3D530Ac_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_cca68e89d0545dac01a8c7a461ac6e import (
-    JSONSchemaValidatorCca68E89D0545DAc01A8C7A461Ac6E as JSONSchemaValidatorCca68E89D0545DAc01A8C7A461Ac6E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ee8590b6b45048b84e814161272bee import (
-    JSONSchemaValidatorEe8590B6B45048B84E814161272Bee as JSONSchemaValidatorEe8590B6B45048B84E814161272Bee_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bb7c52e5225e9398a006fecf4da06f import (
-    JSONSchemaValidatorBb7C52E5225E9398A006Fecf4Da06F as JSONSchemaValidatorBb7C52E5225E9398A006Fecf4Da06F_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d5da0365e31972173f015ed3614 import (
-    JSONSchemaValidatorD5DA0365E31972173F015Ed3614 as JSONSchemaValidatorD5DA0365E31972173F015Ed3614_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_97e350a7a690cdfeffa5eaca import (
-    JSONSchemaValidator97E350A7A690Cdfeffa5Eaca as JSONSchemaValidator97E350A7A690Cdfeffa5Eaca_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fd6083b0c65d03b2d53f10b3ece59d import (
-    JSONSchemaValidatorFd6083B0C65D03B2D53F10B3Ece59D as JSONSchemaValidatorFd6083B0C65D03B2D53F10B3Ece59D_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a0a8d545698d1d59a9be90e51 import (
-    JSONSchemaValidatorA0A8D545698D1D59A9Be90E51 as JSONSchemaValidatorA0A8D545698D1D59A9Be90E51_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ecfe864dc5012ab9c25d23e2ce9f5 import (
-    JSONSchemaValidatorEcfe864Dc5012Ab9C25D23E2Ce9F5 as JSONSchemaValidatorEcfe864Dc5012Ab9C25D23E2Ce9F5_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d7073129453698264e7519d82991c import (
-    JSONSchemaValidatorD7073129453698264E7519D82991C as JSONSchemaValidatorD7073129453698264E7519D82991C_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f751cc2f55767b34e4c890b3fd36e import (
-    JSONSchemaValidatorF751CC2F55767B34E4C890B3Fd36E as JSONSchemaValidatorF751CC2F55767B34E4C890B3Fd36E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f790a930d452708353c374f5c0f90f import (
-    JSONSchemaValidatorF790A930D452708353C374F5C0F90F as JSONSchemaValidatorF790A930D452708353C374F5C0F90F_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a544e27e18e5412af3b68d915c8ca50 import (
-    JSONSchemaValidatorA544E27E18E5412Af3B68D915C8Ca50 as JSONSchemaValidatorA544E27E18E5412Af3B68D915C8Ca50_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_af7031cc5ca5b44af0e6454d558412c import (
-    JSONSchemaValidatorAf7031CC5Ca5B44Af0E6454D558412C as JSONSchemaValidatorAf7031CC5Ca5B44Af0E6454D558412C_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d999a1d36ee52babb6b619877dad734 import (
-    JSONSchemaValidatorD999A1D36Ee52BaBb6B619877Dad734 as JSONSchemaValidatorD999A1D36Ee52BaBb6B619877Dad734_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e86b65311b05d29ba5eea0d5f1fd88f import (
-    JSONSchemaValidatorE86B65311B05D29Ba5EEa0D5F1Fd88F as JSONSchemaValidatorE86B65311B05D29Ba5EEa0D5F1Fd88F_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f44ddd3c38c5a9484f5cb4e125447bc import (
-    JSONSchemaValidatorF44Ddd3C38C5A9484F5Cb4E125447Bc as JSONSchemaValidatorF44Ddd3C38C5A9484F5Cb4E125447Bc_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_cd16daa50533eb0f5873b7601abb2 import (
-    JSONSchemaValidatorCd16DAa50533EB0F5873B7601Abb2 as JSONSchemaValidatorCd16DAa50533EB0F5873B7601Abb2_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c7266d89581c9601b79b7304fda3 import (
-    JSONSchemaValidatorC7266D89581C9601B79B7304Fda3 as JSONSchemaValidatorC7266D89581C9601B79B7304Fda3_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ce6c2c14553f9a4a88f66a04c21c4 import (
-    JSONSchemaValidatorCe6C2C14553F9A4A88F66A04C21C4 as JSONSchemaValidatorCe6C2C14553F9A4A88F66A04C21C4_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e5bb87a955e33a7ee46f1085fd880 import (
-    JSONSchemaValidatorE5Bb87A955E33A7Ee46F1085Fd880 as JSONSchemaValidatorE5Bb87A955E33A7Ee46F1085Fd880_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d76a951f85a7a927afc2f1ea935c8 import (
-    JSONSchemaValidatorD76A951F85A7A927AFc2F1Ea935C8 as JSONSchemaValidatorD76A951F85A7A927AFc2F1Ea935C8_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f2c49c69c53e7b4f57f2af9a6f597 import (
-    JSONSchemaValidatorF2C49C69C53E7B4F57F2Af9A6F597 as JSONSchemaValidatorF2C49C69C53E7B4F57F2Af9A6F597_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e1a76c121857a085149e62e56caadd import (
-    JSONSchemaValidatorE1A76C121857A085149E62E56Caadd as JSONSchemaValidatorE1A76C121857A085149E62E56Caadd_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ca2f659b595c0ba7c649fd8c8bdad6 import (
-    JSONSchemaValidatorCa2F659B595C0BA7C649Fd8C8Bdad6 as JSONSchemaValidatorCa2F659B595C0BA7C649Fd8C8Bdad6_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a4dab79d54829548004029a91ba1 import (
-    JSONSchemaValidatorA4DaB79D54829548004029A91Ba1 as JSONSchemaValidatorA4DaB79D54829548004029A91Ba1_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f5a13405ba69f3957b98db8663a import (
-    JSONSchemaValidatorF5A13405Ba69F3957B98Db8663A as JSONSchemaValidatorF5A13405Ba69F3957B98Db8663A_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_6ce35f19bc4c1d058aa01536 import (
-    JSONSchemaValidator6Ce35F19Bc4C1D058Aa01536 as JSONSchemaValidator6Ce35F19Bc4C1D058Aa01536_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b107800544384c1ddad7b60c237 import (
-    JSONSchemaValidatorB107800544384C1Ddad7B60C237 as JSONSchemaValidatorB107800544384C1Ddad7B60C237_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a3954b27e5eeb82789ed231e0557f import (
-    JSONSchemaValidatorA3954B27E5Eeb82789Ed231E0557F as JSONSchemaValidatorA3954B27E5Eeb82789Ed231E0557F_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e3a724a35854758d65a83823c88435 import (
-    JSONSchemaValidatorE3A724A35854758D65A83823C88435 as JSONSchemaValidatorE3A724A35854758D65A83823C88435_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a2131eae5c1d8e73cd55eebf6a83 import (
-    JSONSchemaValidatorA2131Eae5C1D8E73Cd55Eebf6A83 as JSONSchemaValidatorA2131Eae5C1D8E73Cd55Eebf6A83_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f2562a2d8e5ec287738032961762ed import (
-    JSONSchemaValidatorF2562A2D8E5Ec287738032961762Ed as JSONSchemaValidatorF2562A2D8E5Ec287738032961762Ed_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f256e33af7501a8bdae2742ca9f6d6 import (
-    JSONSchemaValidatorF256E33Af7501A8BdaE2742Ca9F6D6 as JSONSchemaValidatorF256E33Af7501A8BdaE2742Ca9F6D6_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b269afaaa855d3291b825f724fc8ea9 import (
-    JSONSchemaValidatorB269AfaAa855D3291B825F724Fc8Ea9 as JSONSchemaValidatorB269AfaAa855D3291B825F724Fc8Ea9_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b3323a24b275402b97c7e9ccfd78c91 import (
-    JSONSchemaValidatorB3323A24B275402B97C7E9Ccfd78C91 as JSONSchemaValidatorB3323A24B275402B97C7E9Ccfd78C91_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_cc239fa9b185ecbab9e306289850a63 import (
-    JSONSchemaValidatorCc239Fa9B185EcbAb9E306289850A63 as JSONSchemaValidatorCc239Fa9B185EcbAb9E306289850A63_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ccbaf226c685cacac29eb345955f3ad import (
-    JSONSchemaValidatorCcbaf226C685CacAc29Eb345955F3Ad as JSONSchemaValidatorCcbaf226C685CacAc29Eb345955F3Ad_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d1845268faf55f98bc952872259f16f import (
-    JSONSchemaValidatorD1845268Faf55F98Bc952872259F16F as JSONSchemaValidatorD1845268Faf55F98Bc952872259F16F_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d9bd7c527d254ecb63d2b709c428043 import (
-    JSONSchemaValidatorD9Bd7C527D254EcB63D2B709C428043 as JSONSchemaValidatorD9Bd7C527D254EcB63D2B709C428043_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e5e51bcda0b5fec984ba8120f743fe2 import (
-    JSONSchemaValidatorE5E51BcDa0B5Fec984BA8120F743Fe2 as JSONSchemaValidatorE5E51BcDa0B5Fec984BA8120F743Fe2_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_efc2269ee565e23b7be7b49e4fc0322 import (
-    JSONSchemaValidatorEfc2269Ee565E23B7Be7B49E4Fc0322 as JSONSchemaValidatorEfc2269Ee565E23B7Be7B49E4Fc0322_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f77386a48895fa59dcddcc7dd4addb5 import (
-    JSONSchemaValidatorF77386A48895Fa59DcdDcc7Dd4Addb5 as JSONSchemaValidatorF77386A48895Fa59DcdDcc7Dd4Addb5_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ffa347eb411567a9c793696795250a5 import (
-    JSONSchemaValidatorFfa347EB411567A9C793696795250A5 as JSONSchemaValidatorFfa347EB411567A9C793696795250A5_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ffcaccdd9f2530abf66adc98c3f0201 import (
-    JSONSchemaValidatorFfcaccdD9F2530ABf66Adc98C3F0201 as JSONSchemaValidatorFfcaccdD9F2530ABf66Adc98C3F0201_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b9be51e25efc9f41d4f68451f9a6 import (
-    JSONSchemaValidatorB9Be51E25Efc9F41D4F68451F9A6 as JSONSchemaValidatorB9Be51E25Efc9F41D4F68451F9A6_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bf80823752baba63a8849fd521cd import (
-    JSONSchemaValidatorBf80823752BaBa63A8849Fd521Cd as JSONSchemaValidatorBf80823752BaBa63A8849Fd521Cd_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d833c51c4f5cd2879d3e69f773295c import (
-    JSONSchemaValidatorD833C51C4F5Cd2879D3E69F773295C as JSONSchemaValidatorD833C51C4F5Cd2879D3E69F773295C_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fa310ab095148bdb00d7d3d5e1676 import (
-    JSONSchemaValidatorFa310Ab095148Bdb00D7D3D5E1676 as JSONSchemaValidatorFa310Ab095148Bdb00D7D3D5E1676_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a9136d5513985f15e91a19da66c import (
-    JSONSchemaValidatorA9136D5513985F15E91A19Da66C as JSONSchemaValidatorA9136D5513985F15E91A19Da66C_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b887c55faaca726bbe4ac2564 import (
-    JSONSchemaValidatorB887C55FaAca726Bbe4Ac2564 as JSONSchemaValidatorB887C55FaAca726Bbe4Ac2564_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f90ae8599c8a21c98b7a1ca804 import (
-    JSONSchemaValidatorF90Ae8599C8A21C98B7A1Ca804 as JSONSchemaValidatorF90Ae8599C8A21C98B7A1Ca804_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a94058a99acaaf8eb73c9227 import (
-    JSONSchemaValidatorA94058A99AcaAf8Eb73C9227 as JSONSchemaValidatorA94058A99AcaAf8Eb73C9227_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_cfb1d6e52878d057740de275896 import (
-    JSONSchemaValidatorCfb1D6E52878D057740De275896 as JSONSchemaValidatorCfb1D6E52878D057740De275896_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a4829a44597bbf9813664eb75de0 import (
-    JSONSchemaValidatorA4829A44597BBf9813664Eb75De0 as JSONSchemaValidatorA4829A44597BBf9813664Eb75De0_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bdc981805b5fad0a038966d52558 import (
-    JSONSchemaValidatorBdc981805B5FAd0A038966D52558 as JSONSchemaValidatorBdc981805B5FAd0A038966D52558_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_df9908ad265e83ab77d73803925678 import (
-    JSONSchemaValidatorDf9908Ad265E83Ab77D73803925678 as JSONSchemaValidatorDf9908Ad265E83Ab77D73803925678_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e37e7d81575d35a974df797e0a2268 import (
-    JSONSchemaValidatorE37E7D81575D35A974Df797E0A2268 as JSONSchemaValidatorE37E7D81575D35A974Df797E0A2268_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a924f763a15125a8d5beaa6dd6fa2c import (
-    JSONSchemaValidatorA924F763A15125A8D5Beaa6Dd6Fa2C as JSONSchemaValidatorA924F763A15125A8D5Beaa6Dd6Fa2C_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_de4c9b685250dfa8556ab1ec20407c import (
-    JSONSchemaValidatorDe4C9B685250DfA8556Ab1Ec20407C as JSONSchemaValidatorDe4C9B685250DfA8556Ab1Ec20407C_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a15a2f83f975a6a9964e7da79a605de import (
-    JSONSchemaValidatorA15A2F83F975A6A9964E7Da79A605De as JSONSchemaValidatorA15A2F83F975A6A9964E7Da79A605De_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a3a1bf404bf5772828f66f1e10f074d import (
-    JSONSchemaValidatorA3A1Bf404Bf5772828F66F1E10F074D as JSONSchemaValidatorA3A1Bf404Bf5772828F66F1E10F074D_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a7283357c1657bf8ccb3d32a96249d4 import (
-    JSONSchemaValidatorA7283357C1657Bf8Ccb3D32A96249D4 as JSONSchemaValidatorA7283357C1657Bf8Ccb3D32A96249D4_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b4635c45c3b5e44a30d84daa1d5fb69 import (
-    JSONSchemaValidatorB4635C45C3B5E44A30D84Daa1D5Fb69 as JSONSchemaValidatorB4635C45C3B5E44A30D84Daa1D5Fb69_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b60f9f312235959812d49dc4c469e83 import (
-    JSONSchemaValidatorB60F9F312235959812D49Dc4C469E83 as JSONSchemaValidatorB60F9F312235959812D49Dc4C469E83_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bb01b6bd31b53bfb12bbe327320392e import (
-    JSONSchemaValidatorBb01B6BD31B53BfB12BBe327320392E as JSONSchemaValidatorBb01B6BD31B53BfB12BBe327320392E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c224ae3007d5486bbc5abb1f88e95e6 import (
-    JSONSchemaValidatorC224Ae3007D5486Bbc5Abb1F88E95E6 as JSONSchemaValidatorC224Ae3007D5486Bbc5Abb1F88E95E6_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d9ed5bba1155b9c8fe132640832f94e import (
-    JSONSchemaValidatorD9Ed5BbA1155B9C8Fe132640832F94E as JSONSchemaValidatorD9Ed5BbA1155B9C8Fe132640832F94E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e69d02d71905aecbd10b782469efbda import (
-    JSONSchemaValidatorE69D02D71905AecBd10B782469Efbda as JSONSchemaValidatorE69D02D71905AecBd10B782469Efbda_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e722e05046d5262b55c125237e9b67d import (
-    JSONSchemaValidatorE722E05046D5262B55C125237E9B67D as JSONSchemaValidatorE722E05046D5262B55C125237E9B67D_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d77719c37558f694e5545a21406275 import (
-    JSONSchemaValidatorD77719C37558F694E5545A21406275 as JSONSchemaValidatorD77719C37558F694E5545A21406275_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d9a13d575abdc26d485af708e7 import (
-    JSONSchemaValidatorD9A13D575ABdc26D485Af708E7 as JSONSchemaValidatorD9A13D575ABdc26D485Af708E7_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c7315d78a2ddda76b62777e8 import (
-    JSONSchemaValidatorC7315D78A2DdDa76B62777E8 as JSONSchemaValidatorC7315D78A2DdDa76B62777E8_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c279ba052250d883ef87775a415089 import (
-    JSONSchemaValidatorC279Ba052250D883Ef87775A415089 as JSONSchemaValidatorC279Ba052250D883Ef87775A415089_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_af893464e53d2abc8922f4f3310ea import (
-    JSONSchemaValidatorAf893464E53D2Abc8922F4F3310Ea as JSONSchemaValidatorAf893464E53D2Abc8922F4F3310Ea_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d2bd5f05bd535a89ebadb30e2ede9e import (
-    JSONSchemaValidatorD2Bd5F05Bd535A89EbAdb30E2Ede9E as JSONSchemaValidatorD2Bd5F05Bd535A89EbAdb30E2Ede9E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f33d768d01586c9133b155da5e5ade import (
-    JSONSchemaValidatorF33D768D01586C9133B155Da5E5Ade as JSONSchemaValidatorF33D768D01586C9133B155Da5E5Ade_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f624469d5e448e9eba137fe533e8 import (
-    JSONSchemaValidatorF624469D5E448E9EBa137Fe533E8 as JSONSchemaValidatorF624469D5E448E9EBa137Fe533E8_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d2ece28b509b8ef80b2b8c5c5f36 import (
-    JSONSchemaValidatorD2EcE28B509B8Ef80B2B8C5C5F36 as JSONSchemaValidatorD2EcE28B509B8Ef80B2B8C5C5F36_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e31c795964b3bdf85da1b5a2a5 import (
-    JSONSchemaValidatorE31C795964B3BdF85Da1B5A2A5 as JSONSchemaValidatorE31C795964B3BdF85Da1B5A2A5_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_dabd13cd5e9c928daf80d6758d62 import (
-    JSONSchemaValidatorDabd13Cd5E9C928DAf80D6758D62 as JSONSchemaValidatorDabd13Cd5E9C928DAf80D6758D62_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b46a141650debf5946262e8a0961 import (
-    JSONSchemaValidatorB46A141650DeBf5946262E8A0961 as JSONSchemaValidatorB46A141650DeBf5946262E8A0961_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b8699619f95a24bd2d81f12f048235 import (
-    JSONSchemaValidatorB8699619F95A24Bd2D81F12F048235 as JSONSchemaValidatorB8699619F95A24Bd2D81F12F048235_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c00df3623b5a74ad41e75487ed9b77 import (
-    JSONSchemaValidatorC00Df3623B5A74Ad41E75487Ed9B77 as JSONSchemaValidatorC00Df3623B5A74Ad41E75487Ed9B77_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a64bd4956649de3a61e10f0637e import (
-    JSONSchemaValidatorA64Bd4956649De3A61E10F0637E as JSONSchemaValidatorA64Bd4956649De3A61E10F0637E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bc1f37a9f2571fa4d7bc85b9e8a583 import (
-    JSONSchemaValidatorBc1F37A9F2571FA4D7Bc85B9E8A583 as JSONSchemaValidatorBc1F37A9F2571FA4D7Bc85B9E8A583_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a88c7510a15578b8eb2df183a92d5d import (
-    JSONSchemaValidatorA88C7510A15578B8Eb2Df183A92D5D as JSONSchemaValidatorA88C7510A15578B8Eb2Df183A92D5D_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_febb2149ac5f8ba25dbf4d9a862d94 import (
-    JSONSchemaValidatorFebb2149Ac5F8BA25DBf4D9A862D94 as JSONSchemaValidatorFebb2149Ac5F8BA25DBf4D9A862D94_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_cad522e57a7b96b7238935689ed import (
-    JSONSchemaValidatorCad522E57A7B96B7238935689Ed as JSONSchemaValidatorCad522E57A7B96B7238935689Ed_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e702d5786552992aa76b930780569 import (
-    JSONSchemaValidatorE702D5786552992Aa76B930780569 as JSONSchemaValidatorE702D5786552992Aa76B930780569_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_cb98464ddb5ee9ba7ebb4428443ba9 import (
-    JSONSchemaValidatorCb98464Ddb5Ee9Ba7EBb4428443Ba9 as JSONSchemaValidatorCb98464Ddb5Ee9Ba7EBb4428443Ba9_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d292147221524a96616d982b0147c0 import (
-    JSONSchemaValidatorD292147221524A96616D982B0147C0 as JSONSchemaValidatorD292147221524A96616D982B0147C0_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_af29516f0c8591da2a92523b5ab3386 import (
-    JSONSchemaValidatorAf29516F0C8591DA2A92523B5Ab3386 as JSONSchemaValidatorAf29516F0C8591DA2A92523B5Ab3386_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bc9716ed6eb5c6e9ecb0380501d6138 import (
-    JSONSchemaValidatorBc9716ED6Eb5C6E9Ecb0380501D6138 as JSONSchemaValidatorBc9716ED6Eb5C6E9Ecb0380501D6138_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_de92f8ae3c15ea0bad5562452eb5c40 import (
-    JSONSchemaValidatorDe92F8AE3C15Ea0Bad5562452Eb5C40 as JSONSchemaValidatorDe92F8AE3C15Ea0Bad5562452Eb5C40_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f09c94c65c858e4b7be0b7cb3d25b7a import (
-    JSONSchemaValidatorF09C94C65C858E4B7Be0B7Cb3D25B7A as JSONSchemaValidatorF09C94C65C858E4B7Be0B7Cb3D25B7A_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f25c825ca6e58a5b1c2294b11558e7b import (
-    JSONSchemaValidatorF25C825Ca6E58A5B1C2294B11558E7B as JSONSchemaValidatorF25C825Ca6E58A5B1C2294B11558E7B_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c6506b22335101a465d2adf5ca7f37 import (
-    JSONSchemaValidatorC6506B22335101A465D2Adf5Ca7F37 as JSONSchemaValidatorC6506B22335101A465D2Adf5Ca7F37_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e0ed6b9a530ea05d77a199ded4e3 import (
-    JSONSchemaValidatorE0Ed6B9A530EA05D77A199Ded4E3 as JSONSchemaValidatorE0Ed6B9A530EA05D77A199Ded4E3_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a2be6dde4c587389e79d6cb84e54a6 import (
-    JSONSchemaValidatorA2Be6DDe4C587389E79D6Cb84E54A6 as JSONSchemaValidatorA2Be6DDe4C587389E79D6Cb84E54A6_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ad0cb5a12a76384ba4644e55e import (
-    JSONSchemaValidatorAD0Cb5A12A76384Ba4644E55E as JSONSchemaValidatorAD0Cb5A12A76384Ba4644E55E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fdd2af215b9b8327a3e24a3dea89 import (
-    JSONSchemaValidatorFdd2Af215B9B8327A3E24A3Dea89 as JSONSchemaValidatorFdd2Af215B9B8327A3E24A3Dea89_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f71d0b2527b8cd13123f9a68cf3 import (
-    JSONSchemaValidatorF71D0B2527B8Cd13123F9A68Cf3 as JSONSchemaValidatorF71D0B2527B8Cd13123F9A68Cf3_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fee1860b4d509585956565df54a91a import (
-    JSONSchemaValidatorFee1860B4D509585956565Df54A91A as JSONSchemaValidatorFee1860B4D509585956565Df54A91A_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b42a01655325be161ab2ad60aa68 import (
-    JSONSchemaValidatorB42A01655325Be161Ab2Ad60Aa68 as JSONSchemaValidatorB42A01655325Be161Ab2Ad60Aa68_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fe62979a925778bdb0a974a7d86a12 import (
-    JSONSchemaValidatorFe62979A925778Bdb0A974A7D86A12 as JSONSchemaValidatorFe62979A925778Bdb0A974A7D86A12_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a602eee5a56faa64436bade8a240e import (
-    JSONSchemaValidatorA602EEe5A56FaA64436Bade8A240E as JSONSchemaValidatorA602EEe5A56FaA64436Bade8A240E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e6ea8c5d425cf9ac77006f5593725f import (
-    JSONSchemaValidatorE6Ea8C5D425Cf9Ac77006F5593725F as JSONSchemaValidatorE6Ea8C5D425Cf9Ac77006F5593725F_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bcb1d489d735258975828f845df1769 import (
-    JSONSchemaValidatorBcb1D489D735258975828F845Df1769 as JSONSchemaValidatorBcb1D489D735258975828F845Df1769_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bd5b507f58a50aab614e3d7409eec4c import (
-    JSONSchemaValidatorBd5B507F58A50AaB614E3D7409Eec4C as JSONSchemaValidatorBd5B507F58A50AaB614E3D7409Eec4C_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_db690b800995e35bc4e8c43d8ea6c18 import (
-    JSONSchemaValidatorDb690B800995E35Bc4E8C43D8Ea6C18 as JSONSchemaValidatorDb690B800995E35Bc4E8C43D8Ea6C18_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e235d44e4485bafa4499f5a8e53bcd3 import (
-    JSONSchemaValidatorE235D44E4485BafA4499F5A8E53Bcd3 as JSONSchemaValidatorE235D44E4485BafA4499F5A8E53Bcd3_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e4f91ea42515ccdbc24549b84ca1e90 import (
-    JSONSchemaValidatorE4F91Ea42515CcdBc24549B84Ca1E90 as JSONSchemaValidatorE4F91Ea42515CcdBc24549B84Ca1E90_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_efa7f7a97b95f5885a00e6981b27b11 import (
-    JSONSchemaValidatorEfa7F7A97B95F5885A00E6981B27B11 as JSONSchemaValidatorEfa7F7A97B95F5885A00E6981B27B11_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f5d13316c8f53a0b78d881c738a15c6 import (
-    JSONSchemaValidatorF5D13316C8F53A0B78D881C738A15C6 as JSONSchemaValidatorF5D13316C8F53A0B78D881C738A15C6_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bbf7ce025bc2a291b90c37a6b898 import (
-    JSONSchemaValidatorBbf7Ce025Bc2A291B90C37A6B898 as JSONSchemaValidatorBbf7Ce025Bc2A291B90C37A6B898_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_effb55c158f28469762804e84633 import (
-    JSONSchemaValidatorEffb55C158F28469762804E84633 as JSONSchemaValidatorEffb55C158F28469762804E84633_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b8a44ba454de8a7bb52d3efe97ca import (
-    JSONSchemaValidatorB8A44Ba454De8A7BB52D3Efe97Ca as JSONSchemaValidatorB8A44Ba454De8A7BB52D3Efe97Ca_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e0b654c39dc6e19cd6f5194d import (
-    JSONSchemaValidatorE0B654C39Dc6E19Cd6F5194D as JSONSchemaValidatorE0B654C39Dc6E19Cd6F5194D_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b3ff5f865f1c8122a0ec8ca73921 import (
-    JSONSchemaValidatorB3Ff5F865F1C8122A0Ec8Ca73921 as JSONSchemaValidatorB3Ff5F865F1C8122A0Ec8Ca73921_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_de1b75d59b083df0ece12259ecd import (
-    JSONSchemaValidatorDe1B75D59B083Df0Ece12259Ecd as JSONSchemaValidatorDe1B75D59B083Df0Ece12259Ecd_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fc95c917352ad8410ffe6d6e522ed import (
-    JSONSchemaValidatorFc95C917352Ad8410Ffe6D6E522Ed as JSONSchemaValidatorFc95C917352Ad8410Ffe6D6E522Ed_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ae7f02a3d051f2baf7cc087990d658 import (
-    JSONSchemaValidatorAe7F02A3D051F2Baf7Cc087990D658 as JSONSchemaValidatorAe7F02A3D051F2Baf7Cc087990D658_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c0204c665262a712caef988d7d88 import (
-    JSONSchemaValidatorC0204C665262A712Caef988D7D88 as JSONSchemaValidatorC0204C665262A712Caef988D7D88_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f50f8c552f5d2eb68d715e1318976e import (
-    JSONSchemaValidatorF50F8C552F5D2EB68D715E1318976E as JSONSchemaValidatorF50F8C552F5D2EB68D715E1318976E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d9227adc5f02b7cd264af7255d19 import (
-    JSONSchemaValidatorD9227Adc5F02B7Cd264Af7255D19 as JSONSchemaValidatorD9227Adc5F02B7Cd264Af7255D19_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e6ec627d3c587288978990aae75228 import (
-    JSONSchemaValidatorE6Ec627D3C587288978990Aae75228 as JSONSchemaValidatorE6Ec627D3C587288978990Aae75228_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d58baa26bd5a6d9c461592c872d515 import (
-    JSONSchemaValidatorD58Baa26Bd5A6D9C461592C872D515 as JSONSchemaValidatorD58Baa26Bd5A6D9C461592C872D515_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_eb1227bb250799b6ca76ed4bee9d9 import (
-    JSONSchemaValidatorEb1227Bb250799B6CA76Ed4Bee9D9 as JSONSchemaValidatorEb1227Bb250799B6CA76Ed4Bee9D9_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c380301e3e05423bdc1857ff00ae77a import (
-    JSONSchemaValidatorC380301E3E05423Bdc1857Ff00Ae77A as JSONSchemaValidatorC380301E3E05423Bdc1857Ff00Ae77A_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c8354b61a36524cbb2e1037bd814807 import (
-    JSONSchemaValidatorC8354B61A36524CBb2E1037Bd814807 as JSONSchemaValidatorC8354B61A36524CBb2E1037Bd814807_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f1debbfd4775faba3779c513181dfbf import (
-    JSONSchemaValidatorF1DebbfD4775FabA3779C513181Dfbf as JSONSchemaValidatorF1DebbfD4775FabA3779C513181Dfbf_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f24f6c07641580ba6ed710e92c2da16 import (
-    JSONSchemaValidatorF24F6C07641580BA6Ed710E92C2Da16 as JSONSchemaValidatorF24F6C07641580BA6Ed710E92C2Da16_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f4ce55b5f235924903516ef31dc9e3c import (
-    JSONSchemaValidatorF4Ce55B5F235924903516Ef31Dc9E3C as JSONSchemaValidatorF4Ce55B5F235924903516Ef31Dc9E3C_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fcc151af7615a84adf48b714d146192 import (
-    JSONSchemaValidatorFcc151AF7615A84Adf48B714D146192 as JSONSchemaValidatorFcc151AF7615A84Adf48B714D146192_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fccc089e04b557aa7478de3d8fe472f import (
-    JSONSchemaValidatorFccc089E04B557AA7478De3D8Fe472F as JSONSchemaValidatorFccc089E04B557AA7478De3D8Fe472F_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fe3ec7651e79d891fce37a0d860 import (
-    JSONSchemaValidatorFe3Ec7651E79D891Fce37A0D860 as JSONSchemaValidatorFe3Ec7651E79D891Fce37A0D860_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b07f187b7456c8bbb6088a2f24dcee import (
-    JSONSchemaValidatorB07F187B7456C8Bbb6088A2F24Dcee as JSONSchemaValidatorB07F187B7456C8Bbb6088A2F24Dcee_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_cb7563a5058c4801eb842a74ff61c import (
-    JSONSchemaValidatorCb7563A5058C4801EB842A74Ff61C as JSONSchemaValidatorCb7563A5058C4801EB842A74Ff61C_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c10072541e94bd16f1aebffe32 import (
-    JSONSchemaValidatorC10072541E94Bd16F1Aebffe32 as JSONSchemaValidatorC10072541E94Bd16F1Aebffe32_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a18e761ac8592e9a5c4e0bb2308cf0 import (
-    JSONSchemaValidatorA18E761Ac8592E9A5C4E0Bb2308Cf0 as JSONSchemaValidatorA18E761Ac8592E9A5C4E0Bb2308Cf0_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a31cc19195d43ba695f4b7494b559 import (
-    JSONSchemaValidatorA31Cc19195D43Ba695F4B7494B559 as JSONSchemaValidatorA31Cc19195D43Ba695F4B7494B559_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_edc44e0e7a513191cc16dc2b4da88e import (
-    JSONSchemaValidatorEdc44E0E7A513191Cc16Dc2B4Da88E as JSONSchemaValidatorEdc44E0E7A513191Cc16Dc2B4Da88E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d39d23589e85db0a63c414057c import (
-    JSONSchemaValidatorD39D23589E85Db0A63C414057C as JSONSchemaValidatorD39D23589E85Db0A63C414057C_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c45c1c55d498d03a72933690098 import (
-    JSONSchemaValidatorC45C1C55D498D03A72933690098 as JSONSchemaValidatorC45C1C55D498D03A72933690098_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a9f5796226051218eac559ab5211384 import (
-    JSONSchemaValidatorA9F5796226051218Eac559Ab5211384 as JSONSchemaValidatorA9F5796226051218Eac559Ab5211384_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c4befbd77a452a9b7873ffc360a1f20 import (
-    JSONSchemaValidatorC4Befbd77A452A9B7873Ffc360A1F20 as JSONSchemaValidatorC4Befbd77A452A9B7873Ffc360A1F20_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c8d11fb9fc752ab8bb8e2b1413ccc92 import (
-    JSONSchemaValidatorC8D11Fb9Fc752Ab8Bb8E2B1413Ccc92 as JSONSchemaValidatorC8D11Fb9Fc752Ab8Bb8E2B1413Ccc92_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ccd75f80ece59f08cadda085402cef5 import (
-    JSONSchemaValidatorCcd75F80Ece59F08CadDa085402Cef5 as JSONSchemaValidatorCcd75F80Ece59F08CadDa085402Cef5_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d82755e5e03510daf0951c1f42c2702 import (
-    JSONSchemaValidatorD82755E5E03510DAf0951C1F42C2702 as JSONSchemaValidatorD82755E5E03510DAf0951C1F42C2702_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e0bd567c1395531a7f18ab4e14110bd import (
-    JSONSchemaValidatorE0Bd567C1395531A7F18Ab4E14110Bd as JSONSchemaValidatorE0Bd567C1395531A7F18Ab4E14110Bd_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e4f57e8f06856ee9a7e490d01f7f692 import (
-    JSONSchemaValidatorE4F57E8F06856Ee9A7E490D01F7F692 as JSONSchemaValidatorE4F57E8F06856Ee9A7E490D01F7F692_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_eb3b18894545315b25b94d0c0e2ec67 import (
-    JSONSchemaValidatorEb3B18894545315B25B94D0C0E2Ec67 as JSONSchemaValidatorEb3B18894545315B25B94D0C0E2Ec67_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_eca62ef076b5627a85b2a5959613fb8 import (
-    JSONSchemaValidatorEca62Ef076B5627A85B2A5959613Fb8 as JSONSchemaValidatorEca62Ef076B5627A85B2A5959613Fb8_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f486694f3da57b4921b7f2036a1b754 import (
-    JSONSchemaValidatorF486694F3Da57B4921B7F2036A1B754 as JSONSchemaValidatorF486694F3Da57B4921B7F2036A1B754_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f6536a8f01d5863856a0a8308198e15 import (
-    JSONSchemaValidatorF6536A8F01D5863856A0A8308198E15 as JSONSchemaValidatorF6536A8F01D5863856A0A8308198E15_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f7dd6a6cf8d57499168aae05847ad34 import (
-    JSONSchemaValidatorF7Dd6A6Cf8D57499168Aae05847Ad34 as JSONSchemaValidatorF7Dd6A6Cf8D57499168Aae05847Ad34_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fdd36dd2454547096bb65df3755710f import (
-    JSONSchemaValidatorFdd36Dd2454547096Bb65Df3755710F as JSONSchemaValidatorFdd36Dd2454547096Bb65Df3755710F_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_cec6c85d9bb4bcc8f61f31296b import (
-    JSONSchemaValidatorCeC6C85D9BB4BcC8F61F31296B as JSONSchemaValidatorCeC6C85D9BB4BcC8F61F31296B_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f7cf4f24d54c6944a31ed308f8361 import (
-    JSONSchemaValidatorF7Cf4F24D54C6944A31Ed308F8361 as JSONSchemaValidatorF7Cf4F24D54C6944A31Ed308F8361_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e9c5c3e5515a2e1b2cdee6928ab import (
-    JSONSchemaValidatorE9C5C3E5515A2E1B2Cdee6928Ab as JSONSchemaValidatorE9C5C3E5515A2E1B2Cdee6928Ab_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d73cd5be487a36d0a01d6cdc3 import (
-    JSONSchemaValidatorD73Cd5Be487A36D0A01D6Cdc3 as JSONSchemaValidatorD73Cd5Be487A36D0A01D6Cdc3_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_db7b6c4f0542aab9fe7cf5c995f83 import (
-    JSONSchemaValidatorDb7B6C4F0542AAb9FE7Cf5C995F83 as JSONSchemaValidatorDb7B6C4F0542AAb9FE7Cf5C995F83_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d7161b33157dba957ba18eda440c2 import (
-    JSONSchemaValidatorD7161B33157DbA957Ba18Eda440C2 as JSONSchemaValidatorD7161B33157DbA957Ba18Eda440C2_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f5ebb9d50aab287f320d32181c0 import (
-    JSONSchemaValidatorF5EBb9D50AaB287F320D32181C0 as JSONSchemaValidatorF5EBb9D50AaB287F320D32181C0_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_aba18f6e605ce28a112b34dcb4fe82 import (
-    JSONSchemaValidatorAba18F6E605Ce28A112B34Dcb4Fe82 as JSONSchemaValidatorAba18F6E605Ce28A112B34Dcb4Fe82_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fa27ccbaf55711849381a707e1edfa import (
-    JSONSchemaValidatorFa27CcBaf55711849381A707E1Edfa as JSONSchemaValidatorFa27CcBaf55711849381A707E1Edfa_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f04b76067507b9384e409e9431ef3 import (
-    JSONSchemaValidatorF04B76067507B9384E409E9431Ef3 as JSONSchemaValidatorF04B76067507B9384E409E9431Ef3_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b7ae9494b05a57bf6393eaf308b1e7 import (
-    JSONSchemaValidatorB7Ae9494B05A57Bf6393Eaf308B1E7 as JSONSchemaValidatorB7Ae9494B05A57Bf6393Eaf308B1E7_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f24a5ad5bf03fe236dd96dcb import (
-    JSONSchemaValidatorF24A5Ad5Bf03Fe236Dd96Dcb as JSONSchemaValidatorF24A5Ad5Bf03Fe236Dd96Dcb_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b6581534bb321eaea272365b7 import (
-    JSONSchemaValidatorB6581534BB321Eaea272365B7 as JSONSchemaValidatorB6581534BB321Eaea272365B7_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_cc59d48f8159008f52b29e08738811 import (
-    JSONSchemaValidatorCc59D48F8159008F52B29E08738811 as JSONSchemaValidatorCc59D48F8159008F52B29E08738811_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bfca373c5d7c863eef14abc654fd import (
-    JSONSchemaValidatorBfca373C5D7C863EEf14Abc654Fd as JSONSchemaValidatorBfca373C5D7C863EEf14Abc654Fd_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d1608b2751c883a072ee3fb80228 import (
-    JSONSchemaValidatorD1608B2751C883A072Ee3Fb80228 as JSONSchemaValidatorD1608B2751C883A072Ee3Fb80228_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_eea0014365ef78d30d9ba8f1752e8 import (
-    JSONSchemaValidatorEea0014365Ef78D30D9Ba8F1752E8 as JSONSchemaValidatorEea0014365Ef78D30D9Ba8F1752E8_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e73b352ff2573aab906c2ad75c5a71 import (
-    JSONSchemaValidatorE73B352Ff2573AAb906C2Ad75C5A71 as JSONSchemaValidatorE73B352Ff2573AAb906C2Ad75C5A71_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ac98aec39c95c2d97532514ee9b9f3e import (
-    JSONSchemaValidatorAc98Aec39C95C2D97532514Ee9B9F3E as JSONSchemaValidatorAc98Aec39C95C2D97532514Ee9B9F3E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ba9e0f3a5db5972a55d4b3fcf2b5432 import (
-    JSONSchemaValidatorBa9E0F3A5Db5972A55D4B3Fcf2B5432 as JSONSchemaValidatorBa9E0F3A5Db5972A55D4B3Fcf2B5432_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bd421c1db8c5deaa3301b8cc73dd541 import (
-    JSONSchemaValidatorBd421C1Db8C5DeaA3301B8Cc73Dd541 as JSONSchemaValidatorBd421C1Db8C5DeaA3301B8Cc73Dd541_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_be8cdb967555fcca03a4c1f796eee56 import (
-    JSONSchemaValidatorBe8Cdb967555FccA03A4C1F796Eee56 as JSONSchemaValidatorBe8Cdb967555FccA03A4C1F796Eee56_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_cba0eecfc555390935cebd13e6bcb90 import (
-    JSONSchemaValidatorCba0EecFc555390935CEbd13E6Bcb90 as JSONSchemaValidatorCba0EecFc555390935CEbd13E6Bcb90_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d54c40ecb5f531cb5a78d0cd5dd585e import (
-    JSONSchemaValidatorD54C40ECb5F531CB5A78D0Cd5Dd585E as JSONSchemaValidatorD54C40ECb5F531CB5A78D0Cd5Dd585E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_dbea7d7de125cf6b840d5032d3a5c59 import (
-    JSONSchemaValidatorDbea7D7De125Cf6B840D5032D3A5C59 as JSONSchemaValidatorDbea7D7De125Cf6B840D5032D3A5C59_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f019a24c5ce50f082d081bb72ff4df9 import (
-    JSONSchemaValidatorF019A24C5Ce50F082D081Bb72Ff4Df9 as JSONSchemaValidatorF019A24C5Ce50F082D081Bb72Ff4Df9_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f2b137487385de6925b7b6136d4b027 import (
-    JSONSchemaValidatorF2B137487385De6925B7B6136D4B027 as JSONSchemaValidatorF2B137487385De6925B7B6136D4B027_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f5645e6e819558fa08761dee45ca406 import (
-    JSONSchemaValidatorF5645E6E819558FA08761Dee45Ca406 as JSONSchemaValidatorF5645E6E819558FA08761Dee45Ca406_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fe06867e548bba1919024b40d992 import (
-    JSONSchemaValidatorFe06867E548BBa1919024B40D992 as JSONSchemaValidatorFe06867E548BBa1919024B40D992_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_efa92557c9a6c8af0a71829c7e import (
-    JSONSchemaValidatorEfA92557C9A6C8Af0A71829C7E as JSONSchemaValidatorEfA92557C9A6C8Af0A71829C7E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e55cca88065707a6f812a679f69a5d import (
-    JSONSchemaValidatorE55Cca88065707A6F812A679F69A5D as JSONSchemaValidatorE55Cca88065707A6F812A679F69A5D_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ecc3258a5c5b8f2267a512820a59 import (
-    JSONSchemaValidatorEcc3258A5C5B8F2267A512820A59 as JSONSchemaValidatorEcc3258A5C5B8F2267A512820A59_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f5602b2965e53b5bdda193025a3fc import (
-    JSONSchemaValidatorF5602B2965E53B5BdDa193025A3Fc as JSONSchemaValidatorF5602B2965E53B5BdDa193025A3Fc_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e6bca55256a0aac288486e38049b import (
-    JSONSchemaValidatorE6BcA55256A0Aac288486E38049B as JSONSchemaValidatorE6BcA55256A0Aac288486E38049B_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ba98ed72975099b39dd2dc4cb65ed8 import (
-    JSONSchemaValidatorBa98Ed72975099B39DD2Dc4Cb65Ed8 as JSONSchemaValidatorBa98Ed72975099B39DD2Dc4Cb65Ed8_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ef28900485c4e9842b4a68e483d4e import (
-    JSONSchemaValidatorEf28900485C4E9842B4A68E483D4E as JSONSchemaValidatorEf28900485C4E9842B4A68E483D4E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ea8d75a9d8d9e6882da4a4a91 import (
-    JSONSchemaValidatorEA8D75A9D8D9E6882Da4A4A91 as JSONSchemaValidatorEA8D75A9D8D9E6882Da4A4A91_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c49a8488cd52158790aac513e7184a import (
-    JSONSchemaValidatorC49A8488Cd52158790Aac513E7184A as JSONSchemaValidatorC49A8488Cd52158790Aac513E7184A_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ae57085565e551594fc05b4db6a64af import (
-    JSONSchemaValidatorAe57085565E551594Fc05B4Db6A64Af as JSONSchemaValidatorAe57085565E551594Fc05B4Db6A64Af_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bb1653037ca558a8c6097e20b99b4b1 import (
-    JSONSchemaValidatorBb1653037Ca558A8C6097E20B99B4B1 as JSONSchemaValidatorBb1653037Ca558A8C6097E20B99B4B1_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bd1c59e9be75ac4a40decaa95ee9efd import (
-    JSONSchemaValidatorBd1C59E9Be75Ac4A40DEcaa95Ee9Efd as JSONSchemaValidatorBd1C59E9Be75Ac4A40DEcaa95Ee9Efd_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bec2dde673c5b2f940d0474fed32af6 import (
-    JSONSchemaValidatorBec2Dde673C5B2F940D0474Fed32Af6 as JSONSchemaValidatorBec2Dde673C5B2F940D0474Fed32Af6_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d16471a58805b4aa2c757209d188aed import (
-    JSONSchemaValidatorD16471A58805B4AA2C757209D188Aed as JSONSchemaValidatorD16471A58805B4AA2C757209D188Aed_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d6b58f378895114839682dceed1a9b5 import (
-    JSONSchemaValidatorD6B58F378895114839682Dceed1A9B5 as JSONSchemaValidatorD6B58F378895114839682Dceed1A9B5_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d8fc92ddeab597ebb50ea003a6d46bd import (
-    JSONSchemaValidatorD8Fc92DDeab597EBb50Ea003A6D46Bd as JSONSchemaValidatorD8Fc92DDeab597EBb50Ea003A6D46Bd_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e481654675355408be8daff9a82f9a0 import (
-    JSONSchemaValidatorE481654675355408Be8Daff9A82F9A0 as JSONSchemaValidatorE481654675355408Be8Daff9A82F9A0_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ee43cac5fd65c55ab3153d3549d18c0 import (
-    JSONSchemaValidatorEe43Cac5Fd65C55Ab3153D3549D18C0 as JSONSchemaValidatorEe43Cac5Fd65C55Ab3153D3549D18C0_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_eea45fca32f5f12adc30a9d03c43ac6 import (
-    JSONSchemaValidatorEea45FcA32F5F12Adc30A9D03C43Ac6 as JSONSchemaValidatorEea45FcA32F5F12Adc30A9D03C43Ac6_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c90c04b8356cf9974957e0f9516d0 import (
-    JSONSchemaValidatorC90C04B8356Cf9974957E0F9516D0 as JSONSchemaValidatorC90C04B8356Cf9974957E0F9516D0_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b4155d6f885a53ad0e47b1a4 import (
-    JSONSchemaValidatorB4155D6F885A53Ad0E47B1A4 as JSONSchemaValidatorB4155D6F885A53Ad0E47B1A4_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_cf2cac6f150c9bee9ade37921b162 import (
-    JSONSchemaValidatorCf2CaC6F150C9Bee9Ade37921B162 as JSONSchemaValidatorCf2CaC6F150C9Bee9Ade37921B162_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_adfc115d6888722b71811ac96e import (
-    JSONSchemaValidatorAdFc115D6888722B71811Ac96E as JSONSchemaValidatorAdFc115D6888722B71811Ac96E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bc55e6552fac58cc0aaacd773a import (
-    JSONSchemaValidatorBc55E6552FAc58Cc0Aaacd773A as JSONSchemaValidatorBc55E6552FAc58Cc0Aaacd773A_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_dece7a9b353b49084a8ffa4f18c91 import (
-    JSONSchemaValidatorDece7A9B353B49084A8Ffa4F18C91 as JSONSchemaValidatorDece7A9B353B49084A8Ffa4F18C91_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c9ea5c02b2b7368cac785f30 import (
-    JSONSchemaValidatorC9Ea5C02B2B7368Cac785F30 as JSONSchemaValidatorC9Ea5C02B2B7368Cac785F30_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f4b2825561e808787a16f7e0a1f import (
-    JSONSchemaValidatorF4B2825561E808787A16F7E0A1F as JSONSchemaValidatorF4B2825561E808787A16F7E0A1F_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bc3ed6556f9b9c959e53e271d70 import (
-    JSONSchemaValidatorBc3Ed6556F9B9C959E53E271D70 as JSONSchemaValidatorBc3Ed6556F9B9C959E53E271D70_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_aac9ba55e5043b4d5e0995c566dce import (
-    JSONSchemaValidatorAac9BA55E5043B4D5E0995C566Dce as JSONSchemaValidatorAac9BA55E5043B4D5E0995C566Dce_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b818044610579a9b74ec582e7739ab import (
-    JSONSchemaValidatorB818044610579A9B74Ec582E7739Ab as JSONSchemaValidatorB818044610579A9B74Ec582E7739Ab_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bcb7a52e3c5763b246bcf438fe57c9 import (
-    JSONSchemaValidatorBcb7A52E3C5763B246Bcf438Fe57C9 as JSONSchemaValidatorBcb7A52E3C5763B246Bcf438Fe57C9_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_eb209544555e43ae2bc909499f3900 import (
-    JSONSchemaValidatorEb209544555E43Ae2BC909499F3900 as JSONSchemaValidatorEb209544555E43Ae2BC909499F3900_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f2c120b855cb8c852806ce72e54d import (
-    JSONSchemaValidatorF2C120B855Cb8C852806Ce72E54D as JSONSchemaValidatorF2C120B855Cb8C852806Ce72E54D_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a4d8313a955433858e0137ba7ef672 import (
-    JSONSchemaValidatorA4D8313A955433858E0137Ba7Ef672 as JSONSchemaValidatorA4D8313A955433858E0137Ba7Ef672_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e62749061c5aae8ecd1ccc2d315153 import (
-    JSONSchemaValidatorE62749061C5Aae8Ecd1Ccc2D315153 as JSONSchemaValidatorE62749061C5Aae8Ecd1Ccc2D315153_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_cd2e825a78b6de087e991f6fe0 import (
-    JSONSchemaValidatorCd2E825A78B6De087E991F6Fe0 as JSONSchemaValidatorCd2E825A78B6De087E991F6Fe0_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c14a815ec5938950343f6188f0785 import (
-    JSONSchemaValidatorC14A815Ec5938950343F6188F0785 as JSONSchemaValidatorC14A815Ec5938950343F6188F0785_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_aaebb912125213b350d7423b4f01a4 import (
-    JSONSchemaValidatorAaebb912125213B350D7423B4F01A4 as JSONSchemaValidatorAaebb912125213B350D7423B4F01A4_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fb8fee52fcb7577206a3fcac8c import (
-    JSONSchemaValidatorFb8Fee52FcB7577206A3Fcac8C as JSONSchemaValidatorFb8Fee52FcB7577206A3Fcac8C_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ad0cce45817862bebfc839bf5ae import (
-    JSONSchemaValidatorAd0Cce45817862BEbfc839Bf5Ae as JSONSchemaValidatorAd0Cce45817862BEbfc839Bf5Ae_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d6d7d5c8983c1d3c9815bfd35 import (
-    JSONSchemaValidatorD6D7D5C8983C1D3C9815Bfd35 as JSONSchemaValidatorD6D7D5C8983C1D3C9815Bfd35_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fb5a8c0075563491622171958074bf import (
-    JSONSchemaValidatorFb5A8C0075563491622171958074Bf as JSONSchemaValidatorFb5A8C0075563491622171958074Bf_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a764c85d8df5c30b9143619d4f9cde9 import (
-    JSONSchemaValidatorA764C85D8Df5C30B9143619D4F9Cde9 as JSONSchemaValidatorA764C85D8Df5C30B9143619D4F9Cde9_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c991ce0b0f058a08c863a4abdfc70a6 import (
-    JSONSchemaValidatorC991Ce0B0F058A08C863A4Abdfc70A6 as JSONSchemaValidatorC991Ce0B0F058A08C863A4Abdfc70A6_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d10535ed2045b9bb5c58882e6f43cb2 import (
-    JSONSchemaValidatorD10535ED2045B9BB5C58882E6F43Cb2 as JSONSchemaValidatorD10535ED2045B9BB5C58882E6F43Cb2_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f41eb48a0da56949cfaddeecb51ab66 import (
-    JSONSchemaValidatorF41Eb48A0Da56949CfaDdeecb51Ab66 as JSONSchemaValidatorF41Eb48A0Da56949CfaDdeecb51Ab66_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f5bfccc7e30550baa7046f74daa1ef2 import (
-    JSONSchemaValidatorF5Bfccc7E30550BAa7046F74Daa1Ef2 as JSONSchemaValidatorF5Bfccc7E30550BAa7046F74Daa1Ef2_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fff3662537e538f82bfb5809e30b3df import (
-    JSONSchemaValidatorFff3662537E538F82BfB5809E30B3Df as JSONSchemaValidatorFff3662537E538F82BfB5809E30B3Df_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a0c237c8fc115b6f98b87cc7a1360dd0 import (
-    JSONSchemaValidatorA0C237C8Fc115B6F98B87Cc7A1360Dd0 as JSONSchemaValidatorA0C237C8Fc115B6F98B87Cc7A1360Dd0_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a0f799d5ec6954d1bd7a25853080a9f1 import (
-    JSONSchemaValidatorA0F799D5Ec6954D1Bd7A25853080A9F1 as JSONSchemaValidatorA0F799D5Ec6954D1Bd7A25853080A9F1_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a14e71c1b98e51eea41255720025b519 import (
-    JSONSchemaValidatorA14E71C1B98E51EeA41255720025B519 as JSONSchemaValidatorA14E71C1B98E51EeA41255720025B519_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a352f6280e445075b3ea7cbf868c2d94 import (
-    JSONSchemaValidatorA352F6280E445075B3Ea7Cbf868C2D94 as JSONSchemaValidatorA352F6280E445075B3Ea7Cbf868C2D94_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a3b37dcbe2a150bea06d9dcde1837281 import (
-    JSONSchemaValidatorA3B37DcbE2A150BeA06D9Dcde1837281 as JSONSchemaValidatorA3B37DcbE2A150BeA06D9Dcde1837281_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a3d2432ae8c55fe793c5180d8d5fce25 import (
-    JSONSchemaValidatorA3D2432AE8C55Fe793C5180D8D5Fce25 as JSONSchemaValidatorA3D2432AE8C55Fe793C5180D8D5Fce25_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a3fb2e7bb8aa50508425b1dd8818fda4 import (
-    JSONSchemaValidatorA3Fb2E7BB8Aa50508425B1Dd8818Fda4 as JSONSchemaValidatorA3Fb2E7BB8Aa50508425B1Dd8818Fda4_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a41113bc28515538af4fe4d2ff707f60 import (
-    JSONSchemaValidatorA41113Bc28515538Af4FE4D2Ff707F60 as JSONSchemaValidatorA41113Bc28515538Af4FE4D2Ff707F60_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a54fce1a0c305bdabfe91a8a6161e539 import (
-    JSONSchemaValidatorA54Fce1A0C305BdaBfe91A8A6161E539 as JSONSchemaValidatorA54Fce1A0C305BdaBfe91A8A6161E539_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a5e4452cb2e05682933349833a01d14b import (
-    JSONSchemaValidatorA5E4452CB2E05682933349833A01D14B as JSONSchemaValidatorA5E4452CB2E05682933349833A01D14B_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a66db26df529597c84c2a15ea2d632ce import (
-    JSONSchemaValidatorA66Db26DF529597C84C2A15Ea2D632Ce as JSONSchemaValidatorA66Db26DF529597C84C2A15Ea2D632Ce_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a6c4ce7aef8251a2a8646ba0b5c1826a import (
-    JSONSchemaValidatorA6C4Ce7AEf8251A2A8646Ba0B5C1826A as JSONSchemaValidatorA6C4Ce7AEf8251A2A8646Ba0B5C1826A_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a73fbc67627e5bbbafe748de84d42df6 import (
-    JSONSchemaValidatorA73Fbc67627E5BbbAfe748De84D42Df6 as JSONSchemaValidatorA73Fbc67627E5BbbAfe748De84D42Df6_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a7935eedd53a5b8c84668c903cc1c705 import (
-    JSONSchemaValidatorA7935EedD53A5B8C84668C903Cc1C705 as JSONSchemaValidatorA7935EedD53A5B8C84668C903Cc1C705_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a7d6d604f38f5f849af79d8768bddfc1 import (
-    JSONSchemaValidatorA7D6D604F38F5F849Af79D8768Bddfc1 as JSONSchemaValidatorA7D6D604F38F5F849Af79D8768Bddfc1_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a837b8a46cd459c8b429d16fb17f1370 import (
-    JSONSchemaValidatorA837B8A46Cd459C8B429D16Fb17F1370 as JSONSchemaValidatorA837B8A46Cd459C8B429D16Fb17F1370_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a91eed12dfc85dbdaacab22e6e9f04a5 import (
-    JSONSchemaValidatorA91Eed12Dfc85DbdAacaB22E6E9F04A5 as JSONSchemaValidatorA91Eed12Dfc85DbdAacaB22E6E9F04A5_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a93d01238de0537dbb3d358f9cce0bd2 import (
-    JSONSchemaValidatorA93D01238De0537DBb3D358F9Cce0Bd2 as JSONSchemaValidatorA93D01238De0537DBb3D358F9Cce0Bd2_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a9b864257b965fe4bd8b0293f41f1537 import (
-    JSONSchemaValidatorA9B864257B965Fe4Bd8B0293F41F1537 as JSONSchemaValidatorA9B864257B965Fe4Bd8B0293F41F1537_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_a9e0722d184658c592bd130ff03e1dde import (
-    JSONSchemaValidatorA9E0722D184658C592Bd130Ff03E1Dde as JSONSchemaValidatorA9E0722D184658C592Bd130Ff03E1Dde_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_aa11f09d28165f4ea6c81b8642e59cc4 import (
-    JSONSchemaValidatorAa11F09D28165F4EA6C81B8642E59Cc4 as JSONSchemaValidatorAa11F09D28165F4EA6C81B8642E59Cc4_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_aa663ca2bd1f5a3db67c405987495112 import (
-    JSONSchemaValidatorAa663Ca2Bd1F5A3DB67C405987495112 as JSONSchemaValidatorAa663Ca2Bd1F5A3DB67C405987495112_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ac6e63199fb05bcf89106a22502c2197 import (
-    JSONSchemaValidatorAc6E63199Fb05Bcf89106A22502C2197 as JSONSchemaValidatorAc6E63199Fb05Bcf89106A22502C2197_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ac7ce690e0f55a469b0a9bfa3d2c165e import (
-    JSONSchemaValidatorAc7Ce690E0F55A469B0A9Bfa3D2C165E as JSONSchemaValidatorAc7Ce690E0F55A469B0A9Bfa3D2C165E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ad936677c99a58f6b532359d66fe98a7 import (
-    JSONSchemaValidatorAd936677C99A58F6B532359D66Fe98A7 as JSONSchemaValidatorAd936677C99A58F6B532359D66Fe98A7_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ad96e712f4525a128368b1bfe3afc21c import (
-    JSONSchemaValidatorAd96E712F4525A128368B1Bfe3Afc21C as JSONSchemaValidatorAd96E712F4525A128368B1Bfe3Afc21C_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ada3522de8ef54729e9fc242df292547 import (
-    JSONSchemaValidatorAda3522DE8Ef54729E9FC242Df292547 as JSONSchemaValidatorAda3522DE8Ef54729E9FC242Df292547_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ae4d33eacca95f109bebc6fd0528ca48 import (
-    JSONSchemaValidatorAe4D33EaCca95F109BebC6Fd0528Ca48 as JSONSchemaValidatorAe4D33EaCca95F109BebC6Fd0528Ca48_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_afcd4a0cbe985fd7aafa73d671c43a1e import (
-    JSONSchemaValidatorAfcd4A0CBe985Fd7Aafa73D671C43A1E as JSONSchemaValidatorAfcd4A0CBe985Fd7Aafa73D671C43A1E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b08f499f995f5f46ba52e0385b54721a import (
-    JSONSchemaValidatorB08F499F995F5F46Ba52E0385B54721A as JSONSchemaValidatorB08F499F995F5F46Ba52E0385B54721A_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b0aa8e79d21f5e579908825e70aaccf6 import (
-    JSONSchemaValidatorB0Aa8E79D21F5E579908825E70Aaccf6 as JSONSchemaValidatorB0Aa8E79D21F5E579908825E70Aaccf6_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b0b146a144a65aa296b8b939c2926158 import (
-    JSONSchemaValidatorB0B146A144A65Aa296B8B939C2926158 as JSONSchemaValidatorB0B146A144A65Aa296B8B939C2926158_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b119a4d455e35cc3b2cc6695a045cbfa import (
-    JSONSchemaValidatorB119A4D455E35Cc3B2Cc6695A045Cbfa as JSONSchemaValidatorB119A4D455E35Cc3B2Cc6695A045Cbfa_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b11aa4de387251c794665e030fa815da import (
-    JSONSchemaValidatorB11Aa4De387251C794665E030Fa815Da as JSONSchemaValidatorB11Aa4De387251C794665E030Fa815Da_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b2dae3b41636596aa02c3ad0a4bcb8d7 import (
-    JSONSchemaValidatorB2Dae3B41636596AA02C3Ad0A4Bcb8D7 as JSONSchemaValidatorB2Dae3B41636596AA02C3Ad0A4Bcb8D7_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b350fb0876a25879973b0840fbb690bb import (
-    JSONSchemaValidatorB350Fb0876A25879973B0840Fbb690Bb as JSONSchemaValidatorB350Fb0876A25879973B0840Fbb690Bb_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b3ab480a3f485ecc9fef1bd2f8c9d109 import (
-    JSONSchemaValidatorB3Ab480A3F485Ecc9Fef1Bd2F8C9D109 as JSONSchemaValidatorB3Ab480A3F485Ecc9Fef1Bd2F8C9D109_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b3c4383ecc13514c85c6f3d8484f6d68 import (
-    JSONSchemaValidatorB3C4383ECc13514C85C6F3D8484F6D68 as JSONSchemaValidatorB3C4383ECc13514C85C6F3D8484F6D68_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b43e0f60e9ac5bd4960f9772cf7a497b import (
-    JSONSchemaValidatorB43E0F60E9Ac5Bd4960F9772Cf7A497B as JSONSchemaValidatorB43E0F60E9Ac5Bd4960F9772Cf7A497B_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b4f52e69ddca5b2583b28fb4c96447aa import (
-    JSONSchemaValidatorB4F52E69Ddca5B2583B28Fb4C96447Aa as JSONSchemaValidatorB4F52E69Ddca5B2583B28Fb4C96447Aa_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b6f2d8e46cdd5f05bb06f52cd1b26fb2 import (
-    JSONSchemaValidatorB6F2D8E46Cdd5F05Bb06F52Cd1B26Fb2 as JSONSchemaValidatorB6F2D8E46Cdd5F05Bb06F52Cd1B26Fb2_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b7079a38844e56dd8f1b6b876880a02e import (
-    JSONSchemaValidatorB7079A38844E56Dd8F1B6B876880A02E as JSONSchemaValidatorB7079A38844E56Dd8F1B6B876880A02E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_b95201b6a6905a10b463e036bf591166 import (
-    JSONSchemaValidatorB95201B6A6905A10B463E036Bf591166 as JSONSchemaValidatorB95201B6A6905A10B463E036Bf591166_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ba40975123ed50daa2f9f599cdf2d911 import (
-    JSONSchemaValidatorBa40975123Ed50DaA2F9F599Cdf2D911 as JSONSchemaValidatorBa40975123Ed50DaA2F9F599Cdf2D911_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bac0c488707959c182dfef18681bceda import (
-    JSONSchemaValidatorBac0C488707959C182DfEf18681Bceda as JSONSchemaValidatorBac0C488707959C182DfEf18681Bceda_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bc33daf690ec5399a507829abfc4fe64 import (
-    JSONSchemaValidatorBc33Daf690Ec5399A507829Abfc4Fe64 as JSONSchemaValidatorBc33Daf690Ec5399A507829Abfc4Fe64_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bc3cb471beaf5bfeb47201993c023068 import (
-    JSONSchemaValidatorBc3Cb471Beaf5BfeB47201993C023068 as JSONSchemaValidatorBc3Cb471Beaf5BfeB47201993C023068_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bce8e6b307ce52dd8f5546fbd78e05ee import (
-    JSONSchemaValidatorBce8E6B307Ce52Dd8F5546Fbd78E05Ee as JSONSchemaValidatorBce8E6B307Ce52Dd8F5546Fbd78E05Ee_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bd31fcbd1ecd5a2c8b812088b27bfcea import (
-    JSONSchemaValidatorBd31Fcbd1Ecd5A2C8B812088B27Bfcea as JSONSchemaValidatorBd31Fcbd1Ecd5A2C8B812088B27Bfcea_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bd400dbef41e53ed82541c766f14f1eb import (
-    JSONSchemaValidatorBd400DbeF41E53Ed82541C766F14F1Eb as JSONSchemaValidatorBd400DbeF41E53Ed82541C766F14F1Eb_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bdca1829ea705fa690922e3e0f8ff7b0 import (
-    JSONSchemaValidatorBdca1829Ea705Fa690922E3E0F8Ff7B0 as JSONSchemaValidatorBdca1829Ea705Fa690922E3E0F8Ff7B0_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bdcb514ae33b571795e4a42147d11f87 import (
-    JSONSchemaValidatorBdcb514AE33B571795E4A42147D11F87 as JSONSchemaValidatorBdcb514AE33B571795E4A42147D11F87_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bf40cea4982c54278a52ac2e7b0c458a import (
-    JSONSchemaValidatorBf40Cea4982C54278A52Ac2E7B0C458A as JSONSchemaValidatorBf40Cea4982C54278A52Ac2E7B0C458A_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bfb1005f4d265f8bb340637175a5841f import (
-    JSONSchemaValidatorBfb1005F4D265F8BB340637175A5841F as JSONSchemaValidatorBfb1005F4D265F8BB340637175A5841F_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_bfd1cc1403c951a99c0fcafd59eaabf3 import (
-    JSONSchemaValidatorBfd1Cc1403C951A99C0FCafd59Eaabf3 as JSONSchemaValidatorBfd1Cc1403C951A99C0FCafd59Eaabf3_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c17432d928f755f8bb9f4edb83089d3e import (
-    JSONSchemaValidatorC17432D928F755F8Bb9F4Edb83089D3E as JSONSchemaValidatorC17432D928F755F8Bb9F4Edb83089D3E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c1dae5c13e6959348fe1fe0652958647 import (
-    JSONSchemaValidatorC1Dae5C13E6959348Fe1Fe0652958647 as JSONSchemaValidatorC1Dae5C13E6959348Fe1Fe0652958647_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c524f0ec199e5435bcaee56b423532e7 import (
-    JSONSchemaValidatorC524F0Ec199E5435BcaeE56B423532E7 as JSONSchemaValidatorC524F0Ec199E5435BcaeE56B423532E7_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c5c273290fae513da209ec2c9270e46d import (
-    JSONSchemaValidatorC5C273290Fae513DA209Ec2C9270E46D as JSONSchemaValidatorC5C273290Fae513DA209Ec2C9270E46D_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c5f97865727857d5b1eeaedee3dcccd2 import (
-    JSONSchemaValidatorC5F97865727857D5B1EeAedee3Dcccd2 as JSONSchemaValidatorC5F97865727857D5B1EeAedee3Dcccd2_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c60312a923ee5a6fb3f2c725c32dc96f import (
-    JSONSchemaValidatorC60312A923Ee5A6FB3F2C725C32Dc96F as JSONSchemaValidatorC60312A923Ee5A6FB3F2C725C32Dc96F_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c6774ff9549a53d4b41fdd2d88f1d0f5 import (
-    JSONSchemaValidatorC6774Ff9549A53D4B41FDd2D88F1D0F5 as JSONSchemaValidatorC6774Ff9549A53D4B41FDd2D88F1D0F5_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c7f28c3d23ba5384be5e769ae0505d00 import (
-    JSONSchemaValidatorC7F28C3D23Ba5384Be5E769Ae0505D00 as JSONSchemaValidatorC7F28C3D23Ba5384Be5E769Ae0505D00_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c85b39d6bae0536695992ddbb91ea96d import (
-    JSONSchemaValidatorC85B39D6Bae0536695992Ddbb91Ea96D as JSONSchemaValidatorC85B39D6Bae0536695992Ddbb91Ea96D_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c937494318f952ba92eaeb82b144c338 import (
-    JSONSchemaValidatorC937494318F952Ba92EaEb82B144C338 as JSONSchemaValidatorC937494318F952Ba92EaEb82B144C338_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c9b5b83e67195b649077a05e42897cc4 import (
-    JSONSchemaValidatorC9B5B83E67195B649077A05E42897Cc4 as JSONSchemaValidatorC9B5B83E67195B649077A05E42897Cc4_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_c9f995abc21b54e7860f66aef2ffbc85 import (
-    JSONSchemaValidatorC9F995AbC21B54E7860F66Aef2Ffbc85 as JSONSchemaValidatorC9F995AbC21B54E7860F66Aef2Ffbc85_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ca2fe989a227585086452d24d32867a6 import (
-    JSONSchemaValidatorCa2Fe989A227585086452D24D32867A6 as JSONSchemaValidatorCa2Fe989A227585086452D24D32867A6_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_cb38886d0236502783d431455e3fb880 import (
-    JSONSchemaValidatorCb38886D0236502783D431455E3Fb880 as JSONSchemaValidatorCb38886D0236502783D431455E3Fb880_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_cc1599012a5a59c8abdda5376b5cc583 import (
-    JSONSchemaValidatorCc1599012A5A59C8AbddA5376B5Cc583 as JSONSchemaValidatorCc1599012A5A59C8AbddA5376B5Cc583_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_cc19241fd92f586c8986d4d5c99c3a88 import (
-    JSONSchemaValidatorCc19241FD92F586C8986D4D5C99C3A88 as JSONSchemaValidatorCc19241FD92F586C8986D4D5C99C3A88_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ccbf614b4b355cac929f12cc61272c1c import (
-    JSONSchemaValidatorCcbf614B4B355Cac929F12Cc61272C1C as JSONSchemaValidatorCcbf614B4B355Cac929F12Cc61272C1C_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_cdf8c0d3866d5147901c0cf4821a84a7 import (
-    JSONSchemaValidatorCdf8C0D3866D5147901C0Cf4821A84A7 as JSONSchemaValidatorCdf8C0D3866D5147901C0Cf4821A84A7_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_cec8139f6b1c5e5991d12197206029a0 import (
-    JSONSchemaValidatorCec8139F6B1C5E5991D12197206029A0 as JSONSchemaValidatorCec8139F6B1C5E5991D12197206029A0_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_cf9d39cef5e95bb9bd48d5f86e094c99 import (
-    JSONSchemaValidatorCf9D39CeF5E95Bb9Bd48D5F86E094C99 as JSONSchemaValidatorCf9D39CeF5E95Bb9Bd48D5F86E094C99_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_cfadc5e4c912588389f4f63d2fb6e4ed import (
-    JSONSchemaValidatorCfadc5E4C912588389F4F63D2Fb6E4Ed as JSONSchemaValidatorCfadc5E4C912588389F4F63D2Fb6E4Ed_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d02614492a2251c18de2e36c097e40ff import (
-    JSONSchemaValidatorD02614492A2251C18De2E36C097E40Ff as JSONSchemaValidatorD02614492A2251C18De2E36C097E40Ff_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d045d18062ad5ae59c6f446beb17d675 import (
-    JSONSchemaValidatorD045D18062Ad5Ae59C6F446Beb17D675 as JSONSchemaValidatorD045D18062Ad5Ae59C6F446Beb17D675_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d05c763ada545fbe94a4c0391456b89f import (
-    JSONSchemaValidatorD05C763ADa545Fbe94A4C0391456B89F as JSONSchemaValidatorD05C763ADa545Fbe94A4C0391456B89F_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d0aab00569b258b481afedc35e6db392 import (
-    JSONSchemaValidatorD0Aab00569B258B481AfEdc35E6Db392 as JSONSchemaValidatorD0Aab00569B258B481AfEdc35E6Db392_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d0f4d6b5909b5ecaa29e854e919b4221 import (
-    JSONSchemaValidatorD0F4D6B5909B5EcaA29E854E919B4221 as JSONSchemaValidatorD0F4D6B5909B5EcaA29E854E919B4221_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d1d42ef2f1895a82a2830bf1353e6baa import (
-    JSONSchemaValidatorD1D42Ef2F1895A82A2830Bf1353E6Baa as JSONSchemaValidatorD1D42Ef2F1895A82A2830Bf1353E6Baa_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d2ea814bfae85da1b77872d095fc8221 import (
-    JSONSchemaValidatorD2Ea814BFae85Da1B77872D095Fc8221 as JSONSchemaValidatorD2Ea814BFae85Da1B77872D095Fc8221_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d413a3d054ac50fa921ca8cf7fdf5449 import (
-    JSONSchemaValidatorD413A3D054Ac50Fa921CA8Cf7Fdf5449 as JSONSchemaValidatorD413A3D054Ac50Fa921CA8Cf7Fdf5449_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d5c229546dc755f796dfcf34f1c2e290 import (
-    JSONSchemaValidatorD5C229546Dc755F796DfCf34F1C2E290 as JSONSchemaValidatorD5C229546Dc755F796DfCf34F1C2E290_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d69b1cfffdda5bd1828a5a89a262cbdd import (
-    JSONSchemaValidatorD69B1CffFdda5Bd1828A5A89A262Cbdd as JSONSchemaValidatorD69B1CffFdda5Bd1828A5A89A262Cbdd_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d825ae9a117f5b6bb65b7d78fd42513c import (
-    JSONSchemaValidatorD825Ae9A117F5B6BB65B7D78Fd42513C as JSONSchemaValidatorD825Ae9A117F5B6BB65B7D78Fd42513C_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d8fcd6dbb7ff53b58f7398c49b27ded2 import (
-    JSONSchemaValidatorD8Fcd6DbB7Ff53B58F7398C49B27Ded2 as JSONSchemaValidatorD8Fcd6DbB7Ff53B58F7398C49B27Ded2_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d91a3aad0fd954e7a43aa3256ce433f6 import (
-    JSONSchemaValidatorD91A3Aad0Fd954E7A43AA3256Ce433F6 as JSONSchemaValidatorD91A3Aad0Fd954E7A43AA3256Ce433F6_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d967a378b43457ad8c6a6de7bc1845d1 import (
-    JSONSchemaValidatorD967A378B43457Ad8C6A6De7Bc1845D1 as JSONSchemaValidatorD967A378B43457Ad8C6A6De7Bc1845D1_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_d9e3276d1ed3511b80b22ea8388959c8 import (
-    JSONSchemaValidatorD9E3276D1Ed3511B80B22Ea8388959C8 as JSONSchemaValidatorD9E3276D1Ed3511B80B22Ea8388959C8_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_da455f4be5b75126ba9970c7cc54c7db import (
-    JSONSchemaValidatorDa455F4BE5B75126Ba9970C7Cc54C7Db as JSONSchemaValidatorDa455F4BE5B75126Ba9970C7Cc54C7Db_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_da593242978c5047bb6b62b7f9475326 import (
-    JSONSchemaValidatorDa593242978C5047Bb6B62B7F9475326 as JSONSchemaValidatorDa593242978C5047Bb6B62B7F9475326_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_db0f8e07ae0d5ecc83e34d29e5e57b41 import (
-    JSONSchemaValidatorDb0F8E07Ae0D5Ecc83E34D29E5E57B41 as JSONSchemaValidatorDb0F8E07Ae0D5Ecc83E34D29E5E57B41_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_dc254215fdf25cd5b7ba797e8f8faebf import (
-    JSONSchemaValidatorDc254215Fdf25Cd5B7Ba797E8F8Faebf as JSONSchemaValidatorDc254215Fdf25Cd5B7Ba797E8F8Faebf_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_dc5d352dfaeb5b17800b0af2858c2f5c import (
-    JSONSchemaValidatorDc5D352DFaeb5B17800B0Af2858C2F5C as JSONSchemaValidatorDc5D352DFaeb5B17800B0Af2858C2F5C_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_dcc43be0514e50fea80cfa827f13ee5c import (
-    JSONSchemaValidatorDcc43Be0514E50FeA80CFa827F13Ee5C as JSONSchemaValidatorDcc43Be0514E50FeA80CFa827F13Ee5C_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_dda852745acd5ce5a97b0cfdf0de2fd2 import (
-    JSONSchemaValidatorDda852745Acd5Ce5A97B0Cfdf0De2Fd2 as JSONSchemaValidatorDda852745Acd5Ce5A97B0Cfdf0De2Fd2_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_de1769e2886b5948b408100225b4a034 import (
-    JSONSchemaValidatorDe1769E2886B5948B408100225B4A034 as JSONSchemaValidatorDe1769E2886B5948B408100225B4A034_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_deb34387d0235811a90985711be9fe2e import (
-    JSONSchemaValidatorDeb34387D0235811A90985711Be9Fe2E as JSONSchemaValidatorDeb34387D0235811A90985711Be9Fe2E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_dec1857f1585557eb39e12a9c93ef985 import (
-    JSONSchemaValidatorDec1857F1585557EB39E12A9C93Ef985 as JSONSchemaValidatorDec1857F1585557EB39E12A9C93Ef985_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_df26f516755a50b5b5477324cf5cb649 import (
-    JSONSchemaValidatorDf26F516755A50B5B5477324Cf5Cb649 as JSONSchemaValidatorDf26F516755A50B5B5477324Cf5Cb649_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_df9ec5aa58815a849b4853b223343e5e import (
-    JSONSchemaValidatorDf9Ec5Aa58815A849B4853B223343E5E as JSONSchemaValidatorDf9Ec5Aa58815A849B4853B223343E5E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_dfda5beca4cc5437876bff366493ebf0 import (
-    JSONSchemaValidatorDfda5BecA4Cc5437876BFf366493Ebf0 as JSONSchemaValidatorDfda5BecA4Cc5437876BFf366493Ebf0_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e0c7b28d55c85d49a84c1403ca14bd5f import (
-    JSONSchemaValidatorE0C7B28D55C85D49A84C1403Ca14Bd5F as JSONSchemaValidatorE0C7B28D55C85D49A84C1403Ca14Bd5F_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e11daa984f535a08bc1eb01bc84bc399 import (
-    JSONSchemaValidatorE11Daa984F535A08Bc1EB01Bc84Bc399 as JSONSchemaValidatorE11Daa984F535A08Bc1EB01Bc84Bc399_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e1781a990c6b5a4b895d56bcfda2b7cb import (
-    JSONSchemaValidatorE1781A990C6B5A4B895D56Bcfda2B7Cb as JSONSchemaValidatorE1781A990C6B5A4B895D56Bcfda2B7Cb_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e1b8c435195d56368c24a54dcce007d0 import (
-    JSONSchemaValidatorE1B8C435195D56368C24A54Dcce007D0 as JSONSchemaValidatorE1B8C435195D56368C24A54Dcce007D0_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e2ec291c2e775df3895aadc639713eea import (
-    JSONSchemaValidatorE2Ec291C2E775Df3895AAdc639713Eea as JSONSchemaValidatorE2Ec291C2E775Df3895AAdc639713Eea_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e2f9718de3d050819cdc6355a3a43200 import (
-    JSONSchemaValidatorE2F9718DE3D050819Cdc6355A3A43200 as JSONSchemaValidatorE2F9718DE3D050819Cdc6355A3A43200_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e328f7d015535897877f3ecb0c927453 import (
-    JSONSchemaValidatorE328F7D015535897877F3Ecb0C927453 as JSONSchemaValidatorE328F7D015535897877F3Ecb0C927453_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e3934b0fb68a5ff787e65e9b7c8e6296 import (
-    JSONSchemaValidatorE3934B0FB68A5Ff787E65E9B7C8E6296 as JSONSchemaValidatorE3934B0FB68A5Ff787E65E9B7C8E6296_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e3d7ad943d3a50fb8c3be7327669e557 import (
-    JSONSchemaValidatorE3D7Ad943D3A50Fb8C3BE7327669E557 as JSONSchemaValidatorE3D7Ad943D3A50Fb8C3BE7327669E557_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e3e170003d865b9a8d76cbe1d2f268be import (
-    JSONSchemaValidatorE3E170003D865B9A8D76Cbe1D2F268Be as JSONSchemaValidatorE3E170003D865B9A8D76Cbe1D2F268Be_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e4a09bf566f35babad9e27f5eb61a86d import (
-    JSONSchemaValidatorE4A09Bf566F35BabAd9E27F5Eb61A86D as JSONSchemaValidatorE4A09Bf566F35BabAd9E27F5Eb61A86D_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e4d083d956805f63b970be543c34eb0e import (
-    JSONSchemaValidatorE4D083D956805F63B970Be543C34Eb0E as JSONSchemaValidatorE4D083D956805F63B970Be543C34Eb0E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e6c22549e5145c4892d0bd3b97614e07 import (
-    JSONSchemaValidatorE6C22549E5145C4892D0Bd3B97614E07 as JSONSchemaValidatorE6C22549E5145C4892D0Bd3B97614E07_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e6eed78cb55d51a1bfe669729df25689 import (
-    JSONSchemaValidatorE6Eed78CB55D51A1Bfe669729Df25689 as JSONSchemaValidatorE6Eed78CB55D51A1Bfe669729Df25689_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e7af120721c7519a84b13bbe4a1a0362 import (
-    JSONSchemaValidatorE7Af120721C7519A84B13Bbe4A1A0362 as JSONSchemaValidatorE7Af120721C7519A84B13Bbe4A1A0362_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e8271b05b62c54609f74b4f2f373ad5a import (
-    JSONSchemaValidatorE8271B05B62C54609F74B4F2F373Ad5A as JSONSchemaValidatorE8271B05B62C54609F74B4F2F373Ad5A_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_e85b40c5ca055f4c82281617a8f95644 import (
-    JSONSchemaValidatorE85B40C5Ca055F4C82281617A8F95644 as JSONSchemaValidatorE85B40C5Ca055F4C82281617A8F95644_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ea4363569a9d58779c2bfc05b6e45423 import (
-    JSONSchemaValidatorEa4363569A9D58779C2BFc05B6E45423 as JSONSchemaValidatorEa4363569A9D58779C2BFc05B6E45423_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ea59df3daf2a57a0b48044cc49c8a1ca import (
-    JSONSchemaValidatorEa59Df3DAf2A57A0B48044Cc49C8A1Ca as JSONSchemaValidatorEa59Df3DAf2A57A0B48044Cc49C8A1Ca_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ea5f116c0cd152bbb4a92c043738ea57 import (
-    JSONSchemaValidatorEa5F116C0Cd152BbB4A92C043738Ea57 as JSONSchemaValidatorEa5F116C0Cd152BbB4A92C043738Ea57_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_eab4d187be085cac8a53971def40bee0 import (
-    JSONSchemaValidatorEab4D187Be085Cac8A53971Def40Bee0 as JSONSchemaValidatorEab4D187Be085Cac8A53971Def40Bee0_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_eb4a05f61e475ad0b9e74f963f27ea1d import (
-    JSONSchemaValidatorEb4A05F61E475Ad0B9E74F963F27Ea1D as JSONSchemaValidatorEb4A05F61E475Ad0B9E74F963F27Ea1D_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ecdb2d14c29b5bf3ad79ed2e3cc70715 import (
-    JSONSchemaValidatorEcdb2D14C29B5Bf3Ad79Ed2E3Cc70715 as JSONSchemaValidatorEcdb2D14C29B5Bf3Ad79Ed2E3Cc70715_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ed266e6eda225aedbf581508635da822 import (
-    JSONSchemaValidatorEd266E6EDa225AedBf581508635Da822 as JSONSchemaValidatorEd266E6EDa225AedBf581508635Da822_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ed9125b257ea54b79ef2db2d8ebd9d00 import (
-    JSONSchemaValidatorEd9125B257Ea54B79Ef2Db2D8Ebd9D00 as JSONSchemaValidatorEd9125B257Ea54B79Ef2Db2D8Ebd9D00_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_edf997bb4bcc5dd6baca80647d8a47ce import (
-    JSONSchemaValidatorEdf997Bb4Bcc5Dd6Baca80647D8A47Ce as JSONSchemaValidatorEdf997Bb4Bcc5Dd6Baca80647D8A47Ce_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_eeb595d249295989a4917261463ea82a import (
-    JSONSchemaValidatorEeb595D249295989A4917261463Ea82A as JSONSchemaValidatorEeb595D249295989A4917261463Ea82A_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_eecf4323cb285985be72a7e061891059 import (
-    JSONSchemaValidatorEecf4323Cb285985Be72A7E061891059 as JSONSchemaValidatorEecf4323Cb285985Be72A7E061891059_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ef94c2c20ba15fd38e129ac75067de1e import (
-    JSONSchemaValidatorEf94C2C20Ba15Fd38E129Ac75067De1E as JSONSchemaValidatorEf94C2C20Ba15Fd38E129Ac75067De1E_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f08eb586113e597a91b1658297570934 import (
-    JSONSchemaValidatorF08Eb586113E597A91B1658297570934 as JSONSchemaValidatorF08Eb586113E597A91B1658297570934_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f0942fbb79f855e889d60777f41ea944 import (
-    JSONSchemaValidatorF0942Fbb79F855E889D60777F41Ea944 as JSONSchemaValidatorF0942Fbb79F855E889D60777F41Ea944_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f0f7b6e1e4e159e7a40001fc3e649dfc import (
-    JSONSchemaValidatorF0F7B6E1E4E159E7A40001Fc3E649Dfc as JSONSchemaValidatorF0F7B6E1E4E159E7A40001Fc3E649Dfc_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f20eecc6e2d95a03a9e8961cd4337467 import (
-    JSONSchemaValidatorF20Eecc6E2D95A03A9E8961Cd4337467 as JSONSchemaValidatorF20Eecc6E2D95A03A9E8961Cd4337467_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f210ff2d89425b4790ce56f19da7be92 import (
-    JSONSchemaValidatorF210Ff2D89425B4790Ce56F19Da7Be92 as JSONSchemaValidatorF210Ff2D89425B4790Ce56F19Da7Be92_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f325b2c7e429566ba5ed9ae8253b5bef import (
-    JSONSchemaValidatorF325B2C7E429566BA5Ed9Ae8253B5Bef as JSONSchemaValidatorF325B2C7E429566BA5Ed9Ae8253B5Bef_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f667322836d5527482ad2100bec7feb4 import (
-    JSONSchemaValidatorF667322836D5527482Ad2100Bec7Feb4 as JSONSchemaValidatorF667322836D5527482Ad2100Bec7Feb4_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f6a4086c00f45dc5a634f0b8db5cdfd3 import (
-    JSONSchemaValidatorF6A4086C00F45Dc5A634F0B8Db5Cdfd3 as JSONSchemaValidatorF6A4086C00F45Dc5A634F0B8Db5Cdfd3_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f6f9dde38ce458fcaf27ffd4f84bfe68 import (
-    JSONSchemaValidatorF6F9Dde38Ce458FcAf27Ffd4F84Bfe68 as JSONSchemaValidatorF6F9Dde38Ce458FcAf27Ffd4F84Bfe68_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f8b4842604b65658afb34b4f124db469 import (
-    JSONSchemaValidatorF8B4842604B65658Afb34B4F124Db469 as JSONSchemaValidatorF8B4842604B65658Afb34B4F124Db469_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f924b4c27d18500b9b23df516b55c182 import (
-    JSONSchemaValidatorF924B4C27D18500B9B23Df516B55C182 as JSONSchemaValidatorF924B4C27D18500B9B23Df516B55C182_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f9492367570c5f009cf8b5955790e87c import (
-    JSONSchemaValidatorF9492367570C5F009Cf8B5955790E87C as JSONSchemaValidatorF9492367570C5F009Cf8B5955790E87C_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f95014e3b3385f21afa39325f3508427 import (
-    JSONSchemaValidatorF95014E3B3385F21Afa39325F3508427 as JSONSchemaValidatorF95014E3B3385F21Afa39325F3508427_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_f99c96c3a9b45ddaabc2c75ff8efa67f import (
-    JSONSchemaValidatorF99C96C3A9B45DdaAbc2C75Ff8Efa67F as JSONSchemaValidatorF99C96C3A9B45DdaAbc2C75Ff8Efa67F_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fa3975be5af25501abb40339d96917eb import (
-    JSONSchemaValidatorFa3975Be5Af25501Abb40339D96917Eb as JSONSchemaValidatorFa3975Be5Af25501Abb40339D96917Eb_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fb5e152d4d3d59f5afd92f717f3a1eea import (
-    JSONSchemaValidatorFb5E152D4D3D59F5Afd92F717F3A1Eea as JSONSchemaValidatorFb5E152D4D3D59F5Afd92F717F3A1Eea_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fbdd94fbecd256c08e1d9f6e1a7657ac import (
-    JSONSchemaValidatorFbdd94FbEcd256C08E1D9F6E1A7657Ac as JSONSchemaValidatorFbdd94FbEcd256C08E1D9F6E1A7657Ac_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fc416739f3c655ed911884aec0130e83 import (
-    JSONSchemaValidatorFc416739F3C655Ed911884Aec0130E83 as JSONSchemaValidatorFc416739F3C655Ed911884Aec0130E83_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fc8410781af357b6be17a2104ce5efb1 import (
-    JSONSchemaValidatorFc8410781Af357B6Be17A2104Ce5Efb1 as JSONSchemaValidatorFc8410781Af357B6Be17A2104Ce5Efb1_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fd488ff002115f3b8f0ee165e5347609 import (
-    JSONSchemaValidatorFd488Ff002115F3B8F0EE165E5347609 as JSONSchemaValidatorFd488Ff002115F3B8F0EE165E5347609_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fdbe4ec3e9f252a988404dc94250b80d import (
-    JSONSchemaValidatorFdbe4Ec3E9F252A988404Dc94250B80D as JSONSchemaValidatorFdbe4Ec3E9F252A988404Dc94250B80D_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_fdfc828270d950ecb75480fe03f7d573 import (
-    JSONSchemaValidatorFdfc828270D950EcB75480Fe03F7D573 as JSONSchemaValidatorFdfc828270D950EcB75480Fe03F7D573_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ff5bf5a67c6c5c0aa9e7ba84c088e1a6 import (
-    JSONSchemaValidatorFf5Bf5A67C6C5C0AA9E7Ba84C088E1A6 as JSONSchemaValidatorFf5Bf5A67C6C5C0AA9E7Ba84C088E1A6_v2_3_7_9,
-)
-from .validators.v2_3_7_9.jsd_ffd2fefb57d5523c87a5d941eb93ddc3 import (
-    JSONSchemaValidatorFfd2Fefb57D5523C87A5D941Eb93Ddc3 as JSONSchemaValidatorFfd2Fefb57D5523C87A5D941Eb93Ddc3_v2_3_7_9,
-)
+#: Process-wide registry of compiled validators keyed by (version, model).
+_json_schema_validators = {}
+_json_schema_validators_lock = threading.Lock()
 
-from .validators.v3_1_3_0.jsd_d5f8cf25475dc5be53f35357aca5a4 import (
-    JSONSchemaValidatorD5F8Cf25475Dc5Be53F35357Aca5A4 as JSONSchemaValidatorD5F8Cf25475Dc5Be53F35357Aca5A4_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b2f15d0c54c2862a60a904289ddd import (
-    JSONSchemaValidatorB2F15D0C54C2862A60A904289Ddd as JSONSchemaValidatorB2F15D0C54C2862A60A904289Ddd_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e4d208b5545f66bf0f94a155c81f46 import (
-    JSONSchemaValidatorE4D208B5545F66Bf0F94A155C81F46 as JSONSchemaValidatorE4D208B5545F66Bf0F94A155C81F46_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cd9d7d858f094469abf9464431f import (
-    JSONSchemaValidatorCd9D7D858F094469Abf9464431F as JSONSchemaValidatorCd9D7D858F094469Abf9464431F_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bece53a182b45ffa4a1a435e import (
-    JSONSchemaValidatorBece53A182B45Ffa4A1A435E as JSONSchemaValidatorBece53A182B45Ffa4A1A435E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cdc0bafd4257e78d211a1f4120bfa9 import (
-    JSONSchemaValidatorCdc0BaFd4257E78D211A1F4120Bfa9 as JSONSchemaValidatorCdc0BaFd4257E78D211A1F4120Bfa9_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e22c99a82f5764828810acb45e7a9e import (
-    JSONSchemaValidatorE22C99A82F5764828810Acb45E7A9E as JSONSchemaValidatorE22C99A82F5764828810Acb45E7A9E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cfb964a2958909f7ca12d23ab2bdb import (
-    JSONSchemaValidatorCfb964A2958909F7CA12D23Ab2Bdb as JSONSchemaValidatorCfb964A2958909F7CA12D23Ab2Bdb_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c2a16208da55e8a615348ed3d530ac import (
-    JSONSchemaValidatorC2A16208Da55E8A615348Ed3D530Ac as JSONSchemaValidatorC2A16208Da55E8A615348Ed3D530Ac_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cca68e89d0545dac01a8c7a461ac6e import (
-    JSONSchemaValidatorCca68E89D0545DAc01A8C7A461Ac6E as JSONSchemaValidatorCca68E89D0545DAc01A8C7A461Ac6E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ee8590b6b45048b84e814161272bee import (
-    JSONSchemaValidatorEe8590B6B45048B84E814161272Bee as JSONSchemaValidatorEe8590B6B45048B84E814161272Bee_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bb7c52e5225e9398a006fecf4da06f import (
-    JSONSchemaValidatorBb7C52E5225E9398A006Fecf4Da06F as JSONSchemaValidatorBb7C52E5225E9398A006Fecf4Da06F_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d5da0365e31972173f015ed3614 import (
-    JSONSchemaValidatorD5DA0365E31972173F015Ed3614 as JSONSchemaValidatorD5DA0365E31972173F015Ed3614_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_97e350a7a690cdfeffa5eaca import (
-    JSONSchemaValidator97E350A7A690Cdfeffa5Eaca as JSONSchemaValidator97E350A7A690Cdfeffa5Eaca_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fd6083b0c65d03b2d53f10b3ece59d import (
-    JSONSchemaValidatorFd6083B0C65D03B2D53F10B3Ece59D as JSONSchemaValidatorFd6083B0C65D03B2D53F10B3Ece59D_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a0a8d545698d1d59a9be90e51 import (
-    JSONSchemaValidatorA0A8D545698D1D59A9Be90E51 as JSONSchemaValidatorA0A8D545698D1D59A9Be90E51_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ecfe864dc5012ab9c25d23e2ce9f5 import (
-    JSONSchemaValidatorEcfe864Dc5012Ab9C25D23E2Ce9F5 as JSONSchemaValidatorEcfe864Dc5012Ab9C25D23E2Ce9F5_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fe8fb526f9b3b8f3c7aaeebac import (
-    JSONSchemaValidatorFE8Fb526F9B3B8F3C7Aaeebac as JSONSchemaValidatorFE8Fb526F9B3B8F3C7Aaeebac_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d7073129453698264e7519d82991c import (
-    JSONSchemaValidatorD7073129453698264E7519D82991C as JSONSchemaValidatorD7073129453698264E7519D82991C_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f751cc2f55767b34e4c890b3fd36e import (
-    JSONSchemaValidatorF751CC2F55767B34E4C890B3Fd36E as JSONSchemaValidatorF751CC2F55767B34E4C890B3Fd36E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f790a930d452708353c374f5c0f90f import (
-    JSONSchemaValidatorF790A930D452708353C374F5C0F90F as JSONSchemaValidatorF790A930D452708353C374F5C0F90F_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a41ac8d894e5ee98fc9324fb8488174 import (
-    JSONSchemaValidatorA41Ac8D894E5Ee98Fc9324Fb8488174 as JSONSchemaValidatorA41Ac8D894E5Ee98Fc9324Fb8488174_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a544e27e18e5412af3b68d915c8ca50 import (
-    JSONSchemaValidatorA544E27E18E5412Af3B68D915C8Ca50 as JSONSchemaValidatorA544E27E18E5412Af3B68D915C8Ca50_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_af7031cc5ca5b44af0e6454d558412c import (
-    JSONSchemaValidatorAf7031CC5Ca5B44Af0E6454D558412C as JSONSchemaValidatorAf7031CC5Ca5B44Af0E6454D558412C_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b9fbd53af6a5b46b34b17e601680801 import (
-    JSONSchemaValidatorB9Fbd53Af6A5B46B34B17E601680801 as JSONSchemaValidatorB9Fbd53Af6A5B46B34B17E601680801_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d999a1d36ee52babb6b619877dad734 import (
-    JSONSchemaValidatorD999A1D36Ee52BaBb6B619877Dad734 as JSONSchemaValidatorD999A1D36Ee52BaBb6B619877Dad734_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e86b65311b05d29ba5eea0d5f1fd88f import (
-    JSONSchemaValidatorE86B65311B05D29Ba5EEa0D5F1Fd88F as JSONSchemaValidatorE86B65311B05D29Ba5EEa0D5F1Fd88F_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f44ddd3c38c5a9484f5cb4e125447bc import (
-    JSONSchemaValidatorF44Ddd3C38C5A9484F5Cb4E125447Bc as JSONSchemaValidatorF44Ddd3C38C5A9484F5Cb4E125447Bc_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cd16daa50533eb0f5873b7601abb2 import (
-    JSONSchemaValidatorCd16DAa50533EB0F5873B7601Abb2 as JSONSchemaValidatorCd16DAa50533EB0F5873B7601Abb2_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c7266d89581c9601b79b7304fda3 import (
-    JSONSchemaValidatorC7266D89581C9601B79B7304Fda3 as JSONSchemaValidatorC7266D89581C9601B79B7304Fda3_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ce6c2c14553f9a4a88f66a04c21c4 import (
-    JSONSchemaValidatorCe6C2C14553F9A4A88F66A04C21C4 as JSONSchemaValidatorCe6C2C14553F9A4A88F66A04C21C4_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e5bb87a955e33a7ee46f1085fd880 import (
-    JSONSchemaValidatorE5Bb87A955E33A7Ee46F1085Fd880 as JSONSchemaValidatorE5Bb87A955E33A7Ee46F1085Fd880_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d76a951f85a7a927afc2f1ea935c8 import (
-    JSONSchemaValidatorD76A951F85A7A927AFc2F1Ea935C8 as JSONSchemaValidatorD76A951F85A7A927AFc2F1Ea935C8_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ee7664344f50cb8f2c94beaa01629d import (
-    JSONSchemaValidatorEe7664344F50Cb8F2C94Beaa01629D as JSONSchemaValidatorEe7664344F50Cb8F2C94Beaa01629D_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f2c49c69c53e7b4f57f2af9a6f597 import (
-    JSONSchemaValidatorF2C49C69C53E7B4F57F2Af9A6F597 as JSONSchemaValidatorF2C49C69C53E7B4F57F2Af9A6F597_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e1a76c121857a085149e62e56caadd import (
-    JSONSchemaValidatorE1A76C121857A085149E62E56Caadd as JSONSchemaValidatorE1A76C121857A085149E62E56Caadd_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ca2f659b595c0ba7c649fd8c8bdad6 import (
-    JSONSchemaValidatorCa2F659B595C0BA7C649Fd8C8Bdad6 as JSONSchemaValidatorCa2F659B595C0BA7C649Fd8C8Bdad6_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a4dab79d54829548004029a91ba1 import (
-    JSONSchemaValidatorA4DaB79D54829548004029A91Ba1 as JSONSchemaValidatorA4DaB79D54829548004029A91Ba1_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f5a13405ba69f3957b98db8663a import (
-    JSONSchemaValidatorF5A13405Ba69F3957B98Db8663A as JSONSchemaValidatorF5A13405Ba69F3957B98Db8663A_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_6ce35f19bc4c1d058aa01536 import (
-    JSONSchemaValidator6Ce35F19Bc4C1D058Aa01536 as JSONSchemaValidator6Ce35F19Bc4C1D058Aa01536_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b107800544384c1ddad7b60c237 import (
-    JSONSchemaValidatorB107800544384C1Ddad7B60C237 as JSONSchemaValidatorB107800544384C1Ddad7B60C237_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a3954b27e5eeb82789ed231e0557f import (
-    JSONSchemaValidatorA3954B27E5Eeb82789Ed231E0557F as JSONSchemaValidatorA3954B27E5Eeb82789Ed231E0557F_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e3a724a35854758d65a83823c88435 import (
-    JSONSchemaValidatorE3A724A35854758D65A83823C88435 as JSONSchemaValidatorE3A724A35854758D65A83823C88435_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d7b57050bdb98e9340d0bc4dba import (
-    JSONSchemaValidatorD7B57050BdB98E9340D0Bc4Dba as JSONSchemaValidatorD7B57050BdB98E9340D0Bc4Dba_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a2131eae5c1d8e73cd55eebf6a83 import (
-    JSONSchemaValidatorA2131Eae5C1D8E73Cd55Eebf6A83 as JSONSchemaValidatorA2131Eae5C1D8E73Cd55Eebf6A83_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f21b7552158e889b51d0c109c15db import (
-    JSONSchemaValidatorF21B7552158E889B51D0C109C15Db as JSONSchemaValidatorF21B7552158E889B51D0C109C15Db_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f2562a2d8e5ec287738032961762ed import (
-    JSONSchemaValidatorF2562A2D8E5Ec287738032961762Ed as JSONSchemaValidatorF2562A2D8E5Ec287738032961762Ed_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f256e33af7501a8bdae2742ca9f6d6 import (
-    JSONSchemaValidatorF256E33Af7501A8BdaE2742Ca9F6D6 as JSONSchemaValidatorF256E33Af7501A8BdaE2742Ca9F6D6_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b269afaaa855d3291b825f724fc8ea9 import (
-    JSONSchemaValidatorB269AfaAa855D3291B825F724Fc8Ea9 as JSONSchemaValidatorB269AfaAa855D3291B825F724Fc8Ea9_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b3323a24b275402b97c7e9ccfd78c91 import (
-    JSONSchemaValidatorB3323A24B275402B97C7E9Ccfd78C91 as JSONSchemaValidatorB3323A24B275402B97C7E9Ccfd78C91_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bfab2e1d87654afb88c77fcfae4e407 import (
-    JSONSchemaValidatorBfab2E1D87654AfB88C77Fcfae4E407 as JSONSchemaValidatorBfab2E1D87654AfB88C77Fcfae4E407_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ca519342eb25dfcaf15f8f44baf0ee0 import (
-    JSONSchemaValidatorCa519342Eb25DfcAf15F8F44Baf0Ee0 as JSONSchemaValidatorCa519342Eb25DfcAf15F8F44Baf0Ee0_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cc239fa9b185ecbab9e306289850a63 import (
-    JSONSchemaValidatorCc239Fa9B185EcbAb9E306289850A63 as JSONSchemaValidatorCc239Fa9B185EcbAb9E306289850A63_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ccbaf226c685cacac29eb345955f3ad import (
-    JSONSchemaValidatorCcbaf226C685CacAc29Eb345955F3Ad as JSONSchemaValidatorCcbaf226C685CacAc29Eb345955F3Ad_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d1845268faf55f98bc952872259f16f import (
-    JSONSchemaValidatorD1845268Faf55F98Bc952872259F16F as JSONSchemaValidatorD1845268Faf55F98Bc952872259F16F_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d9bd7c527d254ecb63d2b709c428043 import (
-    JSONSchemaValidatorD9Bd7C527D254EcB63D2B709C428043 as JSONSchemaValidatorD9Bd7C527D254EcB63D2B709C428043_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e5e51bcda0b5fec984ba8120f743fe2 import (
-    JSONSchemaValidatorE5E51BcDa0B5Fec984BA8120F743Fe2 as JSONSchemaValidatorE5E51BcDa0B5Fec984BA8120F743Fe2_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_efc2269ee565e23b7be7b49e4fc0322 import (
-    JSONSchemaValidatorEfc2269Ee565E23B7Be7B49E4Fc0322 as JSONSchemaValidatorEfc2269Ee565E23B7Be7B49E4Fc0322_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f77386a48895fa59dcddcc7dd4addb5 import (
-    JSONSchemaValidatorF77386A48895Fa59DcdDcc7Dd4Addb5 as JSONSchemaValidatorF77386A48895Fa59DcdDcc7Dd4Addb5_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ffa347eb411567a9c793696795250a5 import (
-    JSONSchemaValidatorFfa347EB411567A9C793696795250A5 as JSONSchemaValidatorFfa347EB411567A9C793696795250A5_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ffcaccdd9f2530abf66adc98c3f0201 import (
-    JSONSchemaValidatorFfcaccdD9F2530ABf66Adc98C3F0201 as JSONSchemaValidatorFfcaccdD9F2530ABf66Adc98C3F0201_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b9be51e25efc9f41d4f68451f9a6 import (
-    JSONSchemaValidatorB9Be51E25Efc9F41D4F68451F9A6 as JSONSchemaValidatorB9Be51E25Efc9F41D4F68451F9A6_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c765afc72581d862cd61f5139d224 import (
-    JSONSchemaValidatorC765AFc72581D862CD61F5139D224 as JSONSchemaValidatorC765AFc72581D862CD61F5139D224_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bf80823752baba63a8849fd521cd import (
-    JSONSchemaValidatorBf80823752BaBa63A8849Fd521Cd as JSONSchemaValidatorBf80823752BaBa63A8849Fd521Cd_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d833c51c4f5cd2879d3e69f773295c import (
-    JSONSchemaValidatorD833C51C4F5Cd2879D3E69F773295C as JSONSchemaValidatorD833C51C4F5Cd2879D3E69F773295C_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fa310ab095148bdb00d7d3d5e1676 import (
-    JSONSchemaValidatorFa310Ab095148Bdb00D7D3D5E1676 as JSONSchemaValidatorFa310Ab095148Bdb00D7D3D5E1676_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a9136d5513985f15e91a19da66c import (
-    JSONSchemaValidatorA9136D5513985F15E91A19Da66C as JSONSchemaValidatorA9136D5513985F15E91A19Da66C_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b887c55faaca726bbe4ac2564 import (
-    JSONSchemaValidatorB887C55FaAca726Bbe4Ac2564 as JSONSchemaValidatorB887C55FaAca726Bbe4Ac2564_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_438d5b72acb418347ec1e1fa import (
-    JSONSchemaValidator438D5B72Acb418347Ec1E1Fa as JSONSchemaValidator438D5B72Acb418347Ec1E1Fa_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f90ae8599c8a21c98b7a1ca804 import (
-    JSONSchemaValidatorF90Ae8599C8A21C98B7A1Ca804 as JSONSchemaValidatorF90Ae8599C8A21C98B7A1Ca804_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a94058a99acaaf8eb73c9227 import (
-    JSONSchemaValidatorA94058A99AcaAf8Eb73C9227 as JSONSchemaValidatorA94058A99AcaAf8Eb73C9227_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cfb1d6e52878d057740de275896 import (
-    JSONSchemaValidatorCfb1D6E52878D057740De275896 as JSONSchemaValidatorCfb1D6E52878D057740De275896_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a4829a44597bbf9813664eb75de0 import (
-    JSONSchemaValidatorA4829A44597BBf9813664Eb75De0 as JSONSchemaValidatorA4829A44597BBf9813664Eb75De0_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bdc981805b5fad0a038966d52558 import (
-    JSONSchemaValidatorBdc981805B5FAd0A038966D52558 as JSONSchemaValidatorBdc981805B5FAd0A038966D52558_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_df9908ad265e83ab77d73803925678 import (
-    JSONSchemaValidatorDf9908Ad265E83Ab77D73803925678 as JSONSchemaValidatorDf9908Ad265E83Ab77D73803925678_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e37e7d81575d35a974df797e0a2268 import (
-    JSONSchemaValidatorE37E7D81575D35A974Df797E0A2268 as JSONSchemaValidatorE37E7D81575D35A974Df797E0A2268_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a924f763a15125a8d5beaa6dd6fa2c import (
-    JSONSchemaValidatorA924F763A15125A8D5Beaa6Dd6Fa2C as JSONSchemaValidatorA924F763A15125A8D5Beaa6Dd6Fa2C_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_de4c9b685250dfa8556ab1ec20407c import (
-    JSONSchemaValidatorDe4C9B685250DfA8556Ab1Ec20407C as JSONSchemaValidatorDe4C9B685250DfA8556Ab1Ec20407C_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a15a2f83f975a6a9964e7da79a605de import (
-    JSONSchemaValidatorA15A2F83F975A6A9964E7Da79A605De as JSONSchemaValidatorA15A2F83F975A6A9964E7Da79A605De_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a3a1bf404bf5772828f66f1e10f074d import (
-    JSONSchemaValidatorA3A1Bf404Bf5772828F66F1E10F074D as JSONSchemaValidatorA3A1Bf404Bf5772828F66F1E10F074D_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a7283357c1657bf8ccb3d32a96249d4 import (
-    JSONSchemaValidatorA7283357C1657Bf8Ccb3D32A96249D4 as JSONSchemaValidatorA7283357C1657Bf8Ccb3D32A96249D4_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b4635c45c3b5e44a30d84daa1d5fb69 import (
-    JSONSchemaValidatorB4635C45C3B5E44A30D84Daa1D5Fb69 as JSONSchemaValidatorB4635C45C3B5E44A30D84Daa1D5Fb69_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b60f9f312235959812d49dc4c469e83 import (
-    JSONSchemaValidatorB60F9F312235959812D49Dc4C469E83 as JSONSchemaValidatorB60F9F312235959812D49Dc4C469E83_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bb01b6bd31b53bfb12bbe327320392e import (
-    JSONSchemaValidatorBb01B6BD31B53BfB12BBe327320392E as JSONSchemaValidatorBb01B6BD31B53BfB12BBe327320392E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c224ae3007d5486bbc5abb1f88e95e6 import (
-    JSONSchemaValidatorC224Ae3007D5486Bbc5Abb1F88E95E6 as JSONSchemaValidatorC224Ae3007D5486Bbc5Abb1F88E95E6_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d9ed5bba1155b9c8fe132640832f94e import (
-    JSONSchemaValidatorD9Ed5BbA1155B9C8Fe132640832F94E as JSONSchemaValidatorD9Ed5BbA1155B9C8Fe132640832F94E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d9f276a532e5eeb86bb591f8537fcc7 import (
-    JSONSchemaValidatorD9F276A532E5Eeb86Bb591F8537Fcc7 as JSONSchemaValidatorD9F276A532E5Eeb86Bb591F8537Fcc7_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e69d02d71905aecbd10b782469efbda import (
-    JSONSchemaValidatorE69D02D71905AecBd10B782469Efbda as JSONSchemaValidatorE69D02D71905AecBd10B782469Efbda_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e722e05046d5262b55c125237e9b67d import (
-    JSONSchemaValidatorE722E05046D5262B55C125237E9B67D as JSONSchemaValidatorE722E05046D5262B55C125237E9B67D_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e9c39175d785a0eb9d6f402f378a2ba import (
-    JSONSchemaValidatorE9C39175D785A0EB9D6F402F378A2Ba as JSONSchemaValidatorE9C39175D785A0EB9D6F402F378A2Ba_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d77719c37558f694e5545a21406275 import (
-    JSONSchemaValidatorD77719C37558F694E5545A21406275 as JSONSchemaValidatorD77719C37558F694E5545A21406275_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d9a13d575abdc26d485af708e7 import (
-    JSONSchemaValidatorD9A13D575ABdc26D485Af708E7 as JSONSchemaValidatorD9A13D575ABdc26D485Af708E7_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c7315d78a2ddda76b62777e8 import (
-    JSONSchemaValidatorC7315D78A2DdDa76B62777E8 as JSONSchemaValidatorC7315D78A2DdDa76B62777E8_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c279ba052250d883ef87775a415089 import (
-    JSONSchemaValidatorC279Ba052250D883Ef87775A415089 as JSONSchemaValidatorC279Ba052250D883Ef87775A415089_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_af893464e53d2abc8922f4f3310ea import (
-    JSONSchemaValidatorAf893464E53D2Abc8922F4F3310Ea as JSONSchemaValidatorAf893464E53D2Abc8922F4F3310Ea_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d2bd5f05bd535a89ebadb30e2ede9e import (
-    JSONSchemaValidatorD2Bd5F05Bd535A89EbAdb30E2Ede9E as JSONSchemaValidatorD2Bd5F05Bd535A89EbAdb30E2Ede9E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f33d768d01586c9133b155da5e5ade import (
-    JSONSchemaValidatorF33D768D01586C9133B155Da5E5Ade as JSONSchemaValidatorF33D768D01586C9133B155Da5E5Ade_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f624469d5e448e9eba137fe533e8 import (
-    JSONSchemaValidatorF624469D5E448E9EBa137Fe533E8 as JSONSchemaValidatorF624469D5E448E9EBa137Fe533E8_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d2ece28b509b8ef80b2b8c5c5f36 import (
-    JSONSchemaValidatorD2EcE28B509B8Ef80B2B8C5C5F36 as JSONSchemaValidatorD2EcE28B509B8Ef80B2B8C5C5F36_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e31c795964b3bdf85da1b5a2a5 import (
-    JSONSchemaValidatorE31C795964B3BdF85Da1B5A2A5 as JSONSchemaValidatorE31C795964B3BdF85Da1B5A2A5_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_dabd13cd5e9c928daf80d6758d62 import (
-    JSONSchemaValidatorDabd13Cd5E9C928DAf80D6758D62 as JSONSchemaValidatorDabd13Cd5E9C928DAf80D6758D62_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b46a141650debf5946262e8a0961 import (
-    JSONSchemaValidatorB46A141650DeBf5946262E8A0961 as JSONSchemaValidatorB46A141650DeBf5946262E8A0961_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b8699619f95a24bd2d81f12f048235 import (
-    JSONSchemaValidatorB8699619F95A24Bd2D81F12F048235 as JSONSchemaValidatorB8699619F95A24Bd2D81F12F048235_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c00df3623b5a74ad41e75487ed9b77 import (
-    JSONSchemaValidatorC00Df3623B5A74Ad41E75487Ed9B77 as JSONSchemaValidatorC00Df3623B5A74Ad41E75487Ed9B77_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cf0138550909ea413dab063868c import (
-    JSONSchemaValidatorCf0138550909Ea413Dab063868C as JSONSchemaValidatorCf0138550909Ea413Dab063868C_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a64bd4956649de3a61e10f0637e import (
-    JSONSchemaValidatorA64Bd4956649De3A61E10F0637E as JSONSchemaValidatorA64Bd4956649De3A61E10F0637E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bc1f37a9f2571fa4d7bc85b9e8a583 import (
-    JSONSchemaValidatorBc1F37A9F2571FA4D7Bc85B9E8A583 as JSONSchemaValidatorBc1F37A9F2571FA4D7Bc85B9E8A583_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e70de44247549f9e49cfa5c6b24de9 import (
-    JSONSchemaValidatorE70De44247549F9E49Cfa5C6B24De9 as JSONSchemaValidatorE70De44247549F9E49Cfa5C6B24De9_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a88c7510a15578b8eb2df183a92d5d import (
-    JSONSchemaValidatorA88C7510A15578B8Eb2Df183A92D5D as JSONSchemaValidatorA88C7510A15578B8Eb2Df183A92D5D_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_febb2149ac5f8ba25dbf4d9a862d94 import (
-    JSONSchemaValidatorFebb2149Ac5F8BA25DBf4D9A862D94 as JSONSchemaValidatorFebb2149Ac5F8BA25DBf4D9A862D94_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cad522e57a7b96b7238935689ed import (
-    JSONSchemaValidatorCad522E57A7B96B7238935689Ed as JSONSchemaValidatorCad522E57A7B96B7238935689Ed_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e702d5786552992aa76b930780569 import (
-    JSONSchemaValidatorE702D5786552992Aa76B930780569 as JSONSchemaValidatorE702D5786552992Aa76B930780569_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cb98464ddb5ee9ba7ebb4428443ba9 import (
-    JSONSchemaValidatorCb98464Ddb5Ee9Ba7EBb4428443Ba9 as JSONSchemaValidatorCb98464Ddb5Ee9Ba7EBb4428443Ba9_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d292147221524a96616d982b0147c0 import (
-    JSONSchemaValidatorD292147221524A96616D982B0147C0 as JSONSchemaValidatorD292147221524A96616D982B0147C0_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_af29516f0c8591da2a92523b5ab3386 import (
-    JSONSchemaValidatorAf29516F0C8591DA2A92523B5Ab3386 as JSONSchemaValidatorAf29516F0C8591DA2A92523B5Ab3386_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bc9716ed6eb5c6e9ecb0380501d6138 import (
-    JSONSchemaValidatorBc9716ED6Eb5C6E9Ecb0380501D6138 as JSONSchemaValidatorBc9716ED6Eb5C6E9Ecb0380501D6138_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_caeb723a074519498c6b08a1c9dacb3 import (
-    JSONSchemaValidatorCaeb723A074519498C6B08A1C9Dacb3 as JSONSchemaValidatorCaeb723A074519498C6B08A1C9Dacb3_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_de92f8ae3c15ea0bad5562452eb5c40 import (
-    JSONSchemaValidatorDe92F8AE3C15Ea0Bad5562452Eb5C40 as JSONSchemaValidatorDe92F8AE3C15Ea0Bad5562452Eb5C40_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f09c94c65c858e4b7be0b7cb3d25b7a import (
-    JSONSchemaValidatorF09C94C65C858E4B7Be0B7Cb3D25B7A as JSONSchemaValidatorF09C94C65C858E4B7Be0B7Cb3D25B7A_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f25c825ca6e58a5b1c2294b11558e7b import (
-    JSONSchemaValidatorF25C825Ca6E58A5B1C2294B11558E7B as JSONSchemaValidatorF25C825Ca6E58A5B1C2294B11558E7B_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c6506b22335101a465d2adf5ca7f37 import (
-    JSONSchemaValidatorC6506B22335101A465D2Adf5Ca7F37 as JSONSchemaValidatorC6506B22335101A465D2Adf5Ca7F37_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e0ed6b9a530ea05d77a199ded4e3 import (
-    JSONSchemaValidatorE0Ed6B9A530EA05D77A199Ded4E3 as JSONSchemaValidatorE0Ed6B9A530EA05D77A199Ded4E3_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a2be6dde4c587389e79d6cb84e54a6 import (
-    JSONSchemaValidatorA2Be6DDe4C587389E79D6Cb84E54A6 as JSONSchemaValidatorA2Be6DDe4C587389E79D6Cb84E54A6_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ad0cb5a12a76384ba4644e55e import (
-    JSONSchemaValidatorAD0Cb5A12A76384Ba4644E55E as JSONSchemaValidatorAD0Cb5A12A76384Ba4644E55E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fdd2af215b9b8327a3e24a3dea89 import (
-    JSONSchemaValidatorFdd2Af215B9B8327A3E24A3Dea89 as JSONSchemaValidatorFdd2Af215B9B8327A3E24A3Dea89_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f71d0b2527b8cd13123f9a68cf3 import (
-    JSONSchemaValidatorF71D0B2527B8Cd13123F9A68Cf3 as JSONSchemaValidatorF71D0B2527B8Cd13123F9A68Cf3_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fee1860b4d509585956565df54a91a import (
-    JSONSchemaValidatorFee1860B4D509585956565Df54A91A as JSONSchemaValidatorFee1860B4D509585956565Df54A91A_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_dfe3872e591f9f3e2a0daa358c1a import (
-    JSONSchemaValidatorDfe3872E591F9F3E2A0Daa358C1A as JSONSchemaValidatorDfe3872E591F9F3E2A0Daa358C1A_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b42a01655325be161ab2ad60aa68 import (
-    JSONSchemaValidatorB42A01655325Be161Ab2Ad60Aa68 as JSONSchemaValidatorB42A01655325Be161Ab2Ad60Aa68_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fe62979a925778bdb0a974a7d86a12 import (
-    JSONSchemaValidatorFe62979A925778Bdb0A974A7D86A12 as JSONSchemaValidatorFe62979A925778Bdb0A974A7D86A12_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b67ad5d41a330c4bdc9f7159f import (
-    JSONSchemaValidatorB67Ad5D41A330C4Bdc9F7159F as JSONSchemaValidatorB67Ad5D41A330C4Bdc9F7159F_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a602eee5a56faa64436bade8a240e import (
-    JSONSchemaValidatorA602EEe5A56FaA64436Bade8A240E as JSONSchemaValidatorA602EEe5A56FaA64436Bade8A240E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e6ea8c5d425cf9ac77006f5593725f import (
-    JSONSchemaValidatorE6Ea8C5D425Cf9Ac77006F5593725F as JSONSchemaValidatorE6Ea8C5D425Cf9Ac77006F5593725F_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bcb1d489d735258975828f845df1769 import (
-    JSONSchemaValidatorBcb1D489D735258975828F845Df1769 as JSONSchemaValidatorBcb1D489D735258975828F845Df1769_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bd5b507f58a50aab614e3d7409eec4c import (
-    JSONSchemaValidatorBd5B507F58A50AaB614E3D7409Eec4C as JSONSchemaValidatorBd5B507F58A50AaB614E3D7409Eec4C_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_db690b800995e35bc4e8c43d8ea6c18 import (
-    JSONSchemaValidatorDb690B800995E35Bc4E8C43D8Ea6C18 as JSONSchemaValidatorDb690B800995E35Bc4E8C43D8Ea6C18_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e235d44e4485bafa4499f5a8e53bcd3 import (
-    JSONSchemaValidatorE235D44E4485BafA4499F5A8E53Bcd3 as JSONSchemaValidatorE235D44E4485BafA4499F5A8E53Bcd3_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e4f91ea42515ccdbc24549b84ca1e90 import (
-    JSONSchemaValidatorE4F91Ea42515CcdBc24549B84Ca1E90 as JSONSchemaValidatorE4F91Ea42515CcdBc24549B84Ca1E90_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_efa7f7a97b95f5885a00e6981b27b11 import (
-    JSONSchemaValidatorEfa7F7A97B95F5885A00E6981B27B11 as JSONSchemaValidatorEfa7F7A97B95F5885A00E6981B27B11_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f5d13316c8f53a0b78d881c738a15c6 import (
-    JSONSchemaValidatorF5D13316C8F53A0B78D881C738A15C6 as JSONSchemaValidatorF5D13316C8F53A0B78D881C738A15C6_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f829d3e99565937b9d12c873f8faa46 import (
-    JSONSchemaValidatorF829D3E99565937B9D12C873F8Faa46 as JSONSchemaValidatorF829D3E99565937B9D12C873F8Faa46_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f8db651a7bb5f85a936c9fdadf3a9d9 import (
-    JSONSchemaValidatorF8Db651A7Bb5F85A936C9Fdadf3A9D9 as JSONSchemaValidatorF8Db651A7Bb5F85A936C9Fdadf3A9D9_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bbf7ce025bc2a291b90c37a6b898 import (
-    JSONSchemaValidatorBbf7Ce025Bc2A291B90C37A6B898 as JSONSchemaValidatorBbf7Ce025Bc2A291B90C37A6B898_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_effb55c158f28469762804e84633 import (
-    JSONSchemaValidatorEffb55C158F28469762804E84633 as JSONSchemaValidatorEffb55C158F28469762804E84633_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fa2127b55124a3a00b2991b77db6 import (
-    JSONSchemaValidatorFa2127B55124A3A00B2991B77Db6 as JSONSchemaValidatorFa2127B55124A3A00B2991B77Db6_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b8a44ba454de8a7bb52d3efe97ca import (
-    JSONSchemaValidatorB8A44Ba454De8A7BB52D3Efe97Ca as JSONSchemaValidatorB8A44Ba454De8A7BB52D3Efe97Ca_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e0b654c39dc6e19cd6f5194d import (
-    JSONSchemaValidatorE0B654C39Dc6E19Cd6F5194D as JSONSchemaValidatorE0B654C39Dc6E19Cd6F5194D_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b3ff5f865f1c8122a0ec8ca73921 import (
-    JSONSchemaValidatorB3Ff5F865F1C8122A0Ec8Ca73921 as JSONSchemaValidatorB3Ff5F865F1C8122A0Ec8Ca73921_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_de1b75d59b083df0ece12259ecd import (
-    JSONSchemaValidatorDe1B75D59B083Df0Ece12259Ecd as JSONSchemaValidatorDe1B75D59B083Df0Ece12259Ecd_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fc95c917352ad8410ffe6d6e522ed import (
-    JSONSchemaValidatorFc95C917352Ad8410Ffe6D6E522Ed as JSONSchemaValidatorFc95C917352Ad8410Ffe6D6E522Ed_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ae7f02a3d051f2baf7cc087990d658 import (
-    JSONSchemaValidatorAe7F02A3D051F2Baf7Cc087990D658 as JSONSchemaValidatorAe7F02A3D051F2Baf7Cc087990D658_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c0204c665262a712caef988d7d88 import (
-    JSONSchemaValidatorC0204C665262A712Caef988D7D88 as JSONSchemaValidatorC0204C665262A712Caef988D7D88_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f50f8c552f5d2eb68d715e1318976e import (
-    JSONSchemaValidatorF50F8C552F5D2EB68D715E1318976E as JSONSchemaValidatorF50F8C552F5D2EB68D715E1318976E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d9227adc5f02b7cd264af7255d19 import (
-    JSONSchemaValidatorD9227Adc5F02B7Cd264Af7255D19 as JSONSchemaValidatorD9227Adc5F02B7Cd264Af7255D19_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_de4a255bc6849a7c9cec69f13c import (
-    JSONSchemaValidatorDe4A255Bc6849A7C9Cec69F13C as JSONSchemaValidatorDe4A255Bc6849A7C9Cec69F13C_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e6ec627d3c587288978990aae75228 import (
-    JSONSchemaValidatorE6Ec627D3C587288978990Aae75228 as JSONSchemaValidatorE6Ec627D3C587288978990Aae75228_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d58baa26bd5a6d9c461592c872d515 import (
-    JSONSchemaValidatorD58Baa26Bd5A6D9C461592C872D515 as JSONSchemaValidatorD58Baa26Bd5A6D9C461592C872D515_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_eb1227bb250799b6ca76ed4bee9d9 import (
-    JSONSchemaValidatorEb1227Bb250799B6CA76Ed4Bee9D9 as JSONSchemaValidatorEb1227Bb250799B6CA76Ed4Bee9D9_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c380301e3e05423bdc1857ff00ae77a import (
-    JSONSchemaValidatorC380301E3E05423Bdc1857Ff00Ae77A as JSONSchemaValidatorC380301E3E05423Bdc1857Ff00Ae77A_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c8354b61a36524cbb2e1037bd814807 import (
-    JSONSchemaValidatorC8354B61A36524CBb2E1037Bd814807 as JSONSchemaValidatorC8354B61A36524CBb2E1037Bd814807_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f1debbfd4775faba3779c513181dfbf import (
-    JSONSchemaValidatorF1DebbfD4775FabA3779C513181Dfbf as JSONSchemaValidatorF1DebbfD4775FabA3779C513181Dfbf_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f24f6c07641580ba6ed710e92c2da16 import (
-    JSONSchemaValidatorF24F6C07641580BA6Ed710E92C2Da16 as JSONSchemaValidatorF24F6C07641580BA6Ed710E92C2Da16_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f4ce55b5f235924903516ef31dc9e3c import (
-    JSONSchemaValidatorF4Ce55B5F235924903516Ef31Dc9E3C as JSONSchemaValidatorF4Ce55B5F235924903516Ef31Dc9E3C_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f75156ff30d50d1bced4ec466b56b38 import (
-    JSONSchemaValidatorF75156FF30D50D1Bced4Ec466B56B38 as JSONSchemaValidatorF75156FF30D50D1Bced4Ec466B56B38_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fcc151af7615a84adf48b714d146192 import (
-    JSONSchemaValidatorFcc151AF7615A84Adf48B714D146192 as JSONSchemaValidatorFcc151AF7615A84Adf48B714D146192_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fccc089e04b557aa7478de3d8fe472f import (
-    JSONSchemaValidatorFccc089E04B557AA7478De3D8Fe472F as JSONSchemaValidatorFccc089E04B557AA7478De3D8Fe472F_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fe3ec7651e79d891fce37a0d860 import (
-    JSONSchemaValidatorFe3Ec7651E79D891Fce37A0D860 as JSONSchemaValidatorFe3Ec7651E79D891Fce37A0D860_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b07f187b7456c8bbb6088a2f24dcee import (
-    JSONSchemaValidatorB07F187B7456C8Bbb6088A2F24Dcee as JSONSchemaValidatorB07F187B7456C8Bbb6088A2F24Dcee_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cb7563a5058c4801eb842a74ff61c import (
-    JSONSchemaValidatorCb7563A5058C4801EB842A74Ff61C as JSONSchemaValidatorCb7563A5058C4801EB842A74Ff61C_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c10072541e94bd16f1aebffe32 import (
-    JSONSchemaValidatorC10072541E94Bd16F1Aebffe32 as JSONSchemaValidatorC10072541E94Bd16F1Aebffe32_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a18e761ac8592e9a5c4e0bb2308cf0 import (
-    JSONSchemaValidatorA18E761Ac8592E9A5C4E0Bb2308Cf0 as JSONSchemaValidatorA18E761Ac8592E9A5C4E0Bb2308Cf0_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a31cc19195d43ba695f4b7494b559 import (
-    JSONSchemaValidatorA31Cc19195D43Ba695F4B7494B559 as JSONSchemaValidatorA31Cc19195D43Ba695F4B7494B559_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_edc44e0e7a513191cc16dc2b4da88e import (
-    JSONSchemaValidatorEdc44E0E7A513191Cc16Dc2B4Da88E as JSONSchemaValidatorEdc44E0E7A513191Cc16Dc2B4Da88E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a25f176554fb407fbe4952f1c4e import (
-    JSONSchemaValidatorA25F176554FB407Fbe4952F1C4E as JSONSchemaValidatorA25F176554FB407Fbe4952F1C4E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d39d23589e85db0a63c414057c import (
-    JSONSchemaValidatorD39D23589E85Db0A63C414057C as JSONSchemaValidatorD39D23589E85Db0A63C414057C_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c45c1c55d498d03a72933690098 import (
-    JSONSchemaValidatorC45C1C55D498D03A72933690098 as JSONSchemaValidatorC45C1C55D498D03A72933690098_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a9f5796226051218eac559ab5211384 import (
-    JSONSchemaValidatorA9F5796226051218Eac559Ab5211384 as JSONSchemaValidatorA9F5796226051218Eac559Ab5211384_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c4befbd77a452a9b7873ffc360a1f20 import (
-    JSONSchemaValidatorC4Befbd77A452A9B7873Ffc360A1F20 as JSONSchemaValidatorC4Befbd77A452A9B7873Ffc360A1F20_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c8d11fb9fc752ab8bb8e2b1413ccc92 import (
-    JSONSchemaValidatorC8D11Fb9Fc752Ab8Bb8E2B1413Ccc92 as JSONSchemaValidatorC8D11Fb9Fc752Ab8Bb8E2B1413Ccc92_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ccd75f80ece59f08cadda085402cef5 import (
-    JSONSchemaValidatorCcd75F80Ece59F08CadDa085402Cef5 as JSONSchemaValidatorCcd75F80Ece59F08CadDa085402Cef5_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d82755e5e03510daf0951c1f42c2702 import (
-    JSONSchemaValidatorD82755E5E03510DAf0951C1F42C2702 as JSONSchemaValidatorD82755E5E03510DAf0951C1F42C2702_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e0bd567c1395531a7f18ab4e14110bd import (
-    JSONSchemaValidatorE0Bd567C1395531A7F18Ab4E14110Bd as JSONSchemaValidatorE0Bd567C1395531A7F18Ab4E14110Bd_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e4f57e8f06856ee9a7e490d01f7f692 import (
-    JSONSchemaValidatorE4F57E8F06856Ee9A7E490D01F7F692 as JSONSchemaValidatorE4F57E8F06856Ee9A7E490D01F7F692_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_eb3b18894545315b25b94d0c0e2ec67 import (
-    JSONSchemaValidatorEb3B18894545315B25B94D0C0E2Ec67 as JSONSchemaValidatorEb3B18894545315B25B94D0C0E2Ec67_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_eca62ef076b5627a85b2a5959613fb8 import (
-    JSONSchemaValidatorEca62Ef076B5627A85B2A5959613Fb8 as JSONSchemaValidatorEca62Ef076B5627A85B2A5959613Fb8_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ed96d98063c5be9aa0005772dc95fc5 import (
-    JSONSchemaValidatorEd96D98063C5Be9Aa0005772Dc95Fc5 as JSONSchemaValidatorEd96D98063C5Be9Aa0005772Dc95Fc5_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f486694f3da57b4921b7f2036a1b754 import (
-    JSONSchemaValidatorF486694F3Da57B4921B7F2036A1B754 as JSONSchemaValidatorF486694F3Da57B4921B7F2036A1B754_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f6536a8f01d5863856a0a8308198e15 import (
-    JSONSchemaValidatorF6536A8F01D5863856A0A8308198E15 as JSONSchemaValidatorF6536A8F01D5863856A0A8308198E15_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f7dd6a6cf8d57499168aae05847ad34 import (
-    JSONSchemaValidatorF7Dd6A6Cf8D57499168Aae05847Ad34 as JSONSchemaValidatorF7Dd6A6Cf8D57499168Aae05847Ad34_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fb433ea1bbc5dc49dce4fde0a04e5ed import (
-    JSONSchemaValidatorFb433Ea1Bbc5Dc49Dce4Fde0A04E5Ed as JSONSchemaValidatorFb433Ea1Bbc5Dc49Dce4Fde0A04E5Ed_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fdd36dd2454547096bb65df3755710f import (
-    JSONSchemaValidatorFdd36Dd2454547096Bb65Df3755710F as JSONSchemaValidatorFdd36Dd2454547096Bb65Df3755710F_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cec6c85d9bb4bcc8f61f31296b import (
-    JSONSchemaValidatorCeC6C85D9BB4BcC8F61F31296B as JSONSchemaValidatorCeC6C85D9BB4BcC8F61F31296B_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f7cf4f24d54c6944a31ed308f8361 import (
-    JSONSchemaValidatorF7Cf4F24D54C6944A31Ed308F8361 as JSONSchemaValidatorF7Cf4F24D54C6944A31Ed308F8361_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e9c5c3e5515a2e1b2cdee6928ab import (
-    JSONSchemaValidatorE9C5C3E5515A2E1B2Cdee6928Ab as JSONSchemaValidatorE9C5C3E5515A2E1B2Cdee6928Ab_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d73cd5be487a36d0a01d6cdc3 import (
-    JSONSchemaValidatorD73Cd5Be487A36D0A01D6Cdc3 as JSONSchemaValidatorD73Cd5Be487A36D0A01D6Cdc3_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_db7b6c4f0542aab9fe7cf5c995f83 import (
-    JSONSchemaValidatorDb7B6C4F0542AAb9FE7Cf5C995F83 as JSONSchemaValidatorDb7B6C4F0542AAb9FE7Cf5C995F83_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c536ac5a318629fc3d6b3dc236 import (
-    JSONSchemaValidatorC536Ac5A318629Fc3D6B3Dc236 as JSONSchemaValidatorC536Ac5A318629Fc3D6B3Dc236_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_493a5d8cab239b9d2d0b49ce import (
-    JSONSchemaValidator493A5D8CAb239B9D2D0B49Ce as JSONSchemaValidator493A5D8CAb239B9D2D0B49Ce_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d7161b33157dba957ba18eda440c2 import (
-    JSONSchemaValidatorD7161B33157DbA957Ba18Eda440C2 as JSONSchemaValidatorD7161B33157DbA957Ba18Eda440C2_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f5ebb9d50aab287f320d32181c0 import (
-    JSONSchemaValidatorF5EBb9D50AaB287F320D32181C0 as JSONSchemaValidatorF5EBb9D50AaB287F320D32181C0_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_aba18f6e605ce28a112b34dcb4fe82 import (
-    JSONSchemaValidatorAba18F6E605Ce28A112B34Dcb4Fe82 as JSONSchemaValidatorAba18F6E605Ce28A112B34Dcb4Fe82_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fa27ccbaf55711849381a707e1edfa import (
-    JSONSchemaValidatorFa27CcBaf55711849381A707E1Edfa as JSONSchemaValidatorFa27CcBaf55711849381A707E1Edfa_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f04b76067507b9384e409e9431ef3 import (
-    JSONSchemaValidatorF04B76067507B9384E409E9431Ef3 as JSONSchemaValidatorF04B76067507B9384E409E9431Ef3_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b7ae9494b05a57bf6393eaf308b1e7 import (
-    JSONSchemaValidatorB7Ae9494B05A57Bf6393Eaf308B1E7 as JSONSchemaValidatorB7Ae9494B05A57Bf6393Eaf308B1E7_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f24a5ad5bf03fe236dd96dcb import (
-    JSONSchemaValidatorF24A5Ad5Bf03Fe236Dd96Dcb as JSONSchemaValidatorF24A5Ad5Bf03Fe236Dd96Dcb_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b6581534bb321eaea272365b7 import (
-    JSONSchemaValidatorB6581534BB321Eaea272365B7 as JSONSchemaValidatorB6581534BB321Eaea272365B7_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b33956f3e56c6b8d234e7ed6a20e6 import (
-    JSONSchemaValidatorB33956F3E56C6B8D234E7Ed6A20E6 as JSONSchemaValidatorB33956F3E56C6B8D234E7Ed6A20E6_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cc59d48f8159008f52b29e08738811 import (
-    JSONSchemaValidatorCc59D48F8159008F52B29E08738811 as JSONSchemaValidatorCc59D48F8159008F52B29E08738811_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bfca373c5d7c863eef14abc654fd import (
-    JSONSchemaValidatorBfca373C5D7C863EEf14Abc654Fd as JSONSchemaValidatorBfca373C5D7C863EEf14Abc654Fd_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d1608b2751c883a072ee3fb80228 import (
-    JSONSchemaValidatorD1608B2751C883A072Ee3Fb80228 as JSONSchemaValidatorD1608B2751C883A072Ee3Fb80228_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_eea0014365ef78d30d9ba8f1752e8 import (
-    JSONSchemaValidatorEea0014365Ef78D30D9Ba8F1752E8 as JSONSchemaValidatorEea0014365Ef78D30D9Ba8F1752E8_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e73b352ff2573aab906c2ad75c5a71 import (
-    JSONSchemaValidatorE73B352Ff2573AAb906C2Ad75C5A71 as JSONSchemaValidatorE73B352Ff2573AAb906C2Ad75C5A71_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ac98aec39c95c2d97532514ee9b9f3e import (
-    JSONSchemaValidatorAc98Aec39C95C2D97532514Ee9B9F3E as JSONSchemaValidatorAc98Aec39C95C2D97532514Ee9B9F3E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ba9e0f3a5db5972a55d4b3fcf2b5432 import (
-    JSONSchemaValidatorBa9E0F3A5Db5972A55D4B3Fcf2B5432 as JSONSchemaValidatorBa9E0F3A5Db5972A55D4B3Fcf2B5432_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bd421c1db8c5deaa3301b8cc73dd541 import (
-    JSONSchemaValidatorBd421C1Db8C5DeaA3301B8Cc73Dd541 as JSONSchemaValidatorBd421C1Db8C5DeaA3301B8Cc73Dd541_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_be8cdb967555fcca03a4c1f796eee56 import (
-    JSONSchemaValidatorBe8Cdb967555FccA03A4C1F796Eee56 as JSONSchemaValidatorBe8Cdb967555FccA03A4C1F796Eee56_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c9d3ba6208e5d6eb45fa5c9b8f7e327 import (
-    JSONSchemaValidatorC9D3Ba6208E5D6EB45FA5C9B8F7E327 as JSONSchemaValidatorC9D3Ba6208E5D6EB45FA5C9B8F7E327_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cba0eecfc555390935cebd13e6bcb90 import (
-    JSONSchemaValidatorCba0EecFc555390935CEbd13E6Bcb90 as JSONSchemaValidatorCba0EecFc555390935CEbd13E6Bcb90_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d54c40ecb5f531cb5a78d0cd5dd585e import (
-    JSONSchemaValidatorD54C40ECb5F531CB5A78D0Cd5Dd585E as JSONSchemaValidatorD54C40ECb5F531CB5A78D0Cd5Dd585E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_dbea7d7de125cf6b840d5032d3a5c59 import (
-    JSONSchemaValidatorDbea7D7De125Cf6B840D5032D3A5C59 as JSONSchemaValidatorDbea7D7De125Cf6B840D5032D3A5C59_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e8911ba7a8b54be8e443df8ac842e36 import (
-    JSONSchemaValidatorE8911Ba7A8B54Be8E443Df8Ac842E36 as JSONSchemaValidatorE8911Ba7A8B54Be8E443Df8Ac842E36_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f019a24c5ce50f082d081bb72ff4df9 import (
-    JSONSchemaValidatorF019A24C5Ce50F082D081Bb72Ff4Df9 as JSONSchemaValidatorF019A24C5Ce50F082D081Bb72Ff4Df9_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f2b137487385de6925b7b6136d4b027 import (
-    JSONSchemaValidatorF2B137487385De6925B7B6136D4B027 as JSONSchemaValidatorF2B137487385De6925B7B6136D4B027_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f5645e6e819558fa08761dee45ca406 import (
-    JSONSchemaValidatorF5645E6E819558FA08761Dee45Ca406 as JSONSchemaValidatorF5645E6E819558FA08761Dee45Ca406_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fe06867e548bba1919024b40d992 import (
-    JSONSchemaValidatorFe06867E548BBa1919024B40D992 as JSONSchemaValidatorFe06867E548BBa1919024B40D992_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_efa92557c9a6c8af0a71829c7e import (
-    JSONSchemaValidatorEfA92557C9A6C8Af0A71829C7E as JSONSchemaValidatorEfA92557C9A6C8Af0A71829C7E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e55cca88065707a6f812a679f69a5d import (
-    JSONSchemaValidatorE55Cca88065707A6F812A679F69A5D as JSONSchemaValidatorE55Cca88065707A6F812A679F69A5D_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ecc3258a5c5b8f2267a512820a59 import (
-    JSONSchemaValidatorEcc3258A5C5B8F2267A512820A59 as JSONSchemaValidatorEcc3258A5C5B8F2267A512820A59_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f5602b2965e53b5bdda193025a3fc import (
-    JSONSchemaValidatorF5602B2965E53B5BdDa193025A3Fc as JSONSchemaValidatorF5602B2965E53B5BdDa193025A3Fc_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e6bca55256a0aac288486e38049b import (
-    JSONSchemaValidatorE6BcA55256A0Aac288486E38049B as JSONSchemaValidatorE6BcA55256A0Aac288486E38049B_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ba98ed72975099b39dd2dc4cb65ed8 import (
-    JSONSchemaValidatorBa98Ed72975099B39DD2Dc4Cb65Ed8 as JSONSchemaValidatorBa98Ed72975099B39DD2Dc4Cb65Ed8_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ef28900485c4e9842b4a68e483d4e import (
-    JSONSchemaValidatorEf28900485C4E9842B4A68E483D4E as JSONSchemaValidatorEf28900485C4E9842B4A68E483D4E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ea8d75a9d8d9e6882da4a4a91 import (
-    JSONSchemaValidatorEA8D75A9D8D9E6882Da4A4A91 as JSONSchemaValidatorEA8D75A9D8D9E6882Da4A4A91_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c49a8488cd52158790aac513e7184a import (
-    JSONSchemaValidatorC49A8488Cd52158790Aac513E7184A as JSONSchemaValidatorC49A8488Cd52158790Aac513E7184A_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ae57085565e551594fc05b4db6a64af import (
-    JSONSchemaValidatorAe57085565E551594Fc05B4Db6A64Af as JSONSchemaValidatorAe57085565E551594Fc05B4Db6A64Af_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bb1653037ca558a8c6097e20b99b4b1 import (
-    JSONSchemaValidatorBb1653037Ca558A8C6097E20B99B4B1 as JSONSchemaValidatorBb1653037Ca558A8C6097E20B99B4B1_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bd1c59e9be75ac4a40decaa95ee9efd import (
-    JSONSchemaValidatorBd1C59E9Be75Ac4A40DEcaa95Ee9Efd as JSONSchemaValidatorBd1C59E9Be75Ac4A40DEcaa95Ee9Efd_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bec2dde673c5b2f940d0474fed32af6 import (
-    JSONSchemaValidatorBec2Dde673C5B2F940D0474Fed32Af6 as JSONSchemaValidatorBec2Dde673C5B2F940D0474Fed32Af6_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d16471a58805b4aa2c757209d188aed import (
-    JSONSchemaValidatorD16471A58805B4AA2C757209D188Aed as JSONSchemaValidatorD16471A58805B4AA2C757209D188Aed_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d6b58f378895114839682dceed1a9b5 import (
-    JSONSchemaValidatorD6B58F378895114839682Dceed1A9B5 as JSONSchemaValidatorD6B58F378895114839682Dceed1A9B5_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d8fc92ddeab597ebb50ea003a6d46bd import (
-    JSONSchemaValidatorD8Fc92DDeab597EBb50Ea003A6D46Bd as JSONSchemaValidatorD8Fc92DDeab597EBb50Ea003A6D46Bd_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e481654675355408be8daff9a82f9a0 import (
-    JSONSchemaValidatorE481654675355408Be8Daff9A82F9A0 as JSONSchemaValidatorE481654675355408Be8Daff9A82F9A0_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ee43cac5fd65c55ab3153d3549d18c0 import (
-    JSONSchemaValidatorEe43Cac5Fd65C55Ab3153D3549D18C0 as JSONSchemaValidatorEe43Cac5Fd65C55Ab3153D3549D18C0_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_eea45fca32f5f12adc30a9d03c43ac6 import (
-    JSONSchemaValidatorEea45FcA32F5F12Adc30A9D03C43Ac6 as JSONSchemaValidatorEea45FcA32F5F12Adc30A9D03C43Ac6_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c90c04b8356cf9974957e0f9516d0 import (
-    JSONSchemaValidatorC90C04B8356Cf9974957E0F9516D0 as JSONSchemaValidatorC90C04B8356Cf9974957E0F9516D0_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b4155d6f885a53ad0e47b1a4 import (
-    JSONSchemaValidatorB4155D6F885A53Ad0E47B1A4 as JSONSchemaValidatorB4155D6F885A53Ad0E47B1A4_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cf2cac6f150c9bee9ade37921b162 import (
-    JSONSchemaValidatorCf2CaC6F150C9Bee9Ade37921B162 as JSONSchemaValidatorCf2CaC6F150C9Bee9Ade37921B162_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cf0f416ef5c25a159f4c3e376741a import (
-    JSONSchemaValidatorCf0F416Ef5C25A159F4C3E376741A as JSONSchemaValidatorCf0F416Ef5C25A159F4C3E376741A_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_adfc115d6888722b71811ac96e import (
-    JSONSchemaValidatorAdFc115D6888722B71811Ac96E as JSONSchemaValidatorAdFc115D6888722B71811Ac96E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bc55e6552fac58cc0aaacd773a import (
-    JSONSchemaValidatorBc55E6552FAc58Cc0Aaacd773A as JSONSchemaValidatorBc55E6552FAc58Cc0Aaacd773A_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_dece7a9b353b49084a8ffa4f18c91 import (
-    JSONSchemaValidatorDece7A9B353B49084A8Ffa4F18C91 as JSONSchemaValidatorDece7A9B353B49084A8Ffa4F18C91_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c9ea5c02b2b7368cac785f30 import (
-    JSONSchemaValidatorC9Ea5C02B2B7368Cac785F30 as JSONSchemaValidatorC9Ea5C02B2B7368Cac785F30_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f4b2825561e808787a16f7e0a1f import (
-    JSONSchemaValidatorF4B2825561E808787A16F7E0A1F as JSONSchemaValidatorF4B2825561E808787A16F7E0A1F_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bc3ed6556f9b9c959e53e271d70 import (
-    JSONSchemaValidatorBc3Ed6556F9B9C959E53E271D70 as JSONSchemaValidatorBc3Ed6556F9B9C959E53E271D70_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_aac9ba55e5043b4d5e0995c566dce import (
-    JSONSchemaValidatorAac9BA55E5043B4D5E0995C566Dce as JSONSchemaValidatorAac9BA55E5043B4D5E0995C566Dce_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b818044610579a9b74ec582e7739ab import (
-    JSONSchemaValidatorB818044610579A9B74Ec582E7739Ab as JSONSchemaValidatorB818044610579A9B74Ec582E7739Ab_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bcb7a52e3c5763b246bcf438fe57c9 import (
-    JSONSchemaValidatorBcb7A52E3C5763B246Bcf438Fe57C9 as JSONSchemaValidatorBcb7A52E3C5763B246Bcf438Fe57C9_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_eb209544555e43ae2bc909499f3900 import (
-    JSONSchemaValidatorEb209544555E43Ae2BC909499F3900 as JSONSchemaValidatorEb209544555E43Ae2BC909499F3900_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f2c120b855cb8c852806ce72e54d import (
-    JSONSchemaValidatorF2C120B855Cb8C852806Ce72E54D as JSONSchemaValidatorF2C120B855Cb8C852806Ce72E54D_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a4d8313a955433858e0137ba7ef672 import (
-    JSONSchemaValidatorA4D8313A955433858E0137Ba7Ef672 as JSONSchemaValidatorA4D8313A955433858E0137Ba7Ef672_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e62749061c5aae8ecd1ccc2d315153 import (
-    JSONSchemaValidatorE62749061C5Aae8Ecd1Ccc2D315153 as JSONSchemaValidatorE62749061C5Aae8Ecd1Ccc2D315153_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cd2e825a78b6de087e991f6fe0 import (
-    JSONSchemaValidatorCd2E825A78B6De087E991F6Fe0 as JSONSchemaValidatorCd2E825A78B6De087E991F6Fe0_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c14a815ec5938950343f6188f0785 import (
-    JSONSchemaValidatorC14A815Ec5938950343F6188F0785 as JSONSchemaValidatorC14A815Ec5938950343F6188F0785_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_aaebb912125213b350d7423b4f01a4 import (
-    JSONSchemaValidatorAaebb912125213B350D7423B4F01A4 as JSONSchemaValidatorAaebb912125213B350D7423B4F01A4_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fb8fee52fcb7577206a3fcac8c import (
-    JSONSchemaValidatorFb8Fee52FcB7577206A3Fcac8C as JSONSchemaValidatorFb8Fee52FcB7577206A3Fcac8C_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ad0cce45817862bebfc839bf5ae import (
-    JSONSchemaValidatorAd0Cce45817862BEbfc839Bf5Ae as JSONSchemaValidatorAd0Cce45817862BEbfc839Bf5Ae_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d6d7d5c8983c1d3c9815bfd35 import (
-    JSONSchemaValidatorD6D7D5C8983C1D3C9815Bfd35 as JSONSchemaValidatorD6D7D5C8983C1D3C9815Bfd35_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fb5a8c0075563491622171958074bf import (
-    JSONSchemaValidatorFb5A8C0075563491622171958074Bf as JSONSchemaValidatorFb5A8C0075563491622171958074Bf_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a764c85d8df5c30b9143619d4f9cde9 import (
-    JSONSchemaValidatorA764C85D8Df5C30B9143619D4F9Cde9 as JSONSchemaValidatorA764C85D8Df5C30B9143619D4F9Cde9_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b5a94fd2d97514b8a9cf73df4e154b8 import (
-    JSONSchemaValidatorB5A94Fd2D97514B8A9CF73Df4E154B8 as JSONSchemaValidatorB5A94Fd2D97514B8A9CF73Df4E154B8_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c991ce0b0f058a08c863a4abdfc70a6 import (
-    JSONSchemaValidatorC991Ce0B0F058A08C863A4Abdfc70A6 as JSONSchemaValidatorC991Ce0B0F058A08C863A4Abdfc70A6_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d10535ed2045b9bb5c58882e6f43cb2 import (
-    JSONSchemaValidatorD10535ED2045B9BB5C58882E6F43Cb2 as JSONSchemaValidatorD10535ED2045B9BB5C58882E6F43Cb2_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f41eb48a0da56949cfaddeecb51ab66 import (
-    JSONSchemaValidatorF41Eb48A0Da56949CfaDdeecb51Ab66 as JSONSchemaValidatorF41Eb48A0Da56949CfaDdeecb51Ab66_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f5bfccc7e30550baa7046f74daa1ef2 import (
-    JSONSchemaValidatorF5Bfccc7E30550BAa7046F74Daa1Ef2 as JSONSchemaValidatorF5Bfccc7E30550BAa7046F74Daa1Ef2_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fcd7200871e5e2db7f1720d95fee764 import (
-    JSONSchemaValidatorFcd7200871E5E2DB7F1720D95Fee764 as JSONSchemaValidatorFcd7200871E5E2DB7F1720D95Fee764_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fff3662537e538f82bfb5809e30b3df import (
-    JSONSchemaValidatorFff3662537E538F82BfB5809E30B3Df as JSONSchemaValidatorFff3662537E538F82BfB5809E30B3Df_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a0c237c8fc115b6f98b87cc7a1360dd0 import (
-    JSONSchemaValidatorA0C237C8Fc115B6F98B87Cc7A1360Dd0 as JSONSchemaValidatorA0C237C8Fc115B6F98B87Cc7A1360Dd0_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a0f799d5ec6954d1bd7a25853080a9f1 import (
-    JSONSchemaValidatorA0F799D5Ec6954D1Bd7A25853080A9F1 as JSONSchemaValidatorA0F799D5Ec6954D1Bd7A25853080A9F1_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a14e71c1b98e51eea41255720025b519 import (
-    JSONSchemaValidatorA14E71C1B98E51EeA41255720025B519 as JSONSchemaValidatorA14E71C1B98E51EeA41255720025B519_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a2da4c1e5224542e8474f09eb8d4f32d import (
-    JSONSchemaValidatorA2Da4C1E5224542E8474F09Eb8D4F32D as JSONSchemaValidatorA2Da4C1E5224542E8474F09Eb8D4F32D_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a352f6280e445075b3ea7cbf868c2d94 import (
-    JSONSchemaValidatorA352F6280E445075B3Ea7Cbf868C2D94 as JSONSchemaValidatorA352F6280E445075B3Ea7Cbf868C2D94_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a3b37dcbe2a150bea06d9dcde1837281 import (
-    JSONSchemaValidatorA3B37DcbE2A150BeA06D9Dcde1837281 as JSONSchemaValidatorA3B37DcbE2A150BeA06D9Dcde1837281_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a3d2432ae8c55fe793c5180d8d5fce25 import (
-    JSONSchemaValidatorA3D2432AE8C55Fe793C5180D8D5Fce25 as JSONSchemaValidatorA3D2432AE8C55Fe793C5180D8D5Fce25_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a3fb2e7bb8aa50508425b1dd8818fda4 import (
-    JSONSchemaValidatorA3Fb2E7BB8Aa50508425B1Dd8818Fda4 as JSONSchemaValidatorA3Fb2E7BB8Aa50508425B1Dd8818Fda4_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a41113bc28515538af4fe4d2ff707f60 import (
-    JSONSchemaValidatorA41113Bc28515538Af4FE4D2Ff707F60 as JSONSchemaValidatorA41113Bc28515538Af4FE4D2Ff707F60_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a54fce1a0c305bdabfe91a8a6161e539 import (
-    JSONSchemaValidatorA54Fce1A0C305BdaBfe91A8A6161E539 as JSONSchemaValidatorA54Fce1A0C305BdaBfe91A8A6161E539_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a5e4452cb2e05682933349833a01d14b import (
-    JSONSchemaValidatorA5E4452CB2E05682933349833A01D14B as JSONSchemaValidatorA5E4452CB2E05682933349833A01D14B_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a66db26df529597c84c2a15ea2d632ce import (
-    JSONSchemaValidatorA66Db26DF529597C84C2A15Ea2D632Ce as JSONSchemaValidatorA66Db26DF529597C84C2A15Ea2D632Ce_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a6c4ce7aef8251a2a8646ba0b5c1826a import (
-    JSONSchemaValidatorA6C4Ce7AEf8251A2A8646Ba0B5C1826A as JSONSchemaValidatorA6C4Ce7AEf8251A2A8646Ba0B5C1826A_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a73fbc67627e5bbbafe748de84d42df6 import (
-    JSONSchemaValidatorA73Fbc67627E5BbbAfe748De84D42Df6 as JSONSchemaValidatorA73Fbc67627E5BbbAfe748De84D42Df6_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a7935eedd53a5b8c84668c903cc1c705 import (
-    JSONSchemaValidatorA7935EedD53A5B8C84668C903Cc1C705 as JSONSchemaValidatorA7935EedD53A5B8C84668C903Cc1C705_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a7d6d604f38f5f849af79d8768bddfc1 import (
-    JSONSchemaValidatorA7D6D604F38F5F849Af79D8768Bddfc1 as JSONSchemaValidatorA7D6D604F38F5F849Af79D8768Bddfc1_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a837b8a46cd459c8b429d16fb17f1370 import (
-    JSONSchemaValidatorA837B8A46Cd459C8B429D16Fb17F1370 as JSONSchemaValidatorA837B8A46Cd459C8B429D16Fb17F1370_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a914cc0c96a35a06a54856e778742a8c import (
-    JSONSchemaValidatorA914Cc0C96A35A06A54856E778742A8C as JSONSchemaValidatorA914Cc0C96A35A06A54856E778742A8C_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a91eed12dfc85dbdaacab22e6e9f04a5 import (
-    JSONSchemaValidatorA91Eed12Dfc85DbdAacaB22E6E9F04A5 as JSONSchemaValidatorA91Eed12Dfc85DbdAacaB22E6E9F04A5_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a93d01238de0537dbb3d358f9cce0bd2 import (
-    JSONSchemaValidatorA93D01238De0537DBb3D358F9Cce0Bd2 as JSONSchemaValidatorA93D01238De0537DBb3D358F9Cce0Bd2_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a9b864257b965fe4bd8b0293f41f1537 import (
-    JSONSchemaValidatorA9B864257B965Fe4Bd8B0293F41F1537 as JSONSchemaValidatorA9B864257B965Fe4Bd8B0293F41F1537_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_a9e0722d184658c592bd130ff03e1dde import (
-    JSONSchemaValidatorA9E0722D184658C592Bd130Ff03E1Dde as JSONSchemaValidatorA9E0722D184658C592Bd130Ff03E1Dde_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_aa11f09d28165f4ea6c81b8642e59cc4 import (
-    JSONSchemaValidatorAa11F09D28165F4EA6C81B8642E59Cc4 as JSONSchemaValidatorAa11F09D28165F4EA6C81B8642E59Cc4_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_aa663ca2bd1f5a3db67c405987495112 import (
-    JSONSchemaValidatorAa663Ca2Bd1F5A3DB67C405987495112 as JSONSchemaValidatorAa663Ca2Bd1F5A3DB67C405987495112_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ac6e63199fb05bcf89106a22502c2197 import (
-    JSONSchemaValidatorAc6E63199Fb05Bcf89106A22502C2197 as JSONSchemaValidatorAc6E63199Fb05Bcf89106A22502C2197_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ac7ce690e0f55a469b0a9bfa3d2c165e import (
-    JSONSchemaValidatorAc7Ce690E0F55A469B0A9Bfa3D2C165E as JSONSchemaValidatorAc7Ce690E0F55A469B0A9Bfa3D2C165E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ad487b01cede5cb4bdd5ee06695a6020 import (
-    JSONSchemaValidatorAd487B01Cede5Cb4Bdd5Ee06695A6020 as JSONSchemaValidatorAd487B01Cede5Cb4Bdd5Ee06695A6020_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ad936677c99a58f6b532359d66fe98a7 import (
-    JSONSchemaValidatorAd936677C99A58F6B532359D66Fe98A7 as JSONSchemaValidatorAd936677C99A58F6B532359D66Fe98A7_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ad96e712f4525a128368b1bfe3afc21c import (
-    JSONSchemaValidatorAd96E712F4525A128368B1Bfe3Afc21C as JSONSchemaValidatorAd96E712F4525A128368B1Bfe3Afc21C_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ada3522de8ef54729e9fc242df292547 import (
-    JSONSchemaValidatorAda3522DE8Ef54729E9FC242Df292547 as JSONSchemaValidatorAda3522DE8Ef54729E9FC242Df292547_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ae4d33eacca95f109bebc6fd0528ca48 import (
-    JSONSchemaValidatorAe4D33EaCca95F109BebC6Fd0528Ca48 as JSONSchemaValidatorAe4D33EaCca95F109BebC6Fd0528Ca48_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ae8282c90a7059ceb31b4072429d00cd import (
-    JSONSchemaValidatorAe8282C90A7059CeB31B4072429D00Cd as JSONSchemaValidatorAe8282C90A7059CeB31B4072429D00Cd_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_afcd4a0cbe985fd7aafa73d671c43a1e import (
-    JSONSchemaValidatorAfcd4A0CBe985Fd7Aafa73D671C43A1E as JSONSchemaValidatorAfcd4A0CBe985Fd7Aafa73D671C43A1E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b08f499f995f5f46ba52e0385b54721a import (
-    JSONSchemaValidatorB08F499F995F5F46Ba52E0385B54721A as JSONSchemaValidatorB08F499F995F5F46Ba52E0385B54721A_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b0aa8e79d21f5e579908825e70aaccf6 import (
-    JSONSchemaValidatorB0Aa8E79D21F5E579908825E70Aaccf6 as JSONSchemaValidatorB0Aa8E79D21F5E579908825E70Aaccf6_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b0b146a144a65aa296b8b939c2926158 import (
-    JSONSchemaValidatorB0B146A144A65Aa296B8B939C2926158 as JSONSchemaValidatorB0B146A144A65Aa296B8B939C2926158_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b119a4d455e35cc3b2cc6695a045cbfa import (
-    JSONSchemaValidatorB119A4D455E35Cc3B2Cc6695A045Cbfa as JSONSchemaValidatorB119A4D455E35Cc3B2Cc6695A045Cbfa_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b11aa4de387251c794665e030fa815da import (
-    JSONSchemaValidatorB11Aa4De387251C794665E030Fa815Da as JSONSchemaValidatorB11Aa4De387251C794665E030Fa815Da_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b2dae3b41636596aa02c3ad0a4bcb8d7 import (
-    JSONSchemaValidatorB2Dae3B41636596AA02C3Ad0A4Bcb8D7 as JSONSchemaValidatorB2Dae3B41636596AA02C3Ad0A4Bcb8D7_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b350fb0876a25879973b0840fbb690bb import (
-    JSONSchemaValidatorB350Fb0876A25879973B0840Fbb690Bb as JSONSchemaValidatorB350Fb0876A25879973B0840Fbb690Bb_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b3ab480a3f485ecc9fef1bd2f8c9d109 import (
-    JSONSchemaValidatorB3Ab480A3F485Ecc9Fef1Bd2F8C9D109 as JSONSchemaValidatorB3Ab480A3F485Ecc9Fef1Bd2F8C9D109_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b3c4383ecc13514c85c6f3d8484f6d68 import (
-    JSONSchemaValidatorB3C4383ECc13514C85C6F3D8484F6D68 as JSONSchemaValidatorB3C4383ECc13514C85C6F3D8484F6D68_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b43e0f60e9ac5bd4960f9772cf7a497b import (
-    JSONSchemaValidatorB43E0F60E9Ac5Bd4960F9772Cf7A497B as JSONSchemaValidatorB43E0F60E9Ac5Bd4960F9772Cf7A497B_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b4f52e69ddca5b2583b28fb4c96447aa import (
-    JSONSchemaValidatorB4F52E69Ddca5B2583B28Fb4C96447Aa as JSONSchemaValidatorB4F52E69Ddca5B2583B28Fb4C96447Aa_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b6f2d8e46cdd5f05bb06f52cd1b26fb2 import (
-    JSONSchemaValidatorB6F2D8E46Cdd5F05Bb06F52Cd1B26Fb2 as JSONSchemaValidatorB6F2D8E46Cdd5F05Bb06F52Cd1B26Fb2_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b7079a38844e56dd8f1b6b876880a02e import (
-    JSONSchemaValidatorB7079A38844E56Dd8F1B6B876880A02E as JSONSchemaValidatorB7079A38844E56Dd8F1B6B876880A02E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b843a90c86875472af1f351e78dd5521 import (
-    JSONSchemaValidatorB843A90C86875472Af1F351E78Dd5521 as JSONSchemaValidatorB843A90C86875472Af1F351E78Dd5521_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_b95201b6a6905a10b463e036bf591166 import (
-    JSONSchemaValidatorB95201B6A6905A10B463E036Bf591166 as JSONSchemaValidatorB95201B6A6905A10B463E036Bf591166_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ba40975123ed50daa2f9f599cdf2d911 import (
-    JSONSchemaValidatorBa40975123Ed50DaA2F9F599Cdf2D911 as JSONSchemaValidatorBa40975123Ed50DaA2F9F599Cdf2D911_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ba52bb172d495710aa00f7d4d060ec50 import (
-    JSONSchemaValidatorBa52Bb172D495710Aa00F7D4D060Ec50 as JSONSchemaValidatorBa52Bb172D495710Aa00F7D4D060Ec50_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bac0c488707959c182dfef18681bceda import (
-    JSONSchemaValidatorBac0C488707959C182DfEf18681Bceda as JSONSchemaValidatorBac0C488707959C182DfEf18681Bceda_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bbc4dab8193c546ab116e19863dff621 import (
-    JSONSchemaValidatorBbc4Dab8193C546AB116E19863Dff621 as JSONSchemaValidatorBbc4Dab8193C546AB116E19863Dff621_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bc33daf690ec5399a507829abfc4fe64 import (
-    JSONSchemaValidatorBc33Daf690Ec5399A507829Abfc4Fe64 as JSONSchemaValidatorBc33Daf690Ec5399A507829Abfc4Fe64_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bc3cb471beaf5bfeb47201993c023068 import (
-    JSONSchemaValidatorBc3Cb471Beaf5BfeB47201993C023068 as JSONSchemaValidatorBc3Cb471Beaf5BfeB47201993C023068_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bce8e6b307ce52dd8f5546fbd78e05ee import (
-    JSONSchemaValidatorBce8E6B307Ce52Dd8F5546Fbd78E05Ee as JSONSchemaValidatorBce8E6B307Ce52Dd8F5546Fbd78E05Ee_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bd31fcbd1ecd5a2c8b812088b27bfcea import (
-    JSONSchemaValidatorBd31Fcbd1Ecd5A2C8B812088B27Bfcea as JSONSchemaValidatorBd31Fcbd1Ecd5A2C8B812088B27Bfcea_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bd400dbef41e53ed82541c766f14f1eb import (
-    JSONSchemaValidatorBd400DbeF41E53Ed82541C766F14F1Eb as JSONSchemaValidatorBd400DbeF41E53Ed82541C766F14F1Eb_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bdca1829ea705fa690922e3e0f8ff7b0 import (
-    JSONSchemaValidatorBdca1829Ea705Fa690922E3E0F8Ff7B0 as JSONSchemaValidatorBdca1829Ea705Fa690922E3E0F8Ff7B0_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bdcb514ae33b571795e4a42147d11f87 import (
-    JSONSchemaValidatorBdcb514AE33B571795E4A42147D11F87 as JSONSchemaValidatorBdcb514AE33B571795E4A42147D11F87_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bf40cea4982c54278a52ac2e7b0c458a import (
-    JSONSchemaValidatorBf40Cea4982C54278A52Ac2E7B0C458A as JSONSchemaValidatorBf40Cea4982C54278A52Ac2E7B0C458A_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bfb1005f4d265f8bb340637175a5841f import (
-    JSONSchemaValidatorBfb1005F4D265F8BB340637175A5841F as JSONSchemaValidatorBfb1005F4D265F8BB340637175A5841F_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_bfd1cc1403c951a99c0fcafd59eaabf3 import (
-    JSONSchemaValidatorBfd1Cc1403C951A99C0FCafd59Eaabf3 as JSONSchemaValidatorBfd1Cc1403C951A99C0FCafd59Eaabf3_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c17432d928f755f8bb9f4edb83089d3e import (
-    JSONSchemaValidatorC17432D928F755F8Bb9F4Edb83089D3E as JSONSchemaValidatorC17432D928F755F8Bb9F4Edb83089D3E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c1dae5c13e6959348fe1fe0652958647 import (
-    JSONSchemaValidatorC1Dae5C13E6959348Fe1Fe0652958647 as JSONSchemaValidatorC1Dae5C13E6959348Fe1Fe0652958647_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c1fa19f9295c50018132c6c9ebc3fc35 import (
-    JSONSchemaValidatorC1Fa19F9295C50018132C6C9Ebc3Fc35 as JSONSchemaValidatorC1Fa19F9295C50018132C6C9Ebc3Fc35_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c524f0ec199e5435bcaee56b423532e7 import (
-    JSONSchemaValidatorC524F0Ec199E5435BcaeE56B423532E7 as JSONSchemaValidatorC524F0Ec199E5435BcaeE56B423532E7_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c5c273290fae513da209ec2c9270e46d import (
-    JSONSchemaValidatorC5C273290Fae513DA209Ec2C9270E46D as JSONSchemaValidatorC5C273290Fae513DA209Ec2C9270E46D_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c5f97865727857d5b1eeaedee3dcccd2 import (
-    JSONSchemaValidatorC5F97865727857D5B1EeAedee3Dcccd2 as JSONSchemaValidatorC5F97865727857D5B1EeAedee3Dcccd2_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c60312a923ee5a6fb3f2c725c32dc96f import (
-    JSONSchemaValidatorC60312A923Ee5A6FB3F2C725C32Dc96F as JSONSchemaValidatorC60312A923Ee5A6FB3F2C725C32Dc96F_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c6774ff9549a53d4b41fdd2d88f1d0f5 import (
-    JSONSchemaValidatorC6774Ff9549A53D4B41FDd2D88F1D0F5 as JSONSchemaValidatorC6774Ff9549A53D4B41FDd2D88F1D0F5_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c7f28c3d23ba5384be5e769ae0505d00 import (
-    JSONSchemaValidatorC7F28C3D23Ba5384Be5E769Ae0505D00 as JSONSchemaValidatorC7F28C3D23Ba5384Be5E769Ae0505D00_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c85b39d6bae0536695992ddbb91ea96d import (
-    JSONSchemaValidatorC85B39D6Bae0536695992Ddbb91Ea96D as JSONSchemaValidatorC85B39D6Bae0536695992Ddbb91Ea96D_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c880bc6a8faa5bb4afbfd6bea38c75fa import (
-    JSONSchemaValidatorC880Bc6A8Faa5Bb4AfbfD6Bea38C75Fa as JSONSchemaValidatorC880Bc6A8Faa5Bb4AfbfD6Bea38C75Fa_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c937494318f952ba92eaeb82b144c338 import (
-    JSONSchemaValidatorC937494318F952Ba92EaEb82B144C338 as JSONSchemaValidatorC937494318F952Ba92EaEb82B144C338_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c9b5b83e67195b649077a05e42897cc4 import (
-    JSONSchemaValidatorC9B5B83E67195B649077A05E42897Cc4 as JSONSchemaValidatorC9B5B83E67195B649077A05E42897Cc4_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_c9f995abc21b54e7860f66aef2ffbc85 import (
-    JSONSchemaValidatorC9F995AbC21B54E7860F66Aef2Ffbc85 as JSONSchemaValidatorC9F995AbC21B54E7860F66Aef2Ffbc85_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ca2fe989a227585086452d24d32867a6 import (
-    JSONSchemaValidatorCa2Fe989A227585086452D24D32867A6 as JSONSchemaValidatorCa2Fe989A227585086452D24D32867A6_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cb38886d0236502783d431455e3fb880 import (
-    JSONSchemaValidatorCb38886D0236502783D431455E3Fb880 as JSONSchemaValidatorCb38886D0236502783D431455E3Fb880_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cc1599012a5a59c8abdda5376b5cc583 import (
-    JSONSchemaValidatorCc1599012A5A59C8AbddA5376B5Cc583 as JSONSchemaValidatorCc1599012A5A59C8AbddA5376B5Cc583_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cc19241fd92f586c8986d4d5c99c3a88 import (
-    JSONSchemaValidatorCc19241FD92F586C8986D4D5C99C3A88 as JSONSchemaValidatorCc19241FD92F586C8986D4D5C99C3A88_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ccbf614b4b355cac929f12cc61272c1c import (
-    JSONSchemaValidatorCcbf614B4B355Cac929F12Cc61272C1C as JSONSchemaValidatorCcbf614B4B355Cac929F12Cc61272C1C_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cdf8c0d3866d5147901c0cf4821a84a7 import (
-    JSONSchemaValidatorCdf8C0D3866D5147901C0Cf4821A84A7 as JSONSchemaValidatorCdf8C0D3866D5147901C0Cf4821A84A7_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cec8139f6b1c5e5991d12197206029a0 import (
-    JSONSchemaValidatorCec8139F6B1C5E5991D12197206029A0 as JSONSchemaValidatorCec8139F6B1C5E5991D12197206029A0_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cf9d39cef5e95bb9bd48d5f86e094c99 import (
-    JSONSchemaValidatorCf9D39CeF5E95Bb9Bd48D5F86E094C99 as JSONSchemaValidatorCf9D39CeF5E95Bb9Bd48D5F86E094C99_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_cfadc5e4c912588389f4f63d2fb6e4ed import (
-    JSONSchemaValidatorCfadc5E4C912588389F4F63D2Fb6E4Ed as JSONSchemaValidatorCfadc5E4C912588389F4F63D2Fb6E4Ed_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d02614492a2251c18de2e36c097e40ff import (
-    JSONSchemaValidatorD02614492A2251C18De2E36C097E40Ff as JSONSchemaValidatorD02614492A2251C18De2E36C097E40Ff_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d045d18062ad5ae59c6f446beb17d675 import (
-    JSONSchemaValidatorD045D18062Ad5Ae59C6F446Beb17D675 as JSONSchemaValidatorD045D18062Ad5Ae59C6F446Beb17D675_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d05c763ada545fbe94a4c0391456b89f import (
-    JSONSchemaValidatorD05C763ADa545Fbe94A4C0391456B89F as JSONSchemaValidatorD05C763ADa545Fbe94A4C0391456B89F_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d0aab00569b258b481afedc35e6db392 import (
-    JSONSchemaValidatorD0Aab00569B258B481AfEdc35E6Db392 as JSONSchemaValidatorD0Aab00569B258B481AfEdc35E6Db392_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d0b2cc705afb536fab6fd0848baa73c0 import (
-    JSONSchemaValidatorD0B2Cc705Afb536FAb6FD0848Baa73C0 as JSONSchemaValidatorD0B2Cc705Afb536FAb6FD0848Baa73C0_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d0e1021de57d5e95bbea5d5bd86b481a import (
-    JSONSchemaValidatorD0E1021DE57D5E95Bbea5D5Bd86B481A as JSONSchemaValidatorD0E1021DE57D5E95Bbea5D5Bd86B481A_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d0f4d6b5909b5ecaa29e854e919b4221 import (
-    JSONSchemaValidatorD0F4D6B5909B5EcaA29E854E919B4221 as JSONSchemaValidatorD0F4D6B5909B5EcaA29E854E919B4221_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d1d42ef2f1895a82a2830bf1353e6baa import (
-    JSONSchemaValidatorD1D42Ef2F1895A82A2830Bf1353E6Baa as JSONSchemaValidatorD1D42Ef2F1895A82A2830Bf1353E6Baa_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d2ea814bfae85da1b77872d095fc8221 import (
-    JSONSchemaValidatorD2Ea814BFae85Da1B77872D095Fc8221 as JSONSchemaValidatorD2Ea814BFae85Da1B77872D095Fc8221_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d413a3d054ac50fa921ca8cf7fdf5449 import (
-    JSONSchemaValidatorD413A3D054Ac50Fa921CA8Cf7Fdf5449 as JSONSchemaValidatorD413A3D054Ac50Fa921CA8Cf7Fdf5449_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d5c229546dc755f796dfcf34f1c2e290 import (
-    JSONSchemaValidatorD5C229546Dc755F796DfCf34F1C2E290 as JSONSchemaValidatorD5C229546Dc755F796DfCf34F1C2E290_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d6451662bd1652e7bdc39053429e87a4 import (
-    JSONSchemaValidatorD6451662Bd1652E7Bdc39053429E87A4 as JSONSchemaValidatorD6451662Bd1652E7Bdc39053429E87A4_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d69b1cfffdda5bd1828a5a89a262cbdd import (
-    JSONSchemaValidatorD69B1CffFdda5Bd1828A5A89A262Cbdd as JSONSchemaValidatorD69B1CffFdda5Bd1828A5A89A262Cbdd_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d73fc407278f5eefa67e6a014aeaf742 import (
-    JSONSchemaValidatorD73Fc407278F5EefA67E6A014Aeaf742 as JSONSchemaValidatorD73Fc407278F5EefA67E6A014Aeaf742_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d825ae9a117f5b6bb65b7d78fd42513c import (
-    JSONSchemaValidatorD825Ae9A117F5B6BB65B7D78Fd42513C as JSONSchemaValidatorD825Ae9A117F5B6BB65B7D78Fd42513C_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d8fcd6dbb7ff53b58f7398c49b27ded2 import (
-    JSONSchemaValidatorD8Fcd6DbB7Ff53B58F7398C49B27Ded2 as JSONSchemaValidatorD8Fcd6DbB7Ff53B58F7398C49B27Ded2_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d91a3aad0fd954e7a43aa3256ce433f6 import (
-    JSONSchemaValidatorD91A3Aad0Fd954E7A43AA3256Ce433F6 as JSONSchemaValidatorD91A3Aad0Fd954E7A43AA3256Ce433F6_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d967a378b43457ad8c6a6de7bc1845d1 import (
-    JSONSchemaValidatorD967A378B43457Ad8C6A6De7Bc1845D1 as JSONSchemaValidatorD967A378B43457Ad8C6A6De7Bc1845D1_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d9c01903d0645a3d8b56172bb9549be3 import (
-    JSONSchemaValidatorD9C01903D0645A3D8B56172Bb9549Be3 as JSONSchemaValidatorD9C01903D0645A3D8B56172Bb9549Be3_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_d9e3276d1ed3511b80b22ea8388959c8 import (
-    JSONSchemaValidatorD9E3276D1Ed3511B80B22Ea8388959C8 as JSONSchemaValidatorD9E3276D1Ed3511B80B22Ea8388959C8_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_da24bdb30635515395471fe644cdc7b5 import (
-    JSONSchemaValidatorDa24Bdb30635515395471Fe644Cdc7B5 as JSONSchemaValidatorDa24Bdb30635515395471Fe644Cdc7B5_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_da455f4be5b75126ba9970c7cc54c7db import (
-    JSONSchemaValidatorDa455F4BE5B75126Ba9970C7Cc54C7Db as JSONSchemaValidatorDa455F4BE5B75126Ba9970C7Cc54C7Db_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_da593242978c5047bb6b62b7f9475326 import (
-    JSONSchemaValidatorDa593242978C5047Bb6B62B7F9475326 as JSONSchemaValidatorDa593242978C5047Bb6B62B7F9475326_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_db0f8e07ae0d5ecc83e34d29e5e57b41 import (
-    JSONSchemaValidatorDb0F8E07Ae0D5Ecc83E34D29E5E57B41 as JSONSchemaValidatorDb0F8E07Ae0D5Ecc83E34D29E5E57B41_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_dc254215fdf25cd5b7ba797e8f8faebf import (
-    JSONSchemaValidatorDc254215Fdf25Cd5B7Ba797E8F8Faebf as JSONSchemaValidatorDc254215Fdf25Cd5B7Ba797E8F8Faebf_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_dc5d352dfaeb5b17800b0af2858c2f5c import (
-    JSONSchemaValidatorDc5D352DFaeb5B17800B0Af2858C2F5C as JSONSchemaValidatorDc5D352DFaeb5B17800B0Af2858C2F5C_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_dcc43be0514e50fea80cfa827f13ee5c import (
-    JSONSchemaValidatorDcc43Be0514E50FeA80CFa827F13Ee5C as JSONSchemaValidatorDcc43Be0514E50FeA80CFa827F13Ee5C_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_dda852745acd5ce5a97b0cfdf0de2fd2 import (
-    JSONSchemaValidatorDda852745Acd5Ce5A97B0Cfdf0De2Fd2 as JSONSchemaValidatorDda852745Acd5Ce5A97B0Cfdf0De2Fd2_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_de1769e2886b5948b408100225b4a034 import (
-    JSONSchemaValidatorDe1769E2886B5948B408100225B4A034 as JSONSchemaValidatorDe1769E2886B5948B408100225B4A034_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_de24de1222a4500cab78b4b34ee299f2 import (
-    JSONSchemaValidatorDe24De1222A4500CAb78B4B34Ee299F2 as JSONSchemaValidatorDe24De1222A4500CAb78B4B34Ee299F2_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_deb34387d0235811a90985711be9fe2e import (
-    JSONSchemaValidatorDeb34387D0235811A90985711Be9Fe2E as JSONSchemaValidatorDeb34387D0235811A90985711Be9Fe2E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_dec1857f1585557eb39e12a9c93ef985 import (
-    JSONSchemaValidatorDec1857F1585557EB39E12A9C93Ef985 as JSONSchemaValidatorDec1857F1585557EB39E12A9C93Ef985_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ded95db0af275081801b54e0ce105c71 import (
-    JSONSchemaValidatorDed95Db0Af275081801B54E0Ce105C71 as JSONSchemaValidatorDed95Db0Af275081801B54E0Ce105C71_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_df26f516755a50b5b5477324cf5cb649 import (
-    JSONSchemaValidatorDf26F516755A50B5B5477324Cf5Cb649 as JSONSchemaValidatorDf26F516755A50B5B5477324Cf5Cb649_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_df9ec5aa58815a849b4853b223343e5e import (
-    JSONSchemaValidatorDf9Ec5Aa58815A849B4853B223343E5E as JSONSchemaValidatorDf9Ec5Aa58815A849B4853B223343E5E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_dfda5beca4cc5437876bff366493ebf0 import (
-    JSONSchemaValidatorDfda5BecA4Cc5437876BFf366493Ebf0 as JSONSchemaValidatorDfda5BecA4Cc5437876BFf366493Ebf0_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e0c7b28d55c85d49a84c1403ca14bd5f import (
-    JSONSchemaValidatorE0C7B28D55C85D49A84C1403Ca14Bd5F as JSONSchemaValidatorE0C7B28D55C85D49A84C1403Ca14Bd5F_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e11daa984f535a08bc1eb01bc84bc399 import (
-    JSONSchemaValidatorE11Daa984F535A08Bc1EB01Bc84Bc399 as JSONSchemaValidatorE11Daa984F535A08Bc1EB01Bc84Bc399_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e1781a990c6b5a4b895d56bcfda2b7cb import (
-    JSONSchemaValidatorE1781A990C6B5A4B895D56Bcfda2B7Cb as JSONSchemaValidatorE1781A990C6B5A4B895D56Bcfda2B7Cb_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e1b8c435195d56368c24a54dcce007d0 import (
-    JSONSchemaValidatorE1B8C435195D56368C24A54Dcce007D0 as JSONSchemaValidatorE1B8C435195D56368C24A54Dcce007D0_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e2ec291c2e775df3895aadc639713eea import (
-    JSONSchemaValidatorE2Ec291C2E775Df3895AAdc639713Eea as JSONSchemaValidatorE2Ec291C2E775Df3895AAdc639713Eea_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e2f9718de3d050819cdc6355a3a43200 import (
-    JSONSchemaValidatorE2F9718DE3D050819Cdc6355A3A43200 as JSONSchemaValidatorE2F9718DE3D050819Cdc6355A3A43200_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e328f7d015535897877f3ecb0c927453 import (
-    JSONSchemaValidatorE328F7D015535897877F3Ecb0C927453 as JSONSchemaValidatorE328F7D015535897877F3Ecb0C927453_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e3934b0fb68a5ff787e65e9b7c8e6296 import (
-    JSONSchemaValidatorE3934B0FB68A5Ff787E65E9B7C8E6296 as JSONSchemaValidatorE3934B0FB68A5Ff787E65E9B7C8E6296_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e3d7ad943d3a50fb8c3be7327669e557 import (
-    JSONSchemaValidatorE3D7Ad943D3A50Fb8C3BE7327669E557 as JSONSchemaValidatorE3D7Ad943D3A50Fb8C3BE7327669E557_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e3e170003d865b9a8d76cbe1d2f268be import (
-    JSONSchemaValidatorE3E170003D865B9A8D76Cbe1D2F268Be as JSONSchemaValidatorE3E170003D865B9A8D76Cbe1D2F268Be_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e4a09bf566f35babad9e27f5eb61a86d import (
-    JSONSchemaValidatorE4A09Bf566F35BabAd9E27F5Eb61A86D as JSONSchemaValidatorE4A09Bf566F35BabAd9E27F5Eb61A86D_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e4d083d956805f63b970be543c34eb0e import (
-    JSONSchemaValidatorE4D083D956805F63B970Be543C34Eb0E as JSONSchemaValidatorE4D083D956805F63B970Be543C34Eb0E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e6c22549e5145c4892d0bd3b97614e07 import (
-    JSONSchemaValidatorE6C22549E5145C4892D0Bd3B97614E07 as JSONSchemaValidatorE6C22549E5145C4892D0Bd3B97614E07_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e6eed78cb55d51a1bfe669729df25689 import (
-    JSONSchemaValidatorE6Eed78CB55D51A1Bfe669729Df25689 as JSONSchemaValidatorE6Eed78CB55D51A1Bfe669729Df25689_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e7af120721c7519a84b13bbe4a1a0362 import (
-    JSONSchemaValidatorE7Af120721C7519A84B13Bbe4A1A0362 as JSONSchemaValidatorE7Af120721C7519A84B13Bbe4A1A0362_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e8271b05b62c54609f74b4f2f373ad5a import (
-    JSONSchemaValidatorE8271B05B62C54609F74B4F2F373Ad5A as JSONSchemaValidatorE8271B05B62C54609F74B4F2F373Ad5A_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_e85b40c5ca055f4c82281617a8f95644 import (
-    JSONSchemaValidatorE85B40C5Ca055F4C82281617A8F95644 as JSONSchemaValidatorE85B40C5Ca055F4C82281617A8F95644_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ea4363569a9d58779c2bfc05b6e45423 import (
-    JSONSchemaValidatorEa4363569A9D58779C2BFc05B6E45423 as JSONSchemaValidatorEa4363569A9D58779C2BFc05B6E45423_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ea59df3daf2a57a0b48044cc49c8a1ca import (
-    JSONSchemaValidatorEa59Df3DAf2A57A0B48044Cc49C8A1Ca as JSONSchemaValidatorEa59Df3DAf2A57A0B48044Cc49C8A1Ca_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ea5f116c0cd152bbb4a92c043738ea57 import (
-    JSONSchemaValidatorEa5F116C0Cd152BbB4A92C043738Ea57 as JSONSchemaValidatorEa5F116C0Cd152BbB4A92C043738Ea57_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_eab4d187be085cac8a53971def40bee0 import (
-    JSONSchemaValidatorEab4D187Be085Cac8A53971Def40Bee0 as JSONSchemaValidatorEab4D187Be085Cac8A53971Def40Bee0_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_eb4a05f61e475ad0b9e74f963f27ea1d import (
-    JSONSchemaValidatorEb4A05F61E475Ad0B9E74F963F27Ea1D as JSONSchemaValidatorEb4A05F61E475Ad0B9E74F963F27Ea1D_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ecdb2d14c29b5bf3ad79ed2e3cc70715 import (
-    JSONSchemaValidatorEcdb2D14C29B5Bf3Ad79Ed2E3Cc70715 as JSONSchemaValidatorEcdb2D14C29B5Bf3Ad79Ed2E3Cc70715_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ed266e6eda225aedbf581508635da822 import (
-    JSONSchemaValidatorEd266E6EDa225AedBf581508635Da822 as JSONSchemaValidatorEd266E6EDa225AedBf581508635Da822_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ed9125b257ea54b79ef2db2d8ebd9d00 import (
-    JSONSchemaValidatorEd9125B257Ea54B79Ef2Db2D8Ebd9D00 as JSONSchemaValidatorEd9125B257Ea54B79Ef2Db2D8Ebd9D00_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_edf997bb4bcc5dd6baca80647d8a47ce import (
-    JSONSchemaValidatorEdf997Bb4Bcc5Dd6Baca80647D8A47Ce as JSONSchemaValidatorEdf997Bb4Bcc5Dd6Baca80647D8A47Ce_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_eeb595d249295989a4917261463ea82a import (
-    JSONSchemaValidatorEeb595D249295989A4917261463Ea82A as JSONSchemaValidatorEeb595D249295989A4917261463Ea82A_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_eecf4323cb285985be72a7e061891059 import (
-    JSONSchemaValidatorEecf4323Cb285985Be72A7E061891059 as JSONSchemaValidatorEecf4323Cb285985Be72A7E061891059_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ef94c2c20ba15fd38e129ac75067de1e import (
-    JSONSchemaValidatorEf94C2C20Ba15Fd38E129Ac75067De1E as JSONSchemaValidatorEf94C2C20Ba15Fd38E129Ac75067De1E_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f08eb586113e597a91b1658297570934 import (
-    JSONSchemaValidatorF08Eb586113E597A91B1658297570934 as JSONSchemaValidatorF08Eb586113E597A91B1658297570934_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f0942fbb79f855e889d60777f41ea944 import (
-    JSONSchemaValidatorF0942Fbb79F855E889D60777F41Ea944 as JSONSchemaValidatorF0942Fbb79F855E889D60777F41Ea944_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f0f7b6e1e4e159e7a40001fc3e649dfc import (
-    JSONSchemaValidatorF0F7B6E1E4E159E7A40001Fc3E649Dfc as JSONSchemaValidatorF0F7B6E1E4E159E7A40001Fc3E649Dfc_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f15aaad792fc57fd89c880afc3b84dc4 import (
-    JSONSchemaValidatorF15Aaad792Fc57Fd89C880Afc3B84Dc4 as JSONSchemaValidatorF15Aaad792Fc57Fd89C880Afc3B84Dc4_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f200dc9a10d25beab1243a5b29f99c7d import (
-    JSONSchemaValidatorF200Dc9A10D25BeaB1243A5B29F99C7D as JSONSchemaValidatorF200Dc9A10D25BeaB1243A5B29F99C7D_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f20eecc6e2d95a03a9e8961cd4337467 import (
-    JSONSchemaValidatorF20Eecc6E2D95A03A9E8961Cd4337467 as JSONSchemaValidatorF20Eecc6E2D95A03A9E8961Cd4337467_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f210ff2d89425b4790ce56f19da7be92 import (
-    JSONSchemaValidatorF210Ff2D89425B4790Ce56F19Da7Be92 as JSONSchemaValidatorF210Ff2D89425B4790Ce56F19Da7Be92_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f325b2c7e429566ba5ed9ae8253b5bef import (
-    JSONSchemaValidatorF325B2C7E429566BA5Ed9Ae8253B5Bef as JSONSchemaValidatorF325B2C7E429566BA5Ed9Ae8253B5Bef_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f667322836d5527482ad2100bec7feb4 import (
-    JSONSchemaValidatorF667322836D5527482Ad2100Bec7Feb4 as JSONSchemaValidatorF667322836D5527482Ad2100Bec7Feb4_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f6a4086c00f45dc5a634f0b8db5cdfd3 import (
-    JSONSchemaValidatorF6A4086C00F45Dc5A634F0B8Db5Cdfd3 as JSONSchemaValidatorF6A4086C00F45Dc5A634F0B8Db5Cdfd3_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f6f9dde38ce458fcaf27ffd4f84bfe68 import (
-    JSONSchemaValidatorF6F9Dde38Ce458FcAf27Ffd4F84Bfe68 as JSONSchemaValidatorF6F9Dde38Ce458FcAf27Ffd4F84Bfe68_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f8b4842604b65658afb34b4f124db469 import (
-    JSONSchemaValidatorF8B4842604B65658Afb34B4F124Db469 as JSONSchemaValidatorF8B4842604B65658Afb34B4F124Db469_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f924b4c27d18500b9b23df516b55c182 import (
-    JSONSchemaValidatorF924B4C27D18500B9B23Df516B55C182 as JSONSchemaValidatorF924B4C27D18500B9B23Df516B55C182_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f9492367570c5f009cf8b5955790e87c import (
-    JSONSchemaValidatorF9492367570C5F009Cf8B5955790E87C as JSONSchemaValidatorF9492367570C5F009Cf8B5955790E87C_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f95014e3b3385f21afa39325f3508427 import (
-    JSONSchemaValidatorF95014E3B3385F21Afa39325F3508427 as JSONSchemaValidatorF95014E3B3385F21Afa39325F3508427_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_f99c96c3a9b45ddaabc2c75ff8efa67f import (
-    JSONSchemaValidatorF99C96C3A9B45DdaAbc2C75Ff8Efa67F as JSONSchemaValidatorF99C96C3A9B45DdaAbc2C75Ff8Efa67F_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fa3975be5af25501abb40339d96917eb import (
-    JSONSchemaValidatorFa3975Be5Af25501Abb40339D96917Eb as JSONSchemaValidatorFa3975Be5Af25501Abb40339D96917Eb_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fa8fb3bdbffe5958858f20447dcb3ca5 import (
-    JSONSchemaValidatorFa8Fb3BdBffe5958858F20447Dcb3Ca5 as JSONSchemaValidatorFa8Fb3BdBffe5958858F20447Dcb3Ca5_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fb5e152d4d3d59f5afd92f717f3a1eea import (
-    JSONSchemaValidatorFb5E152D4D3D59F5Afd92F717F3A1Eea as JSONSchemaValidatorFb5E152D4D3D59F5Afd92F717F3A1Eea_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fbdd94fbecd256c08e1d9f6e1a7657ac import (
-    JSONSchemaValidatorFbdd94FbEcd256C08E1D9F6E1A7657Ac as JSONSchemaValidatorFbdd94FbEcd256C08E1D9F6E1A7657Ac_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fc416739f3c655ed911884aec0130e83 import (
-    JSONSchemaValidatorFc416739F3C655Ed911884Aec0130E83 as JSONSchemaValidatorFc416739F3C655Ed911884Aec0130E83_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fc8410781af357b6be17a2104ce5efb1 import (
-    JSONSchemaValidatorFc8410781Af357B6Be17A2104Ce5Efb1 as JSONSchemaValidatorFc8410781Af357B6Be17A2104Ce5Efb1_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fd488ff002115f3b8f0ee165e5347609 import (
-    JSONSchemaValidatorFd488Ff002115F3B8F0EE165E5347609 as JSONSchemaValidatorFd488Ff002115F3B8F0EE165E5347609_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fdbe4ec3e9f252a988404dc94250b80d import (
-    JSONSchemaValidatorFdbe4Ec3E9F252A988404Dc94250B80D as JSONSchemaValidatorFdbe4Ec3E9F252A988404Dc94250B80D_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_fdfc828270d950ecb75480fe03f7d573 import (
-    JSONSchemaValidatorFdfc828270D950EcB75480Fe03F7D573 as JSONSchemaValidatorFdfc828270D950EcB75480Fe03F7D573_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ff5bf5a67c6c5c0aa9e7ba84c088e1a6 import (
-    JSONSchemaValidatorFf5Bf5A67C6C5C0AA9E7Ba84C088E1A6 as JSONSchemaValidatorFf5Bf5A67C6C5C0AA9E7Ba84C088E1A6_v3_1_3_0,
-)
-from .validators.v3_1_3_0.jsd_ffd2fefb57d5523c87a5d941eb93ddc3 import (
-    JSONSchemaValidatorFfd2Fefb57D5523C87A5D941Eb93Ddc3 as JSONSchemaValidatorFfd2Fefb57D5523C87A5D941Eb93Ddc3_v3_1_3_0,
-)
-from .validators.v3_1_6_0.jsd_d5f8cf25475dc5be53f35357aca5a4 import (
-    JSONSchemaValidatorD5F8Cf25475Dc5Be53F35357Aca5A4 as JSONSchemaValidatorD5F8Cf25475Dc5Be53F35357Aca5A4_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b2f15d0c54c2862a60a904289ddd import (
-    JSONSchemaValidatorB2F15D0C54C2862A60A904289Ddd as JSONSchemaValidatorB2F15D0C54C2862A60A904289Ddd_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e4d208b5545f66bf0f94a155c81f46 import (
-    JSONSchemaValidatorE4D208B5545F66Bf0F94A155C81F46 as JSONSchemaValidatorE4D208B5545F66Bf0F94A155C81F46_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cd9d7d858f094469abf9464431f import (
-    JSONSchemaValidatorCd9D7D858F094469Abf9464431F as JSONSchemaValidatorCd9D7D858F094469Abf9464431F_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bece53a182b45ffa4a1a435e import (
-    JSONSchemaValidatorBece53A182B45Ffa4A1A435E as JSONSchemaValidatorBece53A182B45Ffa4A1A435E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cdc0bafd4257e78d211a1f4120bfa9 import (
-    JSONSchemaValidatorCdc0BaFd4257E78D211A1F4120Bfa9 as JSONSchemaValidatorCdc0BaFd4257E78D211A1F4120Bfa9_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e22c99a82f5764828810acb45e7a9e import (
-    JSONSchemaValidatorE22C99A82F5764828810Acb45E7A9E as JSONSchemaValidatorE22C99A82F5764828810Acb45E7A9E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cfb964a2958909f7ca12d23ab2bdb import (
-    JSONSchemaValidatorCfb964A2958909F7CA12D23Ab2Bdb as JSONSchemaValidatorCfb964A2958909F7CA12D23Ab2Bdb_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c2a16208da55e8a615348ed3d530ac import (
-    JSONSchemaValidatorC2A16208Da55E8A615348Ed3D530Ac as JSONSchemaValidatorC2A16208Da55E8A615348Ed3D530Ac_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cca68e89d0545dac01a8c7a461ac6e import (
-    JSONSchemaValidatorCca68E89D0545DAc01A8C7A461Ac6E as JSONSchemaValidatorCca68E89D0545DAc01A8C7A461Ac6E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ee8590b6b45048b84e814161272bee import (
-    JSONSchemaValidatorEe8590B6B45048B84E814161272Bee as JSONSchemaValidatorEe8590B6B45048B84E814161272Bee_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bb7c52e5225e9398a006fecf4da06f import (
-    JSONSchemaValidatorBb7C52E5225E9398A006Fecf4Da06F as JSONSchemaValidatorBb7C52E5225E9398A006Fecf4Da06F_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d5da0365e31972173f015ed3614 import (
-    JSONSchemaValidatorD5DA0365E31972173F015Ed3614 as JSONSchemaValidatorD5DA0365E31972173F015Ed3614_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_97e350a7a690cdfeffa5eaca import (
-    JSONSchemaValidator97E350A7A690Cdfeffa5Eaca as JSONSchemaValidator97E350A7A690Cdfeffa5Eaca_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_eec9550d3b5c9c9a10e65c3ef2fc2d import (
-    JSONSchemaValidatorEec9550D3B5C9C9A10E65C3Ef2Fc2D as JSONSchemaValidatorEec9550D3B5C9C9A10E65C3Ef2Fc2D_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f57dc44184564cb97a6573a44ad394 import (
-    JSONSchemaValidatorF57Dc44184564CB97A6573A44Ad394 as JSONSchemaValidatorF57Dc44184564CB97A6573A44Ad394_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fd6083b0c65d03b2d53f10b3ece59d import (
-    JSONSchemaValidatorFd6083B0C65D03B2D53F10B3Ece59D as JSONSchemaValidatorFd6083B0C65D03B2D53F10B3Ece59D_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a0a8d545698d1d59a9be90e51 import (
-    JSONSchemaValidatorA0A8D545698D1D59A9Be90E51 as JSONSchemaValidatorA0A8D545698D1D59A9Be90E51_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ecfe864dc5012ab9c25d23e2ce9f5 import (
-    JSONSchemaValidatorEcfe864Dc5012Ab9C25D23E2Ce9F5 as JSONSchemaValidatorEcfe864Dc5012Ab9C25D23E2Ce9F5_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fe8fb526f9b3b8f3c7aaeebac import (
-    JSONSchemaValidatorFE8Fb526F9B3B8F3C7Aaeebac as JSONSchemaValidatorFE8Fb526F9B3B8F3C7Aaeebac_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d7073129453698264e7519d82991c import (
-    JSONSchemaValidatorD7073129453698264E7519D82991C as JSONSchemaValidatorD7073129453698264E7519D82991C_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f751cc2f55767b34e4c890b3fd36e import (
-    JSONSchemaValidatorF751CC2F55767B34E4C890B3Fd36E as JSONSchemaValidatorF751CC2F55767B34E4C890B3Fd36E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c90586f562b8fc0451b7e71b35a import (
-    JSONSchemaValidatorC90586F562B8Fc0451B7E71B35A as JSONSchemaValidatorC90586F562B8Fc0451B7E71B35A_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f790a930d452708353c374f5c0f90f import (
-    JSONSchemaValidatorF790A930D452708353C374F5C0F90F as JSONSchemaValidatorF790A930D452708353C374F5C0F90F_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a41ac8d894e5ee98fc9324fb8488174 import (
-    JSONSchemaValidatorA41Ac8D894E5Ee98Fc9324Fb8488174 as JSONSchemaValidatorA41Ac8D894E5Ee98Fc9324Fb8488174_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a544e27e18e5412af3b68d915c8ca50 import (
-    JSONSchemaValidatorA544E27E18E5412Af3B68D915C8Ca50 as JSONSchemaValidatorA544E27E18E5412Af3B68D915C8Ca50_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_af7031cc5ca5b44af0e6454d558412c import (
-    JSONSchemaValidatorAf7031CC5Ca5B44Af0E6454D558412C as JSONSchemaValidatorAf7031CC5Ca5B44Af0E6454D558412C_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b9fbd53af6a5b46b34b17e601680801 import (
-    JSONSchemaValidatorB9Fbd53Af6A5B46B34B17E601680801 as JSONSchemaValidatorB9Fbd53Af6A5B46B34B17E601680801_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d999a1d36ee52babb6b619877dad734 import (
-    JSONSchemaValidatorD999A1D36Ee52BaBb6B619877Dad734 as JSONSchemaValidatorD999A1D36Ee52BaBb6B619877Dad734_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e86b65311b05d29ba5eea0d5f1fd88f import (
-    JSONSchemaValidatorE86B65311B05D29Ba5EEa0D5F1Fd88F as JSONSchemaValidatorE86B65311B05D29Ba5EEa0D5F1Fd88F_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f44ddd3c38c5a9484f5cb4e125447bc import (
-    JSONSchemaValidatorF44Ddd3C38C5A9484F5Cb4E125447Bc as JSONSchemaValidatorF44Ddd3C38C5A9484F5Cb4E125447Bc_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cd16daa50533eb0f5873b7601abb2 import (
-    JSONSchemaValidatorCd16DAa50533EB0F5873B7601Abb2 as JSONSchemaValidatorCd16DAa50533EB0F5873B7601Abb2_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c7266d89581c9601b79b7304fda3 import (
-    JSONSchemaValidatorC7266D89581C9601B79B7304Fda3 as JSONSchemaValidatorC7266D89581C9601B79B7304Fda3_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ce6c2c14553f9a4a88f66a04c21c4 import (
-    JSONSchemaValidatorCe6C2C14553F9A4A88F66A04C21C4 as JSONSchemaValidatorCe6C2C14553F9A4A88F66A04C21C4_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e5bb87a955e33a7ee46f1085fd880 import (
-    JSONSchemaValidatorE5Bb87A955E33A7Ee46F1085Fd880 as JSONSchemaValidatorE5Bb87A955E33A7Ee46F1085Fd880_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d76a951f85a7a927afc2f1ea935c8 import (
-    JSONSchemaValidatorD76A951F85A7A927AFc2F1Ea935C8 as JSONSchemaValidatorD76A951F85A7A927AFc2F1Ea935C8_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ee7664344f50cb8f2c94beaa01629d import (
-    JSONSchemaValidatorEe7664344F50Cb8F2C94Beaa01629D as JSONSchemaValidatorEe7664344F50Cb8F2C94Beaa01629D_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f2c49c69c53e7b4f57f2af9a6f597 import (
-    JSONSchemaValidatorF2C49C69C53E7B4F57F2Af9A6F597 as JSONSchemaValidatorF2C49C69C53E7B4F57F2Af9A6F597_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e1a76c121857a085149e62e56caadd import (
-    JSONSchemaValidatorE1A76C121857A085149E62E56Caadd as JSONSchemaValidatorE1A76C121857A085149E62E56Caadd_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ca2f659b595c0ba7c649fd8c8bdad6 import (
-    JSONSchemaValidatorCa2F659B595C0BA7C649Fd8C8Bdad6 as JSONSchemaValidatorCa2F659B595C0BA7C649Fd8C8Bdad6_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a4dab79d54829548004029a91ba1 import (
-    JSONSchemaValidatorA4DaB79D54829548004029A91Ba1 as JSONSchemaValidatorA4DaB79D54829548004029A91Ba1_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f5a13405ba69f3957b98db8663a import (
-    JSONSchemaValidatorF5A13405Ba69F3957B98Db8663A as JSONSchemaValidatorF5A13405Ba69F3957B98Db8663A_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_6ce35f19bc4c1d058aa01536 import (
-    JSONSchemaValidator6Ce35F19Bc4C1D058Aa01536 as JSONSchemaValidator6Ce35F19Bc4C1D058Aa01536_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b107800544384c1ddad7b60c237 import (
-    JSONSchemaValidatorB107800544384C1Ddad7B60C237 as JSONSchemaValidatorB107800544384C1Ddad7B60C237_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a3954b27e5eeb82789ed231e0557f import (
-    JSONSchemaValidatorA3954B27E5Eeb82789Ed231E0557F as JSONSchemaValidatorA3954B27E5Eeb82789Ed231E0557F_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e3a724a35854758d65a83823c88435 import (
-    JSONSchemaValidatorE3A724A35854758D65A83823C88435 as JSONSchemaValidatorE3A724A35854758D65A83823C88435_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d7b57050bdb98e9340d0bc4dba import (
-    JSONSchemaValidatorD7B57050BdB98E9340D0Bc4Dba as JSONSchemaValidatorD7B57050BdB98E9340D0Bc4Dba_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a2131eae5c1d8e73cd55eebf6a83 import (
-    JSONSchemaValidatorA2131Eae5C1D8E73Cd55Eebf6A83 as JSONSchemaValidatorA2131Eae5C1D8E73Cd55Eebf6A83_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ff99068551d588a7aeb33c28dff0 import (
-    JSONSchemaValidatorFf99068551D588A7Aeb33C28Dff0 as JSONSchemaValidatorFf99068551D588A7Aeb33C28Dff0_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f21b7552158e889b51d0c109c15db import (
-    JSONSchemaValidatorF21B7552158E889B51D0C109C15Db as JSONSchemaValidatorF21B7552158E889B51D0C109C15Db_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f2562a2d8e5ec287738032961762ed import (
-    JSONSchemaValidatorF2562A2D8E5Ec287738032961762Ed as JSONSchemaValidatorF2562A2D8E5Ec287738032961762Ed_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f256e33af7501a8bdae2742ca9f6d6 import (
-    JSONSchemaValidatorF256E33Af7501A8BdaE2742Ca9F6D6 as JSONSchemaValidatorF256E33Af7501A8BdaE2742Ca9F6D6_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_af13df5f57e523e9da74929b0dc587e import (
-    JSONSchemaValidatorAf13Df5F57E523E9Da74929B0Dc587E as JSONSchemaValidatorAf13Df5F57E523E9Da74929B0Dc587E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b269afaaa855d3291b825f724fc8ea9 import (
-    JSONSchemaValidatorB269AfaAa855D3291B825F724Fc8Ea9 as JSONSchemaValidatorB269AfaAa855D3291B825F724Fc8Ea9_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b3323a24b275402b97c7e9ccfd78c91 import (
-    JSONSchemaValidatorB3323A24B275402B97C7E9Ccfd78C91 as JSONSchemaValidatorB3323A24B275402B97C7E9Ccfd78C91_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bfab2e1d87654afb88c77fcfae4e407 import (
-    JSONSchemaValidatorBfab2E1D87654AfB88C77Fcfae4E407 as JSONSchemaValidatorBfab2E1D87654AfB88C77Fcfae4E407_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ca519342eb25dfcaf15f8f44baf0ee0 import (
-    JSONSchemaValidatorCa519342Eb25DfcAf15F8F44Baf0Ee0 as JSONSchemaValidatorCa519342Eb25DfcAf15F8F44Baf0Ee0_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cc239fa9b185ecbab9e306289850a63 import (
-    JSONSchemaValidatorCc239Fa9B185EcbAb9E306289850A63 as JSONSchemaValidatorCc239Fa9B185EcbAb9E306289850A63_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ccbaf226c685cacac29eb345955f3ad import (
-    JSONSchemaValidatorCcbaf226C685CacAc29Eb345955F3Ad as JSONSchemaValidatorCcbaf226C685CacAc29Eb345955F3Ad_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d1845268faf55f98bc952872259f16f import (
-    JSONSchemaValidatorD1845268Faf55F98Bc952872259F16F as JSONSchemaValidatorD1845268Faf55F98Bc952872259F16F_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d9bd7c527d254ecb63d2b709c428043 import (
-    JSONSchemaValidatorD9Bd7C527D254EcB63D2B709C428043 as JSONSchemaValidatorD9Bd7C527D254EcB63D2B709C428043_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e5e51bcda0b5fec984ba8120f743fe2 import (
-    JSONSchemaValidatorE5E51BcDa0B5Fec984BA8120F743Fe2 as JSONSchemaValidatorE5E51BcDa0B5Fec984BA8120F743Fe2_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_efc2269ee565e23b7be7b49e4fc0322 import (
-    JSONSchemaValidatorEfc2269Ee565E23B7Be7B49E4Fc0322 as JSONSchemaValidatorEfc2269Ee565E23B7Be7B49E4Fc0322_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f77386a48895fa59dcddcc7dd4addb5 import (
-    JSONSchemaValidatorF77386A48895Fa59DcdDcc7Dd4Addb5 as JSONSchemaValidatorF77386A48895Fa59DcdDcc7Dd4Addb5_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ffa347eb411567a9c793696795250a5 import (
-    JSONSchemaValidatorFfa347EB411567A9C793696795250A5 as JSONSchemaValidatorFfa347EB411567A9C793696795250A5_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ffcaccdd9f2530abf66adc98c3f0201 import (
-    JSONSchemaValidatorFfcaccdD9F2530ABf66Adc98C3F0201 as JSONSchemaValidatorFfcaccdD9F2530ABf66Adc98C3F0201_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b9be51e25efc9f41d4f68451f9a6 import (
-    JSONSchemaValidatorB9Be51E25Efc9F41D4F68451F9A6 as JSONSchemaValidatorB9Be51E25Efc9F41D4F68451F9A6_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c765afc72581d862cd61f5139d224 import (
-    JSONSchemaValidatorC765AFc72581D862CD61F5139D224 as JSONSchemaValidatorC765AFc72581D862CD61F5139D224_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bf80823752baba63a8849fd521cd import (
-    JSONSchemaValidatorBf80823752BaBa63A8849Fd521Cd as JSONSchemaValidatorBf80823752BaBa63A8849Fd521Cd_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d833c51c4f5cd2879d3e69f773295c import (
-    JSONSchemaValidatorD833C51C4F5Cd2879D3E69F773295C as JSONSchemaValidatorD833C51C4F5Cd2879D3E69F773295C_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fa310ab095148bdb00d7d3d5e1676 import (
-    JSONSchemaValidatorFa310Ab095148Bdb00D7D3D5E1676 as JSONSchemaValidatorFa310Ab095148Bdb00D7D3D5E1676_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a9136d5513985f15e91a19da66c import (
-    JSONSchemaValidatorA9136D5513985F15E91A19Da66C as JSONSchemaValidatorA9136D5513985F15E91A19Da66C_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b887c55faaca726bbe4ac2564 import (
-    JSONSchemaValidatorB887C55FaAca726Bbe4Ac2564 as JSONSchemaValidatorB887C55FaAca726Bbe4Ac2564_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_438d5b72acb418347ec1e1fa import (
-    JSONSchemaValidator438D5B72Acb418347Ec1E1Fa as JSONSchemaValidator438D5B72Acb418347Ec1E1Fa_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f90ae8599c8a21c98b7a1ca804 import (
-    JSONSchemaValidatorF90Ae8599C8A21C98B7A1Ca804 as JSONSchemaValidatorF90Ae8599C8A21C98B7A1Ca804_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a94058a99acaaf8eb73c9227 import (
-    JSONSchemaValidatorA94058A99AcaAf8Eb73C9227 as JSONSchemaValidatorA94058A99AcaAf8Eb73C9227_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cfb1d6e52878d057740de275896 import (
-    JSONSchemaValidatorCfb1D6E52878D057740De275896 as JSONSchemaValidatorCfb1D6E52878D057740De275896_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a4829a44597bbf9813664eb75de0 import (
-    JSONSchemaValidatorA4829A44597BBf9813664Eb75De0 as JSONSchemaValidatorA4829A44597BBf9813664Eb75De0_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b8b02e13a5281934aecf58df4682d import (
-    JSONSchemaValidatorB8B02E13A5281934AEcf58Df4682D as JSONSchemaValidatorB8B02E13A5281934AEcf58Df4682D_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bdc981805b5fad0a038966d52558 import (
-    JSONSchemaValidatorBdc981805B5FAd0A038966D52558 as JSONSchemaValidatorBdc981805B5FAd0A038966D52558_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_df9908ad265e83ab77d73803925678 import (
-    JSONSchemaValidatorDf9908Ad265E83Ab77D73803925678 as JSONSchemaValidatorDf9908Ad265E83Ab77D73803925678_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e37e7d81575d35a974df797e0a2268 import (
-    JSONSchemaValidatorE37E7D81575D35A974Df797E0A2268 as JSONSchemaValidatorE37E7D81575D35A974Df797E0A2268_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a924f763a15125a8d5beaa6dd6fa2c import (
-    JSONSchemaValidatorA924F763A15125A8D5Beaa6Dd6Fa2C as JSONSchemaValidatorA924F763A15125A8D5Beaa6Dd6Fa2C_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_de4c9b685250dfa8556ab1ec20407c import (
-    JSONSchemaValidatorDe4C9B685250DfA8556Ab1Ec20407C as JSONSchemaValidatorDe4C9B685250DfA8556Ab1Ec20407C_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a15a2f83f975a6a9964e7da79a605de import (
-    JSONSchemaValidatorA15A2F83F975A6A9964E7Da79A605De as JSONSchemaValidatorA15A2F83F975A6A9964E7Da79A605De_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a3a1bf404bf5772828f66f1e10f074d import (
-    JSONSchemaValidatorA3A1Bf404Bf5772828F66F1E10F074D as JSONSchemaValidatorA3A1Bf404Bf5772828F66F1E10F074D_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a7283357c1657bf8ccb3d32a96249d4 import (
-    JSONSchemaValidatorA7283357C1657Bf8Ccb3D32A96249D4 as JSONSchemaValidatorA7283357C1657Bf8Ccb3D32A96249D4_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b4635c45c3b5e44a30d84daa1d5fb69 import (
-    JSONSchemaValidatorB4635C45C3B5E44A30D84Daa1D5Fb69 as JSONSchemaValidatorB4635C45C3B5E44A30D84Daa1D5Fb69_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b60f9f312235959812d49dc4c469e83 import (
-    JSONSchemaValidatorB60F9F312235959812D49Dc4C469E83 as JSONSchemaValidatorB60F9F312235959812D49Dc4C469E83_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bb01b6bd31b53bfb12bbe327320392e import (
-    JSONSchemaValidatorBb01B6BD31B53BfB12BBe327320392E as JSONSchemaValidatorBb01B6BD31B53BfB12BBe327320392E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c224ae3007d5486bbc5abb1f88e95e6 import (
-    JSONSchemaValidatorC224Ae3007D5486Bbc5Abb1F88E95E6 as JSONSchemaValidatorC224Ae3007D5486Bbc5Abb1F88E95E6_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d9ed5bba1155b9c8fe132640832f94e import (
-    JSONSchemaValidatorD9Ed5BbA1155B9C8Fe132640832F94E as JSONSchemaValidatorD9Ed5BbA1155B9C8Fe132640832F94E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d9f276a532e5eeb86bb591f8537fcc7 import (
-    JSONSchemaValidatorD9F276A532E5Eeb86Bb591F8537Fcc7 as JSONSchemaValidatorD9F276A532E5Eeb86Bb591F8537Fcc7_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e69d02d71905aecbd10b782469efbda import (
-    JSONSchemaValidatorE69D02D71905AecBd10B782469Efbda as JSONSchemaValidatorE69D02D71905AecBd10B782469Efbda_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e722e05046d5262b55c125237e9b67d import (
-    JSONSchemaValidatorE722E05046D5262B55C125237E9B67D as JSONSchemaValidatorE722E05046D5262B55C125237E9B67D_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e9c39175d785a0eb9d6f402f378a2ba import (
-    JSONSchemaValidatorE9C39175D785A0EB9D6F402F378A2Ba as JSONSchemaValidatorE9C39175D785A0EB9D6F402F378A2Ba_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d77719c37558f694e5545a21406275 import (
-    JSONSchemaValidatorD77719C37558F694E5545A21406275 as JSONSchemaValidatorD77719C37558F694E5545A21406275_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d9a13d575abdc26d485af708e7 import (
-    JSONSchemaValidatorD9A13D575ABdc26D485Af708E7 as JSONSchemaValidatorD9A13D575ABdc26D485Af708E7_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c7315d78a2ddda76b62777e8 import (
-    JSONSchemaValidatorC7315D78A2DdDa76B62777E8 as JSONSchemaValidatorC7315D78A2DdDa76B62777E8_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c279ba052250d883ef87775a415089 import (
-    JSONSchemaValidatorC279Ba052250D883Ef87775A415089 as JSONSchemaValidatorC279Ba052250D883Ef87775A415089_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_af893464e53d2abc8922f4f3310ea import (
-    JSONSchemaValidatorAf893464E53D2Abc8922F4F3310Ea as JSONSchemaValidatorAf893464E53D2Abc8922F4F3310Ea_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d2bd5f05bd535a89ebadb30e2ede9e import (
-    JSONSchemaValidatorD2Bd5F05Bd535A89EbAdb30E2Ede9E as JSONSchemaValidatorD2Bd5F05Bd535A89EbAdb30E2Ede9E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f33d768d01586c9133b155da5e5ade import (
-    JSONSchemaValidatorF33D768D01586C9133B155Da5E5Ade as JSONSchemaValidatorF33D768D01586C9133B155Da5E5Ade_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f624469d5e448e9eba137fe533e8 import (
-    JSONSchemaValidatorF624469D5E448E9EBa137Fe533E8 as JSONSchemaValidatorF624469D5E448E9EBa137Fe533E8_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d2ece28b509b8ef80b2b8c5c5f36 import (
-    JSONSchemaValidatorD2EcE28B509B8Ef80B2B8C5C5F36 as JSONSchemaValidatorD2EcE28B509B8Ef80B2B8C5C5F36_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e31c795964b3bdf85da1b5a2a5 import (
-    JSONSchemaValidatorE31C795964B3BdF85Da1B5A2A5 as JSONSchemaValidatorE31C795964B3BdF85Da1B5A2A5_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_dabd13cd5e9c928daf80d6758d62 import (
-    JSONSchemaValidatorDabd13Cd5E9C928DAf80D6758D62 as JSONSchemaValidatorDabd13Cd5E9C928DAf80D6758D62_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b46a141650debf5946262e8a0961 import (
-    JSONSchemaValidatorB46A141650DeBf5946262E8A0961 as JSONSchemaValidatorB46A141650DeBf5946262E8A0961_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b8699619f95a24bd2d81f12f048235 import (
-    JSONSchemaValidatorB8699619F95A24Bd2D81F12F048235 as JSONSchemaValidatorB8699619F95A24Bd2D81F12F048235_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c00df3623b5a74ad41e75487ed9b77 import (
-    JSONSchemaValidatorC00Df3623B5A74Ad41E75487Ed9B77 as JSONSchemaValidatorC00Df3623B5A74Ad41E75487Ed9B77_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cf0138550909ea413dab063868c import (
-    JSONSchemaValidatorCf0138550909Ea413Dab063868C as JSONSchemaValidatorCf0138550909Ea413Dab063868C_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a64bd4956649de3a61e10f0637e import (
-    JSONSchemaValidatorA64Bd4956649De3A61E10F0637E as JSONSchemaValidatorA64Bd4956649De3A61E10F0637E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bc1f37a9f2571fa4d7bc85b9e8a583 import (
-    JSONSchemaValidatorBc1F37A9F2571FA4D7Bc85B9E8A583 as JSONSchemaValidatorBc1F37A9F2571FA4D7Bc85B9E8A583_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e70de44247549f9e49cfa5c6b24de9 import (
-    JSONSchemaValidatorE70De44247549F9E49Cfa5C6B24De9 as JSONSchemaValidatorE70De44247549F9E49Cfa5C6B24De9_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a88c7510a15578b8eb2df183a92d5d import (
-    JSONSchemaValidatorA88C7510A15578B8Eb2Df183A92D5D as JSONSchemaValidatorA88C7510A15578B8Eb2Df183A92D5D_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_febb2149ac5f8ba25dbf4d9a862d94 import (
-    JSONSchemaValidatorFebb2149Ac5F8BA25DBf4D9A862D94 as JSONSchemaValidatorFebb2149Ac5F8BA25DBf4D9A862D94_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cad522e57a7b96b7238935689ed import (
-    JSONSchemaValidatorCad522E57A7B96B7238935689Ed as JSONSchemaValidatorCad522E57A7B96B7238935689Ed_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e702d5786552992aa76b930780569 import (
-    JSONSchemaValidatorE702D5786552992Aa76B930780569 as JSONSchemaValidatorE702D5786552992Aa76B930780569_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cb98464ddb5ee9ba7ebb4428443ba9 import (
-    JSONSchemaValidatorCb98464Ddb5Ee9Ba7EBb4428443Ba9 as JSONSchemaValidatorCb98464Ddb5Ee9Ba7EBb4428443Ba9_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d292147221524a96616d982b0147c0 import (
-    JSONSchemaValidatorD292147221524A96616D982B0147C0 as JSONSchemaValidatorD292147221524A96616D982B0147C0_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_af29516f0c8591da2a92523b5ab3386 import (
-    JSONSchemaValidatorAf29516F0C8591DA2A92523B5Ab3386 as JSONSchemaValidatorAf29516F0C8591DA2A92523B5Ab3386_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bc9716ed6eb5c6e9ecb0380501d6138 import (
-    JSONSchemaValidatorBc9716ED6Eb5C6E9Ecb0380501D6138 as JSONSchemaValidatorBc9716ED6Eb5C6E9Ecb0380501D6138_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_caeb723a074519498c6b08a1c9dacb3 import (
-    JSONSchemaValidatorCaeb723A074519498C6B08A1C9Dacb3 as JSONSchemaValidatorCaeb723A074519498C6B08A1C9Dacb3_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_da35060d4a15da8b4c7d9176408ca1e import (
-    JSONSchemaValidatorDa35060D4A15Da8B4C7D9176408Ca1E as JSONSchemaValidatorDa35060D4A15Da8B4C7D9176408Ca1E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_de92f8ae3c15ea0bad5562452eb5c40 import (
-    JSONSchemaValidatorDe92F8AE3C15Ea0Bad5562452Eb5C40 as JSONSchemaValidatorDe92F8AE3C15Ea0Bad5562452Eb5C40_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f09c94c65c858e4b7be0b7cb3d25b7a import (
-    JSONSchemaValidatorF09C94C65C858E4B7Be0B7Cb3D25B7A as JSONSchemaValidatorF09C94C65C858E4B7Be0B7Cb3D25B7A_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f25c825ca6e58a5b1c2294b11558e7b import (
-    JSONSchemaValidatorF25C825Ca6E58A5B1C2294B11558E7B as JSONSchemaValidatorF25C825Ca6E58A5B1C2294B11558E7B_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c6506b22335101a465d2adf5ca7f37 import (
-    JSONSchemaValidatorC6506B22335101A465D2Adf5Ca7F37 as JSONSchemaValidatorC6506B22335101A465D2Adf5Ca7F37_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e0ed6b9a530ea05d77a199ded4e3 import (
-    JSONSchemaValidatorE0Ed6B9A530EA05D77A199Ded4E3 as JSONSchemaValidatorE0Ed6B9A530EA05D77A199Ded4E3_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a2be6dde4c587389e79d6cb84e54a6 import (
-    JSONSchemaValidatorA2Be6DDe4C587389E79D6Cb84E54A6 as JSONSchemaValidatorA2Be6DDe4C587389E79D6Cb84E54A6_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ad0cb5a12a76384ba4644e55e import (
-    JSONSchemaValidatorAD0Cb5A12A76384Ba4644E55E as JSONSchemaValidatorAD0Cb5A12A76384Ba4644E55E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fdd2af215b9b8327a3e24a3dea89 import (
-    JSONSchemaValidatorFdd2Af215B9B8327A3E24A3Dea89 as JSONSchemaValidatorFdd2Af215B9B8327A3E24A3Dea89_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d0456ad1d5bda99f7d9254f8a1ec3 import (
-    JSONSchemaValidatorD0456Ad1D5Bda99F7D9254F8A1Ec3 as JSONSchemaValidatorD0456Ad1D5Bda99F7D9254F8A1Ec3_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f71d0b2527b8cd13123f9a68cf3 import (
-    JSONSchemaValidatorF71D0B2527B8Cd13123F9A68Cf3 as JSONSchemaValidatorF71D0B2527B8Cd13123F9A68Cf3_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fee1860b4d509585956565df54a91a import (
-    JSONSchemaValidatorFee1860B4D509585956565Df54A91A as JSONSchemaValidatorFee1860B4D509585956565Df54A91A_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_dfe3872e591f9f3e2a0daa358c1a import (
-    JSONSchemaValidatorDfe3872E591F9F3E2A0Daa358C1A as JSONSchemaValidatorDfe3872E591F9F3E2A0Daa358C1A_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b42a01655325be161ab2ad60aa68 import (
-    JSONSchemaValidatorB42A01655325Be161Ab2Ad60Aa68 as JSONSchemaValidatorB42A01655325Be161Ab2Ad60Aa68_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fe62979a925778bdb0a974a7d86a12 import (
-    JSONSchemaValidatorFe62979A925778Bdb0A974A7D86A12 as JSONSchemaValidatorFe62979A925778Bdb0A974A7D86A12_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ae10ec6705f368476f7b35918122c import (
-    JSONSchemaValidatorAe10EC6705F368476F7B35918122C as JSONSchemaValidatorAe10EC6705F368476F7B35918122C_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a602eee5a56faa64436bade8a240e import (
-    JSONSchemaValidatorA602EEe5A56FaA64436Bade8A240E as JSONSchemaValidatorA602EEe5A56FaA64436Bade8A240E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e6ea8c5d425cf9ac77006f5593725f import (
-    JSONSchemaValidatorE6Ea8C5D425Cf9Ac77006F5593725F as JSONSchemaValidatorE6Ea8C5D425Cf9Ac77006F5593725F_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bcb1d489d735258975828f845df1769 import (
-    JSONSchemaValidatorBcb1D489D735258975828F845Df1769 as JSONSchemaValidatorBcb1D489D735258975828F845Df1769_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bd5b507f58a50aab614e3d7409eec4c import (
-    JSONSchemaValidatorBd5B507F58A50AaB614E3D7409Eec4C as JSONSchemaValidatorBd5B507F58A50AaB614E3D7409Eec4C_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c05f721266f5264869d10ac0e663812 import (
-    JSONSchemaValidatorC05F721266F5264869D10Ac0E663812 as JSONSchemaValidatorC05F721266F5264869D10Ac0E663812_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_db690b800995e35bc4e8c43d8ea6c18 import (
-    JSONSchemaValidatorDb690B800995E35Bc4E8C43D8Ea6C18 as JSONSchemaValidatorDb690B800995E35Bc4E8C43D8Ea6C18_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_dfc7c061f9259ee891e60fd91235129 import (
-    JSONSchemaValidatorDfc7C061F9259Ee891E60Fd91235129 as JSONSchemaValidatorDfc7C061F9259Ee891E60Fd91235129_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e235d44e4485bafa4499f5a8e53bcd3 import (
-    JSONSchemaValidatorE235D44E4485BafA4499F5A8E53Bcd3 as JSONSchemaValidatorE235D44E4485BafA4499F5A8E53Bcd3_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e4f91ea42515ccdbc24549b84ca1e90 import (
-    JSONSchemaValidatorE4F91Ea42515CcdBc24549B84Ca1E90 as JSONSchemaValidatorE4F91Ea42515CcdBc24549B84Ca1E90_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_efa7f7a97b95f5885a00e6981b27b11 import (
-    JSONSchemaValidatorEfa7F7A97B95F5885A00E6981B27B11 as JSONSchemaValidatorEfa7F7A97B95F5885A00E6981B27B11_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f5d13316c8f53a0b78d881c738a15c6 import (
-    JSONSchemaValidatorF5D13316C8F53A0B78D881C738A15C6 as JSONSchemaValidatorF5D13316C8F53A0B78D881C738A15C6_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f829d3e99565937b9d12c873f8faa46 import (
-    JSONSchemaValidatorF829D3E99565937B9D12C873F8Faa46 as JSONSchemaValidatorF829D3E99565937B9D12C873F8Faa46_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f8db651a7bb5f85a936c9fdadf3a9d9 import (
-    JSONSchemaValidatorF8Db651A7Bb5F85A936C9Fdadf3A9D9 as JSONSchemaValidatorF8Db651A7Bb5F85A936C9Fdadf3A9D9_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bbf7ce025bc2a291b90c37a6b898 import (
-    JSONSchemaValidatorBbf7Ce025Bc2A291B90C37A6B898 as JSONSchemaValidatorBbf7Ce025Bc2A291B90C37A6B898_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b2c5c14bd5ecba26b364716a91731 import (
-    JSONSchemaValidatorB2C5C14Bd5EcbA26B364716A91731 as JSONSchemaValidatorB2C5C14Bd5EcbA26B364716A91731_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_effb55c158f28469762804e84633 import (
-    JSONSchemaValidatorEffb55C158F28469762804E84633 as JSONSchemaValidatorEffb55C158F28469762804E84633_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fa2127b55124a3a00b2991b77db6 import (
-    JSONSchemaValidatorFa2127B55124A3A00B2991B77Db6 as JSONSchemaValidatorFa2127B55124A3A00B2991B77Db6_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b8a44ba454de8a7bb52d3efe97ca import (
-    JSONSchemaValidatorB8A44Ba454De8A7BB52D3Efe97Ca as JSONSchemaValidatorB8A44Ba454De8A7BB52D3Efe97Ca_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e0b654c39dc6e19cd6f5194d import (
-    JSONSchemaValidatorE0B654C39Dc6E19Cd6F5194D as JSONSchemaValidatorE0B654C39Dc6E19Cd6F5194D_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b3ff5f865f1c8122a0ec8ca73921 import (
-    JSONSchemaValidatorB3Ff5F865F1C8122A0Ec8Ca73921 as JSONSchemaValidatorB3Ff5F865F1C8122A0Ec8Ca73921_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_de1b75d59b083df0ece12259ecd import (
-    JSONSchemaValidatorDe1B75D59B083Df0Ece12259Ecd as JSONSchemaValidatorDe1B75D59B083Df0Ece12259Ecd_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fc95c917352ad8410ffe6d6e522ed import (
-    JSONSchemaValidatorFc95C917352Ad8410Ffe6D6E522Ed as JSONSchemaValidatorFc95C917352Ad8410Ffe6D6E522Ed_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ae7f02a3d051f2baf7cc087990d658 import (
-    JSONSchemaValidatorAe7F02A3D051F2Baf7Cc087990D658 as JSONSchemaValidatorAe7F02A3D051F2Baf7Cc087990D658_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c0204c665262a712caef988d7d88 import (
-    JSONSchemaValidatorC0204C665262A712Caef988D7D88 as JSONSchemaValidatorC0204C665262A712Caef988D7D88_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f50f8c552f5d2eb68d715e1318976e import (
-    JSONSchemaValidatorF50F8C552F5D2EB68D715E1318976E as JSONSchemaValidatorF50F8C552F5D2EB68D715E1318976E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d9227adc5f02b7cd264af7255d19 import (
-    JSONSchemaValidatorD9227Adc5F02B7Cd264Af7255D19 as JSONSchemaValidatorD9227Adc5F02B7Cd264Af7255D19_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_de4a255bc6849a7c9cec69f13c import (
-    JSONSchemaValidatorDe4A255Bc6849A7C9Cec69F13C as JSONSchemaValidatorDe4A255Bc6849A7C9Cec69F13C_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fdfba50738387ab89bede6252 import (
-    JSONSchemaValidatorFDfba50738387Ab89Bede6252 as JSONSchemaValidatorFDfba50738387Ab89Bede6252_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e6ec627d3c587288978990aae75228 import (
-    JSONSchemaValidatorE6Ec627D3C587288978990Aae75228 as JSONSchemaValidatorE6Ec627D3C587288978990Aae75228_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d58baa26bd5a6d9c461592c872d515 import (
-    JSONSchemaValidatorD58Baa26Bd5A6D9C461592C872D515 as JSONSchemaValidatorD58Baa26Bd5A6D9C461592C872D515_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_eb1227bb250799b6ca76ed4bee9d9 import (
-    JSONSchemaValidatorEb1227Bb250799B6CA76Ed4Bee9D9 as JSONSchemaValidatorEb1227Bb250799B6CA76Ed4Bee9D9_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c380301e3e05423bdc1857ff00ae77a import (
-    JSONSchemaValidatorC380301E3E05423Bdc1857Ff00Ae77A as JSONSchemaValidatorC380301E3E05423Bdc1857Ff00Ae77A_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c8354b61a36524cbb2e1037bd814807 import (
-    JSONSchemaValidatorC8354B61A36524CBb2E1037Bd814807 as JSONSchemaValidatorC8354B61A36524CBb2E1037Bd814807_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f1debbfd4775faba3779c513181dfbf import (
-    JSONSchemaValidatorF1DebbfD4775FabA3779C513181Dfbf as JSONSchemaValidatorF1DebbfD4775FabA3779C513181Dfbf_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f24f6c07641580ba6ed710e92c2da16 import (
-    JSONSchemaValidatorF24F6C07641580BA6Ed710E92C2Da16 as JSONSchemaValidatorF24F6C07641580BA6Ed710E92C2Da16_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f2dc0b2dd265d3bb69c5aeb5cff2f13 import (
-    JSONSchemaValidatorF2Dc0B2Dd265D3BB69C5Aeb5Cff2F13 as JSONSchemaValidatorF2Dc0B2Dd265D3BB69C5Aeb5Cff2F13_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f4ce55b5f235924903516ef31dc9e3c import (
-    JSONSchemaValidatorF4Ce55B5F235924903516Ef31Dc9E3C as JSONSchemaValidatorF4Ce55B5F235924903516Ef31Dc9E3C_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f75156ff30d50d1bced4ec466b56b38 import (
-    JSONSchemaValidatorF75156FF30D50D1Bced4Ec466B56B38 as JSONSchemaValidatorF75156FF30D50D1Bced4Ec466B56B38_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fcc151af7615a84adf48b714d146192 import (
-    JSONSchemaValidatorFcc151AF7615A84Adf48B714D146192 as JSONSchemaValidatorFcc151AF7615A84Adf48B714D146192_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fccc089e04b557aa7478de3d8fe472f import (
-    JSONSchemaValidatorFccc089E04B557AA7478De3D8Fe472F as JSONSchemaValidatorFccc089E04B557AA7478De3D8Fe472F_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fe3ec7651e79d891fce37a0d860 import (
-    JSONSchemaValidatorFe3Ec7651E79D891Fce37A0D860 as JSONSchemaValidatorFe3Ec7651E79D891Fce37A0D860_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b07f187b7456c8bbb6088a2f24dcee import (
-    JSONSchemaValidatorB07F187B7456C8Bbb6088A2F24Dcee as JSONSchemaValidatorB07F187B7456C8Bbb6088A2F24Dcee_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cb7563a5058c4801eb842a74ff61c import (
-    JSONSchemaValidatorCb7563A5058C4801EB842A74Ff61C as JSONSchemaValidatorCb7563A5058C4801EB842A74Ff61C_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c10072541e94bd16f1aebffe32 import (
-    JSONSchemaValidatorC10072541E94Bd16F1Aebffe32 as JSONSchemaValidatorC10072541E94Bd16F1Aebffe32_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a18e761ac8592e9a5c4e0bb2308cf0 import (
-    JSONSchemaValidatorA18E761Ac8592E9A5C4E0Bb2308Cf0 as JSONSchemaValidatorA18E761Ac8592E9A5C4E0Bb2308Cf0_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a31cc19195d43ba695f4b7494b559 import (
-    JSONSchemaValidatorA31Cc19195D43Ba695F4B7494B559 as JSONSchemaValidatorA31Cc19195D43Ba695F4B7494B559_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_edc44e0e7a513191cc16dc2b4da88e import (
-    JSONSchemaValidatorEdc44E0E7A513191Cc16Dc2B4Da88E as JSONSchemaValidatorEdc44E0E7A513191Cc16Dc2B4Da88E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a25f176554fb407fbe4952f1c4e import (
-    JSONSchemaValidatorA25F176554FB407Fbe4952F1C4E as JSONSchemaValidatorA25F176554FB407Fbe4952F1C4E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d39d23589e85db0a63c414057c import (
-    JSONSchemaValidatorD39D23589E85Db0A63C414057C as JSONSchemaValidatorD39D23589E85Db0A63C414057C_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c45c1c55d498d03a72933690098 import (
-    JSONSchemaValidatorC45C1C55D498D03A72933690098 as JSONSchemaValidatorC45C1C55D498D03A72933690098_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a9f5796226051218eac559ab5211384 import (
-    JSONSchemaValidatorA9F5796226051218Eac559Ab5211384 as JSONSchemaValidatorA9F5796226051218Eac559Ab5211384_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c4befbd77a452a9b7873ffc360a1f20 import (
-    JSONSchemaValidatorC4Befbd77A452A9B7873Ffc360A1F20 as JSONSchemaValidatorC4Befbd77A452A9B7873Ffc360A1F20_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c8d11fb9fc752ab8bb8e2b1413ccc92 import (
-    JSONSchemaValidatorC8D11Fb9Fc752Ab8Bb8E2B1413Ccc92 as JSONSchemaValidatorC8D11Fb9Fc752Ab8Bb8E2B1413Ccc92_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ccd75f80ece59f08cadda085402cef5 import (
-    JSONSchemaValidatorCcd75F80Ece59F08CadDa085402Cef5 as JSONSchemaValidatorCcd75F80Ece59F08CadDa085402Cef5_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d82755e5e03510daf0951c1f42c2702 import (
-    JSONSchemaValidatorD82755E5E03510DAf0951C1F42C2702 as JSONSchemaValidatorD82755E5E03510DAf0951C1F42C2702_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e0bd567c1395531a7f18ab4e14110bd import (
-    JSONSchemaValidatorE0Bd567C1395531A7F18Ab4E14110Bd as JSONSchemaValidatorE0Bd567C1395531A7F18Ab4E14110Bd_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e4f57e8f06856ee9a7e490d01f7f692 import (
-    JSONSchemaValidatorE4F57E8F06856Ee9A7E490D01F7F692 as JSONSchemaValidatorE4F57E8F06856Ee9A7E490D01F7F692_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_eb3b18894545315b25b94d0c0e2ec67 import (
-    JSONSchemaValidatorEb3B18894545315B25B94D0C0E2Ec67 as JSONSchemaValidatorEb3B18894545315B25B94D0C0E2Ec67_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_eca62ef076b5627a85b2a5959613fb8 import (
-    JSONSchemaValidatorEca62Ef076B5627A85B2A5959613Fb8 as JSONSchemaValidatorEca62Ef076B5627A85B2A5959613Fb8_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ed96d98063c5be9aa0005772dc95fc5 import (
-    JSONSchemaValidatorEd96D98063C5Be9Aa0005772Dc95Fc5 as JSONSchemaValidatorEd96D98063C5Be9Aa0005772Dc95Fc5_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f486694f3da57b4921b7f2036a1b754 import (
-    JSONSchemaValidatorF486694F3Da57B4921B7F2036A1B754 as JSONSchemaValidatorF486694F3Da57B4921B7F2036A1B754_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f6536a8f01d5863856a0a8308198e15 import (
-    JSONSchemaValidatorF6536A8F01D5863856A0A8308198E15 as JSONSchemaValidatorF6536A8F01D5863856A0A8308198E15_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f7dd6a6cf8d57499168aae05847ad34 import (
-    JSONSchemaValidatorF7Dd6A6Cf8D57499168Aae05847Ad34 as JSONSchemaValidatorF7Dd6A6Cf8D57499168Aae05847Ad34_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fb433ea1bbc5dc49dce4fde0a04e5ed import (
-    JSONSchemaValidatorFb433Ea1Bbc5Dc49Dce4Fde0A04E5Ed as JSONSchemaValidatorFb433Ea1Bbc5Dc49Dce4Fde0A04E5Ed_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fdd36dd2454547096bb65df3755710f import (
-    JSONSchemaValidatorFdd36Dd2454547096Bb65Df3755710F as JSONSchemaValidatorFdd36Dd2454547096Bb65Df3755710F_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cec6c85d9bb4bcc8f61f31296b import (
-    JSONSchemaValidatorCeC6C85D9BB4BcC8F61F31296B as JSONSchemaValidatorCeC6C85D9BB4BcC8F61F31296B_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f7cf4f24d54c6944a31ed308f8361 import (
-    JSONSchemaValidatorF7Cf4F24D54C6944A31Ed308F8361 as JSONSchemaValidatorF7Cf4F24D54C6944A31Ed308F8361_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e9c5c3e5515a2e1b2cdee6928ab import (
-    JSONSchemaValidatorE9C5C3E5515A2E1B2Cdee6928Ab as JSONSchemaValidatorE9C5C3E5515A2E1B2Cdee6928Ab_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d73cd5be487a36d0a01d6cdc3 import (
-    JSONSchemaValidatorD73Cd5Be487A36D0A01D6Cdc3 as JSONSchemaValidatorD73Cd5Be487A36D0A01D6Cdc3_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_db7b6c4f0542aab9fe7cf5c995f83 import (
-    JSONSchemaValidatorDb7B6C4F0542AAb9FE7Cf5C995F83 as JSONSchemaValidatorDb7B6C4F0542AAb9FE7Cf5C995F83_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c536ac5a318629fc3d6b3dc236 import (
-    JSONSchemaValidatorC536Ac5A318629Fc3D6B3Dc236 as JSONSchemaValidatorC536Ac5A318629Fc3D6B3Dc236_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d7161b33157dba957ba18eda440c2 import (
-    JSONSchemaValidatorD7161B33157DbA957Ba18Eda440C2 as JSONSchemaValidatorD7161B33157DbA957Ba18Eda440C2_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f5ebb9d50aab287f320d32181c0 import (
-    JSONSchemaValidatorF5EBb9D50AaB287F320D32181C0 as JSONSchemaValidatorF5EBb9D50AaB287F320D32181C0_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_aba18f6e605ce28a112b34dcb4fe82 import (
-    JSONSchemaValidatorAba18F6E605Ce28A112B34Dcb4Fe82 as JSONSchemaValidatorAba18F6E605Ce28A112B34Dcb4Fe82_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fa27ccbaf55711849381a707e1edfa import (
-    JSONSchemaValidatorFa27CcBaf55711849381A707E1Edfa as JSONSchemaValidatorFa27CcBaf55711849381A707E1Edfa_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f04b76067507b9384e409e9431ef3 import (
-    JSONSchemaValidatorF04B76067507B9384E409E9431Ef3 as JSONSchemaValidatorF04B76067507B9384E409E9431Ef3_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b7ae9494b05a57bf6393eaf308b1e7 import (
-    JSONSchemaValidatorB7Ae9494B05A57Bf6393Eaf308B1E7 as JSONSchemaValidatorB7Ae9494B05A57Bf6393Eaf308B1E7_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f24a5ad5bf03fe236dd96dcb import (
-    JSONSchemaValidatorF24A5Ad5Bf03Fe236Dd96Dcb as JSONSchemaValidatorF24A5Ad5Bf03Fe236Dd96Dcb_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b6581534bb321eaea272365b7 import (
-    JSONSchemaValidatorB6581534BB321Eaea272365B7 as JSONSchemaValidatorB6581534BB321Eaea272365B7_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f6255ed55aab8b55879cda83511 import (
-    JSONSchemaValidatorF6255Ed55AaB8B55879Cda83511 as JSONSchemaValidatorF6255Ed55AaB8B55879Cda83511_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b33956f3e56c6b8d234e7ed6a20e6 import (
-    JSONSchemaValidatorB33956F3E56C6B8D234E7Ed6A20E6 as JSONSchemaValidatorB33956F3E56C6B8D234E7Ed6A20E6_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cc59d48f8159008f52b29e08738811 import (
-    JSONSchemaValidatorCc59D48F8159008F52B29E08738811 as JSONSchemaValidatorCc59D48F8159008F52B29E08738811_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bfca373c5d7c863eef14abc654fd import (
-    JSONSchemaValidatorBfca373C5D7C863EEf14Abc654Fd as JSONSchemaValidatorBfca373C5D7C863EEf14Abc654Fd_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d1608b2751c883a072ee3fb80228 import (
-    JSONSchemaValidatorD1608B2751C883A072Ee3Fb80228 as JSONSchemaValidatorD1608B2751C883A072Ee3Fb80228_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_eea0014365ef78d30d9ba8f1752e8 import (
-    JSONSchemaValidatorEea0014365Ef78D30D9Ba8F1752E8 as JSONSchemaValidatorEea0014365Ef78D30D9Ba8F1752E8_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e73b352ff2573aab906c2ad75c5a71 import (
-    JSONSchemaValidatorE73B352Ff2573AAb906C2Ad75C5A71 as JSONSchemaValidatorE73B352Ff2573AAb906C2Ad75C5A71_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ac98aec39c95c2d97532514ee9b9f3e import (
-    JSONSchemaValidatorAc98Aec39C95C2D97532514Ee9B9F3E as JSONSchemaValidatorAc98Aec39C95C2D97532514Ee9B9F3E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ba9e0f3a5db5972a55d4b3fcf2b5432 import (
-    JSONSchemaValidatorBa9E0F3A5Db5972A55D4B3Fcf2B5432 as JSONSchemaValidatorBa9E0F3A5Db5972A55D4B3Fcf2B5432_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bd421c1db8c5deaa3301b8cc73dd541 import (
-    JSONSchemaValidatorBd421C1Db8C5DeaA3301B8Cc73Dd541 as JSONSchemaValidatorBd421C1Db8C5DeaA3301B8Cc73Dd541_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_be8cdb967555fcca03a4c1f796eee56 import (
-    JSONSchemaValidatorBe8Cdb967555FccA03A4C1F796Eee56 as JSONSchemaValidatorBe8Cdb967555FccA03A4C1F796Eee56_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c9d3ba6208e5d6eb45fa5c9b8f7e327 import (
-    JSONSchemaValidatorC9D3Ba6208E5D6EB45FA5C9B8F7E327 as JSONSchemaValidatorC9D3Ba6208E5D6EB45FA5C9B8F7E327_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cba0eecfc555390935cebd13e6bcb90 import (
-    JSONSchemaValidatorCba0EecFc555390935CEbd13E6Bcb90 as JSONSchemaValidatorCba0EecFc555390935CEbd13E6Bcb90_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d54c40ecb5f531cb5a78d0cd5dd585e import (
-    JSONSchemaValidatorD54C40ECb5F531CB5A78D0Cd5Dd585E as JSONSchemaValidatorD54C40ECb5F531CB5A78D0Cd5Dd585E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_dbea7d7de125cf6b840d5032d3a5c59 import (
-    JSONSchemaValidatorDbea7D7De125Cf6B840D5032D3A5C59 as JSONSchemaValidatorDbea7D7De125Cf6B840D5032D3A5C59_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e8911ba7a8b54be8e443df8ac842e36 import (
-    JSONSchemaValidatorE8911Ba7A8B54Be8E443Df8Ac842E36 as JSONSchemaValidatorE8911Ba7A8B54Be8E443Df8Ac842E36_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f019a24c5ce50f082d081bb72ff4df9 import (
-    JSONSchemaValidatorF019A24C5Ce50F082D081Bb72Ff4Df9 as JSONSchemaValidatorF019A24C5Ce50F082D081Bb72Ff4Df9_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f2b137487385de6925b7b6136d4b027 import (
-    JSONSchemaValidatorF2B137487385De6925B7B6136D4B027 as JSONSchemaValidatorF2B137487385De6925B7B6136D4B027_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f5645e6e819558fa08761dee45ca406 import (
-    JSONSchemaValidatorF5645E6E819558FA08761Dee45Ca406 as JSONSchemaValidatorF5645E6E819558FA08761Dee45Ca406_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fe06867e548bba1919024b40d992 import (
-    JSONSchemaValidatorFe06867E548BBa1919024B40D992 as JSONSchemaValidatorFe06867E548BBa1919024B40D992_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c024bb00458248144753c93dd8215 import (
-    JSONSchemaValidatorC024BB00458248144753C93Dd8215 as JSONSchemaValidatorC024BB00458248144753C93Dd8215_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_efa92557c9a6c8af0a71829c7e import (
-    JSONSchemaValidatorEfA92557C9A6C8Af0A71829C7E as JSONSchemaValidatorEfA92557C9A6C8Af0A71829C7E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e55cca88065707a6f812a679f69a5d import (
-    JSONSchemaValidatorE55Cca88065707A6F812A679F69A5D as JSONSchemaValidatorE55Cca88065707A6F812A679F69A5D_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ecc3258a5c5b8f2267a512820a59 import (
-    JSONSchemaValidatorEcc3258A5C5B8F2267A512820A59 as JSONSchemaValidatorEcc3258A5C5B8F2267A512820A59_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f5602b2965e53b5bdda193025a3fc import (
-    JSONSchemaValidatorF5602B2965E53B5BdDa193025A3Fc as JSONSchemaValidatorF5602B2965E53B5BdDa193025A3Fc_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e6bca55256a0aac288486e38049b import (
-    JSONSchemaValidatorE6BcA55256A0Aac288486E38049B as JSONSchemaValidatorE6BcA55256A0Aac288486E38049B_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ba98ed72975099b39dd2dc4cb65ed8 import (
-    JSONSchemaValidatorBa98Ed72975099B39DD2Dc4Cb65Ed8 as JSONSchemaValidatorBa98Ed72975099B39DD2Dc4Cb65Ed8_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ef28900485c4e9842b4a68e483d4e import (
-    JSONSchemaValidatorEf28900485C4E9842B4A68E483D4E as JSONSchemaValidatorEf28900485C4E9842B4A68E483D4E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ea8d75a9d8d9e6882da4a4a91 import (
-    JSONSchemaValidatorEA8D75A9D8D9E6882Da4A4A91 as JSONSchemaValidatorEA8D75A9D8D9E6882Da4A4A91_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c49a8488cd52158790aac513e7184a import (
-    JSONSchemaValidatorC49A8488Cd52158790Aac513E7184A as JSONSchemaValidatorC49A8488Cd52158790Aac513E7184A_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ae57085565e551594fc05b4db6a64af import (
-    JSONSchemaValidatorAe57085565E551594Fc05B4Db6A64Af as JSONSchemaValidatorAe57085565E551594Fc05B4Db6A64Af_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bb1653037ca558a8c6097e20b99b4b1 import (
-    JSONSchemaValidatorBb1653037Ca558A8C6097E20B99B4B1 as JSONSchemaValidatorBb1653037Ca558A8C6097E20B99B4B1_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bd1c59e9be75ac4a40decaa95ee9efd import (
-    JSONSchemaValidatorBd1C59E9Be75Ac4A40DEcaa95Ee9Efd as JSONSchemaValidatorBd1C59E9Be75Ac4A40DEcaa95Ee9Efd_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bec2dde673c5b2f940d0474fed32af6 import (
-    JSONSchemaValidatorBec2Dde673C5B2F940D0474Fed32Af6 as JSONSchemaValidatorBec2Dde673C5B2F940D0474Fed32Af6_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d16471a58805b4aa2c757209d188aed import (
-    JSONSchemaValidatorD16471A58805B4AA2C757209D188Aed as JSONSchemaValidatorD16471A58805B4AA2C757209D188Aed_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d6866f768b05f8aa12a142ec526f432 import (
-    JSONSchemaValidatorD6866F768B05F8AA12A142Ec526F432 as JSONSchemaValidatorD6866F768B05F8AA12A142Ec526F432_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d6b58f378895114839682dceed1a9b5 import (
-    JSONSchemaValidatorD6B58F378895114839682Dceed1A9B5 as JSONSchemaValidatorD6B58F378895114839682Dceed1A9B5_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d8fc92ddeab597ebb50ea003a6d46bd import (
-    JSONSchemaValidatorD8Fc92DDeab597EBb50Ea003A6D46Bd as JSONSchemaValidatorD8Fc92DDeab597EBb50Ea003A6D46Bd_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e481654675355408be8daff9a82f9a0 import (
-    JSONSchemaValidatorE481654675355408Be8Daff9A82F9A0 as JSONSchemaValidatorE481654675355408Be8Daff9A82F9A0_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ee43cac5fd65c55ab3153d3549d18c0 import (
-    JSONSchemaValidatorEe43Cac5Fd65C55Ab3153D3549D18C0 as JSONSchemaValidatorEe43Cac5Fd65C55Ab3153D3549D18C0_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_eea45fca32f5f12adc30a9d03c43ac6 import (
-    JSONSchemaValidatorEea45FcA32F5F12Adc30A9D03C43Ac6 as JSONSchemaValidatorEea45FcA32F5F12Adc30A9D03C43Ac6_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_feb78fec3e454e1bd9dd531a6a29100 import (
-    JSONSchemaValidatorFeb78FeC3E454E1Bd9DD531A6A29100 as JSONSchemaValidatorFeb78FeC3E454E1Bd9DD531A6A29100_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c90c04b8356cf9974957e0f9516d0 import (
-    JSONSchemaValidatorC90C04B8356Cf9974957E0F9516D0 as JSONSchemaValidatorC90C04B8356Cf9974957E0F9516D0_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b4155d6f885a53ad0e47b1a4 import (
-    JSONSchemaValidatorB4155D6F885A53Ad0E47B1A4 as JSONSchemaValidatorB4155D6F885A53Ad0E47B1A4_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cf2cac6f150c9bee9ade37921b162 import (
-    JSONSchemaValidatorCf2CaC6F150C9Bee9Ade37921B162 as JSONSchemaValidatorCf2CaC6F150C9Bee9Ade37921B162_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cf0f416ef5c25a159f4c3e376741a import (
-    JSONSchemaValidatorCf0F416Ef5C25A159F4C3E376741A as JSONSchemaValidatorCf0F416Ef5C25A159F4C3E376741A_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_adfc115d6888722b71811ac96e import (
-    JSONSchemaValidatorAdFc115D6888722B71811Ac96E as JSONSchemaValidatorAdFc115D6888722B71811Ac96E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bc55e6552fac58cc0aaacd773a import (
-    JSONSchemaValidatorBc55E6552FAc58Cc0Aaacd773A as JSONSchemaValidatorBc55E6552FAc58Cc0Aaacd773A_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_dece7a9b353b49084a8ffa4f18c91 import (
-    JSONSchemaValidatorDece7A9B353B49084A8Ffa4F18C91 as JSONSchemaValidatorDece7A9B353B49084A8Ffa4F18C91_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c9ea5c02b2b7368cac785f30 import (
-    JSONSchemaValidatorC9Ea5C02B2B7368Cac785F30 as JSONSchemaValidatorC9Ea5C02B2B7368Cac785F30_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f4b2825561e808787a16f7e0a1f import (
-    JSONSchemaValidatorF4B2825561E808787A16F7E0A1F as JSONSchemaValidatorF4B2825561E808787A16F7E0A1F_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bc3ed6556f9b9c959e53e271d70 import (
-    JSONSchemaValidatorBc3Ed6556F9B9C959E53E271D70 as JSONSchemaValidatorBc3Ed6556F9B9C959E53E271D70_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_aac9ba55e5043b4d5e0995c566dce import (
-    JSONSchemaValidatorAac9BA55E5043B4D5E0995C566Dce as JSONSchemaValidatorAac9BA55E5043B4D5E0995C566Dce_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b818044610579a9b74ec582e7739ab import (
-    JSONSchemaValidatorB818044610579A9B74Ec582E7739Ab as JSONSchemaValidatorB818044610579A9B74Ec582E7739Ab_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bcb7a52e3c5763b246bcf438fe57c9 import (
-    JSONSchemaValidatorBcb7A52E3C5763B246Bcf438Fe57C9 as JSONSchemaValidatorBcb7A52E3C5763B246Bcf438Fe57C9_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_eb209544555e43ae2bc909499f3900 import (
-    JSONSchemaValidatorEb209544555E43Ae2BC909499F3900 as JSONSchemaValidatorEb209544555E43Ae2BC909499F3900_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f2c120b855cb8c852806ce72e54d import (
-    JSONSchemaValidatorF2C120B855Cb8C852806Ce72E54D as JSONSchemaValidatorF2C120B855Cb8C852806Ce72E54D_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a4d8313a955433858e0137ba7ef672 import (
-    JSONSchemaValidatorA4D8313A955433858E0137Ba7Ef672 as JSONSchemaValidatorA4D8313A955433858E0137Ba7Ef672_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e62749061c5aae8ecd1ccc2d315153 import (
-    JSONSchemaValidatorE62749061C5Aae8Ecd1Ccc2D315153 as JSONSchemaValidatorE62749061C5Aae8Ecd1Ccc2D315153_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f50ab34f58526bb0ed8aa910f47f24 import (
-    JSONSchemaValidatorF50Ab34F58526BB0Ed8Aa910F47F24 as JSONSchemaValidatorF50Ab34F58526BB0Ed8Aa910F47F24_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cd2e825a78b6de087e991f6fe0 import (
-    JSONSchemaValidatorCd2E825A78B6De087E991F6Fe0 as JSONSchemaValidatorCd2E825A78B6De087E991F6Fe0_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c14a815ec5938950343f6188f0785 import (
-    JSONSchemaValidatorC14A815Ec5938950343F6188F0785 as JSONSchemaValidatorC14A815Ec5938950343F6188F0785_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_aaebb912125213b350d7423b4f01a4 import (
-    JSONSchemaValidatorAaebb912125213B350D7423B4F01A4 as JSONSchemaValidatorAaebb912125213B350D7423B4F01A4_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fb8fee52fcb7577206a3fcac8c import (
-    JSONSchemaValidatorFb8Fee52FcB7577206A3Fcac8C as JSONSchemaValidatorFb8Fee52FcB7577206A3Fcac8C_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ad0cce45817862bebfc839bf5ae import (
-    JSONSchemaValidatorAd0Cce45817862BEbfc839Bf5Ae as JSONSchemaValidatorAd0Cce45817862BEbfc839Bf5Ae_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d6d7d5c8983c1d3c9815bfd35 import (
-    JSONSchemaValidatorD6D7D5C8983C1D3C9815Bfd35 as JSONSchemaValidatorD6D7D5C8983C1D3C9815Bfd35_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fb5a8c0075563491622171958074bf import (
-    JSONSchemaValidatorFb5A8C0075563491622171958074Bf as JSONSchemaValidatorFb5A8C0075563491622171958074Bf_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a764c85d8df5c30b9143619d4f9cde9 import (
-    JSONSchemaValidatorA764C85D8Df5C30B9143619D4F9Cde9 as JSONSchemaValidatorA764C85D8Df5C30B9143619D4F9Cde9_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b5a94fd2d97514b8a9cf73df4e154b8 import (
-    JSONSchemaValidatorB5A94Fd2D97514B8A9CF73Df4E154B8 as JSONSchemaValidatorB5A94Fd2D97514B8A9CF73Df4E154B8_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c991ce0b0f058a08c863a4abdfc70a6 import (
-    JSONSchemaValidatorC991Ce0B0F058A08C863A4Abdfc70A6 as JSONSchemaValidatorC991Ce0B0F058A08C863A4Abdfc70A6_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d10535ed2045b9bb5c58882e6f43cb2 import (
-    JSONSchemaValidatorD10535ED2045B9BB5C58882E6F43Cb2 as JSONSchemaValidatorD10535ED2045B9BB5C58882E6F43Cb2_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f41eb48a0da56949cfaddeecb51ab66 import (
-    JSONSchemaValidatorF41Eb48A0Da56949CfaDdeecb51Ab66 as JSONSchemaValidatorF41Eb48A0Da56949CfaDdeecb51Ab66_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f5bfccc7e30550baa7046f74daa1ef2 import (
-    JSONSchemaValidatorF5Bfccc7E30550BAa7046F74Daa1Ef2 as JSONSchemaValidatorF5Bfccc7E30550BAa7046F74Daa1Ef2_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fcd7200871e5e2db7f1720d95fee764 import (
-    JSONSchemaValidatorFcd7200871E5E2DB7F1720D95Fee764 as JSONSchemaValidatorFcd7200871E5E2DB7F1720D95Fee764_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fff3662537e538f82bfb5809e30b3df import (
-    JSONSchemaValidatorFff3662537E538F82BfB5809E30B3Df as JSONSchemaValidatorFff3662537E538F82BfB5809E30B3Df_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a0c237c8fc115b6f98b87cc7a1360dd0 import (
-    JSONSchemaValidatorA0C237C8Fc115B6F98B87Cc7A1360Dd0 as JSONSchemaValidatorA0C237C8Fc115B6F98B87Cc7A1360Dd0_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a0f799d5ec6954d1bd7a25853080a9f1 import (
-    JSONSchemaValidatorA0F799D5Ec6954D1Bd7A25853080A9F1 as JSONSchemaValidatorA0F799D5Ec6954D1Bd7A25853080A9F1_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a14e71c1b98e51eea41255720025b519 import (
-    JSONSchemaValidatorA14E71C1B98E51EeA41255720025B519 as JSONSchemaValidatorA14E71C1B98E51EeA41255720025B519_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a2da4c1e5224542e8474f09eb8d4f32d import (
-    JSONSchemaValidatorA2Da4C1E5224542E8474F09Eb8D4F32D as JSONSchemaValidatorA2Da4C1E5224542E8474F09Eb8D4F32D_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a352f6280e445075b3ea7cbf868c2d94 import (
-    JSONSchemaValidatorA352F6280E445075B3Ea7Cbf868C2D94 as JSONSchemaValidatorA352F6280E445075B3Ea7Cbf868C2D94_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a3b37dcbe2a150bea06d9dcde1837281 import (
-    JSONSchemaValidatorA3B37DcbE2A150BeA06D9Dcde1837281 as JSONSchemaValidatorA3B37DcbE2A150BeA06D9Dcde1837281_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a3d2432ae8c55fe793c5180d8d5fce25 import (
-    JSONSchemaValidatorA3D2432AE8C55Fe793C5180D8D5Fce25 as JSONSchemaValidatorA3D2432AE8C55Fe793C5180D8D5Fce25_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a3fb2e7bb8aa50508425b1dd8818fda4 import (
-    JSONSchemaValidatorA3Fb2E7BB8Aa50508425B1Dd8818Fda4 as JSONSchemaValidatorA3Fb2E7BB8Aa50508425B1Dd8818Fda4_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a41113bc28515538af4fe4d2ff707f60 import (
-    JSONSchemaValidatorA41113Bc28515538Af4FE4D2Ff707F60 as JSONSchemaValidatorA41113Bc28515538Af4FE4D2Ff707F60_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a542b2feed5259a2922ebd75ca99a141 import (
-    JSONSchemaValidatorA542B2FeEd5259A2922EBd75Ca99A141 as JSONSchemaValidatorA542B2FeEd5259A2922EBd75Ca99A141_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a54fce1a0c305bdabfe91a8a6161e539 import (
-    JSONSchemaValidatorA54Fce1A0C305BdaBfe91A8A6161E539 as JSONSchemaValidatorA54Fce1A0C305BdaBfe91A8A6161E539_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a5e4452cb2e05682933349833a01d14b import (
-    JSONSchemaValidatorA5E4452CB2E05682933349833A01D14B as JSONSchemaValidatorA5E4452CB2E05682933349833A01D14B_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a66db26df529597c84c2a15ea2d632ce import (
-    JSONSchemaValidatorA66Db26DF529597C84C2A15Ea2D632Ce as JSONSchemaValidatorA66Db26DF529597C84C2A15Ea2D632Ce_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a69602efc6f4523d806ffb18fbcf5cee import (
-    JSONSchemaValidatorA69602EfC6F4523D806FFb18Fbcf5Cee as JSONSchemaValidatorA69602EfC6F4523D806FFb18Fbcf5Cee_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a6c4ce7aef8251a2a8646ba0b5c1826a import (
-    JSONSchemaValidatorA6C4Ce7AEf8251A2A8646Ba0B5C1826A as JSONSchemaValidatorA6C4Ce7AEf8251A2A8646Ba0B5C1826A_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a73fbc67627e5bbbafe748de84d42df6 import (
-    JSONSchemaValidatorA73Fbc67627E5BbbAfe748De84D42Df6 as JSONSchemaValidatorA73Fbc67627E5BbbAfe748De84D42Df6_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a7935eedd53a5b8c84668c903cc1c705 import (
-    JSONSchemaValidatorA7935EedD53A5B8C84668C903Cc1C705 as JSONSchemaValidatorA7935EedD53A5B8C84668C903Cc1C705_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a7d6d604f38f5f849af79d8768bddfc1 import (
-    JSONSchemaValidatorA7D6D604F38F5F849Af79D8768Bddfc1 as JSONSchemaValidatorA7D6D604F38F5F849Af79D8768Bddfc1_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a837b8a46cd459c8b429d16fb17f1370 import (
-    JSONSchemaValidatorA837B8A46Cd459C8B429D16Fb17F1370 as JSONSchemaValidatorA837B8A46Cd459C8B429D16Fb17F1370_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a914cc0c96a35a06a54856e778742a8c import (
-    JSONSchemaValidatorA914Cc0C96A35A06A54856E778742A8C as JSONSchemaValidatorA914Cc0C96A35A06A54856E778742A8C_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a91eed12dfc85dbdaacab22e6e9f04a5 import (
-    JSONSchemaValidatorA91Eed12Dfc85DbdAacaB22E6E9F04A5 as JSONSchemaValidatorA91Eed12Dfc85DbdAacaB22E6E9F04A5_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a93d01238de0537dbb3d358f9cce0bd2 import (
-    JSONSchemaValidatorA93D01238De0537DBb3D358F9Cce0Bd2 as JSONSchemaValidatorA93D01238De0537DBb3D358F9Cce0Bd2_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a9b864257b965fe4bd8b0293f41f1537 import (
-    JSONSchemaValidatorA9B864257B965Fe4Bd8B0293F41F1537 as JSONSchemaValidatorA9B864257B965Fe4Bd8B0293F41F1537_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_a9e0722d184658c592bd130ff03e1dde import (
-    JSONSchemaValidatorA9E0722D184658C592Bd130Ff03E1Dde as JSONSchemaValidatorA9E0722D184658C592Bd130Ff03E1Dde_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_aa11f09d28165f4ea6c81b8642e59cc4 import (
-    JSONSchemaValidatorAa11F09D28165F4EA6C81B8642E59Cc4 as JSONSchemaValidatorAa11F09D28165F4EA6C81B8642E59Cc4_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_aa663ca2bd1f5a3db67c405987495112 import (
-    JSONSchemaValidatorAa663Ca2Bd1F5A3DB67C405987495112 as JSONSchemaValidatorAa663Ca2Bd1F5A3DB67C405987495112_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ac6e63199fb05bcf89106a22502c2197 import (
-    JSONSchemaValidatorAc6E63199Fb05Bcf89106A22502C2197 as JSONSchemaValidatorAc6E63199Fb05Bcf89106A22502C2197_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ac7ce690e0f55a469b0a9bfa3d2c165e import (
-    JSONSchemaValidatorAc7Ce690E0F55A469B0A9Bfa3D2C165E as JSONSchemaValidatorAc7Ce690E0F55A469B0A9Bfa3D2C165E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ad487b01cede5cb4bdd5ee06695a6020 import (
-    JSONSchemaValidatorAd487B01Cede5Cb4Bdd5Ee06695A6020 as JSONSchemaValidatorAd487B01Cede5Cb4Bdd5Ee06695A6020_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ad936677c99a58f6b532359d66fe98a7 import (
-    JSONSchemaValidatorAd936677C99A58F6B532359D66Fe98A7 as JSONSchemaValidatorAd936677C99A58F6B532359D66Fe98A7_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ad96e712f4525a128368b1bfe3afc21c import (
-    JSONSchemaValidatorAd96E712F4525A128368B1Bfe3Afc21C as JSONSchemaValidatorAd96E712F4525A128368B1Bfe3Afc21C_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ada3522de8ef54729e9fc242df292547 import (
-    JSONSchemaValidatorAda3522DE8Ef54729E9FC242Df292547 as JSONSchemaValidatorAda3522DE8Ef54729E9FC242Df292547_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ae4d33eacca95f109bebc6fd0528ca48 import (
-    JSONSchemaValidatorAe4D33EaCca95F109BebC6Fd0528Ca48 as JSONSchemaValidatorAe4D33EaCca95F109BebC6Fd0528Ca48_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ae8282c90a7059ceb31b4072429d00cd import (
-    JSONSchemaValidatorAe8282C90A7059CeB31B4072429D00Cd as JSONSchemaValidatorAe8282C90A7059CeB31B4072429D00Cd_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_afcd4a0cbe985fd7aafa73d671c43a1e import (
-    JSONSchemaValidatorAfcd4A0CBe985Fd7Aafa73D671C43A1E as JSONSchemaValidatorAfcd4A0CBe985Fd7Aafa73D671C43A1E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b0780003f8f05720a7b04cfa0d0a9a85 import (
-    JSONSchemaValidatorB0780003F8F05720A7B04Cfa0D0A9A85 as JSONSchemaValidatorB0780003F8F05720A7B04Cfa0D0A9A85_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b08f499f995f5f46ba52e0385b54721a import (
-    JSONSchemaValidatorB08F499F995F5F46Ba52E0385B54721A as JSONSchemaValidatorB08F499F995F5F46Ba52E0385B54721A_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b0aa8e79d21f5e579908825e70aaccf6 import (
-    JSONSchemaValidatorB0Aa8E79D21F5E579908825E70Aaccf6 as JSONSchemaValidatorB0Aa8E79D21F5E579908825E70Aaccf6_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b0b146a144a65aa296b8b939c2926158 import (
-    JSONSchemaValidatorB0B146A144A65Aa296B8B939C2926158 as JSONSchemaValidatorB0B146A144A65Aa296B8B939C2926158_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b119a4d455e35cc3b2cc6695a045cbfa import (
-    JSONSchemaValidatorB119A4D455E35Cc3B2Cc6695A045Cbfa as JSONSchemaValidatorB119A4D455E35Cc3B2Cc6695A045Cbfa_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b11aa4de387251c794665e030fa815da import (
-    JSONSchemaValidatorB11Aa4De387251C794665E030Fa815Da as JSONSchemaValidatorB11Aa4De387251C794665E030Fa815Da_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b1ded5eaafa25e6b8814fa1cc0f9829a import (
-    JSONSchemaValidatorB1Ded5EaAfa25E6B8814Fa1Cc0F9829A as JSONSchemaValidatorB1Ded5EaAfa25E6B8814Fa1Cc0F9829A_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b2dae3b41636596aa02c3ad0a4bcb8d7 import (
-    JSONSchemaValidatorB2Dae3B41636596AA02C3Ad0A4Bcb8D7 as JSONSchemaValidatorB2Dae3B41636596AA02C3Ad0A4Bcb8D7_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b350fb0876a25879973b0840fbb690bb import (
-    JSONSchemaValidatorB350Fb0876A25879973B0840Fbb690Bb as JSONSchemaValidatorB350Fb0876A25879973B0840Fbb690Bb_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b3ab480a3f485ecc9fef1bd2f8c9d109 import (
-    JSONSchemaValidatorB3Ab480A3F485Ecc9Fef1Bd2F8C9D109 as JSONSchemaValidatorB3Ab480A3F485Ecc9Fef1Bd2F8C9D109_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b3c4383ecc13514c85c6f3d8484f6d68 import (
-    JSONSchemaValidatorB3C4383ECc13514C85C6F3D8484F6D68 as JSONSchemaValidatorB3C4383ECc13514C85C6F3D8484F6D68_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b43e0f60e9ac5bd4960f9772cf7a497b import (
-    JSONSchemaValidatorB43E0F60E9Ac5Bd4960F9772Cf7A497B as JSONSchemaValidatorB43E0F60E9Ac5Bd4960F9772Cf7A497B_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b4f52e69ddca5b2583b28fb4c96447aa import (
-    JSONSchemaValidatorB4F52E69Ddca5B2583B28Fb4C96447Aa as JSONSchemaValidatorB4F52E69Ddca5B2583B28Fb4C96447Aa_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b6f2d8e46cdd5f05bb06f52cd1b26fb2 import (
-    JSONSchemaValidatorB6F2D8E46Cdd5F05Bb06F52Cd1B26Fb2 as JSONSchemaValidatorB6F2D8E46Cdd5F05Bb06F52Cd1B26Fb2_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b7079a38844e56dd8f1b6b876880a02e import (
-    JSONSchemaValidatorB7079A38844E56Dd8F1B6B876880A02E as JSONSchemaValidatorB7079A38844E56Dd8F1B6B876880A02E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b843a90c86875472af1f351e78dd5521 import (
-    JSONSchemaValidatorB843A90C86875472Af1F351E78Dd5521 as JSONSchemaValidatorB843A90C86875472Af1F351E78Dd5521_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_b95201b6a6905a10b463e036bf591166 import (
-    JSONSchemaValidatorB95201B6A6905A10B463E036Bf591166 as JSONSchemaValidatorB95201B6A6905A10B463E036Bf591166_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ba40975123ed50daa2f9f599cdf2d911 import (
-    JSONSchemaValidatorBa40975123Ed50DaA2F9F599Cdf2D911 as JSONSchemaValidatorBa40975123Ed50DaA2F9F599Cdf2D911_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ba52bb172d495710aa00f7d4d060ec50 import (
-    JSONSchemaValidatorBa52Bb172D495710Aa00F7D4D060Ec50 as JSONSchemaValidatorBa52Bb172D495710Aa00F7D4D060Ec50_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bac0c488707959c182dfef18681bceda import (
-    JSONSchemaValidatorBac0C488707959C182DfEf18681Bceda as JSONSchemaValidatorBac0C488707959C182DfEf18681Bceda_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bbc4dab8193c546ab116e19863dff621 import (
-    JSONSchemaValidatorBbc4Dab8193C546AB116E19863Dff621 as JSONSchemaValidatorBbc4Dab8193C546AB116E19863Dff621_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bc33daf690ec5399a507829abfc4fe64 import (
-    JSONSchemaValidatorBc33Daf690Ec5399A507829Abfc4Fe64 as JSONSchemaValidatorBc33Daf690Ec5399A507829Abfc4Fe64_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bc35f54af11e5b83a81c25927d1a10b5 import (
-    JSONSchemaValidatorBc35F54AF11E5B83A81C25927D1A10B5 as JSONSchemaValidatorBc35F54AF11E5B83A81C25927D1A10B5_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bc3cb471beaf5bfeb47201993c023068 import (
-    JSONSchemaValidatorBc3Cb471Beaf5BfeB47201993C023068 as JSONSchemaValidatorBc3Cb471Beaf5BfeB47201993C023068_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bce8e6b307ce52dd8f5546fbd78e05ee import (
-    JSONSchemaValidatorBce8E6B307Ce52Dd8F5546Fbd78E05Ee as JSONSchemaValidatorBce8E6B307Ce52Dd8F5546Fbd78E05Ee_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bd31fcbd1ecd5a2c8b812088b27bfcea import (
-    JSONSchemaValidatorBd31Fcbd1Ecd5A2C8B812088B27Bfcea as JSONSchemaValidatorBd31Fcbd1Ecd5A2C8B812088B27Bfcea_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bd400dbef41e53ed82541c766f14f1eb import (
-    JSONSchemaValidatorBd400DbeF41E53Ed82541C766F14F1Eb as JSONSchemaValidatorBd400DbeF41E53Ed82541C766F14F1Eb_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bdca1829ea705fa690922e3e0f8ff7b0 import (
-    JSONSchemaValidatorBdca1829Ea705Fa690922E3E0F8Ff7B0 as JSONSchemaValidatorBdca1829Ea705Fa690922E3E0F8Ff7B0_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bdcb514ae33b571795e4a42147d11f87 import (
-    JSONSchemaValidatorBdcb514AE33B571795E4A42147D11F87 as JSONSchemaValidatorBdcb514AE33B571795E4A42147D11F87_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bf40cea4982c54278a52ac2e7b0c458a import (
-    JSONSchemaValidatorBf40Cea4982C54278A52Ac2E7B0C458A as JSONSchemaValidatorBf40Cea4982C54278A52Ac2E7B0C458A_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bfb1005f4d265f8bb340637175a5841f import (
-    JSONSchemaValidatorBfb1005F4D265F8BB340637175A5841F as JSONSchemaValidatorBfb1005F4D265F8BB340637175A5841F_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_bfd1cc1403c951a99c0fcafd59eaabf3 import (
-    JSONSchemaValidatorBfd1Cc1403C951A99C0FCafd59Eaabf3 as JSONSchemaValidatorBfd1Cc1403C951A99C0FCafd59Eaabf3_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c17432d928f755f8bb9f4edb83089d3e import (
-    JSONSchemaValidatorC17432D928F755F8Bb9F4Edb83089D3E as JSONSchemaValidatorC17432D928F755F8Bb9F4Edb83089D3E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c1dae5c13e6959348fe1fe0652958647 import (
-    JSONSchemaValidatorC1Dae5C13E6959348Fe1Fe0652958647 as JSONSchemaValidatorC1Dae5C13E6959348Fe1Fe0652958647_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c1fa19f9295c50018132c6c9ebc3fc35 import (
-    JSONSchemaValidatorC1Fa19F9295C50018132C6C9Ebc3Fc35 as JSONSchemaValidatorC1Fa19F9295C50018132C6C9Ebc3Fc35_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c524f0ec199e5435bcaee56b423532e7 import (
-    JSONSchemaValidatorC524F0Ec199E5435BcaeE56B423532E7 as JSONSchemaValidatorC524F0Ec199E5435BcaeE56B423532E7_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c5c273290fae513da209ec2c9270e46d import (
-    JSONSchemaValidatorC5C273290Fae513DA209Ec2C9270E46D as JSONSchemaValidatorC5C273290Fae513DA209Ec2C9270E46D_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c5df380093bd5a748d177a34375faab4 import (
-    JSONSchemaValidatorC5Df380093Bd5A748D177A34375Faab4 as JSONSchemaValidatorC5Df380093Bd5A748D177A34375Faab4_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c5f97865727857d5b1eeaedee3dcccd2 import (
-    JSONSchemaValidatorC5F97865727857D5B1EeAedee3Dcccd2 as JSONSchemaValidatorC5F97865727857D5B1EeAedee3Dcccd2_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c60312a923ee5a6fb3f2c725c32dc96f import (
-    JSONSchemaValidatorC60312A923Ee5A6FB3F2C725C32Dc96F as JSONSchemaValidatorC60312A923Ee5A6FB3F2C725C32Dc96F_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c6774ff9549a53d4b41fdd2d88f1d0f5 import (
-    JSONSchemaValidatorC6774Ff9549A53D4B41FDd2D88F1D0F5 as JSONSchemaValidatorC6774Ff9549A53D4B41FDd2D88F1D0F5_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c7f28c3d23ba5384be5e769ae0505d00 import (
-    JSONSchemaValidatorC7F28C3D23Ba5384Be5E769Ae0505D00 as JSONSchemaValidatorC7F28C3D23Ba5384Be5E769Ae0505D00_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c85b39d6bae0536695992ddbb91ea96d import (
-    JSONSchemaValidatorC85B39D6Bae0536695992Ddbb91Ea96D as JSONSchemaValidatorC85B39D6Bae0536695992Ddbb91Ea96D_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c880bc6a8faa5bb4afbfd6bea38c75fa import (
-    JSONSchemaValidatorC880Bc6A8Faa5Bb4AfbfD6Bea38C75Fa as JSONSchemaValidatorC880Bc6A8Faa5Bb4AfbfD6Bea38C75Fa_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c937494318f952ba92eaeb82b144c338 import (
-    JSONSchemaValidatorC937494318F952Ba92EaEb82B144C338 as JSONSchemaValidatorC937494318F952Ba92EaEb82B144C338_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c9b5b83e67195b649077a05e42897cc4 import (
-    JSONSchemaValidatorC9B5B83E67195B649077A05E42897Cc4 as JSONSchemaValidatorC9B5B83E67195B649077A05E42897Cc4_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_c9f995abc21b54e7860f66aef2ffbc85 import (
-    JSONSchemaValidatorC9F995AbC21B54E7860F66Aef2Ffbc85 as JSONSchemaValidatorC9F995AbC21B54E7860F66Aef2Ffbc85_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ca2fe989a227585086452d24d32867a6 import (
-    JSONSchemaValidatorCa2Fe989A227585086452D24D32867A6 as JSONSchemaValidatorCa2Fe989A227585086452D24D32867A6_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cb38886d0236502783d431455e3fb880 import (
-    JSONSchemaValidatorCb38886D0236502783D431455E3Fb880 as JSONSchemaValidatorCb38886D0236502783D431455E3Fb880_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cc1599012a5a59c8abdda5376b5cc583 import (
-    JSONSchemaValidatorCc1599012A5A59C8AbddA5376B5Cc583 as JSONSchemaValidatorCc1599012A5A59C8AbddA5376B5Cc583_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cc19241fd92f586c8986d4d5c99c3a88 import (
-    JSONSchemaValidatorCc19241FD92F586C8986D4D5C99C3A88 as JSONSchemaValidatorCc19241FD92F586C8986D4D5C99C3A88_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ccbf614b4b355cac929f12cc61272c1c import (
-    JSONSchemaValidatorCcbf614B4B355Cac929F12Cc61272C1C as JSONSchemaValidatorCcbf614B4B355Cac929F12Cc61272C1C_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cdf8c0d3866d5147901c0cf4821a84a7 import (
-    JSONSchemaValidatorCdf8C0D3866D5147901C0Cf4821A84A7 as JSONSchemaValidatorCdf8C0D3866D5147901C0Cf4821A84A7_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cec8139f6b1c5e5991d12197206029a0 import (
-    JSONSchemaValidatorCec8139F6B1C5E5991D12197206029A0 as JSONSchemaValidatorCec8139F6B1C5E5991D12197206029A0_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cf82058feef35cfabe601c3d51f01740 import (
-    JSONSchemaValidatorCf82058FEef35CfaBe601C3D51F01740 as JSONSchemaValidatorCf82058FEef35CfaBe601C3D51F01740_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cf9d39cef5e95bb9bd48d5f86e094c99 import (
-    JSONSchemaValidatorCf9D39CeF5E95Bb9Bd48D5F86E094C99 as JSONSchemaValidatorCf9D39CeF5E95Bb9Bd48D5F86E094C99_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_cfadc5e4c912588389f4f63d2fb6e4ed import (
-    JSONSchemaValidatorCfadc5E4C912588389F4F63D2Fb6E4Ed as JSONSchemaValidatorCfadc5E4C912588389F4F63D2Fb6E4Ed_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d02614492a2251c18de2e36c097e40ff import (
-    JSONSchemaValidatorD02614492A2251C18De2E36C097E40Ff as JSONSchemaValidatorD02614492A2251C18De2E36C097E40Ff_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d045d18062ad5ae59c6f446beb17d675 import (
-    JSONSchemaValidatorD045D18062Ad5Ae59C6F446Beb17D675 as JSONSchemaValidatorD045D18062Ad5Ae59C6F446Beb17D675_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d05c763ada545fbe94a4c0391456b89f import (
-    JSONSchemaValidatorD05C763ADa545Fbe94A4C0391456B89F as JSONSchemaValidatorD05C763ADa545Fbe94A4C0391456B89F_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d0aab00569b258b481afedc35e6db392 import (
-    JSONSchemaValidatorD0Aab00569B258B481AfEdc35E6Db392 as JSONSchemaValidatorD0Aab00569B258B481AfEdc35E6Db392_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d0b2cc705afb536fab6fd0848baa73c0 import (
-    JSONSchemaValidatorD0B2Cc705Afb536FAb6FD0848Baa73C0 as JSONSchemaValidatorD0B2Cc705Afb536FAb6FD0848Baa73C0_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d0e1021de57d5e95bbea5d5bd86b481a import (
-    JSONSchemaValidatorD0E1021DE57D5E95Bbea5D5Bd86B481A as JSONSchemaValidatorD0E1021DE57D5E95Bbea5D5Bd86B481A_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d0f4d6b5909b5ecaa29e854e919b4221 import (
-    JSONSchemaValidatorD0F4D6B5909B5EcaA29E854E919B4221 as JSONSchemaValidatorD0F4D6B5909B5EcaA29E854E919B4221_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d1d42ef2f1895a82a2830bf1353e6baa import (
-    JSONSchemaValidatorD1D42Ef2F1895A82A2830Bf1353E6Baa as JSONSchemaValidatorD1D42Ef2F1895A82A2830Bf1353E6Baa_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d2ea814bfae85da1b77872d095fc8221 import (
-    JSONSchemaValidatorD2Ea814BFae85Da1B77872D095Fc8221 as JSONSchemaValidatorD2Ea814BFae85Da1B77872D095Fc8221_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d413a3d054ac50fa921ca8cf7fdf5449 import (
-    JSONSchemaValidatorD413A3D054Ac50Fa921CA8Cf7Fdf5449 as JSONSchemaValidatorD413A3D054Ac50Fa921CA8Cf7Fdf5449_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d5c229546dc755f796dfcf34f1c2e290 import (
-    JSONSchemaValidatorD5C229546Dc755F796DfCf34F1C2E290 as JSONSchemaValidatorD5C229546Dc755F796DfCf34F1C2E290_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d5ecdc670ebc5bae807f25a53d4e8b7f import (
-    JSONSchemaValidatorD5Ecdc670Ebc5Bae807F25A53D4E8B7F as JSONSchemaValidatorD5Ecdc670Ebc5Bae807F25A53D4E8B7F_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d6451662bd1652e7bdc39053429e87a4 import (
-    JSONSchemaValidatorD6451662Bd1652E7Bdc39053429E87A4 as JSONSchemaValidatorD6451662Bd1652E7Bdc39053429E87A4_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d69b1cfffdda5bd1828a5a89a262cbdd import (
-    JSONSchemaValidatorD69B1CffFdda5Bd1828A5A89A262Cbdd as JSONSchemaValidatorD69B1CffFdda5Bd1828A5A89A262Cbdd_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d715bf675b1250118d4b201d1419065e import (
-    JSONSchemaValidatorD715Bf675B1250118D4B201D1419065E as JSONSchemaValidatorD715Bf675B1250118D4B201D1419065E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d73fc407278f5eefa67e6a014aeaf742 import (
-    JSONSchemaValidatorD73Fc407278F5EefA67E6A014Aeaf742 as JSONSchemaValidatorD73Fc407278F5EefA67E6A014Aeaf742_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d825ae9a117f5b6bb65b7d78fd42513c import (
-    JSONSchemaValidatorD825Ae9A117F5B6BB65B7D78Fd42513C as JSONSchemaValidatorD825Ae9A117F5B6BB65B7D78Fd42513C_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d8fcd6dbb7ff53b58f7398c49b27ded2 import (
-    JSONSchemaValidatorD8Fcd6DbB7Ff53B58F7398C49B27Ded2 as JSONSchemaValidatorD8Fcd6DbB7Ff53B58F7398C49B27Ded2_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d91a3aad0fd954e7a43aa3256ce433f6 import (
-    JSONSchemaValidatorD91A3Aad0Fd954E7A43AA3256Ce433F6 as JSONSchemaValidatorD91A3Aad0Fd954E7A43AA3256Ce433F6_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d967a378b43457ad8c6a6de7bc1845d1 import (
-    JSONSchemaValidatorD967A378B43457Ad8C6A6De7Bc1845D1 as JSONSchemaValidatorD967A378B43457Ad8C6A6De7Bc1845D1_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d9c01903d0645a3d8b56172bb9549be3 import (
-    JSONSchemaValidatorD9C01903D0645A3D8B56172Bb9549Be3 as JSONSchemaValidatorD9C01903D0645A3D8B56172Bb9549Be3_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_d9e3276d1ed3511b80b22ea8388959c8 import (
-    JSONSchemaValidatorD9E3276D1Ed3511B80B22Ea8388959C8 as JSONSchemaValidatorD9E3276D1Ed3511B80B22Ea8388959C8_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_da24bdb30635515395471fe644cdc7b5 import (
-    JSONSchemaValidatorDa24Bdb30635515395471Fe644Cdc7B5 as JSONSchemaValidatorDa24Bdb30635515395471Fe644Cdc7B5_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_da455f4be5b75126ba9970c7cc54c7db import (
-    JSONSchemaValidatorDa455F4BE5B75126Ba9970C7Cc54C7Db as JSONSchemaValidatorDa455F4BE5B75126Ba9970C7Cc54C7Db_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_da593242978c5047bb6b62b7f9475326 import (
-    JSONSchemaValidatorDa593242978C5047Bb6B62B7F9475326 as JSONSchemaValidatorDa593242978C5047Bb6B62B7F9475326_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_db0f8e07ae0d5ecc83e34d29e5e57b41 import (
-    JSONSchemaValidatorDb0F8E07Ae0D5Ecc83E34D29E5E57B41 as JSONSchemaValidatorDb0F8E07Ae0D5Ecc83E34D29E5E57B41_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_dc254215fdf25cd5b7ba797e8f8faebf import (
-    JSONSchemaValidatorDc254215Fdf25Cd5B7Ba797E8F8Faebf as JSONSchemaValidatorDc254215Fdf25Cd5B7Ba797E8F8Faebf_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_dc5d352dfaeb5b17800b0af2858c2f5c import (
-    JSONSchemaValidatorDc5D352DFaeb5B17800B0Af2858C2F5C as JSONSchemaValidatorDc5D352DFaeb5B17800B0Af2858C2F5C_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_dcc43be0514e50fea80cfa827f13ee5c import (
-    JSONSchemaValidatorDcc43Be0514E50FeA80CFa827F13Ee5C as JSONSchemaValidatorDcc43Be0514E50FeA80CFa827F13Ee5C_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_dda852745acd5ce5a97b0cfdf0de2fd2 import (
-    JSONSchemaValidatorDda852745Acd5Ce5A97B0Cfdf0De2Fd2 as JSONSchemaValidatorDda852745Acd5Ce5A97B0Cfdf0De2Fd2_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_de1769e2886b5948b408100225b4a034 import (
-    JSONSchemaValidatorDe1769E2886B5948B408100225B4A034 as JSONSchemaValidatorDe1769E2886B5948B408100225B4A034_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_de24de1222a4500cab78b4b34ee299f2 import (
-    JSONSchemaValidatorDe24De1222A4500CAb78B4B34Ee299F2 as JSONSchemaValidatorDe24De1222A4500CAb78B4B34Ee299F2_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_deb34387d0235811a90985711be9fe2e import (
-    JSONSchemaValidatorDeb34387D0235811A90985711Be9Fe2E as JSONSchemaValidatorDeb34387D0235811A90985711Be9Fe2E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_dec1857f1585557eb39e12a9c93ef985 import (
-    JSONSchemaValidatorDec1857F1585557EB39E12A9C93Ef985 as JSONSchemaValidatorDec1857F1585557EB39E12A9C93Ef985_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ded95db0af275081801b54e0ce105c71 import (
-    JSONSchemaValidatorDed95Db0Af275081801B54E0Ce105C71 as JSONSchemaValidatorDed95Db0Af275081801B54E0Ce105C71_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_df26f516755a50b5b5477324cf5cb649 import (
-    JSONSchemaValidatorDf26F516755A50B5B5477324Cf5Cb649 as JSONSchemaValidatorDf26F516755A50B5B5477324Cf5Cb649_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_df9ec5aa58815a849b4853b223343e5e import (
-    JSONSchemaValidatorDf9Ec5Aa58815A849B4853B223343E5E as JSONSchemaValidatorDf9Ec5Aa58815A849B4853B223343E5E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_dfda5beca4cc5437876bff366493ebf0 import (
-    JSONSchemaValidatorDfda5BecA4Cc5437876BFf366493Ebf0 as JSONSchemaValidatorDfda5BecA4Cc5437876BFf366493Ebf0_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e0c7b28d55c85d49a84c1403ca14bd5f import (
-    JSONSchemaValidatorE0C7B28D55C85D49A84C1403Ca14Bd5F as JSONSchemaValidatorE0C7B28D55C85D49A84C1403Ca14Bd5F_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e11daa984f535a08bc1eb01bc84bc399 import (
-    JSONSchemaValidatorE11Daa984F535A08Bc1EB01Bc84Bc399 as JSONSchemaValidatorE11Daa984F535A08Bc1EB01Bc84Bc399_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e1781a990c6b5a4b895d56bcfda2b7cb import (
-    JSONSchemaValidatorE1781A990C6B5A4B895D56Bcfda2B7Cb as JSONSchemaValidatorE1781A990C6B5A4B895D56Bcfda2B7Cb_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e1b8c435195d56368c24a54dcce007d0 import (
-    JSONSchemaValidatorE1B8C435195D56368C24A54Dcce007D0 as JSONSchemaValidatorE1B8C435195D56368C24A54Dcce007D0_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e2ec291c2e775df3895aadc639713eea import (
-    JSONSchemaValidatorE2Ec291C2E775Df3895AAdc639713Eea as JSONSchemaValidatorE2Ec291C2E775Df3895AAdc639713Eea_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e2f9718de3d050819cdc6355a3a43200 import (
-    JSONSchemaValidatorE2F9718DE3D050819Cdc6355A3A43200 as JSONSchemaValidatorE2F9718DE3D050819Cdc6355A3A43200_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e328f7d015535897877f3ecb0c927453 import (
-    JSONSchemaValidatorE328F7D015535897877F3Ecb0C927453 as JSONSchemaValidatorE328F7D015535897877F3Ecb0C927453_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e3934b0fb68a5ff787e65e9b7c8e6296 import (
-    JSONSchemaValidatorE3934B0FB68A5Ff787E65E9B7C8E6296 as JSONSchemaValidatorE3934B0FB68A5Ff787E65E9B7C8E6296_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e3d7ad943d3a50fb8c3be7327669e557 import (
-    JSONSchemaValidatorE3D7Ad943D3A50Fb8C3BE7327669E557 as JSONSchemaValidatorE3D7Ad943D3A50Fb8C3BE7327669E557_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e3e170003d865b9a8d76cbe1d2f268be import (
-    JSONSchemaValidatorE3E170003D865B9A8D76Cbe1D2F268Be as JSONSchemaValidatorE3E170003D865B9A8D76Cbe1D2F268Be_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e4a09bf566f35babad9e27f5eb61a86d import (
-    JSONSchemaValidatorE4A09Bf566F35BabAd9E27F5Eb61A86D as JSONSchemaValidatorE4A09Bf566F35BabAd9E27F5Eb61A86D_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e4d083d956805f63b970be543c34eb0e import (
-    JSONSchemaValidatorE4D083D956805F63B970Be543C34Eb0E as JSONSchemaValidatorE4D083D956805F63B970Be543C34Eb0E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e4ddf9b60efb59ac8f6a200a563d9d72 import (
-    JSONSchemaValidatorE4Ddf9B60Efb59Ac8F6A200A563D9D72 as JSONSchemaValidatorE4Ddf9B60Efb59Ac8F6A200A563D9D72_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e6c22549e5145c4892d0bd3b97614e07 import (
-    JSONSchemaValidatorE6C22549E5145C4892D0Bd3B97614E07 as JSONSchemaValidatorE6C22549E5145C4892D0Bd3B97614E07_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e6eed78cb55d51a1bfe669729df25689 import (
-    JSONSchemaValidatorE6Eed78CB55D51A1Bfe669729Df25689 as JSONSchemaValidatorE6Eed78CB55D51A1Bfe669729Df25689_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e7af120721c7519a84b13bbe4a1a0362 import (
-    JSONSchemaValidatorE7Af120721C7519A84B13Bbe4A1A0362 as JSONSchemaValidatorE7Af120721C7519A84B13Bbe4A1A0362_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e8271b05b62c54609f74b4f2f373ad5a import (
-    JSONSchemaValidatorE8271B05B62C54609F74B4F2F373Ad5A as JSONSchemaValidatorE8271B05B62C54609F74B4F2F373Ad5A_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_e85b40c5ca055f4c82281617a8f95644 import (
-    JSONSchemaValidatorE85B40C5Ca055F4C82281617A8F95644 as JSONSchemaValidatorE85B40C5Ca055F4C82281617A8F95644_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ea4363569a9d58779c2bfc05b6e45423 import (
-    JSONSchemaValidatorEa4363569A9D58779C2BFc05B6E45423 as JSONSchemaValidatorEa4363569A9D58779C2BFc05B6E45423_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ea59df3daf2a57a0b48044cc49c8a1ca import (
-    JSONSchemaValidatorEa59Df3DAf2A57A0B48044Cc49C8A1Ca as JSONSchemaValidatorEa59Df3DAf2A57A0B48044Cc49C8A1Ca_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ea5f116c0cd152bbb4a92c043738ea57 import (
-    JSONSchemaValidatorEa5F116C0Cd152BbB4A92C043738Ea57 as JSONSchemaValidatorEa5F116C0Cd152BbB4A92C043738Ea57_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_eab4d187be085cac8a53971def40bee0 import (
-    JSONSchemaValidatorEab4D187Be085Cac8A53971Def40Bee0 as JSONSchemaValidatorEab4D187Be085Cac8A53971Def40Bee0_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_eb4a05f61e475ad0b9e74f963f27ea1d import (
-    JSONSchemaValidatorEb4A05F61E475Ad0B9E74F963F27Ea1D as JSONSchemaValidatorEb4A05F61E475Ad0B9E74F963F27Ea1D_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ecb990ad7f24519397dd8d6c88de0067 import (
-    JSONSchemaValidatorEcb990Ad7F24519397Dd8D6C88De0067 as JSONSchemaValidatorEcb990Ad7F24519397Dd8D6C88De0067_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ecdb2d14c29b5bf3ad79ed2e3cc70715 import (
-    JSONSchemaValidatorEcdb2D14C29B5Bf3Ad79Ed2E3Cc70715 as JSONSchemaValidatorEcdb2D14C29B5Bf3Ad79Ed2E3Cc70715_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ed266e6eda225aedbf581508635da822 import (
-    JSONSchemaValidatorEd266E6EDa225AedBf581508635Da822 as JSONSchemaValidatorEd266E6EDa225AedBf581508635Da822_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ed9125b257ea54b79ef2db2d8ebd9d00 import (
-    JSONSchemaValidatorEd9125B257Ea54B79Ef2Db2D8Ebd9D00 as JSONSchemaValidatorEd9125B257Ea54B79Ef2Db2D8Ebd9D00_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_edac26fbcb77539ebe8bc5bd4b49055b import (
-    JSONSchemaValidatorEdac26FbCb77539EBe8BC5Bd4B49055B as JSONSchemaValidatorEdac26FbCb77539EBe8BC5Bd4B49055B_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_edf997bb4bcc5dd6baca80647d8a47ce import (
-    JSONSchemaValidatorEdf997Bb4Bcc5Dd6Baca80647D8A47Ce as JSONSchemaValidatorEdf997Bb4Bcc5Dd6Baca80647D8A47Ce_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_eeb595d249295989a4917261463ea82a import (
-    JSONSchemaValidatorEeb595D249295989A4917261463Ea82A as JSONSchemaValidatorEeb595D249295989A4917261463Ea82A_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_eecf4323cb285985be72a7e061891059 import (
-    JSONSchemaValidatorEecf4323Cb285985Be72A7E061891059 as JSONSchemaValidatorEecf4323Cb285985Be72A7E061891059_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ef94c2c20ba15fd38e129ac75067de1e import (
-    JSONSchemaValidatorEf94C2C20Ba15Fd38E129Ac75067De1E as JSONSchemaValidatorEf94C2C20Ba15Fd38E129Ac75067De1E_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f08eb586113e597a91b1658297570934 import (
-    JSONSchemaValidatorF08Eb586113E597A91B1658297570934 as JSONSchemaValidatorF08Eb586113E597A91B1658297570934_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f0942fbb79f855e889d60777f41ea944 import (
-    JSONSchemaValidatorF0942Fbb79F855E889D60777F41Ea944 as JSONSchemaValidatorF0942Fbb79F855E889D60777F41Ea944_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f0f7b6e1e4e159e7a40001fc3e649dfc import (
-    JSONSchemaValidatorF0F7B6E1E4E159E7A40001Fc3E649Dfc as JSONSchemaValidatorF0F7B6E1E4E159E7A40001Fc3E649Dfc_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f15aaad792fc57fd89c880afc3b84dc4 import (
-    JSONSchemaValidatorF15Aaad792Fc57Fd89C880Afc3B84Dc4 as JSONSchemaValidatorF15Aaad792Fc57Fd89C880Afc3B84Dc4_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f200dc9a10d25beab1243a5b29f99c7d import (
-    JSONSchemaValidatorF200Dc9A10D25BeaB1243A5B29F99C7D as JSONSchemaValidatorF200Dc9A10D25BeaB1243A5B29F99C7D_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f20eecc6e2d95a03a9e8961cd4337467 import (
-    JSONSchemaValidatorF20Eecc6E2D95A03A9E8961Cd4337467 as JSONSchemaValidatorF20Eecc6E2D95A03A9E8961Cd4337467_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f210ff2d89425b4790ce56f19da7be92 import (
-    JSONSchemaValidatorF210Ff2D89425B4790Ce56F19Da7Be92 as JSONSchemaValidatorF210Ff2D89425B4790Ce56F19Da7Be92_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f325b2c7e429566ba5ed9ae8253b5bef import (
-    JSONSchemaValidatorF325B2C7E429566BA5Ed9Ae8253B5Bef as JSONSchemaValidatorF325B2C7E429566BA5Ed9Ae8253B5Bef_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f667322836d5527482ad2100bec7feb4 import (
-    JSONSchemaValidatorF667322836D5527482Ad2100Bec7Feb4 as JSONSchemaValidatorF667322836D5527482Ad2100Bec7Feb4_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f6a4086c00f45dc5a634f0b8db5cdfd3 import (
-    JSONSchemaValidatorF6A4086C00F45Dc5A634F0B8Db5Cdfd3 as JSONSchemaValidatorF6A4086C00F45Dc5A634F0B8Db5Cdfd3_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f6f9dde38ce458fcaf27ffd4f84bfe68 import (
-    JSONSchemaValidatorF6F9Dde38Ce458FcAf27Ffd4F84Bfe68 as JSONSchemaValidatorF6F9Dde38Ce458FcAf27Ffd4F84Bfe68_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f7a0cdee493d597e816e012afbcc928d import (
-    JSONSchemaValidatorF7A0Cdee493D597E816E012Afbcc928D as JSONSchemaValidatorF7A0Cdee493D597E816E012Afbcc928D_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f8b4842604b65658afb34b4f124db469 import (
-    JSONSchemaValidatorF8B4842604B65658Afb34B4F124Db469 as JSONSchemaValidatorF8B4842604B65658Afb34B4F124Db469_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f924b4c27d18500b9b23df516b55c182 import (
-    JSONSchemaValidatorF924B4C27D18500B9B23Df516B55C182 as JSONSchemaValidatorF924B4C27D18500B9B23Df516B55C182_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f9492367570c5f009cf8b5955790e87c import (
-    JSONSchemaValidatorF9492367570C5F009Cf8B5955790E87C as JSONSchemaValidatorF9492367570C5F009Cf8B5955790E87C_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f95014e3b3385f21afa39325f3508427 import (
-    JSONSchemaValidatorF95014E3B3385F21Afa39325F3508427 as JSONSchemaValidatorF95014E3B3385F21Afa39325F3508427_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_f99c96c3a9b45ddaabc2c75ff8efa67f import (
-    JSONSchemaValidatorF99C96C3A9B45DdaAbc2C75Ff8Efa67F as JSONSchemaValidatorF99C96C3A9B45DdaAbc2C75Ff8Efa67F_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fa3975be5af25501abb40339d96917eb import (
-    JSONSchemaValidatorFa3975Be5Af25501Abb40339D96917Eb as JSONSchemaValidatorFa3975Be5Af25501Abb40339D96917Eb_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fa8fb3bdbffe5958858f20447dcb3ca5 import (
-    JSONSchemaValidatorFa8Fb3BdBffe5958858F20447Dcb3Ca5 as JSONSchemaValidatorFa8Fb3BdBffe5958858F20447Dcb3Ca5_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fb5e152d4d3d59f5afd92f717f3a1eea import (
-    JSONSchemaValidatorFb5E152D4D3D59F5Afd92F717F3A1Eea as JSONSchemaValidatorFb5E152D4D3D59F5Afd92F717F3A1Eea_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fbdd94fbecd256c08e1d9f6e1a7657ac import (
-    JSONSchemaValidatorFbdd94FbEcd256C08E1D9F6E1A7657Ac as JSONSchemaValidatorFbdd94FbEcd256C08E1D9F6E1A7657Ac_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fc416739f3c655ed911884aec0130e83 import (
-    JSONSchemaValidatorFc416739F3C655Ed911884Aec0130E83 as JSONSchemaValidatorFc416739F3C655Ed911884Aec0130E83_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fc8410781af357b6be17a2104ce5efb1 import (
-    JSONSchemaValidatorFc8410781Af357B6Be17A2104Ce5Efb1 as JSONSchemaValidatorFc8410781Af357B6Be17A2104Ce5Efb1_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fd488ff002115f3b8f0ee165e5347609 import (
-    JSONSchemaValidatorFd488Ff002115F3B8F0EE165E5347609 as JSONSchemaValidatorFd488Ff002115F3B8F0EE165E5347609_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fdbe4ec3e9f252a988404dc94250b80d import (
-    JSONSchemaValidatorFdbe4Ec3E9F252A988404Dc94250B80D as JSONSchemaValidatorFdbe4Ec3E9F252A988404Dc94250B80D_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_fdfc828270d950ecb75480fe03f7d573 import (
-    JSONSchemaValidatorFdfc828270D950EcB75480Fe03F7D573 as JSONSchemaValidatorFdfc828270D950EcB75480Fe03F7D573_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ff5bf5a67c6c5c0aa9e7ba84c088e1a6 import (
-    JSONSchemaValidatorFf5Bf5A67C6C5C0AA9E7Ba84C088E1A6 as JSONSchemaValidatorFf5Bf5A67C6C5C0AA9E7Ba84C088E1A6_v3_1_6_0,
-)
-from .validators.v3_1_6_0.jsd_ffd2fefb57d5523c87a5d941eb93ddc3 import (
-    JSONSchemaValidatorFfd2Fefb57D5523C87A5D941Eb93Ddc3 as JSONSchemaValidatorFfd2Fefb57D5523C87A5D941Eb93Ddc3_v3_1_6_0,
-)
 
 class JSONSchemaValidator(object):
     """Validates a DNA Center JSON request."""
@@ -5497,4981 +60,151 @@ class JSONSchemaValidator(object):
             )
 
 
+class NoOpJSONSchemaValidator(object):
+    """Accepts any DNA Center JSON request without validating it."""
+
+    def validate(self, request):
+        pass
+
+
+#: Shared validator used when a model has no schema or validation is off.
+NO_OP_VALIDATOR = NoOpJSONSchemaValidator()
+
+
+def no_op_json_schema_validate(model):
+    """Validator factory that never validates requests."""
+    return NO_OP_VALIDATOR
+
+
+ValidationTiming = namedtuple("ValidationTiming", ["count", "total_time", "max_time"])
+
+
+class _TimedJSONSchemaValidator(object):
+    """Records the time spent by a validator in its owner's counters."""
+
+    __slots__ = ("_validator", "_timing", "_lock")
+
+    def __init__(self, validator, timing, lock):
+        self._validator = validator
+        self._timing = timing
+        self._lock = lock
+
+    def validate(self, request):
+        start = time.perf_counter()
+        try:
+            self._validator.validate(request)
+        finally:
+            elapsed = time.perf_counter() - start
+            timing = self._timing
+            with self._lock:
+                timing[0] += 1
+                timing[1] += elapsed
+                if elapsed > timing[2]:
+                    timing[2] = elapsed
+
+
+def _version_package(version):
+    """Name of the validators sub-package of a DNA Center version."""
+    return "v" + version.replace(".", "_")
+
+
+def _load_json_schema_validator(version, model):
+    """Import and instantiate the validator of a model.
+
+    The model identifier has the form `jsd_<id>_v<version>`; its validator
+    lives in `validators/v<version>/jsd_<id>.py`.
+
+    Returns:
+        The validator object or None if the model has no validator module.
+    """
+    suffix = "_" + _version_package(version)
+    if not model.startswith("jsd_") or not model.endswith(suffix):
+        return None
+    module_name = ".validators.{}.{}".format(
+        _version_package(version), model[: -len(suffix)]
+    )
+    try:
+        module = importlib.import_module(module_name, __package__)
+    except ImportError:
+        return None
+    for name, value in vars(module).items():
+        if name.startswith("JSONSchemaValidator") and isinstance(value, type):
+            return value()
+    return None
+
+
+def get_json_schema_validator(version, model):
+    """Return the cached validator of a model, loading it on first use.
+
+    Args:
+        version(str): The DNA Center version of the model.
+        model(str): The model identifier.
+
+    Returns:
+        The validator object or None if the model has no validator module.
+    """
+    key = (version, model)
+    try:
+        return _json_schema_validators[key]
+    except KeyError:
+        pass
+    with _json_schema_validators_lock:
+        if key not in _json_schema_validators:
+            _json_schema_validators[key] = _load_json_schema_validator(
+                version, model
+            )
+        return _json_schema_validators[key]
+
+
 class SchemaValidator:
     def __init__(self, version):
+        self.version = version
         self.json_schema_validators = {}
-        self.load_validators(version)
+        self._timings = {}
+        self._timings_lock = threading.Lock()
+
+    def _timed(self, model, validator):
+        timing = self._timings.setdefault(model, [0, 0.0, 0.0])
+        return _TimedJSONSchemaValidator(validator, timing, self._timings_lock)
+
+    def validation_stats(self):
+        """Validation timing counters of the models validated so far.
+
+        Returns:
+            dict: ValidationTiming(count, total_time, max_time) by model,
+            times in seconds.
+        """
+        with self._timings_lock:
+            return {
+                model: ValidationTiming(*timing)
+                for model, timing in self._timings.items()
+                if timing[0]
+            }
 
     def load_validators(self, version):
-        if version == "2.3.5.3":
-            self.json_schema_validators["jsd_b2f15d0c54c2862a60a904289ddd_v2_3_5_3"] = (
-                JSONSchemaValidatorB2F15D0C54C2862A60A904289Ddd_v2_3_5_3()
-            )
-            self.json_schema_validators[
-                "jsd_e22c99a82f5764828810acb45e7a9e_v2_3_5_3"
-            ] = JSONSchemaValidatorE22C99A82F5764828810Acb45E7A9E_v2_3_5_3()
-            self.json_schema_validators["jsd_97e350a7a690cdfeffa5eaca_v2_3_5_3"] = (
-                JSONSchemaValidator97E350A7A690Cdfeffa5Eaca_v2_3_5_3()
-            )
-            self.json_schema_validators[
-                "jsd_fd6083b0c65d03b2d53f10b3ece59d_v2_3_5_3"
-            ] = JSONSchemaValidatorFd6083B0C65D03B2D53F10B3Ece59D_v2_3_5_3()
-            self.json_schema_validators["jsd_a0a8d545698d1d59a9be90e51_v2_3_5_3"] = (
-                JSONSchemaValidatorA0A8D545698D1D59A9Be90E51_v2_3_5_3()
-            )
-            self.json_schema_validators[
-                "jsd_d7073129453698264e7519d82991c_v2_3_5_3"
-            ] = JSONSchemaValidatorD7073129453698264E7519D82991C_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_f790a930d452708353c374f5c0f90f_v2_3_5_3"
-            ] = JSONSchemaValidatorF790A930D452708353C374F5C0F90F_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_a544e27e18e5412af3b68d915c8ca50_v2_3_5_3"
-            ] = JSONSchemaValidatorA544E27E18E5412Af3B68D915C8Ca50_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_d999a1d36ee52babb6b619877dad734_v2_3_5_3"
-            ] = JSONSchemaValidatorD999A1D36Ee52BaBb6B619877Dad734_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_d76a951f85a7a927afc2f1ea935c8_v2_3_5_3"
-            ] = JSONSchemaValidatorD76A951F85A7A927AFc2F1Ea935C8_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_e1a76c121857a085149e62e56caadd_v2_3_5_3"
-            ] = JSONSchemaValidatorE1A76C121857A085149E62E56Caadd_v2_3_5_3()
-            self.json_schema_validators["jsd_f5a13405ba69f3957b98db8663a_v2_3_5_3"] = (
-                JSONSchemaValidatorF5A13405Ba69F3957B98Db8663A_v2_3_5_3()
-            )
-            self.json_schema_validators[
-                "jsd_a3954b27e5eeb82789ed231e0557f_v2_3_5_3"
-            ] = JSONSchemaValidatorA3954B27E5Eeb82789Ed231E0557F_v2_3_5_3()
-            self.json_schema_validators["jsd_e2202e5f7586e68778ed7772b1_v2_3_5_3"] = (
-                JSONSchemaValidatorE2202E5F7586E68778Ed7772B1_v2_3_5_3()
-            )
-            self.json_schema_validators[
-                "jsd_e3a724a35854758d65a83823c88435_v2_3_5_3"
-            ] = JSONSchemaValidatorE3A724A35854758D65A83823C88435_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_f256e33af7501a8bdae2742ca9f6d6_v2_3_5_3"
-            ] = JSONSchemaValidatorF256E33Af7501A8BdaE2742Ca9F6D6_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_b3323a24b275402b97c7e9ccfd78c91_v2_3_5_3"
-            ] = JSONSchemaValidatorB3323A24B275402B97C7E9Ccfd78C91_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_d1845268faf55f98bc952872259f16f_v2_3_5_3"
-            ] = JSONSchemaValidatorD1845268Faf55F98Bc952872259F16F_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_f77386a48895fa59dcddcc7dd4addb5_v2_3_5_3"
-            ] = JSONSchemaValidatorF77386A48895Fa59DcdDcc7Dd4Addb5_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_ffa347eb411567a9c793696795250a5_v2_3_5_3"
-            ] = JSONSchemaValidatorFfa347EB411567A9C793696795250A5_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_ffcaccdd9f2530abf66adc98c3f0201_v2_3_5_3"
-            ] = JSONSchemaValidatorFfcaccdD9F2530ABf66Adc98C3F0201_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_fa310ab095148bdb00d7d3d5e1676_v2_3_5_3"
-            ] = JSONSchemaValidatorFa310Ab095148Bdb00D7D3D5E1676_v2_3_5_3()
-            self.json_schema_validators["jsd_a9136d5513985f15e91a19da66c_v2_3_5_3"] = (
-                JSONSchemaValidatorA9136D5513985F15E91A19Da66C_v2_3_5_3()
-            )
-            self.json_schema_validators["jsd_b887c55faaca726bbe4ac2564_v2_3_5_3"] = (
-                JSONSchemaValidatorB887C55FaAca726Bbe4Ac2564_v2_3_5_3()
-            )
-            self.json_schema_validators["jsd_f90ae8599c8a21c98b7a1ca804_v2_3_5_3"] = (
-                JSONSchemaValidatorF90Ae8599C8A21C98B7A1Ca804_v2_3_5_3()
-            )
-            self.json_schema_validators["jsd_a94058a99acaaf8eb73c9227_v2_3_5_3"] = (
-                JSONSchemaValidatorA94058A99AcaAf8Eb73C9227_v2_3_5_3()
-            )
-            self.json_schema_validators["jsd_cfb1d6e52878d057740de275896_v2_3_5_3"] = (
-                JSONSchemaValidatorCfb1D6E52878D057740De275896_v2_3_5_3()
-            )
-            self.json_schema_validators["jsd_bdc981805b5fad0a038966d52558_v2_3_5_3"] = (
-                JSONSchemaValidatorBdc981805B5FAd0A038966D52558_v2_3_5_3()
-            )
-            self.json_schema_validators[
-                "jsd_df9908ad265e83ab77d73803925678_v2_3_5_3"
-            ] = JSONSchemaValidatorDf9908Ad265E83Ab77D73803925678_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_a3a1bf404bf5772828f66f1e10f074d_v2_3_5_3"
-            ] = JSONSchemaValidatorA3A1Bf404Bf5772828F66F1E10F074D_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_b60f9f312235959812d49dc4c469e83_v2_3_5_3"
-            ] = JSONSchemaValidatorB60F9F312235959812D49Dc4C469E83_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_bb01b6bd31b53bfb12bbe327320392e_v2_3_5_3"
-            ] = JSONSchemaValidatorBb01B6BD31B53BfB12BBe327320392E_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_e69d02d71905aecbd10b782469efbda_v2_3_5_3"
-            ] = JSONSchemaValidatorE69D02D71905AecBd10B782469Efbda_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_e722e05046d5262b55c125237e9b67d_v2_3_5_3"
-            ] = JSONSchemaValidatorE722E05046D5262B55C125237E9B67D_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_d2bd5f05bd535a89ebadb30e2ede9e_v2_3_5_3"
-            ] = JSONSchemaValidatorD2Bd5F05Bd535A89EbAdb30E2Ede9E_v2_3_5_3()
-            self.json_schema_validators["jsd_d2ece28b509b8ef80b2b8c5c5f36_v2_3_5_3"] = (
-                JSONSchemaValidatorD2EcE28B509B8Ef80B2B8C5C5F36_v2_3_5_3()
-            )
-            self.json_schema_validators["jsd_e31c795964b3bdf85da1b5a2a5_v2_3_5_3"] = (
-                JSONSchemaValidatorE31C795964B3BdF85Da1B5A2A5_v2_3_5_3()
-            )
-            self.json_schema_validators[
-                "jsd_b8699619f95a24bd2d81f12f048235_v2_3_5_3"
-            ] = JSONSchemaValidatorB8699619F95A24Bd2D81F12F048235_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_c00df3623b5a74ad41e75487ed9b77_v2_3_5_3"
-            ] = JSONSchemaValidatorC00Df3623B5A74Ad41E75487Ed9B77_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_e702d5786552992aa76b930780569_v2_3_5_3"
-            ] = JSONSchemaValidatorE702D5786552992Aa76B930780569_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_af29516f0c8591da2a92523b5ab3386_v2_3_5_3"
-            ] = JSONSchemaValidatorAf29516F0C8591DA2A92523B5Ab3386_v2_3_5_3()
-            self.json_schema_validators["jsd_fdd2af215b9b8327a3e24a3dea89_v2_3_5_3"] = (
-                JSONSchemaValidatorFdd2Af215B9B8327A3E24A3Dea89_v2_3_5_3()
-            )
-            self.json_schema_validators[
-                "jsd_d9ccfce8451809129ec5de42c5048_v2_3_5_3"
-            ] = JSONSchemaValidatorD9CcfCe8451809129Ec5De42C5048_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_e6ea8c5d425cf9ac77006f5593725f_v2_3_5_3"
-            ] = JSONSchemaValidatorE6Ea8C5D425Cf9Ac77006F5593725F_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_bd5b507f58a50aab614e3d7409eec4c_v2_3_5_3"
-            ] = JSONSchemaValidatorBd5B507F58A50AaB614E3D7409Eec4C_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_e4f91ea42515ccdbc24549b84ca1e90_v2_3_5_3"
-            ] = JSONSchemaValidatorE4F91Ea42515CcdBc24549B84Ca1E90_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_f5d13316c8f53a0b78d881c738a15c6_v2_3_5_3"
-            ] = JSONSchemaValidatorF5D13316C8F53A0B78D881C738A15C6_v2_3_5_3()
-            self.json_schema_validators["jsd_bbf7ce025bc2a291b90c37a6b898_v2_3_5_3"] = (
-                JSONSchemaValidatorBbf7Ce025Bc2A291B90C37A6B898_v2_3_5_3()
-            )
-            self.json_schema_validators["jsd_e0b654c39dc6e19cd6f5194d_v2_3_5_3"] = (
-                JSONSchemaValidatorE0B654C39Dc6E19Cd6F5194D_v2_3_5_3()
-            )
-            self.json_schema_validators[
-                "jsd_ae7f02a3d051f2baf7cc087990d658_v2_3_5_3"
-            ] = JSONSchemaValidatorAe7F02A3D051F2Baf7Cc087990D658_v2_3_5_3()
-            self.json_schema_validators["jsd_d9227adc5f02b7cd264af7255d19_v2_3_5_3"] = (
-                JSONSchemaValidatorD9227Adc5F02B7Cd264Af7255D19_v2_3_5_3()
-            )
-            self.json_schema_validators[
-                "jsd_e6ec627d3c587288978990aae75228_v2_3_5_3"
-            ] = JSONSchemaValidatorE6Ec627D3C587288978990Aae75228_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_c380301e3e05423bdc1857ff00ae77a_v2_3_5_3"
-            ] = JSONSchemaValidatorC380301E3E05423Bdc1857Ff00Ae77A_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_f24f6c07641580ba6ed710e92c2da16_v2_3_5_3"
-            ] = JSONSchemaValidatorF24F6C07641580BA6Ed710E92C2Da16_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_fcc151af7615a84adf48b714d146192_v2_3_5_3"
-            ] = JSONSchemaValidatorFcc151AF7615A84Adf48B714D146192_v2_3_5_3()
-            self.json_schema_validators["jsd_fe3ec7651e79d891fce37a0d860_v2_3_5_3"] = (
-                JSONSchemaValidatorFe3Ec7651E79D891Fce37A0D860_v2_3_5_3()
-            )
-            self.json_schema_validators[
-                "jsd_b07f187b7456c8bbb6088a2f24dcee_v2_3_5_3"
-            ] = JSONSchemaValidatorB07F187B7456C8Bbb6088A2F24Dcee_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_cb7563a5058c4801eb842a74ff61c_v2_3_5_3"
-            ] = JSONSchemaValidatorCb7563A5058C4801EB842A74Ff61C_v2_3_5_3()
-            self.json_schema_validators["jsd_d39d23589e85db0a63c414057c_v2_3_5_3"] = (
-                JSONSchemaValidatorD39D23589E85Db0A63C414057C_v2_3_5_3()
-            )
-            self.json_schema_validators[
-                "jsd_a9f5796226051218eac559ab5211384_v2_3_5_3"
-            ] = JSONSchemaValidatorA9F5796226051218Eac559Ab5211384_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_c4befbd77a452a9b7873ffc360a1f20_v2_3_5_3"
-            ] = JSONSchemaValidatorC4Befbd77A452A9B7873Ffc360A1F20_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_c8d11fb9fc752ab8bb8e2b1413ccc92_v2_3_5_3"
-            ] = JSONSchemaValidatorC8D11Fb9Fc752Ab8Bb8E2B1413Ccc92_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_d82755e5e03510daf0951c1f42c2702_v2_3_5_3"
-            ] = JSONSchemaValidatorD82755E5E03510DAf0951C1F42C2702_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_e0bd567c1395531a7f18ab4e14110bd_v2_3_5_3"
-            ] = JSONSchemaValidatorE0Bd567C1395531A7F18Ab4E14110Bd_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_eca62ef076b5627a85b2a5959613fb8_v2_3_5_3"
-            ] = JSONSchemaValidatorEca62Ef076B5627A85B2A5959613Fb8_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_f6536a8f01d5863856a0a8308198e15_v2_3_5_3"
-            ] = JSONSchemaValidatorF6536A8F01D5863856A0A8308198E15_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_f7dd6a6cf8d57499168aae05847ad34_v2_3_5_3"
-            ] = JSONSchemaValidatorF7Dd6A6Cf8D57499168Aae05847Ad34_v2_3_5_3()
-            self.json_schema_validators["jsd_cec6c85d9bb4bcc8f61f31296b_v2_3_5_3"] = (
-                JSONSchemaValidatorCeC6C85D9BB4BcC8F61F31296B_v2_3_5_3()
-            )
-            self.json_schema_validators[
-                "jsd_f7cf4f24d54c6944a31ed308f8361_v2_3_5_3"
-            ] = JSONSchemaValidatorF7Cf4F24D54C6944A31Ed308F8361_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_db7b6c4f0542aab9fe7cf5c995f83_v2_3_5_3"
-            ] = JSONSchemaValidatorDb7B6C4F0542AAb9FE7Cf5C995F83_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_d7161b33157dba957ba18eda440c2_v2_3_5_3"
-            ] = JSONSchemaValidatorD7161B33157DbA957Ba18Eda440C2_v2_3_5_3()
-            self.json_schema_validators["jsd_f5ebb9d50aab287f320d32181c0_v2_3_5_3"] = (
-                JSONSchemaValidatorF5EBb9D50AaB287F320D32181C0_v2_3_5_3()
-            )
-            self.json_schema_validators[
-                "jsd_fa27ccbaf55711849381a707e1edfa_v2_3_5_3"
-            ] = JSONSchemaValidatorFa27CcBaf55711849381A707E1Edfa_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_f04b76067507b9384e409e9431ef3_v2_3_5_3"
-            ] = JSONSchemaValidatorF04B76067507B9384E409E9431Ef3_v2_3_5_3()
-            self.json_schema_validators["jsd_b6581534bb321eaea272365b7_v2_3_5_3"] = (
-                JSONSchemaValidatorB6581534BB321Eaea272365B7_v2_3_5_3()
-            )
-            self.json_schema_validators["jsd_d1608b2751c883a072ee3fb80228_v2_3_5_3"] = (
-                JSONSchemaValidatorD1608B2751C883A072Ee3Fb80228_v2_3_5_3()
-            )
-            self.json_schema_validators[
-                "jsd_be8cdb967555fcca03a4c1f796eee56_v2_3_5_3"
-            ] = JSONSchemaValidatorBe8Cdb967555FccA03A4C1F796Eee56_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_dbea7d7de125cf6b840d5032d3a5c59_v2_3_5_3"
-            ] = JSONSchemaValidatorDbea7D7De125Cf6B840D5032D3A5C59_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_f5645e6e819558fa08761dee45ca406_v2_3_5_3"
-            ] = JSONSchemaValidatorF5645E6E819558FA08761Dee45Ca406_v2_3_5_3()
-            self.json_schema_validators["jsd_fe06867e548bba1919024b40d992_v2_3_5_3"] = (
-                JSONSchemaValidatorFe06867E548BBa1919024B40D992_v2_3_5_3()
-            )
-            self.json_schema_validators["jsd_efa92557c9a6c8af0a71829c7e_v2_3_5_3"] = (
-                JSONSchemaValidatorEfA92557C9A6C8Af0A71829C7E_v2_3_5_3()
-            )
-            self.json_schema_validators["jsd_ecc3258a5c5b8f2267a512820a59_v2_3_5_3"] = (
-                JSONSchemaValidatorEcc3258A5C5B8F2267A512820A59_v2_3_5_3()
-            )
-            self.json_schema_validators[
-                "jsd_f5602b2965e53b5bdda193025a3fc_v2_3_5_3"
-            ] = JSONSchemaValidatorF5602B2965E53B5BdDa193025A3Fc_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_d16471a58805b4aa2c757209d188aed_v2_3_5_3"
-            ] = JSONSchemaValidatorD16471A58805B4AA2C757209D188Aed_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_d8fc92ddeab597ebb50ea003a6d46bd_v2_3_5_3"
-            ] = JSONSchemaValidatorD8Fc92DDeab597EBb50Ea003A6D46Bd_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_cf2cac6f150c9bee9ade37921b162_v2_3_5_3"
-            ] = JSONSchemaValidatorCf2CaC6F150C9Bee9Ade37921B162_v2_3_5_3()
-            self.json_schema_validators["jsd_bc55e6552fac58cc0aaacd773a_v2_3_5_3"] = (
-                JSONSchemaValidatorBc55E6552FAc58Cc0Aaacd773A_v2_3_5_3()
-            )
-            self.json_schema_validators[
-                "jsd_dece7a9b353b49084a8ffa4f18c91_v2_3_5_3"
-            ] = JSONSchemaValidatorDece7A9B353B49084A8Ffa4F18C91_v2_3_5_3()
-            self.json_schema_validators["jsd_c9ea5c02b2b7368cac785f30_v2_3_5_3"] = (
-                JSONSchemaValidatorC9Ea5C02B2B7368Cac785F30_v2_3_5_3()
-            )
-            self.json_schema_validators["jsd_f2c120b855cb8c852806ce72e54d_v2_3_5_3"] = (
-                JSONSchemaValidatorF2C120B855Cb8C852806Ce72E54D_v2_3_5_3()
-            )
-            self.json_schema_validators[
-                "jsd_aaebb912125213b350d7423b4f01a4_v2_3_5_3"
-            ] = JSONSchemaValidatorAaebb912125213B350D7423B4F01A4_v2_3_5_3()
-            self.json_schema_validators["jsd_ad0cce45817862bebfc839bf5ae_v2_3_5_3"] = (
-                JSONSchemaValidatorAd0Cce45817862BEbfc839Bf5Ae_v2_3_5_3()
-            )
-            self.json_schema_validators[
-                "jsd_fb5a8c0075563491622171958074bf_v2_3_5_3"
-            ] = JSONSchemaValidatorFb5A8C0075563491622171958074Bf_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_a764c85d8df5c30b9143619d4f9cde9_v2_3_5_3"
-            ] = JSONSchemaValidatorA764C85D8Df5C30B9143619D4F9Cde9_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_c991ce0b0f058a08c863a4abdfc70a6_v2_3_5_3"
-            ] = JSONSchemaValidatorC991Ce0B0F058A08C863A4Abdfc70A6_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_f41eb48a0da56949cfaddeecb51ab66_v2_3_5_3"
-            ] = JSONSchemaValidatorF41Eb48A0Da56949CfaDdeecb51Ab66_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_a352f6280e445075b3ea7cbf868c2d94_v2_3_5_3"
-            ] = JSONSchemaValidatorA352F6280E445075B3Ea7Cbf868C2D94_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_a3b37dcbe2a150bea06d9dcde1837281_v2_3_5_3"
-            ] = JSONSchemaValidatorA3B37DcbE2A150BeA06D9Dcde1837281_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_a54fce1a0c305bdabfe91a8a6161e539_v2_3_5_3"
-            ] = JSONSchemaValidatorA54Fce1A0C305BdaBfe91A8A6161E539_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_a66db26df529597c84c2a15ea2d632ce_v2_3_5_3"
-            ] = JSONSchemaValidatorA66Db26DF529597C84C2A15Ea2D632Ce_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_a73fbc67627e5bbbafe748de84d42df6_v2_3_5_3"
-            ] = JSONSchemaValidatorA73Fbc67627E5BbbAfe748De84D42Df6_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_a7935eedd53a5b8c84668c903cc1c705_v2_3_5_3"
-            ] = JSONSchemaValidatorA7935EedD53A5B8C84668C903Cc1C705_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_a7d6d604f38f5f849af79d8768bddfc1_v2_3_5_3"
-            ] = JSONSchemaValidatorA7D6D604F38F5F849Af79D8768Bddfc1_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_a9b864257b965fe4bd8b0293f41f1537_v2_3_5_3"
-            ] = JSONSchemaValidatorA9B864257B965Fe4Bd8B0293F41F1537_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_aa11f09d28165f4ea6c81b8642e59cc4_v2_3_5_3"
-            ] = JSONSchemaValidatorAa11F09D28165F4EA6C81B8642E59Cc4_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_ac6e63199fb05bcf89106a22502c2197_v2_3_5_3"
-            ] = JSONSchemaValidatorAc6E63199Fb05Bcf89106A22502C2197_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_ad96e712f4525a128368b1bfe3afc21c_v2_3_5_3"
-            ] = JSONSchemaValidatorAd96E712F4525A128368B1Bfe3Afc21C_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_b119a4d455e35cc3b2cc6695a045cbfa_v2_3_5_3"
-            ] = JSONSchemaValidatorB119A4D455E35Cc3B2Cc6695A045Cbfa_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_b11aa4de387251c794665e030fa815da_v2_3_5_3"
-            ] = JSONSchemaValidatorB11Aa4De387251C794665E030Fa815Da_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_b2dae3b41636596aa02c3ad0a4bcb8d7_v2_3_5_3"
-            ] = JSONSchemaValidatorB2Dae3B41636596AA02C3Ad0A4Bcb8D7_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_b6f2d8e46cdd5f05bb06f52cd1b26fb2_v2_3_5_3"
-            ] = JSONSchemaValidatorB6F2D8E46Cdd5F05Bb06F52Cd1B26Fb2_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_b7079a38844e56dd8f1b6b876880a02e_v2_3_5_3"
-            ] = JSONSchemaValidatorB7079A38844E56Dd8F1B6B876880A02E_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_b95201b6a6905a10b463e036bf591166_v2_3_5_3"
-            ] = JSONSchemaValidatorB95201B6A6905A10B463E036Bf591166_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_bc33daf690ec5399a507829abfc4fe64_v2_3_5_3"
-            ] = JSONSchemaValidatorBc33Daf690Ec5399A507829Abfc4Fe64_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_bc3cb471beaf5bfeb47201993c023068_v2_3_5_3"
-            ] = JSONSchemaValidatorBc3Cb471Beaf5BfeB47201993C023068_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_bce8e6b307ce52dd8f5546fbd78e05ee_v2_3_5_3"
-            ] = JSONSchemaValidatorBce8E6B307Ce52Dd8F5546Fbd78E05Ee_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_bd31fcbd1ecd5a2c8b812088b27bfcea_v2_3_5_3"
-            ] = JSONSchemaValidatorBd31Fcbd1Ecd5A2C8B812088B27Bfcea_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_bf40cea4982c54278a52ac2e7b0c458a_v2_3_5_3"
-            ] = JSONSchemaValidatorBf40Cea4982C54278A52Ac2E7B0C458A_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_c524f0ec199e5435bcaee56b423532e7_v2_3_5_3"
-            ] = JSONSchemaValidatorC524F0Ec199E5435BcaeE56B423532E7_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_c5f97865727857d5b1eeaedee3dcccd2_v2_3_5_3"
-            ] = JSONSchemaValidatorC5F97865727857D5B1EeAedee3Dcccd2_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_c6774ff9549a53d4b41fdd2d88f1d0f5_v2_3_5_3"
-            ] = JSONSchemaValidatorC6774Ff9549A53D4B41FDd2D88F1D0F5_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_c9b5b83e67195b649077a05e42897cc4_v2_3_5_3"
-            ] = JSONSchemaValidatorC9B5B83E67195B649077A05E42897Cc4_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_c9f995abc21b54e7860f66aef2ffbc85_v2_3_5_3"
-            ] = JSONSchemaValidatorC9F995AbC21B54E7860F66Aef2Ffbc85_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_cc19241fd92f586c8986d4d5c99c3a88_v2_3_5_3"
-            ] = JSONSchemaValidatorCc19241FD92F586C8986D4D5C99C3A88_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_cc72e307e5df50c48ce57370f27395a0_v2_3_5_3"
-            ] = JSONSchemaValidatorCc72E307E5Df50C48Ce57370F27395A0_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_ccbf614b4b355cac929f12cc61272c1c_v2_3_5_3"
-            ] = JSONSchemaValidatorCcbf614B4B355Cac929F12Cc61272C1C_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_cec8139f6b1c5e5991d12197206029a0_v2_3_5_3"
-            ] = JSONSchemaValidatorCec8139F6B1C5E5991D12197206029A0_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_cfadc5e4c912588389f4f63d2fb6e4ed_v2_3_5_3"
-            ] = JSONSchemaValidatorCfadc5E4C912588389F4F63D2Fb6E4Ed_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_d045d18062ad5ae59c6f446beb17d675_v2_3_5_3"
-            ] = JSONSchemaValidatorD045D18062Ad5Ae59C6F446Beb17D675_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_d0aab00569b258b481afedc35e6db392_v2_3_5_3"
-            ] = JSONSchemaValidatorD0Aab00569B258B481AfEdc35E6Db392_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_d1d42ef2f1895a82a2830bf1353e6baa_v2_3_5_3"
-            ] = JSONSchemaValidatorD1D42Ef2F1895A82A2830Bf1353E6Baa_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_d2a712eb315650618d475db5de0aabec_v2_3_5_3"
-            ] = JSONSchemaValidatorD2A712Eb315650618D475Db5De0Aabec_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_d2ea814bfae85da1b77872d095fc8221_v2_3_5_3"
-            ] = JSONSchemaValidatorD2Ea814BFae85Da1B77872D095Fc8221_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_d5c229546dc755f796dfcf34f1c2e290_v2_3_5_3"
-            ] = JSONSchemaValidatorD5C229546Dc755F796DfCf34F1C2E290_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_d825ae9a117f5b6bb65b7d78fd42513c_v2_3_5_3"
-            ] = JSONSchemaValidatorD825Ae9A117F5B6BB65B7D78Fd42513C_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_d967a378b43457ad8c6a6de7bc1845d1_v2_3_5_3"
-            ] = JSONSchemaValidatorD967A378B43457Ad8C6A6De7Bc1845D1_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_da593242978c5047bb6b62b7f9475326_v2_3_5_3"
-            ] = JSONSchemaValidatorDa593242978C5047Bb6B62B7F9475326_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_dc254215fdf25cd5b7ba797e8f8faebf_v2_3_5_3"
-            ] = JSONSchemaValidatorDc254215Fdf25Cd5B7Ba797E8F8Faebf_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_dcc43be0514e50fea80cfa827f13ee5c_v2_3_5_3"
-            ] = JSONSchemaValidatorDcc43Be0514E50FeA80CFa827F13Ee5C_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_dec1857f1585557eb39e12a9c93ef985_v2_3_5_3"
-            ] = JSONSchemaValidatorDec1857F1585557EB39E12A9C93Ef985_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_df26f516755a50b5b5477324cf5cb649_v2_3_5_3"
-            ] = JSONSchemaValidatorDf26F516755A50B5B5477324Cf5Cb649_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_dfda5beca4cc5437876bff366493ebf0_v2_3_5_3"
-            ] = JSONSchemaValidatorDfda5BecA4Cc5437876BFf366493Ebf0_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_e0c7b28d55c85d49a84c1403ca14bd5f_v2_3_5_3"
-            ] = JSONSchemaValidatorE0C7B28D55C85D49A84C1403Ca14Bd5F_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_e11daa984f535a08bc1eb01bc84bc399_v2_3_5_3"
-            ] = JSONSchemaValidatorE11Daa984F535A08Bc1EB01Bc84Bc399_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_e1781a990c6b5a4b895d56bcfda2b7cb_v2_3_5_3"
-            ] = JSONSchemaValidatorE1781A990C6B5A4B895D56Bcfda2B7Cb_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_e1b8c435195d56368c24a54dcce007d0_v2_3_5_3"
-            ] = JSONSchemaValidatorE1B8C435195D56368C24A54Dcce007D0_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_e2f9718de3d050819cdc6355a3a43200_v2_3_5_3"
-            ] = JSONSchemaValidatorE2F9718DE3D050819Cdc6355A3A43200_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_e3934b0fb68a5ff787e65e9b7c8e6296_v2_3_5_3"
-            ] = JSONSchemaValidatorE3934B0FB68A5Ff787E65E9B7C8E6296_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_e3d7ad943d3a50fb8c3be7327669e557_v2_3_5_3"
-            ] = JSONSchemaValidatorE3D7Ad943D3A50Fb8C3BE7327669E557_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_e3e170003d865b9a8d76cbe1d2f268be_v2_3_5_3"
-            ] = JSONSchemaValidatorE3E170003D865B9A8D76Cbe1D2F268Be_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_e4a09bf566f35babad9e27f5eb61a86d_v2_3_5_3"
-            ] = JSONSchemaValidatorE4A09Bf566F35BabAd9E27F5Eb61A86D_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_e8271b05b62c54609f74b4f2f373ad5a_v2_3_5_3"
-            ] = JSONSchemaValidatorE8271B05B62C54609F74B4F2F373Ad5A_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_e85b40c5ca055f4c82281617a8f95644_v2_3_5_3"
-            ] = JSONSchemaValidatorE85B40C5Ca055F4C82281617A8F95644_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_ea59df3daf2a57a0b48044cc49c8a1ca_v2_3_5_3"
-            ] = JSONSchemaValidatorEa59Df3DAf2A57A0B48044Cc49C8A1Ca_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_ecdb2d14c29b5bf3ad79ed2e3cc70715_v2_3_5_3"
-            ] = JSONSchemaValidatorEcdb2D14C29B5Bf3Ad79Ed2E3Cc70715_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_ed266e6eda225aedbf581508635da822_v2_3_5_3"
-            ] = JSONSchemaValidatorEd266E6EDa225AedBf581508635Da822_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_eecf4323cb285985be72a7e061891059_v2_3_5_3"
-            ] = JSONSchemaValidatorEecf4323Cb285985Be72A7E061891059_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_f325b2c7e429566ba5ed9ae8253b5bef_v2_3_5_3"
-            ] = JSONSchemaValidatorF325B2C7E429566BA5Ed9Ae8253B5Bef_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_f8b4842604b65658afb34b4f124db469_v2_3_5_3"
-            ] = JSONSchemaValidatorF8B4842604B65658Afb34B4F124Db469_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_f9492367570c5f009cf8b5955790e87c_v2_3_5_3"
-            ] = JSONSchemaValidatorF9492367570C5F009Cf8B5955790E87C_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_f99c96c3a9b45ddaabc2c75ff8efa67f_v2_3_5_3"
-            ] = JSONSchemaValidatorF99C96C3A9B45DdaAbc2C75Ff8Efa67F_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_fc416739f3c655ed911884aec0130e83_v2_3_5_3"
-            ] = JSONSchemaValidatorFc416739F3C655Ed911884Aec0130E83_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_fc8410781af357b6be17a2104ce5efb1_v2_3_5_3"
-            ] = JSONSchemaValidatorFc8410781Af357B6Be17A2104Ce5Efb1_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_fd488ff002115f3b8f0ee165e5347609_v2_3_5_3"
-            ] = JSONSchemaValidatorFd488Ff002115F3B8F0EE165E5347609_v2_3_5_3()
-            self.json_schema_validators[
-                "jsd_fdbe4ec3e9f252a988404dc94250b80d_v2_3_5_3"
-            ] = JSONSchemaValidatorFdbe4Ec3E9F252A988404Dc94250B80D_v2_3_5_3()
-        if version == "2.3.7.6":
-            self.json_schema_validators["jsd_b2f15d0c54c2862a60a904289ddd_v2_3_7_6"] = (
-                JSONSchemaValidatorB2F15D0C54C2862A60A904289Ddd_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_e4d208b5545f66bf0f94a155c81f46_v2_3_7_6"
-            ] = JSONSchemaValidatorE4D208B5545F66Bf0F94A155C81F46_v2_3_7_6()
-            self.json_schema_validators["jsd_bece53a182b45ffa4a1a435e_v2_3_7_6"] = (
-                JSONSchemaValidatorBece53A182B45Ffa4A1A435E_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_cdc0bafd4257e78d211a1f4120bfa9_v2_3_7_6"
-            ] = JSONSchemaValidatorCdc0BaFd4257E78D211A1F4120Bfa9_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e22c99a82f5764828810acb45e7a9e_v2_3_7_6"
-            ] = JSONSchemaValidatorE22C99A82F5764828810Acb45E7A9E_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_cfb964a2958909f7ca12d23ab2bdb_v2_3_7_6"
-            ] = JSONSchemaValidatorCfb964A2958909F7CA12D23Ab2Bdb_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ee8590b6b45048b84e814161272bee_v2_3_7_6"
-            ] = JSONSchemaValidatorEe8590B6B45048B84E814161272Bee_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_bb7c52e5225e9398a006fecf4da06f_v2_3_7_6"
-            ] = JSONSchemaValidatorBb7C52E5225E9398A006Fecf4Da06F_v2_3_7_6()
-            self.json_schema_validators["jsd_d5da0365e31972173f015ed3614_v2_3_7_6"] = (
-                JSONSchemaValidatorD5DA0365E31972173F015Ed3614_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_97e350a7a690cdfeffa5eaca_v2_3_7_6"] = (
-                JSONSchemaValidator97E350A7A690Cdfeffa5Eaca_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_fd6083b0c65d03b2d53f10b3ece59d_v2_3_7_6"
-            ] = JSONSchemaValidatorFd6083B0C65D03B2D53F10B3Ece59D_v2_3_7_6()
-            self.json_schema_validators["jsd_a0a8d545698d1d59a9be90e51_v2_3_7_6"] = (
-                JSONSchemaValidatorA0A8D545698D1D59A9Be90E51_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_a421626459dcbe382c43ffcbddae_v2_3_7_6"] = (
-                JSONSchemaValidatorA421626459DcBe382C43Ffcbddae_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_d7073129453698264e7519d82991c_v2_3_7_6"
-            ] = JSONSchemaValidatorD7073129453698264E7519D82991C_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f751cc2f55767b34e4c890b3fd36e_v2_3_7_6"
-            ] = JSONSchemaValidatorF751CC2F55767B34E4C890B3Fd36E_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f790a930d452708353c374f5c0f90f_v2_3_7_6"
-            ] = JSONSchemaValidatorF790A930D452708353C374F5C0F90F_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a544e27e18e5412af3b68d915c8ca50_v2_3_7_6"
-            ] = JSONSchemaValidatorA544E27E18E5412Af3B68D915C8Ca50_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d999a1d36ee52babb6b619877dad734_v2_3_7_6"
-            ] = JSONSchemaValidatorD999A1D36Ee52BaBb6B619877Dad734_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e86b65311b05d29ba5eea0d5f1fd88f_v2_3_7_6"
-            ] = JSONSchemaValidatorE86B65311B05D29Ba5EEa0D5F1Fd88F_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f44ddd3c38c5a9484f5cb4e125447bc_v2_3_7_6"
-            ] = JSONSchemaValidatorF44Ddd3C38C5A9484F5Cb4E125447Bc_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_cd16daa50533eb0f5873b7601abb2_v2_3_7_6"
-            ] = JSONSchemaValidatorCd16DAa50533EB0F5873B7601Abb2_v2_3_7_6()
-            self.json_schema_validators["jsd_c7266d89581c9601b79b7304fda3_v2_3_7_6"] = (
-                JSONSchemaValidatorC7266D89581C9601B79B7304Fda3_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_d76a951f85a7a927afc2f1ea935c8_v2_3_7_6"
-            ] = JSONSchemaValidatorD76A951F85A7A927AFc2F1Ea935C8_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f2c49c69c53e7b4f57f2af9a6f597_v2_3_7_6"
-            ] = JSONSchemaValidatorF2C49C69C53E7B4F57F2Af9A6F597_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e1a76c121857a085149e62e56caadd_v2_3_7_6"
-            ] = JSONSchemaValidatorE1A76C121857A085149E62E56Caadd_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ca2f659b595c0ba7c649fd8c8bdad6_v2_3_7_6"
-            ] = JSONSchemaValidatorCa2F659B595C0BA7C649Fd8C8Bdad6_v2_3_7_6()
-            self.json_schema_validators["jsd_a4dab79d54829548004029a91ba1_v2_3_7_6"] = (
-                JSONSchemaValidatorA4DaB79D54829548004029A91Ba1_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_f5a13405ba69f3957b98db8663a_v2_3_7_6"] = (
-                JSONSchemaValidatorF5A13405Ba69F3957B98Db8663A_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_b107800544384c1ddad7b60c237_v2_3_7_6"] = (
-                JSONSchemaValidatorB107800544384C1Ddad7B60C237_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_a3954b27e5eeb82789ed231e0557f_v2_3_7_6"
-            ] = JSONSchemaValidatorA3954B27E5Eeb82789Ed231E0557F_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e3a724a35854758d65a83823c88435_v2_3_7_6"
-            ] = JSONSchemaValidatorE3A724A35854758D65A83823C88435_v2_3_7_6()
-            self.json_schema_validators["jsd_a2131eae5c1d8e73cd55eebf6a83_v2_3_7_6"] = (
-                JSONSchemaValidatorA2131Eae5C1D8E73Cd55Eebf6A83_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_f256e33af7501a8bdae2742ca9f6d6_v2_3_7_6"
-            ] = JSONSchemaValidatorF256E33Af7501A8BdaE2742Ca9F6D6_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_b269afaaa855d3291b825f724fc8ea9_v2_3_7_6"
-            ] = JSONSchemaValidatorB269AfaAa855D3291B825F724Fc8Ea9_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_b3323a24b275402b97c7e9ccfd78c91_v2_3_7_6"
-            ] = JSONSchemaValidatorB3323A24B275402B97C7E9Ccfd78C91_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ccbaf226c685cacac29eb345955f3ad_v2_3_7_6"
-            ] = JSONSchemaValidatorCcbaf226C685CacAc29Eb345955F3Ad_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d1845268faf55f98bc952872259f16f_v2_3_7_6"
-            ] = JSONSchemaValidatorD1845268Faf55F98Bc952872259F16F_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d9bd7c527d254ecb63d2b709c428043_v2_3_7_6"
-            ] = JSONSchemaValidatorD9Bd7C527D254EcB63D2B709C428043_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f77386a48895fa59dcddcc7dd4addb5_v2_3_7_6"
-            ] = JSONSchemaValidatorF77386A48895Fa59DcdDcc7Dd4Addb5_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ffa347eb411567a9c793696795250a5_v2_3_7_6"
-            ] = JSONSchemaValidatorFfa347EB411567A9C793696795250A5_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ffcaccdd9f2530abf66adc98c3f0201_v2_3_7_6"
-            ] = JSONSchemaValidatorFfcaccdD9F2530ABf66Adc98C3F0201_v2_3_7_6()
-            self.json_schema_validators["jsd_bf80823752baba63a8849fd521cd_v2_3_7_6"] = (
-                JSONSchemaValidatorBf80823752BaBa63A8849Fd521Cd_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_fa310ab095148bdb00d7d3d5e1676_v2_3_7_6"
-            ] = JSONSchemaValidatorFa310Ab095148Bdb00D7D3D5E1676_v2_3_7_6()
-            self.json_schema_validators["jsd_a9136d5513985f15e91a19da66c_v2_3_7_6"] = (
-                JSONSchemaValidatorA9136D5513985F15E91A19Da66C_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_b887c55faaca726bbe4ac2564_v2_3_7_6"] = (
-                JSONSchemaValidatorB887C55FaAca726Bbe4Ac2564_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_f90ae8599c8a21c98b7a1ca804_v2_3_7_6"] = (
-                JSONSchemaValidatorF90Ae8599C8A21C98B7A1Ca804_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_a94058a99acaaf8eb73c9227_v2_3_7_6"] = (
-                JSONSchemaValidatorA94058A99AcaAf8Eb73C9227_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_cfb1d6e52878d057740de275896_v2_3_7_6"] = (
-                JSONSchemaValidatorCfb1D6E52878D057740De275896_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_bdc981805b5fad0a038966d52558_v2_3_7_6"] = (
-                JSONSchemaValidatorBdc981805B5FAd0A038966D52558_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_df9908ad265e83ab77d73803925678_v2_3_7_6"
-            ] = JSONSchemaValidatorDf9908Ad265E83Ab77D73803925678_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a924f763a15125a8d5beaa6dd6fa2c_v2_3_7_6"
-            ] = JSONSchemaValidatorA924F763A15125A8D5Beaa6Dd6Fa2C_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_de4c9b685250dfa8556ab1ec20407c_v2_3_7_6"
-            ] = JSONSchemaValidatorDe4C9B685250DfA8556Ab1Ec20407C_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a15a2f83f975a6a9964e7da79a605de_v2_3_7_6"
-            ] = JSONSchemaValidatorA15A2F83F975A6A9964E7Da79A605De_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a3a1bf404bf5772828f66f1e10f074d_v2_3_7_6"
-            ] = JSONSchemaValidatorA3A1Bf404Bf5772828F66F1E10F074D_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_b60f9f312235959812d49dc4c469e83_v2_3_7_6"
-            ] = JSONSchemaValidatorB60F9F312235959812D49Dc4C469E83_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_bb01b6bd31b53bfb12bbe327320392e_v2_3_7_6"
-            ] = JSONSchemaValidatorBb01B6BD31B53BfB12BBe327320392E_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_c224ae3007d5486bbc5abb1f88e95e6_v2_3_7_6"
-            ] = JSONSchemaValidatorC224Ae3007D5486Bbc5Abb1F88E95E6_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d9ed5bba1155b9c8fe132640832f94e_v2_3_7_6"
-            ] = JSONSchemaValidatorD9Ed5BbA1155B9C8Fe132640832F94E_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e69d02d71905aecbd10b782469efbda_v2_3_7_6"
-            ] = JSONSchemaValidatorE69D02D71905AecBd10B782469Efbda_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e722e05046d5262b55c125237e9b67d_v2_3_7_6"
-            ] = JSONSchemaValidatorE722E05046D5262B55C125237E9B67D_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d77719c37558f694e5545a21406275_v2_3_7_6"
-            ] = JSONSchemaValidatorD77719C37558F694E5545A21406275_v2_3_7_6()
-            self.json_schema_validators["jsd_d9a13d575abdc26d485af708e7_v2_3_7_6"] = (
-                JSONSchemaValidatorD9A13D575ABdc26D485Af708E7_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_c279ba052250d883ef87775a415089_v2_3_7_6"
-            ] = JSONSchemaValidatorC279Ba052250D883Ef87775A415089_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d2bd5f05bd535a89ebadb30e2ede9e_v2_3_7_6"
-            ] = JSONSchemaValidatorD2Bd5F05Bd535A89EbAdb30E2Ede9E_v2_3_7_6()
-            self.json_schema_validators["jsd_d2ece28b509b8ef80b2b8c5c5f36_v2_3_7_6"] = (
-                JSONSchemaValidatorD2EcE28B509B8Ef80B2B8C5C5F36_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_e31c795964b3bdf85da1b5a2a5_v2_3_7_6"] = (
-                JSONSchemaValidatorE31C795964B3BdF85Da1B5A2A5_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_dabd13cd5e9c928daf80d6758d62_v2_3_7_6"] = (
-                JSONSchemaValidatorDabd13Cd5E9C928DAf80D6758D62_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_b46a141650debf5946262e8a0961_v2_3_7_6"] = (
-                JSONSchemaValidatorB46A141650DeBf5946262E8A0961_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_b8699619f95a24bd2d81f12f048235_v2_3_7_6"
-            ] = JSONSchemaValidatorB8699619F95A24Bd2D81F12F048235_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_c00df3623b5a74ad41e75487ed9b77_v2_3_7_6"
-            ] = JSONSchemaValidatorC00Df3623B5A74Ad41E75487Ed9B77_v2_3_7_6()
-            self.json_schema_validators["jsd_a64bd4956649de3a61e10f0637e_v2_3_7_6"] = (
-                JSONSchemaValidatorA64Bd4956649De3A61E10F0637E_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_a88c7510a15578b8eb2df183a92d5d_v2_3_7_6"
-            ] = JSONSchemaValidatorA88C7510A15578B8Eb2Df183A92D5D_v2_3_7_6()
-            self.json_schema_validators["jsd_cad522e57a7b96b7238935689ed_v2_3_7_6"] = (
-                JSONSchemaValidatorCad522E57A7B96B7238935689Ed_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_e702d5786552992aa76b930780569_v2_3_7_6"
-            ] = JSONSchemaValidatorE702D5786552992Aa76B930780569_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_cb98464ddb5ee9ba7ebb4428443ba9_v2_3_7_6"
-            ] = JSONSchemaValidatorCb98464Ddb5Ee9Ba7EBb4428443Ba9_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d292147221524a96616d982b0147c0_v2_3_7_6"
-            ] = JSONSchemaValidatorD292147221524A96616D982B0147C0_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_af29516f0c8591da2a92523b5ab3386_v2_3_7_6"
-            ] = JSONSchemaValidatorAf29516F0C8591DA2A92523B5Ab3386_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_de92f8ae3c15ea0bad5562452eb5c40_v2_3_7_6"
-            ] = JSONSchemaValidatorDe92F8AE3C15Ea0Bad5562452Eb5C40_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f09c94c65c858e4b7be0b7cb3d25b7a_v2_3_7_6"
-            ] = JSONSchemaValidatorF09C94C65C858E4B7Be0B7Cb3D25B7A_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f25c825ca6e58a5b1c2294b11558e7b_v2_3_7_6"
-            ] = JSONSchemaValidatorF25C825Ca6E58A5B1C2294B11558E7B_v2_3_7_6()
-            self.json_schema_validators["jsd_e0ed6b9a530ea05d77a199ded4e3_v2_3_7_6"] = (
-                JSONSchemaValidatorE0Ed6B9A530EA05D77A199Ded4E3_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_ad0cb5a12a76384ba4644e55e_v2_3_7_6"] = (
-                JSONSchemaValidatorAD0Cb5A12A76384Ba4644E55E_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_fdd2af215b9b8327a3e24a3dea89_v2_3_7_6"] = (
-                JSONSchemaValidatorFdd2Af215B9B8327A3E24A3Dea89_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_fee1860b4d509585956565df54a91a_v2_3_7_6"
-            ] = JSONSchemaValidatorFee1860B4D509585956565Df54A91A_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_fe62979a925778bdb0a974a7d86a12_v2_3_7_6"
-            ] = JSONSchemaValidatorFe62979A925778Bdb0A974A7D86A12_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a602eee5a56faa64436bade8a240e_v2_3_7_6"
-            ] = JSONSchemaValidatorA602EEe5A56FaA64436Bade8A240E_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e6ea8c5d425cf9ac77006f5593725f_v2_3_7_6"
-            ] = JSONSchemaValidatorE6Ea8C5D425Cf9Ac77006F5593725F_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_bcb1d489d735258975828f845df1769_v2_3_7_6"
-            ] = JSONSchemaValidatorBcb1D489D735258975828F845Df1769_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_bd5b507f58a50aab614e3d7409eec4c_v2_3_7_6"
-            ] = JSONSchemaValidatorBd5B507F58A50AaB614E3D7409Eec4C_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e4f91ea42515ccdbc24549b84ca1e90_v2_3_7_6"
-            ] = JSONSchemaValidatorE4F91Ea42515CcdBc24549B84Ca1E90_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_efa7f7a97b95f5885a00e6981b27b11_v2_3_7_6"
-            ] = JSONSchemaValidatorEfa7F7A97B95F5885A00E6981B27B11_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f5d13316c8f53a0b78d881c738a15c6_v2_3_7_6"
-            ] = JSONSchemaValidatorF5D13316C8F53A0B78D881C738A15C6_v2_3_7_6()
-            self.json_schema_validators["jsd_bbf7ce025bc2a291b90c37a6b898_v2_3_7_6"] = (
-                JSONSchemaValidatorBbf7Ce025Bc2A291B90C37A6B898_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_effb55c158f28469762804e84633_v2_3_7_6"] = (
-                JSONSchemaValidatorEffb55C158F28469762804E84633_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_e0b654c39dc6e19cd6f5194d_v2_3_7_6"] = (
-                JSONSchemaValidatorE0B654C39Dc6E19Cd6F5194D_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_de1b75d59b083df0ece12259ecd_v2_3_7_6"] = (
-                JSONSchemaValidatorDe1B75D59B083Df0Ece12259Ecd_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_fc95c917352ad8410ffe6d6e522ed_v2_3_7_6"
-            ] = JSONSchemaValidatorFc95C917352Ad8410Ffe6D6E522Ed_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ae7f02a3d051f2baf7cc087990d658_v2_3_7_6"
-            ] = JSONSchemaValidatorAe7F02A3D051F2Baf7Cc087990D658_v2_3_7_6()
-            self.json_schema_validators["jsd_c0204c665262a712caef988d7d88_v2_3_7_6"] = (
-                JSONSchemaValidatorC0204C665262A712Caef988D7D88_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_f50f8c552f5d2eb68d715e1318976e_v2_3_7_6"
-            ] = JSONSchemaValidatorF50F8C552F5D2EB68D715E1318976E_v2_3_7_6()
-            self.json_schema_validators["jsd_d9227adc5f02b7cd264af7255d19_v2_3_7_6"] = (
-                JSONSchemaValidatorD9227Adc5F02B7Cd264Af7255D19_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_e6ec627d3c587288978990aae75228_v2_3_7_6"
-            ] = JSONSchemaValidatorE6Ec627D3C587288978990Aae75228_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_c380301e3e05423bdc1857ff00ae77a_v2_3_7_6"
-            ] = JSONSchemaValidatorC380301E3E05423Bdc1857Ff00Ae77A_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_c8354b61a36524cbb2e1037bd814807_v2_3_7_6"
-            ] = JSONSchemaValidatorC8354B61A36524CBb2E1037Bd814807_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f24f6c07641580ba6ed710e92c2da16_v2_3_7_6"
-            ] = JSONSchemaValidatorF24F6C07641580BA6Ed710E92C2Da16_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f4ce55b5f235924903516ef31dc9e3c_v2_3_7_6"
-            ] = JSONSchemaValidatorF4Ce55B5F235924903516Ef31Dc9E3C_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_fcc151af7615a84adf48b714d146192_v2_3_7_6"
-            ] = JSONSchemaValidatorFcc151AF7615A84Adf48B714D146192_v2_3_7_6()
-            self.json_schema_validators["jsd_fe3ec7651e79d891fce37a0d860_v2_3_7_6"] = (
-                JSONSchemaValidatorFe3Ec7651E79D891Fce37A0D860_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_b07f187b7456c8bbb6088a2f24dcee_v2_3_7_6"
-            ] = JSONSchemaValidatorB07F187B7456C8Bbb6088A2F24Dcee_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_cb7563a5058c4801eb842a74ff61c_v2_3_7_6"
-            ] = JSONSchemaValidatorCb7563A5058C4801EB842A74Ff61C_v2_3_7_6()
-            self.json_schema_validators["jsd_c10072541e94bd16f1aebffe32_v2_3_7_6"] = (
-                JSONSchemaValidatorC10072541E94Bd16F1Aebffe32_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_d39d23589e85db0a63c414057c_v2_3_7_6"] = (
-                JSONSchemaValidatorD39D23589E85Db0A63C414057C_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_c45c1c55d498d03a72933690098_v2_3_7_6"] = (
-                JSONSchemaValidatorC45C1C55D498D03A72933690098_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_a9f5796226051218eac559ab5211384_v2_3_7_6"
-            ] = JSONSchemaValidatorA9F5796226051218Eac559Ab5211384_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_c4befbd77a452a9b7873ffc360a1f20_v2_3_7_6"
-            ] = JSONSchemaValidatorC4Befbd77A452A9B7873Ffc360A1F20_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_c8d11fb9fc752ab8bb8e2b1413ccc92_v2_3_7_6"
-            ] = JSONSchemaValidatorC8D11Fb9Fc752Ab8Bb8E2B1413Ccc92_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ccd75f80ece59f08cadda085402cef5_v2_3_7_6"
-            ] = JSONSchemaValidatorCcd75F80Ece59F08CadDa085402Cef5_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d82755e5e03510daf0951c1f42c2702_v2_3_7_6"
-            ] = JSONSchemaValidatorD82755E5E03510DAf0951C1F42C2702_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e0bd567c1395531a7f18ab4e14110bd_v2_3_7_6"
-            ] = JSONSchemaValidatorE0Bd567C1395531A7F18Ab4E14110Bd_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e4f57e8f06856ee9a7e490d01f7f692_v2_3_7_6"
-            ] = JSONSchemaValidatorE4F57E8F06856Ee9A7E490D01F7F692_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_eb3b18894545315b25b94d0c0e2ec67_v2_3_7_6"
-            ] = JSONSchemaValidatorEb3B18894545315B25B94D0C0E2Ec67_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_eca62ef076b5627a85b2a5959613fb8_v2_3_7_6"
-            ] = JSONSchemaValidatorEca62Ef076B5627A85B2A5959613Fb8_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f486694f3da57b4921b7f2036a1b754_v2_3_7_6"
-            ] = JSONSchemaValidatorF486694F3Da57B4921B7F2036A1B754_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f6536a8f01d5863856a0a8308198e15_v2_3_7_6"
-            ] = JSONSchemaValidatorF6536A8F01D5863856A0A8308198E15_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f7dd6a6cf8d57499168aae05847ad34_v2_3_7_6"
-            ] = JSONSchemaValidatorF7Dd6A6Cf8D57499168Aae05847Ad34_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_fdd36dd2454547096bb65df3755710f_v2_3_7_6"
-            ] = JSONSchemaValidatorFdd36Dd2454547096Bb65Df3755710F_v2_3_7_6()
-            self.json_schema_validators["jsd_cec6c85d9bb4bcc8f61f31296b_v2_3_7_6"] = (
-                JSONSchemaValidatorCeC6C85D9BB4BcC8F61F31296B_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_f7cf4f24d54c6944a31ed308f8361_v2_3_7_6"
-            ] = JSONSchemaValidatorF7Cf4F24D54C6944A31Ed308F8361_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_db7b6c4f0542aab9fe7cf5c995f83_v2_3_7_6"
-            ] = JSONSchemaValidatorDb7B6C4F0542AAb9FE7Cf5C995F83_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d7161b33157dba957ba18eda440c2_v2_3_7_6"
-            ] = JSONSchemaValidatorD7161B33157DbA957Ba18Eda440C2_v2_3_7_6()
-            self.json_schema_validators["jsd_f5ebb9d50aab287f320d32181c0_v2_3_7_6"] = (
-                JSONSchemaValidatorF5EBb9D50AaB287F320D32181C0_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_aba18f6e605ce28a112b34dcb4fe82_v2_3_7_6"
-            ] = JSONSchemaValidatorAba18F6E605Ce28A112B34Dcb4Fe82_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_fa27ccbaf55711849381a707e1edfa_v2_3_7_6"
-            ] = JSONSchemaValidatorFa27CcBaf55711849381A707E1Edfa_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f04b76067507b9384e409e9431ef3_v2_3_7_6"
-            ] = JSONSchemaValidatorF04B76067507B9384E409E9431Ef3_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_b7ae9494b05a57bf6393eaf308b1e7_v2_3_7_6"
-            ] = JSONSchemaValidatorB7Ae9494B05A57Bf6393Eaf308B1E7_v2_3_7_6()
-            self.json_schema_validators["jsd_b6581534bb321eaea272365b7_v2_3_7_6"] = (
-                JSONSchemaValidatorB6581534BB321Eaea272365B7_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_cc59d48f8159008f52b29e08738811_v2_3_7_6"
-            ] = JSONSchemaValidatorCc59D48F8159008F52B29E08738811_v2_3_7_6()
-            self.json_schema_validators["jsd_bfca373c5d7c863eef14abc654fd_v2_3_7_6"] = (
-                JSONSchemaValidatorBfca373C5D7C863EEf14Abc654Fd_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_d1608b2751c883a072ee3fb80228_v2_3_7_6"] = (
-                JSONSchemaValidatorD1608B2751C883A072Ee3Fb80228_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_eea0014365ef78d30d9ba8f1752e8_v2_3_7_6"
-            ] = JSONSchemaValidatorEea0014365Ef78D30D9Ba8F1752E8_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e73b352ff2573aab906c2ad75c5a71_v2_3_7_6"
-            ] = JSONSchemaValidatorE73B352Ff2573AAb906C2Ad75C5A71_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_bd421c1db8c5deaa3301b8cc73dd541_v2_3_7_6"
-            ] = JSONSchemaValidatorBd421C1Db8C5DeaA3301B8Cc73Dd541_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_be8cdb967555fcca03a4c1f796eee56_v2_3_7_6"
-            ] = JSONSchemaValidatorBe8Cdb967555FccA03A4C1F796Eee56_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_dbea7d7de125cf6b840d5032d3a5c59_v2_3_7_6"
-            ] = JSONSchemaValidatorDbea7D7De125Cf6B840D5032D3A5C59_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f019a24c5ce50f082d081bb72ff4df9_v2_3_7_6"
-            ] = JSONSchemaValidatorF019A24C5Ce50F082D081Bb72Ff4Df9_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f2b137487385de6925b7b6136d4b027_v2_3_7_6"
-            ] = JSONSchemaValidatorF2B137487385De6925B7B6136D4B027_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f5645e6e819558fa08761dee45ca406_v2_3_7_6"
-            ] = JSONSchemaValidatorF5645E6E819558FA08761Dee45Ca406_v2_3_7_6()
-            self.json_schema_validators["jsd_fe06867e548bba1919024b40d992_v2_3_7_6"] = (
-                JSONSchemaValidatorFe06867E548BBa1919024B40D992_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_efa92557c9a6c8af0a71829c7e_v2_3_7_6"] = (
-                JSONSchemaValidatorEfA92557C9A6C8Af0A71829C7E_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_ecc3258a5c5b8f2267a512820a59_v2_3_7_6"] = (
-                JSONSchemaValidatorEcc3258A5C5B8F2267A512820A59_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_f5602b2965e53b5bdda193025a3fc_v2_3_7_6"
-            ] = JSONSchemaValidatorF5602B2965E53B5BdDa193025A3Fc_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ba98ed72975099b39dd2dc4cb65ed8_v2_3_7_6"
-            ] = JSONSchemaValidatorBa98Ed72975099B39DD2Dc4Cb65Ed8_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ef28900485c4e9842b4a68e483d4e_v2_3_7_6"
-            ] = JSONSchemaValidatorEf28900485C4E9842B4A68E483D4E_v2_3_7_6()
-            self.json_schema_validators["jsd_ea8d75a9d8d9e6882da4a4a91_v2_3_7_6"] = (
-                JSONSchemaValidatorEA8D75A9D8D9E6882Da4A4A91_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_c49a8488cd52158790aac513e7184a_v2_3_7_6"
-            ] = JSONSchemaValidatorC49A8488Cd52158790Aac513E7184A_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ae57085565e551594fc05b4db6a64af_v2_3_7_6"
-            ] = JSONSchemaValidatorAe57085565E551594Fc05B4Db6A64Af_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_bd1c59e9be75ac4a40decaa95ee9efd_v2_3_7_6"
-            ] = JSONSchemaValidatorBd1C59E9Be75Ac4A40DEcaa95Ee9Efd_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_bec2dde673c5b2f940d0474fed32af6_v2_3_7_6"
-            ] = JSONSchemaValidatorBec2Dde673C5B2F940D0474Fed32Af6_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d16471a58805b4aa2c757209d188aed_v2_3_7_6"
-            ] = JSONSchemaValidatorD16471A58805B4AA2C757209D188Aed_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d6b58f378895114839682dceed1a9b5_v2_3_7_6"
-            ] = JSONSchemaValidatorD6B58F378895114839682Dceed1A9B5_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d8fc92ddeab597ebb50ea003a6d46bd_v2_3_7_6"
-            ] = JSONSchemaValidatorD8Fc92DDeab597EBb50Ea003A6D46Bd_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e481654675355408be8daff9a82f9a0_v2_3_7_6"
-            ] = JSONSchemaValidatorE481654675355408Be8Daff9A82F9A0_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ee43cac5fd65c55ab3153d3549d18c0_v2_3_7_6"
-            ] = JSONSchemaValidatorEe43Cac5Fd65C55Ab3153D3549D18C0_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_c90c04b8356cf9974957e0f9516d0_v2_3_7_6"
-            ] = JSONSchemaValidatorC90C04B8356Cf9974957E0F9516D0_v2_3_7_6()
-            self.json_schema_validators["jsd_b4155d6f885a53ad0e47b1a4_v2_3_7_6"] = (
-                JSONSchemaValidatorB4155D6F885A53Ad0E47B1A4_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_cf2cac6f150c9bee9ade37921b162_v2_3_7_6"
-            ] = JSONSchemaValidatorCf2CaC6F150C9Bee9Ade37921B162_v2_3_7_6()
-            self.json_schema_validators["jsd_bc55e6552fac58cc0aaacd773a_v2_3_7_6"] = (
-                JSONSchemaValidatorBc55E6552FAc58Cc0Aaacd773A_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_dece7a9b353b49084a8ffa4f18c91_v2_3_7_6"
-            ] = JSONSchemaValidatorDece7A9B353B49084A8Ffa4F18C91_v2_3_7_6()
-            self.json_schema_validators["jsd_c9ea5c02b2b7368cac785f30_v2_3_7_6"] = (
-                JSONSchemaValidatorC9Ea5C02B2B7368Cac785F30_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_f4b2825561e808787a16f7e0a1f_v2_3_7_6"] = (
-                JSONSchemaValidatorF4B2825561E808787A16F7E0A1F_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_bc3ed6556f9b9c959e53e271d70_v2_3_7_6"] = (
-                JSONSchemaValidatorBc3Ed6556F9B9C959E53E271D70_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_aac9ba55e5043b4d5e0995c566dce_v2_3_7_6"
-            ] = JSONSchemaValidatorAac9BA55E5043B4D5E0995C566Dce_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_b818044610579a9b74ec582e7739ab_v2_3_7_6"
-            ] = JSONSchemaValidatorB818044610579A9B74Ec582E7739Ab_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_bcb7a52e3c5763b246bcf438fe57c9_v2_3_7_6"
-            ] = JSONSchemaValidatorBcb7A52E3C5763B246Bcf438Fe57C9_v2_3_7_6()
-            self.json_schema_validators["jsd_f2c120b855cb8c852806ce72e54d_v2_3_7_6"] = (
-                JSONSchemaValidatorF2C120B855Cb8C852806Ce72E54D_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_a4d8313a955433858e0137ba7ef672_v2_3_7_6"
-            ] = JSONSchemaValidatorA4D8313A955433858E0137Ba7Ef672_v2_3_7_6()
-            self.json_schema_validators["jsd_cd2e825a78b6de087e991f6fe0_v2_3_7_6"] = (
-                JSONSchemaValidatorCd2E825A78B6De087E991F6Fe0_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_c14a815ec5938950343f6188f0785_v2_3_7_6"
-            ] = JSONSchemaValidatorC14A815Ec5938950343F6188F0785_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_aaebb912125213b350d7423b4f01a4_v2_3_7_6"
-            ] = JSONSchemaValidatorAaebb912125213B350D7423B4F01A4_v2_3_7_6()
-            self.json_schema_validators["jsd_ad0cce45817862bebfc839bf5ae_v2_3_7_6"] = (
-                JSONSchemaValidatorAd0Cce45817862BEbfc839Bf5Ae_v2_3_7_6()
-            )
-            self.json_schema_validators["jsd_d6d7d5c8983c1d3c9815bfd35_v2_3_7_6"] = (
-                JSONSchemaValidatorD6D7D5C8983C1D3C9815Bfd35_v2_3_7_6()
-            )
-            self.json_schema_validators[
-                "jsd_fb5a8c0075563491622171958074bf_v2_3_7_6"
-            ] = JSONSchemaValidatorFb5A8C0075563491622171958074Bf_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a764c85d8df5c30b9143619d4f9cde9_v2_3_7_6"
-            ] = JSONSchemaValidatorA764C85D8Df5C30B9143619D4F9Cde9_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_c991ce0b0f058a08c863a4abdfc70a6_v2_3_7_6"
-            ] = JSONSchemaValidatorC991Ce0B0F058A08C863A4Abdfc70A6_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f41eb48a0da56949cfaddeecb51ab66_v2_3_7_6"
-            ] = JSONSchemaValidatorF41Eb48A0Da56949CfaDdeecb51Ab66_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f5bfccc7e30550baa7046f74daa1ef2_v2_3_7_6"
-            ] = JSONSchemaValidatorF5Bfccc7E30550BAa7046F74Daa1Ef2_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a0c237c8fc115b6f98b87cc7a1360dd0_v2_3_7_6"
-            ] = JSONSchemaValidatorA0C237C8Fc115B6F98B87Cc7A1360Dd0_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a14e71c1b98e51eea41255720025b519_v2_3_7_6"
-            ] = JSONSchemaValidatorA14E71C1B98E51EeA41255720025B519_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a352f6280e445075b3ea7cbf868c2d94_v2_3_7_6"
-            ] = JSONSchemaValidatorA352F6280E445075B3Ea7Cbf868C2D94_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a3b37dcbe2a150bea06d9dcde1837281_v2_3_7_6"
-            ] = JSONSchemaValidatorA3B37DcbE2A150BeA06D9Dcde1837281_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a3d2432ae8c55fe793c5180d8d5fce25_v2_3_7_6"
-            ] = JSONSchemaValidatorA3D2432AE8C55Fe793C5180D8D5Fce25_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a41113bc28515538af4fe4d2ff707f60_v2_3_7_6"
-            ] = JSONSchemaValidatorA41113Bc28515538Af4FE4D2Ff707F60_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a54fce1a0c305bdabfe91a8a6161e539_v2_3_7_6"
-            ] = JSONSchemaValidatorA54Fce1A0C305BdaBfe91A8A6161E539_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a66db26df529597c84c2a15ea2d632ce_v2_3_7_6"
-            ] = JSONSchemaValidatorA66Db26DF529597C84C2A15Ea2D632Ce_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a6c4ce7aef8251a2a8646ba0b5c1826a_v2_3_7_6"
-            ] = JSONSchemaValidatorA6C4Ce7AEf8251A2A8646Ba0B5C1826A_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a73fbc67627e5bbbafe748de84d42df6_v2_3_7_6"
-            ] = JSONSchemaValidatorA73Fbc67627E5BbbAfe748De84D42Df6_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a7935eedd53a5b8c84668c903cc1c705_v2_3_7_6"
-            ] = JSONSchemaValidatorA7935EedD53A5B8C84668C903Cc1C705_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a7d6d604f38f5f849af79d8768bddfc1_v2_3_7_6"
-            ] = JSONSchemaValidatorA7D6D604F38F5F849Af79D8768Bddfc1_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a91eed12dfc85dbdaacab22e6e9f04a5_v2_3_7_6"
-            ] = JSONSchemaValidatorA91Eed12Dfc85DbdAacaB22E6E9F04A5_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a93d01238de0537dbb3d358f9cce0bd2_v2_3_7_6"
-            ] = JSONSchemaValidatorA93D01238De0537DBb3D358F9Cce0Bd2_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a9b864257b965fe4bd8b0293f41f1537_v2_3_7_6"
-            ] = JSONSchemaValidatorA9B864257B965Fe4Bd8B0293F41F1537_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_a9e0722d184658c592bd130ff03e1dde_v2_3_7_6"
-            ] = JSONSchemaValidatorA9E0722D184658C592Bd130Ff03E1Dde_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_aa11f09d28165f4ea6c81b8642e59cc4_v2_3_7_6"
-            ] = JSONSchemaValidatorAa11F09D28165F4EA6C81B8642E59Cc4_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_aa663ca2bd1f5a3db67c405987495112_v2_3_7_6"
-            ] = JSONSchemaValidatorAa663Ca2Bd1F5A3DB67C405987495112_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ac6e63199fb05bcf89106a22502c2197_v2_3_7_6"
-            ] = JSONSchemaValidatorAc6E63199Fb05Bcf89106A22502C2197_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ac7ce690e0f55a469b0a9bfa3d2c165e_v2_3_7_6"
-            ] = JSONSchemaValidatorAc7Ce690E0F55A469B0A9Bfa3D2C165E_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ad936677c99a58f6b532359d66fe98a7_v2_3_7_6"
-            ] = JSONSchemaValidatorAd936677C99A58F6B532359D66Fe98A7_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ad96e712f4525a128368b1bfe3afc21c_v2_3_7_6"
-            ] = JSONSchemaValidatorAd96E712F4525A128368B1Bfe3Afc21C_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ada3522de8ef54729e9fc242df292547_v2_3_7_6"
-            ] = JSONSchemaValidatorAda3522DE8Ef54729E9FC242Df292547_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ae4d33eacca95f109bebc6fd0528ca48_v2_3_7_6"
-            ] = JSONSchemaValidatorAe4D33EaCca95F109BebC6Fd0528Ca48_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_b08f499f995f5f46ba52e0385b54721a_v2_3_7_6"
-            ] = JSONSchemaValidatorB08F499F995F5F46Ba52E0385B54721A_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_b0aa8e79d21f5e579908825e70aaccf6_v2_3_7_6"
-            ] = JSONSchemaValidatorB0Aa8E79D21F5E579908825E70Aaccf6_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_b0b146a144a65aa296b8b939c2926158_v2_3_7_6"
-            ] = JSONSchemaValidatorB0B146A144A65Aa296B8B939C2926158_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_b119a4d455e35cc3b2cc6695a045cbfa_v2_3_7_6"
-            ] = JSONSchemaValidatorB119A4D455E35Cc3B2Cc6695A045Cbfa_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_b11aa4de387251c794665e030fa815da_v2_3_7_6"
-            ] = JSONSchemaValidatorB11Aa4De387251C794665E030Fa815Da_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_b2dae3b41636596aa02c3ad0a4bcb8d7_v2_3_7_6"
-            ] = JSONSchemaValidatorB2Dae3B41636596AA02C3Ad0A4Bcb8D7_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_b350fb0876a25879973b0840fbb690bb_v2_3_7_6"
-            ] = JSONSchemaValidatorB350Fb0876A25879973B0840Fbb690Bb_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_b3ab480a3f485ecc9fef1bd2f8c9d109_v2_3_7_6"
-            ] = JSONSchemaValidatorB3Ab480A3F485Ecc9Fef1Bd2F8C9D109_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_b3c4383ecc13514c85c6f3d8484f6d68_v2_3_7_6"
-            ] = JSONSchemaValidatorB3C4383ECc13514C85C6F3D8484F6D68_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_b4f52e69ddca5b2583b28fb4c96447aa_v2_3_7_6"
-            ] = JSONSchemaValidatorB4F52E69Ddca5B2583B28Fb4C96447Aa_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_b6f2d8e46cdd5f05bb06f52cd1b26fb2_v2_3_7_6"
-            ] = JSONSchemaValidatorB6F2D8E46Cdd5F05Bb06F52Cd1B26Fb2_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_b7079a38844e56dd8f1b6b876880a02e_v2_3_7_6"
-            ] = JSONSchemaValidatorB7079A38844E56Dd8F1B6B876880A02E_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_b95201b6a6905a10b463e036bf591166_v2_3_7_6"
-            ] = JSONSchemaValidatorB95201B6A6905A10B463E036Bf591166_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ba40975123ed50daa2f9f599cdf2d911_v2_3_7_6"
-            ] = JSONSchemaValidatorBa40975123Ed50DaA2F9F599Cdf2D911_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_bac0c488707959c182dfef18681bceda_v2_3_7_6"
-            ] = JSONSchemaValidatorBac0C488707959C182DfEf18681Bceda_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_bc33daf690ec5399a507829abfc4fe64_v2_3_7_6"
-            ] = JSONSchemaValidatorBc33Daf690Ec5399A507829Abfc4Fe64_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_bc3cb471beaf5bfeb47201993c023068_v2_3_7_6"
-            ] = JSONSchemaValidatorBc3Cb471Beaf5BfeB47201993C023068_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_bce8e6b307ce52dd8f5546fbd78e05ee_v2_3_7_6"
-            ] = JSONSchemaValidatorBce8E6B307Ce52Dd8F5546Fbd78E05Ee_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_bd31fcbd1ecd5a2c8b812088b27bfcea_v2_3_7_6"
-            ] = JSONSchemaValidatorBd31Fcbd1Ecd5A2C8B812088B27Bfcea_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_bdcb514ae33b571795e4a42147d11f87_v2_3_7_6"
-            ] = JSONSchemaValidatorBdcb514AE33B571795E4A42147D11F87_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_bf40cea4982c54278a52ac2e7b0c458a_v2_3_7_6"
-            ] = JSONSchemaValidatorBf40Cea4982C54278A52Ac2E7B0C458A_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_bfb1005f4d265f8bb340637175a5841f_v2_3_7_6"
-            ] = JSONSchemaValidatorBfb1005F4D265F8BB340637175A5841F_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_bfd1cc1403c951a99c0fcafd59eaabf3_v2_3_7_6"
-            ] = JSONSchemaValidatorBfd1Cc1403C951A99C0FCafd59Eaabf3_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_c17432d928f755f8bb9f4edb83089d3e_v2_3_7_6"
-            ] = JSONSchemaValidatorC17432D928F755F8Bb9F4Edb83089D3E_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_c524f0ec199e5435bcaee56b423532e7_v2_3_7_6"
-            ] = JSONSchemaValidatorC524F0Ec199E5435BcaeE56B423532E7_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_c5f97865727857d5b1eeaedee3dcccd2_v2_3_7_6"
-            ] = JSONSchemaValidatorC5F97865727857D5B1EeAedee3Dcccd2_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_c6774ff9549a53d4b41fdd2d88f1d0f5_v2_3_7_6"
-            ] = JSONSchemaValidatorC6774Ff9549A53D4B41FDd2D88F1D0F5_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_c7f28c3d23ba5384be5e769ae0505d00_v2_3_7_6"
-            ] = JSONSchemaValidatorC7F28C3D23Ba5384Be5E769Ae0505D00_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_c937494318f952ba92eaeb82b144c338_v2_3_7_6"
-            ] = JSONSchemaValidatorC937494318F952Ba92EaEb82B144C338_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_c9b5b83e67195b649077a05e42897cc4_v2_3_7_6"
-            ] = JSONSchemaValidatorC9B5B83E67195B649077A05E42897Cc4_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_c9f995abc21b54e7860f66aef2ffbc85_v2_3_7_6"
-            ] = JSONSchemaValidatorC9F995AbC21B54E7860F66Aef2Ffbc85_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ca2fe989a227585086452d24d32867a6_v2_3_7_6"
-            ] = JSONSchemaValidatorCa2Fe989A227585086452D24D32867A6_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_cc1599012a5a59c8abdda5376b5cc583_v2_3_7_6"
-            ] = JSONSchemaValidatorCc1599012A5A59C8AbddA5376B5Cc583_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_cc19241fd92f586c8986d4d5c99c3a88_v2_3_7_6"
-            ] = JSONSchemaValidatorCc19241FD92F586C8986D4D5C99C3A88_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ccbf614b4b355cac929f12cc61272c1c_v2_3_7_6"
-            ] = JSONSchemaValidatorCcbf614B4B355Cac929F12Cc61272C1C_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_cec8139f6b1c5e5991d12197206029a0_v2_3_7_6"
-            ] = JSONSchemaValidatorCec8139F6B1C5E5991D12197206029A0_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_cf9d39cef5e95bb9bd48d5f86e094c99_v2_3_7_6"
-            ] = JSONSchemaValidatorCf9D39CeF5E95Bb9Bd48D5F86E094C99_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_cfadc5e4c912588389f4f63d2fb6e4ed_v2_3_7_6"
-            ] = JSONSchemaValidatorCfadc5E4C912588389F4F63D2Fb6E4Ed_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d02614492a2251c18de2e36c097e40ff_v2_3_7_6"
-            ] = JSONSchemaValidatorD02614492A2251C18De2E36C097E40Ff_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d045d18062ad5ae59c6f446beb17d675_v2_3_7_6"
-            ] = JSONSchemaValidatorD045D18062Ad5Ae59C6F446Beb17D675_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d0aab00569b258b481afedc35e6db392_v2_3_7_6"
-            ] = JSONSchemaValidatorD0Aab00569B258B481AfEdc35E6Db392_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d1d42ef2f1895a82a2830bf1353e6baa_v2_3_7_6"
-            ] = JSONSchemaValidatorD1D42Ef2F1895A82A2830Bf1353E6Baa_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d2ea814bfae85da1b77872d095fc8221_v2_3_7_6"
-            ] = JSONSchemaValidatorD2Ea814BFae85Da1B77872D095Fc8221_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d413a3d054ac50fa921ca8cf7fdf5449_v2_3_7_6"
-            ] = JSONSchemaValidatorD413A3D054Ac50Fa921CA8Cf7Fdf5449_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d5c229546dc755f796dfcf34f1c2e290_v2_3_7_6"
-            ] = JSONSchemaValidatorD5C229546Dc755F796DfCf34F1C2E290_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d69b1cfffdda5bd1828a5a89a262cbdd_v2_3_7_6"
-            ] = JSONSchemaValidatorD69B1CffFdda5Bd1828A5A89A262Cbdd_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d825ae9a117f5b6bb65b7d78fd42513c_v2_3_7_6"
-            ] = JSONSchemaValidatorD825Ae9A117F5B6BB65B7D78Fd42513C_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d91a3aad0fd954e7a43aa3256ce433f6_v2_3_7_6"
-            ] = JSONSchemaValidatorD91A3Aad0Fd954E7A43AA3256Ce433F6_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_d967a378b43457ad8c6a6de7bc1845d1_v2_3_7_6"
-            ] = JSONSchemaValidatorD967A378B43457Ad8C6A6De7Bc1845D1_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_da455f4be5b75126ba9970c7cc54c7db_v2_3_7_6"
-            ] = JSONSchemaValidatorDa455F4BE5B75126Ba9970C7Cc54C7Db_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_da593242978c5047bb6b62b7f9475326_v2_3_7_6"
-            ] = JSONSchemaValidatorDa593242978C5047Bb6B62B7F9475326_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_db0f8e07ae0d5ecc83e34d29e5e57b41_v2_3_7_6"
-            ] = JSONSchemaValidatorDb0F8E07Ae0D5Ecc83E34D29E5E57B41_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_dc254215fdf25cd5b7ba797e8f8faebf_v2_3_7_6"
-            ] = JSONSchemaValidatorDc254215Fdf25Cd5B7Ba797E8F8Faebf_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_dc5d352dfaeb5b17800b0af2858c2f5c_v2_3_7_6"
-            ] = JSONSchemaValidatorDc5D352DFaeb5B17800B0Af2858C2F5C_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_dcc43be0514e50fea80cfa827f13ee5c_v2_3_7_6"
-            ] = JSONSchemaValidatorDcc43Be0514E50FeA80CFa827F13Ee5C_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_deb34387d0235811a90985711be9fe2e_v2_3_7_6"
-            ] = JSONSchemaValidatorDeb34387D0235811A90985711Be9Fe2E_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_dec1857f1585557eb39e12a9c93ef985_v2_3_7_6"
-            ] = JSONSchemaValidatorDec1857F1585557EB39E12A9C93Ef985_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_df26f516755a50b5b5477324cf5cb649_v2_3_7_6"
-            ] = JSONSchemaValidatorDf26F516755A50B5B5477324Cf5Cb649_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_df9ec5aa58815a849b4853b223343e5e_v2_3_7_6"
-            ] = JSONSchemaValidatorDf9Ec5Aa58815A849B4853B223343E5E_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_dfda5beca4cc5437876bff366493ebf0_v2_3_7_6"
-            ] = JSONSchemaValidatorDfda5BecA4Cc5437876BFf366493Ebf0_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e0c7b28d55c85d49a84c1403ca14bd5f_v2_3_7_6"
-            ] = JSONSchemaValidatorE0C7B28D55C85D49A84C1403Ca14Bd5F_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e11daa984f535a08bc1eb01bc84bc399_v2_3_7_6"
-            ] = JSONSchemaValidatorE11Daa984F535A08Bc1EB01Bc84Bc399_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e1781a990c6b5a4b895d56bcfda2b7cb_v2_3_7_6"
-            ] = JSONSchemaValidatorE1781A990C6B5A4B895D56Bcfda2B7Cb_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e1b8c435195d56368c24a54dcce007d0_v2_3_7_6"
-            ] = JSONSchemaValidatorE1B8C435195D56368C24A54Dcce007D0_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e2f9718de3d050819cdc6355a3a43200_v2_3_7_6"
-            ] = JSONSchemaValidatorE2F9718DE3D050819Cdc6355A3A43200_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e3934b0fb68a5ff787e65e9b7c8e6296_v2_3_7_6"
-            ] = JSONSchemaValidatorE3934B0FB68A5Ff787E65E9B7C8E6296_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e3d7ad943d3a50fb8c3be7327669e557_v2_3_7_6"
-            ] = JSONSchemaValidatorE3D7Ad943D3A50Fb8C3BE7327669E557_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e3e170003d865b9a8d76cbe1d2f268be_v2_3_7_6"
-            ] = JSONSchemaValidatorE3E170003D865B9A8D76Cbe1D2F268Be_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e4a09bf566f35babad9e27f5eb61a86d_v2_3_7_6"
-            ] = JSONSchemaValidatorE4A09Bf566F35BabAd9E27F5Eb61A86D_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e4d083d956805f63b970be543c34eb0e_v2_3_7_6"
-            ] = JSONSchemaValidatorE4D083D956805F63B970Be543C34Eb0E_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e6eed78cb55d51a1bfe669729df25689_v2_3_7_6"
-            ] = JSONSchemaValidatorE6Eed78CB55D51A1Bfe669729Df25689_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e7af120721c7519a84b13bbe4a1a0362_v2_3_7_6"
-            ] = JSONSchemaValidatorE7Af120721C7519A84B13Bbe4A1A0362_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e8271b05b62c54609f74b4f2f373ad5a_v2_3_7_6"
-            ] = JSONSchemaValidatorE8271B05B62C54609F74B4F2F373Ad5A_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_e85b40c5ca055f4c82281617a8f95644_v2_3_7_6"
-            ] = JSONSchemaValidatorE85B40C5Ca055F4C82281617A8F95644_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ea59df3daf2a57a0b48044cc49c8a1ca_v2_3_7_6"
-            ] = JSONSchemaValidatorEa59Df3DAf2A57A0B48044Cc49C8A1Ca_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ea5f116c0cd152bbb4a92c043738ea57_v2_3_7_6"
-            ] = JSONSchemaValidatorEa5F116C0Cd152BbB4A92C043738Ea57_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_eab4d187be085cac8a53971def40bee0_v2_3_7_6"
-            ] = JSONSchemaValidatorEab4D187Be085Cac8A53971Def40Bee0_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_eb4a05f61e475ad0b9e74f963f27ea1d_v2_3_7_6"
-            ] = JSONSchemaValidatorEb4A05F61E475Ad0B9E74F963F27Ea1D_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ecdb2d14c29b5bf3ad79ed2e3cc70715_v2_3_7_6"
-            ] = JSONSchemaValidatorEcdb2D14C29B5Bf3Ad79Ed2E3Cc70715_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ed266e6eda225aedbf581508635da822_v2_3_7_6"
-            ] = JSONSchemaValidatorEd266E6EDa225AedBf581508635Da822_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ed9125b257ea54b79ef2db2d8ebd9d00_v2_3_7_6"
-            ] = JSONSchemaValidatorEd9125B257Ea54B79Ef2Db2D8Ebd9D00_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_eecf4323cb285985be72a7e061891059_v2_3_7_6"
-            ] = JSONSchemaValidatorEecf4323Cb285985Be72A7E061891059_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ef94c2c20ba15fd38e129ac75067de1e_v2_3_7_6"
-            ] = JSONSchemaValidatorEf94C2C20Ba15Fd38E129Ac75067De1E_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f08eb586113e597a91b1658297570934_v2_3_7_6"
-            ] = JSONSchemaValidatorF08Eb586113E597A91B1658297570934_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f0942fbb79f855e889d60777f41ea944_v2_3_7_6"
-            ] = JSONSchemaValidatorF0942Fbb79F855E889D60777F41Ea944_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f210ff2d89425b4790ce56f19da7be92_v2_3_7_6"
-            ] = JSONSchemaValidatorF210Ff2D89425B4790Ce56F19Da7Be92_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f325b2c7e429566ba5ed9ae8253b5bef_v2_3_7_6"
-            ] = JSONSchemaValidatorF325B2C7E429566BA5Ed9Ae8253B5Bef_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f667322836d5527482ad2100bec7feb4_v2_3_7_6"
-            ] = JSONSchemaValidatorF667322836D5527482Ad2100Bec7Feb4_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f6a4086c00f45dc5a634f0b8db5cdfd3_v2_3_7_6"
-            ] = JSONSchemaValidatorF6A4086C00F45Dc5A634F0B8Db5Cdfd3_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f6f9dde38ce458fcaf27ffd4f84bfe68_v2_3_7_6"
-            ] = JSONSchemaValidatorF6F9Dde38Ce458FcAf27Ffd4F84Bfe68_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f8b4842604b65658afb34b4f124db469_v2_3_7_6"
-            ] = JSONSchemaValidatorF8B4842604B65658Afb34B4F124Db469_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f9492367570c5f009cf8b5955790e87c_v2_3_7_6"
-            ] = JSONSchemaValidatorF9492367570C5F009Cf8B5955790E87C_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f95014e3b3385f21afa39325f3508427_v2_3_7_6"
-            ] = JSONSchemaValidatorF95014E3B3385F21Afa39325F3508427_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_f99c96c3a9b45ddaabc2c75ff8efa67f_v2_3_7_6"
-            ] = JSONSchemaValidatorF99C96C3A9B45DdaAbc2C75Ff8Efa67F_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_fa3975be5af25501abb40339d96917eb_v2_3_7_6"
-            ] = JSONSchemaValidatorFa3975Be5Af25501Abb40339D96917Eb_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_fb5e152d4d3d59f5afd92f717f3a1eea_v2_3_7_6"
-            ] = JSONSchemaValidatorFb5E152D4D3D59F5Afd92F717F3A1Eea_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_fbdd94fbecd256c08e1d9f6e1a7657ac_v2_3_7_6"
-            ] = JSONSchemaValidatorFbdd94FbEcd256C08E1D9F6E1A7657Ac_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_fc416739f3c655ed911884aec0130e83_v2_3_7_6"
-            ] = JSONSchemaValidatorFc416739F3C655Ed911884Aec0130E83_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_fc8410781af357b6be17a2104ce5efb1_v2_3_7_6"
-            ] = JSONSchemaValidatorFc8410781Af357B6Be17A2104Ce5Efb1_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_fd488ff002115f3b8f0ee165e5347609_v2_3_7_6"
-            ] = JSONSchemaValidatorFd488Ff002115F3B8F0EE165E5347609_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_fdbe4ec3e9f252a988404dc94250b80d_v2_3_7_6"
-            ] = JSONSchemaValidatorFdbe4Ec3E9F252A988404Dc94250B80D_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_fdfc828270d950ecb75480fe03f7d573_v2_3_7_6"
-            ] = JSONSchemaValidatorFdfc828270D950EcB75480Fe03F7D573_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ff5bf5a67c6c5c0aa9e7ba84c088e1a6_v2_3_7_6"
-            ] = JSONSchemaValidatorFf5Bf5A67C6C5C0AA9E7Ba84C088E1A6_v2_3_7_6()
-            self.json_schema_validators[
-                "jsd_ffd2fefb57d5523c87a5d941eb93ddc3_v2_3_7_6"
-            ] = JSONSchemaValidatorFfd2Fefb57D5523C87A5D941Eb93Ddc3_v2_3_7_6()
-        if version == "2.3.7.9":
-            self.json_schema_validators[
-                "jsd_d5f8cf25475dc5be53f35357aca5a4_v2_3_7_9"
-            ] = JSONSchemaValidatorD5F8Cf25475Dc5Be53F35357Aca5A4_v2_3_7_9()
-            self.json_schema_validators["jsd_b2f15d0c54c2862a60a904289ddd_v2_3_7_9"] = (
-                JSONSchemaValidatorB2F15D0C54C2862A60A904289Ddd_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_e4d208b5545f66bf0f94a155c81f46_v2_3_7_9"
-            ] = JSONSchemaValidatorE4D208B5545F66Bf0F94A155C81F46_v2_3_7_9()
-            self.json_schema_validators["jsd_bece53a182b45ffa4a1a435e_v2_3_7_9"] = (
-                JSONSchemaValidatorBece53A182B45Ffa4A1A435E_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_cdc0bafd4257e78d211a1f4120bfa9_v2_3_7_9"
-            ] = JSONSchemaValidatorCdc0BaFd4257E78D211A1F4120Bfa9_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e22c99a82f5764828810acb45e7a9e_v2_3_7_9"
-            ] = JSONSchemaValidatorE22C99A82F5764828810Acb45E7A9E_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_cfb964a2958909f7ca12d23ab2bdb_v2_3_7_9"
-            ] = JSONSchemaValidatorCfb964A2958909F7CA12D23Ab2Bdb_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c2a16208da55e8a615348ed3d530ac_v2_3_7_9"
-            ] = JSONSchemaValidatorC2A16208Da55E8A615348Ed3D530Ac_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_cca68e89d0545dac01a8c7a461ac6e_v2_3_7_9"
-            ] = JSONSchemaValidatorCca68E89D0545DAc01A8C7A461Ac6E_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ee8590b6b45048b84e814161272bee_v2_3_7_9"
-            ] = JSONSchemaValidatorEe8590B6B45048B84E814161272Bee_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_bb7c52e5225e9398a006fecf4da06f_v2_3_7_9"
-            ] = JSONSchemaValidatorBb7C52E5225E9398A006Fecf4Da06F_v2_3_7_9()
-            self.json_schema_validators["jsd_d5da0365e31972173f015ed3614_v2_3_7_9"] = (
-                JSONSchemaValidatorD5DA0365E31972173F015Ed3614_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_97e350a7a690cdfeffa5eaca_v2_3_7_9"] = (
-                JSONSchemaValidator97E350A7A690Cdfeffa5Eaca_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_fd6083b0c65d03b2d53f10b3ece59d_v2_3_7_9"
-            ] = JSONSchemaValidatorFd6083B0C65D03B2D53F10B3Ece59D_v2_3_7_9()
-            self.json_schema_validators["jsd_a0a8d545698d1d59a9be90e51_v2_3_7_9"] = (
-                JSONSchemaValidatorA0A8D545698D1D59A9Be90E51_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_ecfe864dc5012ab9c25d23e2ce9f5_v2_3_7_9"
-            ] = JSONSchemaValidatorEcfe864Dc5012Ab9C25D23E2Ce9F5_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d7073129453698264e7519d82991c_v2_3_7_9"
-            ] = JSONSchemaValidatorD7073129453698264E7519D82991C_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f751cc2f55767b34e4c890b3fd36e_v2_3_7_9"
-            ] = JSONSchemaValidatorF751CC2F55767B34E4C890B3Fd36E_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f790a930d452708353c374f5c0f90f_v2_3_7_9"
-            ] = JSONSchemaValidatorF790A930D452708353C374F5C0F90F_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a544e27e18e5412af3b68d915c8ca50_v2_3_7_9"
-            ] = JSONSchemaValidatorA544E27E18E5412Af3B68D915C8Ca50_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_af7031cc5ca5b44af0e6454d558412c_v2_3_7_9"
-            ] = JSONSchemaValidatorAf7031CC5Ca5B44Af0E6454D558412C_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d999a1d36ee52babb6b619877dad734_v2_3_7_9"
-            ] = JSONSchemaValidatorD999A1D36Ee52BaBb6B619877Dad734_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e86b65311b05d29ba5eea0d5f1fd88f_v2_3_7_9"
-            ] = JSONSchemaValidatorE86B65311B05D29Ba5EEa0D5F1Fd88F_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f44ddd3c38c5a9484f5cb4e125447bc_v2_3_7_9"
-            ] = JSONSchemaValidatorF44Ddd3C38C5A9484F5Cb4E125447Bc_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_cd16daa50533eb0f5873b7601abb2_v2_3_7_9"
-            ] = JSONSchemaValidatorCd16DAa50533EB0F5873B7601Abb2_v2_3_7_9()
-            self.json_schema_validators["jsd_c7266d89581c9601b79b7304fda3_v2_3_7_9"] = (
-                JSONSchemaValidatorC7266D89581C9601B79B7304Fda3_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_ce6c2c14553f9a4a88f66a04c21c4_v2_3_7_9"
-            ] = JSONSchemaValidatorCe6C2C14553F9A4A88F66A04C21C4_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e5bb87a955e33a7ee46f1085fd880_v2_3_7_9"
-            ] = JSONSchemaValidatorE5Bb87A955E33A7Ee46F1085Fd880_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d76a951f85a7a927afc2f1ea935c8_v2_3_7_9"
-            ] = JSONSchemaValidatorD76A951F85A7A927AFc2F1Ea935C8_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f2c49c69c53e7b4f57f2af9a6f597_v2_3_7_9"
-            ] = JSONSchemaValidatorF2C49C69C53E7B4F57F2Af9A6F597_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e1a76c121857a085149e62e56caadd_v2_3_7_9"
-            ] = JSONSchemaValidatorE1A76C121857A085149E62E56Caadd_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ca2f659b595c0ba7c649fd8c8bdad6_v2_3_7_9"
-            ] = JSONSchemaValidatorCa2F659B595C0BA7C649Fd8C8Bdad6_v2_3_7_9()
-            self.json_schema_validators["jsd_a4dab79d54829548004029a91ba1_v2_3_7_9"] = (
-                JSONSchemaValidatorA4DaB79D54829548004029A91Ba1_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_f5a13405ba69f3957b98db8663a_v2_3_7_9"] = (
-                JSONSchemaValidatorF5A13405Ba69F3957B98Db8663A_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_6ce35f19bc4c1d058aa01536_v2_3_7_9"] = (
-                JSONSchemaValidator6Ce35F19Bc4C1D058Aa01536_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_b107800544384c1ddad7b60c237_v2_3_7_9"] = (
-                JSONSchemaValidatorB107800544384C1Ddad7B60C237_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_a3954b27e5eeb82789ed231e0557f_v2_3_7_9"
-            ] = JSONSchemaValidatorA3954B27E5Eeb82789Ed231E0557F_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e3a724a35854758d65a83823c88435_v2_3_7_9"
-            ] = JSONSchemaValidatorE3A724A35854758D65A83823C88435_v2_3_7_9()
-            self.json_schema_validators["jsd_a2131eae5c1d8e73cd55eebf6a83_v2_3_7_9"] = (
-                JSONSchemaValidatorA2131Eae5C1D8E73Cd55Eebf6A83_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_f2562a2d8e5ec287738032961762ed_v2_3_7_9"
-            ] = JSONSchemaValidatorF2562A2D8E5Ec287738032961762Ed_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f256e33af7501a8bdae2742ca9f6d6_v2_3_7_9"
-            ] = JSONSchemaValidatorF256E33Af7501A8BdaE2742Ca9F6D6_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_b269afaaa855d3291b825f724fc8ea9_v2_3_7_9"
-            ] = JSONSchemaValidatorB269AfaAa855D3291B825F724Fc8Ea9_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_b3323a24b275402b97c7e9ccfd78c91_v2_3_7_9"
-            ] = JSONSchemaValidatorB3323A24B275402B97C7E9Ccfd78C91_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_cc239fa9b185ecbab9e306289850a63_v2_3_7_9"
-            ] = JSONSchemaValidatorCc239Fa9B185EcbAb9E306289850A63_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ccbaf226c685cacac29eb345955f3ad_v2_3_7_9"
-            ] = JSONSchemaValidatorCcbaf226C685CacAc29Eb345955F3Ad_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d1845268faf55f98bc952872259f16f_v2_3_7_9"
-            ] = JSONSchemaValidatorD1845268Faf55F98Bc952872259F16F_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d9bd7c527d254ecb63d2b709c428043_v2_3_7_9"
-            ] = JSONSchemaValidatorD9Bd7C527D254EcB63D2B709C428043_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e5e51bcda0b5fec984ba8120f743fe2_v2_3_7_9"
-            ] = JSONSchemaValidatorE5E51BcDa0B5Fec984BA8120F743Fe2_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_efc2269ee565e23b7be7b49e4fc0322_v2_3_7_9"
-            ] = JSONSchemaValidatorEfc2269Ee565E23B7Be7B49E4Fc0322_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f77386a48895fa59dcddcc7dd4addb5_v2_3_7_9"
-            ] = JSONSchemaValidatorF77386A48895Fa59DcdDcc7Dd4Addb5_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ffa347eb411567a9c793696795250a5_v2_3_7_9"
-            ] = JSONSchemaValidatorFfa347EB411567A9C793696795250A5_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ffcaccdd9f2530abf66adc98c3f0201_v2_3_7_9"
-            ] = JSONSchemaValidatorFfcaccdD9F2530ABf66Adc98C3F0201_v2_3_7_9()
-            self.json_schema_validators["jsd_b9be51e25efc9f41d4f68451f9a6_v2_3_7_9"] = (
-                JSONSchemaValidatorB9Be51E25Efc9F41D4F68451F9A6_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_bf80823752baba63a8849fd521cd_v2_3_7_9"] = (
-                JSONSchemaValidatorBf80823752BaBa63A8849Fd521Cd_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_d833c51c4f5cd2879d3e69f773295c_v2_3_7_9"
-            ] = JSONSchemaValidatorD833C51C4F5Cd2879D3E69F773295C_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_fa310ab095148bdb00d7d3d5e1676_v2_3_7_9"
-            ] = JSONSchemaValidatorFa310Ab095148Bdb00D7D3D5E1676_v2_3_7_9()
-            self.json_schema_validators["jsd_a9136d5513985f15e91a19da66c_v2_3_7_9"] = (
-                JSONSchemaValidatorA9136D5513985F15E91A19Da66C_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_b887c55faaca726bbe4ac2564_v2_3_7_9"] = (
-                JSONSchemaValidatorB887C55FaAca726Bbe4Ac2564_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_f90ae8599c8a21c98b7a1ca804_v2_3_7_9"] = (
-                JSONSchemaValidatorF90Ae8599C8A21C98B7A1Ca804_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_a94058a99acaaf8eb73c9227_v2_3_7_9"] = (
-                JSONSchemaValidatorA94058A99AcaAf8Eb73C9227_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_cfb1d6e52878d057740de275896_v2_3_7_9"] = (
-                JSONSchemaValidatorCfb1D6E52878D057740De275896_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_a4829a44597bbf9813664eb75de0_v2_3_7_9"] = (
-                JSONSchemaValidatorA4829A44597BBf9813664Eb75De0_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_bdc981805b5fad0a038966d52558_v2_3_7_9"] = (
-                JSONSchemaValidatorBdc981805B5FAd0A038966D52558_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_df9908ad265e83ab77d73803925678_v2_3_7_9"
-            ] = JSONSchemaValidatorDf9908Ad265E83Ab77D73803925678_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e37e7d81575d35a974df797e0a2268_v2_3_7_9"
-            ] = JSONSchemaValidatorE37E7D81575D35A974Df797E0A2268_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a924f763a15125a8d5beaa6dd6fa2c_v2_3_7_9"
-            ] = JSONSchemaValidatorA924F763A15125A8D5Beaa6Dd6Fa2C_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_de4c9b685250dfa8556ab1ec20407c_v2_3_7_9"
-            ] = JSONSchemaValidatorDe4C9B685250DfA8556Ab1Ec20407C_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a15a2f83f975a6a9964e7da79a605de_v2_3_7_9"
-            ] = JSONSchemaValidatorA15A2F83F975A6A9964E7Da79A605De_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a3a1bf404bf5772828f66f1e10f074d_v2_3_7_9"
-            ] = JSONSchemaValidatorA3A1Bf404Bf5772828F66F1E10F074D_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a7283357c1657bf8ccb3d32a96249d4_v2_3_7_9"
-            ] = JSONSchemaValidatorA7283357C1657Bf8Ccb3D32A96249D4_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_b4635c45c3b5e44a30d84daa1d5fb69_v2_3_7_9"
-            ] = JSONSchemaValidatorB4635C45C3B5E44A30D84Daa1D5Fb69_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_b60f9f312235959812d49dc4c469e83_v2_3_7_9"
-            ] = JSONSchemaValidatorB60F9F312235959812D49Dc4C469E83_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_bb01b6bd31b53bfb12bbe327320392e_v2_3_7_9"
-            ] = JSONSchemaValidatorBb01B6BD31B53BfB12BBe327320392E_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c224ae3007d5486bbc5abb1f88e95e6_v2_3_7_9"
-            ] = JSONSchemaValidatorC224Ae3007D5486Bbc5Abb1F88E95E6_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d9ed5bba1155b9c8fe132640832f94e_v2_3_7_9"
-            ] = JSONSchemaValidatorD9Ed5BbA1155B9C8Fe132640832F94E_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e69d02d71905aecbd10b782469efbda_v2_3_7_9"
-            ] = JSONSchemaValidatorE69D02D71905AecBd10B782469Efbda_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e722e05046d5262b55c125237e9b67d_v2_3_7_9"
-            ] = JSONSchemaValidatorE722E05046D5262B55C125237E9B67D_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d77719c37558f694e5545a21406275_v2_3_7_9"
-            ] = JSONSchemaValidatorD77719C37558F694E5545A21406275_v2_3_7_9()
-            self.json_schema_validators["jsd_d9a13d575abdc26d485af708e7_v2_3_7_9"] = (
-                JSONSchemaValidatorD9A13D575ABdc26D485Af708E7_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_c7315d78a2ddda76b62777e8_v2_3_7_9"] = (
-                JSONSchemaValidatorC7315D78A2DdDa76B62777E8_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_c279ba052250d883ef87775a415089_v2_3_7_9"
-            ] = JSONSchemaValidatorC279Ba052250D883Ef87775A415089_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_af893464e53d2abc8922f4f3310ea_v2_3_7_9"
-            ] = JSONSchemaValidatorAf893464E53D2Abc8922F4F3310Ea_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d2bd5f05bd535a89ebadb30e2ede9e_v2_3_7_9"
-            ] = JSONSchemaValidatorD2Bd5F05Bd535A89EbAdb30E2Ede9E_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f33d768d01586c9133b155da5e5ade_v2_3_7_9"
-            ] = JSONSchemaValidatorF33D768D01586C9133B155Da5E5Ade_v2_3_7_9()
-            self.json_schema_validators["jsd_f624469d5e448e9eba137fe533e8_v2_3_7_9"] = (
-                JSONSchemaValidatorF624469D5E448E9EBa137Fe533E8_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_d2ece28b509b8ef80b2b8c5c5f36_v2_3_7_9"] = (
-                JSONSchemaValidatorD2EcE28B509B8Ef80B2B8C5C5F36_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_e31c795964b3bdf85da1b5a2a5_v2_3_7_9"] = (
-                JSONSchemaValidatorE31C795964B3BdF85Da1B5A2A5_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_dabd13cd5e9c928daf80d6758d62_v2_3_7_9"] = (
-                JSONSchemaValidatorDabd13Cd5E9C928DAf80D6758D62_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_b46a141650debf5946262e8a0961_v2_3_7_9"] = (
-                JSONSchemaValidatorB46A141650DeBf5946262E8A0961_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_b8699619f95a24bd2d81f12f048235_v2_3_7_9"
-            ] = JSONSchemaValidatorB8699619F95A24Bd2D81F12F048235_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c00df3623b5a74ad41e75487ed9b77_v2_3_7_9"
-            ] = JSONSchemaValidatorC00Df3623B5A74Ad41E75487Ed9B77_v2_3_7_9()
-            self.json_schema_validators["jsd_a64bd4956649de3a61e10f0637e_v2_3_7_9"] = (
-                JSONSchemaValidatorA64Bd4956649De3A61E10F0637E_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_bc1f37a9f2571fa4d7bc85b9e8a583_v2_3_7_9"
-            ] = JSONSchemaValidatorBc1F37A9F2571FA4D7Bc85B9E8A583_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a88c7510a15578b8eb2df183a92d5d_v2_3_7_9"
-            ] = JSONSchemaValidatorA88C7510A15578B8Eb2Df183A92D5D_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_febb2149ac5f8ba25dbf4d9a862d94_v2_3_7_9"
-            ] = JSONSchemaValidatorFebb2149Ac5F8BA25DBf4D9A862D94_v2_3_7_9()
-            self.json_schema_validators["jsd_cad522e57a7b96b7238935689ed_v2_3_7_9"] = (
-                JSONSchemaValidatorCad522E57A7B96B7238935689Ed_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_e702d5786552992aa76b930780569_v2_3_7_9"
-            ] = JSONSchemaValidatorE702D5786552992Aa76B930780569_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_cb98464ddb5ee9ba7ebb4428443ba9_v2_3_7_9"
-            ] = JSONSchemaValidatorCb98464Ddb5Ee9Ba7EBb4428443Ba9_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d292147221524a96616d982b0147c0_v2_3_7_9"
-            ] = JSONSchemaValidatorD292147221524A96616D982B0147C0_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_af29516f0c8591da2a92523b5ab3386_v2_3_7_9"
-            ] = JSONSchemaValidatorAf29516F0C8591DA2A92523B5Ab3386_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_bc9716ed6eb5c6e9ecb0380501d6138_v2_3_7_9"
-            ] = JSONSchemaValidatorBc9716ED6Eb5C6E9Ecb0380501D6138_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_de92f8ae3c15ea0bad5562452eb5c40_v2_3_7_9"
-            ] = JSONSchemaValidatorDe92F8AE3C15Ea0Bad5562452Eb5C40_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f09c94c65c858e4b7be0b7cb3d25b7a_v2_3_7_9"
-            ] = JSONSchemaValidatorF09C94C65C858E4B7Be0B7Cb3D25B7A_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f25c825ca6e58a5b1c2294b11558e7b_v2_3_7_9"
-            ] = JSONSchemaValidatorF25C825Ca6E58A5B1C2294B11558E7B_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c6506b22335101a465d2adf5ca7f37_v2_3_7_9"
-            ] = JSONSchemaValidatorC6506B22335101A465D2Adf5Ca7F37_v2_3_7_9()
-            self.json_schema_validators["jsd_e0ed6b9a530ea05d77a199ded4e3_v2_3_7_9"] = (
-                JSONSchemaValidatorE0Ed6B9A530EA05D77A199Ded4E3_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_a2be6dde4c587389e79d6cb84e54a6_v2_3_7_9"
-            ] = JSONSchemaValidatorA2Be6DDe4C587389E79D6Cb84E54A6_v2_3_7_9()
-            self.json_schema_validators["jsd_ad0cb5a12a76384ba4644e55e_v2_3_7_9"] = (
-                JSONSchemaValidatorAD0Cb5A12A76384Ba4644E55E_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_fdd2af215b9b8327a3e24a3dea89_v2_3_7_9"] = (
-                JSONSchemaValidatorFdd2Af215B9B8327A3E24A3Dea89_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_f71d0b2527b8cd13123f9a68cf3_v2_3_7_9"] = (
-                JSONSchemaValidatorF71D0B2527B8Cd13123F9A68Cf3_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_fee1860b4d509585956565df54a91a_v2_3_7_9"
-            ] = JSONSchemaValidatorFee1860B4D509585956565Df54A91A_v2_3_7_9()
-            self.json_schema_validators["jsd_b42a01655325be161ab2ad60aa68_v2_3_7_9"] = (
-                JSONSchemaValidatorB42A01655325Be161Ab2Ad60Aa68_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_fe62979a925778bdb0a974a7d86a12_v2_3_7_9"
-            ] = JSONSchemaValidatorFe62979A925778Bdb0A974A7D86A12_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a602eee5a56faa64436bade8a240e_v2_3_7_9"
-            ] = JSONSchemaValidatorA602EEe5A56FaA64436Bade8A240E_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e6ea8c5d425cf9ac77006f5593725f_v2_3_7_9"
-            ] = JSONSchemaValidatorE6Ea8C5D425Cf9Ac77006F5593725F_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_bcb1d489d735258975828f845df1769_v2_3_7_9"
-            ] = JSONSchemaValidatorBcb1D489D735258975828F845Df1769_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_bd5b507f58a50aab614e3d7409eec4c_v2_3_7_9"
-            ] = JSONSchemaValidatorBd5B507F58A50AaB614E3D7409Eec4C_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_db690b800995e35bc4e8c43d8ea6c18_v2_3_7_9"
-            ] = JSONSchemaValidatorDb690B800995E35Bc4E8C43D8Ea6C18_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e235d44e4485bafa4499f5a8e53bcd3_v2_3_7_9"
-            ] = JSONSchemaValidatorE235D44E4485BafA4499F5A8E53Bcd3_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e4f91ea42515ccdbc24549b84ca1e90_v2_3_7_9"
-            ] = JSONSchemaValidatorE4F91Ea42515CcdBc24549B84Ca1E90_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_efa7f7a97b95f5885a00e6981b27b11_v2_3_7_9"
-            ] = JSONSchemaValidatorEfa7F7A97B95F5885A00E6981B27B11_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f5d13316c8f53a0b78d881c738a15c6_v2_3_7_9"
-            ] = JSONSchemaValidatorF5D13316C8F53A0B78D881C738A15C6_v2_3_7_9()
-            self.json_schema_validators["jsd_bbf7ce025bc2a291b90c37a6b898_v2_3_7_9"] = (
-                JSONSchemaValidatorBbf7Ce025Bc2A291B90C37A6B898_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_effb55c158f28469762804e84633_v2_3_7_9"] = (
-                JSONSchemaValidatorEffb55C158F28469762804E84633_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_b8a44ba454de8a7bb52d3efe97ca_v2_3_7_9"] = (
-                JSONSchemaValidatorB8A44Ba454De8A7BB52D3Efe97Ca_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_e0b654c39dc6e19cd6f5194d_v2_3_7_9"] = (
-                JSONSchemaValidatorE0B654C39Dc6E19Cd6F5194D_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_b3ff5f865f1c8122a0ec8ca73921_v2_3_7_9"] = (
-                JSONSchemaValidatorB3Ff5F865F1C8122A0Ec8Ca73921_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_de1b75d59b083df0ece12259ecd_v2_3_7_9"] = (
-                JSONSchemaValidatorDe1B75D59B083Df0Ece12259Ecd_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_fc95c917352ad8410ffe6d6e522ed_v2_3_7_9"
-            ] = JSONSchemaValidatorFc95C917352Ad8410Ffe6D6E522Ed_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ae7f02a3d051f2baf7cc087990d658_v2_3_7_9"
-            ] = JSONSchemaValidatorAe7F02A3D051F2Baf7Cc087990D658_v2_3_7_9()
-            self.json_schema_validators["jsd_c0204c665262a712caef988d7d88_v2_3_7_9"] = (
-                JSONSchemaValidatorC0204C665262A712Caef988D7D88_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_f50f8c552f5d2eb68d715e1318976e_v2_3_7_9"
-            ] = JSONSchemaValidatorF50F8C552F5D2EB68D715E1318976E_v2_3_7_9()
-            self.json_schema_validators["jsd_d9227adc5f02b7cd264af7255d19_v2_3_7_9"] = (
-                JSONSchemaValidatorD9227Adc5F02B7Cd264Af7255D19_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_e6ec627d3c587288978990aae75228_v2_3_7_9"
-            ] = JSONSchemaValidatorE6Ec627D3C587288978990Aae75228_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d58baa26bd5a6d9c461592c872d515_v2_3_7_9"
-            ] = JSONSchemaValidatorD58Baa26Bd5A6D9C461592C872D515_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_eb1227bb250799b6ca76ed4bee9d9_v2_3_7_9"
-            ] = JSONSchemaValidatorEb1227Bb250799B6CA76Ed4Bee9D9_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c380301e3e05423bdc1857ff00ae77a_v2_3_7_9"
-            ] = JSONSchemaValidatorC380301E3E05423Bdc1857Ff00Ae77A_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c8354b61a36524cbb2e1037bd814807_v2_3_7_9"
-            ] = JSONSchemaValidatorC8354B61A36524CBb2E1037Bd814807_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f1debbfd4775faba3779c513181dfbf_v2_3_7_9"
-            ] = JSONSchemaValidatorF1DebbfD4775FabA3779C513181Dfbf_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f24f6c07641580ba6ed710e92c2da16_v2_3_7_9"
-            ] = JSONSchemaValidatorF24F6C07641580BA6Ed710E92C2Da16_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f4ce55b5f235924903516ef31dc9e3c_v2_3_7_9"
-            ] = JSONSchemaValidatorF4Ce55B5F235924903516Ef31Dc9E3C_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_fcc151af7615a84adf48b714d146192_v2_3_7_9"
-            ] = JSONSchemaValidatorFcc151AF7615A84Adf48B714D146192_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_fccc089e04b557aa7478de3d8fe472f_v2_3_7_9"
-            ] = JSONSchemaValidatorFccc089E04B557AA7478De3D8Fe472F_v2_3_7_9()
-            self.json_schema_validators["jsd_fe3ec7651e79d891fce37a0d860_v2_3_7_9"] = (
-                JSONSchemaValidatorFe3Ec7651E79D891Fce37A0D860_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_b07f187b7456c8bbb6088a2f24dcee_v2_3_7_9"
-            ] = JSONSchemaValidatorB07F187B7456C8Bbb6088A2F24Dcee_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_cb7563a5058c4801eb842a74ff61c_v2_3_7_9"
-            ] = JSONSchemaValidatorCb7563A5058C4801EB842A74Ff61C_v2_3_7_9()
-            self.json_schema_validators["jsd_c10072541e94bd16f1aebffe32_v2_3_7_9"] = (
-                JSONSchemaValidatorC10072541E94Bd16F1Aebffe32_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_a18e761ac8592e9a5c4e0bb2308cf0_v2_3_7_9"
-            ] = JSONSchemaValidatorA18E761Ac8592E9A5C4E0Bb2308Cf0_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a31cc19195d43ba695f4b7494b559_v2_3_7_9"
-            ] = JSONSchemaValidatorA31Cc19195D43Ba695F4B7494B559_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_edc44e0e7a513191cc16dc2b4da88e_v2_3_7_9"
-            ] = JSONSchemaValidatorEdc44E0E7A513191Cc16Dc2B4Da88E_v2_3_7_9()
-            self.json_schema_validators["jsd_d39d23589e85db0a63c414057c_v2_3_7_9"] = (
-                JSONSchemaValidatorD39D23589E85Db0A63C414057C_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_c45c1c55d498d03a72933690098_v2_3_7_9"] = (
-                JSONSchemaValidatorC45C1C55D498D03A72933690098_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_a9f5796226051218eac559ab5211384_v2_3_7_9"
-            ] = JSONSchemaValidatorA9F5796226051218Eac559Ab5211384_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c4befbd77a452a9b7873ffc360a1f20_v2_3_7_9"
-            ] = JSONSchemaValidatorC4Befbd77A452A9B7873Ffc360A1F20_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c8d11fb9fc752ab8bb8e2b1413ccc92_v2_3_7_9"
-            ] = JSONSchemaValidatorC8D11Fb9Fc752Ab8Bb8E2B1413Ccc92_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ccd75f80ece59f08cadda085402cef5_v2_3_7_9"
-            ] = JSONSchemaValidatorCcd75F80Ece59F08CadDa085402Cef5_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d82755e5e03510daf0951c1f42c2702_v2_3_7_9"
-            ] = JSONSchemaValidatorD82755E5E03510DAf0951C1F42C2702_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e0bd567c1395531a7f18ab4e14110bd_v2_3_7_9"
-            ] = JSONSchemaValidatorE0Bd567C1395531A7F18Ab4E14110Bd_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e4f57e8f06856ee9a7e490d01f7f692_v2_3_7_9"
-            ] = JSONSchemaValidatorE4F57E8F06856Ee9A7E490D01F7F692_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_eb3b18894545315b25b94d0c0e2ec67_v2_3_7_9"
-            ] = JSONSchemaValidatorEb3B18894545315B25B94D0C0E2Ec67_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_eca62ef076b5627a85b2a5959613fb8_v2_3_7_9"
-            ] = JSONSchemaValidatorEca62Ef076B5627A85B2A5959613Fb8_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f486694f3da57b4921b7f2036a1b754_v2_3_7_9"
-            ] = JSONSchemaValidatorF486694F3Da57B4921B7F2036A1B754_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f6536a8f01d5863856a0a8308198e15_v2_3_7_9"
-            ] = JSONSchemaValidatorF6536A8F01D5863856A0A8308198E15_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f7dd6a6cf8d57499168aae05847ad34_v2_3_7_9"
-            ] = JSONSchemaValidatorF7Dd6A6Cf8D57499168Aae05847Ad34_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_fdd36dd2454547096bb65df3755710f_v2_3_7_9"
-            ] = JSONSchemaValidatorFdd36Dd2454547096Bb65Df3755710F_v2_3_7_9()
-            self.json_schema_validators["jsd_cec6c85d9bb4bcc8f61f31296b_v2_3_7_9"] = (
-                JSONSchemaValidatorCeC6C85D9BB4BcC8F61F31296B_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_f7cf4f24d54c6944a31ed308f8361_v2_3_7_9"
-            ] = JSONSchemaValidatorF7Cf4F24D54C6944A31Ed308F8361_v2_3_7_9()
-            self.json_schema_validators["jsd_e9c5c3e5515a2e1b2cdee6928ab_v2_3_7_9"] = (
-                JSONSchemaValidatorE9C5C3E5515A2E1B2Cdee6928Ab_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_d73cd5be487a36d0a01d6cdc3_v2_3_7_9"] = (
-                JSONSchemaValidatorD73Cd5Be487A36D0A01D6Cdc3_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_db7b6c4f0542aab9fe7cf5c995f83_v2_3_7_9"
-            ] = JSONSchemaValidatorDb7B6C4F0542AAb9FE7Cf5C995F83_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d7161b33157dba957ba18eda440c2_v2_3_7_9"
-            ] = JSONSchemaValidatorD7161B33157DbA957Ba18Eda440C2_v2_3_7_9()
-            self.json_schema_validators["jsd_f5ebb9d50aab287f320d32181c0_v2_3_7_9"] = (
-                JSONSchemaValidatorF5EBb9D50AaB287F320D32181C0_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_aba18f6e605ce28a112b34dcb4fe82_v2_3_7_9"
-            ] = JSONSchemaValidatorAba18F6E605Ce28A112B34Dcb4Fe82_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_fa27ccbaf55711849381a707e1edfa_v2_3_7_9"
-            ] = JSONSchemaValidatorFa27CcBaf55711849381A707E1Edfa_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f04b76067507b9384e409e9431ef3_v2_3_7_9"
-            ] = JSONSchemaValidatorF04B76067507B9384E409E9431Ef3_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_b7ae9494b05a57bf6393eaf308b1e7_v2_3_7_9"
-            ] = JSONSchemaValidatorB7Ae9494B05A57Bf6393Eaf308B1E7_v2_3_7_9()
-            self.json_schema_validators["jsd_f24a5ad5bf03fe236dd96dcb_v2_3_7_9"] = (
-                JSONSchemaValidatorF24A5Ad5Bf03Fe236Dd96Dcb_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_b6581534bb321eaea272365b7_v2_3_7_9"] = (
-                JSONSchemaValidatorB6581534BB321Eaea272365B7_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_cc59d48f8159008f52b29e08738811_v2_3_7_9"
-            ] = JSONSchemaValidatorCc59D48F8159008F52B29E08738811_v2_3_7_9()
-            self.json_schema_validators["jsd_bfca373c5d7c863eef14abc654fd_v2_3_7_9"] = (
-                JSONSchemaValidatorBfca373C5D7C863EEf14Abc654Fd_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_d1608b2751c883a072ee3fb80228_v2_3_7_9"] = (
-                JSONSchemaValidatorD1608B2751C883A072Ee3Fb80228_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_eea0014365ef78d30d9ba8f1752e8_v2_3_7_9"
-            ] = JSONSchemaValidatorEea0014365Ef78D30D9Ba8F1752E8_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e73b352ff2573aab906c2ad75c5a71_v2_3_7_9"
-            ] = JSONSchemaValidatorE73B352Ff2573AAb906C2Ad75C5A71_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ac98aec39c95c2d97532514ee9b9f3e_v2_3_7_9"
-            ] = JSONSchemaValidatorAc98Aec39C95C2D97532514Ee9B9F3E_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ba9e0f3a5db5972a55d4b3fcf2b5432_v2_3_7_9"
-            ] = JSONSchemaValidatorBa9E0F3A5Db5972A55D4B3Fcf2B5432_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_bd421c1db8c5deaa3301b8cc73dd541_v2_3_7_9"
-            ] = JSONSchemaValidatorBd421C1Db8C5DeaA3301B8Cc73Dd541_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_be8cdb967555fcca03a4c1f796eee56_v2_3_7_9"
-            ] = JSONSchemaValidatorBe8Cdb967555FccA03A4C1F796Eee56_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_cba0eecfc555390935cebd13e6bcb90_v2_3_7_9"
-            ] = JSONSchemaValidatorCba0EecFc555390935CEbd13E6Bcb90_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d54c40ecb5f531cb5a78d0cd5dd585e_v2_3_7_9"
-            ] = JSONSchemaValidatorD54C40ECb5F531CB5A78D0Cd5Dd585E_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_dbea7d7de125cf6b840d5032d3a5c59_v2_3_7_9"
-            ] = JSONSchemaValidatorDbea7D7De125Cf6B840D5032D3A5C59_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f019a24c5ce50f082d081bb72ff4df9_v2_3_7_9"
-            ] = JSONSchemaValidatorF019A24C5Ce50F082D081Bb72Ff4Df9_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f2b137487385de6925b7b6136d4b027_v2_3_7_9"
-            ] = JSONSchemaValidatorF2B137487385De6925B7B6136D4B027_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f5645e6e819558fa08761dee45ca406_v2_3_7_9"
-            ] = JSONSchemaValidatorF5645E6E819558FA08761Dee45Ca406_v2_3_7_9()
-            self.json_schema_validators["jsd_fe06867e548bba1919024b40d992_v2_3_7_9"] = (
-                JSONSchemaValidatorFe06867E548BBa1919024B40D992_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_efa92557c9a6c8af0a71829c7e_v2_3_7_9"] = (
-                JSONSchemaValidatorEfA92557C9A6C8Af0A71829C7E_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_e55cca88065707a6f812a679f69a5d_v2_3_7_9"
-            ] = JSONSchemaValidatorE55Cca88065707A6F812A679F69A5D_v2_3_7_9()
-            self.json_schema_validators["jsd_ecc3258a5c5b8f2267a512820a59_v2_3_7_9"] = (
-                JSONSchemaValidatorEcc3258A5C5B8F2267A512820A59_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_f5602b2965e53b5bdda193025a3fc_v2_3_7_9"
-            ] = JSONSchemaValidatorF5602B2965E53B5BdDa193025A3Fc_v2_3_7_9()
-            self.json_schema_validators["jsd_e6bca55256a0aac288486e38049b_v2_3_7_9"] = (
-                JSONSchemaValidatorE6BcA55256A0Aac288486E38049B_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_ba98ed72975099b39dd2dc4cb65ed8_v2_3_7_9"
-            ] = JSONSchemaValidatorBa98Ed72975099B39DD2Dc4Cb65Ed8_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ef28900485c4e9842b4a68e483d4e_v2_3_7_9"
-            ] = JSONSchemaValidatorEf28900485C4E9842B4A68E483D4E_v2_3_7_9()
-            self.json_schema_validators["jsd_ea8d75a9d8d9e6882da4a4a91_v2_3_7_9"] = (
-                JSONSchemaValidatorEA8D75A9D8D9E6882Da4A4A91_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_c49a8488cd52158790aac513e7184a_v2_3_7_9"
-            ] = JSONSchemaValidatorC49A8488Cd52158790Aac513E7184A_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ae57085565e551594fc05b4db6a64af_v2_3_7_9"
-            ] = JSONSchemaValidatorAe57085565E551594Fc05B4Db6A64Af_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_bb1653037ca558a8c6097e20b99b4b1_v2_3_7_9"
-            ] = JSONSchemaValidatorBb1653037Ca558A8C6097E20B99B4B1_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_bd1c59e9be75ac4a40decaa95ee9efd_v2_3_7_9"
-            ] = JSONSchemaValidatorBd1C59E9Be75Ac4A40DEcaa95Ee9Efd_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_bec2dde673c5b2f940d0474fed32af6_v2_3_7_9"
-            ] = JSONSchemaValidatorBec2Dde673C5B2F940D0474Fed32Af6_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d16471a58805b4aa2c757209d188aed_v2_3_7_9"
-            ] = JSONSchemaValidatorD16471A58805B4AA2C757209D188Aed_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d6b58f378895114839682dceed1a9b5_v2_3_7_9"
-            ] = JSONSchemaValidatorD6B58F378895114839682Dceed1A9B5_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d8fc92ddeab597ebb50ea003a6d46bd_v2_3_7_9"
-            ] = JSONSchemaValidatorD8Fc92DDeab597EBb50Ea003A6D46Bd_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e481654675355408be8daff9a82f9a0_v2_3_7_9"
-            ] = JSONSchemaValidatorE481654675355408Be8Daff9A82F9A0_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ee43cac5fd65c55ab3153d3549d18c0_v2_3_7_9"
-            ] = JSONSchemaValidatorEe43Cac5Fd65C55Ab3153D3549D18C0_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_eea45fca32f5f12adc30a9d03c43ac6_v2_3_7_9"
-            ] = JSONSchemaValidatorEea45FcA32F5F12Adc30A9D03C43Ac6_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c90c04b8356cf9974957e0f9516d0_v2_3_7_9"
-            ] = JSONSchemaValidatorC90C04B8356Cf9974957E0F9516D0_v2_3_7_9()
-            self.json_schema_validators["jsd_b4155d6f885a53ad0e47b1a4_v2_3_7_9"] = (
-                JSONSchemaValidatorB4155D6F885A53Ad0E47B1A4_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_cf2cac6f150c9bee9ade37921b162_v2_3_7_9"
-            ] = JSONSchemaValidatorCf2CaC6F150C9Bee9Ade37921B162_v2_3_7_9()
-            self.json_schema_validators["jsd_adfc115d6888722b71811ac96e_v2_3_7_9"] = (
-                JSONSchemaValidatorAdFc115D6888722B71811Ac96E_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_bc55e6552fac58cc0aaacd773a_v2_3_7_9"] = (
-                JSONSchemaValidatorBc55E6552FAc58Cc0Aaacd773A_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_dece7a9b353b49084a8ffa4f18c91_v2_3_7_9"
-            ] = JSONSchemaValidatorDece7A9B353B49084A8Ffa4F18C91_v2_3_7_9()
-            self.json_schema_validators["jsd_c9ea5c02b2b7368cac785f30_v2_3_7_9"] = (
-                JSONSchemaValidatorC9Ea5C02B2B7368Cac785F30_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_f4b2825561e808787a16f7e0a1f_v2_3_7_9"] = (
-                JSONSchemaValidatorF4B2825561E808787A16F7E0A1F_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_bc3ed6556f9b9c959e53e271d70_v2_3_7_9"] = (
-                JSONSchemaValidatorBc3Ed6556F9B9C959E53E271D70_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_aac9ba55e5043b4d5e0995c566dce_v2_3_7_9"
-            ] = JSONSchemaValidatorAac9BA55E5043B4D5E0995C566Dce_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_b818044610579a9b74ec582e7739ab_v2_3_7_9"
-            ] = JSONSchemaValidatorB818044610579A9B74Ec582E7739Ab_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_bcb7a52e3c5763b246bcf438fe57c9_v2_3_7_9"
-            ] = JSONSchemaValidatorBcb7A52E3C5763B246Bcf438Fe57C9_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_eb209544555e43ae2bc909499f3900_v2_3_7_9"
-            ] = JSONSchemaValidatorEb209544555E43Ae2BC909499F3900_v2_3_7_9()
-            self.json_schema_validators["jsd_f2c120b855cb8c852806ce72e54d_v2_3_7_9"] = (
-                JSONSchemaValidatorF2C120B855Cb8C852806Ce72E54D_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_a4d8313a955433858e0137ba7ef672_v2_3_7_9"
-            ] = JSONSchemaValidatorA4D8313A955433858E0137Ba7Ef672_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e62749061c5aae8ecd1ccc2d315153_v2_3_7_9"
-            ] = JSONSchemaValidatorE62749061C5Aae8Ecd1Ccc2D315153_v2_3_7_9()
-            self.json_schema_validators["jsd_cd2e825a78b6de087e991f6fe0_v2_3_7_9"] = (
-                JSONSchemaValidatorCd2E825A78B6De087E991F6Fe0_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_c14a815ec5938950343f6188f0785_v2_3_7_9"
-            ] = JSONSchemaValidatorC14A815Ec5938950343F6188F0785_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_aaebb912125213b350d7423b4f01a4_v2_3_7_9"
-            ] = JSONSchemaValidatorAaebb912125213B350D7423B4F01A4_v2_3_7_9()
-            self.json_schema_validators["jsd_fb8fee52fcb7577206a3fcac8c_v2_3_7_9"] = (
-                JSONSchemaValidatorFb8Fee52FcB7577206A3Fcac8C_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_ad0cce45817862bebfc839bf5ae_v2_3_7_9"] = (
-                JSONSchemaValidatorAd0Cce45817862BEbfc839Bf5Ae_v2_3_7_9()
-            )
-            self.json_schema_validators["jsd_d6d7d5c8983c1d3c9815bfd35_v2_3_7_9"] = (
-                JSONSchemaValidatorD6D7D5C8983C1D3C9815Bfd35_v2_3_7_9()
-            )
-            self.json_schema_validators[
-                "jsd_fb5a8c0075563491622171958074bf_v2_3_7_9"
-            ] = JSONSchemaValidatorFb5A8C0075563491622171958074Bf_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a764c85d8df5c30b9143619d4f9cde9_v2_3_7_9"
-            ] = JSONSchemaValidatorA764C85D8Df5C30B9143619D4F9Cde9_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c991ce0b0f058a08c863a4abdfc70a6_v2_3_7_9"
-            ] = JSONSchemaValidatorC991Ce0B0F058A08C863A4Abdfc70A6_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d10535ed2045b9bb5c58882e6f43cb2_v2_3_7_9"
-            ] = JSONSchemaValidatorD10535ED2045B9BB5C58882E6F43Cb2_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f41eb48a0da56949cfaddeecb51ab66_v2_3_7_9"
-            ] = JSONSchemaValidatorF41Eb48A0Da56949CfaDdeecb51Ab66_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f5bfccc7e30550baa7046f74daa1ef2_v2_3_7_9"
-            ] = JSONSchemaValidatorF5Bfccc7E30550BAa7046F74Daa1Ef2_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_fff3662537e538f82bfb5809e30b3df_v2_3_7_9"
-            ] = JSONSchemaValidatorFff3662537E538F82BfB5809E30B3Df_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a0c237c8fc115b6f98b87cc7a1360dd0_v2_3_7_9"
-            ] = JSONSchemaValidatorA0C237C8Fc115B6F98B87Cc7A1360Dd0_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a0f799d5ec6954d1bd7a25853080a9f1_v2_3_7_9"
-            ] = JSONSchemaValidatorA0F799D5Ec6954D1Bd7A25853080A9F1_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a14e71c1b98e51eea41255720025b519_v2_3_7_9"
-            ] = JSONSchemaValidatorA14E71C1B98E51EeA41255720025B519_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a352f6280e445075b3ea7cbf868c2d94_v2_3_7_9"
-            ] = JSONSchemaValidatorA352F6280E445075B3Ea7Cbf868C2D94_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a3b37dcbe2a150bea06d9dcde1837281_v2_3_7_9"
-            ] = JSONSchemaValidatorA3B37DcbE2A150BeA06D9Dcde1837281_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a3d2432ae8c55fe793c5180d8d5fce25_v2_3_7_9"
-            ] = JSONSchemaValidatorA3D2432AE8C55Fe793C5180D8D5Fce25_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a3fb2e7bb8aa50508425b1dd8818fda4_v2_3_7_9"
-            ] = JSONSchemaValidatorA3Fb2E7BB8Aa50508425B1Dd8818Fda4_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a41113bc28515538af4fe4d2ff707f60_v2_3_7_9"
-            ] = JSONSchemaValidatorA41113Bc28515538Af4FE4D2Ff707F60_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a54fce1a0c305bdabfe91a8a6161e539_v2_3_7_9"
-            ] = JSONSchemaValidatorA54Fce1A0C305BdaBfe91A8A6161E539_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a5e4452cb2e05682933349833a01d14b_v2_3_7_9"
-            ] = JSONSchemaValidatorA5E4452CB2E05682933349833A01D14B_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a66db26df529597c84c2a15ea2d632ce_v2_3_7_9"
-            ] = JSONSchemaValidatorA66Db26DF529597C84C2A15Ea2D632Ce_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a6c4ce7aef8251a2a8646ba0b5c1826a_v2_3_7_9"
-            ] = JSONSchemaValidatorA6C4Ce7AEf8251A2A8646Ba0B5C1826A_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a73fbc67627e5bbbafe748de84d42df6_v2_3_7_9"
-            ] = JSONSchemaValidatorA73Fbc67627E5BbbAfe748De84D42Df6_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a7935eedd53a5b8c84668c903cc1c705_v2_3_7_9"
-            ] = JSONSchemaValidatorA7935EedD53A5B8C84668C903Cc1C705_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a7d6d604f38f5f849af79d8768bddfc1_v2_3_7_9"
-            ] = JSONSchemaValidatorA7D6D604F38F5F849Af79D8768Bddfc1_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a837b8a46cd459c8b429d16fb17f1370_v2_3_7_9"
-            ] = JSONSchemaValidatorA837B8A46Cd459C8B429D16Fb17F1370_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a91eed12dfc85dbdaacab22e6e9f04a5_v2_3_7_9"
-            ] = JSONSchemaValidatorA91Eed12Dfc85DbdAacaB22E6E9F04A5_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a93d01238de0537dbb3d358f9cce0bd2_v2_3_7_9"
-            ] = JSONSchemaValidatorA93D01238De0537DBb3D358F9Cce0Bd2_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a9b864257b965fe4bd8b0293f41f1537_v2_3_7_9"
-            ] = JSONSchemaValidatorA9B864257B965Fe4Bd8B0293F41F1537_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_a9e0722d184658c592bd130ff03e1dde_v2_3_7_9"
-            ] = JSONSchemaValidatorA9E0722D184658C592Bd130Ff03E1Dde_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_aa11f09d28165f4ea6c81b8642e59cc4_v2_3_7_9"
-            ] = JSONSchemaValidatorAa11F09D28165F4EA6C81B8642E59Cc4_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_aa663ca2bd1f5a3db67c405987495112_v2_3_7_9"
-            ] = JSONSchemaValidatorAa663Ca2Bd1F5A3DB67C405987495112_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ac6e63199fb05bcf89106a22502c2197_v2_3_7_9"
-            ] = JSONSchemaValidatorAc6E63199Fb05Bcf89106A22502C2197_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ac7ce690e0f55a469b0a9bfa3d2c165e_v2_3_7_9"
-            ] = JSONSchemaValidatorAc7Ce690E0F55A469B0A9Bfa3D2C165E_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ad936677c99a58f6b532359d66fe98a7_v2_3_7_9"
-            ] = JSONSchemaValidatorAd936677C99A58F6B532359D66Fe98A7_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ad96e712f4525a128368b1bfe3afc21c_v2_3_7_9"
-            ] = JSONSchemaValidatorAd96E712F4525A128368B1Bfe3Afc21C_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ada3522de8ef54729e9fc242df292547_v2_3_7_9"
-            ] = JSONSchemaValidatorAda3522DE8Ef54729E9FC242Df292547_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ae4d33eacca95f109bebc6fd0528ca48_v2_3_7_9"
-            ] = JSONSchemaValidatorAe4D33EaCca95F109BebC6Fd0528Ca48_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_afcd4a0cbe985fd7aafa73d671c43a1e_v2_3_7_9"
-            ] = JSONSchemaValidatorAfcd4A0CBe985Fd7Aafa73D671C43A1E_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_b08f499f995f5f46ba52e0385b54721a_v2_3_7_9"
-            ] = JSONSchemaValidatorB08F499F995F5F46Ba52E0385B54721A_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_b0aa8e79d21f5e579908825e70aaccf6_v2_3_7_9"
-            ] = JSONSchemaValidatorB0Aa8E79D21F5E579908825E70Aaccf6_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_b0b146a144a65aa296b8b939c2926158_v2_3_7_9"
-            ] = JSONSchemaValidatorB0B146A144A65Aa296B8B939C2926158_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_b119a4d455e35cc3b2cc6695a045cbfa_v2_3_7_9"
-            ] = JSONSchemaValidatorB119A4D455E35Cc3B2Cc6695A045Cbfa_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_b11aa4de387251c794665e030fa815da_v2_3_7_9"
-            ] = JSONSchemaValidatorB11Aa4De387251C794665E030Fa815Da_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_b2dae3b41636596aa02c3ad0a4bcb8d7_v2_3_7_9"
-            ] = JSONSchemaValidatorB2Dae3B41636596AA02C3Ad0A4Bcb8D7_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_b350fb0876a25879973b0840fbb690bb_v2_3_7_9"
-            ] = JSONSchemaValidatorB350Fb0876A25879973B0840Fbb690Bb_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_b3ab480a3f485ecc9fef1bd2f8c9d109_v2_3_7_9"
-            ] = JSONSchemaValidatorB3Ab480A3F485Ecc9Fef1Bd2F8C9D109_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_b3c4383ecc13514c85c6f3d8484f6d68_v2_3_7_9"
-            ] = JSONSchemaValidatorB3C4383ECc13514C85C6F3D8484F6D68_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_b43e0f60e9ac5bd4960f9772cf7a497b_v2_3_7_9"
-            ] = JSONSchemaValidatorB43E0F60E9Ac5Bd4960F9772Cf7A497B_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_b4f52e69ddca5b2583b28fb4c96447aa_v2_3_7_9"
-            ] = JSONSchemaValidatorB4F52E69Ddca5B2583B28Fb4C96447Aa_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_b6f2d8e46cdd5f05bb06f52cd1b26fb2_v2_3_7_9"
-            ] = JSONSchemaValidatorB6F2D8E46Cdd5F05Bb06F52Cd1B26Fb2_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_b7079a38844e56dd8f1b6b876880a02e_v2_3_7_9"
-            ] = JSONSchemaValidatorB7079A38844E56Dd8F1B6B876880A02E_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_b95201b6a6905a10b463e036bf591166_v2_3_7_9"
-            ] = JSONSchemaValidatorB95201B6A6905A10B463E036Bf591166_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ba40975123ed50daa2f9f599cdf2d911_v2_3_7_9"
-            ] = JSONSchemaValidatorBa40975123Ed50DaA2F9F599Cdf2D911_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_bac0c488707959c182dfef18681bceda_v2_3_7_9"
-            ] = JSONSchemaValidatorBac0C488707959C182DfEf18681Bceda_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_bc33daf690ec5399a507829abfc4fe64_v2_3_7_9"
-            ] = JSONSchemaValidatorBc33Daf690Ec5399A507829Abfc4Fe64_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_bc3cb471beaf5bfeb47201993c023068_v2_3_7_9"
-            ] = JSONSchemaValidatorBc3Cb471Beaf5BfeB47201993C023068_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_bce8e6b307ce52dd8f5546fbd78e05ee_v2_3_7_9"
-            ] = JSONSchemaValidatorBce8E6B307Ce52Dd8F5546Fbd78E05Ee_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_bd31fcbd1ecd5a2c8b812088b27bfcea_v2_3_7_9"
-            ] = JSONSchemaValidatorBd31Fcbd1Ecd5A2C8B812088B27Bfcea_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_bd400dbef41e53ed82541c766f14f1eb_v2_3_7_9"
-            ] = JSONSchemaValidatorBd400DbeF41E53Ed82541C766F14F1Eb_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_bdca1829ea705fa690922e3e0f8ff7b0_v2_3_7_9"
-            ] = JSONSchemaValidatorBdca1829Ea705Fa690922E3E0F8Ff7B0_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_bdcb514ae33b571795e4a42147d11f87_v2_3_7_9"
-            ] = JSONSchemaValidatorBdcb514AE33B571795E4A42147D11F87_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_bf40cea4982c54278a52ac2e7b0c458a_v2_3_7_9"
-            ] = JSONSchemaValidatorBf40Cea4982C54278A52Ac2E7B0C458A_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_bfb1005f4d265f8bb340637175a5841f_v2_3_7_9"
-            ] = JSONSchemaValidatorBfb1005F4D265F8BB340637175A5841F_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_bfd1cc1403c951a99c0fcafd59eaabf3_v2_3_7_9"
-            ] = JSONSchemaValidatorBfd1Cc1403C951A99C0FCafd59Eaabf3_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c17432d928f755f8bb9f4edb83089d3e_v2_3_7_9"
-            ] = JSONSchemaValidatorC17432D928F755F8Bb9F4Edb83089D3E_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c1dae5c13e6959348fe1fe0652958647_v2_3_7_9"
-            ] = JSONSchemaValidatorC1Dae5C13E6959348Fe1Fe0652958647_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c524f0ec199e5435bcaee56b423532e7_v2_3_7_9"
-            ] = JSONSchemaValidatorC524F0Ec199E5435BcaeE56B423532E7_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c5c273290fae513da209ec2c9270e46d_v2_3_7_9"
-            ] = JSONSchemaValidatorC5C273290Fae513DA209Ec2C9270E46D_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c5f97865727857d5b1eeaedee3dcccd2_v2_3_7_9"
-            ] = JSONSchemaValidatorC5F97865727857D5B1EeAedee3Dcccd2_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c60312a923ee5a6fb3f2c725c32dc96f_v2_3_7_9"
-            ] = JSONSchemaValidatorC60312A923Ee5A6FB3F2C725C32Dc96F_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c6774ff9549a53d4b41fdd2d88f1d0f5_v2_3_7_9"
-            ] = JSONSchemaValidatorC6774Ff9549A53D4B41FDd2D88F1D0F5_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c7f28c3d23ba5384be5e769ae0505d00_v2_3_7_9"
-            ] = JSONSchemaValidatorC7F28C3D23Ba5384Be5E769Ae0505D00_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c85b39d6bae0536695992ddbb91ea96d_v2_3_7_9"
-            ] = JSONSchemaValidatorC85B39D6Bae0536695992Ddbb91Ea96D_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c937494318f952ba92eaeb82b144c338_v2_3_7_9"
-            ] = JSONSchemaValidatorC937494318F952Ba92EaEb82B144C338_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c9b5b83e67195b649077a05e42897cc4_v2_3_7_9"
-            ] = JSONSchemaValidatorC9B5B83E67195B649077A05E42897Cc4_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_c9f995abc21b54e7860f66aef2ffbc85_v2_3_7_9"
-            ] = JSONSchemaValidatorC9F995AbC21B54E7860F66Aef2Ffbc85_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ca2fe989a227585086452d24d32867a6_v2_3_7_9"
-            ] = JSONSchemaValidatorCa2Fe989A227585086452D24D32867A6_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_cb38886d0236502783d431455e3fb880_v2_3_7_9"
-            ] = JSONSchemaValidatorCb38886D0236502783D431455E3Fb880_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_cc1599012a5a59c8abdda5376b5cc583_v2_3_7_9"
-            ] = JSONSchemaValidatorCc1599012A5A59C8AbddA5376B5Cc583_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_cc19241fd92f586c8986d4d5c99c3a88_v2_3_7_9"
-            ] = JSONSchemaValidatorCc19241FD92F586C8986D4D5C99C3A88_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ccbf614b4b355cac929f12cc61272c1c_v2_3_7_9"
-            ] = JSONSchemaValidatorCcbf614B4B355Cac929F12Cc61272C1C_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_cdf8c0d3866d5147901c0cf4821a84a7_v2_3_7_9"
-            ] = JSONSchemaValidatorCdf8C0D3866D5147901C0Cf4821A84A7_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_cec8139f6b1c5e5991d12197206029a0_v2_3_7_9"
-            ] = JSONSchemaValidatorCec8139F6B1C5E5991D12197206029A0_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_cf9d39cef5e95bb9bd48d5f86e094c99_v2_3_7_9"
-            ] = JSONSchemaValidatorCf9D39CeF5E95Bb9Bd48D5F86E094C99_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_cfadc5e4c912588389f4f63d2fb6e4ed_v2_3_7_9"
-            ] = JSONSchemaValidatorCfadc5E4C912588389F4F63D2Fb6E4Ed_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d02614492a2251c18de2e36c097e40ff_v2_3_7_9"
-            ] = JSONSchemaValidatorD02614492A2251C18De2E36C097E40Ff_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d045d18062ad5ae59c6f446beb17d675_v2_3_7_9"
-            ] = JSONSchemaValidatorD045D18062Ad5Ae59C6F446Beb17D675_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d05c763ada545fbe94a4c0391456b89f_v2_3_7_9"
-            ] = JSONSchemaValidatorD05C763ADa545Fbe94A4C0391456B89F_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d0aab00569b258b481afedc35e6db392_v2_3_7_9"
-            ] = JSONSchemaValidatorD0Aab00569B258B481AfEdc35E6Db392_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d0f4d6b5909b5ecaa29e854e919b4221_v2_3_7_9"
-            ] = JSONSchemaValidatorD0F4D6B5909B5EcaA29E854E919B4221_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d1d42ef2f1895a82a2830bf1353e6baa_v2_3_7_9"
-            ] = JSONSchemaValidatorD1D42Ef2F1895A82A2830Bf1353E6Baa_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d2ea814bfae85da1b77872d095fc8221_v2_3_7_9"
-            ] = JSONSchemaValidatorD2Ea814BFae85Da1B77872D095Fc8221_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d413a3d054ac50fa921ca8cf7fdf5449_v2_3_7_9"
-            ] = JSONSchemaValidatorD413A3D054Ac50Fa921CA8Cf7Fdf5449_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d5c229546dc755f796dfcf34f1c2e290_v2_3_7_9"
-            ] = JSONSchemaValidatorD5C229546Dc755F796DfCf34F1C2E290_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d69b1cfffdda5bd1828a5a89a262cbdd_v2_3_7_9"
-            ] = JSONSchemaValidatorD69B1CffFdda5Bd1828A5A89A262Cbdd_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d825ae9a117f5b6bb65b7d78fd42513c_v2_3_7_9"
-            ] = JSONSchemaValidatorD825Ae9A117F5B6BB65B7D78Fd42513C_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d8fcd6dbb7ff53b58f7398c49b27ded2_v2_3_7_9"
-            ] = JSONSchemaValidatorD8Fcd6DbB7Ff53B58F7398C49B27Ded2_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d91a3aad0fd954e7a43aa3256ce433f6_v2_3_7_9"
-            ] = JSONSchemaValidatorD91A3Aad0Fd954E7A43AA3256Ce433F6_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d967a378b43457ad8c6a6de7bc1845d1_v2_3_7_9"
-            ] = JSONSchemaValidatorD967A378B43457Ad8C6A6De7Bc1845D1_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_d9e3276d1ed3511b80b22ea8388959c8_v2_3_7_9"
-            ] = JSONSchemaValidatorD9E3276D1Ed3511B80B22Ea8388959C8_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_da455f4be5b75126ba9970c7cc54c7db_v2_3_7_9"
-            ] = JSONSchemaValidatorDa455F4BE5B75126Ba9970C7Cc54C7Db_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_da593242978c5047bb6b62b7f9475326_v2_3_7_9"
-            ] = JSONSchemaValidatorDa593242978C5047Bb6B62B7F9475326_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_db0f8e07ae0d5ecc83e34d29e5e57b41_v2_3_7_9"
-            ] = JSONSchemaValidatorDb0F8E07Ae0D5Ecc83E34D29E5E57B41_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_dc254215fdf25cd5b7ba797e8f8faebf_v2_3_7_9"
-            ] = JSONSchemaValidatorDc254215Fdf25Cd5B7Ba797E8F8Faebf_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_dc5d352dfaeb5b17800b0af2858c2f5c_v2_3_7_9"
-            ] = JSONSchemaValidatorDc5D352DFaeb5B17800B0Af2858C2F5C_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_dcc43be0514e50fea80cfa827f13ee5c_v2_3_7_9"
-            ] = JSONSchemaValidatorDcc43Be0514E50FeA80CFa827F13Ee5C_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_dda852745acd5ce5a97b0cfdf0de2fd2_v2_3_7_9"
-            ] = JSONSchemaValidatorDda852745Acd5Ce5A97B0Cfdf0De2Fd2_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_de1769e2886b5948b408100225b4a034_v2_3_7_9"
-            ] = JSONSchemaValidatorDe1769E2886B5948B408100225B4A034_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_deb34387d0235811a90985711be9fe2e_v2_3_7_9"
-            ] = JSONSchemaValidatorDeb34387D0235811A90985711Be9Fe2E_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_dec1857f1585557eb39e12a9c93ef985_v2_3_7_9"
-            ] = JSONSchemaValidatorDec1857F1585557EB39E12A9C93Ef985_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_df26f516755a50b5b5477324cf5cb649_v2_3_7_9"
-            ] = JSONSchemaValidatorDf26F516755A50B5B5477324Cf5Cb649_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_df9ec5aa58815a849b4853b223343e5e_v2_3_7_9"
-            ] = JSONSchemaValidatorDf9Ec5Aa58815A849B4853B223343E5E_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_dfda5beca4cc5437876bff366493ebf0_v2_3_7_9"
-            ] = JSONSchemaValidatorDfda5BecA4Cc5437876BFf366493Ebf0_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e0c7b28d55c85d49a84c1403ca14bd5f_v2_3_7_9"
-            ] = JSONSchemaValidatorE0C7B28D55C85D49A84C1403Ca14Bd5F_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e11daa984f535a08bc1eb01bc84bc399_v2_3_7_9"
-            ] = JSONSchemaValidatorE11Daa984F535A08Bc1EB01Bc84Bc399_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e1781a990c6b5a4b895d56bcfda2b7cb_v2_3_7_9"
-            ] = JSONSchemaValidatorE1781A990C6B5A4B895D56Bcfda2B7Cb_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e1b8c435195d56368c24a54dcce007d0_v2_3_7_9"
-            ] = JSONSchemaValidatorE1B8C435195D56368C24A54Dcce007D0_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e2ec291c2e775df3895aadc639713eea_v2_3_7_9"
-            ] = JSONSchemaValidatorE2Ec291C2E775Df3895AAdc639713Eea_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e2f9718de3d050819cdc6355a3a43200_v2_3_7_9"
-            ] = JSONSchemaValidatorE2F9718DE3D050819Cdc6355A3A43200_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e328f7d015535897877f3ecb0c927453_v2_3_7_9"
-            ] = JSONSchemaValidatorE328F7D015535897877F3Ecb0C927453_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e3934b0fb68a5ff787e65e9b7c8e6296_v2_3_7_9"
-            ] = JSONSchemaValidatorE3934B0FB68A5Ff787E65E9B7C8E6296_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e3d7ad943d3a50fb8c3be7327669e557_v2_3_7_9"
-            ] = JSONSchemaValidatorE3D7Ad943D3A50Fb8C3BE7327669E557_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e3e170003d865b9a8d76cbe1d2f268be_v2_3_7_9"
-            ] = JSONSchemaValidatorE3E170003D865B9A8D76Cbe1D2F268Be_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e4a09bf566f35babad9e27f5eb61a86d_v2_3_7_9"
-            ] = JSONSchemaValidatorE4A09Bf566F35BabAd9E27F5Eb61A86D_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e4d083d956805f63b970be543c34eb0e_v2_3_7_9"
-            ] = JSONSchemaValidatorE4D083D956805F63B970Be543C34Eb0E_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e6c22549e5145c4892d0bd3b97614e07_v2_3_7_9"
-            ] = JSONSchemaValidatorE6C22549E5145C4892D0Bd3B97614E07_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e6eed78cb55d51a1bfe669729df25689_v2_3_7_9"
-            ] = JSONSchemaValidatorE6Eed78CB55D51A1Bfe669729Df25689_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e7af120721c7519a84b13bbe4a1a0362_v2_3_7_9"
-            ] = JSONSchemaValidatorE7Af120721C7519A84B13Bbe4A1A0362_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e8271b05b62c54609f74b4f2f373ad5a_v2_3_7_9"
-            ] = JSONSchemaValidatorE8271B05B62C54609F74B4F2F373Ad5A_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_e85b40c5ca055f4c82281617a8f95644_v2_3_7_9"
-            ] = JSONSchemaValidatorE85B40C5Ca055F4C82281617A8F95644_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ea4363569a9d58779c2bfc05b6e45423_v2_3_7_9"
-            ] = JSONSchemaValidatorEa4363569A9D58779C2BFc05B6E45423_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ea59df3daf2a57a0b48044cc49c8a1ca_v2_3_7_9"
-            ] = JSONSchemaValidatorEa59Df3DAf2A57A0B48044Cc49C8A1Ca_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ea5f116c0cd152bbb4a92c043738ea57_v2_3_7_9"
-            ] = JSONSchemaValidatorEa5F116C0Cd152BbB4A92C043738Ea57_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_eab4d187be085cac8a53971def40bee0_v2_3_7_9"
-            ] = JSONSchemaValidatorEab4D187Be085Cac8A53971Def40Bee0_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_eb4a05f61e475ad0b9e74f963f27ea1d_v2_3_7_9"
-            ] = JSONSchemaValidatorEb4A05F61E475Ad0B9E74F963F27Ea1D_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ecdb2d14c29b5bf3ad79ed2e3cc70715_v2_3_7_9"
-            ] = JSONSchemaValidatorEcdb2D14C29B5Bf3Ad79Ed2E3Cc70715_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ed266e6eda225aedbf581508635da822_v2_3_7_9"
-            ] = JSONSchemaValidatorEd266E6EDa225AedBf581508635Da822_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ed9125b257ea54b79ef2db2d8ebd9d00_v2_3_7_9"
-            ] = JSONSchemaValidatorEd9125B257Ea54B79Ef2Db2D8Ebd9D00_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_edf997bb4bcc5dd6baca80647d8a47ce_v2_3_7_9"
-            ] = JSONSchemaValidatorEdf997Bb4Bcc5Dd6Baca80647D8A47Ce_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_eeb595d249295989a4917261463ea82a_v2_3_7_9"
-            ] = JSONSchemaValidatorEeb595D249295989A4917261463Ea82A_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_eecf4323cb285985be72a7e061891059_v2_3_7_9"
-            ] = JSONSchemaValidatorEecf4323Cb285985Be72A7E061891059_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ef94c2c20ba15fd38e129ac75067de1e_v2_3_7_9"
-            ] = JSONSchemaValidatorEf94C2C20Ba15Fd38E129Ac75067De1E_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f08eb586113e597a91b1658297570934_v2_3_7_9"
-            ] = JSONSchemaValidatorF08Eb586113E597A91B1658297570934_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f0942fbb79f855e889d60777f41ea944_v2_3_7_9"
-            ] = JSONSchemaValidatorF0942Fbb79F855E889D60777F41Ea944_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f0f7b6e1e4e159e7a40001fc3e649dfc_v2_3_7_9"
-            ] = JSONSchemaValidatorF0F7B6E1E4E159E7A40001Fc3E649Dfc_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f20eecc6e2d95a03a9e8961cd4337467_v2_3_7_9"
-            ] = JSONSchemaValidatorF20Eecc6E2D95A03A9E8961Cd4337467_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f210ff2d89425b4790ce56f19da7be92_v2_3_7_9"
-            ] = JSONSchemaValidatorF210Ff2D89425B4790Ce56F19Da7Be92_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f325b2c7e429566ba5ed9ae8253b5bef_v2_3_7_9"
-            ] = JSONSchemaValidatorF325B2C7E429566BA5Ed9Ae8253B5Bef_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f667322836d5527482ad2100bec7feb4_v2_3_7_9"
-            ] = JSONSchemaValidatorF667322836D5527482Ad2100Bec7Feb4_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f6a4086c00f45dc5a634f0b8db5cdfd3_v2_3_7_9"
-            ] = JSONSchemaValidatorF6A4086C00F45Dc5A634F0B8Db5Cdfd3_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f6f9dde38ce458fcaf27ffd4f84bfe68_v2_3_7_9"
-            ] = JSONSchemaValidatorF6F9Dde38Ce458FcAf27Ffd4F84Bfe68_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f8b4842604b65658afb34b4f124db469_v2_3_7_9"
-            ] = JSONSchemaValidatorF8B4842604B65658Afb34B4F124Db469_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f924b4c27d18500b9b23df516b55c182_v2_3_7_9"
-            ] = JSONSchemaValidatorF924B4C27D18500B9B23Df516B55C182_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f9492367570c5f009cf8b5955790e87c_v2_3_7_9"
-            ] = JSONSchemaValidatorF9492367570C5F009Cf8B5955790E87C_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f95014e3b3385f21afa39325f3508427_v2_3_7_9"
-            ] = JSONSchemaValidatorF95014E3B3385F21Afa39325F3508427_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_f99c96c3a9b45ddaabc2c75ff8efa67f_v2_3_7_9"
-            ] = JSONSchemaValidatorF99C96C3A9B45DdaAbc2C75Ff8Efa67F_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_fa3975be5af25501abb40339d96917eb_v2_3_7_9"
-            ] = JSONSchemaValidatorFa3975Be5Af25501Abb40339D96917Eb_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_fb5e152d4d3d59f5afd92f717f3a1eea_v2_3_7_9"
-            ] = JSONSchemaValidatorFb5E152D4D3D59F5Afd92F717F3A1Eea_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_fbdd94fbecd256c08e1d9f6e1a7657ac_v2_3_7_9"
-            ] = JSONSchemaValidatorFbdd94FbEcd256C08E1D9F6E1A7657Ac_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_fc416739f3c655ed911884aec0130e83_v2_3_7_9"
-            ] = JSONSchemaValidatorFc416739F3C655Ed911884Aec0130E83_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_fc8410781af357b6be17a2104ce5efb1_v2_3_7_9"
-            ] = JSONSchemaValidatorFc8410781Af357B6Be17A2104Ce5Efb1_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_fd488ff002115f3b8f0ee165e5347609_v2_3_7_9"
-            ] = JSONSchemaValidatorFd488Ff002115F3B8F0EE165E5347609_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_fdbe4ec3e9f252a988404dc94250b80d_v2_3_7_9"
-            ] = JSONSchemaValidatorFdbe4Ec3E9F252A988404Dc94250B80D_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_fdfc828270d950ecb75480fe03f7d573_v2_3_7_9"
-            ] = JSONSchemaValidatorFdfc828270D950EcB75480Fe03F7D573_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ff5bf5a67c6c5c0aa9e7ba84c088e1a6_v2_3_7_9"
-            ] = JSONSchemaValidatorFf5Bf5A67C6C5C0AA9E7Ba84C088E1A6_v2_3_7_9()
-            self.json_schema_validators[
-                "jsd_ffd2fefb57d5523c87a5d941eb93ddc3_v2_3_7_9"
-            ] = JSONSchemaValidatorFfd2Fefb57D5523C87A5D941Eb93Ddc3_v2_3_7_9()
-        if version == "3.1.3.0":
-            self.json_schema_validators[
-                "jsd_d5f8cf25475dc5be53f35357aca5a4_v3_1_3_0"
-            ] = JSONSchemaValidatorD5F8Cf25475Dc5Be53F35357Aca5A4_v3_1_3_0()
-            self.json_schema_validators["jsd_b2f15d0c54c2862a60a904289ddd_v3_1_3_0"] = (
-                JSONSchemaValidatorB2F15D0C54C2862A60A904289Ddd_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_e4d208b5545f66bf0f94a155c81f46_v3_1_3_0"
-            ] = JSONSchemaValidatorE4D208B5545F66Bf0F94A155C81F46_v3_1_3_0()
-            self.json_schema_validators["jsd_cd9d7d858f094469abf9464431f_v3_1_3_0"] = (
-                JSONSchemaValidatorCd9D7D858F094469Abf9464431F_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_bece53a182b45ffa4a1a435e_v3_1_3_0"] = (
-                JSONSchemaValidatorBece53A182B45Ffa4A1A435E_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_cdc0bafd4257e78d211a1f4120bfa9_v3_1_3_0"
-            ] = JSONSchemaValidatorCdc0BaFd4257E78D211A1F4120Bfa9_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e22c99a82f5764828810acb45e7a9e_v3_1_3_0"
-            ] = JSONSchemaValidatorE22C99A82F5764828810Acb45E7A9E_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_cfb964a2958909f7ca12d23ab2bdb_v3_1_3_0"
-            ] = JSONSchemaValidatorCfb964A2958909F7CA12D23Ab2Bdb_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c2a16208da55e8a615348ed3d530ac_v3_1_3_0"
-            ] = JSONSchemaValidatorC2A16208Da55E8A615348Ed3D530Ac_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_cca68e89d0545dac01a8c7a461ac6e_v3_1_3_0"
-            ] = JSONSchemaValidatorCca68E89D0545DAc01A8C7A461Ac6E_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ee8590b6b45048b84e814161272bee_v3_1_3_0"
-            ] = JSONSchemaValidatorEe8590B6B45048B84E814161272Bee_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bb7c52e5225e9398a006fecf4da06f_v3_1_3_0"
-            ] = JSONSchemaValidatorBb7C52E5225E9398A006Fecf4Da06F_v3_1_3_0()
-            self.json_schema_validators["jsd_d5da0365e31972173f015ed3614_v3_1_3_0"] = (
-                JSONSchemaValidatorD5DA0365E31972173F015Ed3614_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_97e350a7a690cdfeffa5eaca_v3_1_3_0"] = (
-                JSONSchemaValidator97E350A7A690Cdfeffa5Eaca_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_fd6083b0c65d03b2d53f10b3ece59d_v3_1_3_0"
-            ] = JSONSchemaValidatorFd6083B0C65D03B2D53F10B3Ece59D_v3_1_3_0()
-            self.json_schema_validators["jsd_a0a8d545698d1d59a9be90e51_v3_1_3_0"] = (
-                JSONSchemaValidatorA0A8D545698D1D59A9Be90E51_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_ecfe864dc5012ab9c25d23e2ce9f5_v3_1_3_0"
-            ] = JSONSchemaValidatorEcfe864Dc5012Ab9C25D23E2Ce9F5_v3_1_3_0()
-            self.json_schema_validators["jsd_fe8fb526f9b3b8f3c7aaeebac_v3_1_3_0"] = (
-                JSONSchemaValidatorFE8Fb526F9B3B8F3C7Aaeebac_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_d7073129453698264e7519d82991c_v3_1_3_0"
-            ] = JSONSchemaValidatorD7073129453698264E7519D82991C_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f751cc2f55767b34e4c890b3fd36e_v3_1_3_0"
-            ] = JSONSchemaValidatorF751CC2F55767B34E4C890B3Fd36E_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f790a930d452708353c374f5c0f90f_v3_1_3_0"
-            ] = JSONSchemaValidatorF790A930D452708353C374F5C0F90F_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a41ac8d894e5ee98fc9324fb8488174_v3_1_3_0"
-            ] = JSONSchemaValidatorA41Ac8D894E5Ee98Fc9324Fb8488174_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a544e27e18e5412af3b68d915c8ca50_v3_1_3_0"
-            ] = JSONSchemaValidatorA544E27E18E5412Af3B68D915C8Ca50_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_af7031cc5ca5b44af0e6454d558412c_v3_1_3_0"
-            ] = JSONSchemaValidatorAf7031CC5Ca5B44Af0E6454D558412C_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b9fbd53af6a5b46b34b17e601680801_v3_1_3_0"
-            ] = JSONSchemaValidatorB9Fbd53Af6A5B46B34B17E601680801_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d999a1d36ee52babb6b619877dad734_v3_1_3_0"
-            ] = JSONSchemaValidatorD999A1D36Ee52BaBb6B619877Dad734_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e86b65311b05d29ba5eea0d5f1fd88f_v3_1_3_0"
-            ] = JSONSchemaValidatorE86B65311B05D29Ba5EEa0D5F1Fd88F_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f44ddd3c38c5a9484f5cb4e125447bc_v3_1_3_0"
-            ] = JSONSchemaValidatorF44Ddd3C38C5A9484F5Cb4E125447Bc_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_cd16daa50533eb0f5873b7601abb2_v3_1_3_0"
-            ] = JSONSchemaValidatorCd16DAa50533EB0F5873B7601Abb2_v3_1_3_0()
-            self.json_schema_validators["jsd_c7266d89581c9601b79b7304fda3_v3_1_3_0"] = (
-                JSONSchemaValidatorC7266D89581C9601B79B7304Fda3_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_ce6c2c14553f9a4a88f66a04c21c4_v3_1_3_0"
-            ] = JSONSchemaValidatorCe6C2C14553F9A4A88F66A04C21C4_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e5bb87a955e33a7ee46f1085fd880_v3_1_3_0"
-            ] = JSONSchemaValidatorE5Bb87A955E33A7Ee46F1085Fd880_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d76a951f85a7a927afc2f1ea935c8_v3_1_3_0"
-            ] = JSONSchemaValidatorD76A951F85A7A927AFc2F1Ea935C8_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ee7664344f50cb8f2c94beaa01629d_v3_1_3_0"
-            ] = JSONSchemaValidatorEe7664344F50Cb8F2C94Beaa01629D_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f2c49c69c53e7b4f57f2af9a6f597_v3_1_3_0"
-            ] = JSONSchemaValidatorF2C49C69C53E7B4F57F2Af9A6F597_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e1a76c121857a085149e62e56caadd_v3_1_3_0"
-            ] = JSONSchemaValidatorE1A76C121857A085149E62E56Caadd_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ca2f659b595c0ba7c649fd8c8bdad6_v3_1_3_0"
-            ] = JSONSchemaValidatorCa2F659B595C0BA7C649Fd8C8Bdad6_v3_1_3_0()
-            self.json_schema_validators["jsd_a4dab79d54829548004029a91ba1_v3_1_3_0"] = (
-                JSONSchemaValidatorA4DaB79D54829548004029A91Ba1_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_f5a13405ba69f3957b98db8663a_v3_1_3_0"] = (
-                JSONSchemaValidatorF5A13405Ba69F3957B98Db8663A_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_6ce35f19bc4c1d058aa01536_v3_1_3_0"] = (
-                JSONSchemaValidator6Ce35F19Bc4C1D058Aa01536_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_b107800544384c1ddad7b60c237_v3_1_3_0"] = (
-                JSONSchemaValidatorB107800544384C1Ddad7B60C237_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_a3954b27e5eeb82789ed231e0557f_v3_1_3_0"
-            ] = JSONSchemaValidatorA3954B27E5Eeb82789Ed231E0557F_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e3a724a35854758d65a83823c88435_v3_1_3_0"
-            ] = JSONSchemaValidatorE3A724A35854758D65A83823C88435_v3_1_3_0()
-            self.json_schema_validators["jsd_d7b57050bdb98e9340d0bc4dba_v3_1_3_0"] = (
-                JSONSchemaValidatorD7B57050BdB98E9340D0Bc4Dba_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_a2131eae5c1d8e73cd55eebf6a83_v3_1_3_0"] = (
-                JSONSchemaValidatorA2131Eae5C1D8E73Cd55Eebf6A83_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_f21b7552158e889b51d0c109c15db_v3_1_3_0"
-            ] = JSONSchemaValidatorF21B7552158E889B51D0C109C15Db_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f2562a2d8e5ec287738032961762ed_v3_1_3_0"
-            ] = JSONSchemaValidatorF2562A2D8E5Ec287738032961762Ed_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f256e33af7501a8bdae2742ca9f6d6_v3_1_3_0"
-            ] = JSONSchemaValidatorF256E33Af7501A8BdaE2742Ca9F6D6_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b269afaaa855d3291b825f724fc8ea9_v3_1_3_0"
-            ] = JSONSchemaValidatorB269AfaAa855D3291B825F724Fc8Ea9_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b3323a24b275402b97c7e9ccfd78c91_v3_1_3_0"
-            ] = JSONSchemaValidatorB3323A24B275402B97C7E9Ccfd78C91_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bfab2e1d87654afb88c77fcfae4e407_v3_1_3_0"
-            ] = JSONSchemaValidatorBfab2E1D87654AfB88C77Fcfae4E407_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ca519342eb25dfcaf15f8f44baf0ee0_v3_1_3_0"
-            ] = JSONSchemaValidatorCa519342Eb25DfcAf15F8F44Baf0Ee0_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_cc239fa9b185ecbab9e306289850a63_v3_1_3_0"
-            ] = JSONSchemaValidatorCc239Fa9B185EcbAb9E306289850A63_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ccbaf226c685cacac29eb345955f3ad_v3_1_3_0"
-            ] = JSONSchemaValidatorCcbaf226C685CacAc29Eb345955F3Ad_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d1845268faf55f98bc952872259f16f_v3_1_3_0"
-            ] = JSONSchemaValidatorD1845268Faf55F98Bc952872259F16F_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d9bd7c527d254ecb63d2b709c428043_v3_1_3_0"
-            ] = JSONSchemaValidatorD9Bd7C527D254EcB63D2B709C428043_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e5e51bcda0b5fec984ba8120f743fe2_v3_1_3_0"
-            ] = JSONSchemaValidatorE5E51BcDa0B5Fec984BA8120F743Fe2_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_efc2269ee565e23b7be7b49e4fc0322_v3_1_3_0"
-            ] = JSONSchemaValidatorEfc2269Ee565E23B7Be7B49E4Fc0322_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f77386a48895fa59dcddcc7dd4addb5_v3_1_3_0"
-            ] = JSONSchemaValidatorF77386A48895Fa59DcdDcc7Dd4Addb5_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ffa347eb411567a9c793696795250a5_v3_1_3_0"
-            ] = JSONSchemaValidatorFfa347EB411567A9C793696795250A5_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ffcaccdd9f2530abf66adc98c3f0201_v3_1_3_0"
-            ] = JSONSchemaValidatorFfcaccdD9F2530ABf66Adc98C3F0201_v3_1_3_0()
-            self.json_schema_validators["jsd_b9be51e25efc9f41d4f68451f9a6_v3_1_3_0"] = (
-                JSONSchemaValidatorB9Be51E25Efc9F41D4F68451F9A6_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_c765afc72581d862cd61f5139d224_v3_1_3_0"
-            ] = JSONSchemaValidatorC765AFc72581D862CD61F5139D224_v3_1_3_0()
-            self.json_schema_validators["jsd_bf80823752baba63a8849fd521cd_v3_1_3_0"] = (
-                JSONSchemaValidatorBf80823752BaBa63A8849Fd521Cd_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_d833c51c4f5cd2879d3e69f773295c_v3_1_3_0"
-            ] = JSONSchemaValidatorD833C51C4F5Cd2879D3E69F773295C_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_fa310ab095148bdb00d7d3d5e1676_v3_1_3_0"
-            ] = JSONSchemaValidatorFa310Ab095148Bdb00D7D3D5E1676_v3_1_3_0()
-            self.json_schema_validators["jsd_a9136d5513985f15e91a19da66c_v3_1_3_0"] = (
-                JSONSchemaValidatorA9136D5513985F15E91A19Da66C_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_b887c55faaca726bbe4ac2564_v3_1_3_0"] = (
-                JSONSchemaValidatorB887C55FaAca726Bbe4Ac2564_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_438d5b72acb418347ec1e1fa_v3_1_3_0"] = (
-                JSONSchemaValidator438D5B72Acb418347Ec1E1Fa_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_f90ae8599c8a21c98b7a1ca804_v3_1_3_0"] = (
-                JSONSchemaValidatorF90Ae8599C8A21C98B7A1Ca804_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_a94058a99acaaf8eb73c9227_v3_1_3_0"] = (
-                JSONSchemaValidatorA94058A99AcaAf8Eb73C9227_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_cfb1d6e52878d057740de275896_v3_1_3_0"] = (
-                JSONSchemaValidatorCfb1D6E52878D057740De275896_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_a4829a44597bbf9813664eb75de0_v3_1_3_0"] = (
-                JSONSchemaValidatorA4829A44597BBf9813664Eb75De0_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_bdc981805b5fad0a038966d52558_v3_1_3_0"] = (
-                JSONSchemaValidatorBdc981805B5FAd0A038966D52558_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_df9908ad265e83ab77d73803925678_v3_1_3_0"
-            ] = JSONSchemaValidatorDf9908Ad265E83Ab77D73803925678_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e37e7d81575d35a974df797e0a2268_v3_1_3_0"
-            ] = JSONSchemaValidatorE37E7D81575D35A974Df797E0A2268_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a924f763a15125a8d5beaa6dd6fa2c_v3_1_3_0"
-            ] = JSONSchemaValidatorA924F763A15125A8D5Beaa6Dd6Fa2C_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_de4c9b685250dfa8556ab1ec20407c_v3_1_3_0"
-            ] = JSONSchemaValidatorDe4C9B685250DfA8556Ab1Ec20407C_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a15a2f83f975a6a9964e7da79a605de_v3_1_3_0"
-            ] = JSONSchemaValidatorA15A2F83F975A6A9964E7Da79A605De_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a3a1bf404bf5772828f66f1e10f074d_v3_1_3_0"
-            ] = JSONSchemaValidatorA3A1Bf404Bf5772828F66F1E10F074D_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a7283357c1657bf8ccb3d32a96249d4_v3_1_3_0"
-            ] = JSONSchemaValidatorA7283357C1657Bf8Ccb3D32A96249D4_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b4635c45c3b5e44a30d84daa1d5fb69_v3_1_3_0"
-            ] = JSONSchemaValidatorB4635C45C3B5E44A30D84Daa1D5Fb69_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b60f9f312235959812d49dc4c469e83_v3_1_3_0"
-            ] = JSONSchemaValidatorB60F9F312235959812D49Dc4C469E83_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bb01b6bd31b53bfb12bbe327320392e_v3_1_3_0"
-            ] = JSONSchemaValidatorBb01B6BD31B53BfB12BBe327320392E_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c224ae3007d5486bbc5abb1f88e95e6_v3_1_3_0"
-            ] = JSONSchemaValidatorC224Ae3007D5486Bbc5Abb1F88E95E6_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d9ed5bba1155b9c8fe132640832f94e_v3_1_3_0"
-            ] = JSONSchemaValidatorD9Ed5BbA1155B9C8Fe132640832F94E_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d9f276a532e5eeb86bb591f8537fcc7_v3_1_3_0"
-            ] = JSONSchemaValidatorD9F276A532E5Eeb86Bb591F8537Fcc7_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e69d02d71905aecbd10b782469efbda_v3_1_3_0"
-            ] = JSONSchemaValidatorE69D02D71905AecBd10B782469Efbda_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e722e05046d5262b55c125237e9b67d_v3_1_3_0"
-            ] = JSONSchemaValidatorE722E05046D5262B55C125237E9B67D_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e9c39175d785a0eb9d6f402f378a2ba_v3_1_3_0"
-            ] = JSONSchemaValidatorE9C39175D785A0EB9D6F402F378A2Ba_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d77719c37558f694e5545a21406275_v3_1_3_0"
-            ] = JSONSchemaValidatorD77719C37558F694E5545A21406275_v3_1_3_0()
-            self.json_schema_validators["jsd_d9a13d575abdc26d485af708e7_v3_1_3_0"] = (
-                JSONSchemaValidatorD9A13D575ABdc26D485Af708E7_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_c7315d78a2ddda76b62777e8_v3_1_3_0"] = (
-                JSONSchemaValidatorC7315D78A2DdDa76B62777E8_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_c279ba052250d883ef87775a415089_v3_1_3_0"
-            ] = JSONSchemaValidatorC279Ba052250D883Ef87775A415089_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_af893464e53d2abc8922f4f3310ea_v3_1_3_0"
-            ] = JSONSchemaValidatorAf893464E53D2Abc8922F4F3310Ea_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d2bd5f05bd535a89ebadb30e2ede9e_v3_1_3_0"
-            ] = JSONSchemaValidatorD2Bd5F05Bd535A89EbAdb30E2Ede9E_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f33d768d01586c9133b155da5e5ade_v3_1_3_0"
-            ] = JSONSchemaValidatorF33D768D01586C9133B155Da5E5Ade_v3_1_3_0()
-            self.json_schema_validators["jsd_f624469d5e448e9eba137fe533e8_v3_1_3_0"] = (
-                JSONSchemaValidatorF624469D5E448E9EBa137Fe533E8_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_d2ece28b509b8ef80b2b8c5c5f36_v3_1_3_0"] = (
-                JSONSchemaValidatorD2EcE28B509B8Ef80B2B8C5C5F36_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_e31c795964b3bdf85da1b5a2a5_v3_1_3_0"] = (
-                JSONSchemaValidatorE31C795964B3BdF85Da1B5A2A5_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_dabd13cd5e9c928daf80d6758d62_v3_1_3_0"] = (
-                JSONSchemaValidatorDabd13Cd5E9C928DAf80D6758D62_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_b46a141650debf5946262e8a0961_v3_1_3_0"] = (
-                JSONSchemaValidatorB46A141650DeBf5946262E8A0961_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_b8699619f95a24bd2d81f12f048235_v3_1_3_0"
-            ] = JSONSchemaValidatorB8699619F95A24Bd2D81F12F048235_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c00df3623b5a74ad41e75487ed9b77_v3_1_3_0"
-            ] = JSONSchemaValidatorC00Df3623B5A74Ad41E75487Ed9B77_v3_1_3_0()
-            self.json_schema_validators["jsd_cf0138550909ea413dab063868c_v3_1_3_0"] = (
-                JSONSchemaValidatorCf0138550909Ea413Dab063868C_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_a64bd4956649de3a61e10f0637e_v3_1_3_0"] = (
-                JSONSchemaValidatorA64Bd4956649De3A61E10F0637E_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_bc1f37a9f2571fa4d7bc85b9e8a583_v3_1_3_0"
-            ] = JSONSchemaValidatorBc1F37A9F2571FA4D7Bc85B9E8A583_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e70de44247549f9e49cfa5c6b24de9_v3_1_3_0"
-            ] = JSONSchemaValidatorE70De44247549F9E49Cfa5C6B24De9_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a88c7510a15578b8eb2df183a92d5d_v3_1_3_0"
-            ] = JSONSchemaValidatorA88C7510A15578B8Eb2Df183A92D5D_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_febb2149ac5f8ba25dbf4d9a862d94_v3_1_3_0"
-            ] = JSONSchemaValidatorFebb2149Ac5F8BA25DBf4D9A862D94_v3_1_3_0()
-            self.json_schema_validators["jsd_cad522e57a7b96b7238935689ed_v3_1_3_0"] = (
-                JSONSchemaValidatorCad522E57A7B96B7238935689Ed_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_e702d5786552992aa76b930780569_v3_1_3_0"
-            ] = JSONSchemaValidatorE702D5786552992Aa76B930780569_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_cb98464ddb5ee9ba7ebb4428443ba9_v3_1_3_0"
-            ] = JSONSchemaValidatorCb98464Ddb5Ee9Ba7EBb4428443Ba9_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d292147221524a96616d982b0147c0_v3_1_3_0"
-            ] = JSONSchemaValidatorD292147221524A96616D982B0147C0_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_af29516f0c8591da2a92523b5ab3386_v3_1_3_0"
-            ] = JSONSchemaValidatorAf29516F0C8591DA2A92523B5Ab3386_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bc9716ed6eb5c6e9ecb0380501d6138_v3_1_3_0"
-            ] = JSONSchemaValidatorBc9716ED6Eb5C6E9Ecb0380501D6138_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_caeb723a074519498c6b08a1c9dacb3_v3_1_3_0"
-            ] = JSONSchemaValidatorCaeb723A074519498C6B08A1C9Dacb3_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_de92f8ae3c15ea0bad5562452eb5c40_v3_1_3_0"
-            ] = JSONSchemaValidatorDe92F8AE3C15Ea0Bad5562452Eb5C40_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f09c94c65c858e4b7be0b7cb3d25b7a_v3_1_3_0"
-            ] = JSONSchemaValidatorF09C94C65C858E4B7Be0B7Cb3D25B7A_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f25c825ca6e58a5b1c2294b11558e7b_v3_1_3_0"
-            ] = JSONSchemaValidatorF25C825Ca6E58A5B1C2294B11558E7B_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c6506b22335101a465d2adf5ca7f37_v3_1_3_0"
-            ] = JSONSchemaValidatorC6506B22335101A465D2Adf5Ca7F37_v3_1_3_0()
-            self.json_schema_validators["jsd_e0ed6b9a530ea05d77a199ded4e3_v3_1_3_0"] = (
-                JSONSchemaValidatorE0Ed6B9A530EA05D77A199Ded4E3_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_a2be6dde4c587389e79d6cb84e54a6_v3_1_3_0"
-            ] = JSONSchemaValidatorA2Be6DDe4C587389E79D6Cb84E54A6_v3_1_3_0()
-            self.json_schema_validators["jsd_ad0cb5a12a76384ba4644e55e_v3_1_3_0"] = (
-                JSONSchemaValidatorAD0Cb5A12A76384Ba4644E55E_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_fdd2af215b9b8327a3e24a3dea89_v3_1_3_0"] = (
-                JSONSchemaValidatorFdd2Af215B9B8327A3E24A3Dea89_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_f71d0b2527b8cd13123f9a68cf3_v3_1_3_0"] = (
-                JSONSchemaValidatorF71D0B2527B8Cd13123F9A68Cf3_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_fee1860b4d509585956565df54a91a_v3_1_3_0"
-            ] = JSONSchemaValidatorFee1860B4D509585956565Df54A91A_v3_1_3_0()
-            self.json_schema_validators["jsd_dfe3872e591f9f3e2a0daa358c1a_v3_1_3_0"] = (
-                JSONSchemaValidatorDfe3872E591F9F3E2A0Daa358C1A_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_b42a01655325be161ab2ad60aa68_v3_1_3_0"] = (
-                JSONSchemaValidatorB42A01655325Be161Ab2Ad60Aa68_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_fe62979a925778bdb0a974a7d86a12_v3_1_3_0"
-            ] = JSONSchemaValidatorFe62979A925778Bdb0A974A7D86A12_v3_1_3_0()
-            self.json_schema_validators["jsd_b67ad5d41a330c4bdc9f7159f_v3_1_3_0"] = (
-                JSONSchemaValidatorB67Ad5D41A330C4Bdc9F7159F_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_a602eee5a56faa64436bade8a240e_v3_1_3_0"
-            ] = JSONSchemaValidatorA602EEe5A56FaA64436Bade8A240E_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e6ea8c5d425cf9ac77006f5593725f_v3_1_3_0"
-            ] = JSONSchemaValidatorE6Ea8C5D425Cf9Ac77006F5593725F_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bcb1d489d735258975828f845df1769_v3_1_3_0"
-            ] = JSONSchemaValidatorBcb1D489D735258975828F845Df1769_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bd5b507f58a50aab614e3d7409eec4c_v3_1_3_0"
-            ] = JSONSchemaValidatorBd5B507F58A50AaB614E3D7409Eec4C_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_db690b800995e35bc4e8c43d8ea6c18_v3_1_3_0"
-            ] = JSONSchemaValidatorDb690B800995E35Bc4E8C43D8Ea6C18_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e235d44e4485bafa4499f5a8e53bcd3_v3_1_3_0"
-            ] = JSONSchemaValidatorE235D44E4485BafA4499F5A8E53Bcd3_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e4f91ea42515ccdbc24549b84ca1e90_v3_1_3_0"
-            ] = JSONSchemaValidatorE4F91Ea42515CcdBc24549B84Ca1E90_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_efa7f7a97b95f5885a00e6981b27b11_v3_1_3_0"
-            ] = JSONSchemaValidatorEfa7F7A97B95F5885A00E6981B27B11_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f5d13316c8f53a0b78d881c738a15c6_v3_1_3_0"
-            ] = JSONSchemaValidatorF5D13316C8F53A0B78D881C738A15C6_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f829d3e99565937b9d12c873f8faa46_v3_1_3_0"
-            ] = JSONSchemaValidatorF829D3E99565937B9D12C873F8Faa46_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f8db651a7bb5f85a936c9fdadf3a9d9_v3_1_3_0"
-            ] = JSONSchemaValidatorF8Db651A7Bb5F85A936C9Fdadf3A9D9_v3_1_3_0()
-            self.json_schema_validators["jsd_bbf7ce025bc2a291b90c37a6b898_v3_1_3_0"] = (
-                JSONSchemaValidatorBbf7Ce025Bc2A291B90C37A6B898_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_effb55c158f28469762804e84633_v3_1_3_0"] = (
-                JSONSchemaValidatorEffb55C158F28469762804E84633_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_fa2127b55124a3a00b2991b77db6_v3_1_3_0"] = (
-                JSONSchemaValidatorFa2127B55124A3A00B2991B77Db6_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_b8a44ba454de8a7bb52d3efe97ca_v3_1_3_0"] = (
-                JSONSchemaValidatorB8A44Ba454De8A7BB52D3Efe97Ca_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_e0b654c39dc6e19cd6f5194d_v3_1_3_0"] = (
-                JSONSchemaValidatorE0B654C39Dc6E19Cd6F5194D_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_b3ff5f865f1c8122a0ec8ca73921_v3_1_3_0"] = (
-                JSONSchemaValidatorB3Ff5F865F1C8122A0Ec8Ca73921_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_de1b75d59b083df0ece12259ecd_v3_1_3_0"] = (
-                JSONSchemaValidatorDe1B75D59B083Df0Ece12259Ecd_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_fc95c917352ad8410ffe6d6e522ed_v3_1_3_0"
-            ] = JSONSchemaValidatorFc95C917352Ad8410Ffe6D6E522Ed_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ae7f02a3d051f2baf7cc087990d658_v3_1_3_0"
-            ] = JSONSchemaValidatorAe7F02A3D051F2Baf7Cc087990D658_v3_1_3_0()
-            self.json_schema_validators["jsd_c0204c665262a712caef988d7d88_v3_1_3_0"] = (
-                JSONSchemaValidatorC0204C665262A712Caef988D7D88_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_f50f8c552f5d2eb68d715e1318976e_v3_1_3_0"
-            ] = JSONSchemaValidatorF50F8C552F5D2EB68D715E1318976E_v3_1_3_0()
-            self.json_schema_validators["jsd_d9227adc5f02b7cd264af7255d19_v3_1_3_0"] = (
-                JSONSchemaValidatorD9227Adc5F02B7Cd264Af7255D19_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_de4a255bc6849a7c9cec69f13c_v3_1_3_0"] = (
-                JSONSchemaValidatorDe4A255Bc6849A7C9Cec69F13C_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_e6ec627d3c587288978990aae75228_v3_1_3_0"
-            ] = JSONSchemaValidatorE6Ec627D3C587288978990Aae75228_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d58baa26bd5a6d9c461592c872d515_v3_1_3_0"
-            ] = JSONSchemaValidatorD58Baa26Bd5A6D9C461592C872D515_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_eb1227bb250799b6ca76ed4bee9d9_v3_1_3_0"
-            ] = JSONSchemaValidatorEb1227Bb250799B6CA76Ed4Bee9D9_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c380301e3e05423bdc1857ff00ae77a_v3_1_3_0"
-            ] = JSONSchemaValidatorC380301E3E05423Bdc1857Ff00Ae77A_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c8354b61a36524cbb2e1037bd814807_v3_1_3_0"
-            ] = JSONSchemaValidatorC8354B61A36524CBb2E1037Bd814807_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f1debbfd4775faba3779c513181dfbf_v3_1_3_0"
-            ] = JSONSchemaValidatorF1DebbfD4775FabA3779C513181Dfbf_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f24f6c07641580ba6ed710e92c2da16_v3_1_3_0"
-            ] = JSONSchemaValidatorF24F6C07641580BA6Ed710E92C2Da16_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f4ce55b5f235924903516ef31dc9e3c_v3_1_3_0"
-            ] = JSONSchemaValidatorF4Ce55B5F235924903516Ef31Dc9E3C_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f75156ff30d50d1bced4ec466b56b38_v3_1_3_0"
-            ] = JSONSchemaValidatorF75156FF30D50D1Bced4Ec466B56B38_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_fcc151af7615a84adf48b714d146192_v3_1_3_0"
-            ] = JSONSchemaValidatorFcc151AF7615A84Adf48B714D146192_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_fccc089e04b557aa7478de3d8fe472f_v3_1_3_0"
-            ] = JSONSchemaValidatorFccc089E04B557AA7478De3D8Fe472F_v3_1_3_0()
-            self.json_schema_validators["jsd_fe3ec7651e79d891fce37a0d860_v3_1_3_0"] = (
-                JSONSchemaValidatorFe3Ec7651E79D891Fce37A0D860_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_b07f187b7456c8bbb6088a2f24dcee_v3_1_3_0"
-            ] = JSONSchemaValidatorB07F187B7456C8Bbb6088A2F24Dcee_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_cb7563a5058c4801eb842a74ff61c_v3_1_3_0"
-            ] = JSONSchemaValidatorCb7563A5058C4801EB842A74Ff61C_v3_1_3_0()
-            self.json_schema_validators["jsd_c10072541e94bd16f1aebffe32_v3_1_3_0"] = (
-                JSONSchemaValidatorC10072541E94Bd16F1Aebffe32_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_a18e761ac8592e9a5c4e0bb2308cf0_v3_1_3_0"
-            ] = JSONSchemaValidatorA18E761Ac8592E9A5C4E0Bb2308Cf0_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a31cc19195d43ba695f4b7494b559_v3_1_3_0"
-            ] = JSONSchemaValidatorA31Cc19195D43Ba695F4B7494B559_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_edc44e0e7a513191cc16dc2b4da88e_v3_1_3_0"
-            ] = JSONSchemaValidatorEdc44E0E7A513191Cc16Dc2B4Da88E_v3_1_3_0()
-            self.json_schema_validators["jsd_a25f176554fb407fbe4952f1c4e_v3_1_3_0"] = (
-                JSONSchemaValidatorA25F176554FB407Fbe4952F1C4E_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_d39d23589e85db0a63c414057c_v3_1_3_0"] = (
-                JSONSchemaValidatorD39D23589E85Db0A63C414057C_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_c45c1c55d498d03a72933690098_v3_1_3_0"] = (
-                JSONSchemaValidatorC45C1C55D498D03A72933690098_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_a9f5796226051218eac559ab5211384_v3_1_3_0"
-            ] = JSONSchemaValidatorA9F5796226051218Eac559Ab5211384_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c4befbd77a452a9b7873ffc360a1f20_v3_1_3_0"
-            ] = JSONSchemaValidatorC4Befbd77A452A9B7873Ffc360A1F20_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c8d11fb9fc752ab8bb8e2b1413ccc92_v3_1_3_0"
-            ] = JSONSchemaValidatorC8D11Fb9Fc752Ab8Bb8E2B1413Ccc92_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ccd75f80ece59f08cadda085402cef5_v3_1_3_0"
-            ] = JSONSchemaValidatorCcd75F80Ece59F08CadDa085402Cef5_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d82755e5e03510daf0951c1f42c2702_v3_1_3_0"
-            ] = JSONSchemaValidatorD82755E5E03510DAf0951C1F42C2702_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e0bd567c1395531a7f18ab4e14110bd_v3_1_3_0"
-            ] = JSONSchemaValidatorE0Bd567C1395531A7F18Ab4E14110Bd_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e4f57e8f06856ee9a7e490d01f7f692_v3_1_3_0"
-            ] = JSONSchemaValidatorE4F57E8F06856Ee9A7E490D01F7F692_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_eb3b18894545315b25b94d0c0e2ec67_v3_1_3_0"
-            ] = JSONSchemaValidatorEb3B18894545315B25B94D0C0E2Ec67_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_eca62ef076b5627a85b2a5959613fb8_v3_1_3_0"
-            ] = JSONSchemaValidatorEca62Ef076B5627A85B2A5959613Fb8_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ed96d98063c5be9aa0005772dc95fc5_v3_1_3_0"
-            ] = JSONSchemaValidatorEd96D98063C5Be9Aa0005772Dc95Fc5_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f486694f3da57b4921b7f2036a1b754_v3_1_3_0"
-            ] = JSONSchemaValidatorF486694F3Da57B4921B7F2036A1B754_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f6536a8f01d5863856a0a8308198e15_v3_1_3_0"
-            ] = JSONSchemaValidatorF6536A8F01D5863856A0A8308198E15_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f7dd6a6cf8d57499168aae05847ad34_v3_1_3_0"
-            ] = JSONSchemaValidatorF7Dd6A6Cf8D57499168Aae05847Ad34_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_fb433ea1bbc5dc49dce4fde0a04e5ed_v3_1_3_0"
-            ] = JSONSchemaValidatorFb433Ea1Bbc5Dc49Dce4Fde0A04E5Ed_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_fdd36dd2454547096bb65df3755710f_v3_1_3_0"
-            ] = JSONSchemaValidatorFdd36Dd2454547096Bb65Df3755710F_v3_1_3_0()
-            self.json_schema_validators["jsd_cec6c85d9bb4bcc8f61f31296b_v3_1_3_0"] = (
-                JSONSchemaValidatorCeC6C85D9BB4BcC8F61F31296B_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_f7cf4f24d54c6944a31ed308f8361_v3_1_3_0"
-            ] = JSONSchemaValidatorF7Cf4F24D54C6944A31Ed308F8361_v3_1_3_0()
-            self.json_schema_validators["jsd_e9c5c3e5515a2e1b2cdee6928ab_v3_1_3_0"] = (
-                JSONSchemaValidatorE9C5C3E5515A2E1B2Cdee6928Ab_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_d73cd5be487a36d0a01d6cdc3_v3_1_3_0"] = (
-                JSONSchemaValidatorD73Cd5Be487A36D0A01D6Cdc3_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_db7b6c4f0542aab9fe7cf5c995f83_v3_1_3_0"
-            ] = JSONSchemaValidatorDb7B6C4F0542AAb9FE7Cf5C995F83_v3_1_3_0()
-            self.json_schema_validators["jsd_c536ac5a318629fc3d6b3dc236_v3_1_3_0"] = (
-                JSONSchemaValidatorC536Ac5A318629Fc3D6B3Dc236_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_493a5d8cab239b9d2d0b49ce_v3_1_3_0"] = (
-                JSONSchemaValidator493A5D8CAb239B9D2D0B49Ce_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_d7161b33157dba957ba18eda440c2_v3_1_3_0"
-            ] = JSONSchemaValidatorD7161B33157DbA957Ba18Eda440C2_v3_1_3_0()
-            self.json_schema_validators["jsd_f5ebb9d50aab287f320d32181c0_v3_1_3_0"] = (
-                JSONSchemaValidatorF5EBb9D50AaB287F320D32181C0_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_aba18f6e605ce28a112b34dcb4fe82_v3_1_3_0"
-            ] = JSONSchemaValidatorAba18F6E605Ce28A112B34Dcb4Fe82_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_fa27ccbaf55711849381a707e1edfa_v3_1_3_0"
-            ] = JSONSchemaValidatorFa27CcBaf55711849381A707E1Edfa_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f04b76067507b9384e409e9431ef3_v3_1_3_0"
-            ] = JSONSchemaValidatorF04B76067507B9384E409E9431Ef3_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b7ae9494b05a57bf6393eaf308b1e7_v3_1_3_0"
-            ] = JSONSchemaValidatorB7Ae9494B05A57Bf6393Eaf308B1E7_v3_1_3_0()
-            self.json_schema_validators["jsd_f24a5ad5bf03fe236dd96dcb_v3_1_3_0"] = (
-                JSONSchemaValidatorF24A5Ad5Bf03Fe236Dd96Dcb_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_b6581534bb321eaea272365b7_v3_1_3_0"] = (
-                JSONSchemaValidatorB6581534BB321Eaea272365B7_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_b33956f3e56c6b8d234e7ed6a20e6_v3_1_3_0"
-            ] = JSONSchemaValidatorB33956F3E56C6B8D234E7Ed6A20E6_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_cc59d48f8159008f52b29e08738811_v3_1_3_0"
-            ] = JSONSchemaValidatorCc59D48F8159008F52B29E08738811_v3_1_3_0()
-            self.json_schema_validators["jsd_bfca373c5d7c863eef14abc654fd_v3_1_3_0"] = (
-                JSONSchemaValidatorBfca373C5D7C863EEf14Abc654Fd_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_d1608b2751c883a072ee3fb80228_v3_1_3_0"] = (
-                JSONSchemaValidatorD1608B2751C883A072Ee3Fb80228_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_eea0014365ef78d30d9ba8f1752e8_v3_1_3_0"
-            ] = JSONSchemaValidatorEea0014365Ef78D30D9Ba8F1752E8_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e73b352ff2573aab906c2ad75c5a71_v3_1_3_0"
-            ] = JSONSchemaValidatorE73B352Ff2573AAb906C2Ad75C5A71_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ac98aec39c95c2d97532514ee9b9f3e_v3_1_3_0"
-            ] = JSONSchemaValidatorAc98Aec39C95C2D97532514Ee9B9F3E_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ba9e0f3a5db5972a55d4b3fcf2b5432_v3_1_3_0"
-            ] = JSONSchemaValidatorBa9E0F3A5Db5972A55D4B3Fcf2B5432_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bd421c1db8c5deaa3301b8cc73dd541_v3_1_3_0"
-            ] = JSONSchemaValidatorBd421C1Db8C5DeaA3301B8Cc73Dd541_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_be8cdb967555fcca03a4c1f796eee56_v3_1_3_0"
-            ] = JSONSchemaValidatorBe8Cdb967555FccA03A4C1F796Eee56_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c9d3ba6208e5d6eb45fa5c9b8f7e327_v3_1_3_0"
-            ] = JSONSchemaValidatorC9D3Ba6208E5D6EB45FA5C9B8F7E327_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_cba0eecfc555390935cebd13e6bcb90_v3_1_3_0"
-            ] = JSONSchemaValidatorCba0EecFc555390935CEbd13E6Bcb90_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d54c40ecb5f531cb5a78d0cd5dd585e_v3_1_3_0"
-            ] = JSONSchemaValidatorD54C40ECb5F531CB5A78D0Cd5Dd585E_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_dbea7d7de125cf6b840d5032d3a5c59_v3_1_3_0"
-            ] = JSONSchemaValidatorDbea7D7De125Cf6B840D5032D3A5C59_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e8911ba7a8b54be8e443df8ac842e36_v3_1_3_0"
-            ] = JSONSchemaValidatorE8911Ba7A8B54Be8E443Df8Ac842E36_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f019a24c5ce50f082d081bb72ff4df9_v3_1_3_0"
-            ] = JSONSchemaValidatorF019A24C5Ce50F082D081Bb72Ff4Df9_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f2b137487385de6925b7b6136d4b027_v3_1_3_0"
-            ] = JSONSchemaValidatorF2B137487385De6925B7B6136D4B027_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f5645e6e819558fa08761dee45ca406_v3_1_3_0"
-            ] = JSONSchemaValidatorF5645E6E819558FA08761Dee45Ca406_v3_1_3_0()
-            self.json_schema_validators["jsd_fe06867e548bba1919024b40d992_v3_1_3_0"] = (
-                JSONSchemaValidatorFe06867E548BBa1919024B40D992_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_efa92557c9a6c8af0a71829c7e_v3_1_3_0"] = (
-                JSONSchemaValidatorEfA92557C9A6C8Af0A71829C7E_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_e55cca88065707a6f812a679f69a5d_v3_1_3_0"
-            ] = JSONSchemaValidatorE55Cca88065707A6F812A679F69A5D_v3_1_3_0()
-            self.json_schema_validators["jsd_ecc3258a5c5b8f2267a512820a59_v3_1_3_0"] = (
-                JSONSchemaValidatorEcc3258A5C5B8F2267A512820A59_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_f5602b2965e53b5bdda193025a3fc_v3_1_3_0"
-            ] = JSONSchemaValidatorF5602B2965E53B5BdDa193025A3Fc_v3_1_3_0()
-            self.json_schema_validators["jsd_e6bca55256a0aac288486e38049b_v3_1_3_0"] = (
-                JSONSchemaValidatorE6BcA55256A0Aac288486E38049B_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_ba98ed72975099b39dd2dc4cb65ed8_v3_1_3_0"
-            ] = JSONSchemaValidatorBa98Ed72975099B39DD2Dc4Cb65Ed8_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ef28900485c4e9842b4a68e483d4e_v3_1_3_0"
-            ] = JSONSchemaValidatorEf28900485C4E9842B4A68E483D4E_v3_1_3_0()
-            self.json_schema_validators["jsd_ea8d75a9d8d9e6882da4a4a91_v3_1_3_0"] = (
-                JSONSchemaValidatorEA8D75A9D8D9E6882Da4A4A91_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_c49a8488cd52158790aac513e7184a_v3_1_3_0"
-            ] = JSONSchemaValidatorC49A8488Cd52158790Aac513E7184A_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ae57085565e551594fc05b4db6a64af_v3_1_3_0"
-            ] = JSONSchemaValidatorAe57085565E551594Fc05B4Db6A64Af_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bb1653037ca558a8c6097e20b99b4b1_v3_1_3_0"
-            ] = JSONSchemaValidatorBb1653037Ca558A8C6097E20B99B4B1_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bd1c59e9be75ac4a40decaa95ee9efd_v3_1_3_0"
-            ] = JSONSchemaValidatorBd1C59E9Be75Ac4A40DEcaa95Ee9Efd_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bec2dde673c5b2f940d0474fed32af6_v3_1_3_0"
-            ] = JSONSchemaValidatorBec2Dde673C5B2F940D0474Fed32Af6_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d16471a58805b4aa2c757209d188aed_v3_1_3_0"
-            ] = JSONSchemaValidatorD16471A58805B4AA2C757209D188Aed_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d6b58f378895114839682dceed1a9b5_v3_1_3_0"
-            ] = JSONSchemaValidatorD6B58F378895114839682Dceed1A9B5_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d8fc92ddeab597ebb50ea003a6d46bd_v3_1_3_0"
-            ] = JSONSchemaValidatorD8Fc92DDeab597EBb50Ea003A6D46Bd_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e481654675355408be8daff9a82f9a0_v3_1_3_0"
-            ] = JSONSchemaValidatorE481654675355408Be8Daff9A82F9A0_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ee43cac5fd65c55ab3153d3549d18c0_v3_1_3_0"
-            ] = JSONSchemaValidatorEe43Cac5Fd65C55Ab3153D3549D18C0_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_eea45fca32f5f12adc30a9d03c43ac6_v3_1_3_0"
-            ] = JSONSchemaValidatorEea45FcA32F5F12Adc30A9D03C43Ac6_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c90c04b8356cf9974957e0f9516d0_v3_1_3_0"
-            ] = JSONSchemaValidatorC90C04B8356Cf9974957E0F9516D0_v3_1_3_0()
-            self.json_schema_validators["jsd_b4155d6f885a53ad0e47b1a4_v3_1_3_0"] = (
-                JSONSchemaValidatorB4155D6F885A53Ad0E47B1A4_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_cf2cac6f150c9bee9ade37921b162_v3_1_3_0"
-            ] = JSONSchemaValidatorCf2CaC6F150C9Bee9Ade37921B162_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_cf0f416ef5c25a159f4c3e376741a_v3_1_3_0"
-            ] = JSONSchemaValidatorCf0F416Ef5C25A159F4C3E376741A_v3_1_3_0()
-            self.json_schema_validators["jsd_adfc115d6888722b71811ac96e_v3_1_3_0"] = (
-                JSONSchemaValidatorAdFc115D6888722B71811Ac96E_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_bc55e6552fac58cc0aaacd773a_v3_1_3_0"] = (
-                JSONSchemaValidatorBc55E6552FAc58Cc0Aaacd773A_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_dece7a9b353b49084a8ffa4f18c91_v3_1_3_0"
-            ] = JSONSchemaValidatorDece7A9B353B49084A8Ffa4F18C91_v3_1_3_0()
-            self.json_schema_validators["jsd_c9ea5c02b2b7368cac785f30_v3_1_3_0"] = (
-                JSONSchemaValidatorC9Ea5C02B2B7368Cac785F30_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_f4b2825561e808787a16f7e0a1f_v3_1_3_0"] = (
-                JSONSchemaValidatorF4B2825561E808787A16F7E0A1F_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_bc3ed6556f9b9c959e53e271d70_v3_1_3_0"] = (
-                JSONSchemaValidatorBc3Ed6556F9B9C959E53E271D70_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_aac9ba55e5043b4d5e0995c566dce_v3_1_3_0"
-            ] = JSONSchemaValidatorAac9BA55E5043B4D5E0995C566Dce_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b818044610579a9b74ec582e7739ab_v3_1_3_0"
-            ] = JSONSchemaValidatorB818044610579A9B74Ec582E7739Ab_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bcb7a52e3c5763b246bcf438fe57c9_v3_1_3_0"
-            ] = JSONSchemaValidatorBcb7A52E3C5763B246Bcf438Fe57C9_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_eb209544555e43ae2bc909499f3900_v3_1_3_0"
-            ] = JSONSchemaValidatorEb209544555E43Ae2BC909499F3900_v3_1_3_0()
-            self.json_schema_validators["jsd_f2c120b855cb8c852806ce72e54d_v3_1_3_0"] = (
-                JSONSchemaValidatorF2C120B855Cb8C852806Ce72E54D_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_a4d8313a955433858e0137ba7ef672_v3_1_3_0"
-            ] = JSONSchemaValidatorA4D8313A955433858E0137Ba7Ef672_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e62749061c5aae8ecd1ccc2d315153_v3_1_3_0"
-            ] = JSONSchemaValidatorE62749061C5Aae8Ecd1Ccc2D315153_v3_1_3_0()
-            self.json_schema_validators["jsd_cd2e825a78b6de087e991f6fe0_v3_1_3_0"] = (
-                JSONSchemaValidatorCd2E825A78B6De087E991F6Fe0_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_c14a815ec5938950343f6188f0785_v3_1_3_0"
-            ] = JSONSchemaValidatorC14A815Ec5938950343F6188F0785_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_aaebb912125213b350d7423b4f01a4_v3_1_3_0"
-            ] = JSONSchemaValidatorAaebb912125213B350D7423B4F01A4_v3_1_3_0()
-            self.json_schema_validators["jsd_fb8fee52fcb7577206a3fcac8c_v3_1_3_0"] = (
-                JSONSchemaValidatorFb8Fee52FcB7577206A3Fcac8C_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_ad0cce45817862bebfc839bf5ae_v3_1_3_0"] = (
-                JSONSchemaValidatorAd0Cce45817862BEbfc839Bf5Ae_v3_1_3_0()
-            )
-            self.json_schema_validators["jsd_d6d7d5c8983c1d3c9815bfd35_v3_1_3_0"] = (
-                JSONSchemaValidatorD6D7D5C8983C1D3C9815Bfd35_v3_1_3_0()
-            )
-            self.json_schema_validators[
-                "jsd_fb5a8c0075563491622171958074bf_v3_1_3_0"
-            ] = JSONSchemaValidatorFb5A8C0075563491622171958074Bf_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a764c85d8df5c30b9143619d4f9cde9_v3_1_3_0"
-            ] = JSONSchemaValidatorA764C85D8Df5C30B9143619D4F9Cde9_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b5a94fd2d97514b8a9cf73df4e154b8_v3_1_3_0"
-            ] = JSONSchemaValidatorB5A94Fd2D97514B8A9CF73Df4E154B8_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c991ce0b0f058a08c863a4abdfc70a6_v3_1_3_0"
-            ] = JSONSchemaValidatorC991Ce0B0F058A08C863A4Abdfc70A6_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d10535ed2045b9bb5c58882e6f43cb2_v3_1_3_0"
-            ] = JSONSchemaValidatorD10535ED2045B9BB5C58882E6F43Cb2_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f41eb48a0da56949cfaddeecb51ab66_v3_1_3_0"
-            ] = JSONSchemaValidatorF41Eb48A0Da56949CfaDdeecb51Ab66_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f5bfccc7e30550baa7046f74daa1ef2_v3_1_3_0"
-            ] = JSONSchemaValidatorF5Bfccc7E30550BAa7046F74Daa1Ef2_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_fcd7200871e5e2db7f1720d95fee764_v3_1_3_0"
-            ] = JSONSchemaValidatorFcd7200871E5E2DB7F1720D95Fee764_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_fff3662537e538f82bfb5809e30b3df_v3_1_3_0"
-            ] = JSONSchemaValidatorFff3662537E538F82BfB5809E30B3Df_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a0c237c8fc115b6f98b87cc7a1360dd0_v3_1_3_0"
-            ] = JSONSchemaValidatorA0C237C8Fc115B6F98B87Cc7A1360Dd0_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a0f799d5ec6954d1bd7a25853080a9f1_v3_1_3_0"
-            ] = JSONSchemaValidatorA0F799D5Ec6954D1Bd7A25853080A9F1_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a14e71c1b98e51eea41255720025b519_v3_1_3_0"
-            ] = JSONSchemaValidatorA14E71C1B98E51EeA41255720025B519_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a2da4c1e5224542e8474f09eb8d4f32d_v3_1_3_0"
-            ] = JSONSchemaValidatorA2Da4C1E5224542E8474F09Eb8D4F32D_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a352f6280e445075b3ea7cbf868c2d94_v3_1_3_0"
-            ] = JSONSchemaValidatorA352F6280E445075B3Ea7Cbf868C2D94_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a3b37dcbe2a150bea06d9dcde1837281_v3_1_3_0"
-            ] = JSONSchemaValidatorA3B37DcbE2A150BeA06D9Dcde1837281_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a3d2432ae8c55fe793c5180d8d5fce25_v3_1_3_0"
-            ] = JSONSchemaValidatorA3D2432AE8C55Fe793C5180D8D5Fce25_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a3fb2e7bb8aa50508425b1dd8818fda4_v3_1_3_0"
-            ] = JSONSchemaValidatorA3Fb2E7BB8Aa50508425B1Dd8818Fda4_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a41113bc28515538af4fe4d2ff707f60_v3_1_3_0"
-            ] = JSONSchemaValidatorA41113Bc28515538Af4FE4D2Ff707F60_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a54fce1a0c305bdabfe91a8a6161e539_v3_1_3_0"
-            ] = JSONSchemaValidatorA54Fce1A0C305BdaBfe91A8A6161E539_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a5e4452cb2e05682933349833a01d14b_v3_1_3_0"
-            ] = JSONSchemaValidatorA5E4452CB2E05682933349833A01D14B_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a66db26df529597c84c2a15ea2d632ce_v3_1_3_0"
-            ] = JSONSchemaValidatorA66Db26DF529597C84C2A15Ea2D632Ce_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a6c4ce7aef8251a2a8646ba0b5c1826a_v3_1_3_0"
-            ] = JSONSchemaValidatorA6C4Ce7AEf8251A2A8646Ba0B5C1826A_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a73fbc67627e5bbbafe748de84d42df6_v3_1_3_0"
-            ] = JSONSchemaValidatorA73Fbc67627E5BbbAfe748De84D42Df6_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a7935eedd53a5b8c84668c903cc1c705_v3_1_3_0"
-            ] = JSONSchemaValidatorA7935EedD53A5B8C84668C903Cc1C705_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a7d6d604f38f5f849af79d8768bddfc1_v3_1_3_0"
-            ] = JSONSchemaValidatorA7D6D604F38F5F849Af79D8768Bddfc1_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a837b8a46cd459c8b429d16fb17f1370_v3_1_3_0"
-            ] = JSONSchemaValidatorA837B8A46Cd459C8B429D16Fb17F1370_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a914cc0c96a35a06a54856e778742a8c_v3_1_3_0"
-            ] = JSONSchemaValidatorA914Cc0C96A35A06A54856E778742A8C_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a91eed12dfc85dbdaacab22e6e9f04a5_v3_1_3_0"
-            ] = JSONSchemaValidatorA91Eed12Dfc85DbdAacaB22E6E9F04A5_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a93d01238de0537dbb3d358f9cce0bd2_v3_1_3_0"
-            ] = JSONSchemaValidatorA93D01238De0537DBb3D358F9Cce0Bd2_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a9b864257b965fe4bd8b0293f41f1537_v3_1_3_0"
-            ] = JSONSchemaValidatorA9B864257B965Fe4Bd8B0293F41F1537_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_a9e0722d184658c592bd130ff03e1dde_v3_1_3_0"
-            ] = JSONSchemaValidatorA9E0722D184658C592Bd130Ff03E1Dde_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_aa11f09d28165f4ea6c81b8642e59cc4_v3_1_3_0"
-            ] = JSONSchemaValidatorAa11F09D28165F4EA6C81B8642E59Cc4_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_aa663ca2bd1f5a3db67c405987495112_v3_1_3_0"
-            ] = JSONSchemaValidatorAa663Ca2Bd1F5A3DB67C405987495112_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ac6e63199fb05bcf89106a22502c2197_v3_1_3_0"
-            ] = JSONSchemaValidatorAc6E63199Fb05Bcf89106A22502C2197_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ac7ce690e0f55a469b0a9bfa3d2c165e_v3_1_3_0"
-            ] = JSONSchemaValidatorAc7Ce690E0F55A469B0A9Bfa3D2C165E_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ad487b01cede5cb4bdd5ee06695a6020_v3_1_3_0"
-            ] = JSONSchemaValidatorAd487B01Cede5Cb4Bdd5Ee06695A6020_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ad936677c99a58f6b532359d66fe98a7_v3_1_3_0"
-            ] = JSONSchemaValidatorAd936677C99A58F6B532359D66Fe98A7_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ad96e712f4525a128368b1bfe3afc21c_v3_1_3_0"
-            ] = JSONSchemaValidatorAd96E712F4525A128368B1Bfe3Afc21C_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ada3522de8ef54729e9fc242df292547_v3_1_3_0"
-            ] = JSONSchemaValidatorAda3522DE8Ef54729E9FC242Df292547_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ae4d33eacca95f109bebc6fd0528ca48_v3_1_3_0"
-            ] = JSONSchemaValidatorAe4D33EaCca95F109BebC6Fd0528Ca48_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ae8282c90a7059ceb31b4072429d00cd_v3_1_3_0"
-            ] = JSONSchemaValidatorAe8282C90A7059CeB31B4072429D00Cd_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_afcd4a0cbe985fd7aafa73d671c43a1e_v3_1_3_0"
-            ] = JSONSchemaValidatorAfcd4A0CBe985Fd7Aafa73D671C43A1E_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b08f499f995f5f46ba52e0385b54721a_v3_1_3_0"
-            ] = JSONSchemaValidatorB08F499F995F5F46Ba52E0385B54721A_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b0aa8e79d21f5e579908825e70aaccf6_v3_1_3_0"
-            ] = JSONSchemaValidatorB0Aa8E79D21F5E579908825E70Aaccf6_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b0b146a144a65aa296b8b939c2926158_v3_1_3_0"
-            ] = JSONSchemaValidatorB0B146A144A65Aa296B8B939C2926158_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b119a4d455e35cc3b2cc6695a045cbfa_v3_1_3_0"
-            ] = JSONSchemaValidatorB119A4D455E35Cc3B2Cc6695A045Cbfa_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b11aa4de387251c794665e030fa815da_v3_1_3_0"
-            ] = JSONSchemaValidatorB11Aa4De387251C794665E030Fa815Da_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b2dae3b41636596aa02c3ad0a4bcb8d7_v3_1_3_0"
-            ] = JSONSchemaValidatorB2Dae3B41636596AA02C3Ad0A4Bcb8D7_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b350fb0876a25879973b0840fbb690bb_v3_1_3_0"
-            ] = JSONSchemaValidatorB350Fb0876A25879973B0840Fbb690Bb_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b3ab480a3f485ecc9fef1bd2f8c9d109_v3_1_3_0"
-            ] = JSONSchemaValidatorB3Ab480A3F485Ecc9Fef1Bd2F8C9D109_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b3c4383ecc13514c85c6f3d8484f6d68_v3_1_3_0"
-            ] = JSONSchemaValidatorB3C4383ECc13514C85C6F3D8484F6D68_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b43e0f60e9ac5bd4960f9772cf7a497b_v3_1_3_0"
-            ] = JSONSchemaValidatorB43E0F60E9Ac5Bd4960F9772Cf7A497B_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b4f52e69ddca5b2583b28fb4c96447aa_v3_1_3_0"
-            ] = JSONSchemaValidatorB4F52E69Ddca5B2583B28Fb4C96447Aa_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b6f2d8e46cdd5f05bb06f52cd1b26fb2_v3_1_3_0"
-            ] = JSONSchemaValidatorB6F2D8E46Cdd5F05Bb06F52Cd1B26Fb2_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b7079a38844e56dd8f1b6b876880a02e_v3_1_3_0"
-            ] = JSONSchemaValidatorB7079A38844E56Dd8F1B6B876880A02E_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b843a90c86875472af1f351e78dd5521_v3_1_3_0"
-            ] = JSONSchemaValidatorB843A90C86875472Af1F351E78Dd5521_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_b95201b6a6905a10b463e036bf591166_v3_1_3_0"
-            ] = JSONSchemaValidatorB95201B6A6905A10B463E036Bf591166_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ba40975123ed50daa2f9f599cdf2d911_v3_1_3_0"
-            ] = JSONSchemaValidatorBa40975123Ed50DaA2F9F599Cdf2D911_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ba52bb172d495710aa00f7d4d060ec50_v3_1_3_0"
-            ] = JSONSchemaValidatorBa52Bb172D495710Aa00F7D4D060Ec50_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bac0c488707959c182dfef18681bceda_v3_1_3_0"
-            ] = JSONSchemaValidatorBac0C488707959C182DfEf18681Bceda_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bbc4dab8193c546ab116e19863dff621_v3_1_3_0"
-            ] = JSONSchemaValidatorBbc4Dab8193C546AB116E19863Dff621_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bc33daf690ec5399a507829abfc4fe64_v3_1_3_0"
-            ] = JSONSchemaValidatorBc33Daf690Ec5399A507829Abfc4Fe64_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bc3cb471beaf5bfeb47201993c023068_v3_1_3_0"
-            ] = JSONSchemaValidatorBc3Cb471Beaf5BfeB47201993C023068_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bce8e6b307ce52dd8f5546fbd78e05ee_v3_1_3_0"
-            ] = JSONSchemaValidatorBce8E6B307Ce52Dd8F5546Fbd78E05Ee_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bd31fcbd1ecd5a2c8b812088b27bfcea_v3_1_3_0"
-            ] = JSONSchemaValidatorBd31Fcbd1Ecd5A2C8B812088B27Bfcea_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bd400dbef41e53ed82541c766f14f1eb_v3_1_3_0"
-            ] = JSONSchemaValidatorBd400DbeF41E53Ed82541C766F14F1Eb_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bdca1829ea705fa690922e3e0f8ff7b0_v3_1_3_0"
-            ] = JSONSchemaValidatorBdca1829Ea705Fa690922E3E0F8Ff7B0_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bdcb514ae33b571795e4a42147d11f87_v3_1_3_0"
-            ] = JSONSchemaValidatorBdcb514AE33B571795E4A42147D11F87_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bf40cea4982c54278a52ac2e7b0c458a_v3_1_3_0"
-            ] = JSONSchemaValidatorBf40Cea4982C54278A52Ac2E7B0C458A_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bfb1005f4d265f8bb340637175a5841f_v3_1_3_0"
-            ] = JSONSchemaValidatorBfb1005F4D265F8BB340637175A5841F_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_bfd1cc1403c951a99c0fcafd59eaabf3_v3_1_3_0"
-            ] = JSONSchemaValidatorBfd1Cc1403C951A99C0FCafd59Eaabf3_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c17432d928f755f8bb9f4edb83089d3e_v3_1_3_0"
-            ] = JSONSchemaValidatorC17432D928F755F8Bb9F4Edb83089D3E_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c1dae5c13e6959348fe1fe0652958647_v3_1_3_0"
-            ] = JSONSchemaValidatorC1Dae5C13E6959348Fe1Fe0652958647_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c1fa19f9295c50018132c6c9ebc3fc35_v3_1_3_0"
-            ] = JSONSchemaValidatorC1Fa19F9295C50018132C6C9Ebc3Fc35_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c524f0ec199e5435bcaee56b423532e7_v3_1_3_0"
-            ] = JSONSchemaValidatorC524F0Ec199E5435BcaeE56B423532E7_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c5c273290fae513da209ec2c9270e46d_v3_1_3_0"
-            ] = JSONSchemaValidatorC5C273290Fae513DA209Ec2C9270E46D_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c5f97865727857d5b1eeaedee3dcccd2_v3_1_3_0"
-            ] = JSONSchemaValidatorC5F97865727857D5B1EeAedee3Dcccd2_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c60312a923ee5a6fb3f2c725c32dc96f_v3_1_3_0"
-            ] = JSONSchemaValidatorC60312A923Ee5A6FB3F2C725C32Dc96F_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c6774ff9549a53d4b41fdd2d88f1d0f5_v3_1_3_0"
-            ] = JSONSchemaValidatorC6774Ff9549A53D4B41FDd2D88F1D0F5_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c7f28c3d23ba5384be5e769ae0505d00_v3_1_3_0"
-            ] = JSONSchemaValidatorC7F28C3D23Ba5384Be5E769Ae0505D00_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c85b39d6bae0536695992ddbb91ea96d_v3_1_3_0"
-            ] = JSONSchemaValidatorC85B39D6Bae0536695992Ddbb91Ea96D_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c880bc6a8faa5bb4afbfd6bea38c75fa_v3_1_3_0"
-            ] = JSONSchemaValidatorC880Bc6A8Faa5Bb4AfbfD6Bea38C75Fa_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c937494318f952ba92eaeb82b144c338_v3_1_3_0"
-            ] = JSONSchemaValidatorC937494318F952Ba92EaEb82B144C338_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c9b5b83e67195b649077a05e42897cc4_v3_1_3_0"
-            ] = JSONSchemaValidatorC9B5B83E67195B649077A05E42897Cc4_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_c9f995abc21b54e7860f66aef2ffbc85_v3_1_3_0"
-            ] = JSONSchemaValidatorC9F995AbC21B54E7860F66Aef2Ffbc85_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ca2fe989a227585086452d24d32867a6_v3_1_3_0"
-            ] = JSONSchemaValidatorCa2Fe989A227585086452D24D32867A6_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_cb38886d0236502783d431455e3fb880_v3_1_3_0"
-            ] = JSONSchemaValidatorCb38886D0236502783D431455E3Fb880_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_cc1599012a5a59c8abdda5376b5cc583_v3_1_3_0"
-            ] = JSONSchemaValidatorCc1599012A5A59C8AbddA5376B5Cc583_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_cc19241fd92f586c8986d4d5c99c3a88_v3_1_3_0"
-            ] = JSONSchemaValidatorCc19241FD92F586C8986D4D5C99C3A88_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ccbf614b4b355cac929f12cc61272c1c_v3_1_3_0"
-            ] = JSONSchemaValidatorCcbf614B4B355Cac929F12Cc61272C1C_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_cdf8c0d3866d5147901c0cf4821a84a7_v3_1_3_0"
-            ] = JSONSchemaValidatorCdf8C0D3866D5147901C0Cf4821A84A7_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_cec8139f6b1c5e5991d12197206029a0_v3_1_3_0"
-            ] = JSONSchemaValidatorCec8139F6B1C5E5991D12197206029A0_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_cf9d39cef5e95bb9bd48d5f86e094c99_v3_1_3_0"
-            ] = JSONSchemaValidatorCf9D39CeF5E95Bb9Bd48D5F86E094C99_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_cfadc5e4c912588389f4f63d2fb6e4ed_v3_1_3_0"
-            ] = JSONSchemaValidatorCfadc5E4C912588389F4F63D2Fb6E4Ed_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d02614492a2251c18de2e36c097e40ff_v3_1_3_0"
-            ] = JSONSchemaValidatorD02614492A2251C18De2E36C097E40Ff_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d045d18062ad5ae59c6f446beb17d675_v3_1_3_0"
-            ] = JSONSchemaValidatorD045D18062Ad5Ae59C6F446Beb17D675_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d05c763ada545fbe94a4c0391456b89f_v3_1_3_0"
-            ] = JSONSchemaValidatorD05C763ADa545Fbe94A4C0391456B89F_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d0aab00569b258b481afedc35e6db392_v3_1_3_0"
-            ] = JSONSchemaValidatorD0Aab00569B258B481AfEdc35E6Db392_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d0b2cc705afb536fab6fd0848baa73c0_v3_1_3_0"
-            ] = JSONSchemaValidatorD0B2Cc705Afb536FAb6FD0848Baa73C0_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d0e1021de57d5e95bbea5d5bd86b481a_v3_1_3_0"
-            ] = JSONSchemaValidatorD0E1021DE57D5E95Bbea5D5Bd86B481A_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d0f4d6b5909b5ecaa29e854e919b4221_v3_1_3_0"
-            ] = JSONSchemaValidatorD0F4D6B5909B5EcaA29E854E919B4221_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d1d42ef2f1895a82a2830bf1353e6baa_v3_1_3_0"
-            ] = JSONSchemaValidatorD1D42Ef2F1895A82A2830Bf1353E6Baa_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d2ea814bfae85da1b77872d095fc8221_v3_1_3_0"
-            ] = JSONSchemaValidatorD2Ea814BFae85Da1B77872D095Fc8221_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d413a3d054ac50fa921ca8cf7fdf5449_v3_1_3_0"
-            ] = JSONSchemaValidatorD413A3D054Ac50Fa921CA8Cf7Fdf5449_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d5c229546dc755f796dfcf34f1c2e290_v3_1_3_0"
-            ] = JSONSchemaValidatorD5C229546Dc755F796DfCf34F1C2E290_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d6451662bd1652e7bdc39053429e87a4_v3_1_3_0"
-            ] = JSONSchemaValidatorD6451662Bd1652E7Bdc39053429E87A4_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d69b1cfffdda5bd1828a5a89a262cbdd_v3_1_3_0"
-            ] = JSONSchemaValidatorD69B1CffFdda5Bd1828A5A89A262Cbdd_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d73fc407278f5eefa67e6a014aeaf742_v3_1_3_0"
-            ] = JSONSchemaValidatorD73Fc407278F5EefA67E6A014Aeaf742_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d825ae9a117f5b6bb65b7d78fd42513c_v3_1_3_0"
-            ] = JSONSchemaValidatorD825Ae9A117F5B6BB65B7D78Fd42513C_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d8fcd6dbb7ff53b58f7398c49b27ded2_v3_1_3_0"
-            ] = JSONSchemaValidatorD8Fcd6DbB7Ff53B58F7398C49B27Ded2_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d91a3aad0fd954e7a43aa3256ce433f6_v3_1_3_0"
-            ] = JSONSchemaValidatorD91A3Aad0Fd954E7A43AA3256Ce433F6_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d967a378b43457ad8c6a6de7bc1845d1_v3_1_3_0"
-            ] = JSONSchemaValidatorD967A378B43457Ad8C6A6De7Bc1845D1_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d9c01903d0645a3d8b56172bb9549be3_v3_1_3_0"
-            ] = JSONSchemaValidatorD9C01903D0645A3D8B56172Bb9549Be3_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_d9e3276d1ed3511b80b22ea8388959c8_v3_1_3_0"
-            ] = JSONSchemaValidatorD9E3276D1Ed3511B80B22Ea8388959C8_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_da24bdb30635515395471fe644cdc7b5_v3_1_3_0"
-            ] = JSONSchemaValidatorDa24Bdb30635515395471Fe644Cdc7B5_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_da455f4be5b75126ba9970c7cc54c7db_v3_1_3_0"
-            ] = JSONSchemaValidatorDa455F4BE5B75126Ba9970C7Cc54C7Db_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_da593242978c5047bb6b62b7f9475326_v3_1_3_0"
-            ] = JSONSchemaValidatorDa593242978C5047Bb6B62B7F9475326_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_db0f8e07ae0d5ecc83e34d29e5e57b41_v3_1_3_0"
-            ] = JSONSchemaValidatorDb0F8E07Ae0D5Ecc83E34D29E5E57B41_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_dc254215fdf25cd5b7ba797e8f8faebf_v3_1_3_0"
-            ] = JSONSchemaValidatorDc254215Fdf25Cd5B7Ba797E8F8Faebf_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_dc5d352dfaeb5b17800b0af2858c2f5c_v3_1_3_0"
-            ] = JSONSchemaValidatorDc5D352DFaeb5B17800B0Af2858C2F5C_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_dcc43be0514e50fea80cfa827f13ee5c_v3_1_3_0"
-            ] = JSONSchemaValidatorDcc43Be0514E50FeA80CFa827F13Ee5C_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_dda852745acd5ce5a97b0cfdf0de2fd2_v3_1_3_0"
-            ] = JSONSchemaValidatorDda852745Acd5Ce5A97B0Cfdf0De2Fd2_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_de1769e2886b5948b408100225b4a034_v3_1_3_0"
-            ] = JSONSchemaValidatorDe1769E2886B5948B408100225B4A034_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_de24de1222a4500cab78b4b34ee299f2_v3_1_3_0"
-            ] = JSONSchemaValidatorDe24De1222A4500CAb78B4B34Ee299F2_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_deb34387d0235811a90985711be9fe2e_v3_1_3_0"
-            ] = JSONSchemaValidatorDeb34387D0235811A90985711Be9Fe2E_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_dec1857f1585557eb39e12a9c93ef985_v3_1_3_0"
-            ] = JSONSchemaValidatorDec1857F1585557EB39E12A9C93Ef985_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ded95db0af275081801b54e0ce105c71_v3_1_3_0"
-            ] = JSONSchemaValidatorDed95Db0Af275081801B54E0Ce105C71_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_df26f516755a50b5b5477324cf5cb649_v3_1_3_0"
-            ] = JSONSchemaValidatorDf26F516755A50B5B5477324Cf5Cb649_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_df9ec5aa58815a849b4853b223343e5e_v3_1_3_0"
-            ] = JSONSchemaValidatorDf9Ec5Aa58815A849B4853B223343E5E_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_dfda5beca4cc5437876bff366493ebf0_v3_1_3_0"
-            ] = JSONSchemaValidatorDfda5BecA4Cc5437876BFf366493Ebf0_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e0c7b28d55c85d49a84c1403ca14bd5f_v3_1_3_0"
-            ] = JSONSchemaValidatorE0C7B28D55C85D49A84C1403Ca14Bd5F_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e11daa984f535a08bc1eb01bc84bc399_v3_1_3_0"
-            ] = JSONSchemaValidatorE11Daa984F535A08Bc1EB01Bc84Bc399_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e1781a990c6b5a4b895d56bcfda2b7cb_v3_1_3_0"
-            ] = JSONSchemaValidatorE1781A990C6B5A4B895D56Bcfda2B7Cb_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e1b8c435195d56368c24a54dcce007d0_v3_1_3_0"
-            ] = JSONSchemaValidatorE1B8C435195D56368C24A54Dcce007D0_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e2ec291c2e775df3895aadc639713eea_v3_1_3_0"
-            ] = JSONSchemaValidatorE2Ec291C2E775Df3895AAdc639713Eea_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e2f9718de3d050819cdc6355a3a43200_v3_1_3_0"
-            ] = JSONSchemaValidatorE2F9718DE3D050819Cdc6355A3A43200_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e328f7d015535897877f3ecb0c927453_v3_1_3_0"
-            ] = JSONSchemaValidatorE328F7D015535897877F3Ecb0C927453_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e3934b0fb68a5ff787e65e9b7c8e6296_v3_1_3_0"
-            ] = JSONSchemaValidatorE3934B0FB68A5Ff787E65E9B7C8E6296_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e3d7ad943d3a50fb8c3be7327669e557_v3_1_3_0"
-            ] = JSONSchemaValidatorE3D7Ad943D3A50Fb8C3BE7327669E557_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e3e170003d865b9a8d76cbe1d2f268be_v3_1_3_0"
-            ] = JSONSchemaValidatorE3E170003D865B9A8D76Cbe1D2F268Be_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e4a09bf566f35babad9e27f5eb61a86d_v3_1_3_0"
-            ] = JSONSchemaValidatorE4A09Bf566F35BabAd9E27F5Eb61A86D_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e4d083d956805f63b970be543c34eb0e_v3_1_3_0"
-            ] = JSONSchemaValidatorE4D083D956805F63B970Be543C34Eb0E_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e6c22549e5145c4892d0bd3b97614e07_v3_1_3_0"
-            ] = JSONSchemaValidatorE6C22549E5145C4892D0Bd3B97614E07_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e6eed78cb55d51a1bfe669729df25689_v3_1_3_0"
-            ] = JSONSchemaValidatorE6Eed78CB55D51A1Bfe669729Df25689_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e7af120721c7519a84b13bbe4a1a0362_v3_1_3_0"
-            ] = JSONSchemaValidatorE7Af120721C7519A84B13Bbe4A1A0362_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e8271b05b62c54609f74b4f2f373ad5a_v3_1_3_0"
-            ] = JSONSchemaValidatorE8271B05B62C54609F74B4F2F373Ad5A_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_e85b40c5ca055f4c82281617a8f95644_v3_1_3_0"
-            ] = JSONSchemaValidatorE85B40C5Ca055F4C82281617A8F95644_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ea4363569a9d58779c2bfc05b6e45423_v3_1_3_0"
-            ] = JSONSchemaValidatorEa4363569A9D58779C2BFc05B6E45423_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ea59df3daf2a57a0b48044cc49c8a1ca_v3_1_3_0"
-            ] = JSONSchemaValidatorEa59Df3DAf2A57A0B48044Cc49C8A1Ca_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ea5f116c0cd152bbb4a92c043738ea57_v3_1_3_0"
-            ] = JSONSchemaValidatorEa5F116C0Cd152BbB4A92C043738Ea57_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_eab4d187be085cac8a53971def40bee0_v3_1_3_0"
-            ] = JSONSchemaValidatorEab4D187Be085Cac8A53971Def40Bee0_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_eb4a05f61e475ad0b9e74f963f27ea1d_v3_1_3_0"
-            ] = JSONSchemaValidatorEb4A05F61E475Ad0B9E74F963F27Ea1D_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ecdb2d14c29b5bf3ad79ed2e3cc70715_v3_1_3_0"
-            ] = JSONSchemaValidatorEcdb2D14C29B5Bf3Ad79Ed2E3Cc70715_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ed266e6eda225aedbf581508635da822_v3_1_3_0"
-            ] = JSONSchemaValidatorEd266E6EDa225AedBf581508635Da822_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ed9125b257ea54b79ef2db2d8ebd9d00_v3_1_3_0"
-            ] = JSONSchemaValidatorEd9125B257Ea54B79Ef2Db2D8Ebd9D00_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_edf997bb4bcc5dd6baca80647d8a47ce_v3_1_3_0"
-            ] = JSONSchemaValidatorEdf997Bb4Bcc5Dd6Baca80647D8A47Ce_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_eeb595d249295989a4917261463ea82a_v3_1_3_0"
-            ] = JSONSchemaValidatorEeb595D249295989A4917261463Ea82A_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_eecf4323cb285985be72a7e061891059_v3_1_3_0"
-            ] = JSONSchemaValidatorEecf4323Cb285985Be72A7E061891059_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ef94c2c20ba15fd38e129ac75067de1e_v3_1_3_0"
-            ] = JSONSchemaValidatorEf94C2C20Ba15Fd38E129Ac75067De1E_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f08eb586113e597a91b1658297570934_v3_1_3_0"
-            ] = JSONSchemaValidatorF08Eb586113E597A91B1658297570934_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f0942fbb79f855e889d60777f41ea944_v3_1_3_0"
-            ] = JSONSchemaValidatorF0942Fbb79F855E889D60777F41Ea944_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f0f7b6e1e4e159e7a40001fc3e649dfc_v3_1_3_0"
-            ] = JSONSchemaValidatorF0F7B6E1E4E159E7A40001Fc3E649Dfc_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f15aaad792fc57fd89c880afc3b84dc4_v3_1_3_0"
-            ] = JSONSchemaValidatorF15Aaad792Fc57Fd89C880Afc3B84Dc4_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f200dc9a10d25beab1243a5b29f99c7d_v3_1_3_0"
-            ] = JSONSchemaValidatorF200Dc9A10D25BeaB1243A5B29F99C7D_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f20eecc6e2d95a03a9e8961cd4337467_v3_1_3_0"
-            ] = JSONSchemaValidatorF20Eecc6E2D95A03A9E8961Cd4337467_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f210ff2d89425b4790ce56f19da7be92_v3_1_3_0"
-            ] = JSONSchemaValidatorF210Ff2D89425B4790Ce56F19Da7Be92_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f325b2c7e429566ba5ed9ae8253b5bef_v3_1_3_0"
-            ] = JSONSchemaValidatorF325B2C7E429566BA5Ed9Ae8253B5Bef_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f667322836d5527482ad2100bec7feb4_v3_1_3_0"
-            ] = JSONSchemaValidatorF667322836D5527482Ad2100Bec7Feb4_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f6a4086c00f45dc5a634f0b8db5cdfd3_v3_1_3_0"
-            ] = JSONSchemaValidatorF6A4086C00F45Dc5A634F0B8Db5Cdfd3_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f6f9dde38ce458fcaf27ffd4f84bfe68_v3_1_3_0"
-            ] = JSONSchemaValidatorF6F9Dde38Ce458FcAf27Ffd4F84Bfe68_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f8b4842604b65658afb34b4f124db469_v3_1_3_0"
-            ] = JSONSchemaValidatorF8B4842604B65658Afb34B4F124Db469_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f924b4c27d18500b9b23df516b55c182_v3_1_3_0"
-            ] = JSONSchemaValidatorF924B4C27D18500B9B23Df516B55C182_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f9492367570c5f009cf8b5955790e87c_v3_1_3_0"
-            ] = JSONSchemaValidatorF9492367570C5F009Cf8B5955790E87C_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f95014e3b3385f21afa39325f3508427_v3_1_3_0"
-            ] = JSONSchemaValidatorF95014E3B3385F21Afa39325F3508427_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_f99c96c3a9b45ddaabc2c75ff8efa67f_v3_1_3_0"
-            ] = JSONSchemaValidatorF99C96C3A9B45DdaAbc2C75Ff8Efa67F_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_fa3975be5af25501abb40339d96917eb_v3_1_3_0"
-            ] = JSONSchemaValidatorFa3975Be5Af25501Abb40339D96917Eb_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_fa8fb3bdbffe5958858f20447dcb3ca5_v3_1_3_0"
-            ] = JSONSchemaValidatorFa8Fb3BdBffe5958858F20447Dcb3Ca5_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_fb5e152d4d3d59f5afd92f717f3a1eea_v3_1_3_0"
-            ] = JSONSchemaValidatorFb5E152D4D3D59F5Afd92F717F3A1Eea_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_fbdd94fbecd256c08e1d9f6e1a7657ac_v3_1_3_0"
-            ] = JSONSchemaValidatorFbdd94FbEcd256C08E1D9F6E1A7657Ac_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_fc416739f3c655ed911884aec0130e83_v3_1_3_0"
-            ] = JSONSchemaValidatorFc416739F3C655Ed911884Aec0130E83_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_fc8410781af357b6be17a2104ce5efb1_v3_1_3_0"
-            ] = JSONSchemaValidatorFc8410781Af357B6Be17A2104Ce5Efb1_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_fd488ff002115f3b8f0ee165e5347609_v3_1_3_0"
-            ] = JSONSchemaValidatorFd488Ff002115F3B8F0EE165E5347609_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_fdbe4ec3e9f252a988404dc94250b80d_v3_1_3_0"
-            ] = JSONSchemaValidatorFdbe4Ec3E9F252A988404Dc94250B80D_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_fdfc828270d950ecb75480fe03f7d573_v3_1_3_0"
-            ] = JSONSchemaValidatorFdfc828270D950EcB75480Fe03F7D573_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ff5bf5a67c6c5c0aa9e7ba84c088e1a6_v3_1_3_0"
-            ] = JSONSchemaValidatorFf5Bf5A67C6C5C0AA9E7Ba84C088E1A6_v3_1_3_0()
-            self.json_schema_validators[
-                "jsd_ffd2fefb57d5523c87a5d941eb93ddc3_v3_1_3_0"
-            ] = JSONSchemaValidatorFfd2Fefb57D5523C87A5D941Eb93Ddc3_v3_1_3_0()
-        if version == '3.1.6.0':
-            self.json_schema_validators['jsd_d5f8cf25475dc5be53f35357aca5a4_v3_1_6_0'] =\
-                JSONSchemaValidatorD5F8Cf25475Dc5Be53F35357Aca5A4_v3_1_6_0()
-            self.json_schema_validators['jsd_b2f15d0c54c2862a60a904289ddd_v3_1_6_0'] =\
-                JSONSchemaValidatorB2F15D0C54C2862A60A904289Ddd_v3_1_6_0()
-            self.json_schema_validators['jsd_e4d208b5545f66bf0f94a155c81f46_v3_1_6_0'] =\
-                JSONSchemaValidatorE4D208B5545F66Bf0F94A155C81F46_v3_1_6_0()
-            self.json_schema_validators['jsd_cd9d7d858f094469abf9464431f_v3_1_6_0'] =\
-                JSONSchemaValidatorCd9D7D858F094469Abf9464431F_v3_1_6_0()
-            self.json_schema_validators['jsd_bece53a182b45ffa4a1a435e_v3_1_6_0'] =\
-                JSONSchemaValidatorBece53A182B45Ffa4A1A435E_v3_1_6_0()
-            self.json_schema_validators['jsd_cdc0bafd4257e78d211a1f4120bfa9_v3_1_6_0'] =\
-                JSONSchemaValidatorCdc0BaFd4257E78D211A1F4120Bfa9_v3_1_6_0()
-            self.json_schema_validators['jsd_e22c99a82f5764828810acb45e7a9e_v3_1_6_0'] =\
-                JSONSchemaValidatorE22C99A82F5764828810Acb45E7A9E_v3_1_6_0()
-            self.json_schema_validators['jsd_cfb964a2958909f7ca12d23ab2bdb_v3_1_6_0'] =\
-                JSONSchemaValidatorCfb964A2958909F7CA12D23Ab2Bdb_v3_1_6_0()
-            self.json_schema_validators['jsd_c2a16208da55e8a615348ed3d530ac_v3_1_6_0'] =\
-                JSONSchemaValidatorC2A16208Da55E8A615348Ed3D530Ac_v3_1_6_0()
-            self.json_schema_validators['jsd_cca68e89d0545dac01a8c7a461ac6e_v3_1_6_0'] =\
-                JSONSchemaValidatorCca68E89D0545DAc01A8C7A461Ac6E_v3_1_6_0()
-            self.json_schema_validators['jsd_ee8590b6b45048b84e814161272bee_v3_1_6_0'] =\
-                JSONSchemaValidatorEe8590B6B45048B84E814161272Bee_v3_1_6_0()
-            self.json_schema_validators['jsd_bb7c52e5225e9398a006fecf4da06f_v3_1_6_0'] =\
-                JSONSchemaValidatorBb7C52E5225E9398A006Fecf4Da06F_v3_1_6_0()
-            self.json_schema_validators['jsd_d5da0365e31972173f015ed3614_v3_1_6_0'] =\
-                JSONSchemaValidatorD5DA0365E31972173F015Ed3614_v3_1_6_0()
-            self.json_schema_validators['jsd_97e350a7a690cdfeffa5eaca_v3_1_6_0'] =\
-                JSONSchemaValidator97E350A7A690Cdfeffa5Eaca_v3_1_6_0()
-            self.json_schema_validators['jsd_eec9550d3b5c9c9a10e65c3ef2fc2d_v3_1_6_0'] =\
-                JSONSchemaValidatorEec9550D3B5C9C9A10E65C3Ef2Fc2D_v3_1_6_0()
-            self.json_schema_validators['jsd_f57dc44184564cb97a6573a44ad394_v3_1_6_0'] =\
-                JSONSchemaValidatorF57Dc44184564CB97A6573A44Ad394_v3_1_6_0()
-            self.json_schema_validators['jsd_fd6083b0c65d03b2d53f10b3ece59d_v3_1_6_0'] =\
-                JSONSchemaValidatorFd6083B0C65D03B2D53F10B3Ece59D_v3_1_6_0()
-            self.json_schema_validators['jsd_a0a8d545698d1d59a9be90e51_v3_1_6_0'] =\
-                JSONSchemaValidatorA0A8D545698D1D59A9Be90E51_v3_1_6_0()
-            self.json_schema_validators['jsd_ecfe864dc5012ab9c25d23e2ce9f5_v3_1_6_0'] =\
-                JSONSchemaValidatorEcfe864Dc5012Ab9C25D23E2Ce9F5_v3_1_6_0()
-            self.json_schema_validators['jsd_fe8fb526f9b3b8f3c7aaeebac_v3_1_6_0'] =\
-                JSONSchemaValidatorFE8Fb526F9B3B8F3C7Aaeebac_v3_1_6_0()
-            self.json_schema_validators['jsd_d7073129453698264e7519d82991c_v3_1_6_0'] =\
-                JSONSchemaValidatorD7073129453698264E7519D82991C_v3_1_6_0()
-            self.json_schema_validators['jsd_f751cc2f55767b34e4c890b3fd36e_v3_1_6_0'] =\
-                JSONSchemaValidatorF751CC2F55767B34E4C890B3Fd36E_v3_1_6_0()
-            self.json_schema_validators['jsd_c90586f562b8fc0451b7e71b35a_v3_1_6_0'] =\
-                JSONSchemaValidatorC90586F562B8Fc0451B7E71B35A_v3_1_6_0()
-            self.json_schema_validators['jsd_f790a930d452708353c374f5c0f90f_v3_1_6_0'] =\
-                JSONSchemaValidatorF790A930D452708353C374F5C0F90F_v3_1_6_0()
-            self.json_schema_validators['jsd_a41ac8d894e5ee98fc9324fb8488174_v3_1_6_0'] =\
-                JSONSchemaValidatorA41Ac8D894E5Ee98Fc9324Fb8488174_v3_1_6_0()
-            self.json_schema_validators['jsd_a544e27e18e5412af3b68d915c8ca50_v3_1_6_0'] =\
-                JSONSchemaValidatorA544E27E18E5412Af3B68D915C8Ca50_v3_1_6_0()
-            self.json_schema_validators['jsd_af7031cc5ca5b44af0e6454d558412c_v3_1_6_0'] =\
-                JSONSchemaValidatorAf7031CC5Ca5B44Af0E6454D558412C_v3_1_6_0()
-            self.json_schema_validators['jsd_b9fbd53af6a5b46b34b17e601680801_v3_1_6_0'] =\
-                JSONSchemaValidatorB9Fbd53Af6A5B46B34B17E601680801_v3_1_6_0()
-            self.json_schema_validators['jsd_d999a1d36ee52babb6b619877dad734_v3_1_6_0'] =\
-                JSONSchemaValidatorD999A1D36Ee52BaBb6B619877Dad734_v3_1_6_0()
-            self.json_schema_validators['jsd_e86b65311b05d29ba5eea0d5f1fd88f_v3_1_6_0'] =\
-                JSONSchemaValidatorE86B65311B05D29Ba5EEa0D5F1Fd88F_v3_1_6_0()
-            self.json_schema_validators['jsd_f44ddd3c38c5a9484f5cb4e125447bc_v3_1_6_0'] =\
-                JSONSchemaValidatorF44Ddd3C38C5A9484F5Cb4E125447Bc_v3_1_6_0()
-            self.json_schema_validators['jsd_cd16daa50533eb0f5873b7601abb2_v3_1_6_0'] =\
-                JSONSchemaValidatorCd16DAa50533EB0F5873B7601Abb2_v3_1_6_0()
-            self.json_schema_validators['jsd_c7266d89581c9601b79b7304fda3_v3_1_6_0'] =\
-                JSONSchemaValidatorC7266D89581C9601B79B7304Fda3_v3_1_6_0()
-            self.json_schema_validators['jsd_ce6c2c14553f9a4a88f66a04c21c4_v3_1_6_0'] =\
-                JSONSchemaValidatorCe6C2C14553F9A4A88F66A04C21C4_v3_1_6_0()
-            self.json_schema_validators['jsd_e5bb87a955e33a7ee46f1085fd880_v3_1_6_0'] =\
-                JSONSchemaValidatorE5Bb87A955E33A7Ee46F1085Fd880_v3_1_6_0()
-            self.json_schema_validators['jsd_d76a951f85a7a927afc2f1ea935c8_v3_1_6_0'] =\
-                JSONSchemaValidatorD76A951F85A7A927AFc2F1Ea935C8_v3_1_6_0()
-            self.json_schema_validators['jsd_ee7664344f50cb8f2c94beaa01629d_v3_1_6_0'] =\
-                JSONSchemaValidatorEe7664344F50Cb8F2C94Beaa01629D_v3_1_6_0()
-            self.json_schema_validators['jsd_f2c49c69c53e7b4f57f2af9a6f597_v3_1_6_0'] =\
-                JSONSchemaValidatorF2C49C69C53E7B4F57F2Af9A6F597_v3_1_6_0()
-            self.json_schema_validators['jsd_e1a76c121857a085149e62e56caadd_v3_1_6_0'] =\
-                JSONSchemaValidatorE1A76C121857A085149E62E56Caadd_v3_1_6_0()
-            self.json_schema_validators['jsd_ca2f659b595c0ba7c649fd8c8bdad6_v3_1_6_0'] =\
-                JSONSchemaValidatorCa2F659B595C0BA7C649Fd8C8Bdad6_v3_1_6_0()
-            self.json_schema_validators['jsd_a4dab79d54829548004029a91ba1_v3_1_6_0'] =\
-                JSONSchemaValidatorA4DaB79D54829548004029A91Ba1_v3_1_6_0()
-            self.json_schema_validators['jsd_f5a13405ba69f3957b98db8663a_v3_1_6_0'] =\
-                JSONSchemaValidatorF5A13405Ba69F3957B98Db8663A_v3_1_6_0()
-            self.json_schema_validators['jsd_6ce35f19bc4c1d058aa01536_v3_1_6_0'] =\
-                JSONSchemaValidator6Ce35F19Bc4C1D058Aa01536_v3_1_6_0()
-            self.json_schema_validators['jsd_b107800544384c1ddad7b60c237_v3_1_6_0'] =\
-                JSONSchemaValidatorB107800544384C1Ddad7B60C237_v3_1_6_0()
-            self.json_schema_validators['jsd_a3954b27e5eeb82789ed231e0557f_v3_1_6_0'] =\
-                JSONSchemaValidatorA3954B27E5Eeb82789Ed231E0557F_v3_1_6_0()
-            self.json_schema_validators['jsd_e3a724a35854758d65a83823c88435_v3_1_6_0'] =\
-                JSONSchemaValidatorE3A724A35854758D65A83823C88435_v3_1_6_0()
-            self.json_schema_validators['jsd_d7b57050bdb98e9340d0bc4dba_v3_1_6_0'] =\
-                JSONSchemaValidatorD7B57050BdB98E9340D0Bc4Dba_v3_1_6_0()
-            self.json_schema_validators['jsd_a2131eae5c1d8e73cd55eebf6a83_v3_1_6_0'] =\
-                JSONSchemaValidatorA2131Eae5C1D8E73Cd55Eebf6A83_v3_1_6_0()
-            self.json_schema_validators['jsd_ff99068551d588a7aeb33c28dff0_v3_1_6_0'] =\
-                JSONSchemaValidatorFf99068551D588A7Aeb33C28Dff0_v3_1_6_0()
-            self.json_schema_validators['jsd_f21b7552158e889b51d0c109c15db_v3_1_6_0'] =\
-                JSONSchemaValidatorF21B7552158E889B51D0C109C15Db_v3_1_6_0()
-            self.json_schema_validators['jsd_f2562a2d8e5ec287738032961762ed_v3_1_6_0'] =\
-                JSONSchemaValidatorF2562A2D8E5Ec287738032961762Ed_v3_1_6_0()
-            self.json_schema_validators['jsd_f256e33af7501a8bdae2742ca9f6d6_v3_1_6_0'] =\
-                JSONSchemaValidatorF256E33Af7501A8BdaE2742Ca9F6D6_v3_1_6_0()
-            self.json_schema_validators['jsd_af13df5f57e523e9da74929b0dc587e_v3_1_6_0'] =\
-                JSONSchemaValidatorAf13Df5F57E523E9Da74929B0Dc587E_v3_1_6_0()
-            self.json_schema_validators['jsd_b269afaaa855d3291b825f724fc8ea9_v3_1_6_0'] =\
-                JSONSchemaValidatorB269AfaAa855D3291B825F724Fc8Ea9_v3_1_6_0()
-            self.json_schema_validators['jsd_b3323a24b275402b97c7e9ccfd78c91_v3_1_6_0'] =\
-                JSONSchemaValidatorB3323A24B275402B97C7E9Ccfd78C91_v3_1_6_0()
-            self.json_schema_validators['jsd_bfab2e1d87654afb88c77fcfae4e407_v3_1_6_0'] =\
-                JSONSchemaValidatorBfab2E1D87654AfB88C77Fcfae4E407_v3_1_6_0()
-            self.json_schema_validators['jsd_ca519342eb25dfcaf15f8f44baf0ee0_v3_1_6_0'] =\
-                JSONSchemaValidatorCa519342Eb25DfcAf15F8F44Baf0Ee0_v3_1_6_0()
-            self.json_schema_validators['jsd_cc239fa9b185ecbab9e306289850a63_v3_1_6_0'] =\
-                JSONSchemaValidatorCc239Fa9B185EcbAb9E306289850A63_v3_1_6_0()
-            self.json_schema_validators['jsd_ccbaf226c685cacac29eb345955f3ad_v3_1_6_0'] =\
-                JSONSchemaValidatorCcbaf226C685CacAc29Eb345955F3Ad_v3_1_6_0()
-            self.json_schema_validators['jsd_d1845268faf55f98bc952872259f16f_v3_1_6_0'] =\
-                JSONSchemaValidatorD1845268Faf55F98Bc952872259F16F_v3_1_6_0()
-            self.json_schema_validators['jsd_d9bd7c527d254ecb63d2b709c428043_v3_1_6_0'] =\
-                JSONSchemaValidatorD9Bd7C527D254EcB63D2B709C428043_v3_1_6_0()
-            self.json_schema_validators['jsd_e5e51bcda0b5fec984ba8120f743fe2_v3_1_6_0'] =\
-                JSONSchemaValidatorE5E51BcDa0B5Fec984BA8120F743Fe2_v3_1_6_0()
-            self.json_schema_validators['jsd_efc2269ee565e23b7be7b49e4fc0322_v3_1_6_0'] =\
-                JSONSchemaValidatorEfc2269Ee565E23B7Be7B49E4Fc0322_v3_1_6_0()
-            self.json_schema_validators['jsd_f77386a48895fa59dcddcc7dd4addb5_v3_1_6_0'] =\
-                JSONSchemaValidatorF77386A48895Fa59DcdDcc7Dd4Addb5_v3_1_6_0()
-            self.json_schema_validators['jsd_ffa347eb411567a9c793696795250a5_v3_1_6_0'] =\
-                JSONSchemaValidatorFfa347EB411567A9C793696795250A5_v3_1_6_0()
-            self.json_schema_validators['jsd_ffcaccdd9f2530abf66adc98c3f0201_v3_1_6_0'] =\
-                JSONSchemaValidatorFfcaccdD9F2530ABf66Adc98C3F0201_v3_1_6_0()
-            self.json_schema_validators['jsd_b9be51e25efc9f41d4f68451f9a6_v3_1_6_0'] =\
-                JSONSchemaValidatorB9Be51E25Efc9F41D4F68451F9A6_v3_1_6_0()
-            self.json_schema_validators['jsd_c765afc72581d862cd61f5139d224_v3_1_6_0'] =\
-                JSONSchemaValidatorC765AFc72581D862CD61F5139D224_v3_1_6_0()
-            self.json_schema_validators['jsd_bf80823752baba63a8849fd521cd_v3_1_6_0'] =\
-                JSONSchemaValidatorBf80823752BaBa63A8849Fd521Cd_v3_1_6_0()
-            self.json_schema_validators['jsd_d833c51c4f5cd2879d3e69f773295c_v3_1_6_0'] =\
-                JSONSchemaValidatorD833C51C4F5Cd2879D3E69F773295C_v3_1_6_0()
-            self.json_schema_validators['jsd_fa310ab095148bdb00d7d3d5e1676_v3_1_6_0'] =\
-                JSONSchemaValidatorFa310Ab095148Bdb00D7D3D5E1676_v3_1_6_0()
-            self.json_schema_validators['jsd_a9136d5513985f15e91a19da66c_v3_1_6_0'] =\
-                JSONSchemaValidatorA9136D5513985F15E91A19Da66C_v3_1_6_0()
-            self.json_schema_validators['jsd_b887c55faaca726bbe4ac2564_v3_1_6_0'] =\
-                JSONSchemaValidatorB887C55FaAca726Bbe4Ac2564_v3_1_6_0()
-            self.json_schema_validators['jsd_438d5b72acb418347ec1e1fa_v3_1_6_0'] =\
-                JSONSchemaValidator438D5B72Acb418347Ec1E1Fa_v3_1_6_0()
-            self.json_schema_validators['jsd_f90ae8599c8a21c98b7a1ca804_v3_1_6_0'] =\
-                JSONSchemaValidatorF90Ae8599C8A21C98B7A1Ca804_v3_1_6_0()
-            self.json_schema_validators['jsd_a94058a99acaaf8eb73c9227_v3_1_6_0'] =\
-                JSONSchemaValidatorA94058A99AcaAf8Eb73C9227_v3_1_6_0()
-            self.json_schema_validators['jsd_cfb1d6e52878d057740de275896_v3_1_6_0'] =\
-                JSONSchemaValidatorCfb1D6E52878D057740De275896_v3_1_6_0()
-            self.json_schema_validators['jsd_a4829a44597bbf9813664eb75de0_v3_1_6_0'] =\
-                JSONSchemaValidatorA4829A44597BBf9813664Eb75De0_v3_1_6_0()
-            self.json_schema_validators['jsd_b8b02e13a5281934aecf58df4682d_v3_1_6_0'] =\
-                JSONSchemaValidatorB8B02E13A5281934AEcf58Df4682D_v3_1_6_0()
-            self.json_schema_validators['jsd_bdc981805b5fad0a038966d52558_v3_1_6_0'] =\
-                JSONSchemaValidatorBdc981805B5FAd0A038966D52558_v3_1_6_0()
-            self.json_schema_validators['jsd_df9908ad265e83ab77d73803925678_v3_1_6_0'] =\
-                JSONSchemaValidatorDf9908Ad265E83Ab77D73803925678_v3_1_6_0()
-            self.json_schema_validators['jsd_e37e7d81575d35a974df797e0a2268_v3_1_6_0'] =\
-                JSONSchemaValidatorE37E7D81575D35A974Df797E0A2268_v3_1_6_0()
-            self.json_schema_validators['jsd_a924f763a15125a8d5beaa6dd6fa2c_v3_1_6_0'] =\
-                JSONSchemaValidatorA924F763A15125A8D5Beaa6Dd6Fa2C_v3_1_6_0()
-            self.json_schema_validators['jsd_de4c9b685250dfa8556ab1ec20407c_v3_1_6_0'] =\
-                JSONSchemaValidatorDe4C9B685250DfA8556Ab1Ec20407C_v3_1_6_0()
-            self.json_schema_validators['jsd_a15a2f83f975a6a9964e7da79a605de_v3_1_6_0'] =\
-                JSONSchemaValidatorA15A2F83F975A6A9964E7Da79A605De_v3_1_6_0()
-            self.json_schema_validators['jsd_a3a1bf404bf5772828f66f1e10f074d_v3_1_6_0'] =\
-                JSONSchemaValidatorA3A1Bf404Bf5772828F66F1E10F074D_v3_1_6_0()
-            self.json_schema_validators['jsd_a7283357c1657bf8ccb3d32a96249d4_v3_1_6_0'] =\
-                JSONSchemaValidatorA7283357C1657Bf8Ccb3D32A96249D4_v3_1_6_0()
-            self.json_schema_validators['jsd_b4635c45c3b5e44a30d84daa1d5fb69_v3_1_6_0'] =\
-                JSONSchemaValidatorB4635C45C3B5E44A30D84Daa1D5Fb69_v3_1_6_0()
-            self.json_schema_validators['jsd_b60f9f312235959812d49dc4c469e83_v3_1_6_0'] =\
-                JSONSchemaValidatorB60F9F312235959812D49Dc4C469E83_v3_1_6_0()
-            self.json_schema_validators['jsd_bb01b6bd31b53bfb12bbe327320392e_v3_1_6_0'] =\
-                JSONSchemaValidatorBb01B6BD31B53BfB12BBe327320392E_v3_1_6_0()
-            self.json_schema_validators['jsd_c224ae3007d5486bbc5abb1f88e95e6_v3_1_6_0'] =\
-                JSONSchemaValidatorC224Ae3007D5486Bbc5Abb1F88E95E6_v3_1_6_0()
-            self.json_schema_validators['jsd_d9ed5bba1155b9c8fe132640832f94e_v3_1_6_0'] =\
-                JSONSchemaValidatorD9Ed5BbA1155B9C8Fe132640832F94E_v3_1_6_0()
-            self.json_schema_validators['jsd_d9f276a532e5eeb86bb591f8537fcc7_v3_1_6_0'] =\
-                JSONSchemaValidatorD9F276A532E5Eeb86Bb591F8537Fcc7_v3_1_6_0()
-            self.json_schema_validators['jsd_e69d02d71905aecbd10b782469efbda_v3_1_6_0'] =\
-                JSONSchemaValidatorE69D02D71905AecBd10B782469Efbda_v3_1_6_0()
-            self.json_schema_validators['jsd_e722e05046d5262b55c125237e9b67d_v3_1_6_0'] =\
-                JSONSchemaValidatorE722E05046D5262B55C125237E9B67D_v3_1_6_0()
-            self.json_schema_validators['jsd_e9c39175d785a0eb9d6f402f378a2ba_v3_1_6_0'] =\
-                JSONSchemaValidatorE9C39175D785A0EB9D6F402F378A2Ba_v3_1_6_0()
-            self.json_schema_validators['jsd_d77719c37558f694e5545a21406275_v3_1_6_0'] =\
-                JSONSchemaValidatorD77719C37558F694E5545A21406275_v3_1_6_0()
-            self.json_schema_validators['jsd_d9a13d575abdc26d485af708e7_v3_1_6_0'] =\
-                JSONSchemaValidatorD9A13D575ABdc26D485Af708E7_v3_1_6_0()
-            self.json_schema_validators['jsd_c7315d78a2ddda76b62777e8_v3_1_6_0'] =\
-                JSONSchemaValidatorC7315D78A2DdDa76B62777E8_v3_1_6_0()
-            self.json_schema_validators['jsd_c279ba052250d883ef87775a415089_v3_1_6_0'] =\
-                JSONSchemaValidatorC279Ba052250D883Ef87775A415089_v3_1_6_0()
-            self.json_schema_validators['jsd_af893464e53d2abc8922f4f3310ea_v3_1_6_0'] =\
-                JSONSchemaValidatorAf893464E53D2Abc8922F4F3310Ea_v3_1_6_0()
-            self.json_schema_validators['jsd_d2bd5f05bd535a89ebadb30e2ede9e_v3_1_6_0'] =\
-                JSONSchemaValidatorD2Bd5F05Bd535A89EbAdb30E2Ede9E_v3_1_6_0()
-            self.json_schema_validators['jsd_f33d768d01586c9133b155da5e5ade_v3_1_6_0'] =\
-                JSONSchemaValidatorF33D768D01586C9133B155Da5E5Ade_v3_1_6_0()
-            self.json_schema_validators['jsd_f624469d5e448e9eba137fe533e8_v3_1_6_0'] =\
-                JSONSchemaValidatorF624469D5E448E9EBa137Fe533E8_v3_1_6_0()
-            self.json_schema_validators['jsd_d2ece28b509b8ef80b2b8c5c5f36_v3_1_6_0'] =\
-                JSONSchemaValidatorD2EcE28B509B8Ef80B2B8C5C5F36_v3_1_6_0()
-            self.json_schema_validators['jsd_e31c795964b3bdf85da1b5a2a5_v3_1_6_0'] =\
-                JSONSchemaValidatorE31C795964B3BdF85Da1B5A2A5_v3_1_6_0()
-            self.json_schema_validators['jsd_dabd13cd5e9c928daf80d6758d62_v3_1_6_0'] =\
-                JSONSchemaValidatorDabd13Cd5E9C928DAf80D6758D62_v3_1_6_0()
-            self.json_schema_validators['jsd_b46a141650debf5946262e8a0961_v3_1_6_0'] =\
-                JSONSchemaValidatorB46A141650DeBf5946262E8A0961_v3_1_6_0()
-            self.json_schema_validators['jsd_b8699619f95a24bd2d81f12f048235_v3_1_6_0'] =\
-                JSONSchemaValidatorB8699619F95A24Bd2D81F12F048235_v3_1_6_0()
-            self.json_schema_validators['jsd_c00df3623b5a74ad41e75487ed9b77_v3_1_6_0'] =\
-                JSONSchemaValidatorC00Df3623B5A74Ad41E75487Ed9B77_v3_1_6_0()
-            self.json_schema_validators['jsd_cf0138550909ea413dab063868c_v3_1_6_0'] =\
-                JSONSchemaValidatorCf0138550909Ea413Dab063868C_v3_1_6_0()
-            self.json_schema_validators['jsd_a64bd4956649de3a61e10f0637e_v3_1_6_0'] =\
-                JSONSchemaValidatorA64Bd4956649De3A61E10F0637E_v3_1_6_0()
-            self.json_schema_validators['jsd_bc1f37a9f2571fa4d7bc85b9e8a583_v3_1_6_0'] =\
-                JSONSchemaValidatorBc1F37A9F2571FA4D7Bc85B9E8A583_v3_1_6_0()
-            self.json_schema_validators['jsd_e70de44247549f9e49cfa5c6b24de9_v3_1_6_0'] =\
-                JSONSchemaValidatorE70De44247549F9E49Cfa5C6B24De9_v3_1_6_0()
-            self.json_schema_validators['jsd_a88c7510a15578b8eb2df183a92d5d_v3_1_6_0'] =\
-                JSONSchemaValidatorA88C7510A15578B8Eb2Df183A92D5D_v3_1_6_0()
-            self.json_schema_validators['jsd_febb2149ac5f8ba25dbf4d9a862d94_v3_1_6_0'] =\
-                JSONSchemaValidatorFebb2149Ac5F8BA25DBf4D9A862D94_v3_1_6_0()
-            self.json_schema_validators['jsd_cad522e57a7b96b7238935689ed_v3_1_6_0'] =\
-                JSONSchemaValidatorCad522E57A7B96B7238935689Ed_v3_1_6_0()
-            self.json_schema_validators['jsd_e702d5786552992aa76b930780569_v3_1_6_0'] =\
-                JSONSchemaValidatorE702D5786552992Aa76B930780569_v3_1_6_0()
-            self.json_schema_validators['jsd_cb98464ddb5ee9ba7ebb4428443ba9_v3_1_6_0'] =\
-                JSONSchemaValidatorCb98464Ddb5Ee9Ba7EBb4428443Ba9_v3_1_6_0()
-            self.json_schema_validators['jsd_d292147221524a96616d982b0147c0_v3_1_6_0'] =\
-                JSONSchemaValidatorD292147221524A96616D982B0147C0_v3_1_6_0()
-            self.json_schema_validators['jsd_af29516f0c8591da2a92523b5ab3386_v3_1_6_0'] =\
-                JSONSchemaValidatorAf29516F0C8591DA2A92523B5Ab3386_v3_1_6_0()
-            self.json_schema_validators['jsd_bc9716ed6eb5c6e9ecb0380501d6138_v3_1_6_0'] =\
-                JSONSchemaValidatorBc9716ED6Eb5C6E9Ecb0380501D6138_v3_1_6_0()
-            self.json_schema_validators['jsd_caeb723a074519498c6b08a1c9dacb3_v3_1_6_0'] =\
-                JSONSchemaValidatorCaeb723A074519498C6B08A1C9Dacb3_v3_1_6_0()
-            self.json_schema_validators['jsd_da35060d4a15da8b4c7d9176408ca1e_v3_1_6_0'] =\
-                JSONSchemaValidatorDa35060D4A15Da8B4C7D9176408Ca1E_v3_1_6_0()
-            self.json_schema_validators['jsd_de92f8ae3c15ea0bad5562452eb5c40_v3_1_6_0'] =\
-                JSONSchemaValidatorDe92F8AE3C15Ea0Bad5562452Eb5C40_v3_1_6_0()
-            self.json_schema_validators['jsd_f09c94c65c858e4b7be0b7cb3d25b7a_v3_1_6_0'] =\
-                JSONSchemaValidatorF09C94C65C858E4B7Be0B7Cb3D25B7A_v3_1_6_0()
-            self.json_schema_validators['jsd_f25c825ca6e58a5b1c2294b11558e7b_v3_1_6_0'] =\
-                JSONSchemaValidatorF25C825Ca6E58A5B1C2294B11558E7B_v3_1_6_0()
-            self.json_schema_validators['jsd_c6506b22335101a465d2adf5ca7f37_v3_1_6_0'] =\
-                JSONSchemaValidatorC6506B22335101A465D2Adf5Ca7F37_v3_1_6_0()
-            self.json_schema_validators['jsd_e0ed6b9a530ea05d77a199ded4e3_v3_1_6_0'] =\
-                JSONSchemaValidatorE0Ed6B9A530EA05D77A199Ded4E3_v3_1_6_0()
-            self.json_schema_validators['jsd_a2be6dde4c587389e79d6cb84e54a6_v3_1_6_0'] =\
-                JSONSchemaValidatorA2Be6DDe4C587389E79D6Cb84E54A6_v3_1_6_0()
-            self.json_schema_validators['jsd_ad0cb5a12a76384ba4644e55e_v3_1_6_0'] =\
-                JSONSchemaValidatorAD0Cb5A12A76384Ba4644E55E_v3_1_6_0()
-            self.json_schema_validators['jsd_fdd2af215b9b8327a3e24a3dea89_v3_1_6_0'] =\
-                JSONSchemaValidatorFdd2Af215B9B8327A3E24A3Dea89_v3_1_6_0()
-            self.json_schema_validators['jsd_d0456ad1d5bda99f7d9254f8a1ec3_v3_1_6_0'] =\
-                JSONSchemaValidatorD0456Ad1D5Bda99F7D9254F8A1Ec3_v3_1_6_0()
-            self.json_schema_validators['jsd_f71d0b2527b8cd13123f9a68cf3_v3_1_6_0'] =\
-                JSONSchemaValidatorF71D0B2527B8Cd13123F9A68Cf3_v3_1_6_0()
-            self.json_schema_validators['jsd_fee1860b4d509585956565df54a91a_v3_1_6_0'] =\
-                JSONSchemaValidatorFee1860B4D509585956565Df54A91A_v3_1_6_0()
-            self.json_schema_validators['jsd_dfe3872e591f9f3e2a0daa358c1a_v3_1_6_0'] =\
-                JSONSchemaValidatorDfe3872E591F9F3E2A0Daa358C1A_v3_1_6_0()
-            self.json_schema_validators['jsd_b42a01655325be161ab2ad60aa68_v3_1_6_0'] =\
-                JSONSchemaValidatorB42A01655325Be161Ab2Ad60Aa68_v3_1_6_0()
-            self.json_schema_validators['jsd_fe62979a925778bdb0a974a7d86a12_v3_1_6_0'] =\
-                JSONSchemaValidatorFe62979A925778Bdb0A974A7D86A12_v3_1_6_0()
-            self.json_schema_validators['jsd_ae10ec6705f368476f7b35918122c_v3_1_6_0'] =\
-                JSONSchemaValidatorAe10EC6705F368476F7B35918122C_v3_1_6_0()
-            self.json_schema_validators['jsd_a602eee5a56faa64436bade8a240e_v3_1_6_0'] =\
-                JSONSchemaValidatorA602EEe5A56FaA64436Bade8A240E_v3_1_6_0()
-            self.json_schema_validators['jsd_e6ea8c5d425cf9ac77006f5593725f_v3_1_6_0'] =\
-                JSONSchemaValidatorE6Ea8C5D425Cf9Ac77006F5593725F_v3_1_6_0()
-            self.json_schema_validators['jsd_bcb1d489d735258975828f845df1769_v3_1_6_0'] =\
-                JSONSchemaValidatorBcb1D489D735258975828F845Df1769_v3_1_6_0()
-            self.json_schema_validators['jsd_bd5b507f58a50aab614e3d7409eec4c_v3_1_6_0'] =\
-                JSONSchemaValidatorBd5B507F58A50AaB614E3D7409Eec4C_v3_1_6_0()
-            self.json_schema_validators['jsd_c05f721266f5264869d10ac0e663812_v3_1_6_0'] =\
-                JSONSchemaValidatorC05F721266F5264869D10Ac0E663812_v3_1_6_0()
-            self.json_schema_validators['jsd_db690b800995e35bc4e8c43d8ea6c18_v3_1_6_0'] =\
-                JSONSchemaValidatorDb690B800995E35Bc4E8C43D8Ea6C18_v3_1_6_0()
-            self.json_schema_validators['jsd_dfc7c061f9259ee891e60fd91235129_v3_1_6_0'] =\
-                JSONSchemaValidatorDfc7C061F9259Ee891E60Fd91235129_v3_1_6_0()
-            self.json_schema_validators['jsd_e235d44e4485bafa4499f5a8e53bcd3_v3_1_6_0'] =\
-                JSONSchemaValidatorE235D44E4485BafA4499F5A8E53Bcd3_v3_1_6_0()
-            self.json_schema_validators['jsd_e4f91ea42515ccdbc24549b84ca1e90_v3_1_6_0'] =\
-                JSONSchemaValidatorE4F91Ea42515CcdBc24549B84Ca1E90_v3_1_6_0()
-            self.json_schema_validators['jsd_efa7f7a97b95f5885a00e6981b27b11_v3_1_6_0'] =\
-                JSONSchemaValidatorEfa7F7A97B95F5885A00E6981B27B11_v3_1_6_0()
-            self.json_schema_validators['jsd_f5d13316c8f53a0b78d881c738a15c6_v3_1_6_0'] =\
-                JSONSchemaValidatorF5D13316C8F53A0B78D881C738A15C6_v3_1_6_0()
-            self.json_schema_validators['jsd_f829d3e99565937b9d12c873f8faa46_v3_1_6_0'] =\
-                JSONSchemaValidatorF829D3E99565937B9D12C873F8Faa46_v3_1_6_0()
-            self.json_schema_validators['jsd_f8db651a7bb5f85a936c9fdadf3a9d9_v3_1_6_0'] =\
-                JSONSchemaValidatorF8Db651A7Bb5F85A936C9Fdadf3A9D9_v3_1_6_0()
-            self.json_schema_validators['jsd_bbf7ce025bc2a291b90c37a6b898_v3_1_6_0'] =\
-                JSONSchemaValidatorBbf7Ce025Bc2A291B90C37A6B898_v3_1_6_0()
-            self.json_schema_validators['jsd_b2c5c14bd5ecba26b364716a91731_v3_1_6_0'] =\
-                JSONSchemaValidatorB2C5C14Bd5EcbA26B364716A91731_v3_1_6_0()
-            self.json_schema_validators['jsd_effb55c158f28469762804e84633_v3_1_6_0'] =\
-                JSONSchemaValidatorEffb55C158F28469762804E84633_v3_1_6_0()
-            self.json_schema_validators['jsd_fa2127b55124a3a00b2991b77db6_v3_1_6_0'] =\
-                JSONSchemaValidatorFa2127B55124A3A00B2991B77Db6_v3_1_6_0()
-            self.json_schema_validators['jsd_b8a44ba454de8a7bb52d3efe97ca_v3_1_6_0'] =\
-                JSONSchemaValidatorB8A44Ba454De8A7BB52D3Efe97Ca_v3_1_6_0()
-            self.json_schema_validators['jsd_e0b654c39dc6e19cd6f5194d_v3_1_6_0'] =\
-                JSONSchemaValidatorE0B654C39Dc6E19Cd6F5194D_v3_1_6_0()
-            self.json_schema_validators['jsd_b3ff5f865f1c8122a0ec8ca73921_v3_1_6_0'] =\
-                JSONSchemaValidatorB3Ff5F865F1C8122A0Ec8Ca73921_v3_1_6_0()
-            self.json_schema_validators['jsd_de1b75d59b083df0ece12259ecd_v3_1_6_0'] =\
-                JSONSchemaValidatorDe1B75D59B083Df0Ece12259Ecd_v3_1_6_0()
-            self.json_schema_validators['jsd_fc95c917352ad8410ffe6d6e522ed_v3_1_6_0'] =\
-                JSONSchemaValidatorFc95C917352Ad8410Ffe6D6E522Ed_v3_1_6_0()
-            self.json_schema_validators['jsd_ae7f02a3d051f2baf7cc087990d658_v3_1_6_0'] =\
-                JSONSchemaValidatorAe7F02A3D051F2Baf7Cc087990D658_v3_1_6_0()
-            self.json_schema_validators['jsd_c0204c665262a712caef988d7d88_v3_1_6_0'] =\
-                JSONSchemaValidatorC0204C665262A712Caef988D7D88_v3_1_6_0()
-            self.json_schema_validators['jsd_f50f8c552f5d2eb68d715e1318976e_v3_1_6_0'] =\
-                JSONSchemaValidatorF50F8C552F5D2EB68D715E1318976E_v3_1_6_0()
-            self.json_schema_validators['jsd_d9227adc5f02b7cd264af7255d19_v3_1_6_0'] =\
-                JSONSchemaValidatorD9227Adc5F02B7Cd264Af7255D19_v3_1_6_0()
-            self.json_schema_validators['jsd_de4a255bc6849a7c9cec69f13c_v3_1_6_0'] =\
-                JSONSchemaValidatorDe4A255Bc6849A7C9Cec69F13C_v3_1_6_0()
-            self.json_schema_validators['jsd_fdfba50738387ab89bede6252_v3_1_6_0'] =\
-                JSONSchemaValidatorFDfba50738387Ab89Bede6252_v3_1_6_0()
-            self.json_schema_validators['jsd_e6ec627d3c587288978990aae75228_v3_1_6_0'] =\
-                JSONSchemaValidatorE6Ec627D3C587288978990Aae75228_v3_1_6_0()
-            self.json_schema_validators['jsd_d58baa26bd5a6d9c461592c872d515_v3_1_6_0'] =\
-                JSONSchemaValidatorD58Baa26Bd5A6D9C461592C872D515_v3_1_6_0()
-            self.json_schema_validators['jsd_eb1227bb250799b6ca76ed4bee9d9_v3_1_6_0'] =\
-                JSONSchemaValidatorEb1227Bb250799B6CA76Ed4Bee9D9_v3_1_6_0()
-            self.json_schema_validators['jsd_c380301e3e05423bdc1857ff00ae77a_v3_1_6_0'] =\
-                JSONSchemaValidatorC380301E3E05423Bdc1857Ff00Ae77A_v3_1_6_0()
-            self.json_schema_validators['jsd_c8354b61a36524cbb2e1037bd814807_v3_1_6_0'] =\
-                JSONSchemaValidatorC8354B61A36524CBb2E1037Bd814807_v3_1_6_0()
-            self.json_schema_validators['jsd_f1debbfd4775faba3779c513181dfbf_v3_1_6_0'] =\
-                JSONSchemaValidatorF1DebbfD4775FabA3779C513181Dfbf_v3_1_6_0()
-            self.json_schema_validators['jsd_f24f6c07641580ba6ed710e92c2da16_v3_1_6_0'] =\
-                JSONSchemaValidatorF24F6C07641580BA6Ed710E92C2Da16_v3_1_6_0()
-            self.json_schema_validators['jsd_f2dc0b2dd265d3bb69c5aeb5cff2f13_v3_1_6_0'] =\
-                JSONSchemaValidatorF2Dc0B2Dd265D3BB69C5Aeb5Cff2F13_v3_1_6_0()
-            self.json_schema_validators['jsd_f4ce55b5f235924903516ef31dc9e3c_v3_1_6_0'] =\
-                JSONSchemaValidatorF4Ce55B5F235924903516Ef31Dc9E3C_v3_1_6_0()
-            self.json_schema_validators['jsd_f75156ff30d50d1bced4ec466b56b38_v3_1_6_0'] =\
-                JSONSchemaValidatorF75156FF30D50D1Bced4Ec466B56B38_v3_1_6_0()
-            self.json_schema_validators['jsd_fcc151af7615a84adf48b714d146192_v3_1_6_0'] =\
-                JSONSchemaValidatorFcc151AF7615A84Adf48B714D146192_v3_1_6_0()
-            self.json_schema_validators['jsd_fccc089e04b557aa7478de3d8fe472f_v3_1_6_0'] =\
-                JSONSchemaValidatorFccc089E04B557AA7478De3D8Fe472F_v3_1_6_0()
-            self.json_schema_validators['jsd_fe3ec7651e79d891fce37a0d860_v3_1_6_0'] =\
-                JSONSchemaValidatorFe3Ec7651E79D891Fce37A0D860_v3_1_6_0()
-            self.json_schema_validators['jsd_b07f187b7456c8bbb6088a2f24dcee_v3_1_6_0'] =\
-                JSONSchemaValidatorB07F187B7456C8Bbb6088A2F24Dcee_v3_1_6_0()
-            self.json_schema_validators['jsd_cb7563a5058c4801eb842a74ff61c_v3_1_6_0'] =\
-                JSONSchemaValidatorCb7563A5058C4801EB842A74Ff61C_v3_1_6_0()
-            self.json_schema_validators['jsd_c10072541e94bd16f1aebffe32_v3_1_6_0'] =\
-                JSONSchemaValidatorC10072541E94Bd16F1Aebffe32_v3_1_6_0()
-            self.json_schema_validators['jsd_a18e761ac8592e9a5c4e0bb2308cf0_v3_1_6_0'] =\
-                JSONSchemaValidatorA18E761Ac8592E9A5C4E0Bb2308Cf0_v3_1_6_0()
-            self.json_schema_validators['jsd_a31cc19195d43ba695f4b7494b559_v3_1_6_0'] =\
-                JSONSchemaValidatorA31Cc19195D43Ba695F4B7494B559_v3_1_6_0()
-            self.json_schema_validators['jsd_edc44e0e7a513191cc16dc2b4da88e_v3_1_6_0'] =\
-                JSONSchemaValidatorEdc44E0E7A513191Cc16Dc2B4Da88E_v3_1_6_0()
-            self.json_schema_validators['jsd_a25f176554fb407fbe4952f1c4e_v3_1_6_0'] =\
-                JSONSchemaValidatorA25F176554FB407Fbe4952F1C4E_v3_1_6_0()
-            self.json_schema_validators['jsd_d39d23589e85db0a63c414057c_v3_1_6_0'] =\
-                JSONSchemaValidatorD39D23589E85Db0A63C414057C_v3_1_6_0()
-            self.json_schema_validators['jsd_c45c1c55d498d03a72933690098_v3_1_6_0'] =\
-                JSONSchemaValidatorC45C1C55D498D03A72933690098_v3_1_6_0()
-            self.json_schema_validators['jsd_a9f5796226051218eac559ab5211384_v3_1_6_0'] =\
-                JSONSchemaValidatorA9F5796226051218Eac559Ab5211384_v3_1_6_0()
-            self.json_schema_validators['jsd_c4befbd77a452a9b7873ffc360a1f20_v3_1_6_0'] =\
-                JSONSchemaValidatorC4Befbd77A452A9B7873Ffc360A1F20_v3_1_6_0()
-            self.json_schema_validators['jsd_c8d11fb9fc752ab8bb8e2b1413ccc92_v3_1_6_0'] =\
-                JSONSchemaValidatorC8D11Fb9Fc752Ab8Bb8E2B1413Ccc92_v3_1_6_0()
-            self.json_schema_validators['jsd_ccd75f80ece59f08cadda085402cef5_v3_1_6_0'] =\
-                JSONSchemaValidatorCcd75F80Ece59F08CadDa085402Cef5_v3_1_6_0()
-            self.json_schema_validators['jsd_d82755e5e03510daf0951c1f42c2702_v3_1_6_0'] =\
-                JSONSchemaValidatorD82755E5E03510DAf0951C1F42C2702_v3_1_6_0()
-            self.json_schema_validators['jsd_e0bd567c1395531a7f18ab4e14110bd_v3_1_6_0'] =\
-                JSONSchemaValidatorE0Bd567C1395531A7F18Ab4E14110Bd_v3_1_6_0()
-            self.json_schema_validators['jsd_e4f57e8f06856ee9a7e490d01f7f692_v3_1_6_0'] =\
-                JSONSchemaValidatorE4F57E8F06856Ee9A7E490D01F7F692_v3_1_6_0()
-            self.json_schema_validators['jsd_eb3b18894545315b25b94d0c0e2ec67_v3_1_6_0'] =\
-                JSONSchemaValidatorEb3B18894545315B25B94D0C0E2Ec67_v3_1_6_0()
-            self.json_schema_validators['jsd_eca62ef076b5627a85b2a5959613fb8_v3_1_6_0'] =\
-                JSONSchemaValidatorEca62Ef076B5627A85B2A5959613Fb8_v3_1_6_0()
-            self.json_schema_validators['jsd_ed96d98063c5be9aa0005772dc95fc5_v3_1_6_0'] =\
-                JSONSchemaValidatorEd96D98063C5Be9Aa0005772Dc95Fc5_v3_1_6_0()
-            self.json_schema_validators['jsd_f486694f3da57b4921b7f2036a1b754_v3_1_6_0'] =\
-                JSONSchemaValidatorF486694F3Da57B4921B7F2036A1B754_v3_1_6_0()
-            self.json_schema_validators['jsd_f6536a8f01d5863856a0a8308198e15_v3_1_6_0'] =\
-                JSONSchemaValidatorF6536A8F01D5863856A0A8308198E15_v3_1_6_0()
-            self.json_schema_validators['jsd_f7dd6a6cf8d57499168aae05847ad34_v3_1_6_0'] =\
-                JSONSchemaValidatorF7Dd6A6Cf8D57499168Aae05847Ad34_v3_1_6_0()
-            self.json_schema_validators['jsd_fb433ea1bbc5dc49dce4fde0a04e5ed_v3_1_6_0'] =\
-                JSONSchemaValidatorFb433Ea1Bbc5Dc49Dce4Fde0A04E5Ed_v3_1_6_0()
-            self.json_schema_validators['jsd_fdd36dd2454547096bb65df3755710f_v3_1_6_0'] =\
-                JSONSchemaValidatorFdd36Dd2454547096Bb65Df3755710F_v3_1_6_0()
-            self.json_schema_validators['jsd_cec6c85d9bb4bcc8f61f31296b_v3_1_6_0'] =\
-                JSONSchemaValidatorCeC6C85D9BB4BcC8F61F31296B_v3_1_6_0()
-            self.json_schema_validators['jsd_f7cf4f24d54c6944a31ed308f8361_v3_1_6_0'] =\
-                JSONSchemaValidatorF7Cf4F24D54C6944A31Ed308F8361_v3_1_6_0()
-            self.json_schema_validators['jsd_e9c5c3e5515a2e1b2cdee6928ab_v3_1_6_0'] =\
-                JSONSchemaValidatorE9C5C3E5515A2E1B2Cdee6928Ab_v3_1_6_0()
-            self.json_schema_validators['jsd_d73cd5be487a36d0a01d6cdc3_v3_1_6_0'] =\
-                JSONSchemaValidatorD73Cd5Be487A36D0A01D6Cdc3_v3_1_6_0()
-            self.json_schema_validators['jsd_db7b6c4f0542aab9fe7cf5c995f83_v3_1_6_0'] =\
-                JSONSchemaValidatorDb7B6C4F0542AAb9FE7Cf5C995F83_v3_1_6_0()
-            self.json_schema_validators['jsd_c536ac5a318629fc3d6b3dc236_v3_1_6_0'] =\
-                JSONSchemaValidatorC536Ac5A318629Fc3D6B3Dc236_v3_1_6_0()
-            self.json_schema_validators['jsd_d7161b33157dba957ba18eda440c2_v3_1_6_0'] =\
-                JSONSchemaValidatorD7161B33157DbA957Ba18Eda440C2_v3_1_6_0()
-            self.json_schema_validators['jsd_f5ebb9d50aab287f320d32181c0_v3_1_6_0'] =\
-                JSONSchemaValidatorF5EBb9D50AaB287F320D32181C0_v3_1_6_0()
-            self.json_schema_validators['jsd_aba18f6e605ce28a112b34dcb4fe82_v3_1_6_0'] =\
-                JSONSchemaValidatorAba18F6E605Ce28A112B34Dcb4Fe82_v3_1_6_0()
-            self.json_schema_validators['jsd_fa27ccbaf55711849381a707e1edfa_v3_1_6_0'] =\
-                JSONSchemaValidatorFa27CcBaf55711849381A707E1Edfa_v3_1_6_0()
-            self.json_schema_validators['jsd_f04b76067507b9384e409e9431ef3_v3_1_6_0'] =\
-                JSONSchemaValidatorF04B76067507B9384E409E9431Ef3_v3_1_6_0()
-            self.json_schema_validators['jsd_b7ae9494b05a57bf6393eaf308b1e7_v3_1_6_0'] =\
-                JSONSchemaValidatorB7Ae9494B05A57Bf6393Eaf308B1E7_v3_1_6_0()
-            self.json_schema_validators['jsd_f24a5ad5bf03fe236dd96dcb_v3_1_6_0'] =\
-                JSONSchemaValidatorF24A5Ad5Bf03Fe236Dd96Dcb_v3_1_6_0()
-            self.json_schema_validators['jsd_b6581534bb321eaea272365b7_v3_1_6_0'] =\
-                JSONSchemaValidatorB6581534BB321Eaea272365B7_v3_1_6_0()
-            self.json_schema_validators['jsd_f6255ed55aab8b55879cda83511_v3_1_6_0'] =\
-                JSONSchemaValidatorF6255Ed55AaB8B55879Cda83511_v3_1_6_0()
-            self.json_schema_validators['jsd_b33956f3e56c6b8d234e7ed6a20e6_v3_1_6_0'] =\
-                JSONSchemaValidatorB33956F3E56C6B8D234E7Ed6A20E6_v3_1_6_0()
-            self.json_schema_validators['jsd_cc59d48f8159008f52b29e08738811_v3_1_6_0'] =\
-                JSONSchemaValidatorCc59D48F8159008F52B29E08738811_v3_1_6_0()
-            self.json_schema_validators['jsd_bfca373c5d7c863eef14abc654fd_v3_1_6_0'] =\
-                JSONSchemaValidatorBfca373C5D7C863EEf14Abc654Fd_v3_1_6_0()
-            self.json_schema_validators['jsd_d1608b2751c883a072ee3fb80228_v3_1_6_0'] =\
-                JSONSchemaValidatorD1608B2751C883A072Ee3Fb80228_v3_1_6_0()
-            self.json_schema_validators['jsd_eea0014365ef78d30d9ba8f1752e8_v3_1_6_0'] =\
-                JSONSchemaValidatorEea0014365Ef78D30D9Ba8F1752E8_v3_1_6_0()
-            self.json_schema_validators['jsd_e73b352ff2573aab906c2ad75c5a71_v3_1_6_0'] =\
-                JSONSchemaValidatorE73B352Ff2573AAb906C2Ad75C5A71_v3_1_6_0()
-            self.json_schema_validators['jsd_ac98aec39c95c2d97532514ee9b9f3e_v3_1_6_0'] =\
-                JSONSchemaValidatorAc98Aec39C95C2D97532514Ee9B9F3E_v3_1_6_0()
-            self.json_schema_validators['jsd_ba9e0f3a5db5972a55d4b3fcf2b5432_v3_1_6_0'] =\
-                JSONSchemaValidatorBa9E0F3A5Db5972A55D4B3Fcf2B5432_v3_1_6_0()
-            self.json_schema_validators['jsd_bd421c1db8c5deaa3301b8cc73dd541_v3_1_6_0'] =\
-                JSONSchemaValidatorBd421C1Db8C5DeaA3301B8Cc73Dd541_v3_1_6_0()
-            self.json_schema_validators['jsd_be8cdb967555fcca03a4c1f796eee56_v3_1_6_0'] =\
-                JSONSchemaValidatorBe8Cdb967555FccA03A4C1F796Eee56_v3_1_6_0()
-            self.json_schema_validators['jsd_c9d3ba6208e5d6eb45fa5c9b8f7e327_v3_1_6_0'] =\
-                JSONSchemaValidatorC9D3Ba6208E5D6EB45FA5C9B8F7E327_v3_1_6_0()
-            self.json_schema_validators['jsd_cba0eecfc555390935cebd13e6bcb90_v3_1_6_0'] =\
-                JSONSchemaValidatorCba0EecFc555390935CEbd13E6Bcb90_v3_1_6_0()
-            self.json_schema_validators['jsd_d54c40ecb5f531cb5a78d0cd5dd585e_v3_1_6_0'] =\
-                JSONSchemaValidatorD54C40ECb5F531CB5A78D0Cd5Dd585E_v3_1_6_0()
-            self.json_schema_validators['jsd_dbea7d7de125cf6b840d5032d3a5c59_v3_1_6_0'] =\
-                JSONSchemaValidatorDbea7D7De125Cf6B840D5032D3A5C59_v3_1_6_0()
-            self.json_schema_validators['jsd_e8911ba7a8b54be8e443df8ac842e36_v3_1_6_0'] =\
-                JSONSchemaValidatorE8911Ba7A8B54Be8E443Df8Ac842E36_v3_1_6_0()
-            self.json_schema_validators['jsd_f019a24c5ce50f082d081bb72ff4df9_v3_1_6_0'] =\
-                JSONSchemaValidatorF019A24C5Ce50F082D081Bb72Ff4Df9_v3_1_6_0()
-            self.json_schema_validators['jsd_f2b137487385de6925b7b6136d4b027_v3_1_6_0'] =\
-                JSONSchemaValidatorF2B137487385De6925B7B6136D4B027_v3_1_6_0()
-            self.json_schema_validators['jsd_f5645e6e819558fa08761dee45ca406_v3_1_6_0'] =\
-                JSONSchemaValidatorF5645E6E819558FA08761Dee45Ca406_v3_1_6_0()
-            self.json_schema_validators['jsd_fe06867e548bba1919024b40d992_v3_1_6_0'] =\
-                JSONSchemaValidatorFe06867E548BBa1919024B40D992_v3_1_6_0()
-            self.json_schema_validators['jsd_c024bb00458248144753c93dd8215_v3_1_6_0'] =\
-                JSONSchemaValidatorC024BB00458248144753C93Dd8215_v3_1_6_0()
-            self.json_schema_validators['jsd_efa92557c9a6c8af0a71829c7e_v3_1_6_0'] =\
-                JSONSchemaValidatorEfA92557C9A6C8Af0A71829C7E_v3_1_6_0()
-            self.json_schema_validators['jsd_e55cca88065707a6f812a679f69a5d_v3_1_6_0'] =\
-                JSONSchemaValidatorE55Cca88065707A6F812A679F69A5D_v3_1_6_0()
-            self.json_schema_validators['jsd_ecc3258a5c5b8f2267a512820a59_v3_1_6_0'] =\
-                JSONSchemaValidatorEcc3258A5C5B8F2267A512820A59_v3_1_6_0()
-            self.json_schema_validators['jsd_f5602b2965e53b5bdda193025a3fc_v3_1_6_0'] =\
-                JSONSchemaValidatorF5602B2965E53B5BdDa193025A3Fc_v3_1_6_0()
-            self.json_schema_validators['jsd_e6bca55256a0aac288486e38049b_v3_1_6_0'] =\
-                JSONSchemaValidatorE6BcA55256A0Aac288486E38049B_v3_1_6_0()
-            self.json_schema_validators['jsd_ba98ed72975099b39dd2dc4cb65ed8_v3_1_6_0'] =\
-                JSONSchemaValidatorBa98Ed72975099B39DD2Dc4Cb65Ed8_v3_1_6_0()
-            self.json_schema_validators['jsd_ef28900485c4e9842b4a68e483d4e_v3_1_6_0'] =\
-                JSONSchemaValidatorEf28900485C4E9842B4A68E483D4E_v3_1_6_0()
-            self.json_schema_validators['jsd_ea8d75a9d8d9e6882da4a4a91_v3_1_6_0'] =\
-                JSONSchemaValidatorEA8D75A9D8D9E6882Da4A4A91_v3_1_6_0()
-            self.json_schema_validators['jsd_c49a8488cd52158790aac513e7184a_v3_1_6_0'] =\
-                JSONSchemaValidatorC49A8488Cd52158790Aac513E7184A_v3_1_6_0()
-            self.json_schema_validators['jsd_ae57085565e551594fc05b4db6a64af_v3_1_6_0'] =\
-                JSONSchemaValidatorAe57085565E551594Fc05B4Db6A64Af_v3_1_6_0()
-            self.json_schema_validators['jsd_bb1653037ca558a8c6097e20b99b4b1_v3_1_6_0'] =\
-                JSONSchemaValidatorBb1653037Ca558A8C6097E20B99B4B1_v3_1_6_0()
-            self.json_schema_validators['jsd_bd1c59e9be75ac4a40decaa95ee9efd_v3_1_6_0'] =\
-                JSONSchemaValidatorBd1C59E9Be75Ac4A40DEcaa95Ee9Efd_v3_1_6_0()
-            self.json_schema_validators['jsd_bec2dde673c5b2f940d0474fed32af6_v3_1_6_0'] =\
-                JSONSchemaValidatorBec2Dde673C5B2F940D0474Fed32Af6_v3_1_6_0()
-            self.json_schema_validators['jsd_d16471a58805b4aa2c757209d188aed_v3_1_6_0'] =\
-                JSONSchemaValidatorD16471A58805B4AA2C757209D188Aed_v3_1_6_0()
-            self.json_schema_validators['jsd_d6866f768b05f8aa12a142ec526f432_v3_1_6_0'] =\
-                JSONSchemaValidatorD6866F768B05F8AA12A142Ec526F432_v3_1_6_0()
-            self.json_schema_validators['jsd_d6b58f378895114839682dceed1a9b5_v3_1_6_0'] =\
-                JSONSchemaValidatorD6B58F378895114839682Dceed1A9B5_v3_1_6_0()
-            self.json_schema_validators['jsd_d8fc92ddeab597ebb50ea003a6d46bd_v3_1_6_0'] =\
-                JSONSchemaValidatorD8Fc92DDeab597EBb50Ea003A6D46Bd_v3_1_6_0()
-            self.json_schema_validators['jsd_e481654675355408be8daff9a82f9a0_v3_1_6_0'] =\
-                JSONSchemaValidatorE481654675355408Be8Daff9A82F9A0_v3_1_6_0()
-            self.json_schema_validators['jsd_ee43cac5fd65c55ab3153d3549d18c0_v3_1_6_0'] =\
-                JSONSchemaValidatorEe43Cac5Fd65C55Ab3153D3549D18C0_v3_1_6_0()
-            self.json_schema_validators['jsd_eea45fca32f5f12adc30a9d03c43ac6_v3_1_6_0'] =\
-                JSONSchemaValidatorEea45FcA32F5F12Adc30A9D03C43Ac6_v3_1_6_0()
-            self.json_schema_validators['jsd_feb78fec3e454e1bd9dd531a6a29100_v3_1_6_0'] =\
-                JSONSchemaValidatorFeb78FeC3E454E1Bd9DD531A6A29100_v3_1_6_0()
-            self.json_schema_validators['jsd_c90c04b8356cf9974957e0f9516d0_v3_1_6_0'] =\
-                JSONSchemaValidatorC90C04B8356Cf9974957E0F9516D0_v3_1_6_0()
-            self.json_schema_validators['jsd_b4155d6f885a53ad0e47b1a4_v3_1_6_0'] =\
-                JSONSchemaValidatorB4155D6F885A53Ad0E47B1A4_v3_1_6_0()
-            self.json_schema_validators['jsd_cf2cac6f150c9bee9ade37921b162_v3_1_6_0'] =\
-                JSONSchemaValidatorCf2CaC6F150C9Bee9Ade37921B162_v3_1_6_0()
-            self.json_schema_validators['jsd_cf0f416ef5c25a159f4c3e376741a_v3_1_6_0'] =\
-                JSONSchemaValidatorCf0F416Ef5C25A159F4C3E376741A_v3_1_6_0()
-            self.json_schema_validators['jsd_adfc115d6888722b71811ac96e_v3_1_6_0'] =\
-                JSONSchemaValidatorAdFc115D6888722B71811Ac96E_v3_1_6_0()
-            self.json_schema_validators['jsd_bc55e6552fac58cc0aaacd773a_v3_1_6_0'] =\
-                JSONSchemaValidatorBc55E6552FAc58Cc0Aaacd773A_v3_1_6_0()
-            self.json_schema_validators['jsd_dece7a9b353b49084a8ffa4f18c91_v3_1_6_0'] =\
-                JSONSchemaValidatorDece7A9B353B49084A8Ffa4F18C91_v3_1_6_0()
-            self.json_schema_validators['jsd_c9ea5c02b2b7368cac785f30_v3_1_6_0'] =\
-                JSONSchemaValidatorC9Ea5C02B2B7368Cac785F30_v3_1_6_0()
-            self.json_schema_validators['jsd_f4b2825561e808787a16f7e0a1f_v3_1_6_0'] =\
-                JSONSchemaValidatorF4B2825561E808787A16F7E0A1F_v3_1_6_0()
-            self.json_schema_validators['jsd_bc3ed6556f9b9c959e53e271d70_v3_1_6_0'] =\
-                JSONSchemaValidatorBc3Ed6556F9B9C959E53E271D70_v3_1_6_0()
-            self.json_schema_validators['jsd_aac9ba55e5043b4d5e0995c566dce_v3_1_6_0'] =\
-                JSONSchemaValidatorAac9BA55E5043B4D5E0995C566Dce_v3_1_6_0()
-            self.json_schema_validators['jsd_b818044610579a9b74ec582e7739ab_v3_1_6_0'] =\
-                JSONSchemaValidatorB818044610579A9B74Ec582E7739Ab_v3_1_6_0()
-            self.json_schema_validators['jsd_bcb7a52e3c5763b246bcf438fe57c9_v3_1_6_0'] =\
-                JSONSchemaValidatorBcb7A52E3C5763B246Bcf438Fe57C9_v3_1_6_0()
-            self.json_schema_validators['jsd_eb209544555e43ae2bc909499f3900_v3_1_6_0'] =\
-                JSONSchemaValidatorEb209544555E43Ae2BC909499F3900_v3_1_6_0()
-            self.json_schema_validators['jsd_f2c120b855cb8c852806ce72e54d_v3_1_6_0'] =\
-                JSONSchemaValidatorF2C120B855Cb8C852806Ce72E54D_v3_1_6_0()
-            self.json_schema_validators['jsd_a4d8313a955433858e0137ba7ef672_v3_1_6_0'] =\
-                JSONSchemaValidatorA4D8313A955433858E0137Ba7Ef672_v3_1_6_0()
-            self.json_schema_validators['jsd_e62749061c5aae8ecd1ccc2d315153_v3_1_6_0'] =\
-                JSONSchemaValidatorE62749061C5Aae8Ecd1Ccc2D315153_v3_1_6_0()
-            self.json_schema_validators['jsd_f50ab34f58526bb0ed8aa910f47f24_v3_1_6_0'] =\
-                JSONSchemaValidatorF50Ab34F58526BB0Ed8Aa910F47F24_v3_1_6_0()
-            self.json_schema_validators['jsd_cd2e825a78b6de087e991f6fe0_v3_1_6_0'] =\
-                JSONSchemaValidatorCd2E825A78B6De087E991F6Fe0_v3_1_6_0()
-            self.json_schema_validators['jsd_c14a815ec5938950343f6188f0785_v3_1_6_0'] =\
-                JSONSchemaValidatorC14A815Ec5938950343F6188F0785_v3_1_6_0()
-            self.json_schema_validators['jsd_aaebb912125213b350d7423b4f01a4_v3_1_6_0'] =\
-                JSONSchemaValidatorAaebb912125213B350D7423B4F01A4_v3_1_6_0()
-            self.json_schema_validators['jsd_fb8fee52fcb7577206a3fcac8c_v3_1_6_0'] =\
-                JSONSchemaValidatorFb8Fee52FcB7577206A3Fcac8C_v3_1_6_0()
-            self.json_schema_validators['jsd_ad0cce45817862bebfc839bf5ae_v3_1_6_0'] =\
-                JSONSchemaValidatorAd0Cce45817862BEbfc839Bf5Ae_v3_1_6_0()
-            self.json_schema_validators['jsd_d6d7d5c8983c1d3c9815bfd35_v3_1_6_0'] =\
-                JSONSchemaValidatorD6D7D5C8983C1D3C9815Bfd35_v3_1_6_0()
-            self.json_schema_validators['jsd_fb5a8c0075563491622171958074bf_v3_1_6_0'] =\
-                JSONSchemaValidatorFb5A8C0075563491622171958074Bf_v3_1_6_0()
-            self.json_schema_validators['jsd_a764c85d8df5c30b9143619d4f9cde9_v3_1_6_0'] =\
-                JSONSchemaValidatorA764C85D8Df5C30B9143619D4F9Cde9_v3_1_6_0()
-            self.json_schema_validators['jsd_b5a94fd2d97514b8a9cf73df4e154b8_v3_1_6_0'] =\
-                JSONSchemaValidatorB5A94Fd2D97514B8A9CF73Df4E154B8_v3_1_6_0()
-            self.json_schema_validators['jsd_c991ce0b0f058a08c863a4abdfc70a6_v3_1_6_0'] =\
-                JSONSchemaValidatorC991Ce0B0F058A08C863A4Abdfc70A6_v3_1_6_0()
-            self.json_schema_validators['jsd_d10535ed2045b9bb5c58882e6f43cb2_v3_1_6_0'] =\
-                JSONSchemaValidatorD10535ED2045B9BB5C58882E6F43Cb2_v3_1_6_0()
-            self.json_schema_validators['jsd_f41eb48a0da56949cfaddeecb51ab66_v3_1_6_0'] =\
-                JSONSchemaValidatorF41Eb48A0Da56949CfaDdeecb51Ab66_v3_1_6_0()
-            self.json_schema_validators['jsd_f5bfccc7e30550baa7046f74daa1ef2_v3_1_6_0'] =\
-                JSONSchemaValidatorF5Bfccc7E30550BAa7046F74Daa1Ef2_v3_1_6_0()
-            self.json_schema_validators['jsd_fcd7200871e5e2db7f1720d95fee764_v3_1_6_0'] =\
-                JSONSchemaValidatorFcd7200871E5E2DB7F1720D95Fee764_v3_1_6_0()
-            self.json_schema_validators['jsd_fff3662537e538f82bfb5809e30b3df_v3_1_6_0'] =\
-                JSONSchemaValidatorFff3662537E538F82BfB5809E30B3Df_v3_1_6_0()
-            self.json_schema_validators['jsd_a0c237c8fc115b6f98b87cc7a1360dd0_v3_1_6_0'] =\
-                JSONSchemaValidatorA0C237C8Fc115B6F98B87Cc7A1360Dd0_v3_1_6_0()
-            self.json_schema_validators['jsd_a0f799d5ec6954d1bd7a25853080a9f1_v3_1_6_0'] =\
-                JSONSchemaValidatorA0F799D5Ec6954D1Bd7A25853080A9F1_v3_1_6_0()
-            self.json_schema_validators['jsd_a14e71c1b98e51eea41255720025b519_v3_1_6_0'] =\
-                JSONSchemaValidatorA14E71C1B98E51EeA41255720025B519_v3_1_6_0()
-            self.json_schema_validators['jsd_a2da4c1e5224542e8474f09eb8d4f32d_v3_1_6_0'] =\
-                JSONSchemaValidatorA2Da4C1E5224542E8474F09Eb8D4F32D_v3_1_6_0()
-            self.json_schema_validators['jsd_a352f6280e445075b3ea7cbf868c2d94_v3_1_6_0'] =\
-                JSONSchemaValidatorA352F6280E445075B3Ea7Cbf868C2D94_v3_1_6_0()
-            self.json_schema_validators['jsd_a3b37dcbe2a150bea06d9dcde1837281_v3_1_6_0'] =\
-                JSONSchemaValidatorA3B37DcbE2A150BeA06D9Dcde1837281_v3_1_6_0()
-            self.json_schema_validators['jsd_a3d2432ae8c55fe793c5180d8d5fce25_v3_1_6_0'] =\
-                JSONSchemaValidatorA3D2432AE8C55Fe793C5180D8D5Fce25_v3_1_6_0()
-            self.json_schema_validators['jsd_a3fb2e7bb8aa50508425b1dd8818fda4_v3_1_6_0'] =\
-                JSONSchemaValidatorA3Fb2E7BB8Aa50508425B1Dd8818Fda4_v3_1_6_0()
-            self.json_schema_validators['jsd_a41113bc28515538af4fe4d2ff707f60_v3_1_6_0'] =\
-                JSONSchemaValidatorA41113Bc28515538Af4FE4D2Ff707F60_v3_1_6_0()
-            self.json_schema_validators['jsd_a542b2feed5259a2922ebd75ca99a141_v3_1_6_0'] =\
-                JSONSchemaValidatorA542B2FeEd5259A2922EBd75Ca99A141_v3_1_6_0()
-            self.json_schema_validators['jsd_a54fce1a0c305bdabfe91a8a6161e539_v3_1_6_0'] =\
-                JSONSchemaValidatorA54Fce1A0C305BdaBfe91A8A6161E539_v3_1_6_0()
-            self.json_schema_validators['jsd_a5e4452cb2e05682933349833a01d14b_v3_1_6_0'] =\
-                JSONSchemaValidatorA5E4452CB2E05682933349833A01D14B_v3_1_6_0()
-            self.json_schema_validators['jsd_a66db26df529597c84c2a15ea2d632ce_v3_1_6_0'] =\
-                JSONSchemaValidatorA66Db26DF529597C84C2A15Ea2D632Ce_v3_1_6_0()
-            self.json_schema_validators['jsd_a69602efc6f4523d806ffb18fbcf5cee_v3_1_6_0'] =\
-                JSONSchemaValidatorA69602EfC6F4523D806FFb18Fbcf5Cee_v3_1_6_0()
-            self.json_schema_validators['jsd_a6c4ce7aef8251a2a8646ba0b5c1826a_v3_1_6_0'] =\
-                JSONSchemaValidatorA6C4Ce7AEf8251A2A8646Ba0B5C1826A_v3_1_6_0()
-            self.json_schema_validators['jsd_a73fbc67627e5bbbafe748de84d42df6_v3_1_6_0'] =\
-                JSONSchemaValidatorA73Fbc67627E5BbbAfe748De84D42Df6_v3_1_6_0()
-            self.json_schema_validators['jsd_a7935eedd53a5b8c84668c903cc1c705_v3_1_6_0'] =\
-                JSONSchemaValidatorA7935EedD53A5B8C84668C903Cc1C705_v3_1_6_0()
-            self.json_schema_validators['jsd_a7d6d604f38f5f849af79d8768bddfc1_v3_1_6_0'] =\
-                JSONSchemaValidatorA7D6D604F38F5F849Af79D8768Bddfc1_v3_1_6_0()
-            self.json_schema_validators['jsd_a837b8a46cd459c8b429d16fb17f1370_v3_1_6_0'] =\
-                JSONSchemaValidatorA837B8A46Cd459C8B429D16Fb17F1370_v3_1_6_0()
-            self.json_schema_validators['jsd_a914cc0c96a35a06a54856e778742a8c_v3_1_6_0'] =\
-                JSONSchemaValidatorA914Cc0C96A35A06A54856E778742A8C_v3_1_6_0()
-            self.json_schema_validators['jsd_a91eed12dfc85dbdaacab22e6e9f04a5_v3_1_6_0'] =\
-                JSONSchemaValidatorA91Eed12Dfc85DbdAacaB22E6E9F04A5_v3_1_6_0()
-            self.json_schema_validators['jsd_a93d01238de0537dbb3d358f9cce0bd2_v3_1_6_0'] =\
-                JSONSchemaValidatorA93D01238De0537DBb3D358F9Cce0Bd2_v3_1_6_0()
-            self.json_schema_validators['jsd_a9b864257b965fe4bd8b0293f41f1537_v3_1_6_0'] =\
-                JSONSchemaValidatorA9B864257B965Fe4Bd8B0293F41F1537_v3_1_6_0()
-            self.json_schema_validators['jsd_a9e0722d184658c592bd130ff03e1dde_v3_1_6_0'] =\
-                JSONSchemaValidatorA9E0722D184658C592Bd130Ff03E1Dde_v3_1_6_0()
-            self.json_schema_validators['jsd_aa11f09d28165f4ea6c81b8642e59cc4_v3_1_6_0'] =\
-                JSONSchemaValidatorAa11F09D28165F4EA6C81B8642E59Cc4_v3_1_6_0()
-            self.json_schema_validators['jsd_aa663ca2bd1f5a3db67c405987495112_v3_1_6_0'] =\
-                JSONSchemaValidatorAa663Ca2Bd1F5A3DB67C405987495112_v3_1_6_0()
-            self.json_schema_validators['jsd_ac6e63199fb05bcf89106a22502c2197_v3_1_6_0'] =\
-                JSONSchemaValidatorAc6E63199Fb05Bcf89106A22502C2197_v3_1_6_0()
-            self.json_schema_validators['jsd_ac7ce690e0f55a469b0a9bfa3d2c165e_v3_1_6_0'] =\
-                JSONSchemaValidatorAc7Ce690E0F55A469B0A9Bfa3D2C165E_v3_1_6_0()
-            self.json_schema_validators['jsd_ad487b01cede5cb4bdd5ee06695a6020_v3_1_6_0'] =\
-                JSONSchemaValidatorAd487B01Cede5Cb4Bdd5Ee06695A6020_v3_1_6_0()
-            self.json_schema_validators['jsd_ad936677c99a58f6b532359d66fe98a7_v3_1_6_0'] =\
-                JSONSchemaValidatorAd936677C99A58F6B532359D66Fe98A7_v3_1_6_0()
-            self.json_schema_validators['jsd_ad96e712f4525a128368b1bfe3afc21c_v3_1_6_0'] =\
-                JSONSchemaValidatorAd96E712F4525A128368B1Bfe3Afc21C_v3_1_6_0()
-            self.json_schema_validators['jsd_ada3522de8ef54729e9fc242df292547_v3_1_6_0'] =\
-                JSONSchemaValidatorAda3522DE8Ef54729E9FC242Df292547_v3_1_6_0()
-            self.json_schema_validators['jsd_ae4d33eacca95f109bebc6fd0528ca48_v3_1_6_0'] =\
-                JSONSchemaValidatorAe4D33EaCca95F109BebC6Fd0528Ca48_v3_1_6_0()
-            self.json_schema_validators['jsd_ae8282c90a7059ceb31b4072429d00cd_v3_1_6_0'] =\
-                JSONSchemaValidatorAe8282C90A7059CeB31B4072429D00Cd_v3_1_6_0()
-            self.json_schema_validators['jsd_afcd4a0cbe985fd7aafa73d671c43a1e_v3_1_6_0'] =\
-                JSONSchemaValidatorAfcd4A0CBe985Fd7Aafa73D671C43A1E_v3_1_6_0()
-            self.json_schema_validators['jsd_b0780003f8f05720a7b04cfa0d0a9a85_v3_1_6_0'] =\
-                JSONSchemaValidatorB0780003F8F05720A7B04Cfa0D0A9A85_v3_1_6_0()
-            self.json_schema_validators['jsd_b08f499f995f5f46ba52e0385b54721a_v3_1_6_0'] =\
-                JSONSchemaValidatorB08F499F995F5F46Ba52E0385B54721A_v3_1_6_0()
-            self.json_schema_validators['jsd_b0aa8e79d21f5e579908825e70aaccf6_v3_1_6_0'] =\
-                JSONSchemaValidatorB0Aa8E79D21F5E579908825E70Aaccf6_v3_1_6_0()
-            self.json_schema_validators['jsd_b0b146a144a65aa296b8b939c2926158_v3_1_6_0'] =\
-                JSONSchemaValidatorB0B146A144A65Aa296B8B939C2926158_v3_1_6_0()
-            self.json_schema_validators['jsd_b119a4d455e35cc3b2cc6695a045cbfa_v3_1_6_0'] =\
-                JSONSchemaValidatorB119A4D455E35Cc3B2Cc6695A045Cbfa_v3_1_6_0()
-            self.json_schema_validators['jsd_b11aa4de387251c794665e030fa815da_v3_1_6_0'] =\
-                JSONSchemaValidatorB11Aa4De387251C794665E030Fa815Da_v3_1_6_0()
-            self.json_schema_validators['jsd_b1ded5eaafa25e6b8814fa1cc0f9829a_v3_1_6_0'] =\
-                JSONSchemaValidatorB1Ded5EaAfa25E6B8814Fa1Cc0F9829A_v3_1_6_0()
-            self.json_schema_validators['jsd_b2dae3b41636596aa02c3ad0a4bcb8d7_v3_1_6_0'] =\
-                JSONSchemaValidatorB2Dae3B41636596AA02C3Ad0A4Bcb8D7_v3_1_6_0()
-            self.json_schema_validators['jsd_b350fb0876a25879973b0840fbb690bb_v3_1_6_0'] =\
-                JSONSchemaValidatorB350Fb0876A25879973B0840Fbb690Bb_v3_1_6_0()
-            self.json_schema_validators['jsd_b3ab480a3f485ecc9fef1bd2f8c9d109_v3_1_6_0'] =\
-                JSONSchemaValidatorB3Ab480A3F485Ecc9Fef1Bd2F8C9D109_v3_1_6_0()
-            self.json_schema_validators['jsd_b3c4383ecc13514c85c6f3d8484f6d68_v3_1_6_0'] =\
-                JSONSchemaValidatorB3C4383ECc13514C85C6F3D8484F6D68_v3_1_6_0()
-            self.json_schema_validators['jsd_b43e0f60e9ac5bd4960f9772cf7a497b_v3_1_6_0'] =\
-                JSONSchemaValidatorB43E0F60E9Ac5Bd4960F9772Cf7A497B_v3_1_6_0()
-            self.json_schema_validators['jsd_b4f52e69ddca5b2583b28fb4c96447aa_v3_1_6_0'] =\
-                JSONSchemaValidatorB4F52E69Ddca5B2583B28Fb4C96447Aa_v3_1_6_0()
-            self.json_schema_validators['jsd_b6f2d8e46cdd5f05bb06f52cd1b26fb2_v3_1_6_0'] =\
-                JSONSchemaValidatorB6F2D8E46Cdd5F05Bb06F52Cd1B26Fb2_v3_1_6_0()
-            self.json_schema_validators['jsd_b7079a38844e56dd8f1b6b876880a02e_v3_1_6_0'] =\
-                JSONSchemaValidatorB7079A38844E56Dd8F1B6B876880A02E_v3_1_6_0()
-            self.json_schema_validators['jsd_b843a90c86875472af1f351e78dd5521_v3_1_6_0'] =\
-                JSONSchemaValidatorB843A90C86875472Af1F351E78Dd5521_v3_1_6_0()
-            self.json_schema_validators['jsd_b95201b6a6905a10b463e036bf591166_v3_1_6_0'] =\
-                JSONSchemaValidatorB95201B6A6905A10B463E036Bf591166_v3_1_6_0()
-            self.json_schema_validators['jsd_ba40975123ed50daa2f9f599cdf2d911_v3_1_6_0'] =\
-                JSONSchemaValidatorBa40975123Ed50DaA2F9F599Cdf2D911_v3_1_6_0()
-            self.json_schema_validators['jsd_ba52bb172d495710aa00f7d4d060ec50_v3_1_6_0'] =\
-                JSONSchemaValidatorBa52Bb172D495710Aa00F7D4D060Ec50_v3_1_6_0()
-            self.json_schema_validators['jsd_bac0c488707959c182dfef18681bceda_v3_1_6_0'] =\
-                JSONSchemaValidatorBac0C488707959C182DfEf18681Bceda_v3_1_6_0()
-            self.json_schema_validators['jsd_bbc4dab8193c546ab116e19863dff621_v3_1_6_0'] =\
-                JSONSchemaValidatorBbc4Dab8193C546AB116E19863Dff621_v3_1_6_0()
-            self.json_schema_validators['jsd_bc33daf690ec5399a507829abfc4fe64_v3_1_6_0'] =\
-                JSONSchemaValidatorBc33Daf690Ec5399A507829Abfc4Fe64_v3_1_6_0()
-            self.json_schema_validators['jsd_bc35f54af11e5b83a81c25927d1a10b5_v3_1_6_0'] =\
-                JSONSchemaValidatorBc35F54AF11E5B83A81C25927D1A10B5_v3_1_6_0()
-            self.json_schema_validators['jsd_bc3cb471beaf5bfeb47201993c023068_v3_1_6_0'] =\
-                JSONSchemaValidatorBc3Cb471Beaf5BfeB47201993C023068_v3_1_6_0()
-            self.json_schema_validators['jsd_bce8e6b307ce52dd8f5546fbd78e05ee_v3_1_6_0'] =\
-                JSONSchemaValidatorBce8E6B307Ce52Dd8F5546Fbd78E05Ee_v3_1_6_0()
-            self.json_schema_validators['jsd_bd31fcbd1ecd5a2c8b812088b27bfcea_v3_1_6_0'] =\
-                JSONSchemaValidatorBd31Fcbd1Ecd5A2C8B812088B27Bfcea_v3_1_6_0()
-            self.json_schema_validators['jsd_bd400dbef41e53ed82541c766f14f1eb_v3_1_6_0'] =\
-                JSONSchemaValidatorBd400DbeF41E53Ed82541C766F14F1Eb_v3_1_6_0()
-            self.json_schema_validators['jsd_bdca1829ea705fa690922e3e0f8ff7b0_v3_1_6_0'] =\
-                JSONSchemaValidatorBdca1829Ea705Fa690922E3E0F8Ff7B0_v3_1_6_0()
-            self.json_schema_validators['jsd_bdcb514ae33b571795e4a42147d11f87_v3_1_6_0'] =\
-                JSONSchemaValidatorBdcb514AE33B571795E4A42147D11F87_v3_1_6_0()
-            self.json_schema_validators['jsd_bf40cea4982c54278a52ac2e7b0c458a_v3_1_6_0'] =\
-                JSONSchemaValidatorBf40Cea4982C54278A52Ac2E7B0C458A_v3_1_6_0()
-            self.json_schema_validators['jsd_bfb1005f4d265f8bb340637175a5841f_v3_1_6_0'] =\
-                JSONSchemaValidatorBfb1005F4D265F8BB340637175A5841F_v3_1_6_0()
-            self.json_schema_validators['jsd_bfd1cc1403c951a99c0fcafd59eaabf3_v3_1_6_0'] =\
-                JSONSchemaValidatorBfd1Cc1403C951A99C0FCafd59Eaabf3_v3_1_6_0()
-            self.json_schema_validators['jsd_c17432d928f755f8bb9f4edb83089d3e_v3_1_6_0'] =\
-                JSONSchemaValidatorC17432D928F755F8Bb9F4Edb83089D3E_v3_1_6_0()
-            self.json_schema_validators['jsd_c1dae5c13e6959348fe1fe0652958647_v3_1_6_0'] =\
-                JSONSchemaValidatorC1Dae5C13E6959348Fe1Fe0652958647_v3_1_6_0()
-            self.json_schema_validators['jsd_c1fa19f9295c50018132c6c9ebc3fc35_v3_1_6_0'] =\
-                JSONSchemaValidatorC1Fa19F9295C50018132C6C9Ebc3Fc35_v3_1_6_0()
-            self.json_schema_validators['jsd_c524f0ec199e5435bcaee56b423532e7_v3_1_6_0'] =\
-                JSONSchemaValidatorC524F0Ec199E5435BcaeE56B423532E7_v3_1_6_0()
-            self.json_schema_validators['jsd_c5c273290fae513da209ec2c9270e46d_v3_1_6_0'] =\
-                JSONSchemaValidatorC5C273290Fae513DA209Ec2C9270E46D_v3_1_6_0()
-            self.json_schema_validators['jsd_c5df380093bd5a748d177a34375faab4_v3_1_6_0'] =\
-                JSONSchemaValidatorC5Df380093Bd5A748D177A34375Faab4_v3_1_6_0()
-            self.json_schema_validators['jsd_c5f97865727857d5b1eeaedee3dcccd2_v3_1_6_0'] =\
-                JSONSchemaValidatorC5F97865727857D5B1EeAedee3Dcccd2_v3_1_6_0()
-            self.json_schema_validators['jsd_c60312a923ee5a6fb3f2c725c32dc96f_v3_1_6_0'] =\
-                JSONSchemaValidatorC60312A923Ee5A6FB3F2C725C32Dc96F_v3_1_6_0()
-            self.json_schema_validators['jsd_c6774ff9549a53d4b41fdd2d88f1d0f5_v3_1_6_0'] =\
-                JSONSchemaValidatorC6774Ff9549A53D4B41FDd2D88F1D0F5_v3_1_6_0()
-            self.json_schema_validators['jsd_c7f28c3d23ba5384be5e769ae0505d00_v3_1_6_0'] =\
-                JSONSchemaValidatorC7F28C3D23Ba5384Be5E769Ae0505D00_v3_1_6_0()
-            self.json_schema_validators['jsd_c85b39d6bae0536695992ddbb91ea96d_v3_1_6_0'] =\
-                JSONSchemaValidatorC85B39D6Bae0536695992Ddbb91Ea96D_v3_1_6_0()
-            self.json_schema_validators['jsd_c880bc6a8faa5bb4afbfd6bea38c75fa_v3_1_6_0'] =\
-                JSONSchemaValidatorC880Bc6A8Faa5Bb4AfbfD6Bea38C75Fa_v3_1_6_0()
-            self.json_schema_validators['jsd_c937494318f952ba92eaeb82b144c338_v3_1_6_0'] =\
-                JSONSchemaValidatorC937494318F952Ba92EaEb82B144C338_v3_1_6_0()
-            self.json_schema_validators['jsd_c9b5b83e67195b649077a05e42897cc4_v3_1_6_0'] =\
-                JSONSchemaValidatorC9B5B83E67195B649077A05E42897Cc4_v3_1_6_0()
-            self.json_schema_validators['jsd_c9f995abc21b54e7860f66aef2ffbc85_v3_1_6_0'] =\
-                JSONSchemaValidatorC9F995AbC21B54E7860F66Aef2Ffbc85_v3_1_6_0()
-            self.json_schema_validators['jsd_ca2fe989a227585086452d24d32867a6_v3_1_6_0'] =\
-                JSONSchemaValidatorCa2Fe989A227585086452D24D32867A6_v3_1_6_0()
-            self.json_schema_validators['jsd_cb38886d0236502783d431455e3fb880_v3_1_6_0'] =\
-                JSONSchemaValidatorCb38886D0236502783D431455E3Fb880_v3_1_6_0()
-            self.json_schema_validators['jsd_cc1599012a5a59c8abdda5376b5cc583_v3_1_6_0'] =\
-                JSONSchemaValidatorCc1599012A5A59C8AbddA5376B5Cc583_v3_1_6_0()
-            self.json_schema_validators['jsd_cc19241fd92f586c8986d4d5c99c3a88_v3_1_6_0'] =\
-                JSONSchemaValidatorCc19241FD92F586C8986D4D5C99C3A88_v3_1_6_0()
-            self.json_schema_validators['jsd_ccbf614b4b355cac929f12cc61272c1c_v3_1_6_0'] =\
-                JSONSchemaValidatorCcbf614B4B355Cac929F12Cc61272C1C_v3_1_6_0()
-            self.json_schema_validators['jsd_cdf8c0d3866d5147901c0cf4821a84a7_v3_1_6_0'] =\
-                JSONSchemaValidatorCdf8C0D3866D5147901C0Cf4821A84A7_v3_1_6_0()
-            self.json_schema_validators['jsd_cec8139f6b1c5e5991d12197206029a0_v3_1_6_0'] =\
-                JSONSchemaValidatorCec8139F6B1C5E5991D12197206029A0_v3_1_6_0()
-            self.json_schema_validators['jsd_cf82058feef35cfabe601c3d51f01740_v3_1_6_0'] =\
-                JSONSchemaValidatorCf82058FEef35CfaBe601C3D51F01740_v3_1_6_0()
-            self.json_schema_validators['jsd_cf9d39cef5e95bb9bd48d5f86e094c99_v3_1_6_0'] =\
-                JSONSchemaValidatorCf9D39CeF5E95Bb9Bd48D5F86E094C99_v3_1_6_0()
-            self.json_schema_validators['jsd_cfadc5e4c912588389f4f63d2fb6e4ed_v3_1_6_0'] =\
-                JSONSchemaValidatorCfadc5E4C912588389F4F63D2Fb6E4Ed_v3_1_6_0()
-            self.json_schema_validators['jsd_d02614492a2251c18de2e36c097e40ff_v3_1_6_0'] =\
-                JSONSchemaValidatorD02614492A2251C18De2E36C097E40Ff_v3_1_6_0()
-            self.json_schema_validators['jsd_d045d18062ad5ae59c6f446beb17d675_v3_1_6_0'] =\
-                JSONSchemaValidatorD045D18062Ad5Ae59C6F446Beb17D675_v3_1_6_0()
-            self.json_schema_validators['jsd_d05c763ada545fbe94a4c0391456b89f_v3_1_6_0'] =\
-                JSONSchemaValidatorD05C763ADa545Fbe94A4C0391456B89F_v3_1_6_0()
-            self.json_schema_validators['jsd_d0aab00569b258b481afedc35e6db392_v3_1_6_0'] =\
-                JSONSchemaValidatorD0Aab00569B258B481AfEdc35E6Db392_v3_1_6_0()
-            self.json_schema_validators['jsd_d0b2cc705afb536fab6fd0848baa73c0_v3_1_6_0'] =\
-                JSONSchemaValidatorD0B2Cc705Afb536FAb6FD0848Baa73C0_v3_1_6_0()
-            self.json_schema_validators['jsd_d0e1021de57d5e95bbea5d5bd86b481a_v3_1_6_0'] =\
-                JSONSchemaValidatorD0E1021DE57D5E95Bbea5D5Bd86B481A_v3_1_6_0()
-            self.json_schema_validators['jsd_d0f4d6b5909b5ecaa29e854e919b4221_v3_1_6_0'] =\
-                JSONSchemaValidatorD0F4D6B5909B5EcaA29E854E919B4221_v3_1_6_0()
-            self.json_schema_validators['jsd_d1d42ef2f1895a82a2830bf1353e6baa_v3_1_6_0'] =\
-                JSONSchemaValidatorD1D42Ef2F1895A82A2830Bf1353E6Baa_v3_1_6_0()
-            self.json_schema_validators['jsd_d2ea814bfae85da1b77872d095fc8221_v3_1_6_0'] =\
-                JSONSchemaValidatorD2Ea814BFae85Da1B77872D095Fc8221_v3_1_6_0()
-            self.json_schema_validators['jsd_d413a3d054ac50fa921ca8cf7fdf5449_v3_1_6_0'] =\
-                JSONSchemaValidatorD413A3D054Ac50Fa921CA8Cf7Fdf5449_v3_1_6_0()
-            self.json_schema_validators['jsd_d5c229546dc755f796dfcf34f1c2e290_v3_1_6_0'] =\
-                JSONSchemaValidatorD5C229546Dc755F796DfCf34F1C2E290_v3_1_6_0()
-            self.json_schema_validators['jsd_d5ecdc670ebc5bae807f25a53d4e8b7f_v3_1_6_0'] =\
-                JSONSchemaValidatorD5Ecdc670Ebc5Bae807F25A53D4E8B7F_v3_1_6_0()
-            self.json_schema_validators['jsd_d6451662bd1652e7bdc39053429e87a4_v3_1_6_0'] =\
-                JSONSchemaValidatorD6451662Bd1652E7Bdc39053429E87A4_v3_1_6_0()
-            self.json_schema_validators['jsd_d69b1cfffdda5bd1828a5a89a262cbdd_v3_1_6_0'] =\
-                JSONSchemaValidatorD69B1CffFdda5Bd1828A5A89A262Cbdd_v3_1_6_0()
-            self.json_schema_validators['jsd_d715bf675b1250118d4b201d1419065e_v3_1_6_0'] =\
-                JSONSchemaValidatorD715Bf675B1250118D4B201D1419065E_v3_1_6_0()
-            self.json_schema_validators['jsd_d73fc407278f5eefa67e6a014aeaf742_v3_1_6_0'] =\
-                JSONSchemaValidatorD73Fc407278F5EefA67E6A014Aeaf742_v3_1_6_0()
-            self.json_schema_validators['jsd_d825ae9a117f5b6bb65b7d78fd42513c_v3_1_6_0'] =\
-                JSONSchemaValidatorD825Ae9A117F5B6BB65B7D78Fd42513C_v3_1_6_0()
-            self.json_schema_validators['jsd_d8fcd6dbb7ff53b58f7398c49b27ded2_v3_1_6_0'] =\
-                JSONSchemaValidatorD8Fcd6DbB7Ff53B58F7398C49B27Ded2_v3_1_6_0()
-            self.json_schema_validators['jsd_d91a3aad0fd954e7a43aa3256ce433f6_v3_1_6_0'] =\
-                JSONSchemaValidatorD91A3Aad0Fd954E7A43AA3256Ce433F6_v3_1_6_0()
-            self.json_schema_validators['jsd_d967a378b43457ad8c6a6de7bc1845d1_v3_1_6_0'] =\
-                JSONSchemaValidatorD967A378B43457Ad8C6A6De7Bc1845D1_v3_1_6_0()
-            self.json_schema_validators['jsd_d9c01903d0645a3d8b56172bb9549be3_v3_1_6_0'] =\
-                JSONSchemaValidatorD9C01903D0645A3D8B56172Bb9549Be3_v3_1_6_0()
-            self.json_schema_validators['jsd_d9e3276d1ed3511b80b22ea8388959c8_v3_1_6_0'] =\
-                JSONSchemaValidatorD9E3276D1Ed3511B80B22Ea8388959C8_v3_1_6_0()
-            self.json_schema_validators['jsd_da24bdb30635515395471fe644cdc7b5_v3_1_6_0'] =\
-                JSONSchemaValidatorDa24Bdb30635515395471Fe644Cdc7B5_v3_1_6_0()
-            self.json_schema_validators['jsd_da455f4be5b75126ba9970c7cc54c7db_v3_1_6_0'] =\
-                JSONSchemaValidatorDa455F4BE5B75126Ba9970C7Cc54C7Db_v3_1_6_0()
-            self.json_schema_validators['jsd_da593242978c5047bb6b62b7f9475326_v3_1_6_0'] =\
-                JSONSchemaValidatorDa593242978C5047Bb6B62B7F9475326_v3_1_6_0()
-            self.json_schema_validators['jsd_db0f8e07ae0d5ecc83e34d29e5e57b41_v3_1_6_0'] =\
-                JSONSchemaValidatorDb0F8E07Ae0D5Ecc83E34D29E5E57B41_v3_1_6_0()
-            self.json_schema_validators['jsd_dc254215fdf25cd5b7ba797e8f8faebf_v3_1_6_0'] =\
-                JSONSchemaValidatorDc254215Fdf25Cd5B7Ba797E8F8Faebf_v3_1_6_0()
-            self.json_schema_validators['jsd_dc5d352dfaeb5b17800b0af2858c2f5c_v3_1_6_0'] =\
-                JSONSchemaValidatorDc5D352DFaeb5B17800B0Af2858C2F5C_v3_1_6_0()
-            self.json_schema_validators['jsd_dcc43be0514e50fea80cfa827f13ee5c_v3_1_6_0'] =\
-                JSONSchemaValidatorDcc43Be0514E50FeA80CFa827F13Ee5C_v3_1_6_0()
-            self.json_schema_validators['jsd_dda852745acd5ce5a97b0cfdf0de2fd2_v3_1_6_0'] =\
-                JSONSchemaValidatorDda852745Acd5Ce5A97B0Cfdf0De2Fd2_v3_1_6_0()
-            self.json_schema_validators['jsd_de1769e2886b5948b408100225b4a034_v3_1_6_0'] =\
-                JSONSchemaValidatorDe1769E2886B5948B408100225B4A034_v3_1_6_0()
-            self.json_schema_validators['jsd_de24de1222a4500cab78b4b34ee299f2_v3_1_6_0'] =\
-                JSONSchemaValidatorDe24De1222A4500CAb78B4B34Ee299F2_v3_1_6_0()
-            self.json_schema_validators['jsd_deb34387d0235811a90985711be9fe2e_v3_1_6_0'] =\
-                JSONSchemaValidatorDeb34387D0235811A90985711Be9Fe2E_v3_1_6_0()
-            self.json_schema_validators['jsd_dec1857f1585557eb39e12a9c93ef985_v3_1_6_0'] =\
-                JSONSchemaValidatorDec1857F1585557EB39E12A9C93Ef985_v3_1_6_0()
-            self.json_schema_validators['jsd_ded95db0af275081801b54e0ce105c71_v3_1_6_0'] =\
-                JSONSchemaValidatorDed95Db0Af275081801B54E0Ce105C71_v3_1_6_0()
-            self.json_schema_validators['jsd_df26f516755a50b5b5477324cf5cb649_v3_1_6_0'] =\
-                JSONSchemaValidatorDf26F516755A50B5B5477324Cf5Cb649_v3_1_6_0()
-            self.json_schema_validators['jsd_df9ec5aa58815a849b4853b223343e5e_v3_1_6_0'] =\
-                JSONSchemaValidatorDf9Ec5Aa58815A849B4853B223343E5E_v3_1_6_0()
-            self.json_schema_validators['jsd_dfda5beca4cc5437876bff366493ebf0_v3_1_6_0'] =\
-                JSONSchemaValidatorDfda5BecA4Cc5437876BFf366493Ebf0_v3_1_6_0()
-            self.json_schema_validators['jsd_e0c7b28d55c85d49a84c1403ca14bd5f_v3_1_6_0'] =\
-                JSONSchemaValidatorE0C7B28D55C85D49A84C1403Ca14Bd5F_v3_1_6_0()
-            self.json_schema_validators['jsd_e11daa984f535a08bc1eb01bc84bc399_v3_1_6_0'] =\
-                JSONSchemaValidatorE11Daa984F535A08Bc1EB01Bc84Bc399_v3_1_6_0()
-            self.json_schema_validators['jsd_e1781a990c6b5a4b895d56bcfda2b7cb_v3_1_6_0'] =\
-                JSONSchemaValidatorE1781A990C6B5A4B895D56Bcfda2B7Cb_v3_1_6_0()
-            self.json_schema_validators['jsd_e1b8c435195d56368c24a54dcce007d0_v3_1_6_0'] =\
-                JSONSchemaValidatorE1B8C435195D56368C24A54Dcce007D0_v3_1_6_0()
-            self.json_schema_validators['jsd_e2ec291c2e775df3895aadc639713eea_v3_1_6_0'] =\
-                JSONSchemaValidatorE2Ec291C2E775Df3895AAdc639713Eea_v3_1_6_0()
-            self.json_schema_validators['jsd_e2f9718de3d050819cdc6355a3a43200_v3_1_6_0'] =\
-                JSONSchemaValidatorE2F9718DE3D050819Cdc6355A3A43200_v3_1_6_0()
-            self.json_schema_validators['jsd_e328f7d015535897877f3ecb0c927453_v3_1_6_0'] =\
-                JSONSchemaValidatorE328F7D015535897877F3Ecb0C927453_v3_1_6_0()
-            self.json_schema_validators['jsd_e3934b0fb68a5ff787e65e9b7c8e6296_v3_1_6_0'] =\
-                JSONSchemaValidatorE3934B0FB68A5Ff787E65E9B7C8E6296_v3_1_6_0()
-            self.json_schema_validators['jsd_e3d7ad943d3a50fb8c3be7327669e557_v3_1_6_0'] =\
-                JSONSchemaValidatorE3D7Ad943D3A50Fb8C3BE7327669E557_v3_1_6_0()
-            self.json_schema_validators['jsd_e3e170003d865b9a8d76cbe1d2f268be_v3_1_6_0'] =\
-                JSONSchemaValidatorE3E170003D865B9A8D76Cbe1D2F268Be_v3_1_6_0()
-            self.json_schema_validators['jsd_e4a09bf566f35babad9e27f5eb61a86d_v3_1_6_0'] =\
-                JSONSchemaValidatorE4A09Bf566F35BabAd9E27F5Eb61A86D_v3_1_6_0()
-            self.json_schema_validators['jsd_e4d083d956805f63b970be543c34eb0e_v3_1_6_0'] =\
-                JSONSchemaValidatorE4D083D956805F63B970Be543C34Eb0E_v3_1_6_0()
-            self.json_schema_validators['jsd_e4ddf9b60efb59ac8f6a200a563d9d72_v3_1_6_0'] =\
-                JSONSchemaValidatorE4Ddf9B60Efb59Ac8F6A200A563D9D72_v3_1_6_0()
-            self.json_schema_validators['jsd_e6c22549e5145c4892d0bd3b97614e07_v3_1_6_0'] =\
-                JSONSchemaValidatorE6C22549E5145C4892D0Bd3B97614E07_v3_1_6_0()
-            self.json_schema_validators['jsd_e6eed78cb55d51a1bfe669729df25689_v3_1_6_0'] =\
-                JSONSchemaValidatorE6Eed78CB55D51A1Bfe669729Df25689_v3_1_6_0()
-            self.json_schema_validators['jsd_e7af120721c7519a84b13bbe4a1a0362_v3_1_6_0'] =\
-                JSONSchemaValidatorE7Af120721C7519A84B13Bbe4A1A0362_v3_1_6_0()
-            self.json_schema_validators['jsd_e8271b05b62c54609f74b4f2f373ad5a_v3_1_6_0'] =\
-                JSONSchemaValidatorE8271B05B62C54609F74B4F2F373Ad5A_v3_1_6_0()
-            self.json_schema_validators['jsd_e85b40c5ca055f4c82281617a8f95644_v3_1_6_0'] =\
-                JSONSchemaValidatorE85B40C5Ca055F4C82281617A8F95644_v3_1_6_0()
-            self.json_schema_validators['jsd_ea4363569a9d58779c2bfc05b6e45423_v3_1_6_0'] =\
-                JSONSchemaValidatorEa4363569A9D58779C2BFc05B6E45423_v3_1_6_0()
-            self.json_schema_validators['jsd_ea59df3daf2a57a0b48044cc49c8a1ca_v3_1_6_0'] =\
-                JSONSchemaValidatorEa59Df3DAf2A57A0B48044Cc49C8A1Ca_v3_1_6_0()
-            self.json_schema_validators['jsd_ea5f116c0cd152bbb4a92c043738ea57_v3_1_6_0'] =\
-                JSONSchemaValidatorEa5F116C0Cd152BbB4A92C043738Ea57_v3_1_6_0()
-            self.json_schema_validators['jsd_eab4d187be085cac8a53971def40bee0_v3_1_6_0'] =\
-                JSONSchemaValidatorEab4D187Be085Cac8A53971Def40Bee0_v3_1_6_0()
-            self.json_schema_validators['jsd_eb4a05f61e475ad0b9e74f963f27ea1d_v3_1_6_0'] =\
-                JSONSchemaValidatorEb4A05F61E475Ad0B9E74F963F27Ea1D_v3_1_6_0()
-            self.json_schema_validators['jsd_ecb990ad7f24519397dd8d6c88de0067_v3_1_6_0'] =\
-                JSONSchemaValidatorEcb990Ad7F24519397Dd8D6C88De0067_v3_1_6_0()
-            self.json_schema_validators['jsd_ecdb2d14c29b5bf3ad79ed2e3cc70715_v3_1_6_0'] =\
-                JSONSchemaValidatorEcdb2D14C29B5Bf3Ad79Ed2E3Cc70715_v3_1_6_0()
-            self.json_schema_validators['jsd_ed266e6eda225aedbf581508635da822_v3_1_6_0'] =\
-                JSONSchemaValidatorEd266E6EDa225AedBf581508635Da822_v3_1_6_0()
-            self.json_schema_validators['jsd_ed9125b257ea54b79ef2db2d8ebd9d00_v3_1_6_0'] =\
-                JSONSchemaValidatorEd9125B257Ea54B79Ef2Db2D8Ebd9D00_v3_1_6_0()
-            self.json_schema_validators['jsd_edac26fbcb77539ebe8bc5bd4b49055b_v3_1_6_0'] =\
-                JSONSchemaValidatorEdac26FbCb77539EBe8BC5Bd4B49055B_v3_1_6_0()
-            self.json_schema_validators['jsd_edf997bb4bcc5dd6baca80647d8a47ce_v3_1_6_0'] =\
-                JSONSchemaValidatorEdf997Bb4Bcc5Dd6Baca80647D8A47Ce_v3_1_6_0()
-            self.json_schema_validators['jsd_eeb595d249295989a4917261463ea82a_v3_1_6_0'] =\
-                JSONSchemaValidatorEeb595D249295989A4917261463Ea82A_v3_1_6_0()
-            self.json_schema_validators['jsd_eecf4323cb285985be72a7e061891059_v3_1_6_0'] =\
-                JSONSchemaValidatorEecf4323Cb285985Be72A7E061891059_v3_1_6_0()
-            self.json_schema_validators['jsd_ef94c2c20ba15fd38e129ac75067de1e_v3_1_6_0'] =\
-                JSONSchemaValidatorEf94C2C20Ba15Fd38E129Ac75067De1E_v3_1_6_0()
-            self.json_schema_validators['jsd_f08eb586113e597a91b1658297570934_v3_1_6_0'] =\
-                JSONSchemaValidatorF08Eb586113E597A91B1658297570934_v3_1_6_0()
-            self.json_schema_validators['jsd_f0942fbb79f855e889d60777f41ea944_v3_1_6_0'] =\
-                JSONSchemaValidatorF0942Fbb79F855E889D60777F41Ea944_v3_1_6_0()
-            self.json_schema_validators['jsd_f0f7b6e1e4e159e7a40001fc3e649dfc_v3_1_6_0'] =\
-                JSONSchemaValidatorF0F7B6E1E4E159E7A40001Fc3E649Dfc_v3_1_6_0()
-            self.json_schema_validators['jsd_f15aaad792fc57fd89c880afc3b84dc4_v3_1_6_0'] =\
-                JSONSchemaValidatorF15Aaad792Fc57Fd89C880Afc3B84Dc4_v3_1_6_0()
-            self.json_schema_validators['jsd_f200dc9a10d25beab1243a5b29f99c7d_v3_1_6_0'] =\
-                JSONSchemaValidatorF200Dc9A10D25BeaB1243A5B29F99C7D_v3_1_6_0()
-            self.json_schema_validators['jsd_f20eecc6e2d95a03a9e8961cd4337467_v3_1_6_0'] =\
-                JSONSchemaValidatorF20Eecc6E2D95A03A9E8961Cd4337467_v3_1_6_0()
-            self.json_schema_validators['jsd_f210ff2d89425b4790ce56f19da7be92_v3_1_6_0'] =\
-                JSONSchemaValidatorF210Ff2D89425B4790Ce56F19Da7Be92_v3_1_6_0()
-            self.json_schema_validators['jsd_f325b2c7e429566ba5ed9ae8253b5bef_v3_1_6_0'] =\
-                JSONSchemaValidatorF325B2C7E429566BA5Ed9Ae8253B5Bef_v3_1_6_0()
-            self.json_schema_validators['jsd_f667322836d5527482ad2100bec7feb4_v3_1_6_0'] =\
-                JSONSchemaValidatorF667322836D5527482Ad2100Bec7Feb4_v3_1_6_0()
-            self.json_schema_validators['jsd_f6a4086c00f45dc5a634f0b8db5cdfd3_v3_1_6_0'] =\
-                JSONSchemaValidatorF6A4086C00F45Dc5A634F0B8Db5Cdfd3_v3_1_6_0()
-            self.json_schema_validators['jsd_f6f9dde38ce458fcaf27ffd4f84bfe68_v3_1_6_0'] =\
-                JSONSchemaValidatorF6F9Dde38Ce458FcAf27Ffd4F84Bfe68_v3_1_6_0()
-            self.json_schema_validators['jsd_f7a0cdee493d597e816e012afbcc928d_v3_1_6_0'] =\
-                JSONSchemaValidatorF7A0Cdee493D597E816E012Afbcc928D_v3_1_6_0()
-            self.json_schema_validators['jsd_f8b4842604b65658afb34b4f124db469_v3_1_6_0'] =\
-                JSONSchemaValidatorF8B4842604B65658Afb34B4F124Db469_v3_1_6_0()
-            self.json_schema_validators['jsd_f924b4c27d18500b9b23df516b55c182_v3_1_6_0'] =\
-                JSONSchemaValidatorF924B4C27D18500B9B23Df516B55C182_v3_1_6_0()
-            self.json_schema_validators['jsd_f9492367570c5f009cf8b5955790e87c_v3_1_6_0'] =\
-                JSONSchemaValidatorF9492367570C5F009Cf8B5955790E87C_v3_1_6_0()
-            self.json_schema_validators['jsd_f95014e3b3385f21afa39325f3508427_v3_1_6_0'] =\
-                JSONSchemaValidatorF95014E3B3385F21Afa39325F3508427_v3_1_6_0()
-            self.json_schema_validators['jsd_f99c96c3a9b45ddaabc2c75ff8efa67f_v3_1_6_0'] =\
-                JSONSchemaValidatorF99C96C3A9B45DdaAbc2C75Ff8Efa67F_v3_1_6_0()
-            self.json_schema_validators['jsd_fa3975be5af25501abb40339d96917eb_v3_1_6_0'] =\
-                JSONSchemaValidatorFa3975Be5Af25501Abb40339D96917Eb_v3_1_6_0()
-            self.json_schema_validators['jsd_fa8fb3bdbffe5958858f20447dcb3ca5_v3_1_6_0'] =\
-                JSONSchemaValidatorFa8Fb3BdBffe5958858F20447Dcb3Ca5_v3_1_6_0()
-            self.json_schema_validators['jsd_fb5e152d4d3d59f5afd92f717f3a1eea_v3_1_6_0'] =\
-                JSONSchemaValidatorFb5E152D4D3D59F5Afd92F717F3A1Eea_v3_1_6_0()
-            self.json_schema_validators['jsd_fbdd94fbecd256c08e1d9f6e1a7657ac_v3_1_6_0'] =\
-                JSONSchemaValidatorFbdd94FbEcd256C08E1D9F6E1A7657Ac_v3_1_6_0()
-            self.json_schema_validators['jsd_fc416739f3c655ed911884aec0130e83_v3_1_6_0'] =\
-                JSONSchemaValidatorFc416739F3C655Ed911884Aec0130E83_v3_1_6_0()
-            self.json_schema_validators['jsd_fc8410781af357b6be17a2104ce5efb1_v3_1_6_0'] =\
-                JSONSchemaValidatorFc8410781Af357B6Be17A2104Ce5Efb1_v3_1_6_0()
-            self.json_schema_validators['jsd_fd488ff002115f3b8f0ee165e5347609_v3_1_6_0'] =\
-                JSONSchemaValidatorFd488Ff002115F3B8F0EE165E5347609_v3_1_6_0()
-            self.json_schema_validators['jsd_fdbe4ec3e9f252a988404dc94250b80d_v3_1_6_0'] =\
-                JSONSchemaValidatorFdbe4Ec3E9F252A988404Dc94250B80D_v3_1_6_0()
-            self.json_schema_validators['jsd_fdfc828270d950ecb75480fe03f7d573_v3_1_6_0'] =\
-                JSONSchemaValidatorFdfc828270D950EcB75480Fe03F7D573_v3_1_6_0()
-            self.json_schema_validators['jsd_ff5bf5a67c6c5c0aa9e7ba84c088e1a6_v3_1_6_0'] =\
-                JSONSchemaValidatorFf5Bf5A67C6C5C0AA9E7Ba84C088E1A6_v3_1_6_0()
-            self.json_schema_validators['jsd_ffd2fefb57d5523c87a5d941eb93ddc3_v3_1_6_0'] =\
-                JSONSchemaValidatorFfd2Fefb57D5523C87A5D941Eb93Ddc3_v3_1_6_0()
+        """Eagerly load every validator of a DNA Center version.
+
+        Validators are otherwise imported and compiled on first use.
 
+        Args:
+            version(str).
+        """
+        package = "{}.validators.{}".format(__package__, _version_package(version))
+        try:
+            module = importlib.import_module(package)
+        except ImportError:
+            return
+        for module_info in pkgutil.iter_modules(module.__path__):
+            model = "{}_{}".format(module_info.name, _version_package(version))
+            validator = get_json_schema_validator(version, model)
+            if validator is not None:
+                self.json_schema_validators[model] = self._timed(model, validator)
 
     def json_schema_validate(self, model):
         """Factory function for creating JSONSchemaValidator objects.
 
+        Models without a schema share the NO_OP_VALIDATOR.
+
         Args:
             model(str).
 
@@ -10481,4 +214,11 @@ class SchemaValidator:
         Raises:
             MalformedRequest.
         """
-        return self.json_schema_validators.get(model, JSONSchemaValidator())
+        validator = self.json_schema_validators.get(model)
+        if validator is None:
+            validator = get_json_schema_validator(self.version, model)
+            if validator is None:
+                return NO_OP_VALIDATOR
+            validator = self._timed(model, validator)
+            self.json_schema_validators[model] = validator
+        return validator
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA66Db26DF529597C84C2A15Ea2D632Ce(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorA66Db26DF529597C84C2A15Ea2D632Ce(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA66Db26DF529597C84C2A15Ea2D632Ce, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA9136D5513985F15E91A19Da66C(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorA9136D5513985F15E91A19Da66C(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA9136D5513985F15E91A19Da66C, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
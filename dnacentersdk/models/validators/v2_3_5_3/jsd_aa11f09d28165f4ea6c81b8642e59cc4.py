@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAa11F09D28165F4EA6C81B8642E59Cc4(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorAa11F09D28165F4EA6C81B8642E59Cc4(object):
 
     def __init__(self):
         super(JSONSchemaValidatorAa11F09D28165F4EA6C81B8642E59Cc4, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAd0Cce45817862BEbfc839Bf5Ae(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorAd0Cce45817862BEbfc839Bf5Ae(object):
 
     def __init__(self):
         super(JSONSchemaValidatorAd0Cce45817862BEbfc839Bf5Ae, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
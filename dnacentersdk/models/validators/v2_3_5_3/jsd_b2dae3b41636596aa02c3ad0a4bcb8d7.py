@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB2Dae3B41636596AA02C3Ad0A4Bcb8D7(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorB2Dae3B41636596AA02C3Ad0A4Bcb8D7(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB2Dae3B41636596AA02C3Ad0A4Bcb8D7, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB2F15D0C54C2862A60A904289Ddd(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorB2F15D0C54C2862A60A904289Ddd(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB2F15D0C54C2862A60A904289Ddd, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
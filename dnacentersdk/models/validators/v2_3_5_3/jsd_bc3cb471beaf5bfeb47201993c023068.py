@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBc3Cb471Beaf5BfeB47201993C023068(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorBc3Cb471Beaf5BfeB47201993C023068(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBc3Cb471Beaf5BfeB47201993C023068, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBd31Fcbd1Ecd5A2C8B812088B27Bfcea(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorBd31Fcbd1Ecd5A2C8B812088B27Bfcea(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBd31Fcbd1Ecd5A2C8B812088B27Bfcea, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
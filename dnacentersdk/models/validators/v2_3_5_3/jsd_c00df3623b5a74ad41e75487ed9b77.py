@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC00Df3623B5A74Ad41E75487Ed9B77(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorC00Df3623B5A74Ad41E75487Ed9B77(object):
 
     def __init__(self):
         super(JSONSchemaValidatorC00Df3623B5A74Ad41E75487Ed9B77, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC991Ce0B0F058A08C863A4Abdfc70A6(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorC991Ce0B0F058A08C863A4Abdfc70A6(object):
 
     def __init__(self):
         super(JSONSchemaValidatorC991Ce0B0F058A08C863A4Abdfc70A6, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCc72E307E5Df50C48Ce57370F27395A0(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorCc72E307E5Df50C48Ce57370F27395A0(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCc72E307E5Df50C48Ce57370F27395A0, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
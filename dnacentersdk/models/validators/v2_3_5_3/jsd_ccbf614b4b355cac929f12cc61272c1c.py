@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCcbf614B4B355Cac929F12Cc61272C1C(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorCcbf614B4B355Cac929F12Cc61272C1C(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCcbf614B4B355Cac929F12Cc61272C1C, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
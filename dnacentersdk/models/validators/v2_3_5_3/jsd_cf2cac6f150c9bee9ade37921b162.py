@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCf2CaC6F150C9Bee9Ade37921B162(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorCf2CaC6F150C9Bee9Ade37921B162(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCf2CaC6F150C9Bee9Ade37921B162, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
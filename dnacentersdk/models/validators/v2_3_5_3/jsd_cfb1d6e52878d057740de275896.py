@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCfb1D6E52878D057740De275896(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorCfb1D6E52878D057740De275896(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCfb1D6E52878D057740De275896, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD1D42Ef2F1895A82A2830Bf1353E6Baa(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorD1D42Ef2F1895A82A2830Bf1353E6Baa(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD1D42Ef2F1895A82A2830Bf1353E6Baa, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD7161B33157DbA957Ba18Eda440C2(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorD7161B33157DbA957Ba18Eda440C2(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD7161B33157DbA957Ba18Eda440C2, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD8Fc92DDeab597EBb50Ea003A6D46Bd(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorD8Fc92DDeab597EBb50Ea003A6D46Bd(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD8Fc92DDeab597EBb50Ea003A6D46Bd, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD9227Adc5F02B7Cd264Af7255D19(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorD9227Adc5F02B7Cd264Af7255D19(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD9227Adc5F02B7Cd264Af7255D19, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDcc43Be0514E50FeA80CFa827F13Ee5C(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorDcc43Be0514E50FeA80CFa827F13Ee5C(object):
 
     def __init__(self):
         super(JSONSchemaValidatorDcc43Be0514E50FeA80CFa827F13Ee5C, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
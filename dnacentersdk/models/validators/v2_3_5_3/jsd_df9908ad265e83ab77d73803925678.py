@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDf9908Ad265E83Ab77D73803925678(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorDf9908Ad265E83Ab77D73803925678(object):
 
     def __init__(self):
         super(JSONSchemaValidatorDf9908Ad265E83Ab77D73803925678, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE2202E5F7586E68778Ed7772B1(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorE2202E5F7586E68778Ed7772B1(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE2202E5F7586E68778Ed7772B1, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE22C99A82F5764828810Acb45E7A9E(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorE22C99A82F5764828810Acb45E7A9E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE22C99A82F5764828810Acb45E7A9E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
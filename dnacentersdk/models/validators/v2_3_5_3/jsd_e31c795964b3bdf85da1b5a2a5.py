@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE31C795964B3BdF85Da1B5A2A5(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorE31C795964B3BdF85Da1B5A2A5(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE31C795964B3BdF85Da1B5A2A5, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE3934B0FB68A5Ff787E65E9B7C8E6296(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorE3934B0FB68A5Ff787E65E9B7C8E6296(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE3934B0FB68A5Ff787E65E9B7C8E6296, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE3D7Ad943D3A50Fb8C3BE7327669E557(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorE3D7Ad943D3A50Fb8C3BE7327669E557(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE3D7Ad943D3A50Fb8C3BE7327669E557, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
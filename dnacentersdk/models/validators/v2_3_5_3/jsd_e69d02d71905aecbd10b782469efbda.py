@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE69D02D71905AecBd10B782469Efbda(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorE69D02D71905AecBd10B782469Efbda(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE69D02D71905AecBd10B782469Efbda, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE6Ea8C5D425Cf9Ac77006F5593725F(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorE6Ea8C5D425Cf9Ac77006F5593725F(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE6Ea8C5D425Cf9Ac77006F5593725F, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
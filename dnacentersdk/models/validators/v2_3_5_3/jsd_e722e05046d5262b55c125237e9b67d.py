@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE722E05046D5262B55C125237E9B67D(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorE722E05046D5262B55C125237E9B67D(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE722E05046D5262B55C125237E9B67D, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE8271B05B62C54609F74B4F2F373Ad5A(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorE8271B05B62C54609F74B4F2F373Ad5A(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE8271B05B62C54609F74B4F2F373Ad5A, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
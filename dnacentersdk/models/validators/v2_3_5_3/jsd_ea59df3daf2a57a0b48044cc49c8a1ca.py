@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEa59Df3DAf2A57A0B48044Cc49C8A1Ca(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorEa59Df3DAf2A57A0B48044Cc49C8A1Ca(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEa59Df3DAf2A57A0B48044Cc49C8A1Ca, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
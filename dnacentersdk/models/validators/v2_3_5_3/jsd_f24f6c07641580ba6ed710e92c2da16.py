@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF24F6C07641580BA6Ed710E92C2Da16(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorF24F6C07641580BA6Ed710E92C2Da16(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF24F6C07641580BA6Ed710E92C2Da16, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
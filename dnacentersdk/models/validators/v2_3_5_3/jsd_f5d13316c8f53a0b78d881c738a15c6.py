@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF5D13316C8F53A0B78D881C738A15C6(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorF5D13316C8F53A0B78D881C738A15C6(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF5D13316C8F53A0B78D881C738A15C6, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF9492367570C5F009Cf8B5955790E87C(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorF9492367570C5F009Cf8B5955790E87C(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF9492367570C5F009Cf8B5955790E87C, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
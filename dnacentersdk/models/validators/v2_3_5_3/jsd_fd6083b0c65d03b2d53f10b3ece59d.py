@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFd6083B0C65D03B2D53F10B3Ece59D(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorFd6083B0C65D03B2D53F10B3Ece59D(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFd6083B0C65D03B2D53F10B3Ece59D, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFdd2Af215B9B8327A3E24A3Dea89(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorFdd2Af215B9B8327A3E24A3Dea89(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFdd2Af215B9B8327A3E24A3Dea89, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA0A8D545698D1D59A9Be90E51(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorA0A8D545698D1D59A9Be90E51(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA0A8D545698D1D59A9Be90E51, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA2131Eae5C1D8E73Cd55Eebf6A83(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorA2131Eae5C1D8E73Cd55Eebf6A83(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA2131Eae5C1D8E73Cd55Eebf6A83, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA352F6280E445075B3Ea7Cbf868C2D94(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorA352F6280E445075B3Ea7Cbf868C2D94(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA352F6280E445075B3Ea7Cbf868C2D94, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA3A1Bf404Bf5772828F66F1E10F074D(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorA3A1Bf404Bf5772828F66F1E10F074D(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA3A1Bf404Bf5772828F66F1E10F074D, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA3D2432AE8C55Fe793C5180D8D5Fce25(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorA3D2432AE8C55Fe793C5180D8D5Fce25(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA3D2432AE8C55Fe793C5180D8D5Fce25, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
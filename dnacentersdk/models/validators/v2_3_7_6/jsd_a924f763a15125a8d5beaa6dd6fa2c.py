@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA924F763A15125A8D5Beaa6Dd6Fa2C(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorA924F763A15125A8D5Beaa6Dd6Fa2C(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA924F763A15125A8D5Beaa6Dd6Fa2C, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
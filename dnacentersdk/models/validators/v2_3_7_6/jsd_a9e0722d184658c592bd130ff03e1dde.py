@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA9E0722D184658C592Bd130Ff03E1Dde(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorA9E0722D184658C592Bd130Ff03E1Dde(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA9E0722D184658C592Bd130Ff03E1Dde, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAa663Ca2Bd1F5A3DB67C405987495112(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorAa663Ca2Bd1F5A3DB67C405987495112(object):
 
     def __init__(self):
         super(JSONSchemaValidatorAa663Ca2Bd1F5A3DB67C405987495112, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAac9BA55E5043B4D5E0995C566Dce(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorAac9BA55E5043B4D5E0995C566Dce(object):
 
     def __init__(self):
         super(JSONSchemaValidatorAac9BA55E5043B4D5E0995C566Dce, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
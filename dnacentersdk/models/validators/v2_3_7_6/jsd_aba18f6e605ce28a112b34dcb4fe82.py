@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAba18F6E605Ce28A112B34Dcb4Fe82(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorAba18F6E605Ce28A112B34Dcb4Fe82(object):
 
     def __init__(self):
         super(JSONSchemaValidatorAba18F6E605Ce28A112B34Dcb4Fe82, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
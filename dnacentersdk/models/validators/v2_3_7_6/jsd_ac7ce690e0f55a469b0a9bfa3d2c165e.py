@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAc7Ce690E0F55A469B0A9Bfa3D2C165E(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorAc7Ce690E0F55A469B0A9Bfa3D2C165E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorAc7Ce690E0F55A469B0A9Bfa3D2C165E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
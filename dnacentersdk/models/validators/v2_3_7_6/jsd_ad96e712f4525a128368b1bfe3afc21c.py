@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAd96E712F4525A128368B1Bfe3Afc21C(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorAd96E712F4525A128368B1Bfe3Afc21C(object):
 
     def __init__(self):
         super(JSONSchemaValidatorAd96E712F4525A128368B1Bfe3Afc21C, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
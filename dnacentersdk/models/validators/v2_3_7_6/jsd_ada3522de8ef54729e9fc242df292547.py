@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAda3522DE8Ef54729E9FC242Df292547(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorAda3522DE8Ef54729E9FC242Df292547(object):
 
     def __init__(self):
         super(JSONSchemaValidatorAda3522DE8Ef54729E9FC242Df292547, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
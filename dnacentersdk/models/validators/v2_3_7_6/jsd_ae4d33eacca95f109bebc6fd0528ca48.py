@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAe4D33EaCca95F109BebC6Fd0528Ca48(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorAe4D33EaCca95F109BebC6Fd0528Ca48(object):
 
     def __init__(self):
         super(JSONSchemaValidatorAe4D33EaCca95F109BebC6Fd0528Ca48, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAe57085565E551594Fc05B4Db6A64Af(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorAe57085565E551594Fc05B4Db6A64Af(object):
 
     def __init__(self):
         super(JSONSchemaValidatorAe57085565E551594Fc05B4Db6A64Af, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAf29516F0C8591DA2A92523B5Ab3386(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorAf29516F0C8591DA2A92523B5Ab3386(object):
 
     def __init__(self):
         super(JSONSchemaValidatorAf29516F0C8591DA2A92523B5Ab3386, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
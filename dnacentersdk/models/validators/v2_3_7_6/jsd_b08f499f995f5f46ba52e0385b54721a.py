@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB08F499F995F5F46Ba52E0385B54721A(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorB08F499F995F5F46Ba52E0385B54721A(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB08F499F995F5F46Ba52E0385B54721A, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
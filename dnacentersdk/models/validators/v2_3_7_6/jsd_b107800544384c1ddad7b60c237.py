@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB107800544384C1Ddad7B60C237(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorB107800544384C1Ddad7B60C237(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB107800544384C1Ddad7B60C237, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB119A4D455E35Cc3B2Cc6695A045Cbfa(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorB119A4D455E35Cc3B2Cc6695A045Cbfa(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB119A4D455E35Cc3B2Cc6695A045Cbfa, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB11Aa4De387251C794665E030Fa815Da(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorB11Aa4De387251C794665E030Fa815Da(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB11Aa4De387251C794665E030Fa815Da, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
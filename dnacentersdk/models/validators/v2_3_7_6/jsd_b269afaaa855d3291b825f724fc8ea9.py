@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB269AfaAa855D3291B825F724Fc8Ea9(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorB269AfaAa855D3291B825F724Fc8Ea9(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB269AfaAa855D3291B825F724Fc8Ea9, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
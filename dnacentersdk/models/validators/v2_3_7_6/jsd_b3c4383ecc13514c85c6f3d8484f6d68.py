@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB3C4383ECc13514C85C6F3D8484F6D68(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorB3C4383ECc13514C85C6F3D8484F6D68(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB3C4383ECc13514C85C6F3D8484F6D68, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB46A141650DeBf5946262E8A0961(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorB46A141650DeBf5946262E8A0961(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB46A141650DeBf5946262E8A0961, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB7079A38844E56Dd8F1B6B876880A02E(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorB7079A38844E56Dd8F1B6B876880A02E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB7079A38844E56Dd8F1B6B876880A02E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
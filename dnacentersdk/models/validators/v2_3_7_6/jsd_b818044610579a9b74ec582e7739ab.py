@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB818044610579A9B74Ec582E7739Ab(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorB818044610579A9B74Ec582E7739Ab(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB818044610579A9B74Ec582E7739Ab, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
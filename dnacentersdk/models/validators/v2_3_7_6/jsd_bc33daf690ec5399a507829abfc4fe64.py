@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBc33Daf690Ec5399A507829Abfc4Fe64(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorBc33Daf690Ec5399A507829Abfc4Fe64(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBc33Daf690Ec5399A507829Abfc4Fe64, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
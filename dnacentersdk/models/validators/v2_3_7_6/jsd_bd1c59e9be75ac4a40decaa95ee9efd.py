@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBd1C59E9Be75Ac4A40DEcaa95Ee9Efd(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorBd1C59E9Be75Ac4A40DEcaa95Ee9Efd(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBd1C59E9Be75Ac4A40DEcaa95Ee9Efd, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBd421C1Db8C5DeaA3301B8Cc73Dd541(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorBd421C1Db8C5DeaA3301B8Cc73Dd541(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBd421C1Db8C5DeaA3301B8Cc73Dd541, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBdcb514AE33B571795E4A42147D11F87(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorBdcb514AE33B571795E4A42147D11F87(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBdcb514AE33B571795E4A42147D11F87, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBf80823752BaBa63A8849Fd521Cd(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorBf80823752BaBa63A8849Fd521Cd(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBf80823752BaBa63A8849Fd521Cd, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
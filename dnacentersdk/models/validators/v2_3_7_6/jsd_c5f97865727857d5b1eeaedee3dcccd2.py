@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC5F97865727857D5B1EeAedee3Dcccd2(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorC5F97865727857D5B1EeAedee3Dcccd2(object):
 
     def __init__(self):
         super(JSONSchemaValidatorC5F97865727857D5B1EeAedee3Dcccd2, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC90C04B8356Cf9974957E0F9516D0(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorC90C04B8356Cf9974957E0F9516D0(object):
 
     def __init__(self):
         super(JSONSchemaValidatorC90C04B8356Cf9974957E0F9516D0, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC9B5B83E67195B649077A05E42897Cc4(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorC9B5B83E67195B649077A05E42897Cc4(object):
 
     def __init__(self):
         super(JSONSchemaValidatorC9B5B83E67195B649077A05E42897Cc4, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
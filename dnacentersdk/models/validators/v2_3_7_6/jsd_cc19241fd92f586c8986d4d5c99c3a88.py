@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCc19241FD92F586C8986D4D5C99C3A88(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorCc19241FD92F586C8986D4D5C99C3A88(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCc19241FD92F586C8986D4D5C99C3A88, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCd16DAa50533EB0F5873B7601Abb2(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorCd16DAa50533EB0F5873B7601Abb2(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCd16DAa50533EB0F5873B7601Abb2, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCd2E825A78B6De087E991F6Fe0(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorCd2E825A78B6De087E991F6Fe0(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCd2E825A78B6De087E991F6Fe0, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCdc0BaFd4257E78D211A1F4120Bfa9(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorCdc0BaFd4257E78D211A1F4120Bfa9(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCdc0BaFd4257E78D211A1F4120Bfa9, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
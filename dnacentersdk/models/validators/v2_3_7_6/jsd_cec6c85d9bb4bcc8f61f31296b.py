@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCeC6C85D9BB4BcC8F61F31296B(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorCeC6C85D9BB4BcC8F61F31296B(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCeC6C85D9BB4BcC8F61F31296B, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
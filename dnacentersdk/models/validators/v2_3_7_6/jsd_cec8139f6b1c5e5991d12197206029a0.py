@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCec8139F6B1C5E5991D12197206029A0(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorCec8139F6B1C5E5991D12197206029A0(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCec8139F6B1C5E5991D12197206029A0, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
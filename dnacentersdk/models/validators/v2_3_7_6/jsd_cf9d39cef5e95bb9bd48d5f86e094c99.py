@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCf9D39CeF5E95Bb9Bd48D5F86E094C99(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorCf9D39CeF5E95Bb9Bd48D5F86E094C99(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCf9D39CeF5E95Bb9Bd48D5F86E094C99, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
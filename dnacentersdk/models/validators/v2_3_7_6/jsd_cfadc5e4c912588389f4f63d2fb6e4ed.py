@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCfadc5E4C912588389F4F63D2Fb6E4Ed(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorCfadc5E4C912588389F4F63D2Fb6E4Ed(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCfadc5E4C912588389F4F63D2Fb6E4Ed, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
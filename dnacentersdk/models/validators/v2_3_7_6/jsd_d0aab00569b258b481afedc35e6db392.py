@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD0Aab00569B258B481AfEdc35E6Db392(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorD0Aab00569B258B481AfEdc35E6Db392(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD0Aab00569B258B481AfEdc35E6Db392, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
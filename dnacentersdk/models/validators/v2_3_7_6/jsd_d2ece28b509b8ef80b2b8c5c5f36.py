@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD2EcE28B509B8Ef80B2B8C5C5F36(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorD2EcE28B509B8Ef80B2B8C5C5F36(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD2EcE28B509B8Ef80B2B8C5C5F36, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
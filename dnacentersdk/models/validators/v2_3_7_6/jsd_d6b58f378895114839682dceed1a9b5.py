@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD6B58F378895114839682Dceed1A9B5(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorD6B58F378895114839682Dceed1A9B5(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD6B58F378895114839682Dceed1A9B5, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
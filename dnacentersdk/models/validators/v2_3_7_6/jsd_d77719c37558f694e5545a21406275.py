@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD77719C37558F694E5545A21406275(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorD77719C37558F694E5545A21406275(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD77719C37558F694E5545A21406275, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDc254215Fdf25Cd5B7Ba797E8F8Faebf(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorDc254215Fdf25Cd5B7Ba797E8F8Faebf(object):
 
     def __init__(self):
         super(JSONSchemaValidatorDc254215Fdf25Cd5B7Ba797E8F8Faebf, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDc5D352DFaeb5B17800B0Af2858C2F5C(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorDc5D352DFaeb5B17800B0Af2858C2F5C(object):
 
     def __init__(self):
         super(JSONSchemaValidatorDc5D352DFaeb5B17800B0Af2858C2F5C, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
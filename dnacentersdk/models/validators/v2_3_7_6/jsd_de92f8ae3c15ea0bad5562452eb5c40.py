@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDe92F8AE3C15Ea0Bad5562452Eb5C40(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorDe92F8AE3C15Ea0Bad5562452Eb5C40(object):
 
     def __init__(self):
         super(JSONSchemaValidatorDe92F8AE3C15Ea0Bad5562452Eb5C40, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
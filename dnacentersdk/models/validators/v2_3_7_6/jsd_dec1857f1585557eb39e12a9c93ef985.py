@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDec1857F1585557EB39E12A9C93Ef985(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorDec1857F1585557EB39E12A9C93Ef985(object):
 
     def __init__(self):
         super(JSONSchemaValidatorDec1857F1585557EB39E12A9C93Ef985, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
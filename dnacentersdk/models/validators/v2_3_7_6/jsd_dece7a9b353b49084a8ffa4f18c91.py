@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDece7A9B353B49084A8Ffa4F18C91(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorDece7A9B353B49084A8Ffa4F18C91(object):
 
     def __init__(self):
         super(JSONSchemaValidatorDece7A9B353B49084A8Ffa4F18C91, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
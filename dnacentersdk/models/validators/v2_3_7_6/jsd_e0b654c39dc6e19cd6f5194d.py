@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE0B654C39Dc6E19Cd6F5194D(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorE0B654C39Dc6E19Cd6F5194D(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE0B654C39Dc6E19Cd6F5194D, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
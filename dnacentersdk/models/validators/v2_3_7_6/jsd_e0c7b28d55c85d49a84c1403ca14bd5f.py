@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE0C7B28D55C85D49A84C1403Ca14Bd5F(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorE0C7B28D55C85D49A84C1403Ca14Bd5F(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE0C7B28D55C85D49A84C1403Ca14Bd5F, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE1A76C121857A085149E62E56Caadd(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorE1A76C121857A085149E62E56Caadd(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE1A76C121857A085149E62E56Caadd, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE4F57E8F06856Ee9A7E490D01F7F692(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorE4F57E8F06856Ee9A7E490D01F7F692(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE4F57E8F06856Ee9A7E490D01F7F692, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
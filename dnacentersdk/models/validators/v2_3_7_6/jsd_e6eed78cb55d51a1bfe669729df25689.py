@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE6Eed78CB55D51A1Bfe669729Df25689(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorE6Eed78CB55D51A1Bfe669729Df25689(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE6Eed78CB55D51A1Bfe669729Df25689, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE85B40C5Ca055F4C82281617A8F95644(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorE85B40C5Ca055F4C82281617A8F95644(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE85B40C5Ca055F4C82281617A8F95644, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE86B65311B05D29Ba5EEa0D5F1Fd88F(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorE86B65311B05D29Ba5EEa0D5F1Fd88F(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE86B65311B05D29Ba5EEa0D5F1Fd88F, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
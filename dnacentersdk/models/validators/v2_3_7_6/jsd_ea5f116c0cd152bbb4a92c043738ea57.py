@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEa5F116C0Cd152BbB4A92C043738Ea57(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorEa5F116C0Cd152BbB4A92C043738Ea57(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEa5F116C0Cd152BbB4A92C043738Ea57, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEb4A05F61E475Ad0B9E74F963F27Ea1D(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorEb4A05F61E475Ad0B9E74F963F27Ea1D(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEb4A05F61E475Ad0B9E74F963F27Ea1D, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEca62Ef076B5627A85B2A5959613Fb8(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorEca62Ef076B5627A85B2A5959613Fb8(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEca62Ef076B5627A85B2A5959613Fb8, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEfa7F7A97B95F5885A00E6981B27B11(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorEfa7F7A97B95F5885A00E6981B27B11(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEfa7F7A97B95F5885A00E6981B27B11, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF019A24C5Ce50F082D081Bb72Ff4Df9(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorF019A24C5Ce50F082D081Bb72Ff4Df9(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF019A24C5Ce50F082D081Bb72Ff4Df9, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
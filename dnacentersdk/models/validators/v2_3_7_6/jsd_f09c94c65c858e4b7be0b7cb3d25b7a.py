@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF09C94C65C858E4B7Be0B7Cb3D25B7A(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorF09C94C65C858E4B7Be0B7Cb3D25B7A(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF09C94C65C858E4B7Be0B7Cb3D25B7A, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF210Ff2D89425B4790Ce56F19Da7Be92(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorF210Ff2D89425B4790Ce56F19Da7Be92(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF210Ff2D89425B4790Ce56F19Da7Be92, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
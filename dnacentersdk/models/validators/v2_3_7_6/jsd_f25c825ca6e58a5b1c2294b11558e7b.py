@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF25C825Ca6E58A5B1C2294B11558E7B(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorF25C825Ca6E58A5B1C2294B11558E7B(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF25C825Ca6E58A5B1C2294B11558E7B, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
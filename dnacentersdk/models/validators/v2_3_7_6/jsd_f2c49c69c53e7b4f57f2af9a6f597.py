@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF2C49C69C53E7B4F57F2Af9A6F597(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorF2C49C69C53E7B4F57F2Af9A6F597(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF2C49C69C53E7B4F57F2Af9A6F597, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF325B2C7E429566BA5Ed9Ae8253B5Bef(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorF325B2C7E429566BA5Ed9Ae8253B5Bef(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF325B2C7E429566BA5Ed9Ae8253B5Bef, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
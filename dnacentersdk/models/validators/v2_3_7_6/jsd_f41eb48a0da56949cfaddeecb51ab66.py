@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF41Eb48A0Da56949CfaDdeecb51Ab66(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorF41Eb48A0Da56949CfaDdeecb51Ab66(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF41Eb48A0Da56949CfaDdeecb51Ab66, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
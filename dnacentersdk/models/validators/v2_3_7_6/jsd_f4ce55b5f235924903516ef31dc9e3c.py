@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF4Ce55B5F235924903516Ef31Dc9E3C(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorF4Ce55B5F235924903516Ef31Dc9E3C(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF4Ce55B5F235924903516Ef31Dc9E3C, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF5602B2965E53B5BdDa193025A3Fc(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorF5602B2965E53B5BdDa193025A3Fc(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF5602B2965E53B5BdDa193025A3Fc, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF667322836D5527482Ad2100Bec7Feb4(object):
@@ -39,7 +40,7 @@ class JSONSchemaValidatorF667322836D5527482Ad2100Bec7Feb4(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF667322836D5527482Ad2100Bec7Feb4, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF6F9Dde38Ce458FcAf27Ffd4F84Bfe68(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorF6F9Dde38Ce458FcAf27Ffd4F84Bfe68(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF6F9Dde38Ce458FcAf27Ffd4F84Bfe68, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF751CC2F55767B34E4C890B3Fd36E(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorF751CC2F55767B34E4C890B3Fd36E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF751CC2F55767B34E4C890B3Fd36E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF790A930D452708353C374F5C0F90F(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorF790A930D452708353C374F5C0F90F(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF790A930D452708353C374F5C0F90F, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF8B4842604B65658Afb34B4F124Db469(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorF8B4842604B65658Afb34B4F124Db469(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF8B4842604B65658Afb34B4F124Db469, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF99C96C3A9B45DdaAbc2C75Ff8Efa67F(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorF99C96C3A9B45DdaAbc2C75Ff8Efa67F(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF99C96C3A9B45DdaAbc2C75Ff8Efa67F, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
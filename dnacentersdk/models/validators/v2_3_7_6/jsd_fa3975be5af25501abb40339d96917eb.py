@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFa3975Be5Af25501Abb40339D96917Eb(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorFa3975Be5Af25501Abb40339D96917Eb(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFa3975Be5Af25501Abb40339D96917Eb, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFb5A8C0075563491622171958074Bf(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorFb5A8C0075563491622171958074Bf(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFb5A8C0075563491622171958074Bf, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
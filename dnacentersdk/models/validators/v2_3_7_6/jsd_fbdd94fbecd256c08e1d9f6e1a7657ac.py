@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFbdd94FbEcd256C08E1D9F6E1A7657Ac(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorFbdd94FbEcd256C08E1D9F6E1A7657Ac(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFbdd94FbEcd256C08E1D9F6E1A7657Ac, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
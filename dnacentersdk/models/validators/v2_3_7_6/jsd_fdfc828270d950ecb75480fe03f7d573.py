@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFdfc828270D950EcB75480Fe03F7D573(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorFdfc828270D950EcB75480Fe03F7D573(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFdfc828270D950EcB75480Fe03F7D573, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
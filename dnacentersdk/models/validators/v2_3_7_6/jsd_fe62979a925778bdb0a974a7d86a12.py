@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFe62979A925778Bdb0A974A7D86A12(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorFe62979A925778Bdb0A974A7D86A12(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFe62979A925778Bdb0A974A7D86A12, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
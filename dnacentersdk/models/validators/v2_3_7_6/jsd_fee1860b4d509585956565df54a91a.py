@@ -29,6 +29,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFee1860B4D509585956565Df54A91A(object):
@@ -36,7 +37,7 @@ class JSONSchemaValidatorFee1860B4D509585956565Df54A91A(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFee1860B4D509585956565Df54A91A, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA18E761Ac8592E9A5C4E0Bb2308Cf0(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorA18E761Ac8592E9A5C4E0Bb2308Cf0(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA18E761Ac8592E9A5C4E0Bb2308Cf0, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA3954B27E5Eeb82789Ed231E0557F(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorA3954B27E5Eeb82789Ed231E0557F(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA3954B27E5Eeb82789Ed231E0557F, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
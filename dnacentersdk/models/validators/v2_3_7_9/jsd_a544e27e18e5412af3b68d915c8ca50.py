@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA544E27E18E5412Af3B68D915C8Ca50(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorA544E27E18E5412Af3B68D915C8Ca50(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA544E27E18E5412Af3B68D915C8Ca50, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
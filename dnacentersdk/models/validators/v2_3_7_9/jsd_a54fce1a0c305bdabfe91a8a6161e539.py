@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA54Fce1A0C305BdaBfe91A8A6161E539(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorA54Fce1A0C305BdaBfe91A8A6161E539(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA54Fce1A0C305BdaBfe91A8A6161E539, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA5E4452CB2E05682933349833A01D14B(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorA5E4452CB2E05682933349833A01D14B(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA5E4452CB2E05682933349833A01D14B, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA764C85D8Df5C30B9143619D4F9Cde9(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorA764C85D8Df5C30B9143619D4F9Cde9(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA764C85D8Df5C30B9143619D4F9Cde9, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
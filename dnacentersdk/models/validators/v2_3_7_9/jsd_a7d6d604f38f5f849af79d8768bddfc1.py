@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA7D6D604F38F5F849Af79D8768Bddfc1(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorA7D6D604F38F5F849Af79D8768Bddfc1(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA7D6D604F38F5F849Af79D8768Bddfc1, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA837B8A46Cd459C8B429D16Fb17F1370(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorA837B8A46Cd459C8B429D16Fb17F1370(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA837B8A46Cd459C8B429D16Fb17F1370, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
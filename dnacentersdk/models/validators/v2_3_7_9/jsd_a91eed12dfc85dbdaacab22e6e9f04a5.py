@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA91Eed12Dfc85DbdAacaB22E6E9F04A5(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorA91Eed12Dfc85DbdAacaB22E6E9F04A5(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA91Eed12Dfc85DbdAacaB22E6E9F04A5, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAaebb912125213B350D7423B4F01A4(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorAaebb912125213B350D7423B4F01A4(object):
 
     def __init__(self):
         super(JSONSchemaValidatorAaebb912125213B350D7423B4F01A4, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAc6E63199Fb05Bcf89106A22502C2197(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorAc6E63199Fb05Bcf89106A22502C2197(object):
 
     def __init__(self):
         super(JSONSchemaValidatorAc6E63199Fb05Bcf89106A22502C2197, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAe8282C90A7059CeB31B4072429D00Cd(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorAe8282C90A7059CeB31B4072429D00Cd(object):
 
     def __init__(self):
         super(JSONSchemaValidatorAe8282C90A7059CeB31B4072429D00Cd, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
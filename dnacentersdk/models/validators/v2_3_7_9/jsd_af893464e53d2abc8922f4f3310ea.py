@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAf893464E53D2Abc8922F4F3310Ea(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorAf893464E53D2Abc8922F4F3310Ea(object):
 
     def __init__(self):
         super(JSONSchemaValidatorAf893464E53D2Abc8922F4F3310Ea, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
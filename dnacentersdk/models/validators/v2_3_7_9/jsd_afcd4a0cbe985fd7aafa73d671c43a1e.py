@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAfcd4A0CBe985Fd7Aafa73D671C43A1E(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorAfcd4A0CBe985Fd7Aafa73D671C43A1E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorAfcd4A0CBe985Fd7Aafa73D671C43A1E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB4155D6F885A53Ad0E47B1A4(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorB4155D6F885A53Ad0E47B1A4(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB4155D6F885A53Ad0E47B1A4, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB4635C45C3B5E44A30D84Daa1D5Fb69(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorB4635C45C3B5E44A30D84Daa1D5Fb69(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB4635C45C3B5E44A30D84Daa1D5Fb69, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB8699619F95A24Bd2D81F12F048235(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorB8699619F95A24Bd2D81F12F048235(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB8699619F95A24Bd2D81F12F048235, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
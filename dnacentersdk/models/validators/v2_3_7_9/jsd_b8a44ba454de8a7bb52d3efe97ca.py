@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB8A44Ba454De8A7BB52D3Efe97Ca(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorB8A44Ba454De8A7BB52D3Efe97Ca(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB8A44Ba454De8A7BB52D3Efe97Ca, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
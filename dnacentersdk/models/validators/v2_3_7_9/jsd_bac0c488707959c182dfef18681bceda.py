@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBac0C488707959C182DfEf18681Bceda(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorBac0C488707959C182DfEf18681Bceda(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBac0C488707959C182DfEf18681Bceda, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
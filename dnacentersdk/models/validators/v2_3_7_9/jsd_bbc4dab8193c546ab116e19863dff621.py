@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBbc4Dab8193C546AB116E19863Dff621(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorBbc4Dab8193C546AB116E19863Dff621(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBbc4Dab8193C546AB116E19863Dff621, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
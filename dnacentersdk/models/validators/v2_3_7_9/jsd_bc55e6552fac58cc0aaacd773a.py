@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBc55E6552FAc58Cc0Aaacd773A(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorBc55E6552FAc58Cc0Aaacd773A(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBc55E6552FAc58Cc0Aaacd773A, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBd5B507F58A50AaB614E3D7409Eec4C(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorBd5B507F58A50AaB614E3D7409Eec4C(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBd5B507F58A50AaB614E3D7409Eec4C, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBdca1829Ea705Fa690922E3E0F8Ff7B0(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorBdca1829Ea705Fa690922E3E0F8Ff7B0(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBdca1829Ea705Fa690922E3E0F8Ff7B0, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBec2Dde673C5B2F940D0474Fed32Af6(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorBec2Dde673C5B2F940D0474Fed32Af6(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBec2Dde673C5B2F940D0474Fed32Af6, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
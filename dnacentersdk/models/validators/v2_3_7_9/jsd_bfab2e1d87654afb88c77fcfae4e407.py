@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBfab2E1D87654AfB88C77Fcfae4E407(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorBfab2E1D87654AfB88C77Fcfae4E407(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBfab2E1D87654AfB88C77Fcfae4E407, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBfb1005F4D265F8BB340637175A5841F(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorBfb1005F4D265F8BB340637175A5841F(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBfb1005F4D265F8BB340637175A5841F, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBfca373C5D7C863EEf14Abc654Fd(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorBfca373C5D7C863EEf14Abc654Fd(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBfca373C5D7C863EEf14Abc654Fd, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
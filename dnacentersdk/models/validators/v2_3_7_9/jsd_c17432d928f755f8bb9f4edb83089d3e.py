@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC17432D928F755F8Bb9F4Edb83089D3E(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorC17432D928F755F8Bb9F4Edb83089D3E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorC17432D928F755F8Bb9F4Edb83089D3E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC49A8488Cd52158790Aac513E7184A(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorC49A8488Cd52158790Aac513E7184A(object):
 
     def __init__(self):
         super(JSONSchemaValidatorC49A8488Cd52158790Aac513E7184A, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC60312A923Ee5A6FB3F2C725C32Dc96F(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorC60312A923Ee5A6FB3F2C725C32Dc96F(object):
 
     def __init__(self):
         super(JSONSchemaValidatorC60312A923Ee5A6FB3F2C725C32Dc96F, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC7315D78A2DdDa76B62777E8(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorC7315D78A2DdDa76B62777E8(object):
 
     def __init__(self):
         super(JSONSchemaValidatorC7315D78A2DdDa76B62777E8, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
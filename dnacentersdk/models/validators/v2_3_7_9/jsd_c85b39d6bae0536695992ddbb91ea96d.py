@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC85B39D6Bae0536695992Ddbb91Ea96D(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorC85B39D6Bae0536695992Ddbb91Ea96D(object):
 
     def __init__(self):
         super(JSONSchemaValidatorC85B39D6Bae0536695992Ddbb91Ea96D, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC9D3Ba6208E5D6EB45FA5C9B8F7E327(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorC9D3Ba6208E5D6EB45FA5C9B8F7E327(object):
 
     def __init__(self):
         super(JSONSchemaValidatorC9D3Ba6208E5D6EB45FA5C9B8F7E327, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCa519342Eb25DfcAf15F8F44Baf0Ee0(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorCa519342Eb25DfcAf15F8F44Baf0Ee0(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCa519342Eb25DfcAf15F8F44Baf0Ee0, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCc1599012A5A59C8AbddA5376B5Cc583(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorCc1599012A5A59C8AbddA5376B5Cc583(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCc1599012A5A59C8AbddA5376B5Cc583, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
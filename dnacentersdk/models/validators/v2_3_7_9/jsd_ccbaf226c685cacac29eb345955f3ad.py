@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCcbaf226C685CacAc29Eb345955F3Ad(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorCcbaf226C685CacAc29Eb345955F3Ad(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCcbaf226C685CacAc29Eb345955F3Ad, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
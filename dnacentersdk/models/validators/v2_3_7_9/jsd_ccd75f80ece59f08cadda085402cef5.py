@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCcd75F80Ece59F08CadDa085402Cef5(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorCcd75F80Ece59F08CadDa085402Cef5(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCcd75F80Ece59F08CadDa085402Cef5, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCf0F416Ef5C25A159F4C3E376741A(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorCf0F416Ef5C25A159F4C3E376741A(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCf0F416Ef5C25A159F4C3E376741A, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCfb964A2958909F7CA12D23Ab2Bdb(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorCfb964A2958909F7CA12D23Ab2Bdb(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCfb964A2958909F7CA12D23Ab2Bdb, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
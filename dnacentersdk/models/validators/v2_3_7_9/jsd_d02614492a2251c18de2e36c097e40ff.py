@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD02614492A2251C18De2E36C097E40Ff(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorD02614492A2251C18De2E36C097E40Ff(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD02614492A2251C18De2E36C097E40Ff, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
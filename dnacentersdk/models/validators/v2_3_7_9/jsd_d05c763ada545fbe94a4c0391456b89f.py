@@ -31,6 +31,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD05C763ADa545Fbe94A4C0391456B89F(object):
@@ -39,7 +40,7 @@ class JSONSchemaValidatorD05C763ADa545Fbe94A4C0391456B89F(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD05C763ADa545Fbe94A4C0391456B89F, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
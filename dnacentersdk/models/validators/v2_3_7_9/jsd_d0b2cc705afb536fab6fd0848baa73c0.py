@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD0B2Cc705Afb536FAb6FD0848Baa73C0(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorD0B2Cc705Afb536FAb6FD0848Baa73C0(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD0B2Cc705Afb536FAb6FD0848Baa73C0, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD10535ED2045B9BB5C58882E6F43Cb2(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorD10535ED2045B9BB5C58882E6F43Cb2(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD10535ED2045B9BB5C58882E6F43Cb2, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
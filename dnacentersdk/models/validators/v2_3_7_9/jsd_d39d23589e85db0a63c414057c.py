@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD39D23589E85Db0A63C414057C(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorD39D23589E85Db0A63C414057C(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD39D23589E85Db0A63C414057C, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD54C40ECb5F531CB5A78D0Cd5Dd585E(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorD54C40ECb5F531CB5A78D0Cd5Dd585E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD54C40ECb5F531CB5A78D0Cd5Dd585E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
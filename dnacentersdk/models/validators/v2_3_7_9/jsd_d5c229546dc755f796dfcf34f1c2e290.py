@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD5C229546Dc755F796DfCf34F1C2E290(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorD5C229546Dc755F796DfCf34F1C2E290(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD5C229546Dc755F796DfCf34F1C2E290, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
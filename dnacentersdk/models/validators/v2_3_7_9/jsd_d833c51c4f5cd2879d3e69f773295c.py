@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD833C51C4F5Cd2879D3E69F773295C(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorD833C51C4F5Cd2879D3E69F773295C(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD833C51C4F5Cd2879D3E69F773295C, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDa455F4BE5B75126Ba9970C7Cc54C7Db(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorDa455F4BE5B75126Ba9970C7Cc54C7Db(object):
 
     def __init__(self):
         super(JSONSchemaValidatorDa455F4BE5B75126Ba9970C7Cc54C7Db, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
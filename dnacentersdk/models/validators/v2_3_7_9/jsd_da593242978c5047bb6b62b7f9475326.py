@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDa593242978C5047Bb6B62B7F9475326(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorDa593242978C5047Bb6B62B7F9475326(object):
 
     def __init__(self):
         super(JSONSchemaValidatorDa593242978C5047Bb6B62B7F9475326, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDb7B6C4F0542AAb9FE7Cf5C995F83(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorDb7B6C4F0542AAb9FE7Cf5C995F83(object):
 
     def __init__(self):
         super(JSONSchemaValidatorDb7B6C4F0542AAb9FE7Cf5C995F83, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDda852745Acd5Ce5A97B0Cfdf0De2Fd2(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorDda852745Acd5Ce5A97B0Cfdf0De2Fd2(object):
 
     def __init__(self):
         super(JSONSchemaValidatorDda852745Acd5Ce5A97B0Cfdf0De2Fd2, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
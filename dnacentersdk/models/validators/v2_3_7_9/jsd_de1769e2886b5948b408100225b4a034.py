@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDe1769E2886B5948B408100225B4A034(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorDe1769E2886B5948B408100225B4A034(object):
 
     def __init__(self):
         super(JSONSchemaValidatorDe1769E2886B5948B408100225B4A034, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDf26F516755A50B5B5477324Cf5Cb649(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorDf26F516755A50B5B5477324Cf5Cb649(object):
 
     def __init__(self):
         super(JSONSchemaValidatorDf26F516755A50B5B5477324Cf5Cb649, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
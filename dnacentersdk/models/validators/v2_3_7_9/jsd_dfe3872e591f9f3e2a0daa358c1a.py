@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDfe3872E591F9F3E2A0Daa358C1A(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorDfe3872E591F9F3E2A0Daa358C1A(object):
 
     def __init__(self):
         super(JSONSchemaValidatorDfe3872E591F9F3E2A0Daa358C1A, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE1B8C435195D56368C24A54Dcce007D0(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorE1B8C435195D56368C24A54Dcce007D0(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE1B8C435195D56368C24A54Dcce007D0, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE2Ec291C2E775Df3895AAdc639713Eea(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorE2Ec291C2E775Df3895AAdc639713Eea(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE2Ec291C2E775Df3895AAdc639713Eea, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
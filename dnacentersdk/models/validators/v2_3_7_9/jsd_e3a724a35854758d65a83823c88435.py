@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE3A724A35854758D65A83823C88435(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorE3A724A35854758D65A83823C88435(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE3A724A35854758D65A83823C88435, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
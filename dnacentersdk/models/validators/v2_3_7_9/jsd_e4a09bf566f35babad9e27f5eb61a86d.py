@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE4A09Bf566F35BabAd9E27F5Eb61A86D(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorE4A09Bf566F35BabAd9E27F5Eb61A86D(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE4A09Bf566F35BabAd9E27F5Eb61A86D, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
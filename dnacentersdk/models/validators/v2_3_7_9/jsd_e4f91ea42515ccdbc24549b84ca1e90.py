@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE4F91Ea42515CcdBc24549B84Ca1E90(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorE4F91Ea42515CcdBc24549B84Ca1E90(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE4F91Ea42515CcdBc24549B84Ca1E90, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
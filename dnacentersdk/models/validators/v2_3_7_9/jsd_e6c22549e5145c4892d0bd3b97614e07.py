@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE6C22549E5145C4892D0Bd3B97614E07(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorE6C22549E5145C4892D0Bd3B97614E07(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE6C22549E5145C4892D0Bd3B97614E07, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
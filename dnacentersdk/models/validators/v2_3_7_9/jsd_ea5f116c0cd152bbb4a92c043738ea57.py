@@ -31,6 +31,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEa5F116C0Cd152BbB4A92C043738Ea57(object):
@@ -39,7 +40,7 @@ class JSONSchemaValidatorEa5F116C0Cd152BbB4A92C043738Ea57(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEa5F116C0Cd152BbB4A92C043738Ea57, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
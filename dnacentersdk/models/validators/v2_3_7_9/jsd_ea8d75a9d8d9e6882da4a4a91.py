@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEA8D75A9D8D9E6882Da4A4A91(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorEA8D75A9D8D9E6882Da4A4A91(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEA8D75A9D8D9E6882Da4A4A91, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEb209544555E43Ae2BC909499F3900(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorEb209544555E43Ae2BC909499F3900(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEb209544555E43Ae2BC909499F3900, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEb3B18894545315B25B94D0C0E2Ec67(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorEb3B18894545315B25B94D0C0E2Ec67(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEb3B18894545315B25B94D0C0E2Ec67, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
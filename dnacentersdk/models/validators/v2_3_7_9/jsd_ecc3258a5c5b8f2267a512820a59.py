@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEcc3258A5C5B8F2267A512820A59(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorEcc3258A5C5B8F2267A512820A59(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEcc3258A5C5B8F2267A512820A59, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
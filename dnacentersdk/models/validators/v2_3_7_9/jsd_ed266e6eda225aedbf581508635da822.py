@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEd266E6EDa225AedBf581508635Da822(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorEd266E6EDa225AedBf581508635Da822(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEd266E6EDa225AedBf581508635Da822, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
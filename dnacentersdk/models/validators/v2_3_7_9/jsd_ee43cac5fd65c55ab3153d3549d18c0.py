@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEe43Cac5Fd65C55Ab3153D3549D18C0(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorEe43Cac5Fd65C55Ab3153D3549D18C0(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEe43Cac5Fd65C55Ab3153D3549D18C0, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEfA92557C9A6C8Af0A71829C7E(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorEfA92557C9A6C8Af0A71829C7E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEfA92557C9A6C8Af0A71829C7E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
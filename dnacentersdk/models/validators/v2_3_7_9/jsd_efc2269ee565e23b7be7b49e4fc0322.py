@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEfc2269Ee565E23B7Be7B49E4Fc0322(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorEfc2269Ee565E23B7Be7B49E4Fc0322(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEfc2269Ee565E23B7Be7B49E4Fc0322, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
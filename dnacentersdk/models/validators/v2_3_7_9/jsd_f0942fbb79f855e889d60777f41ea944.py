@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF0942Fbb79F855E889D60777F41Ea944(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorF0942Fbb79F855E889D60777F41Ea944(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF0942Fbb79F855E889D60777F41Ea944, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF0F7B6E1E4E159E7A40001Fc3E649Dfc(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorF0F7B6E1E4E159E7A40001Fc3E649Dfc(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF0F7B6E1E4E159E7A40001Fc3E649Dfc, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
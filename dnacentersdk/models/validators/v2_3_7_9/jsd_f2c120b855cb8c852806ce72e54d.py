@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF2C120B855Cb8C852806Ce72E54D(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorF2C120B855Cb8C852806Ce72E54D(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF2C120B855Cb8C852806Ce72E54D, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF44Ddd3C38C5A9484F5Cb4E125447Bc(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorF44Ddd3C38C5A9484F5Cb4E125447Bc(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF44Ddd3C38C5A9484F5Cb4E125447Bc, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
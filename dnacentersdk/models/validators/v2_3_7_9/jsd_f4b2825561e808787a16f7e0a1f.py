@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF4B2825561E808787A16F7E0A1F(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorF4B2825561E808787A16F7E0A1F(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF4B2825561E808787A16F7E0A1F, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
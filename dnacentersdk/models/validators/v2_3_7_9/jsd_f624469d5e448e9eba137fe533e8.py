@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF624469D5E448E9EBa137Fe533E8(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorF624469D5E448E9EBa137Fe533E8(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF624469D5E448E9EBa137Fe533E8, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF6A4086C00F45Dc5A634F0B8Db5Cdfd3(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorF6A4086C00F45Dc5A634F0B8Db5Cdfd3(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF6A4086C00F45Dc5A634F0B8Db5Cdfd3, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF77386A48895Fa59DcdDcc7Dd4Addb5(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorF77386A48895Fa59DcdDcc7Dd4Addb5(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF77386A48895Fa59DcdDcc7Dd4Addb5, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
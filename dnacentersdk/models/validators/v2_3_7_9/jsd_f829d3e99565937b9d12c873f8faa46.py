@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF829D3E99565937B9D12C873F8Faa46(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorF829D3E99565937B9D12C873F8Faa46(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF829D3E99565937B9D12C873F8Faa46, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF90Ae8599C8A21C98B7A1Ca804(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorF90Ae8599C8A21C98B7A1Ca804(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF90Ae8599C8A21C98B7A1Ca804, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
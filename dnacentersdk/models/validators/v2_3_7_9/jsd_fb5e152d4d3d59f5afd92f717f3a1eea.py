@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFb5E152D4D3D59F5Afd92F717F3A1Eea(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorFb5E152D4D3D59F5Afd92F717F3A1Eea(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFb5E152D4D3D59F5Afd92F717F3A1Eea, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
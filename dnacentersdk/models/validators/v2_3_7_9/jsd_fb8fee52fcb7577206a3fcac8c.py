@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFb8Fee52FcB7577206A3Fcac8C(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorFb8Fee52FcB7577206A3Fcac8C(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFb8Fee52FcB7577206A3Fcac8C, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFc8410781Af357B6Be17A2104Ce5Efb1(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorFc8410781Af357B6Be17A2104Ce5Efb1(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFc8410781Af357B6Be17A2104Ce5Efb1, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFcc151AF7615A84Adf48B714D146192(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorFcc151AF7615A84Adf48B714D146192(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFcc151AF7615A84Adf48B714D146192, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
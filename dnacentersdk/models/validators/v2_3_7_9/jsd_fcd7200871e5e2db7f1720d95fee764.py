@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFcd7200871E5E2DB7F1720D95Fee764(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorFcd7200871E5E2DB7F1720D95Fee764(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFcd7200871E5E2DB7F1720D95Fee764, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
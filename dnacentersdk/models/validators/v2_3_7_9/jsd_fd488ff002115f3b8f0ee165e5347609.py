@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFd488Ff002115F3B8F0EE165E5347609(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorFd488Ff002115F3B8F0EE165E5347609(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFd488Ff002115F3B8F0EE165E5347609, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
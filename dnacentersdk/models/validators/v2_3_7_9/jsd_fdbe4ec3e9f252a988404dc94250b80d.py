@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFdbe4Ec3E9F252A988404Dc94250B80D(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorFdbe4Ec3E9F252A988404Dc94250B80D(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFdbe4Ec3E9F252A988404Dc94250B80D, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
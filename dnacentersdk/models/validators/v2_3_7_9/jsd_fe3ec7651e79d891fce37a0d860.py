@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFe3Ec7651E79D891Fce37A0D860(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorFe3Ec7651E79D891Fce37A0D860(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFe3Ec7651E79D891Fce37A0D860, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
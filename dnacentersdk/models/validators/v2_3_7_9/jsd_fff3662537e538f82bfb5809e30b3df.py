@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFff3662537E538F82BfB5809E30B3Df(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorFff3662537E538F82BfB5809E30B3Df(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFff3662537E538F82BfB5809E30B3Df, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
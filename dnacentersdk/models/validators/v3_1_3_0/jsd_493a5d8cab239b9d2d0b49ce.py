@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidator493A5D8CAb239B9D2D0B49Ce(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidator493A5D8CAb239B9D2D0B49Ce(object):
 
     def __init__(self):
         super(JSONSchemaValidator493A5D8CAb239B9D2D0B49Ce, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidator97E350A7A690Cdfeffa5Eaca(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidator97E350A7A690Cdfeffa5Eaca(object):
 
     def __init__(self):
         super(JSONSchemaValidator97E350A7A690Cdfeffa5Eaca, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA14E71C1B98E51EeA41255720025B519(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorA14E71C1B98E51EeA41255720025B519(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA14E71C1B98E51EeA41255720025B519, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
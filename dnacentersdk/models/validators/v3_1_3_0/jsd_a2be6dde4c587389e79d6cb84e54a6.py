@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA2Be6DDe4C587389E79D6Cb84E54A6(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorA2Be6DDe4C587389E79D6Cb84E54A6(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA2Be6DDe4C587389E79D6Cb84E54A6, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA3Fb2E7BB8Aa50508425B1Dd8818Fda4(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorA3Fb2E7BB8Aa50508425B1Dd8818Fda4(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA3Fb2E7BB8Aa50508425B1Dd8818Fda4, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
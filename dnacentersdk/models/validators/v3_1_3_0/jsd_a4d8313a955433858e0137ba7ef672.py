@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA4D8313A955433858E0137Ba7Ef672(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorA4D8313A955433858E0137Ba7Ef672(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA4D8313A955433858E0137Ba7Ef672, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA602EEe5A56FaA64436Bade8A240E(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorA602EEe5A56FaA64436Bade8A240E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA602EEe5A56FaA64436Bade8A240E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
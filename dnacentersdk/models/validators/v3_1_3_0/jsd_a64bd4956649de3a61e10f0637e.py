@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA64Bd4956649De3A61E10F0637E(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorA64Bd4956649De3A61E10F0637E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA64Bd4956649De3A61E10F0637E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA73Fbc67627E5BbbAfe748De84D42Df6(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorA73Fbc67627E5BbbAfe748De84D42Df6(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA73Fbc67627E5BbbAfe748De84D42Df6, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA93D01238De0537DBb3D358F9Cce0Bd2(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorA93D01238De0537DBb3D358F9Cce0Bd2(object):
 
     def __init__(self):
         super(JSONSchemaValidatorA93D01238De0537DBb3D358F9Cce0Bd2, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
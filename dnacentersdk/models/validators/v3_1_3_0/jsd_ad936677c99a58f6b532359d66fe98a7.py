@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAd936677C99A58F6B532359D66Fe98A7(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorAd936677C99A58F6B532359D66Fe98A7(object):
 
     def __init__(self):
         super(JSONSchemaValidatorAd936677C99A58F6B532359D66Fe98A7, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAf7031CC5Ca5B44Af0E6454D558412C(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorAf7031CC5Ca5B44Af0E6454D558412C(object):
 
     def __init__(self):
         super(JSONSchemaValidatorAf7031CC5Ca5B44Af0E6454D558412C, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
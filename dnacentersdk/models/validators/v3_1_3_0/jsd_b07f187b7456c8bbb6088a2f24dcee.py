@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB07F187B7456C8Bbb6088A2F24Dcee(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorB07F187B7456C8Bbb6088A2F24Dcee(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB07F187B7456C8Bbb6088A2F24Dcee, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB3Ff5F865F1C8122A0Ec8Ca73921(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorB3Ff5F865F1C8122A0Ec8Ca73921(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB3Ff5F865F1C8122A0Ec8Ca73921, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
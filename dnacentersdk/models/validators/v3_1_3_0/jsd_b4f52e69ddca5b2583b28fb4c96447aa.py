@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB4F52E69Ddca5B2583B28Fb4C96447Aa(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorB4F52E69Ddca5B2583B28Fb4C96447Aa(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB4F52E69Ddca5B2583B28Fb4C96447Aa, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB5A94Fd2D97514B8A9CF73Df4E154B8(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorB5A94Fd2D97514B8A9CF73Df4E154B8(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB5A94Fd2D97514B8A9CF73Df4E154B8, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB67Ad5D41A330C4Bdc9F7159F(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorB67Ad5D41A330C4Bdc9F7159F(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB67Ad5D41A330C4Bdc9F7159F, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB7Ae9494B05A57Bf6393Eaf308B1E7(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorB7Ae9494B05A57Bf6393Eaf308B1E7(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB7Ae9494B05A57Bf6393Eaf308B1E7, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
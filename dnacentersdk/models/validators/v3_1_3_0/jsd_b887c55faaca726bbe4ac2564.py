@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB887C55FaAca726Bbe4Ac2564(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorB887C55FaAca726Bbe4Ac2564(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB887C55FaAca726Bbe4Ac2564, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB9Be51E25Efc9F41D4F68451F9A6(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorB9Be51E25Efc9F41D4F68451F9A6(object):
 
     def __init__(self):
         super(JSONSchemaValidatorB9Be51E25Efc9F41D4F68451F9A6, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBa40975123Ed50DaA2F9F599Cdf2D911(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorBa40975123Ed50DaA2F9F599Cdf2D911(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBa40975123Ed50DaA2F9F599Cdf2D911, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
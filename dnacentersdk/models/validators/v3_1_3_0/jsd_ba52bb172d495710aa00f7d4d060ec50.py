@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBa52Bb172D495710Aa00F7D4D060Ec50(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorBa52Bb172D495710Aa00F7D4D060Ec50(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBa52Bb172D495710Aa00F7D4D060Ec50, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
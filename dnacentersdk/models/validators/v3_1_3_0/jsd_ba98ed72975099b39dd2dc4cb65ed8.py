@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBa98Ed72975099B39DD2Dc4Cb65Ed8(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorBa98Ed72975099B39DD2Dc4Cb65Ed8(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBa98Ed72975099B39DD2Dc4Cb65Ed8, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBa9E0F3A5Db5972A55D4B3Fcf2B5432(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorBa9E0F3A5Db5972A55D4B3Fcf2B5432(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBa9E0F3A5Db5972A55D4B3Fcf2B5432, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
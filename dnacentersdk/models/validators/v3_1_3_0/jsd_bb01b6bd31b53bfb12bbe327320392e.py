@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBb01B6BD31B53BfB12BBe327320392E(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorBb01B6BD31B53BfB12BBe327320392E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBb01B6BD31B53BfB12BBe327320392E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
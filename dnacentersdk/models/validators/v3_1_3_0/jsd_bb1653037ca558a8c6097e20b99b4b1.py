@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBb1653037Ca558A8C6097E20B99B4B1(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorBb1653037Ca558A8C6097E20B99B4B1(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBb1653037Ca558A8C6097E20B99B4B1, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBb7C52E5225E9398A006Fecf4Da06F(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorBb7C52E5225E9398A006Fecf4Da06F(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBb7C52E5225E9398A006Fecf4Da06F, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBbf7Ce025Bc2A291B90C37A6B898(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorBbf7Ce025Bc2A291B90C37A6B898(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBbf7Ce025Bc2A291B90C37A6B898, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBc1F37A9F2571FA4D7Bc85B9E8A583(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorBc1F37A9F2571FA4D7Bc85B9E8A583(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBc1F37A9F2571FA4D7Bc85B9E8A583, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
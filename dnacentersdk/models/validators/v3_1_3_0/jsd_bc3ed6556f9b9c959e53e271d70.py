@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBc3Ed6556F9B9C959E53E271D70(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorBc3Ed6556F9B9C959E53E271D70(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBc3Ed6556F9B9C959E53E271D70, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBc9716ED6Eb5C6E9Ecb0380501D6138(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorBc9716ED6Eb5C6E9Ecb0380501D6138(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBc9716ED6Eb5C6E9Ecb0380501D6138, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBcb1D489D735258975828F845Df1769(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorBcb1D489D735258975828F845Df1769(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBcb1D489D735258975828F845Df1769, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
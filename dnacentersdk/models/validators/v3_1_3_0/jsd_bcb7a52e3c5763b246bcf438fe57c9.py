@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBcb7A52E3C5763B246Bcf438Fe57C9(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorBcb7A52E3C5763B246Bcf438Fe57C9(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBcb7A52E3C5763B246Bcf438Fe57C9, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
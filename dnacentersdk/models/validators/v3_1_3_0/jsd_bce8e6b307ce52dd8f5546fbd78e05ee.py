@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBce8E6B307Ce52Dd8F5546Fbd78E05Ee(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorBce8E6B307Ce52Dd8F5546Fbd78E05Ee(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBce8E6B307Ce52Dd8F5546Fbd78E05Ee, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
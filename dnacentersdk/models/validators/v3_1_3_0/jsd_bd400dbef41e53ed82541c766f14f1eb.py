@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBd400DbeF41E53Ed82541C766F14F1Eb(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorBd400DbeF41E53Ed82541C766F14F1Eb(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBd400DbeF41E53Ed82541C766F14F1Eb, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBece53A182B45Ffa4A1A435E(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorBece53A182B45Ffa4A1A435E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBece53A182B45Ffa4A1A435E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBf40Cea4982C54278A52Ac2E7B0C458A(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorBf40Cea4982C54278A52Ac2E7B0C458A(object):
 
     def __init__(self):
         super(JSONSchemaValidatorBf40Cea4982C54278A52Ac2E7B0C458A, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC10072541E94Bd16F1Aebffe32(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorC10072541E94Bd16F1Aebffe32(object):
 
     def __init__(self):
         super(JSONSchemaValidatorC10072541E94Bd16F1Aebffe32, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
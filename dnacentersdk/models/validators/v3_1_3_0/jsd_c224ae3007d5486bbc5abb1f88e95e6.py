@@ -31,6 +31,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC224Ae3007D5486Bbc5Abb1F88E95E6(object):
@@ -39,7 +40,7 @@ class JSONSchemaValidatorC224Ae3007D5486Bbc5Abb1F88E95E6(object):
 
     def __init__(self):
         super(JSONSchemaValidatorC224Ae3007D5486Bbc5Abb1F88E95E6, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC380301E3E05423Bdc1857Ff00Ae77A(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorC380301E3E05423Bdc1857Ff00Ae77A(object):
 
     def __init__(self):
         super(JSONSchemaValidatorC380301E3E05423Bdc1857Ff00Ae77A, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
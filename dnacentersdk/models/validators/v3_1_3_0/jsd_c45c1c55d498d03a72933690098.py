@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC45C1C55D498D03A72933690098(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorC45C1C55D498D03A72933690098(object):
 
     def __init__(self):
         super(JSONSchemaValidatorC45C1C55D498D03A72933690098, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC4Befbd77A452A9B7873Ffc360A1F20(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorC4Befbd77A452A9B7873Ffc360A1F20(object):
 
     def __init__(self):
         super(JSONSchemaValidatorC4Befbd77A452A9B7873Ffc360A1F20, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC5C273290Fae513DA209Ec2C9270E46D(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorC5C273290Fae513DA209Ec2C9270E46D(object):
 
     def __init__(self):
         super(JSONSchemaValidatorC5C273290Fae513DA209Ec2C9270E46D, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC6506B22335101A465D2Adf5Ca7F37(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorC6506B22335101A465D2Adf5Ca7F37(object):
 
     def __init__(self):
         super(JSONSchemaValidatorC6506B22335101A465D2Adf5Ca7F37, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
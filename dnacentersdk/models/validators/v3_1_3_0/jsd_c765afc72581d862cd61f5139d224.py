@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC765AFc72581D862CD61F5139D224(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorC765AFc72581D862CD61F5139D224(object):
 
     def __init__(self):
         super(JSONSchemaValidatorC765AFc72581D862CD61F5139D224, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
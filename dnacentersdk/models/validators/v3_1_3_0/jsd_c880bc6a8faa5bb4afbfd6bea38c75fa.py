@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC880Bc6A8Faa5Bb4AfbfD6Bea38C75Fa(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorC880Bc6A8Faa5Bb4AfbfD6Bea38C75Fa(object):
 
     def __init__(self):
         super(JSONSchemaValidatorC880Bc6A8Faa5Bb4AfbfD6Bea38C75Fa, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
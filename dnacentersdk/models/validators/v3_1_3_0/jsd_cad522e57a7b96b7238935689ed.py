@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCad522E57A7B96B7238935689Ed(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorCad522E57A7B96B7238935689Ed(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCad522E57A7B96B7238935689Ed, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCaeb723A074519498C6B08A1C9Dacb3(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorCaeb723A074519498C6B08A1C9Dacb3(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCaeb723A074519498C6B08A1C9Dacb3, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
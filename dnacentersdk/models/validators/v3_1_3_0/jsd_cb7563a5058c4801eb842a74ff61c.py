@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCb7563A5058C4801EB842A74Ff61C(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorCb7563A5058C4801EB842A74Ff61C(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCb7563A5058C4801EB842A74Ff61C, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCb98464Ddb5Ee9Ba7EBb4428443Ba9(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorCb98464Ddb5Ee9Ba7EBb4428443Ba9(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCb98464Ddb5Ee9Ba7EBb4428443Ba9, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
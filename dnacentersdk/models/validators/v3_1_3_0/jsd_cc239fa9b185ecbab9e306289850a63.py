@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCc239Fa9B185EcbAb9E306289850A63(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorCc239Fa9B185EcbAb9E306289850A63(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCc239Fa9B185EcbAb9E306289850A63, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
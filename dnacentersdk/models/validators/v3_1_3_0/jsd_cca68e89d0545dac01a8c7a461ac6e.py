@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCca68E89D0545DAc01A8C7A461Ac6E(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorCca68E89D0545DAc01A8C7A461Ac6E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCca68E89D0545DAc01A8C7A461Ac6E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCd9D7D858F094469Abf9464431F(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorCd9D7D858F094469Abf9464431F(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCd9D7D858F094469Abf9464431F, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCe6C2C14553F9A4A88F66A04C21C4(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorCe6C2C14553F9A4A88F66A04C21C4(object):
 
     def __init__(self):
         super(JSONSchemaValidatorCe6C2C14553F9A4A88F66A04C21C4, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD0E1021DE57D5E95Bbea5D5Bd86B481A(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorD0E1021DE57D5E95Bbea5D5Bd86B481A(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD0E1021DE57D5E95Bbea5D5Bd86B481A, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD1608B2751C883A072Ee3Fb80228(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorD1608B2751C883A072Ee3Fb80228(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD1608B2751C883A072Ee3Fb80228, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
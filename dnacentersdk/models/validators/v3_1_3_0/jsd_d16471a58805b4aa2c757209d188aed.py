@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD16471A58805B4AA2C757209D188Aed(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorD16471A58805B4AA2C757209D188Aed(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD16471A58805B4AA2C757209D188Aed, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
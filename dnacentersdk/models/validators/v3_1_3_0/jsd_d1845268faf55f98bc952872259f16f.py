@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD1845268Faf55F98Bc952872259F16F(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorD1845268Faf55F98Bc952872259F16F(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD1845268Faf55F98Bc952872259F16F, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
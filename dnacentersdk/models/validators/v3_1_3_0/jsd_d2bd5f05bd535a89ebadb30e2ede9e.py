@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD2Bd5F05Bd535A89EbAdb30E2Ede9E(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorD2Bd5F05Bd535A89EbAdb30E2Ede9E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD2Bd5F05Bd535A89EbAdb30E2Ede9E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
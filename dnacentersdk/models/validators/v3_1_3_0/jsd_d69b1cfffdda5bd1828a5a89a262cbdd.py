@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD69B1CffFdda5Bd1828A5A89A262Cbdd(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorD69B1CffFdda5Bd1828A5A89A262Cbdd(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD69B1CffFdda5Bd1828A5A89A262Cbdd, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
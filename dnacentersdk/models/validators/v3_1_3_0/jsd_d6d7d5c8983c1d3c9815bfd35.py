@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD6D7D5C8983C1D3C9815Bfd35(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorD6D7D5C8983C1D3C9815Bfd35(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD6D7D5C8983C1D3C9815Bfd35, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
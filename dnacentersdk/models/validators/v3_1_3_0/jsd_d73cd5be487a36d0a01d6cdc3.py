@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD73Cd5Be487A36D0A01D6Cdc3(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorD73Cd5Be487A36D0A01D6Cdc3(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD73Cd5Be487A36D0A01D6Cdc3, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD73Fc407278F5EefA67E6A014Aeaf742(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorD73Fc407278F5EefA67E6A014Aeaf742(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD73Fc407278F5EefA67E6A014Aeaf742, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD76A951F85A7A927AFc2F1Ea935C8(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorD76A951F85A7A927AFc2F1Ea935C8(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD76A951F85A7A927AFc2F1Ea935C8, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD9Ed5BbA1155B9C8Fe132640832F94E(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorD9Ed5BbA1155B9C8Fe132640832F94E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorD9Ed5BbA1155B9C8Fe132640832F94E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
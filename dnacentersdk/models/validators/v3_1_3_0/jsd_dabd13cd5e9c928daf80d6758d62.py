@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDabd13Cd5E9C928DAf80D6758D62(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorDabd13Cd5E9C928DAf80D6758D62(object):
 
     def __init__(self):
         super(JSONSchemaValidatorDabd13Cd5E9C928DAf80D6758D62, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
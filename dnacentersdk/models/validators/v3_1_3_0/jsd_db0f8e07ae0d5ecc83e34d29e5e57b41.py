@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDb0F8E07Ae0D5Ecc83E34D29E5E57B41(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorDb0F8E07Ae0D5Ecc83E34D29E5E57B41(object):
 
     def __init__(self):
         super(JSONSchemaValidatorDb0F8E07Ae0D5Ecc83E34D29E5E57B41, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -31,6 +31,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDb690B800995E35Bc4E8C43D8Ea6C18(object):
@@ -39,7 +40,7 @@ class JSONSchemaValidatorDb690B800995E35Bc4E8C43D8Ea6C18(object):
 
     def __init__(self):
         super(JSONSchemaValidatorDb690B800995E35Bc4E8C43D8Ea6C18, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
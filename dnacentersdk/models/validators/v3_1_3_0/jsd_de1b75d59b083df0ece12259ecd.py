@@ -31,6 +31,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDe1B75D59B083Df0Ece12259Ecd(object):
@@ -39,7 +40,7 @@ class JSONSchemaValidatorDe1B75D59B083Df0Ece12259Ecd(object):
 
     def __init__(self):
         super(JSONSchemaValidatorDe1B75D59B083Df0Ece12259Ecd, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
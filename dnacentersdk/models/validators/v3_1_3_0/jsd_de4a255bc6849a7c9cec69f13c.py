@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDe4A255Bc6849A7C9Cec69F13C(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorDe4A255Bc6849A7C9Cec69F13C(object):
 
     def __init__(self):
         super(JSONSchemaValidatorDe4A255Bc6849A7C9Cec69F13C, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDeb34387D0235811A90985711Be9Fe2E(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorDeb34387D0235811A90985711Be9Fe2E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorDeb34387D0235811A90985711Be9Fe2E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
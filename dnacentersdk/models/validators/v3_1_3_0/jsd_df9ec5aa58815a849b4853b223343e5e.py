@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDf9Ec5Aa58815A849B4853B223343E5E(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorDf9Ec5Aa58815A849B4853B223343E5E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorDf9Ec5Aa58815A849B4853B223343E5E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
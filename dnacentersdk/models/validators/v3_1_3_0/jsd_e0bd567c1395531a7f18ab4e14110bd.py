@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE0Bd567C1395531A7F18Ab4E14110Bd(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorE0Bd567C1395531A7F18Ab4E14110Bd(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE0Bd567C1395531A7F18Ab4E14110Bd, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
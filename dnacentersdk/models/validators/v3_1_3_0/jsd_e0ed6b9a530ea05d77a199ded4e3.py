@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE0Ed6B9A530EA05D77A199Ded4E3(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorE0Ed6B9A530EA05D77A199Ded4E3(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE0Ed6B9A530EA05D77A199Ded4E3, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
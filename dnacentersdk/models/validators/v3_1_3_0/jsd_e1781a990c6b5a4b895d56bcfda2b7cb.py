@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE1781A990C6B5A4B895D56Bcfda2B7Cb(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorE1781A990C6B5A4B895D56Bcfda2B7Cb(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE1781A990C6B5A4B895D56Bcfda2B7Cb, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE3E170003D865B9A8D76Cbe1D2F268Be(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorE3E170003D865B9A8D76Cbe1D2F268Be(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE3E170003D865B9A8D76Cbe1D2F268Be, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE481654675355408Be8Daff9A82F9A0(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorE481654675355408Be8Daff9A82F9A0(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE481654675355408Be8Daff9A82F9A0, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
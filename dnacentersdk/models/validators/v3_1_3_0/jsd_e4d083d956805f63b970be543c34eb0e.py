@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE4D083D956805F63B970Be543C34Eb0E(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorE4D083D956805F63B970Be543C34Eb0E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE4D083D956805F63B970Be543C34Eb0E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE5Bb87A955E33A7Ee46F1085Fd880(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorE5Bb87A955E33A7Ee46F1085Fd880(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE5Bb87A955E33A7Ee46F1085Fd880, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE6BcA55256A0Aac288486E38049B(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorE6BcA55256A0Aac288486E38049B(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE6BcA55256A0Aac288486E38049B, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
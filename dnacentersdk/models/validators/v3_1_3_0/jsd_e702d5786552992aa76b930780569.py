@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE702D5786552992Aa76B930780569(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorE702D5786552992Aa76B930780569(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE702D5786552992Aa76B930780569, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
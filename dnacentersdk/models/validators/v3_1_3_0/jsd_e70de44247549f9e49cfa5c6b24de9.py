@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE70De44247549F9E49Cfa5C6B24De9(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorE70De44247549F9E49Cfa5C6B24De9(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE70De44247549F9E49Cfa5C6B24De9, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
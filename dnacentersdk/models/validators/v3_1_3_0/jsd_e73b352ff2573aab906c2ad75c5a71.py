@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE73B352Ff2573AAb906C2Ad75C5A71(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorE73B352Ff2573AAb906C2Ad75C5A71(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE73B352Ff2573AAb906C2Ad75C5A71, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
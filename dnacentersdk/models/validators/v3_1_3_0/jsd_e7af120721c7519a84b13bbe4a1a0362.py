@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE7Af120721C7519A84B13Bbe4A1A0362(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorE7Af120721C7519A84B13Bbe4A1A0362(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE7Af120721C7519A84B13Bbe4A1A0362, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
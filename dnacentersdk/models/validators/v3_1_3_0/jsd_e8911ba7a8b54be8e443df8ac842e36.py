@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE8911Ba7A8B54Be8E443Df8Ac842E36(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorE8911Ba7A8B54Be8E443Df8Ac842E36(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE8911Ba7A8B54Be8E443Df8Ac842E36, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
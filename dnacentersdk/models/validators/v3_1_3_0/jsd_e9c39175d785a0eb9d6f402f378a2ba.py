@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE9C39175D785A0EB9D6F402F378A2Ba(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorE9C39175D785A0EB9D6F402F378A2Ba(object):
 
     def __init__(self):
         super(JSONSchemaValidatorE9C39175D785A0EB9D6F402F378A2Ba, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
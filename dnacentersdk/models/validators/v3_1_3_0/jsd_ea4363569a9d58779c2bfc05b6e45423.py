@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEa4363569A9D58779C2BFc05B6E45423(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorEa4363569A9D58779C2BFc05B6E45423(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEa4363569A9D58779C2BFc05B6E45423, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
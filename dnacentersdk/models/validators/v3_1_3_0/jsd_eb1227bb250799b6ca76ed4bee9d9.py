@@ -31,6 +31,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEb1227Bb250799B6CA76Ed4Bee9D9(object):
@@ -39,7 +40,7 @@ class JSONSchemaValidatorEb1227Bb250799B6CA76Ed4Bee9D9(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEb1227Bb250799B6CA76Ed4Bee9D9, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
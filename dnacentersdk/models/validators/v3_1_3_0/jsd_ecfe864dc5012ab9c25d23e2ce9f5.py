@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEcfe864Dc5012Ab9C25D23E2Ce9F5(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorEcfe864Dc5012Ab9C25D23E2Ce9F5(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEcfe864Dc5012Ab9C25D23E2Ce9F5, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEdc44E0E7A513191Cc16Dc2B4Da88E(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorEdc44E0E7A513191Cc16Dc2B4Da88E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEdc44E0E7A513191Cc16Dc2B4Da88E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEe7664344F50Cb8F2C94Beaa01629D(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorEe7664344F50Cb8F2C94Beaa01629D(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEe7664344F50Cb8F2C94Beaa01629D, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEe8590B6B45048B84E814161272Bee(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorEe8590B6B45048B84E814161272Bee(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEe8590B6B45048B84E814161272Bee, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEea45FcA32F5F12Adc30A9D03C43Ac6(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorEea45FcA32F5F12Adc30A9D03C43Ac6(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEea45FcA32F5F12Adc30A9D03C43Ac6, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
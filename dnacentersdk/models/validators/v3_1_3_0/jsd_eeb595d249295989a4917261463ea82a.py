@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEeb595D249295989A4917261463Ea82A(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorEeb595D249295989A4917261463Ea82A(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEeb595D249295989A4917261463Ea82A, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEf28900485C4E9842B4A68E483D4E(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorEf28900485C4E9842B4A68E483D4E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEf28900485C4E9842B4A68E483D4E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEf94C2C20Ba15Fd38E129Ac75067De1E(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorEf94C2C20Ba15Fd38E129Ac75067De1E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorEf94C2C20Ba15Fd38E129Ac75067De1E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF04B76067507B9384E409E9431Ef3(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorF04B76067507B9384E409E9431Ef3(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF04B76067507B9384E409E9431Ef3, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
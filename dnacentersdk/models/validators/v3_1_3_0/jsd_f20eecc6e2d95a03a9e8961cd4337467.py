@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF20Eecc6E2D95A03A9E8961Cd4337467(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorF20Eecc6E2D95A03A9E8961Cd4337467(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF20Eecc6E2D95A03A9E8961Cd4337467, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
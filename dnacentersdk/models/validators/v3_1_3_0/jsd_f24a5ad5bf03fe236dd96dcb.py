@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF24A5Ad5Bf03Fe236Dd96Dcb(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorF24A5Ad5Bf03Fe236Dd96Dcb(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF24A5Ad5Bf03Fe236Dd96Dcb, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF2562A2D8E5Ec287738032961762Ed(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorF2562A2D8E5Ec287738032961762Ed(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF2562A2D8E5Ec287738032961762Ed, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF2B137487385De6925B7B6136D4B027(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorF2B137487385De6925B7B6136D4B027(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF2B137487385De6925B7B6136D4B027, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
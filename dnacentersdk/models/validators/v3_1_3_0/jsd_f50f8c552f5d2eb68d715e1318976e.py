@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF50F8C552F5D2EB68D715E1318976E(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorF50F8C552F5D2EB68D715E1318976E(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF50F8C552F5D2EB68D715E1318976E, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
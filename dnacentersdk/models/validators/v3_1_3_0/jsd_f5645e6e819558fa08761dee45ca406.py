@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF5645E6E819558FA08761Dee45Ca406(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorF5645E6E819558FA08761Dee45Ca406(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF5645E6E819558FA08761Dee45Ca406, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
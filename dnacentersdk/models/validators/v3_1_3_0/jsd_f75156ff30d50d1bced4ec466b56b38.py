@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF75156FF30D50D1Bced4Ec466B56B38(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorF75156FF30D50D1Bced4Ec466B56B38(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF75156FF30D50D1Bced4Ec466B56B38, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
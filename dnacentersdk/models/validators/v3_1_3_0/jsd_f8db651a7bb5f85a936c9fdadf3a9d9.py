@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF8Db651A7Bb5F85A936C9Fdadf3A9D9(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorF8Db651A7Bb5F85A936C9Fdadf3A9D9(object):
 
     def __init__(self):
         super(JSONSchemaValidatorF8Db651A7Bb5F85A936C9Fdadf3A9D9, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFa2127B55124A3A00B2991B77Db6(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorFa2127B55124A3A00B2991B77Db6(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFa2127B55124A3A00B2991B77Db6, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
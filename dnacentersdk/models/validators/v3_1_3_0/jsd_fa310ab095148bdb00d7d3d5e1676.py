@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFa310Ab095148Bdb00D7D3D5E1676(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorFa310Ab095148Bdb00D7D3D5E1676(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFa310Ab095148Bdb00D7D3D5E1676, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
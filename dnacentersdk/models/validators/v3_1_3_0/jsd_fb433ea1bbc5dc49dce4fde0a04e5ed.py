@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFb433Ea1Bbc5Dc49Dce4Fde0A04E5Ed(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorFb433Ea1Bbc5Dc49Dce4Fde0A04E5Ed(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFb433Ea1Bbc5Dc49Dce4Fde0A04E5Ed, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
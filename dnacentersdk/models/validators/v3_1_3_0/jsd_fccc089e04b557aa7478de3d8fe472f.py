@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFccc089E04B557AA7478De3D8Fe472F(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorFccc089E04B557AA7478De3D8Fe472F(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFccc089E04B557AA7478De3D8Fe472F, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFE8Fb526F9B3B8F3C7Aaeebac(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorFE8Fb526F9B3B8F3C7Aaeebac(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFE8Fb526F9B3B8F3C7Aaeebac, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFebb2149Ac5F8BA25DBf4D9A862D94(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorFebb2149Ac5F8BA25DBf4D9A862D94(object):
 
     def __init__(self):
         super(JSONSchemaValidatorFebb2149Ac5F8BA25DBf4D9A862D94, self).__init__()
-        self._validator = fastjsonschema.compile(
+        self._validator = compile_schema(
             json.loads(
                 """{
                 "$schema": "http://json-schema.org/draft-04/schema#",
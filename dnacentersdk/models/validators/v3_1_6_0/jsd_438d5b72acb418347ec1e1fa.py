@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidator438D5B72Acb418347Ec1E1Fa(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidator438D5B72Acb418347Ec1E1Fa(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidator438D5B72Acb418347Ec1E1Fa, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
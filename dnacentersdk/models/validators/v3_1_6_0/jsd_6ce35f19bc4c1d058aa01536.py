@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidator6Ce35F19Bc4C1D058Aa01536(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidator6Ce35F19Bc4C1D058Aa01536(object):
     schema definition."""
     def __init__(self):
         super(JSONSchemaValidator6Ce35F19Bc4C1D058Aa01536, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA0F799D5Ec6954D1Bd7A25853080A9F1(object):
     """CreateAPProfile request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorA0F799D5Ec6954D1Bd7A25853080A9F1, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA14E71C1B98E51EeA41255720025B519(object):
     """CreateApplicationsV2 request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorA14E71C1B98E51EeA41255720025B519, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA15A2F83F975A6A9964E7Da79A605De(object):
     """SetDhcpSettingsForASite request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorA15A2F83F975A6A9964E7Da79A605De, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA2Da4C1E5224542E8474F09Eb8D4F32D(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorA2Da4C1E5224542E8474F09Eb8D4F32D(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorA2Da4C1E5224542E8474F09Eb8D4F32D, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
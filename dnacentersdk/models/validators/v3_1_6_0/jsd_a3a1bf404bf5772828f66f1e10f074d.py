@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA3A1Bf404Bf5772828F66F1E10F074D(object):
     """CreateSNMPWriteCommunity request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorA3A1Bf404Bf5772828F66F1E10F074D, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA41113Bc28515538Af4FE4D2Ff707F60(object):
     """UnassignNetworkDevicesFromSites request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorA41113Bc28515538Af4FE4D2Ff707F60, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
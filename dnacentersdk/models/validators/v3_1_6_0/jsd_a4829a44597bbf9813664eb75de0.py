@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA4829A44597BBf9813664Eb75De0(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorA4829A44597BBf9813664Eb75De0(object):
     request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorA4829A44597BBf9813664Eb75De0, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA4D8313A955433858E0137Ba7Ef672(object):
     """CreatesANewUserDefinedIssueDefinitions request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorA4D8313A955433858E0137Ba7Ef672, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA542B2FeEd5259A2922EBd75Ca99A141(object):
     """ExportsTheCredentialsOfNetworkDevices request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorA542B2FeEd5259A2922EBd75Ca99A141, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA544E27E18E5412Af3B68D915C8Ca50(object):
     """AssignDevicesToSite request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorA544E27E18E5412Af3B68D915C8Ca50, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
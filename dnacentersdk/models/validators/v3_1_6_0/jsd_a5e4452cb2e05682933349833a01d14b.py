@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA5E4452CB2E05682933349833A01D14B(object):
     """CreateAnchorGroup request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorA5E4452CB2E05682933349833A01D14B, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA64Bd4956649De3A61E10F0637E(object):
     """UpdateGlobalResyncInterval request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorA64Bd4956649De3A61E10F0637E, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
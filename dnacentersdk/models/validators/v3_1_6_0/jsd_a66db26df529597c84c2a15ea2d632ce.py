@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA66Db26DF529597C84C2A15Ea2D632Ce(object):
     """CreateSPProfileV2 request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorA66Db26DF529597C84C2A15Ea2D632Ce, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA69602EfC6F4523D806FFb18Fbcf5Cee(object):
     """UpdateFilterGroup request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorA69602EfC6F4523D806FFb18Fbcf5Cee, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
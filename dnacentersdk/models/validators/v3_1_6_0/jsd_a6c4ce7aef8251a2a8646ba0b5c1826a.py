@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA6C4Ce7AEf8251A2A8646Ba0B5C1826A(object):
     """MobilityReset request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorA6C4Ce7AEf8251A2A8646Ba0B5C1826A, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
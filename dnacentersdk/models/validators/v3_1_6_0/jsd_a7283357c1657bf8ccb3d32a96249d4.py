@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA7283357C1657Bf8Ccb3D32A96249D4(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorA7283357C1657Bf8Ccb3D32A96249D4(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorA7283357C1657Bf8Ccb3D32A96249D4, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA7935EedD53A5B8C84668C903Cc1C705(object):
     """UpdateNetworkV2 request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorA7935EedD53A5B8C84668C903Cc1C705, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
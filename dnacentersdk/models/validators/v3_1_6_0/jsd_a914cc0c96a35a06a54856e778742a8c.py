@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA914Cc0C96A35A06A54856E778742A8C(object):
     """DistributeImagesOnTheNetworkDevice request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorA914Cc0C96A35A06A54856E778742A8C, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
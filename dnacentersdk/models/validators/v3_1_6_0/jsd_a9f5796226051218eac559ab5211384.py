@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorA9F5796226051218Eac559Ab5211384(object):
     """UpdateSyslogDestination request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorA9F5796226051218Eac559Ab5211384, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAaebb912125213B350D7423B4F01A4(object):
     """UpdateEmailDestination request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorAaebb912125213B350D7423B4F01A4, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
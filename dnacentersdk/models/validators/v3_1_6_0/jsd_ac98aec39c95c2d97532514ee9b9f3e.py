@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAc98Aec39C95C2D97532514Ee9B9F3E(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorAc98Aec39C95C2D97532514Ee9B9F3E(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorAc98Aec39C95C2D97532514Ee9B9F3E, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "type": "object"
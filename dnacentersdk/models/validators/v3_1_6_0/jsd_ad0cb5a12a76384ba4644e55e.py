@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAD0Cb5A12A76384Ba4644E55E(object):
     """LANAutomationStopAndUpdateDevicesV2 request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorAD0Cb5A12A76384Ba4644E55E, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
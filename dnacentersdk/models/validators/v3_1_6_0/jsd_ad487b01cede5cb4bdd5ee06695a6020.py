@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAd487B01Cede5Cb4Bdd5Ee06695A6020(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorAd487B01Cede5Cb4Bdd5Ee06695A6020(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorAd487B01Cede5Cb4Bdd5Ee06695A6020, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAd936677C99A58F6B532359D66Fe98A7(object):
     """UpdatesFloorSettingsV2 request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorAd936677C99A58F6B532359D66Fe98A7, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAda3522DE8Ef54729E9FC242Df292547(object):
     """UpdateFabricZone request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorAda3522DE8Ef54729E9FC242Df292547, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAdFc115D6888722B71811Ac96E(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorAdFc115D6888722B71811Ac96E(object):
     request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorAdFc115D6888722B71811Ac96E, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
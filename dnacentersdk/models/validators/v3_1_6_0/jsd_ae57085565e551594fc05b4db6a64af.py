@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAe57085565E551594Fc05B4Db6A64Af(object):
     """AddTransitNetworks request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorAe57085565E551594Fc05B4Db6A64Af, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
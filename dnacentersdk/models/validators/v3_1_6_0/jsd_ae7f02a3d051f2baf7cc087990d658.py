@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAe7F02A3D051F2Baf7Cc087990D658(object):
     """AddControlPlaneDevice request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorAe7F02A3D051F2Baf7Cc087990D658, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
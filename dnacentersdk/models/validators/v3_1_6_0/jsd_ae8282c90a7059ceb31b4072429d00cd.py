@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAe8282C90A7059CeB31B4072429D00Cd(object):
     """SubmitRequestToQuerySitesEnergy request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorAe8282C90A7059CeB31B4072429D00Cd, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAf13Df5F57E523E9Da74929B0Dc587E(object):
     """UpdateLSCCertificateRenewalProfile request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorAf13Df5F57E523E9Da74929B0Dc587E, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorAf7031CC5Ca5B44Af0E6454D558412C(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorAf7031CC5Ca5B44Af0E6454D558412C(object):
     schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorAf7031CC5Ca5B44Af0E6454D558412C, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB0780003F8F05720A7B04Cfa0D0A9A85(object):
     """UpdatesTheNetworkDevice request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorB0780003F8F05720A7B04Cfa0D0A9A85, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB0B146A144A65Aa296B8B939C2926158(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorB0B146A144A65Aa296B8B939C2926158(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorB0B146A144A65Aa296B8B939C2926158, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
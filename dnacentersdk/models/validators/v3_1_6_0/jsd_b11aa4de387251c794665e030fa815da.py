@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB11Aa4De387251C794665E030Fa815Da(object):
     """UpdateApplicationPolicyQueuingProfile request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorB11Aa4De387251C794665E030Fa815Da, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
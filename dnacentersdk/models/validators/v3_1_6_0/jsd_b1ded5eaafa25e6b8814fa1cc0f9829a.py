@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB1Ded5EaAfa25E6B8814Fa1Cc0F9829A(object):
     """CreateANewVariable request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorB1Ded5EaAfa25E6B8814Fa1Cc0F9829A, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
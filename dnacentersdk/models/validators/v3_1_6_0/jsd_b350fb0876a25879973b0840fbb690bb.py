@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB350Fb0876A25879973B0840Fbb690Bb(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorB350Fb0876A25879973B0840Fbb690Bb(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorB350Fb0876A25879973B0840Fbb690Bb, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB4155D6F885A53Ad0E47B1A4(object):
     """ImportProfilingRulesInBulk request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorB4155D6F885A53Ad0E47B1A4, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
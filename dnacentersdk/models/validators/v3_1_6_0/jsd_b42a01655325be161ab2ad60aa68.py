@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB42A01655325Be161Ab2Ad60Aa68(object):
     """UpdateAPProfileByID request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorB42A01655325Be161Ab2Ad60Aa68, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
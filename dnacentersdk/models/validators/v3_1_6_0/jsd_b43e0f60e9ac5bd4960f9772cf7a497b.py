@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB43E0F60E9Ac5Bd4960F9772Cf7A497B(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorB43E0F60E9Ac5Bd4960F9772Cf7A497B(object):
     request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorB43E0F60E9Ac5Bd4960F9772Cf7A497B, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
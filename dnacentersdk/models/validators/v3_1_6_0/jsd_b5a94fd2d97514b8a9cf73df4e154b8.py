@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB5A94Fd2D97514B8A9CF73Df4E154B8(object):
     """RestoreBackup request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorB5A94Fd2D97514B8A9CF73Df4E154B8, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
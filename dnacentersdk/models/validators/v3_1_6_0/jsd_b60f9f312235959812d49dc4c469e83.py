@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB60F9F312235959812D49Dc4C469E83(object):
     """UnMarkDeviceForReplacement request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorB60F9F312235959812D49Dc4C469E83, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB7Ae9494B05A57Bf6393Eaf308B1E7(object):
     """RegisterAnEndpoint request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorB7Ae9494B05A57Bf6393Eaf308B1E7, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
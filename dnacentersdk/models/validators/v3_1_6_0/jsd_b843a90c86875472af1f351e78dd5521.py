@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB843A90C86875472Af1F351E78Dd5521(object):
     """CreateBackupConfiguration request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorB843A90C86875472Af1F351E78Dd5521, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB8699619F95A24Bd2D81F12F048235(object):
     """CreateWebhookDestination request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorB8699619F95A24Bd2D81F12F048235, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB887C55FaAca726Bbe4Ac2564(object):
     """UpdateInterfaceDetails request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorB887C55FaAca726Bbe4Ac2564, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
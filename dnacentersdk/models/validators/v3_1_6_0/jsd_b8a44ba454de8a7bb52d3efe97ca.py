@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB8A44Ba454De8A7BB52D3Efe97Ca(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorB8A44Ba454De8A7BB52D3Efe97Ca(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorB8A44Ba454De8A7BB52D3Efe97Ca, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
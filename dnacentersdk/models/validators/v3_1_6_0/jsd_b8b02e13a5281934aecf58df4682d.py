@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB8B02E13A5281934AEcf58Df4682D(object):
     """UpdateRoleV2 request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorB8B02E13A5281934AEcf58Df4682D, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
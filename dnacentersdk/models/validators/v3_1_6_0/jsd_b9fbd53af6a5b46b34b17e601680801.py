@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorB9Fbd53Af6A5B46B34B17E601680801(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorB9Fbd53Af6A5B46B34B17E601680801(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorB9Fbd53Af6A5B46B34B17E601680801, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
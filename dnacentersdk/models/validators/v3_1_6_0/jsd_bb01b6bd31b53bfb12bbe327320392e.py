@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBb01B6BD31B53BfB12BBe327320392E(object):
     """CreateITSMIntegrationSetting request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorBb01B6BD31B53BfB12BBe327320392E, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
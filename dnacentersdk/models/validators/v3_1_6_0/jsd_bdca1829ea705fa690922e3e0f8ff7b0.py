@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBdca1829Ea705Fa690922E3E0F8Ff7B0(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorBdca1829Ea705Fa690922E3E0F8Ff7B0(object):
     request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorBdca1829Ea705Fa690922E3E0F8Ff7B0, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorBfca373C5D7C863EEf14Abc654Fd(object):
     """AddFabricSite request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorBfca373C5D7C863EEf14Abc654Fd, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
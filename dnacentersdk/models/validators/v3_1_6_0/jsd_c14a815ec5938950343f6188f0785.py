@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC14A815Ec5938950343F6188F0785(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorC14A815Ec5938950343F6188F0785(object):
     request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorC14A815Ec5938950343F6188F0785, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
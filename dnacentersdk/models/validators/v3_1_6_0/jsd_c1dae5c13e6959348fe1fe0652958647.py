@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC1Dae5C13E6959348Fe1Fe0652958647(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorC1Dae5C13E6959348Fe1Fe0652958647(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorC1Dae5C13E6959348Fe1Fe0652958647, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC1Fa19F9295C50018132C6C9Ebc3Fc35(object):
     """BulkDistributeImagesOnNetworkDevices request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorC1Fa19F9295C50018132C6C9Ebc3Fc35, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC2A16208Da55E8A615348Ed3D530Ac(object):
     """UpdateOrOverrideSSID request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorC2A16208Da55E8A615348Ed3D530Ac, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
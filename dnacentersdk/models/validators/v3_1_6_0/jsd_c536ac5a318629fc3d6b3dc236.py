@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC536Ac5A318629Fc3D6B3Dc236(object):
     """QueryClientsEnergy request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorC536Ac5A318629Fc3D6B3Dc236, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
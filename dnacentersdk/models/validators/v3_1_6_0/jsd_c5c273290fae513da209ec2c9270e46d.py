@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC5C273290Fae513DA209Ec2C9270E46D(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorC5C273290Fae513DA209Ec2C9270E46D(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorC5C273290Fae513DA209Ec2C9270E46D, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
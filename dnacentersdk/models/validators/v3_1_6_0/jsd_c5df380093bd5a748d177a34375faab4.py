@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC5Df380093Bd5A748D177A34375Faab4(object):
     """AddsANewNetworkDevice request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorC5Df380093Bd5A748D177A34375Faab4, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
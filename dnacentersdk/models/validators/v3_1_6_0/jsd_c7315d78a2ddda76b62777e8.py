@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC7315D78A2DdDa76B62777E8(object):
     """ReservecreateIPAddressSubpools request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorC7315D78A2DdDa76B62777E8, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC7F28C3D23Ba5384Be5E769Ae0505D00(object):
     """UpdateDeviceControllabilitySettings request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorC7F28C3D23Ba5384Be5E769Ae0505D00, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC8354B61A36524CBb2E1037Bd814807(object):
     """RogueAdditionalDetails request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorC8354B61A36524CBb2E1037Bd814807, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC85B39D6Bae0536695992Ddbb91Ea96D(object):
     """UpdateCSSMConnectionMode request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorC85B39D6Bae0536695992Ddbb91Ea96D, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
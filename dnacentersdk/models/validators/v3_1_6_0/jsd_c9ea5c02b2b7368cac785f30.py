@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorC9Ea5C02B2B7368Cac785F30(object):
     """UpdateSNMPWriteCommunity request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorC9Ea5C02B2B7368Cac785F30, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCa2F659B595C0BA7C649Fd8C8Bdad6(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorCa2F659B595C0BA7C649Fd8C8Bdad6(object):
     request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorCa2F659B595C0BA7C649Fd8C8Bdad6, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCa2Fe989A227585086452D24D32867A6(object):
     """CreatePlannedAccessPointForFloor request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorCa2Fe989A227585086452D24D32867A6, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCaeb723A074519498C6B08A1C9Dacb3(object):
     """QueryDevicesEnergy request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorCaeb723A074519498C6B08A1C9Dacb3, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCb38886D0236502783D431455E3Fb880(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorCb38886D0236502783D431455E3Fb880(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorCb38886D0236502783D431455E3Fb880, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
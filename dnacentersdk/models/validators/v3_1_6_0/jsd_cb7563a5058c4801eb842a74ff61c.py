@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCb7563A5058C4801EB842A74Ff61C(object):
     """CreateApplicationSet request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorCb7563A5058C4801EB842A74Ff61C, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCba0EecFc555390935CEbd13E6Bcb90(object):
     """EditTheAccessPointsPositionsV2 request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorCba0EecFc555390935CEbd13E6Bcb90, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCc59D48F8159008F52B29E08738811(object):
     """CreateWirelessProfileConnectivity request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorCc59D48F8159008F52B29E08738811, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCcbf614B4B355Cac929F12Cc61272C1C(object):
     """PreviewTemplate request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorCcbf614B4B355Cac929F12Cc61272C1C, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCd2E825A78B6De087E991F6Fe0(object):
     """SetAAASettingsForASite request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorCd2E825A78B6De087E991F6Fe0, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
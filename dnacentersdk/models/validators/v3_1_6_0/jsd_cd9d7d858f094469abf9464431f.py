@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCd9D7D858F094469Abf9464431F(object):
     """UpdateImagesOnTheNetworkDevice request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorCd9D7D858F094469Abf9464431F, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCdf8C0D3866D5147901C0Cf4821A84A7(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorCdf8C0D3866D5147901C0Cf4821A84A7(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorCdf8C0D3866D5147901C0Cf4821A84A7, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorCf0138550909Ea413Dab063868C(object):
     """CreateANewPortChannelBetweenDevices request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorCf0138550909Ea413Dab063868C, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
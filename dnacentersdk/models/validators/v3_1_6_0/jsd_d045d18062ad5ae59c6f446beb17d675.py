@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD045D18062Ad5Ae59C6F446Beb17D675(object):
     """CreateQosDeviceInterfaceInfo request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorD045D18062Ad5Ae59C6F446Beb17D675, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
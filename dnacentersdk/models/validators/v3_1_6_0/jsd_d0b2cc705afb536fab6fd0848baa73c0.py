@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD0B2Cc705Afb536FAb6FD0848Baa73C0(object):
     """GetEnergySummaryAnalytics request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorD0B2Cc705Afb536FAb6FD0848Baa73C0, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD0E1021DE57D5E95Bbea5D5Bd86B481A(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorD0E1021DE57D5E95Bbea5D5Bd86B481A(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorD0E1021DE57D5E95Bbea5D5Bd86B481A, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
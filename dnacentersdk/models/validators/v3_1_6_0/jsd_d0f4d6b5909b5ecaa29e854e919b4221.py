@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD0F4D6B5909B5EcaA29E854E919B4221(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorD0F4D6B5909B5EcaA29E854E919B4221(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorD0F4D6B5909B5EcaA29E854E919B4221, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
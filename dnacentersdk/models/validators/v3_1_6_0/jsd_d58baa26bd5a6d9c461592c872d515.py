@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD58Baa26Bd5A6D9C461592C872D515(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorD58Baa26Bd5A6D9C461592C872D515(object):
     request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorD58Baa26Bd5A6D9C461592C872D515, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD5Ecdc670Ebc5Bae807F25A53D4E8B7F(object):
     """CreatesDiscovery request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorD5Ecdc670Ebc5Bae807F25A53D4E8B7F, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
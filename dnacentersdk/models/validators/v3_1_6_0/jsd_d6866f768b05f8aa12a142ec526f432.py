@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD6866F768B05F8AA12A142Ec526F432(object):
     """CreateFilterGroup request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorD6866F768B05F8AA12A142Ec526F432, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD7B57050BdB98E9340D0Bc4Dba(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorD7B57050BdB98E9340D0Bc4Dba(object):
     request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorD7B57050BdB98E9340D0Bc4Dba, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD833C51C4F5Cd2879D3E69F773295C(object):
     """CreateAGlobalIPAddressPool request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorD833C51C4F5Cd2879D3E69F773295C, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD8Fcd6DbB7Ff53B58F7398C49B27Ded2(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorD8Fcd6DbB7Ff53B58F7398C49B27Ded2(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorD8Fcd6DbB7Ff53B58F7398C49B27Ded2, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
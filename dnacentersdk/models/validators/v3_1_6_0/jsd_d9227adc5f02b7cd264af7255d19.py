@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD9227Adc5F02B7Cd264Af7255D19(object):
     """AuthorizeDevice request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorD9227Adc5F02B7Cd264Af7255D19, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
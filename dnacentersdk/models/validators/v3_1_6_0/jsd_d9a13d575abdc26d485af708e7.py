@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD9A13D575ABdc26D485Af708E7(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorD9A13D575ABdc26D485Af708E7(object):
     request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorD9A13D575ABdc26D485Af708E7, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
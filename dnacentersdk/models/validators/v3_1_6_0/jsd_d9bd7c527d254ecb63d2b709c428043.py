@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD9Bd7C527D254EcB63D2B709C428043(object):
     """UpdateLicenseSetting request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorD9Bd7C527D254EcB63D2B709C428043, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorD9F276A532E5Eeb86Bb591F8537Fcc7(object):
     """RetrievesTheCountOfREPRings request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorD9F276A532E5Eeb86Bb591F8537Fcc7, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDa24Bdb30635515395471Fe644Cdc7B5(object):
     """UpdateNativeVlanSettingsBySite request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorDa24Bdb30635515395471Fe644Cdc7B5, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDa35060D4A15Da8B4C7D9176408Ca1E(object):
     """CreateLSCCertificateRenewalProfile request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorDa35060D4A15Da8B4C7D9176408Ca1E, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDabd13Cd5E9C928DAf80D6758D62(object):
     """AddLayer3VirtualNetworks request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorDabd13Cd5E9C928DAf80D6758D62, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
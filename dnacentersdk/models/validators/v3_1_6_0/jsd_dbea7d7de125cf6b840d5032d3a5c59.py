@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDbea7D7De125Cf6B840D5032D3A5C59(object):
     """UpdateTemplate request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorDbea7D7De125Cf6B840D5032D3A5C59, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
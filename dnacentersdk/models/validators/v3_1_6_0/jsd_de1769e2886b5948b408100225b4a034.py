@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDe1769E2886B5948B408100225B4A034(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorDe1769E2886B5948B408100225B4A034(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorDe1769E2886B5948B408100225B4A034, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "type": "object"
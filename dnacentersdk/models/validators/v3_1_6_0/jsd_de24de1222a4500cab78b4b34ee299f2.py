@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDe24De1222A4500CAb78B4B34Ee299F2(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorDe24De1222A4500CAb78B4B34Ee299F2(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorDe24De1222A4500CAb78B4B34Ee299F2, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
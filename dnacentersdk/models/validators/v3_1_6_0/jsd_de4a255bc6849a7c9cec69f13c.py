@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDe4A255Bc6849A7C9Cec69F13C(object):
     """GetEnergyTrendAnalytics request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorDe4A255Bc6849A7C9Cec69F13C, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
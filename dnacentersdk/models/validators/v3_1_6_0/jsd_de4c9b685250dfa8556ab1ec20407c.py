@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDe4C9B685250DfA8556Ab1Ec20407C(object):
     """RogueAdditionalDetailCount request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorDe4C9B685250DfA8556Ab1Ec20407C, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDeb34387D0235811A90985711Be9Fe2E(object):
     """ConfigureAccessPointsV2 request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorDeb34387D0235811A90985711Be9Fe2E, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
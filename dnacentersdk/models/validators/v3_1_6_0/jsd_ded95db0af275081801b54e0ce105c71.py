@@ -31,6 +31,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDed95Db0Af275081801B54E0Ce105C71(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorDed95Db0Af275081801B54E0Ce105C71(object):
     HealthMetrics request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorDed95Db0Af275081801B54E0Ce105C71, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDfc7C061F9259Ee891E60Fd91235129(object):
     """UpdateAnExistingVariable request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorDfc7C061F9259Ee891E60Fd91235129, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorDfe3872E591F9F3E2A0Daa358C1A(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorDfe3872E591F9F3E2A0Daa358C1A(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorDfe3872E591F9F3E2A0Daa358C1A, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
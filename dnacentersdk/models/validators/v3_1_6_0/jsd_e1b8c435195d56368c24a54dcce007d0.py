@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE1B8C435195D56368C24A54Dcce007D0(object):
     """UpdateNetwork request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorE1B8C435195D56368C24A54Dcce007D0, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE235D44E4485BafA4499F5A8E53Bcd3(object):
     """UpdatesAGlobalIPAddressPool request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorE235D44E4485BafA4499F5A8E53Bcd3, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE2F9718DE3D050819Cdc6355A3A43200(object):
     """EditSensorTestTemplate request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorE2F9718DE3D050819Cdc6355A3A43200, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
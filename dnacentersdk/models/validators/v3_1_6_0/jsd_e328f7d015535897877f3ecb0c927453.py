@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE328F7D015535897877F3Ecb0C927453(object):
     """UpdatesAnIPAddressSubpool request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorE328F7D015535897877F3Ecb0C927453, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
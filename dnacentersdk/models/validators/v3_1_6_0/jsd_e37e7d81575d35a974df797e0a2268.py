@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE37E7D81575D35A974Df797E0A2268(object):
     """CreateTemplateProject request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorE37E7D81575D35A974Df797E0A2268, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
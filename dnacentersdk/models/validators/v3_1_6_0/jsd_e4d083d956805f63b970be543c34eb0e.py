@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE4D083D956805F63B970Be543C34Eb0E(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorE4D083D956805F63B970Be543C34Eb0E(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorE4D083D956805F63B970Be543C34Eb0E, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
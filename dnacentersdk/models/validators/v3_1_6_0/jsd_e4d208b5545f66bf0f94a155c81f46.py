@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE4D208B5545F66Bf0F94A155C81F46(object):
     """CreateApplicationSetsV2 request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorE4D208B5545F66Bf0F94A155C81F46, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE4Ddf9B60Efb59Ac8F6A200A563D9D72(object):
     """UpdateDownloadedRelease request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorE4Ddf9B60Efb59Ac8F6A200A563D9D72, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
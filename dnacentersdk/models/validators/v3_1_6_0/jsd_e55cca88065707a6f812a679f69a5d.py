@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE55Cca88065707A6F812A679F69A5D(object):
     """UpdateAPAuthorizationList request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorE55Cca88065707A6F812A679F69A5D, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE62749061C5Aae8Ecd1Ccc2D315153(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorE62749061C5Aae8Ecd1Ccc2D315153(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorE62749061C5Aae8Ecd1Ccc2D315153, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE6BcA55256A0Aac288486E38049B(object):
     """SystemLicensingRegistration request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorE6BcA55256A0Aac288486E38049B, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE6Eed78CB55D51A1Bfe669729Df25689(object):
     """ThreatSummary request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorE6Eed78CB55D51A1Bfe669729Df25689, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
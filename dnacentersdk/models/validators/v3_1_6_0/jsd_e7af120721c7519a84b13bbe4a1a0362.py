@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE7Af120721C7519A84B13Bbe4A1A0362(object):
     """GetTopNAnalyticsDataOfIssues request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorE7Af120721C7519A84B13Bbe4A1A0362, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE9C39175D785A0EB9D6F402F378A2Ba(object):
     """CreateNFSConfiguration request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorE9C39175D785A0EB9D6F402F378A2Ba, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
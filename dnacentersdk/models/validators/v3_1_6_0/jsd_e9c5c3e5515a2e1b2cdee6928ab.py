@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorE9C5C3E5515A2E1B2Cdee6928Ab(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorE9C5C3E5515A2E1B2Cdee6928Ab(object):
     request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorE9C5C3E5515A2E1B2Cdee6928Ab, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
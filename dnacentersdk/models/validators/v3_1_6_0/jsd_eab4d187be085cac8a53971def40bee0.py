@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEab4D187Be085Cac8A53971Def40Bee0(object):
     """APProvisionConnectivity request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorEab4D187Be085Cac8A53971Def40Bee0, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEb209544555E43Ae2BC909499F3900(object):
     """EditPlannedAccessPointsPositionsV2 request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorEb209544555E43Ae2BC909499F3900, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
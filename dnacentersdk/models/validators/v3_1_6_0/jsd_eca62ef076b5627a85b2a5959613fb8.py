@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEca62Ef076B5627A85B2A5959613Fb8(object):
     """CreateNetwork request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorEca62Ef076B5627A85B2A5959613Fb8, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEcb990Ad7F24519397Dd8D6C88De0067(object):
     """CreateANewCondition request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorEcb990Ad7F24519397Dd8D6C88De0067, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
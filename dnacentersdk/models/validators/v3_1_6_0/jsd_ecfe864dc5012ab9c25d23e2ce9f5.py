@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEcfe864Dc5012Ab9C25D23E2Ce9F5(object):
     """UpdateAnchorGroup request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorEcfe864Dc5012Ab9C25D23E2Ce9F5, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEd266E6EDa225AedBf581508635Da822(object):
     """CreateUserDefinedField request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorEd266E6EDa225AedBf581508635Da822, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEd96D98063C5Be9Aa0005772Dc95Fc5(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorEd96D98063C5Be9Aa0005772Dc95Fc5(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorEd96D98063C5Be9Aa0005772Dc95Fc5, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
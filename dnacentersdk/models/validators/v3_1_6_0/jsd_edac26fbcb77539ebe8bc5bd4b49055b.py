@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEdac26FbCb77539EBe8BC5Bd4B49055B(object):
     """ValidatesANetworkDevice request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorEdac26FbCb77539EBe8BC5Bd4B49055B, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEdf997Bb4Bcc5Dd6Baca80647D8A47Ce(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorEdf997Bb4Bcc5Dd6Baca80647D8A47Ce(object):
     request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorEdf997Bb4Bcc5Dd6Baca80647D8A47Ce, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEe7664344F50Cb8F2C94Beaa01629D(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorEe7664344F50Cb8F2C94Beaa01629D(object):
     request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorEe7664344F50Cb8F2C94Beaa01629D, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEea45FcA32F5F12Adc30A9D03C43Ac6(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorEea45FcA32F5F12Adc30A9D03C43Ac6(object):
     request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorEea45FcA32F5F12Adc30A9D03C43Ac6, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
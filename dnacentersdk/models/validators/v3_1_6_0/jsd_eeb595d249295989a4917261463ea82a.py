@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEeb595D249295989A4917261463Ea82A(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorEeb595D249295989A4917261463Ea82A(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorEeb595D249295989A4917261463Ea82A, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEec9550D3B5C9C9A10E65C3Ef2Fc2D(object):
     """SetSiteAssignmentsForPolicy request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorEec9550D3B5C9C9A10E65C3Ef2Fc2D, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorEecf4323Cb285985Be72A7E061891059(object):
     """CreateGlobalPool request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorEecf4323Cb285985Be72A7E061891059, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -31,6 +31,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF1DebbfD4775FabA3779C513181Dfbf(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorF1DebbfD4775FabA3779C513181Dfbf(object):
     request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorF1DebbfD4775FabA3779C513181Dfbf, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF200Dc9A10D25BeaB1243A5B29F99C7D(object):
     """ConfigureAREPRingOnFABRICDeployment request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorF200Dc9A10D25BeaB1243A5B29F99C7D, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
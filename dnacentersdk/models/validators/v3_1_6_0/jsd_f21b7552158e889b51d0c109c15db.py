@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF21B7552158E889B51D0C109C15Db(object):
     """BulkUpdateImagesOnNetworkDevices request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorF21B7552158E889B51D0C109C15Db, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
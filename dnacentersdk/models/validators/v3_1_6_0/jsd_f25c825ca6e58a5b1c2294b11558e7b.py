@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF25C825Ca6E58A5B1C2294B11558E7B(object):
     """IssueTriggerDefinitionUpdate request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorF25C825Ca6E58A5B1C2294B11558E7B, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
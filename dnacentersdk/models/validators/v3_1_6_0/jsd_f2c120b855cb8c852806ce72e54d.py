@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF2C120B855Cb8C852806Ce72E54D(object):
     """SyncDevicesUsingForcesync request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorF2C120B855Cb8C852806Ce72E54D, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
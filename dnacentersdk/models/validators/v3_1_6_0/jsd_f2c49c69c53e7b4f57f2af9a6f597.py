@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF2C49C69C53E7B4F57F2Af9A6F597(object):
     """IgnoreTheGivenListOfIssues request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorF2C49C69C53E7B4F57F2Af9A6F597, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF2Dc0B2Dd265D3BB69C5Aeb5Cff2F13(object):
     """InstallOptionalPackages request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorF2Dc0B2Dd265D3BB69C5Aeb5Cff2F13, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
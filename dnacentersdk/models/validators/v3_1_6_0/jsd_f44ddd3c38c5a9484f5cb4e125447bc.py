@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF44Ddd3C38C5A9484F5Cb4E125447Bc(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorF44Ddd3C38C5A9484F5Cb4E125447Bc(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorF44Ddd3C38C5A9484F5Cb4E125447Bc, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF486694F3Da57B4921B7F2036A1B754(object):
     """UpdateAnycastGateways request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorF486694F3Da57B4921B7F2036A1B754, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
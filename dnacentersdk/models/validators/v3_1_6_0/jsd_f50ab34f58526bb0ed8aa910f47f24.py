@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF50Ab34F58526BB0Ed8Aa910F47F24(object):
     """UpdateAnExistingPolicy request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorF50Ab34F58526BB0Ed8Aa910F47F24, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
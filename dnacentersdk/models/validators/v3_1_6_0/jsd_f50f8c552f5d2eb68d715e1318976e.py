@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF50F8C552F5D2EB68D715E1318976E(object):
     """UpdatesAnArea request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorF50F8C552F5D2EB68D715E1318976E, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF5602B2965E53B5BdDa193025A3Fc(object):
     """RebootAccessPoints request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorF5602B2965E53B5BdDa193025A3Fc, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
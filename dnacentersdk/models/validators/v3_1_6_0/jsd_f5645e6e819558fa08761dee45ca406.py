@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF5645E6E819558FA08761Dee45Ca406(object):
     """CreateNetconfCredentials request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorF5645E6E819558FA08761Dee45Ca406, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF57Dc44184564CB97A6573A44Ad394(object):
     """DownloadRelease request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorF57Dc44184564CB97A6573A44Ad394, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
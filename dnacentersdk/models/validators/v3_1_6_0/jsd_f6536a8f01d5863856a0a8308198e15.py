@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF6536A8F01D5863856A0A8308198E15(object):
     """UpdateHTTPWriteCredentials request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorF6536A8F01D5863856A0A8308198E15, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -31,6 +31,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF667322836D5527482Ad2100Bec7Feb4(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorF667322836D5527482Ad2100Bec7Feb4(object):
     mplexFiltersAndAggregationFunctions request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorF667322836D5527482Ad2100Bec7Feb4, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF71D0B2527B8Cd13123F9A68Cf3(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorF71D0B2527B8Cd13123F9A68Cf3(object):
     schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorF71D0B2527B8Cd13123F9A68Cf3, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
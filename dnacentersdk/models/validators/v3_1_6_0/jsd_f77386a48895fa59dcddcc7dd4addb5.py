@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF77386A48895Fa59DcdDcc7Dd4Addb5(object):
     """CreateHTTPWriteCredentials request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorF77386A48895Fa59DcdDcc7Dd4Addb5, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF7A0Cdee493D597E816E012Afbcc928D(object):
     """CreateANewRule request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorF7A0Cdee493D597E816E012Afbcc928D, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF7Cf4F24D54C6944A31Ed308F8361(object):
     """UpdateNetconfCredentials request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorF7Cf4F24D54C6944A31Ed308F8361, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF829D3E99565937B9D12C873F8Faa46(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorF829D3E99565937B9D12C873F8Faa46(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorF829D3E99565937B9D12C873F8Faa46, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF90Ae8599C8A21C98B7A1Ca804(object):
     """UpdateSSIDToIPPoolMapping request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorF90Ae8599C8A21C98B7A1Ca804, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -31,6 +31,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF924B4C27D18500B9B23Df516B55C182(object):
@@ -38,7 +39,7 @@ class JSONSchemaValidatorF924B4C27D18500B9B23Df516B55C182(object):
     gurationOnTheDevice request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorF924B4C27D18500B9B23Df516B55C182, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "type": "object"
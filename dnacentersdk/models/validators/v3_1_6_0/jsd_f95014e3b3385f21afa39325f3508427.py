@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorF95014E3B3385F21Afa39325F3508427(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorF95014E3B3385F21Afa39325F3508427(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorF95014E3B3385F21Afa39325F3508427, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
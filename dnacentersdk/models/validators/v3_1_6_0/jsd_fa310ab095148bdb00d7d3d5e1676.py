@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFa310Ab095148Bdb00D7D3D5E1676(object):
     """CreateOrScheduleAReport request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorFa310Ab095148Bdb00D7D3D5E1676, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
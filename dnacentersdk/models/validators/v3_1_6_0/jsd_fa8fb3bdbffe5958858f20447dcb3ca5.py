@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFa8Fb3BdBffe5958858F20447Dcb3Ca5(object):
     """AddALANAutomatedLinkToAPortChannel request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorFa8Fb3BdBffe5958858F20447Dcb3Ca5, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFc95C917352Ad8410Ffe6D6E522Ed(object):
     """CreatesABuildingV2 request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorFc95C917352Ad8410Ffe6D6E522Ed, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
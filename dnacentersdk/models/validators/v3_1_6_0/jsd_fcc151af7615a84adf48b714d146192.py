@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFcc151AF7615A84Adf48B714D146192(object):
     """CreateEventSubscriptions request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorFcc151AF7615A84Adf48B714D146192, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
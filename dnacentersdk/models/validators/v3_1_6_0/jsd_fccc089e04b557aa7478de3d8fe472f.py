@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFccc089E04B557AA7478De3D8Fe472F(object):
     """AddPlannedAccessPointsPositionsV2 request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorFccc089E04B557AA7478De3D8Fe472F, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
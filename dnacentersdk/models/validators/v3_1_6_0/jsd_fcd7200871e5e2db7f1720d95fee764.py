@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFcd7200871E5E2DB7F1720D95Fee764(object):
     """CountDevicesEnergyFromQuery request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorFcd7200871E5E2DB7F1720D95Fee764, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFdd2Af215B9B8327A3E24A3Dea89(object):
     """UpdateWorkflow request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorFdd2Af215B9B8327A3E24A3Dea89, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
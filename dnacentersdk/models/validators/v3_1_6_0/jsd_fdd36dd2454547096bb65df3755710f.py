@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFdd36Dd2454547096Bb65Df3755710F(object):
     """AddAllowedMacAddress request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorFdd36Dd2454547096Bb65Df3755710F, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "items": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFdfc828270D950EcB75480Fe03F7D573(object):
     """UpdateResyncIntervalForTheNetworkDevice request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorFdfc828270D950EcB75480Fe03F7D573, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFeb78FeC3E454E1Bd9DD531A6A29100(object):
     """UpdateAnExistingRule request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorFeb78FeC3E454E1Bd9DD531A6A29100, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFebb2149Ac5F8BA25DBf4D9A862D94(object):
     """TaggingGoldenImage request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorFebb2149Ac5F8BA25DBf4D9A862D94, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFee1860B4D509585956565Df54A91A(object):
     """GetTrendAnalyticsDataOfIssues request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorFee1860B4D509585956565Df54A91A, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -30,6 +30,7 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFfd2Fefb57D5523C87A5D941Eb93Ddc3(object):
@@ -37,7 +38,7 @@ class JSONSchemaValidatorFfd2Fefb57D5523C87A5D941Eb93Ddc3(object):
     definition."""
     def __init__(self):
         super(JSONSchemaValidatorFfd2Fefb57D5523C87A5D941Eb93Ddc3, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
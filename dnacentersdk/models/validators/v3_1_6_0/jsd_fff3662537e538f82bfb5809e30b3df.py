@@ -30,13 +30,14 @@ from builtins import *
 import fastjsonschema
 
 from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models.schema_cache import compile_schema
 
 
 class JSONSchemaValidatorFff3662537E538F82BfB5809E30B3Df(object):
     """QueryNetworkDevicesWithFilters request schema definition."""
     def __init__(self):
         super(JSONSchemaValidatorFff3662537E538F82BfB5809E30B3Df, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads('''
+        self._validator = compile_schema(json.loads('''
 {
     "$schema": "http://json-schema.org/draft-04/schema#",
     "properties": {
@@ -0,0 +1,480 @@
+# -*- coding: utf-8 -*-
+"""Auto-pagination of the offset/limit endpoints of the DNA Center APIs.
+
+Copyright (c) 2019-2021 Cisco Systems.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import collections
+import functools
+import inspect
+import logging
+import re
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from builtins import *
+
+from .config import DEFAULT_PAGINATION_WORKERS
+from .utils import check_type
+
+logger = logging.getLogger(__name__)
+
+#: How an endpoint is paginated. `offset_base` is the offset of the first
+#: record (0 or 1), `max_page_size` the largest `limit` it accepts (None if
+#: it is not documented) and `page_offsets` whether the offset counts pages
+#: instead of records.
+PaginationInfo = namedtuple(
+    "PaginationInfo", ["offset_base", "max_page_size", "page_offsets"]
+)
+
+_ZERO_BASED_OFFSET = re.compile(
+    r"numbered 0|starts at zero|minimum value is:? 0|greater than or equal to 0"
+    r"|records to skip|default value:? 0\b|whose default value 0",
+    re.IGNORECASE,
+)
+_ONE_BASED_OFFSET = re.compile(
+    r"numbered 1|one based|1-based|indexed from 1|starting value is 1"
+    r"|minimum(?: value is)?:? 1\b|offset >= 1|default value(?: is)?:? 1\b"
+    r"|mu(?:l)?tiple of 'limit' \+ 1",
+    re.IGNORECASE,
+)
+_PAGE_OFFSET = re.compile(r"offset=1 will return next", re.IGNORECASE)
+_MAX_PAGE_SIZE = re.compile(
+    r"max(?:imum)?(?: allowed)?(?: value| limit)?(?: is| of| at| can be)?:? (\d+)"
+    r"|maximum(?: values?)? (?:is|are) (?:[01] and )?(\d+)"
+    r"|between 1 (?:and|to) (\d+)"
+    r"|\[1, ?(\d+)\]"
+    r"|and (\d+), respectively"
+    r"|maximum (\d+) records"
+    r"|default and max supported value is (\d+)"
+    r"|maximum number of objects supported in a single request is (\d+)"
+    r"|maximum value of \{limit\} supported is (\d+)",
+    re.IGNORECASE,
+)
+
+
+def _parameter_doc(doc, name):
+    """Get the documentation of a parameter in a Google-style docstring."""
+    match = re.search(
+        r"^( +){}\([^)]*\):(.*?)(?=^\1\w+\(|^\s*$|\Z)".format(name),
+        doc,
+        re.MULTILINE | re.DOTALL,
+    )
+    return " ".join(match.group(2).split()) if match else None
+
+
+@functools.lru_cache(maxsize=None)
+def _function_pagination_info(function):
+    doc = inspect.getdoc(function) or ""
+    offset_doc = _parameter_doc(doc, "offset") or ""
+    limit_doc = _parameter_doc(doc, "limit") or ""
+
+    page_offsets = bool(_PAGE_OFFSET.search(offset_doc))
+    if page_offsets or _ZERO_BASED_OFFSET.search(offset_doc):
+        offset_base = 0
+    elif _ONE_BASED_OFFSET.search(offset_doc):
+        offset_base = 1
+    else:
+        offset_base = None
+
+    max_page_size = None
+    match = _MAX_PAGE_SIZE.search(limit_doc)
+    if match:
+        max_page_size = int(next(group for group in match.groups() if group))
+    return PaginationInfo(offset_base, max_page_size, page_offsets)
+
+
+def pagination_info(method):
+    """Get how an API wrapper method is paginated, from the documentation of
+    its `offset` and `limit` parameters.
+
+    Args:
+        method(callable): An API wrapper method, e.g.
+            api.devices.get_device_list.
+
+    Returns:
+        PaginationInfo: The offset base (None if it is not documented), the
+        maximum page size (None if it is not documented) and whether the
+        offset counts pages.
+    """
+    return _function_pagination_info(getattr(method, "__func__", method))
+
+
+_LIST_OF = re.compile(r"^(\w+?)_the_list_of_(.+?)(?:_(?:while|along|for|by|that|with)_.*)?$")
+
+
+def count_method(method):
+    """Find the count endpoint of a list endpoint, on the same API wrapper:
+    e.g. get_device_count for get_device_list, get_sites_count for
+    get_sites or retrieves_the_total_count_of_clients_by_applying_basic_filtering
+    for retrieves_the_list_of_clients_while_also_offering_basic_filtering_and_sorting_capabilities.
+
+    Args:
+        method(callable): A bound API wrapper method.
+
+    Returns:
+        callable: The bound count method, or None if there is none.
+    """
+    wrapper = getattr(method, "__self__", None)
+    name = getattr(method, "__name__", "")
+    if wrapper is None:
+        return None
+
+    candidates = [name + "_count"]
+    if name.endswith("_list"):
+        candidates.append(name[: -len("_list")] + "_count")
+    if name.endswith("s"):
+        candidates.append(name[:-1] + "_count")
+    for candidate in candidates:
+        if callable(getattr(wrapper, candidate, None)):
+            return getattr(wrapper, candidate)
+
+    match = _LIST_OF.match(name)
+    if match:
+        prefix = "{}_the_total_count_of_{}".format(*match.groups())
+        names = [
+            candidate
+            for candidate in dir(type(wrapper))
+            if candidate == prefix or candidate.startswith(prefix + "_")
+        ]
+        if len(names) == 1:
+            return getattr(wrapper, names[0])
+    return None
+
+
+def total_count(result):
+    """Get the count of a count endpoint response: its `response` number,
+    or the `count` of its `response` object.
+
+    Raises:
+        ValueError: If the response has no count.
+    """
+    count = result.get("response") if isinstance(result, dict) else result
+    if isinstance(count, dict):
+        count = count.get("count")
+    if isinstance(count, bool) or not isinstance(count, int):
+        raise ValueError("Not a count response: {!r}".format(result))
+    return count
+
+
+def page_items(page, items_key="response"):
+    """Get the items of a page: its `items_key` list or the page itself if
+    it is a list."""
+    if isinstance(page, list):
+        return page
+    if isinstance(page, dict):
+        items = page.get(items_key)
+        if items is None:
+            return []
+        return items if isinstance(items, list) else [items]
+    return []
+
+
+class Paginator(object):
+    """Calls an offset/limit API wrapper method page by page.
+
+    The offset base and the page size default to the ones documented for
+    the endpoint (see pagination_info); they must be given for an endpoint
+    whose documentation does not tell them. Pages are requested lazily,
+    while the items are consumed, each one at the offset after the records
+    received so far, until a page is empty or has less items than a
+    previous one: the server may return less than the page size.
+
+    Example:
+        for device in Paginator(api.devices.get_device_list)(family="Switches and Hubs"):
+            print(device.hostname)
+    """
+
+    def __init__(self, method, page_size=None, offset_base=None, items_key="response"):
+        """Create a new Paginator.
+
+        Args:
+            method(callable): The API wrapper method, which takes `offset`
+                and `limit` kwargs.
+            page_size(int): The `limit` of the requests.
+            offset_base(int): The offset of the first record, 0 or 1.
+            items_key(str): The member of the items in the responses.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If page_size is not positive or offset_base is
+                not 0 or 1, or one of them is not given and not documented
+                for the endpoint.
+        """
+        check_type(page_size, int)
+        check_type(offset_base, int)
+        check_type(items_key, str, may_be_none=False)
+
+        info = pagination_info(method)
+        name = getattr(method, "__name__", method)
+        if offset_base is None:
+            offset_base = info.offset_base
+            if offset_base is None:
+                raise ValueError(
+                    "The offset base of {} is not documented, "
+                    "pass offset_base".format(name)
+                )
+        if page_size is None:
+            page_size = info.max_page_size
+            if page_size is None:
+                raise ValueError(
+                    "The maximum limit of {} is not documented, "
+                    "pass page_size".format(name)
+                )
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        if offset_base not in (0, 1):
+            raise ValueError("offset_base must be 0 or 1")
+
+        self.method = method
+        self.page_size = page_size
+        self.offset_base = offset_base
+        self.page_offsets = info.page_offsets
+        self.items_key = items_key
+
+    def offset(self, page_number, received=None):
+        """The offset of the page number `page_number` (starting at 0),
+        after `received` records, or after full pages if it is None."""
+        if self.page_offsets:
+            return self.offset_base + page_number
+        if received is None:
+            received = page_number * self.page_size
+        return self.offset_base + received
+
+    def get_page(self, page_number, *args, **kwargs):
+        """Request the page number `page_number` (starting at 0), after
+        full pages.
+
+        Returns:
+            list: The items of the page.
+        """
+        return self._request(self.offset(page_number), *args, **kwargs)
+
+    def _request(self, offset, *args, **kwargs):
+        """Request the page at `offset`; return its items."""
+        kwargs["offset"] = offset
+        kwargs["limit"] = self.page_size
+        logger.debug(
+            "Requesting offset {} of {}".format(
+                offset, getattr(self.method, "__name__", self.method)
+            )
+        )
+        return page_items(self.method(*args, **kwargs), self.items_key)
+
+    def pages(self, *args, **kwargs):
+        """Iterate over the pages of the endpoint.
+
+        Args:
+            *args: Passed on to the method.
+            **kwargs: Passed on to the method, except `offset` and `limit`.
+
+        Yields:
+            list: The items of every page.
+        """
+        kwargs.pop("offset", None)
+        kwargs.pop("limit", None)
+        return self._pages_from(0, 0, None, *args, **kwargs)
+
+    def _pages_from(self, page_number, received, served, *args, **kwargs):
+        """Request the pages one after the other from `page_number`, after
+        `received` records, until a page is empty or has less items than
+        `served`, the largest page returned by the server so far."""
+        while True:
+            items = self._request(
+                self.offset(page_number, received), *args, **kwargs
+            )
+            if not items:
+                return
+            yield items
+            if served is not None and len(items) < served:
+                return
+            served = max(served or 0, len(items))
+            received += len(items)
+            page_number += 1
+
+    def __call__(self, *args, **kwargs):
+        """Iterate over the items of all the pages of the endpoint.
+
+        Args:
+            *args: Passed on to the method.
+            **kwargs: Passed on to the method, except `offset` and `limit`.
+
+        Yields:
+            The items of the pages.
+        """
+        for items in self.pages(*args, **kwargs):
+            for item in items:
+                yield item
+
+
+def paginate(method, *args, **kwargs):
+    """Iterate over the items of all the pages of an offset/limit endpoint.
+
+    Shortcut for Paginator(method)(*args, **kwargs).
+
+    Example:
+        for site in paginate(api.sites.get_site, type="building"):
+            print(site.name)
+    """
+    return Paginator(method)(*args, **kwargs)
+
+
+class PrefetchPaginator(Paginator):
+    """Paginator that gets the number of records from the count endpoint
+    first and then requests the pages concurrently.
+
+    The first page is requested alone, to learn how many records the
+    server returns per page, then up to `workers` of the other pages are
+    requested at the same time and the pages are yielded in order. If the
+    last counted page is full (records were added in the meantime) the
+    next pages are requested one after the other.
+
+    Example:
+        devices = PrefetchPaginator(api.devices.get_device_list, workers=8)
+        for device in devices(family="Switches and Hubs"):
+            print(device.hostname)
+    """
+
+    def __init__(
+        self,
+        method,
+        page_size=None,
+        offset_base=None,
+        items_key="response",
+        workers=DEFAULT_PAGINATION_WORKERS,
+        count=None,
+    ):
+        """Create a new PrefetchPaginator.
+
+        Args:
+            method(callable): The API wrapper method, which takes `offset`
+                and `limit` kwargs.
+            page_size(int): The `limit` of the requests.
+            offset_base(int): The offset of the first record, 0 or 1.
+            items_key(str): The member of the items in the responses.
+            workers(int): Maximum number of pages requested at once.
+            count(callable): The count endpoint method. Defaults to the
+                one found by count_method.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If page_size or workers are not positive, or
+                offset_base is not 0 or 1, or there is no count method.
+        """
+        check_type(workers, int, may_be_none=False)
+        super(PrefetchPaginator, self).__init__(
+            method, page_size=page_size, offset_base=offset_base, items_key=items_key
+        )
+        if workers < 1:
+            raise ValueError("workers must be positive")
+        count = count or count_method(method)
+        if count is None:
+            raise ValueError(
+                "No count method found for {}".format(
+                    getattr(method, "__name__", method)
+                )
+            )
+
+        self.workers = workers
+        self.count_method = count
+
+    def count(self, *args, **kwargs):
+        """Get the number of records from the count endpoint.
+
+        The kwargs of the list method that the count method takes (the
+        filters) are passed on to it.
+        """
+        parameters = inspect.signature(self.count_method).parameters
+        count_kwargs = {
+            name: value
+            for name, value in kwargs.items()
+            if name in parameters and name not in ("offset", "limit")
+        }
+        return total_count(self.count_method(*args, **count_kwargs))
+
+    def pages(self, *args, **kwargs):
+        """Iterate over the pages of the endpoint, requested concurrently.
+
+        Args:
+            *args: Passed on to the method.
+            **kwargs: Passed on to the method, except `offset` and `limit`.
+
+        Yields:
+            list: The items of every page, in order.
+        """
+        kwargs.pop("offset", None)
+        kwargs.pop("limit", None)
+        count = self.count(*args, **kwargs)
+        if not count:
+            return
+        items = self.get_page(0, *args, **kwargs)
+        if not items:
+            return
+        yield items
+        served = len(items)
+        page_count = -(-count // served)
+        logger.debug("Requesting {} pages of {} records".format(page_count, served))
+
+        futures = collections.deque()
+        executor = ThreadPoolExecutor(self.workers)
+        try:
+            for page_number in range(1, page_count):
+                futures.append(
+                    executor.submit(
+                        self._request,
+                        self.offset(page_number, page_number * served),
+                        *args,
+                        **kwargs
+                    )
+                )
+                # Keep at most `workers` pages ahead of the consumer
+                while len(futures) > self.workers:
+                    items = futures.popleft().result()
+                    if items:
+                        yield items
+            while futures:
+                items = futures.popleft().result()
+                if items:
+                    yield items
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+        if len(items) == served:
+            # Records were added since they were counted
+            for items in self._pages_from(
+                page_count, page_count * served, served, *args, **kwargs
+            ):
+                yield items
+
+
+def prefetch(method, *args, **kwargs):
+    """Iterate over the items of all the pages of an offset/limit endpoint,
+    requested concurrently after calling its count endpoint.
+
+    Shortcut for PrefetchPaginator(method)(*args, **kwargs).
+
+    Example:
+        for device in prefetch(api.devices.get_device_list):
+            print(device.hostname)
+    """
+    return PrefetchPaginator(method)(*args, **kwargs)
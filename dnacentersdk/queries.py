@@ -0,0 +1,519 @@
+# -*- coding: utf-8 -*-
+"""Runner of the submit-then-poll queries of the DNA Center assurance APIs.
+
+Copyright (c) 2019-2021 Cisco Systems.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import asyncio
+import functools
+import inspect
+import logging
+import queue
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from builtins import *
+
+from .config import (
+    DEFAULT_PAGINATION_OFFSET_BASE,
+    DEFAULT_QUERY_BUFFER_SIZE,
+    DEFAULT_QUERY_CONCURRENCY,
+    DEFAULT_QUERY_PAGE_SIZE,
+    DEFAULT_TASK_POLL_BACKOFF,
+    DEFAULT_TASK_POLL_INTERVAL,
+    DEFAULT_TASK_POLL_MAX_INTERVAL,
+)
+from .exceptions import ApiError
+from .pagination import page_items
+from .tasks import task_id_of
+from .utils import check_type
+
+logger = logging.getLogger(__name__)
+
+_SUBMIT = re.compile(r"^submit_request_(?:to|for)_(.+?)(?:_from_query)?$")
+_RESULT = re.compile(r"^(?:get_)?(.+?)_for_the_given_task_id$")
+
+# Status codes of the result of a query that is still processed
+_PENDING_STATUS_CODES = (202, 404, 409)
+
+# End of the rows of a query in QueryRunner.stream
+_DONE = object()
+
+# Seconds between the checks of the end of QueryRunner.stream by a query
+# waiting for room in the full buffer
+_PUT_TIMEOUT = 0.1
+
+
+def _accepts(function, name):
+    try:
+        return name in inspect.signature(function).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def _result_name(wrapper_class, submit_name):
+    match = _SUBMIT.match(submit_name)
+    if not match:
+        return None
+    names = [
+        name
+        for name in dir(wrapper_class)
+        if _RESULT.match(name)
+        and _RESULT.match(name).group(1) == match.group(1)
+        and _accepts(getattr(wrapper_class, name), "task_id")
+    ]
+    return names[0] if len(names) == 1 else None
+
+
+def result_method(submit):
+    """Find the result endpoint of a query submission endpoint, on the same
+    API wrapper: e.g. query_sites_energy_for_the_given_task_id for
+    submit_request_to_query_sites_energy or
+    get_site_analytics_summary_data_for_the_given_task_id for
+    submit_request_for_site_analytics_summary_data.
+
+    Args:
+        submit(callable): A bound API wrapper method.
+
+    Returns:
+        callable: The bound result method, or None if there is none.
+    """
+    wrapper = getattr(submit, "__self__", None)
+    if wrapper is None:
+        return None
+    name = _result_name(type(wrapper), getattr(submit, "__name__", ""))
+    return getattr(wrapper, name) if name else None
+
+
+def query_pairs(wrapper):
+    """Get the submit-then-poll query endpoints of an API wrapper.
+
+    Example:
+        query_pairs(api.sites)["submit_request_to_query_sites_energy"]
+        # 'query_sites_energy_for_the_given_task_id'
+
+    Args:
+        wrapper: An API wrapper, e.g. api.sites.
+
+    Returns:
+        dict: The names of the result methods by the names of the
+        submission methods.
+    """
+    pairs = {}
+    for name in dir(type(wrapper)):
+        result_name = _result_name(type(wrapper), name)
+        if result_name:
+            pairs[name] = result_name
+    return pairs
+
+
+def _query_result(result):
+    """Get the result of a query, or None while it is still processed."""
+    if isinstance(result, dict) and result.get("response") is None:
+        return None
+    return result
+
+
+def _more_pages(result, items, offset, offset_base, page_size):
+    """Whether a query has rows after a page of `items` at `offset`, from
+    the `page.count` of its result, or else from a full page."""
+    page = result.get("page") if isinstance(result, dict) else None
+    count = page.get("count") if isinstance(page, dict) else None
+    if not items:
+        return False
+    if isinstance(count, int) and not isinstance(count, bool) and count > 0:
+        return offset - offset_base + len(items) < count
+    return len(items) >= page_size
+
+
+class QueryRunner(object):
+    """Runs the submit-then-poll queries of the assurance APIs (e.g.
+    `sites.submit_request_to_query_sites_energy` then
+    `sites.query_sites_energy_for_the_given_task_id`) and streams their rows.
+
+    A query is submitted, then its result endpoint (found by result_method)
+    is polled with the `taskId` of the submission, every `interval`
+    seconds growing by `backoff` up to `max_interval`, until it stops
+    answering with a status code of a pending query (202, 404 or 409) or
+    without a `response`. Queries whose submission takes a `page` are
+    submitted again for every page, of `page_size` rows, until the
+    `page.count` of the results or a page that is not full.
+
+    The queries of a runner share its concurrency limit: at most
+    `concurrency` of them are submitted and polled at once, whichever
+    thread runs them.
+
+    Example:
+        runner = QueryRunner(concurrency=8)
+        for key, row in runner.stream({
+            "energy": (api.sites.submit_request_to_query_sites_energy,
+                       dict(startTime=start, endTime=end)),
+            "summary": (api.sites.submit_request_for_site_analytics_summary_data,
+                        dict(startTime=start, endTime=end)),
+        }):
+            print(key, row)
+    """
+
+    def __init__(
+        self,
+        concurrency=DEFAULT_QUERY_CONCURRENCY,
+        page_size=DEFAULT_QUERY_PAGE_SIZE,
+        offset_base=DEFAULT_PAGINATION_OFFSET_BASE,
+        interval=DEFAULT_TASK_POLL_INTERVAL,
+        max_interval=DEFAULT_TASK_POLL_MAX_INTERVAL,
+        backoff=DEFAULT_TASK_POLL_BACKOFF,
+        timeout=None,
+        items_key="response",
+        buffer_size=DEFAULT_QUERY_BUFFER_SIZE,
+    ):
+        """Create a new QueryRunner.
+
+        Args:
+            concurrency(int): Maximum number of queries submitted and
+                polled at once.
+            page_size(int): The `page.limit` of the submitted queries.
+            offset_base(int): The `page.offset` of the first row, 0 or 1.
+            interval(float): Seconds before the first poll of a result.
+            max_interval(float): Maximum seconds between polls.
+            backoff(float): Factor of the interval after every poll.
+            timeout(float): Seconds to wait for the result of a page, None
+                to wait forever.
+            items_key(str): The member of the rows in the results.
+            buffer_size(int): Maximum rows received by stream and not
+                consumed yet; the queries wait while it is full.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If concurrency, page_size or buffer_size is not
+                positive or offset_base is not 0 or 1.
+        """
+        check_type(concurrency, int, may_be_none=False)
+        check_type(page_size, int, may_be_none=False)
+        check_type(offset_base, int, may_be_none=False)
+        check_type(items_key, str, may_be_none=False)
+        check_type(buffer_size, int, may_be_none=False)
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive")
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be positive")
+        if offset_base not in (0, 1):
+            raise ValueError("offset_base must be 0 or 1")
+
+        self.concurrency = concurrency
+        self.page_size = page_size
+        self.offset_base = offset_base
+        self.interval = interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.timeout = timeout
+        self.items_key = items_key
+        self.buffer_size = buffer_size
+        self._slots = threading.BoundedSemaphore(concurrency)
+
+    def _result_method(self, submit, result):
+        result = result or result_method(submit)
+        if result is None:
+            raise ValueError(
+                "No result method found for {}".format(
+                    getattr(submit, "__name__", submit)
+                )
+            )
+        return result
+
+    def _delays(self):
+        """Seconds before every poll of a result."""
+        delay = self.interval
+        while True:
+            yield delay
+            delay = min(delay * self.backoff, self.max_interval)
+
+    def _first_page(self, submit, kwargs):
+        """Get the kwargs of the submission of the first page, or None if
+        the query is not paged, the page size and the first offset."""
+        if not _accepts(submit, "page"):
+            return None, self.page_size, self.offset_base
+        page = dict(kwargs.get("page") or {})
+        page.setdefault("limit", self.page_size)
+        page.setdefault("offset", self.offset_base)
+        return page, page["limit"], page["offset"]
+
+    def _task_id(self, submit, submitted):
+        task_id = task_id_of(submitted)
+        if task_id is None:
+            raise ValueError(
+                "No taskId in the response of {}: {!r}".format(
+                    getattr(submit, "__name__", submit), submitted
+                )
+            )
+        return task_id
+
+    def _polls(self, task_id):
+        """Seconds before every poll of the result of a query, until its
+        timeout."""
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        for delay in self._delays():
+            if deadline is not None and time.monotonic() + delay > deadline:
+                raise TimeoutError(
+                    "The query {} is not done after {} seconds".format(
+                        task_id, self.timeout
+                    )
+                )
+            yield delay
+
+    def _fetch(self, result, task_id):
+        try:
+            return _query_result(result(task_id=task_id))
+        except ApiError as e:
+            if e.status_code in _PENDING_STATUS_CODES:
+                return None
+            raise
+
+    def _run_page(self, submit, result, kwargs, stop=None):
+        """Submit a page of a query and wait for its result, or return None
+        once the `stop` event is set."""
+        with self._slots:
+            if stop is not None and stop.is_set():
+                return None
+            task_id = self._task_id(submit, submit(**kwargs))
+            logger.debug("Polling query {} of {}".format(task_id, submit.__name__))
+            for delay in self._polls(task_id):
+                if stop is None:
+                    time.sleep(delay)
+                elif stop.wait(delay):
+                    logger.debug("Abandoning query {}".format(task_id))
+                    return None
+                data = self._fetch(result, task_id)
+                if data is not None:
+                    return data
+
+    def pages(self, submit, result=None, **kwargs):
+        """Run a query and iterate over the rows of its pages.
+
+        Args:
+            submit(callable): The submission method of the query, e.g.
+                api.sites.submit_request_to_query_sites_energy.
+            result(callable): The result method of the query. Defaults to
+                the one found by result_method.
+            **kwargs: Passed on to the submission method.
+
+        Yields:
+            list: The rows of every page.
+
+        Raises:
+            ValueError: If there is no result method or a submission has
+                no `taskId`.
+            TimeoutError: If a result is not ready after `timeout` seconds.
+        """
+        return self._pages(submit, result, kwargs)
+
+    def _pages(self, submit, result, kwargs, stop=None):
+        """Iterate over the items of the pages of a query until the `stop`
+        event is set."""
+        result = self._result_method(submit, result)
+        page, page_size, offset = self._first_page(submit, kwargs)
+        while True:
+            if page is not None:
+                kwargs["page"] = dict(page, offset=offset)
+            data = self._run_page(submit, result, kwargs, stop)
+            if data is None:
+                return
+            items = page_items(data, self.items_key)
+            if items:
+                yield items
+            if page is None or not _more_pages(
+                data, items, offset, self.offset_base, page_size
+            ):
+                return
+            offset += page_size
+
+    def rows(self, submit, result=None, **kwargs):
+        """Run a query and iterate over its rows. See pages.
+
+        Example:
+            for site in runner.rows(
+                api.sites.submit_request_to_query_sites_energy,
+                startTime=start, endTime=end,
+            ):
+                print(site.siteName, site.energyConsumed)
+        """
+        for items in self.pages(submit, result, **kwargs):
+            for item in items:
+                yield item
+
+    def stream(self, queries):
+        """Run many queries concurrently and iterate over their rows, as
+        they arrive.
+
+        Args:
+            queries(dict): The `(submit, kwargs)` of every query by its
+                key, where `kwargs` is passed on to rows.
+
+        Yields:
+            tuple: The key of the query and a row.
+
+        Raises:
+            Any exception raised by a query, after which the other
+            queries are stopped, even while they wait for their results.
+            The queries also stop when the generator is closed.
+        """
+        rows = queue.Queue(maxsize=self.buffer_size)
+        stop = threading.Event()
+
+        def put(item):
+            """Wait for room in the buffer; False once the stream ended."""
+            while not stop.is_set():
+                try:
+                    rows.put(item, timeout=_PUT_TIMEOUT)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def run(key, submit, kwargs):
+            result = kwargs.pop("result", None)
+            try:
+                for items in self._pages(submit, result, kwargs, stop):
+                    for row in items:
+                        if not put((key, row, None)):
+                            return
+            except Exception as e:
+                put((key, _DONE, e))
+            else:
+                put((key, _DONE, None))
+
+        executor = ThreadPoolExecutor(self.concurrency)
+        futures = [
+            executor.submit(run, key, submit, dict(kwargs or {}))
+            for key, (submit, kwargs) in queries.items()
+        ]
+        try:
+            remaining = len(futures)
+            while remaining:
+                key, row, error = rows.get()
+                if error is not None:
+                    raise error
+                if row is _DONE:
+                    remaining -= 1
+                else:
+                    yield key, row
+        finally:
+            stop.set()
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+
+class AsyncQueryRunner(QueryRunner):
+    """QueryRunner for the API wrappers of AsyncDNACenterAPI, on the running
+    event loop: its methods are asynchronous generators and the queries
+    share an asyncio semaphore.
+
+    Example:
+        runner = AsyncQueryRunner(concurrency=8)
+        async for site in runner.rows(
+            api.sites.submit_request_to_query_sites_energy,
+            startTime=start, endTime=end,
+        ):
+            print(site.siteName)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(AsyncQueryRunner, self).__init__(*args, **kwargs)
+        self._slots = asyncio.Semaphore(self.concurrency)
+
+    async def _fetch(self, result, task_id):
+        try:
+            return _query_result(await result(task_id=task_id))
+        except ApiError as e:
+            if e.status_code in _PENDING_STATUS_CODES:
+                return None
+            raise
+
+    async def _run_page(self, submit, result, kwargs):
+        async with self._slots:
+            task_id = self._task_id(submit, await submit(**kwargs))
+            logger.debug("Polling query {} of {}".format(task_id, submit.__name__))
+            for delay in self._polls(task_id):
+                await asyncio.sleep(delay)
+                data = await self._fetch(result, task_id)
+                if data is not None:
+                    return data
+
+    async def pages(self, submit, result=None, **kwargs):
+        """Run a query and iterate over the rows of its pages. See
+        QueryRunner.pages."""
+        result = self._result_method(submit, result)
+        page, page_size, offset = self._first_page(submit, kwargs)
+        while True:
+            if page is not None:
+                kwargs["page"] = dict(page, offset=offset)
+            data = await self._run_page(submit, result, kwargs)
+            items = page_items(data, self.items_key)
+            if items:
+                yield items
+            if page is None or not _more_pages(
+                data, items, offset, self.offset_base, page_size
+            ):
+                return
+            offset += page_size
+
+    async def rows(self, submit, result=None, **kwargs):
+        """Run a query and iterate over its rows. See QueryRunner.rows."""
+        async for items in self.pages(submit, result, **kwargs):
+            for item in items:
+                yield item
+
+    async def stream(self, queries):
+        """Run many queries concurrently and iterate over their rows, as
+        they arrive. See QueryRunner.stream."""
+        rows = asyncio.Queue(maxsize=self.buffer_size)
+
+        async def run(key, submit, kwargs):
+            try:
+                async for row in self.rows(submit, **kwargs):
+                    await rows.put((key, row, None))
+            except Exception as e:
+                await rows.put((key, _DONE, e))
+            else:
+                await rows.put((key, _DONE, None))
+
+        tasks = [
+            asyncio.ensure_future(run(key, submit, dict(kwargs or {})))
+            for key, (submit, kwargs) in queries.items()
+        ]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                key, row, error = await rows.get()
+                if error is not None:
+                    raise error
+                if row is _DONE:
+                    remaining -= 1
+                else:
+                    yield key, row
+        finally:
+            for task in tasks:
+                task.cancel()
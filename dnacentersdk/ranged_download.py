@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""Resumable and parallel ranged downloads from the DNA Center APIs.
+
+Copyright (c) 2019-2021 Cisco Systems.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import json
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from builtins import *
+
+from .config import DEFAULT_DOWNLOAD_SEGMENT_ATTEMPTS
+
+logger = logging.getLogger(__name__)
+
+
+def supports_ranges(response):
+    """Whether a response can be fetched again by byte ranges.
+
+    The server must advertise `Accept-Ranges: bytes` and the size of the
+    content with `Content-Length`.
+    """
+    try:
+        int(response.headers.get("Content-Length"))
+    except (TypeError, ValueError):
+        return False
+    return response.headers.get("Accept-Ranges", "").lower() == "bytes"
+
+
+class RangedDownload(object):
+    """Downloads a file by byte-range segments into a preallocated
+    `<path>.part` file, renamed to `<path>` once complete.
+
+    Up to `segments` segments of `segment_size` bytes are fetched at the
+    same time over the session's pooled connections. A segment that fails
+    is requested again from its last received byte, up to
+    DEFAULT_DOWNLOAD_SEGMENT_ATTEMPTS times. The completed segments are
+    recorded in `<path>.part.json`, so with `resume` a later download of the
+    same (unchanged) file only fetches the missing segments.
+    """
+
+    def __init__(
+        self,
+        session,
+        method,
+        url,
+        erc,
+        kwargs,
+        filepath,
+        segments=1,
+        segment_size=None,
+        resume=False,
+        chunk_size=None,
+        progress_callback=None,
+    ):
+        """Create a new RangedDownload.
+
+        Args:
+            session(RestSession): The session that sends the requests.
+            method(str): The request-method type ('GET', 'POST', etc.).
+            url(str): The URL of the API endpoint to be called.
+            erc(int): The expected response codes.
+            kwargs(dict): Passed on to the requests of the segments.
+            filepath(str): The path of the downloaded file.
+            segments(int): Maximum number of segments fetched at once.
+            segment_size(int): Bytes of every segment.
+            resume(bool): Reuse the segments of a previous download.
+            chunk_size(int): Bytes read at a time.
+            progress_callback(callable): Called with the bytes downloaded
+                so far and the total after every chunk.
+        """
+        self._session = session
+        self._method = method
+        self._url = url
+        self._erc = erc
+        self._kwargs = kwargs
+        self.filepath = filepath
+        self.part_path = filepath + ".part"
+        self.state_path = filepath + ".part.json"
+        self._segments = max(1, segments or 1)
+        self._segment_size = segment_size
+        self._resume = resume
+        self._chunk_size = chunk_size
+        self._progress_callback = progress_callback
+        self._lock = threading.Lock()
+        self._done = set()
+        self._downloaded = 0
+        self.total = None
+
+    def _validators(self, response):
+        return {
+            "total": self.total,
+            "segment_size": self._segment_size,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+
+    def _load_state(self, validators):
+        if not (self._resume and os.path.isfile(self.part_path)):
+            return set()
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return set()
+        if state.get("validators") != validators:
+            logger.debug("{} changed, downloading it again".format(self.filepath))
+            return set()
+        return set(state.get("done", []))
+
+    def _save_state(self, validators):
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"validators": validators, "done": sorted(self._done)}, f)
+        os.replace(tmp_path, self.state_path)
+
+    def _progress(self, size):
+        with self._lock:
+            self._downloaded += size
+            downloaded = self._downloaded
+        if self._progress_callback is not None:
+            self._progress_callback(downloaded, self.total)
+
+    def _write(self, response, start, end):
+        """Write the content of a response from byte `start` of the file,
+        up to byte `end`; return the next byte to fetch."""
+        with open(self.part_path, "r+b") as f:
+            f.seek(start)
+            for chunk in response.iter_content(chunk_size=self._chunk_size):
+                if not chunk:
+                    continue
+                chunk = chunk[: end + 1 - start]
+                f.write(chunk)
+                start += len(chunk)
+                self._progress(len(chunk))
+                if start > end:
+                    break
+        return start
+
+    def _fetch(self, index, validators, response=None):
+        """Fetch a segment, starting with the given response (which
+        starts at byte 0) if any."""
+        start = index * self._segment_size
+        end = min(start + self._segment_size, self.total) - 1
+        attempt = 0
+        while start <= end:
+            attempt += 1
+            try:
+                if response is None:
+                    response = self._request_range(start, end)
+                with response:
+                    start = self._write(response, start, end)
+            except Exception as e:
+                if attempt >= DEFAULT_DOWNLOAD_SEGMENT_ATTEMPTS:
+                    raise
+                logger.debug(
+                    "Segment {} of {} failed at byte {}, retrying: {}".format(
+                        index, self.filepath, start, e
+                    )
+                )
+            else:
+                if start <= end and attempt >= DEFAULT_DOWNLOAD_SEGMENT_ATTEMPTS:
+                    raise IOError(
+                        "Incomplete segment {} of {}".format(index, self.filepath)
+                    )
+            response = None
+        with self._lock:
+            self._done.add(index)
+            self._save_state(validators)
+
+    def _request_range(self, start, end):
+        kwargs = dict(self._kwargs)
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers["Range"] = "bytes={}-{}".format(start, end)
+        kwargs["stream"] = True
+        response = self._session.request(
+            self._method, self._url, self._erc, 0, headers=headers, **kwargs
+        )
+        content_range = response.headers.get("Content-Range", "")
+        match = re.match(r"bytes (\d+)-", content_range)
+        if response.status_code != 206 or not match or int(match.group(1)) != start:
+            response.close()
+            raise IOError(
+                "Range request not honored: {} {}".format(
+                    response.status_code, content_range
+                )
+            )
+        return response
+
+    def run(self, response):
+        """Download the file, starting with the response of the first request.
+
+        Args:
+            response(requests.Response): The streamed response of the
+                download request; it is used for the first segment.
+
+        Returns:
+            str: The path of the downloaded file.
+        """
+        self.total = int(response.headers["Content-Length"])
+        if not self._segment_size:
+            self._segment_size = max(1, -(-self.total // self._segments))
+        validators = self._validators(response)
+        count = max(1, -(-self.total // self._segment_size))
+
+        self._done = self._load_state(validators)
+        if not self._done:
+            # Preallocate the file, so segments are written in place
+            with open(self.part_path, "wb") as f:
+                f.truncate(self.total)
+            self._save_state(validators)
+        self._downloaded = sum(
+            min(self._segment_size, self.total - index * self._segment_size)
+            for index in self._done
+        )
+        missing = [index for index in range(count) if index not in self._done]
+        logger.debug(
+            "Downloading {} segments of {} ({} done)".format(
+                len(missing), self.filepath, len(self._done)
+            )
+        )
+
+        first_response = response
+        if 0 in missing:
+            missing.remove(0)
+        else:
+            response.close()
+            first_response = None
+
+        # The first segment streams the first response in one of the
+        # `segments` workers, so at most `segments` connections are open
+        with ThreadPoolExecutor(self._segments) as executor:
+            futures = []
+            if first_response is not None:
+                futures.append(
+                    executor.submit(self._fetch, 0, validators, first_response)
+                )
+            futures.extend(
+                executor.submit(self._fetch, index, validators)
+                for index in missing
+            )
+            for future in futures:
+                future.result()
+
+        os.replace(self.part_path, self.filepath)
+        os.remove(self.state_path)
+        return self.filepath
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""Client-side rate limiting of the requests to the DNA Center APIs.
+
+Copyright (c) 2019-2021 Cisco Systems.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import re
+import threading
+import time
+import urllib.parse
+from builtins import *
+
+from .utils import check_type
+
+
+def url_template_pattern(template):
+    """Compile a URL template into a regular expression.
+
+    `{name}` placeholders match one path segment and `*` matches anything,
+    e.g. "/dna/intent/api/v1/network-device/{id}" or
+    "/dna/intent/api/v1/network-device*".
+
+    Args:
+        template(str): The URL path template.
+
+    Returns:
+        re.Pattern: The pattern matching the paths of the template.
+    """
+    check_type(template, str, may_be_none=False)
+    pattern = ""
+    for part in re.split(r"(\{[^/{}]*\}|\*)", template):
+        if part == "*":
+            pattern += ".*"
+        elif part.startswith("{") and part.endswith("}"):
+            pattern += "[^/]+"
+        else:
+            pattern += re.escape(part)
+    return re.compile(pattern + "$")
+
+
+class TokenBucket(object):
+    """Thread-safe token bucket.
+
+    The bucket holds up to `capacity` tokens and is refilled with `rate`
+    tokens per second. Taking a token from an empty bucket reserves the
+    next one, so callers are served in order.
+    """
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic):
+        """Create a new TokenBucket, initially full.
+
+        Args:
+            rate(int,float): Tokens added per second.
+            capacity(int,float): Maximum number of tokens, i.e. the burst
+                size. Defaults to one second worth of tokens, at least 1.
+            clock(callable): Monotonic clock in seconds.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If rate or capacity are not positive.
+        """
+        check_type(rate, (int, float), may_be_none=False)
+        check_type(capacity, (int, float))
+        if capacity is None:
+            capacity = max(1, rate)
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+
+        self._rate = float(rate)
+        self._capacity = float(capacity)
+        self._clock = clock
+        self._tokens = self._capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self):
+        """Tokens added per second."""
+        return self._rate
+
+    @property
+    def capacity(self):
+        """Maximum number of tokens."""
+        return self._capacity
+
+    def reserve(self, tokens=1):
+        """Take tokens from the bucket.
+
+        Returns:
+            float: Seconds to wait before the tokens are available.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+
+class RateLimiter(object):
+    """Paces the requests of a session before the API rate-limits them.
+
+    Every request takes a token from the global bucket (if a global rate is
+    set) and from the bucket of the first URL template matching its path,
+    and waits until both are available.
+
+    Example:
+        RateLimiter(
+            rate=10,
+            endpoint_limits={
+                "/dna/intent/api/v1/network-device*": 5,
+                "/dna/intent/api/v1/client-health": (1, 3),
+            },
+        )
+    """
+
+    def __init__(
+        self, rate=None, burst=None, endpoint_limits=None, clock=time.monotonic
+    ):
+        """Create a new RateLimiter.
+
+        Args:
+            rate(int,float): Requests per second for all requests, or None
+                for no global limit.
+            burst(int,float): Requests that can be sent at once before
+                the global rate applies. Defaults to one second of requests.
+            endpoint_limits(dict): Requests per second, or a (rate, burst)
+                tuple, by URL template (see url_template_pattern). The
+                first matching template applies.
+            clock(callable): Monotonic clock in seconds.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If a rate or burst is not positive.
+        """
+        check_type(endpoint_limits, dict)
+
+        self._bucket = None
+        if rate is not None:
+            self._bucket = TokenBucket(rate, burst, clock=clock)
+
+        self._endpoint_buckets = []
+        for template, limit in (endpoint_limits or {}).items():
+            endpoint_rate, endpoint_burst = (
+                limit if isinstance(limit, (tuple, list)) else (limit, None)
+            )
+            self._endpoint_buckets.append(
+                (
+                    template,
+                    url_template_pattern(template),
+                    TokenBucket(endpoint_rate, endpoint_burst, clock=clock),
+                )
+            )
+
+    def url_template(self, url):
+        """Get the URL template of the endpoint limit applied to a URL.
+
+        Returns:
+            str: The first matching URL template or None.
+        """
+        path = urllib.parse.urlparse(url).path
+        for template, pattern, _ in self._endpoint_buckets:
+            if pattern.match(path):
+                return template
+        return None
+
+    def reserve(self, method, url):
+        """Take the tokens of a request.
+
+        Args:
+            method(str): The request-method type ('GET', 'POST', etc.).
+            url(str): The URL of the request.
+
+        Returns:
+            float: Seconds to wait before sending the request.
+        """
+        delay = self._bucket.reserve() if self._bucket else 0.0
+        path = urllib.parse.urlparse(url).path
+        for _, pattern, bucket in self._endpoint_buckets:
+            if pattern.match(path):
+                delay = max(delay, bucket.reserve())
+                break
+        return delay
+
+    def acquire(self, method, url):
+        """Wait until a request can be sent.
+
+        Returns:
+            float: Seconds waited.
+        """
+        delay = self.reserve(method, url)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
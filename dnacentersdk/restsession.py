@@ -23,11 +23,15 @@ SOFTWARE.
 """
 
 
-import errno
+import base64
+import contextlib
+import contextvars
+import json
 import logging
 import os
 import re
 import socket
+import threading
 import time
 import urllib.parse
 import warnings
@@ -38,10 +42,21 @@ from requests.packages.urllib3.response import HTTPResponse
 from requests_toolbelt.multipart import encoder
 
 from .config import (
+    DEFAULT_ACCESS_TOKEN_LIFETIME,
+    DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    DEFAULT_DOWNLOAD_SEGMENT_SIZE,
+    DEFAULT_JSON_DECODER,
+    DEFAULT_POOL_BLOCK,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
     DEFAULT_SINGLE_REQUEST_TIMEOUT,
+    DEFAULT_TOKEN_REFRESH_MARGIN,
     DEFAULT_VERIFY,
     DEFAULT_WAIT_ON_RATE_LIMIT,
 )
+from .connection_pool import PoolStats, PoolStatsHTTPAdapter
+from .metrics import MetricsHook, RequestMeter
+from .models.mydict import mydict_data_factory
 from .exceptions import (
     ApiError,
     DownloadFailure,
@@ -49,18 +64,78 @@ from .exceptions import (
     RateLimitWarning,
     dnacentersdkException,
 )
+from .ranged_download import RangedDownload, supports_ranges
+from .rate_limiter import RateLimiter
+from .streaming import StreamedItems
 from .response_codes import EXPECTED_RESPONSE_CODE
+from .retry import DEFAULT_RETRY_POLICY, RetryPolicy
 from .utils import (
+    RequestInfo,
+    ResponseInfo,
     check_response_code,
     check_type,
     extract_and_parse_json,
-    pprint_request_info,
-    pprint_response_info,
+    json_decoder_loads,
+    url_template,
     validate_base_url,
 )
 
 logger = logging.getLogger(__name__)
 
+#: Keyword arguments of RestSession.download that set how the content is
+#: streamed.
+DOWNLOAD_OPTIONS = (
+    "sink",
+    "chunk_size",
+    "buffer",
+    "progress_callback",
+    "segments",
+    "segment_size",
+    "resume",
+)
+
+# The DOWNLOAD_OPTIONS of a DownloadWriter, the others are read by the caller
+_WRITER_OPTIONS = ("sink", "buffer", "progress_callback")
+
+# Streaming options of the downloads started in a RestSession.download_options
+# block, so they reach downloads made through the API wrappers.
+_download_options = contextvars.ContextVar("download_options", default={})
+
+# Options of the RestSession.stream_items block, in which the GET and POST
+# requests return a StreamedItems of their JSON array.
+_stream_items_options = contextvars.ContextVar("stream_items_options", default=None)
+
+# Options of the RestSession.operation_futures block, in which the write
+# requests that start a task or an execution return its future.
+_operation_futures_options = contextvars.ContextVar(
+    "operation_futures_options", default=None
+)
+
+
+def access_token_expiry(access_token, issued_at=None):
+    """Get the time when an access token expires.
+
+    DNA Center access tokens are JWTs, the expiry is read from their `exp`
+    claim. Otherwise the token is assumed to expire
+    DEFAULT_ACCESS_TOKEN_LIFETIME seconds after it was issued.
+
+    Args:
+        access_token(str): The access token.
+        issued_at(float): The time.time() when the token was issued.
+            Defaults to now.
+
+    Returns:
+        float: The expiry as a time.time() value.
+    """
+    try:
+        payload = access_token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except Exception:
+        if issued_at is None:
+            issued_at = time.time()
+        return issued_at + DEFAULT_ACCESS_TOKEN_LIFETIME
+
 
 class DownloadResponse(HTTPResponse):
     """Download Response wrapper.
@@ -87,7 +162,8 @@ class DownloadResponse(HTTPResponse):
             path(str): The downloaded file path.
             filename(str): The downloaded filename.
             dirpath(str): The download directory path.
-            collected_data(bytes): HTTP response's data.
+            collected_data(bytes): HTTP response's data, or None if it was
+                not kept in memory because it was saved to the path.
         """
         super(DownloadResponse, self).__init__(
             body=response.raw,
@@ -109,7 +185,13 @@ class DownloadResponse(HTTPResponse):
         # Call HTTPResponse's data property
         original_data = super(DownloadResponse, self).data
         # It uses the one that has value prioritizing the HTTPResponse's data
-        return original_data or self._collected_data
+        if original_data:
+            return original_data
+        if self._collected_data is None and self._path:
+            # Not kept in memory, read it back from the saved file
+            with open(self._path, "rb") as f:
+                return f.read()
+        return self._collected_data
 
     @property
     def filename(self):
@@ -127,6 +209,86 @@ class DownloadResponse(HTTPResponse):
         return self._path
 
 
+class DownloadWriter(object):
+    """Writes the chunks of a download to its file, sink and buffer."""
+
+    def __init__(
+        self,
+        filepath,
+        content_length=None,
+        sink=None,
+        buffer=None,
+        progress_callback=None,
+    ):
+        """Create a new DownloadWriter.
+
+        Args:
+            filepath(str): The file where the content is saved, or None.
+            content_length(str,int): The Content-Length of the response.
+            sink: File-like object where the content is written, or None.
+            buffer(bool): Keep the content in memory. Defaults to True
+                only when there is neither a file nor a sink.
+            progress_callback(callable): Called with the bytes downloaded
+                so far and the content length (or None) after every chunk.
+        """
+        if buffer is None:
+            buffer = filepath is None and sink is None
+        try:
+            self.total = int(content_length)
+        except (TypeError, ValueError):
+            self.total = None
+        self.filepath = filepath
+        self.downloaded = 0
+        self._file = None
+        self._sink = sink
+        self._chunks = [] if buffer else None
+        self._progress_callback = progress_callback
+
+    @classmethod
+    def from_options(cls, filepath, content_length, options):
+        """Create a DownloadWriter with its options among the
+        DOWNLOAD_OPTIONS of a download."""
+        return cls(
+            filepath,
+            content_length,
+            **{name: options[name] for name in _WRITER_OPTIONS if name in options}
+        )
+
+    def __enter__(self):
+        if self.filepath:
+            logger.debug("Downloading %s", self.filepath)
+            self._file = open(self.filepath, "wb")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            if exc_type is None:
+                logger.debug("Downloaded %s", self.filepath)
+        return False
+
+    def write(self, chunk):
+        if not chunk:
+            return
+        if self._file is not None:
+            self._file.write(chunk)
+        if self._sink is not None:
+            self._sink.write(chunk)
+        if self._chunks is not None:
+            self._chunks.append(chunk)
+        self.downloaded += len(chunk)
+        if self._progress_callback is not None:
+            self._progress_callback(self.downloaded, self.total)
+
+    @property
+    def collected_data(self):
+        """The buffered content, None if it was only saved to the file."""
+        if self._chunks is not None:
+            return b"".join(self._chunks)
+        return None if self.filepath else b""
+
+
 # Main module interface
 class RestSession(object):
     """RESTful HTTP session class for making calls to the DNA Center APIs."""
@@ -142,6 +304,15 @@ class RestSession(object):
         version=None,
         debug=False,
         user_agent=None,
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        pool_block=DEFAULT_POOL_BLOCK,
+        token_refresh_margin=DEFAULT_TOKEN_REFRESH_MARGIN,
+        rate_limiter=None,
+        retry_policy=None,
+        json_decoder=DEFAULT_JSON_DECODER,
+        metrics_hook=None,
+        object_factory=mydict_data_factory,
     ):
         """Initialize a new RestSession object.
 
@@ -165,9 +336,33 @@ class RestSession(object):
                 DNA Center APIs' request and response process.
                 Defaults to the DEBUG environment variable or False
                 if the environment variable is not set.
+            pool_connections(int): Number of hosts whose connection pool
+                is kept. Not used with an injected session.
+            pool_maxsize(int): Maximum number of connections kept open
+                per host. Not used with an injected session.
+            pool_block(bool): Controls whether requests wait for a free
+                connection when the pool of a host is exhausted, instead of
+                opening a connection that is discarded afterwards.
+                Not used with an injected session.
+            token_refresh_margin(int): Seconds before the access token
+                expires when it is refreshed ahead of the next request.
+            rate_limiter(RateLimiter): Optionally pace the requests
+                before the API rate-limits them.
+            retry_policy(RetryPolicy): Which failed requests are retried
+                and when. Defaults to dnacentersdk.retry.DEFAULT_RETRY_POLICY,
+                a single immediate retry of failed connections.
+            json_decoder(str,callable): The decoder of the JSON responses,
+                see dnacentersdk.utils.json_decoder_loads.
+                Defaults to dnacentersdk.config.DEFAULT_JSON_DECODER.
+            metrics_hook(MetricsHook): Optionally report the start and the
+                metrics of every request, e.g. to a
+                dnacentersdk.metrics.MetricsAggregator.
+            object_factory(callable): The factory of the objects of the
+                items streamed in a stream_items block.
 
         Raises:
             TypeError: If the parameter types are incorrect.
+            ValueError: If the json_decoder value is not supported.
 
         """
         check_type(base_url, str, may_be_none=False)
@@ -177,6 +372,15 @@ class RestSession(object):
         check_type(version, str, may_be_none=False)
         check_type(debug, (bool), may_be_none=False)
         check_type(user_agent, str, may_be_none=False)
+        check_type(pool_connections, int, may_be_none=False)
+        check_type(pool_maxsize, int, may_be_none=False)
+        check_type(pool_block, bool, may_be_none=False)
+        check_type(token_refresh_margin, int, may_be_none=False)
+        check_type(rate_limiter, RateLimiter)
+        check_type(retry_policy, RetryPolicy)
+        check_type(metrics_hook, MetricsHook)
+        if not callable(json_decoder):
+            check_type(json_decoder, str, may_be_none=False)
 
         super(RestSession, self).__init__()
 
@@ -191,6 +395,18 @@ class RestSession(object):
         self._debug = debug
         self._user_agent = user_agent
         self._authenticated = False  # Flag to track if we've authenticated
+        self._access_token_expiry = None
+        self._token_refresh_margin = token_refresh_margin
+        # Only one thread at a time gets a new access token
+        self._token_lock = threading.Lock()
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy or DEFAULT_RETRY_POLICY
+        self._json_decoder = json_decoder
+        self._json_loads = json_decoder_loads(json_decoder)
+        self._object_factory = object_factory
+        self._metrics_hook = metrics_hook
+        self._pool_maxsize = pool_maxsize
+        self._pool_stats = PoolStats()
 
         if debug:
             logger.setLevel(logging.DEBUG)
@@ -202,7 +418,17 @@ class RestSession(object):
             requests.packages.urllib3.disable_warnings()
 
         # Use the injected `requests` session, build a new one if not provided
-        self._req_session = session or requests.session()
+        if session is None:
+            session = requests.session()
+            adapter = PoolStatsHTTPAdapter(
+                pool_stats=self._pool_stats,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self._req_session = session
 
         user_agent_suffix = ""
         if user_agent is not None and user_agent != "":
@@ -284,6 +510,43 @@ class RestSession(object):
         check_type(value, bool, may_be_none=False)
         self._wait_on_rate_limit = value
 
+    @property
+    def rate_limiter(self):
+        """The RateLimiter pacing the requests, if any."""
+        return self._rate_limiter
+
+    @property
+    def retry_policy(self):
+        """The RetryPolicy of the failed requests."""
+        return self._retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, value):
+        """The RetryPolicy of the failed requests."""
+        check_type(value, RetryPolicy, may_be_none=False)
+        self._retry_policy = value
+
+    @property
+    def metrics_hook(self):
+        """The MetricsHook of the requests, or None."""
+        return self._metrics_hook
+
+    @metrics_hook.setter
+    def metrics_hook(self, value):
+        """The MetricsHook of the requests, or None."""
+        check_type(value, MetricsHook)
+        self._metrics_hook = value
+
+    @property
+    def json_decoder(self):
+        """The decoder of the JSON responses."""
+        return self._json_decoder
+
+    @property
+    def json_loads(self):
+        """The function parsing the JSON responses' bytes."""
+        return self._json_loads
+
     @property
     def headers(self):
         """The HTTP headers used for requests in this session."""
@@ -294,6 +557,16 @@ class RestSession(object):
         """The DNA Center access token used for this session."""
         return self._debug
     
+    @property
+    def pool_stats(self):
+        """Connections created, reused and discarded by this session.
+
+        Returns:
+            ConnectionPoolStats: The connection pool counters. They stay at
+            zero with an injected session.
+        """
+        return self._pool_stats.snapshot()
+
     @property
     def authenticated(self):
         """Flag to track if we've authenticated."""
@@ -314,24 +587,51 @@ class RestSession(object):
         check_type(headers, dict, may_be_none=False)
         self._req_session.headers.update(headers)
 
+    def _access_token_is_valid(self):
+        """Whether the access token can be used without refreshing it."""
+        if not self._authenticated or not self._access_token:
+            return False
+        return self._access_token_expiry is None or (
+            time.time() < self._access_token_expiry - self._token_refresh_margin
+        )
+
+    def _set_access_token(self, access_token):
+        """Use a new access token for the session's requests."""
+        self._access_token = access_token
+        self._access_token_expiry = access_token_expiry(access_token)
+        self.update_headers({"X-Auth-Token": access_token})
+        self._authenticated = True
+
     def _ensure_authenticated(self):
         """Ensure that we have a valid access token.
 
-        If we don't have an access token or haven't authenticated yet,
-        call the get_access_token method to authenticate.
+        If we don't have an access token, haven't authenticated yet or the
+        token is about to expire, call the get_access_token method to
+        authenticate. Concurrent threads wait for a single call.
         """
-        if not self._authenticated or not self._access_token:
-            self._access_token = self._get_access_token()
-            self.update_headers({"X-Auth-Token": self._access_token})
-            self._authenticated = True
+        if self._access_token_is_valid():
+            return
+        with self._token_lock:
+            if not self._access_token_is_valid():
+                self._set_access_token(self._get_access_token())
+
+    def _refresh_rejected_token(self, rejected_token):
+        """Refresh the access token after it was rejected with a 401.
+
+        Threads whose token was rejected at the same time wait for a single
+        refresh; the token is not refreshed again if another thread already
+        replaced the rejected one.
+        """
+        with self._token_lock:
+            if self._access_token == rejected_token:
+                self._set_access_token(self._get_access_token())
 
     def refresh_token(self):
         """Call the get_access_token method and update the session's
         auth header with the new token.
         """
-        self._access_token = self._get_access_token()
-        self.update_headers({"X-Auth-Token": self.access_token})
-        self._authenticated = True
+        with self._token_lock:
+            self._set_access_token(self._get_access_token())
 
     def abs_url(self, url):
         """Given a relative or absolute URL; return an absolute URL.
@@ -370,6 +670,124 @@ class RestSession(object):
             raise Exception("Could not find the header's filename value")
         return content_file_name
 
+    @contextlib.contextmanager
+    def download_options(self, **options):
+        """Set how the downloads started in the block are streamed.
+
+        The options are the `sink`, `chunk_size`, `buffer`,
+        `progress_callback`, `segments`, `segment_size` and `resume` kwargs
+        of download; they also apply to the downloads made through the API
+        wrappers.
+
+        Example:
+            with open("archive.zip", "wb") as f:
+                with api.session.download_options(sink=f, chunk_size=2**20):
+                    api.configuration_archive.download_masked_device_configuration(id)
+
+            with api.session.download_options(segments=4, resume=True):
+                api.file.download_a_file_by_file_id(file_id, save_file=True)
+
+        Raises:
+            TypeError: If an option is not a download option.
+        """
+        for name in options:
+            if name not in DOWNLOAD_OPTIONS:
+                raise TypeError("Unknown download option {!r}".format(name))
+        token = _download_options.set(dict(_download_options.get(), **options))
+        try:
+            yield
+        finally:
+            _download_options.reset(token)
+
+    @contextlib.contextmanager
+    def stream_items(self, key="response", chunk_size=None):
+        """Stream the JSON array of the GET and POST responses of the block.
+
+        In the block, GET and POST requests (including those made through
+        the API wrappers) return a dnacentersdk.streaming.StreamedItems
+        instead of the parsed response: an iterator over the items of the
+        `key` array of the response, parsed incrementally while the
+        response is read, so a response with many items is never held in
+        memory. Each item is parsed by the JSON decoder and wrapped by the
+        object factory of the session (in a MyDict by default).
+
+        Example:
+            with api.session.stream_items():
+                devices = api.devices.get_device_list()
+            for device in devices:
+                print(device.hostname)
+
+        Args:
+            key(str): The member of the JSON array in the responses.
+            chunk_size(int): Bytes read at a time.
+        """
+        check_type(key, str, may_be_none=False)
+        check_type(chunk_size, int)
+        token = _stream_items_options.set(dict(key=key, chunk_size=chunk_size))
+        try:
+            yield
+        finally:
+            _stream_items_options.reset(token)
+
+    @contextlib.contextmanager
+    def operation_futures(self, waiter, timeout=None):
+        """Return futures for the long-running operations of the block.
+
+        In the block, the PATCH, POST, PUT and DELETE requests (including
+        those made through the API wrappers) whose response has a `taskId`
+        or an `executionId` return the future of the task or execution,
+        tracked by the shared poller of `waiter`, instead of the parsed
+        response. The other responses are returned as usual.
+
+        Example:
+            with api.session.operation_futures(api.task_waiter):
+                future = api.compliance.run_compliance(deviceUuids=uuids)
+            compliance_task = future.result()
+
+        Args:
+            waiter(dnacentersdk.tasks.TaskWaiter): The waiter of the tasks.
+            timeout(float): Seconds to wait for every task.
+        """
+        token = _operation_futures_options.set(dict(waiter=waiter, timeout=timeout))
+        try:
+            yield
+        finally:
+            _operation_futures_options.reset(token)
+
+    def _operation_result(self, json_data):
+        """Get the future of the task or execution of a write response in
+        an operation_futures block, or the response."""
+        options = _operation_futures_options.get()
+        if options is None:
+            return json_data
+        future = options["waiter"].future_of(json_data, timeout=options["timeout"])
+        return json_data if future is None else future
+
+    def _pop_download_options(self, kwargs):
+        """Pop the download options of the kwargs, on top of the options of
+        the download_options block."""
+        options = dict(_download_options.get())
+        for name in DOWNLOAD_OPTIONS:
+            if name in kwargs:
+                options[name] = kwargs.pop(name)
+        options["chunk_size"] = (
+            options.get("chunk_size") or DEFAULT_DOWNLOAD_CHUNK_SIZE
+        )
+        return options
+
+    def _ranged_download_applies(self, save_file, filepath, options, response):
+        """Whether a download is fetched by byte ranges: only files saved
+        without a sink nor a buffer, when segments or resume are asked and
+        the server supports ranges."""
+        return (
+            save_file
+            and filepath is not None
+            and options.get("sink") is None
+            and not options.get("buffer")
+            and ((options.get("segments") or 1) > 1 or options.get("resume"))
+            and supports_ranges(response)
+        )
+
     def download(self, method, url, erc, custom_refresh, **kwargs):
         """It immediately downloads the response content.
 
@@ -389,6 +807,29 @@ class RestSession(object):
         To specify the downloaded directory path use the `dirpath` kwarg.
         It defaults to the os.getcwd() result.
 
+        The content is streamed `chunk_size` bytes at a time (defaults to
+        dnacentersdk.config.DEFAULT_DOWNLOAD_CHUNK_SIZE) to the file and to
+        the `sink` kwarg, a file-like object with a `write` method.
+
+        To keep the content in memory use the `buffer` kwarg. It defaults to
+        True only when the content is neither saved to a file nor written to
+        a sink; the data property of a saved download reads the file.
+
+        To follow the progress use the `progress_callback` kwarg, called
+        with the bytes downloaded so far and the Content-Length (or None)
+        after every chunk.
+
+        A file saved without sink nor buffer can be fetched by byte ranges
+        when the server sends `Accept-Ranges: bytes` and a Content-Length:
+        the `segments` kwarg sets how many ranges of `segment_size` bytes
+        (defaults to dnacentersdk.config.DEFAULT_DOWNLOAD_SEGMENT_SIZE) are
+        fetched in parallel, and with the `resume` kwarg a download that
+        failed continues from the ranges it already saved. Ranged downloads
+        are written to `<file>.part` until they are complete.
+
+        Those streaming kwargs default to the ones of the enclosing
+        download_options block.
+
         Returns:
             DownloadResponse: The DownloadResponse wrapper. Wraps the urllib3.response.HTTPResponse. For more
             information check the `urlib3 documentation <https://urllib3.readthedocs.io/en/latest/reference/urllib3.response.html>`_
@@ -400,8 +841,8 @@ class RestSession(object):
         save_file = kwargs.pop("save_file", False)
         dirpath = kwargs.pop("dirpath", None)
         filename = kwargs.pop("filename", None)
+        options = self._pop_download_options(kwargs)
         filepath = None
-        collected_data = bytes()
 
         if not (dirpath) or not (os.path.isdir(dirpath)):
             dirpath = os.getcwd()
@@ -414,19 +855,39 @@ class RestSession(object):
                     filepath = os.path.join(dirpath, filename)
                 except Exception as e:
                     raise DownloadFailure(resp, e)
-            if save_file and filepath:
+            if self._ranged_download_applies(save_file, filepath, options, resp):
                 try:
-                    with open(filepath, "wb") as f:
-                        logger.debug("Downloading {0}".format(filepath))
-                        for chunk in resp.iter_content(chunk_size=1024):
-                            if chunk:
-                                collected_data += chunk
-                                f.write(chunk)
+                    RangedDownload(
+                        self,
+                        method,
+                        url,
+                        erc,
+                        kwargs,
+                        filepath,
+                        segments=options.get("segments"),
+                        segment_size=(
+                            options.get("segment_size") or DEFAULT_DOWNLOAD_SEGMENT_SIZE
+                        ),
+                        resume=bool(options.get("resume")),
+                        chunk_size=options["chunk_size"],
+                        progress_callback=options.get("progress_callback"),
+                    ).run(resp)
                 except Exception as e:
                     raise DownloadFailure(resp, e)
-                logger.debug("Downloaded {0}".format(filepath))
+                return DownloadResponse(resp, filepath, filename, dirpath, None)
+            writer = DownloadWriter.from_options(
+                filepath if save_file else None,
+                resp.headers.get("Content-Length"),
+                options,
+            )
+            try:
+                with writer:
+                    for chunk in resp.iter_content(chunk_size=options["chunk_size"]):
+                        writer.write(chunk)
+            except Exception as e:
+                raise DownloadFailure(resp, e)
             final_response = DownloadResponse(
-                resp, filepath, filename, dirpath, collected_data
+                resp, filepath, filename, dirpath, writer.collected_data
             )
             return final_response
 
@@ -437,6 +898,7 @@ class RestSession(object):
             * Expands the API endpoint URL to an absolute URL
             * Makes the actual HTTP request to the API endpoint
             * Provides support for DNA Center rate-limiting
+            * Retries failed requests as the retry policy allows
             * Inspects response codes and raises exceptions as appropriate
             * Updates the token if response code is 401 - Unauthorized
                 and makes the request to the API endpoint again
@@ -456,9 +918,32 @@ class RestSession(object):
             ApiError: If anything other than the expected response code is
                 returned by the DNA Center API endpoint.
 
+        """
+        meter = kwargs.pop("_meter", None)
+        if meter is not None or self._metrics_hook is None:
+            return self._request(
+                method, url, erc, custom_refresh, json_null, meter, **kwargs
+            )
+
+        meter = RequestMeter(self._metrics_hook, method, url_template(url))
+        try:
+            response = self._request(
+                method, url, erc, custom_refresh, json_null, meter, **kwargs
+            )
+        except Exception as e:
+            meter.finish(exception=e)
+            raise
+        meter.finish(response=response)
+        return response
+
+    def _request(self, method, url, erc, custom_refresh, json_null, meter, **kwargs):
+        """Send a request, retried as needed; see request.
+
+        The attempts and rate-limit sleeps are counted by the meter, if any.
         """
         # Ensure we are authenticated before making any request
         self._ensure_authenticated()
+        access_token = self._access_token
 
         # Ensure the url is an absolute URL
         abs_url = self.abs_url(url)
@@ -476,36 +961,41 @@ class RestSession(object):
             kwargs.pop("data", None)
 
         c = custom_refresh
+        attempt = 0
         while True:
             c += 1
+            attempt += 1
             # Make the HTTP request to the API endpoint
             try:
-                logger.debug("Attempt {}".format(c))
+                logger.debug("Attempt %s", c)
                 logger.debug(
-                    pprint_request_info(
-                        abs_url, method, _headers=self.headers, **kwargs
-                    )
+                    RequestInfo(abs_url, method, self._req_session.headers, **kwargs)
                 )
+                if meter is not None:
+                    meter.attempt()
+                if self._rate_limiter is not None:
+                    slept = self._rate_limiter.acquire(method, abs_url)
+                    if meter is not None:
+                        meter.rate_limited(slept)
                 response = self._req_session.request(method, abs_url, **kwargs)
-            except socket.error:
-                # A socket error
-                try:
-                    c += 1
-                    logger.debug("Attempt {}".format(c))
-                    response = self._req_session.request(method, abs_url, **kwargs)
-                except Exception as e:
+            except (socket.error, IOError) as e:
+                # Connection, timeout and broken pipe errors
+                delay = self._retry_policy.next_delay(
+                    method, abs_url, attempt, exception=e
+                )
+                if delay is None:
                     raise dnacentersdkException("Socket error {}".format(e))
-            except IOError as e:
-                if e.errno == errno.EPIPE:
-                    # EPIPE error
-                    try:
-                        c += 1
-                        logger.debug("Attempt {}".format(c))
-                        response = self._req_session.request(method, abs_url, **kwargs)
-                    except Exception as e:
-                        raise dnacentersdkException("PipeError {}".format(e))
-                else:
-                    raise dnacentersdkException("IOError {}".format(e))
+                time.sleep(delay)
+                continue
+            delay = self._retry_policy.next_delay(
+                method, abs_url, attempt, response=response
+            )
+            if delay is not None:
+                # Transient error response
+                logger.debug(ResponseInfo(response))
+                response.close()
+                time.sleep(delay)
+                continue
             try:
                 # Check the response code for error conditions
                 check_response_code(response, erc)
@@ -514,6 +1004,8 @@ class RestSession(object):
                 # Wait and retry if automatic rate-limit handling is enabled
                 if self.wait_on_rate_limit:
                     warnings.warn(RateLimitWarning(response))
+                    if meter is not None:
+                        meter.rate_limited(e.retry_after)
                     time.sleep(e.retry_after)
                     continue
                 else:
@@ -521,17 +1013,17 @@ class RestSession(object):
                     raise
             except ApiError as e:
                 if e.status_code == 401 and custom_refresh < 1:
-                    logger.debug(pprint_response_info(response))
+                    logger.debug(ResponseInfo(response))
                     logger.debug("Refreshing access token")
-                    self.refresh_token()
+                    self._refresh_rejected_token(access_token)
                     logger.debug("Refreshed token.")
-                    return self.request(method, url, erc, 1, **kwargs)
+                    return self.request(method, url, erc, 1, _meter=meter, **kwargs)
                 else:
                     # Re-raise the ApiError
-                    logger.debug(pprint_response_info(response))
+                    logger.debug(ResponseInfo(response))
                     raise
             else:
-                logger.debug(pprint_response_info(response))
+                logger.debug(ResponseInfo(response))
                 return response
 
     def multipart_data(self, fields, create_callback):
@@ -569,6 +1061,7 @@ class RestSession(object):
 
         Returns:
             DownloadResponse: If it has `stream` kwarg with a True value.
+            StreamedItems: In a stream_items block.
             Any: Result of the `json.loads` of the server's response to an HTTP request.
 
         Raises:
@@ -582,14 +1075,25 @@ class RestSession(object):
         # Expected response code
         erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["GET"])
         stream = kwargs.get("stream", None)
+        stream_items = _stream_items_options.get()
         if stream:
             return self.download("GET", url, erc, 0, params=params, **kwargs)
+        elif stream_items is not None:
+            response = self.request(
+                "GET", url, erc, 0, params=params, stream=True, **kwargs
+            )
+            return StreamedItems(
+                response,
+                json_loads=self._json_loads,
+                object_factory=self._object_factory,
+                **stream_items
+            )
         else:
             response = self.request("GET", url, erc, 0, params=params, **kwargs)
             # Handle No Content (204) responses
             if response.status_code == 204:
                 return None
-            return extract_and_parse_json(response)
+            return extract_and_parse_json(response, self._json_loads)
 
     def patch(self, url, params=None, json=None, data=None, **kwargs):
         """Sends a PATCH request.
@@ -604,6 +1108,7 @@ class RestSession(object):
 
         Returns:
             DownloadResponse: If it has `stream` kwarg with a True value.
+            Future: In an operation_futures block, for a task or execution.
             Any: Result of the `json.loads` of the server's response to an HTTP request.
 
         Raises:
@@ -626,7 +1131,9 @@ class RestSession(object):
             response = self.request(
                 "PATCH", url, erc, 0, params=params, json=json, data=data, **kwargs
             )
-            return extract_and_parse_json(response)
+            return self._operation_result(
+                extract_and_parse_json(response, self._json_loads)
+            )
 
     def post(self, url, params=None, json=None, data=None, **kwargs):
         """Sends a POST request.
@@ -641,6 +1148,8 @@ class RestSession(object):
 
         Returns:
             DownloadResponse: If it has `stream` kwarg with a True value.
+            StreamedItems: In a stream_items block.
+            Future: In an operation_futures block, for a task or execution.
             Any: Result of the `json.loads` of the server's response to an HTTP request.
 
         Raises:
@@ -655,15 +1164,36 @@ class RestSession(object):
         erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["POST"])
 
         stream = kwargs.get("stream", None)
+        stream_items = _stream_items_options.get()
         if stream:
             return self.download(
                 "POST", url, erc, 0, params=params, json=json, data=data, **kwargs
             )
+        elif stream_items is not None:
+            response = self.request(
+                "POST",
+                url,
+                erc,
+                0,
+                params=params,
+                json=json,
+                data=data,
+                stream=True,
+                **kwargs
+            )
+            return StreamedItems(
+                response,
+                json_loads=self._json_loads,
+                object_factory=self._object_factory,
+                **stream_items
+            )
         else:
             response = self.request(
                 "POST", url, erc, 0, params=params, json=json, data=data, **kwargs
             )
-            return extract_and_parse_json(response)
+            return self._operation_result(
+                extract_and_parse_json(response, self._json_loads)
+            )
 
     def put(self, url, params=None, json=None, data=None, **kwargs):
         """Sends a PUT request.
@@ -679,6 +1209,7 @@ class RestSession(object):
 
         Returns:
             DownloadResponse: If it has `stream` kwarg with a True value.
+            Future: In an operation_futures block, for a task or execution.
             Any: Result of the `json.loads` of the server's response to an HTTP request.
 
         Raises:
@@ -701,7 +1232,9 @@ class RestSession(object):
             response = self.request(
                 "PUT", url, erc, 0, params=params, json=json, data=data, **kwargs
             )
-            return extract_and_parse_json(response)
+            return self._operation_result(
+                extract_and_parse_json(response, self._json_loads)
+            )
 
     def delete(self, url, params=None, **kwargs):
         """Sends a DELETE request.
@@ -724,7 +1257,9 @@ class RestSession(object):
         erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["DELETE"])
 
         response = self.request("DELETE", url, erc, 0, params=params, **kwargs)
-        return extract_and_parse_json(response)
+        return self._operation_result(
+            extract_and_parse_json(response, self._json_loads)
+        )
 
     def close(self):
         """Close the underlying requests session.
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""Retry policies for the requests to the DNA Center APIs.
+
+Copyright (c) 2019-2021 Cisco Systems.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import logging
+import random
+from collections import namedtuple
+from builtins import *
+
+from .config import (
+    DEFAULT_RETRY_BACKOFF_FACTOR,
+    DEFAULT_RETRY_MAX_ATTEMPTS,
+    DEFAULT_RETRY_MAX_BACKOFF,
+    DEFAULT_RETRY_STATUSES,
+)
+from .utils import check_type
+
+logger = logging.getLogger(__name__)
+
+#: Methods that can be sent again without changing the result.
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"])
+
+#: An attempt of a request, as reported to the `on_attempt` hook.
+#: `status_code` is None when the request failed with `exception` and
+#: `delay` is the backoff before the next attempt, None if there is none.
+RetryAttempt = namedtuple(
+    "RetryAttempt", ["method", "url", "attempt", "status_code", "exception", "delay"]
+)
+
+
+class RetryPolicy(object):
+    """Decides which failed requests are sent again and when.
+
+    Requests that failed to connect or to get a response, and responses
+    with a `retry_statuses` code, are retried up to `max_attempts` attempts
+    in total. The n-th retry waits the `Retry-After` seconds of the
+    response (at most max_backoff) or backoff_factor * 2 ** (n - 1) seconds
+    (at most max_backoff), randomized between zero and that value with
+    jitter.
+
+    Only idempotent methods are retried unless `retry_non_idempotent` is
+    set, since a POST that got no response may have been applied.
+    """
+
+    def __init__(
+        self,
+        max_attempts=DEFAULT_RETRY_MAX_ATTEMPTS,
+        backoff_factor=DEFAULT_RETRY_BACKOFF_FACTOR,
+        max_backoff=DEFAULT_RETRY_MAX_BACKOFF,
+        jitter=True,
+        retry_statuses=DEFAULT_RETRY_STATUSES,
+        retry_non_idempotent=False,
+        on_attempt=None,
+    ):
+        """Create a new RetryPolicy.
+
+        Args:
+            max_attempts(int): Maximum number of attempts of a request,
+                including the first one.
+            backoff_factor(int,float): Seconds of the first backoff.
+            max_backoff(int,float): Maximum seconds between two attempts,
+                also caps the Retry-After of the responses.
+            jitter(bool): Randomize the backoff between zero and its value,
+                so clients that failed together don't retry together.
+            retry_statuses(tuple): Response codes that are retried.
+            retry_non_idempotent(bool): Also retry POST and PATCH requests.
+            on_attempt(callable): Called with a RetryAttempt after every
+                attempt of a request.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If max_attempts is lower than 1.
+        """
+        check_type(max_attempts, int, may_be_none=False)
+        check_type(backoff_factor, (int, float), may_be_none=False)
+        check_type(max_backoff, (int, float), may_be_none=False)
+        check_type(jitter, bool, may_be_none=False)
+        check_type(retry_statuses, (tuple, list, set, frozenset), may_be_none=False)
+        check_type(retry_non_idempotent, bool, may_be_none=False)
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_non_idempotent = retry_non_idempotent
+        self.on_attempt = on_attempt
+
+    def backoff(self, attempt):
+        """Seconds to wait after the failed attempt number `attempt`."""
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def _retry_after(self, response, attempt):
+        try:
+            retry_after = max(0, int(response.headers.get("Retry-After")))
+        except (TypeError, ValueError):
+            return self.backoff(attempt)
+        return min(self.max_backoff, retry_after)
+
+    def next_delay(self, method, url, attempt, response=None, exception=None):
+        """Report an attempt and decide whether to retry it.
+
+        Args:
+            method(str): The request-method type ('GET', 'POST', etc.).
+            url(str): The URL of the request.
+            attempt(int): The number of the attempt, starting at 1.
+            response(requests.Response): The response of the attempt.
+            exception(Exception): The error if no response was received.
+
+        Returns:
+            float: Seconds to wait before the next attempt or None if the
+            request must not be retried.
+        """
+        delay = None
+        if attempt < self.max_attempts and (
+            self.retry_non_idempotent or method.upper() in IDEMPOTENT_METHODS
+        ):
+            if exception is not None:
+                delay = self.backoff(attempt)
+            elif response is not None and response.status_code in self.retry_statuses:
+                delay = self._retry_after(response, attempt)
+
+        if delay is not None:
+            logger.debug(
+                "Retrying {} {} in {:.2f}s after attempt {}".format(
+                    method, url, delay, attempt
+                )
+            )
+        if self.on_attempt is not None:
+            self.on_attempt(
+                RetryAttempt(
+                    method,
+                    url,
+                    attempt,
+                    getattr(response, "status_code", None),
+                    exception,
+                    delay,
+                )
+            )
+        return delay
+
+
+#: The default policy of RestSession: a request whose connection failed is
+#: sent once more right away, whatever its method, and error responses
+#: are not retried.
+DEFAULT_RETRY_POLICY = RetryPolicy(
+    max_attempts=2,
+    backoff_factor=0,
+    jitter=False,
+    retry_statuses=(),
+    retry_non_idempotent=True,
+)
@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+"""Incremental parsing of the JSON array responses of the DNA Center APIs.
+
+Copyright (c) 2019-2021 Cisco Systems.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import codecs
+import json
+import re
+from collections import OrderedDict
+from builtins import *
+
+from .config import DEFAULT_DOWNLOAD_CHUNK_SIZE
+from .models.mydict import mydict_data_factory
+from .utils import json_decoder_loads
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARACTERS = "0123456789+-.eE"
+
+# A complete string, a bracket, or the quote of a string that is not
+# complete yet
+_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[][{}"]', re.DOTALL)
+# The characters after a number, true, false or null
+_SCALAR_END = re.compile(r"[\s,:\]}]")
+
+# The json decoders that parse JSON as the loads functions of the JSON
+# decoder settings. orjson cannot parse a value followed by the rest of the
+# document, so the streamed items are parsed by the json scanner instead,
+# which gives the same objects.
+_RAW_DECODERS = {
+    json_decoder_loads("json"): json.JSONDecoder(),
+    json_decoder_loads("ordered"): json.JSONDecoder(object_hook=OrderedDict),
+}
+try:
+    _RAW_DECODERS[json_decoder_loads("orjson")] = json.JSONDecoder()
+except ImportError:
+    pass
+
+
+class _JSONStream(object):
+    """A JSON text read chunk by chunk, of which only the part that is not
+    parsed yet is kept."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self):
+        """Read the next chunk; return False at the end of the text."""
+        if self._eof:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self._eof = True
+            text = self._decoder.decode(b"", final=True)
+        else:
+            text = self._decoder.decode(chunk)
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        return True
+
+    def peek(self):
+        """Skip whitespace and get the next character, "" at the end."""
+        while True:
+            while (
+                self._pos < len(self._buffer)
+                and self._buffer[self._pos] in _WHITESPACE
+            ):
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, characters):
+        """Consume the next character, which must be one of `characters`."""
+        character = self.peek()
+        if not character or character not in characters:
+            raise json.JSONDecodeError(
+                "Expecting one of {!r}".format(characters), self._buffer, self._pos
+            )
+        self._pos += 1
+        return character
+
+    def _end(self):
+        """Find the end of the value at the position, reading chunks until
+        it is complete, without parsing it."""
+        buffer = self._buffer
+        if buffer[self._pos] not in '{["':
+            # A number, true, false or null ends at a separator
+            offset = 0
+            while True:
+                match = _SCALAR_END.search(self._buffer, self._pos + offset)
+                if match is not None:
+                    return match.start()
+                offset = len(self._buffer) - self._pos
+                if not self._fill():
+                    return len(self._buffer)
+        offset, depth = 0, 0
+        while True:
+            buffer = self._buffer
+            for match in _TOKEN.finditer(buffer, self._pos + offset):
+                token = match.group()
+                if token == '"':
+                    # A string that goes on in the next chunk
+                    offset = match.start() - self._pos
+                    break
+                if token in "[{":
+                    depth += 1
+                elif token in "]}":
+                    depth -= 1
+                if depth == 0:
+                    return match.end()
+            else:
+                offset = len(buffer) - self._pos
+            if not self._fill():
+                raise json.JSONDecodeError(
+                    "Unterminated value", self._buffer, self._pos
+                )
+
+    def value(self, loads=None):
+        """Parse the next JSON value, with `loads` (a function parsing JSON
+        bytes) if it is given.
+
+        A value complete in the buffer is parsed once, by the json scanner
+        when `loads` parses like one of the json decoders, which finds its
+        end at the same time. Otherwise its end is found by scanning its
+        brackets and strings, over the next chunks if needed, and then it
+        is parsed once."""
+        if not self.peek():
+            raise json.JSONDecodeError("Expecting value", self._buffer, self._pos)
+        decoder = self._json_decoder if loads is None else _RAW_DECODERS.get(loads)
+        if decoder is not None:
+            try:
+                value, end = decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # The value goes on in the next chunk, or it is invalid
+                pass
+            else:
+                # A number may go on in the next chunk
+                if not isinstance(value, (int, float)) or (
+                    end < len(self._buffer)
+                    and self._buffer[end] not in _NUMBER_CHARACTERS
+                ):
+                    self._pos = end
+                    return value
+        end = self._end()
+        start, self._pos = self._pos, end
+        text = self._buffer[start:end]
+        if decoder is not None:
+            return decoder.decode(text)
+        return loads(text.encode("utf-8"))
+
+
+def iter_json_items(chunks, key="response", loads=None):
+    """Parse the items of a JSON array incrementally.
+
+    The array is the value of the `key` member of a JSON object (other
+    members are skipped) or the JSON text itself. If the `key` value is not
+    an array it is the only item.
+
+    Args:
+        chunks(iterable): The bytes of the JSON text.
+        key(str): The member of the array.
+        loads(callable): The function parsing the JSON bytes of an item,
+            see dnacentersdk.utils.json_decoder_loads. Defaults to
+            json.loads.
+
+    Yields:
+        The items of the array, each parsed when it has been read.
+
+    Raises:
+        json.JSONDecodeError: If the JSON text is invalid.
+    """
+    stream = _JSONStream(chunks)
+    if stream.peek() == "{":
+        stream.expect("{")
+        while True:
+            if stream.peek() == "}":
+                return
+            member = stream.value()
+            stream.expect(":")
+            if member == key:
+                break
+            stream.value()
+            if stream.expect(",}") == "}":
+                return
+        if stream.peek() != "[":
+            yield stream.value(loads)
+            return
+    stream.expect("[")
+    if stream.peek() == "]":
+        return
+    while True:
+        yield stream.value(loads)
+        if stream.expect(",]") == "]":
+            return
+
+
+class StreamedItems(object):
+    """Iterator over the items of the JSON array of a streamed response.
+
+    The response is read `chunk_size` bytes at a time and every item is
+    parsed (by `json_loads`) and wrapped (by `object_factory`) once it has
+    been read, so the memory used does not depend on the number of items.
+    The items of the json, ordered and orjson decoders are parsed by the
+    json scanner, which finds their end as it parses them. The response is
+    closed when the iteration ends or with `close`.
+    """
+
+    def __init__(
+        self,
+        response,
+        key="response",
+        chunk_size=None,
+        json_loads=None,
+        object_factory=mydict_data_factory,
+    ):
+        """Create a new StreamedItems.
+
+        Args:
+            response(requests.Response): The streamed response.
+            key(str): The member of the JSON array in the response.
+            chunk_size(int): Bytes read at a time. Defaults to
+                dnacentersdk.config.DEFAULT_DOWNLOAD_CHUNK_SIZE.
+            json_loads(callable): The function parsing the JSON bytes of
+                an item, see dnacentersdk.utils.json_decoder_loads.
+                Defaults to json.loads.
+            object_factory(callable): The factory of the objects of the
+                items.
+        """
+        self._response = response
+        self._json_loads = json_loads
+        self._object_factory = object_factory
+        self._items = self._iter_items(key, chunk_size or DEFAULT_DOWNLOAD_CHUNK_SIZE)
+
+    @property
+    def response(self):
+        """The streamed response."""
+        return self._response
+
+    def _iter_items(self, key, chunk_size):
+        try:
+            if self._response.status_code == 204:
+                return
+            for item in iter_json_items(
+                self._response.iter_content(chunk_size=chunk_size),
+                key,
+                self._json_loads,
+            ):
+                yield self._object_factory(None, item)
+        finally:
+            self._response.close()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._items)
+
+    def close(self):
+        """Stop the iteration and close the response."""
+        self._items.close()
+        self._response.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
@@ -0,0 +1,639 @@
+# -*- coding: utf-8 -*-
+"""Waiting for the completion of DNA Center tasks.
+
+Copyright (c) 2019-2021 Cisco Systems.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from builtins import *
+
+from .config import (
+    DEFAULT_TASK_CLOCK_SKEW,
+    DEFAULT_TASK_POLL_BACKOFF,
+    DEFAULT_TASK_POLL_INTERVAL,
+    DEFAULT_TASK_POLL_MAX_INTERVAL,
+)
+from .exceptions import ApiError, TaskError
+from .pagination import Paginator, page_items, paginate
+
+logger = logging.getLogger(__name__)
+
+TASK_PENDING = "PENDING"
+TASK_SUCCESS = "SUCCESS"
+TASK_FAILURE = "FAILURE"
+
+# Status codes of a controller without the bulk /tasks API
+_NO_BULK_STATUS_CODES = (400, 404, 405, 501)
+
+
+def task_id_of(result):
+    """Get the task id of the response of a write API, e.g.
+    `{"response": {"taskId": "...", "url": "..."}}`, or None."""
+    for data in (result.get("response") if isinstance(result, dict) else None, result):
+        if isinstance(data, dict) and data.get("taskId"):
+            return data["taskId"]
+    return None
+
+
+def task_status(task):
+    """Get the status of a task: TASK_PENDING, TASK_SUCCESS or TASK_FAILURE.
+
+    Tasks of the /tasks APIs have a `status`; the others (e.g. from
+    get_task_by_id) failed when they have `isError` and are done when they
+    have an `endTime`.
+    """
+    status = task.get("status")
+    if isinstance(status, str) and status.upper() in (
+        TASK_PENDING,
+        TASK_SUCCESS,
+        TASK_FAILURE,
+    ):
+        return status.upper()
+    if task.get("isError"):
+        return TASK_FAILURE
+    if task.get("endTime"):
+        return TASK_SUCCESS
+    return TASK_PENDING
+
+
+def _response(result):
+    if isinstance(result, dict) and "response" in result:
+        return result["response"]
+    return result
+
+
+def execution_id_of(result):
+    """Get the execution id of the response of a Business API, e.g.
+    `{"executionId": "...", "executionStatusUrl": "..."}`, or None."""
+    if isinstance(result, dict) and result.get("executionId"):
+        return result["executionId"]
+    return None
+
+
+def _task_result(task_id, fetched, execution=False, tree=False):
+    """Get the status, the (failed) task and the result of a fetched task,
+    task tree or Business API execution."""
+    if execution:
+        task = fetched or {}
+        return task_status(task), task, task
+    if not tree:
+        task = _response(fetched) or {}
+        return task_status(task), task, task
+
+    tasks = _response(fetched) or []
+    statuses = [task_status(task) for task in tasks]
+    task = next(
+        (task for task in tasks if task.get("id") == task_id),
+        tasks[0] if tasks else {},
+    )
+    if TASK_FAILURE in statuses:
+        return TASK_FAILURE, tasks[statuses.index(TASK_FAILURE)], tasks
+    if not tasks or TASK_PENDING in statuses:
+        return TASK_PENDING, task, tasks
+    return TASK_SUCCESS, task, tasks
+
+
+class _TrackedTask(object):
+    __slots__ = ("task_id", "future", "since", "deadline", "execution")
+
+    def __init__(self, task_id, since, deadline, execution=False):
+        self.task_id = task_id
+        self.future = concurrent.futures.Future()
+        self.future.task_id = task_id
+        self.since = since
+        self.deadline = deadline
+        self.execution = execution
+
+
+class TaskWaiter(object):
+    """Waits for the completion of many DNA Center tasks with one
+    background poller.
+
+    Every check makes one bulk `get_tasks(status="PENDING")` query, paged,
+    over the time window of the tracked tasks. Only the tasks missing from
+    it are fetched one by one, with `get_task_by_id` (or `get_task_tree`),
+    to get their result. The polling traffic therefore grows with the
+    number of completions instead of the number of tasks. Without the bulk
+    API, or with a single task, the tasks are fetched one by one. The
+    interval between checks grows by `backoff` up to `max_interval` while
+    no task completes, and goes back to `interval` when one does. A new
+    task wakes the poller, so it is not left waiting for a backed-off
+    check.
+
+    Every task gets a concurrent.futures.Future, whose result is the task
+    (or with `tree`, the tasks of its tree). It raises TaskError if the
+    task failed, or TimeoutError after `timeout` seconds.
+
+    Example:
+        waiter = TaskWaiter(api)
+        task_ids = [task_id_of(api.devices.add_device(**d)) for d in devices]
+        for future in waiter.as_completed(task_ids):
+            print(future.task_id, future.exception() or "done")
+    """
+
+    def __init__(
+        self,
+        api,
+        interval=DEFAULT_TASK_POLL_INTERVAL,
+        max_interval=DEFAULT_TASK_POLL_MAX_INTERVAL,
+        backoff=DEFAULT_TASK_POLL_BACKOFF,
+        timeout=None,
+        tree=False,
+        bulk=True,
+        max_errors=5,
+    ):
+        """Create a new TaskWaiter.
+
+        Args:
+            api(DNACenterAPI): The API, or its `task` wrapper.
+            interval(float): Seconds between the first checks.
+            max_interval(float): Maximum seconds between checks.
+            backoff(float): Factor of the interval after a check without
+                any completed task.
+            timeout(float): Default seconds to wait for a task, None to
+                wait forever.
+            tree(bool): Wait for the whole tree of the tasks (the tasks
+                whose root is the task) with `get_task_tree`.
+            bulk(bool): Use the bulk `get_tasks` queries.
+            max_errors(int): Number of failed checks in a row after which
+                the futures of the tracked tasks get the error.
+        """
+        self._task_api = getattr(api, "task", api)
+        self.interval = interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.timeout = timeout
+        self.tree = tree
+        self._bulk = bulk and hasattr(self._task_api, "get_tasks")
+        self.max_errors = max_errors
+        self._tracked = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._poller = None
+        self._reset_interval = False
+
+    @property
+    def pending(self):
+        """The ids of the tracked tasks."""
+        with self._lock:
+            return list(self._tracked)
+
+    def submit(self, task_id, timeout=None):
+        """Track a task.
+
+        Args:
+            task_id(str): The id of the task.
+            timeout(float): Seconds to wait for the task, defaults to the
+                `timeout` of the waiter.
+
+        Returns:
+            concurrent.futures.Future: Resolved with the task when it is
+            done. Its `task_id` attribute is the id of the task.
+        """
+        return self._track(task_id, timeout).future
+
+    def submit_execution(self, execution_id, timeout=None):
+        """Track a Business API execution, with
+        `get_business_api_execution_details`.
+
+        Returns:
+            concurrent.futures.Future: Resolved with the execution details
+            when it is done.
+        """
+        return self._track(execution_id, timeout, execution=True).future
+
+    def future_of(self, result, timeout=None):
+        """Track the task or execution of the response of a write API.
+
+        Returns:
+            concurrent.futures.Future: The future of the task or execution,
+            None if the response has neither.
+        """
+        task_id = task_id_of(result)
+        if task_id is not None:
+            return self.submit(task_id, timeout=timeout)
+        execution_id = execution_id_of(result)
+        if execution_id is not None:
+            return self.submit_execution(execution_id, timeout=timeout)
+        return None
+
+    def _track(self, task_id, timeout, execution=False):
+        if timeout is None:
+            timeout = self.timeout
+        wake = False
+        with self._lock:
+            tracked = self._tracked.get(task_id)
+            if tracked is None:
+                tracked = self._tracked[task_id] = _TrackedTask(
+                    task_id,
+                    time.time() - DEFAULT_TASK_CLOCK_SKEW,
+                    None if timeout is None else time.monotonic() + timeout,
+                    execution=execution,
+                )
+                self._reset_interval = True
+                wake = self._poller is not None
+            if self._poller is None:
+                self._poller = self._start_poller()
+        if wake:
+            self._wake()
+        return tracked
+
+    def _wake(self):
+        """Make the poller check the tasks without waiting for its delay."""
+        self._wakeup.set()
+
+    def _start_poller(self):
+        thread = threading.Thread(
+            target=self._run, name="dnacentersdk-task-waiter", daemon=True
+        )
+        thread.start()
+        return thread
+
+    def wait(self, task_id, timeout=None):
+        """Wait for a task.
+
+        Returns:
+            The task, or with `tree` the tasks of its tree.
+
+        Raises:
+            TaskError: If the task failed.
+            TimeoutError: If the task is not done after `timeout` seconds.
+        """
+        return self.submit(task_id, timeout=timeout).result()
+
+    def as_completed(self, task_ids, timeout=None):
+        """Track tasks and iterate over their futures as they complete.
+
+        Args:
+            task_ids(iterable): The ids of the tasks.
+            timeout(float): Seconds to wait for every task.
+
+        Returns:
+            iterator: The futures of the tasks, in completion order.
+        """
+        futures = [self.submit(task_id, timeout=timeout) for task_id in task_ids]
+        return concurrent.futures.as_completed(futures)
+
+    def close(self):
+        """Stop tracking the tasks, whose futures are cancelled."""
+        with self._lock:
+            tracked, self._tracked = list(self._tracked.values()), {}
+        for task in tracked:
+            task.future.cancel()
+        self._wakeup.set()
+
+    def _finish(self, tracked, result=None, exception=None):
+        with self._lock:
+            self._tracked.pop(tracked.task_id, None)
+        if tracked.future.done():
+            return
+        if exception is not None:
+            tracked.future.set_exception(exception)
+        else:
+            tracked.future.set_result(result)
+
+    def _next_delay(self, delay, completed):
+        """Get the delay before the next check, or None to stop polling."""
+        with self._lock:
+            if not self._tracked:
+                self._poller = None
+                return None
+            if self._reset_interval:
+                self._reset_interval = False
+                return self.interval
+        if completed:
+            return self.interval
+        return min(delay * self.backoff, self.max_interval)
+
+    def _failed_check(self, errors, exception):
+        """Count a failed check; fail the tracked tasks after max_errors.
+        Return the new count of failed checks in a row."""
+        errors += 1
+        logger.debug("Task status check failed: %s", exception)
+        if errors < self.max_errors:
+            return errors
+        with self._lock:
+            tracked = list(self._tracked.values())
+        for task in tracked:
+            self._finish(task, exception=exception)
+        return 0
+
+    def _run(self):
+        delay = self.interval
+        errors = 0
+        while True:
+            self._wakeup.wait(delay)
+            self._wakeup.clear()
+            completed = 0
+            if self.pending:
+                try:
+                    completed = self.poll()
+                except Exception as e:
+                    errors = self._failed_check(errors, e)
+                else:
+                    errors = 0
+            delay = self._next_delay(delay, completed)
+            if delay is None:
+                return
+
+    def _due(self):
+        """Fail the tracked tasks that timed out; get the others."""
+        now = time.monotonic()
+        with self._lock:
+            tracked = list(self._tracked.values())
+        for task in tracked:
+            if task.deadline is not None and now >= task.deadline:
+                self._finish(
+                    task,
+                    exception=TimeoutError("Task {} is not done".format(task.task_id)),
+                )
+        return [task for task in tracked if not task.future.done()]
+
+    def _bulk_since(self, tracked):
+        """The start of the window of the bulk query, None to check the
+        tasks one by one."""
+        tasks = [task for task in tracked if not task.execution]
+        if not self._bulk or len(tasks) < 2:
+            return None
+        return min(task.since for task in tasks)
+
+    def _candidates(self, tracked, pending_ids):
+        if pending_ids is None:
+            return tracked
+        return [
+            task
+            for task in tracked
+            if task.execution or task.task_id not in pending_ids
+        ]
+
+    def _no_bulk(self, exception):
+        """Handle an error of the bulk query; return True if there is no
+        bulk API."""
+        if exception.status_code not in _NO_BULK_STATUS_CODES:
+            return False
+        logger.debug("No bulk task queries, checking the tasks one by one")
+        self._bulk = False
+        return True
+
+    def _add_pending(self, pending_ids, tasks):
+        for task in tasks:
+            pending_ids.add(task.get("id"))
+            if self.tree:
+                pending_ids.add(task.get("rootId"))
+
+    def _fetch(self, tracked):
+        """Request a task, its tree or an execution."""
+        if tracked.execution:
+            return self._task_api.get_business_api_execution_details(tracked.task_id)
+        if self.tree:
+            return self._task_api.get_task_tree(tracked.task_id)
+        return self._task_api.get_task_by_id(tracked.task_id)
+
+    def _needs_details(self, task):
+        return (
+            not task.get("failureReason")
+            and not task.get("bapiError")
+            and bool(task.get("id"))
+            and hasattr(self._task_api, "get_task_details_by_id")
+        )
+
+    def _complete(self, tracked, status, task, result, details=None):
+        """Resolve the future of a task that is done; return 1 if it is."""
+        if status == TASK_PENDING:
+            # Widen the window of the bulk queries to the task's start
+            start_time = task.get("startTime")
+            if isinstance(start_time, (int, float)):
+                tracked.since = min(
+                    tracked.since, start_time / 1000 - DEFAULT_TASK_CLOCK_SKEW
+                )
+            return 0
+        if status == TASK_FAILURE:
+            message = None
+            reason = task.get("bapiError")
+            if isinstance(details, dict) and details.get("failureReason"):
+                reason = details["failureReason"]
+            if reason:
+                message = "Task {} failed: {}".format(tracked.task_id, reason)
+            self._finish(
+                tracked, exception=TaskError(tracked.task_id, task, message=message)
+            )
+        else:
+            self._finish(tracked, result=result)
+        return 1
+
+    def poll(self):
+        """Check the status of the tracked tasks once and resolve the
+        futures of those that are done.
+
+        Returns:
+            int: The number of tasks that completed.
+        """
+        tracked = self._due()
+        pending_ids = None
+        since = self._bulk_since(tracked)
+        if since is not None:
+            pending_ids = set()
+            try:
+                self._add_pending(
+                    pending_ids,
+                    paginate(
+                        self._task_api.get_tasks,
+                        start_time=int(since * 1000),
+                        status=TASK_PENDING,
+                    ),
+                )
+            except ApiError as e:
+                if not self._no_bulk(e):
+                    raise
+                pending_ids = None
+        candidates = self._candidates(tracked, pending_ids)
+        logger.debug(
+            "%d tracked tasks, %d to check one by one", len(tracked), len(candidates)
+        )
+
+        completed = 0
+        for tracked_task in candidates:
+            status, task, result = _task_result(
+                tracked_task.task_id,
+                self._fetch(tracked_task),
+                execution=tracked_task.execution,
+                tree=self.tree,
+            )
+            details = None
+            if status == TASK_FAILURE and self._needs_details(task):
+                try:
+                    details = _response(
+                        self._task_api.get_task_details_by_id(task["id"])
+                    )
+                except ApiError:
+                    pass
+            completed += self._complete(tracked_task, status, task, result, details)
+        return completed
+
+
+class AsyncTaskWaiter(TaskWaiter):
+    """TaskWaiter of an AsyncDNACenterAPI, polling from an asyncio task.
+
+    Its futures are asyncio futures of the running event loop, which must
+    be the loop of the API.
+
+    Example:
+        waiter = AsyncTaskWaiter(api)
+        task = await waiter.submit(task_id)
+    """
+
+    def submit(self, task_id, timeout=None):
+        return asyncio.wrap_future(self._track(task_id, timeout).future)
+
+    def submit_execution(self, execution_id, timeout=None):
+        return asyncio.wrap_future(
+            self._track(execution_id, timeout, execution=True).future
+        )
+
+    async def wait(self, task_id, timeout=None):
+        return await self.submit(task_id, timeout=timeout)
+
+    def as_completed(self, task_ids, timeout=None):
+        """Track tasks and iterate over awaitables of their results, in
+        completion order (see asyncio.as_completed)."""
+        futures = [self.submit(task_id, timeout=timeout) for task_id in task_ids]
+        return asyncio.as_completed(futures)
+
+    def close(self):
+        poller = self._poller
+        super(AsyncTaskWaiter, self).close()
+        if poller is not None:
+            try:
+                poller.cancel()
+            except RuntimeError:
+                # The event loop is closed
+                pass
+            self._poller = None
+
+    def _start_poller(self):
+        self._loop = asyncio.get_event_loop()
+        self._async_wakeup = asyncio.Event()
+        return asyncio.ensure_future(self._run(self._async_wakeup))
+
+    def _wake(self):
+        try:
+            self._loop.call_soon_threadsafe(self._async_wakeup.set)
+        except RuntimeError:
+            # The event loop is closed
+            pass
+
+    async def _run(self, wakeup):
+        delay = self.interval
+        errors = 0
+        while True:
+            try:
+                await asyncio.wait_for(wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+            completed = 0
+            if self.pending:
+                try:
+                    completed = await self.poll()
+                except Exception as e:
+                    errors = self._failed_check(errors, e)
+                else:
+                    errors = 0
+            delay = self._next_delay(delay, completed)
+            if delay is None:
+                return
+
+    async def _pending_ids(self, since):
+        paginator = Paginator(self._task_api.get_tasks)
+        pending_ids = set()
+        page_number, received, served = 0, 0, None
+        while True:
+            items = page_items(
+                await self._task_api.get_tasks(
+                    offset=paginator.offset(page_number, received),
+                    limit=paginator.page_size,
+                    start_time=int(since * 1000),
+                    status=TASK_PENDING,
+                )
+            )
+            self._add_pending(pending_ids, items)
+            # See Paginator.pages
+            if not items or (served is not None and len(items) < served):
+                return pending_ids
+            served = max(served or 0, len(items))
+            received += len(items)
+            page_number += 1
+
+    async def poll(self):
+        """Check the status of the tracked tasks once; see TaskWaiter.poll."""
+        tracked = self._due()
+        pending_ids = None
+        since = self._bulk_since(tracked)
+        if since is not None:
+            try:
+                pending_ids = await self._pending_ids(since)
+            except ApiError as e:
+                if not self._no_bulk(e):
+                    raise
+        candidates = self._candidates(tracked, pending_ids)
+
+        completed = 0
+        for tracked_task in candidates:
+            status, task, result = _task_result(
+                tracked_task.task_id,
+                await self._fetch(tracked_task),
+                execution=tracked_task.execution,
+                tree=self.tree,
+            )
+            details = None
+            if status == TASK_FAILURE and self._needs_details(task):
+                try:
+                    details = _response(
+                        await self._task_api.get_task_details_by_id(task["id"])
+                    )
+                except ApiError:
+                    pass
+            completed += self._complete(tracked_task, status, task, result, details)
+        return completed
+
+
+def wait_for_task(api, task_id, timeout=None, **kwargs):
+    """Wait for a task with a new TaskWaiter.
+
+    Args:
+        api(DNACenterAPI): The API, or its `task` wrapper.
+        task_id(str): The id of the task.
+        timeout(float): Seconds to wait for the task.
+        **kwargs: Passed on to TaskWaiter.
+
+    Returns:
+        The task, or with `tree` the tasks of its tree.
+
+    Raises:
+        TaskError: If the task failed.
+        TimeoutError: If the task is not done after `timeout` seconds.
+    """
+    return TaskWaiter(api, **kwargs).wait(task_id, timeout=timeout)
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""Access token stores shared by DNACenterAPI objects and processes.
+
+Copyright (c) 2019-2021 Cisco Systems.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import abc
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import namedtuple
+from builtins import *
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from .utils import check_type
+
+logger = logging.getLogger(__name__)
+
+#: An access token kept in a TokenStore, with its expiry as a time.time().
+CachedToken = namedtuple("CachedToken", ["token", "expiry"])
+
+
+def token_store_key(base_url, username=None, password=None, encoded_auth=None):
+    """Get the TokenStore key of a Catalyst Center and its credentials.
+
+    The key is a hash, so neither the credentials nor the URL can be read
+    from it.
+
+    Args:
+        base_url(str): The base URL of the Catalyst Center.
+        username(str): HTTP Basic Auth username.
+        password(str): HTTP Basic Auth password.
+        encoded_auth(str): HTTP Basic Auth base64 encoded string.
+
+    Returns:
+        str: The key.
+    """
+    credentials = encoded_auth or "{}:{}".format(username, password)
+    return hashlib.sha256(
+        "{}\0{}".format(base_url, credentials).encode("utf-8")
+    ).hexdigest()
+
+
+class TokenStore(abc.ABC):
+    """Interface of the stores where access tokens are shared.
+
+    Subclasses implement `get`, `set` and `delete`; a store missing one of
+    them cannot be instantiated. `lock` serializes the
+    token requests of a key, so only one of the sharing clients
+    authenticates while the others wait and then reuse its token; the
+    default implementation does not lock.
+    """
+
+    @abc.abstractmethod
+    def get(self, key):
+        """Get the token stored under a key.
+
+        Returns:
+            CachedToken: The token and its expiry, or None if there is none.
+        """
+
+    @abc.abstractmethod
+    def set(self, key, token, expiry):
+        """Store a token and its expiry (a time.time() value) under a key."""
+
+    @abc.abstractmethod
+    def delete(self, key):
+        """Remove the token stored under a key, if any."""
+
+    @contextlib.contextmanager
+    def lock(self, key):
+        """Hold exclusive access to a key while a token is requested."""
+        yield
+
+
+class MemoryTokenStore(TokenStore):
+    """TokenStore shared by the DNACenterAPI objects of a process."""
+
+    def __init__(self):
+        self._tokens = {}
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+
+    def get(self, key):
+        return self._tokens.get(key)
+
+    def set(self, key, token, expiry):
+        self._tokens[key] = CachedToken(token, expiry)
+
+    def delete(self, key):
+        self._tokens.pop(key, None)
+
+    @contextlib.contextmanager
+    def lock(self, key):
+        with self._locks_lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            yield
+
+
+class FileTokenStore(TokenStore):
+    """TokenStore shared by the processes of a host through a directory.
+
+    Each key is kept in its own `<key>.json` file, readable only by its
+    owner, and `lock` holds an exclusive file lock on `<key>.lock`.
+    """
+
+    def __init__(self, directory):
+        """Create a new FileTokenStore.
+
+        Args:
+            directory(str): The directory where the tokens are kept. It is
+                created if it does not exist.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+        """
+        check_type(directory, str, may_be_none=False)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        self._directory = directory
+
+    @property
+    def directory(self):
+        """The directory where the tokens are kept."""
+        return self._directory
+
+    def _path(self, key, extension):
+        return os.path.join(self._directory, key + extension)
+
+    def get(self, key):
+        try:
+            with open(self._path(key, ".json")) as f:
+                data = json.load(f)
+            return CachedToken(data["token"], data["expiry"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("Ignoring unreadable cached token: {}".format(e))
+            return None
+
+    def set(self, key, token, expiry):
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self._directory, prefix=key, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"token": token, "expiry": expiry}, f)
+            os.replace(tmp_path, self._path(key, ".json"))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+
+    def delete(self, key):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._path(key, ".json"))
+
+    @contextlib.contextmanager
+    def lock(self, key):
+        fd = os.open(self._path(key, ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                else:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+"""Record and replay of the HTTP exchanges with the DNA Center APIs.
+
+Copyright (c) 2019-2021 Cisco Systems.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import base64
+import datetime
+import gzip
+import io
+import json
+import threading
+import time
+import urllib.parse
+from collections import deque
+from builtins import *
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .config import DEBUG_REDACTED_HEADERS
+from .connection_pool import PoolStatsHTTPAdapter
+from .exceptions import ReplayError
+
+#: The endpoint whose token is redacted from the recordings.
+AUTH_TOKEN_PATH = "/dna/system/api/v1/auth/token"
+
+# Headers that describe the encoding of the body on the wire, which is
+# recorded decoded
+_WIRE_HEADERS = ("content-encoding", "transfer-encoding", "content-length")
+
+# Response headers whose values are redacted from the recordings
+_REDACTED_HEADERS = frozenset(
+    name.lower() for name in DEBUG_REDACTED_HEADERS + ("Set-Cookie",)
+)
+
+
+def _open(path, mode):
+    """Open a recording, gzip-compressed if its name ends with .gz."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def exchange_key(method, url):
+    """Get the key a request is matched by: its method, path and sorted
+    query, so a recording replays against any host."""
+    parts = urllib.parse.urlsplit(url)
+    query = urllib.parse.urlencode(sorted(urllib.parse.parse_qsl(parts.query)))
+    return method.upper(), parts.path, query
+
+
+def _encode_body(body):
+    try:
+        return body.decode("utf-8"), None
+    except UnicodeDecodeError:
+        return base64.b64encode(body).decode("ascii"), "base64"
+
+
+def _decode_body(record):
+    body = record.get("body") or ""
+    if record.get("encoding") == "base64":
+        return base64.b64decode(body)
+    return body.encode("utf-8")
+
+
+def _redact_token(body):
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return body
+    if isinstance(data, dict) and "Token" in data:
+        data["Token"] = "<redacted>"
+        return json.dumps(data).encode("utf-8")
+    return body
+
+
+class RecordingAdapter(PoolStatsHTTPAdapter):
+    """requests adapter that sends the requests over pooled connections and
+    records every exchange as a line of JSON in a file (gzip-compressed if
+    its name ends with .gz).
+
+    The request headers are not recorded, and the token of the
+    authentication responses and the credential headers of the responses
+    (DEBUG_REDACTED_HEADERS and Set-Cookie) are redacted. The body of a streamed response
+    is read whole to be recorded.
+    """
+
+    def __init__(self, path, **kwargs):
+        """Create a new RecordingAdapter.
+
+        Args:
+            path(str): The file of the recording, overwritten.
+            **kwargs: Passed on to PoolStatsHTTPAdapter.
+        """
+        self.path = path
+        self._file = _open(path, "w")
+        self._lock = threading.Lock()
+        super(RecordingAdapter, self).__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        start = time.monotonic()
+        response = super(RecordingAdapter, self).send(request, **kwargs)
+        body = response.content
+        elapsed = time.monotonic() - start
+        if urllib.parse.urlsplit(request.url).path == AUTH_TOKEN_PATH:
+            body = _redact_token(body)
+        text, encoding = _encode_body(body)
+        method, path, query = exchange_key(request.method, request.url)
+        record = {
+            "method": method,
+            "path": path,
+            "query": query,
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                name: "<redacted>" if name.lower() in _REDACTED_HEADERS else value
+                for name, value in response.headers.items()
+                if name.lower() not in _WIRE_HEADERS
+            },
+            "body": text,
+            "encoding": encoding,
+            "elapsed": round(elapsed, 6),
+        }
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+        return response
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+        super(RecordingAdapter, self).close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """requests adapter that answers the requests with the exchanges of a
+    recording, without any network.
+
+    A request gets the next recorded response of the same method, path and
+    query; responses are returned at full speed, or after their recorded
+    latency multiplied by `latency_scale`.
+    """
+
+    def __init__(self, path, latency_scale=0, repeat=False):
+        """Create a new ReplayAdapter.
+
+        Args:
+            path(str): The file of the recording.
+            latency_scale(float): Multiplier of the recorded latencies, 0
+                to replay at full speed.
+            repeat(bool): Start over the responses of a request once they
+                have all been replayed, instead of raising ReplayError.
+        """
+        super(ReplayAdapter, self).__init__()
+        self.path = path
+        self.latency_scale = latency_scale
+        self.repeat = repeat
+        self._lock = threading.Lock()
+        self._records = {}
+        with _open(path, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                key = (record["method"], record["path"], record["query"])
+                self._records.setdefault(key, []).append(record)
+        self._queues = {key: deque(records) for key, records in self._records.items()}
+
+    def _next_record(self, request):
+        key = exchange_key(request.method, request.url)
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue and self.repeat and key in self._records:
+                queue = self._queues[key] = deque(self._records[key])
+            if not queue:
+                raise ReplayError(
+                    "No recorded response for {} {} in {}".format(
+                        request.method, request.url, self.path
+                    )
+                )
+            return queue.popleft()
+
+    def send(self, request, **kwargs):
+        record = self._next_record(request)
+        if self.latency_scale:
+            time.sleep(record.get("elapsed", 0) * self.latency_scale)
+        body = _decode_body(record)
+
+        response = requests.Response()
+        response.status_code = record["status"]
+        response.reason = record.get("reason")
+        response.headers = CaseInsensitiveDict(record.get("headers") or {})
+        response.headers["Content-Length"] = str(len(body))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(body)
+        response._content = body
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.elapsed = datetime.timedelta(seconds=record.get("elapsed", 0))
+        return response
+
+    def close(self):
+        pass
+
+
+def recording_session(path, **kwargs):
+    """Get a requests session that records its exchanges to a file.
+
+    Example:
+        api = DNACenterAPI(session=recording_session("inventory.jsonl.gz"))
+
+    Args:
+        path(str): The file of the recording.
+        **kwargs: Passed on to RecordingAdapter.
+
+    Returns:
+        requests.Session: The session, for the `session` argument of
+        DNACenterAPI or RestSession.
+    """
+    session = requests.session()
+    adapter = RecordingAdapter(path, **kwargs)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def replay_session(path, latency_scale=0, repeat=False):
+    """Get a requests session that replays the exchanges of a recording.
+
+    Example:
+        api = DNACenterAPI(
+            base_url="https://dnac", username="user", password="password",
+            session=replay_session("inventory.jsonl.gz"),
+        )
+
+    Args:
+        path(str): The file of the recording.
+        latency_scale(float): Multiplier of the recorded latencies, 0 to
+            replay at full speed.
+        repeat(bool): Start over the responses of a request once they have
+            all been replayed.
+
+    Returns:
+        requests.Session: The session, for the `session` argument of
+        DNACenterAPI or RestSession.
+    """
+    session = requests.session()
+    adapter = ReplayAdapter(path, latency_scale=latency_scale, repeat=repeat)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -25,6 +25,7 @@ SOFTWARE.
 
 native_str = str
 
+import contextvars
 import json
 import mimetypes
 import os
@@ -36,6 +37,16 @@ from datetime import datetime, timedelta, tzinfo
 import warnings
 import functools
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .config import (
+    DEBUG_REDACTED_HEADERS,
+    DEFAULT_DEBUG_BODY_LIMIT,
+    JSON_DECODERS,
+)
 from .exceptions import ApiError, RateLimitError
 from .response_codes import RATE_LIMIT_RESPONSE_CODE
 
@@ -206,29 +217,79 @@ def check_response_code(response, expected_response_code):
         raise ApiError(response)
 
 
-def extract_and_parse_json(response):
+def _ordered_json_loads(content):
+    return json.loads(content, object_hook=OrderedDict)
+
+
+def json_decoder_loads(json_decoder):
+    """Get the function that parses a JSON document for a decoder setting.
+
+    Args:
+        json_decoder(str,callable): "auto" (orjson if it is installed,
+            json otherwise), "orjson", "json", "ordered" (json with
+            OrderedDict objects, the former behavior) or a function
+            parsing a JSON document given as bytes.
+
+    Returns:
+        callable: The function parsing JSON bytes.
+
+    Raises:
+        ValueError: If the decoder name is not supported.
+        ImportError: If "orjson" is asked and it is not installed.
+    """
+    if callable(json_decoder):
+        return json_decoder
+    if json_decoder not in JSON_DECODERS:
+        raise ValueError(
+            "Unknown JSON decoder {!r}, known decoders are {}".format(
+                json_decoder, ", ".join(JSON_DECODERS)
+            )
+        )
+    if json_decoder == "auto":
+        json_decoder = "json" if orjson is None else "orjson"
+    if json_decoder == "orjson":
+        if orjson is None:
+            raise ImportError(
+                "The orjson JSON decoder requires the orjson package, "
+                "install it with `pip install orjson`"
+            )
+        return orjson.loads
+    if json_decoder == "ordered":
+        return _ordered_json_loads
+    return json.loads
+
+
+_default_json_loads = json_decoder_loads("auto")
+
+
+def extract_and_parse_json(response, json_loads=None):
     """Extract and parse the JSON data from an requests.response object.
 
+    The content bytes are parsed as they are, without decoding them to a
+    str first.
+
     Args:
         response(requests.response): The response object returned by a request
             using the requests package.
-        stream(bool): If the request was to get a raw response content
+        json_loads(callable): The function parsing the JSON bytes, see
+            json_decoder_loads. Defaults to the "auto" decoder.
 
     Returns:
         The parsed JSON data as the appropriate native Python data type.
-        Returns None if response text is empty.
+        Returns None if response content is empty.
 
     Raises:
-        JSONDecodeError: caused by json.loads
-        TypeError: caused by json.loads
+        JSONDecodeError: caused by the JSON decoder
+        TypeError: caused by the JSON decoder
     """
-    try:
-        # Return None if the response text is empty or whitespace-only
-        if not response.text or response.text.isspace():
-            return None
-        return json.loads(response.text, object_hook=OrderedDict)
-    except Exception as e:
-        raise e
+    content = getattr(response, "content", None)
+    if not isinstance(content, (bytes, str)):
+        # Responses without bytes content, e.g. test doubles
+        content = response.text
+    # Return None if the response content is empty or whitespace-only
+    if not content or content.isspace():
+        return None
+    return (json_loads or _default_json_loads)(content)
 
 
 def json_dict(json_data):
@@ -257,11 +318,18 @@ def json_dict(json_data):
         )
 
 
+# The last URL expanded by apply_path_params in this thread or task and
+# its template, so the request of an API wrapper is known by its endpoint
+_last_url_template = contextvars.ContextVar("last_url_template", default=None)
+
+
 def apply_path_params(URL, path_params):
     if isinstance(URL, str) and isinstance(path_params, dict):
+        template = URL
         for k in path_params:
             URL = URL.replace("${" + k + "}", str(path_params[k]))
             URL = URL.replace("{" + k + "}", str(path_params[k]))
+        _last_url_template.set((URL, template))
         return URL
     else:
         raise TypeError(
@@ -271,64 +339,211 @@ def apply_path_params(URL, path_params):
         )
 
 
-def pprint_request_info(url, method, _headers, **kwargs):
-    debug_print = "\nRequest" "\n\tURL: {}" "\n\tMethod: {}" "\n\tHeaders: \n{}"
-    _headers.update(kwargs.get("headers", {}))
-    _headers = "\n".join(["\t\t{}: {}".format(a, b) for a, b in _headers.items()])
-    debug_print = debug_print.format(url, method, _headers)
-
-    kwargs_to_include = ["params", "json", "data", "stream"]
-    kwargs_pprint = {
-        "params": "Params",
-        "json": "Body",
-        "data": "Body",
-        "stream": "Stream",
-    }
-
-    for kw in kwargs_to_include:
-        if kwargs.get(kw) is not None and kwargs_pprint.get(kw):
-            value = kwargs.get(kw)
-            key = kwargs_pprint.get(kw)
-            if isinstance(value, list) or isinstance(value, dict):
-                value = json.dumps(value, indent=4)
+def url_template(url):
+    """Get the URL template of a URL, e.g.
+    "/dna/intent/api/v1/network-device/{id}" for the URL of the last
+    apply_path_params call in this thread or task, or the URL path.
+    """
+    last = _last_url_template.get()
+    if last is not None and last[0] == url:
+        return last[1]
+    return urllib.parse.urlsplit(url).path
+
+
+def _redacted_headers(headers):
+    redacted = {name.lower() for name in DEBUG_REDACTED_HEADERS}
+    return OrderedDict(
+        (name, "<redacted>" if name.lower() in redacted else value)
+        for name, value in headers.items()
+    )
+
+
+def _truncated(text, limit):
+    if limit is not None and len(text) > limit:
+        return "{}... [{} characters truncated]".format(
+            text[:limit], len(text) - limit
+        )
+    return text
+
+
+def _truncated_bytes(content, limit):
+    text = content[:limit].decode("utf-8", "replace")
+    if limit is not None and len(content) > limit:
+        text += "... [{} bytes truncated]".format(len(content) - limit)
+    return text
+
+
+def _pprint_headers(headers):
+    return "\n".join(["\t\t{}: {}".format(a, b) for a, b in headers.items()])
+
+
+class RequestInfo(object):
+    """Debug log record of a request, formatted only when it is emitted.
+
+    It is passed as the message of `logger.debug`, so nothing is formatted
+    when debug logging is off. Log handlers can get its fields, with the
+    X-Auth-Token redacted and the body truncated, from `record.msg.to_dict()`.
+    """
+
+    def __init__(
+        self, url, method, _headers, body_limit=DEFAULT_DEBUG_BODY_LIMIT, **kwargs
+    ):
+        """Create a new RequestInfo.
+
+        Args:
+            url(str): The URL of the request.
+            method(str): The request-method type.
+            _headers(dict): The headers of the session.
+            body_limit(int): Characters of the body kept, None for all.
+            **kwargs: The kwargs of the request; `headers` are added to the
+                session headers.
+        """
+        self.url = url
+        self.method = method
+        self.body_limit = body_limit
+        self._headers = _headers
+        self._kwargs = kwargs
+
+    @property
+    def headers(self):
+        """The headers of the request, the secret ones redacted."""
+        headers = OrderedDict(self._headers.items())
+        headers.update(self._kwargs.get("headers") or {})
+        return _redacted_headers(headers)
+
+    def _value(self, value):
+        if isinstance(value, (list, dict)):
+            value = json.dumps(value, indent=4)
+        elif isinstance(value, bytes):
+            return _truncated_bytes(value, self.body_limit)
+        return _truncated(str(value), self.body_limit)
+
+    def to_dict(self):
+        """The fields of the request."""
+        body = self._kwargs.get("json")
+        if body is None:
+            body = self._kwargs.get("data")
+        return {
+            "method": self.method,
+            "url": self.url,
+            "headers": self.headers,
+            "params": self._kwargs.get("params"),
+            "body": None if body is None else self._value(body),
+            "stream": self._kwargs.get("stream"),
+        }
+
+    def __str__(self):
+        debug_print = "\nRequest" "\n\tURL: {}" "\n\tMethod: {}" "\n\tHeaders: \n{}"
+        debug_print = debug_print.format(
+            self.url, self.method, _pprint_headers(self.headers)
+        )
+
+        kwargs_pprint = {
+            "params": "Params",
+            "json": "Body",
+            "data": "Body",
+            "stream": "Stream",
+        }
+        for kw, key in kwargs_pprint.items():
+            value = self._kwargs.get(kw)
+            if value is None:
+                continue
+            value = self._value(value)
+            if isinstance(self._kwargs[kw], (list, dict)):
                 lines = [" " * (8 + len(key)) + line for line in value.split("\n")]
                 value = "\n".join(lines)
             else:
                 value = "\t\t{}".format(value)
+            debug_print = "{}\n\t{}:\n{}".format(debug_print, key, value)
+        return debug_print
 
-            format_str = "{}\n\t{}:\n{}"
-            debug_print = format_str.format(debug_print, key, value)
-    return debug_print
 
+class ResponseInfo(object):
+    """Debug log record of a response, formatted only when it is emitted.
 
-def pprint_response_info(response):
-    debug_print = "\nResponse" "\n\tStatus: {} - {}" "\n\tHeaders: \n{}"
-    headers = response.headers
-    headers = "\n".join(["\t\t{}: {}".format(a, b) for a, b in headers.items()])
-    body = None
-    file_resp_headers = ["Content-Disposition", "fileName"]
-
-    content_type = response.headers.get("Content-Type")
-    if content_type and "application/json" in content_type:
-        try:
-            body = response.json()
-            body = json.dumps(body, indent=4)
-            body = "\n".join([" " * 13 + line for line in body.split("\n")])
-        except Exception:
-            body = response.text or response.content
-            pass
-    elif any([i in response.headers for i in file_resp_headers]):
-        body = None
-    else:
-        body = response.text or response.content
+    The body is taken from the content already read: a streamed response
+    is not read, and a body longer than `body_limit` is truncated instead
+    of being parsed and pretty-printed.
+    """
+
+    def __init__(self, response, body_limit=DEFAULT_DEBUG_BODY_LIMIT):
+        """Create a new ResponseInfo.
+
+        Args:
+            response(requests.Response): The response.
+            body_limit(int): Characters of the body kept, None for all.
+        """
+        self.response = response
+        self.body_limit = body_limit
+
+    @property
+    def headers(self):
+        """The headers of the response, the secret ones redacted."""
+        return _redacted_headers(getattr(self.response, "headers", None) or {})
+
+    @property
+    def body(self):
+        """The (truncated) body of the response, or None."""
+        response = self.response
+        headers = getattr(response, "headers", None) or {}
+        if any(i in headers for i in ["Content-Disposition", "fileName"]):
+            return None
+        content = getattr(response, "_content", None)
+        if content is False:
+            # Streamed, and not read yet
+            return None
+        if not isinstance(content, (bytes, str)):
+            content = getattr(response, "text", None)
+            if not isinstance(content, str):
+                return None
+
+        limit = self.body_limit
+        content_type = headers.get("Content-Type")
+        if (
+            content_type
+            and "application/json" in content_type
+            and (limit is None or len(content) <= limit)
+        ):
+            try:
+                body = json.dumps(json.loads(content), indent=4)
+            except ValueError:
+                pass
+            else:
+                return "\n".join(
+                    [" " * 13 + line for line in _truncated(body, limit).split("\n")]
+                )
+        if isinstance(content, bytes):
+            return _truncated_bytes(content, limit)
+        return _truncated(content, limit)
+
+    def to_dict(self):
+        """The fields of the response."""
+        return {
+            "status_code": getattr(self.response, "status_code", None),
+            "reason": getattr(self.response, "reason", None),
+            "headers": self.headers,
+            "body": self.body,
+        }
+
+    def __str__(self):
+        debug_print = "\nResponse" "\n\tStatus: {} - {}" "\n\tHeaders: \n{}"
+        debug_print = debug_print.format(
+            getattr(self.response, "status_code", None),
+            getattr(self.response, "reason", None),
+            _pprint_headers(self.headers),
+        )
+        body = self.body
+        if body:
+            debug_print = "{}\n\t{}:\n{}".format(debug_print, "Body", body)
+        return debug_print
 
-    debug_print = debug_print.format(response.status_code, response.reason, headers)
 
-    if body is not None:
-        format_str = "{}\n\t{}:\n{}"
-        debug_print = format_str.format(debug_print, "Body", body)
+def pprint_request_info(url, method, _headers, **kwargs):
+    return str(RequestInfo(url, method, _headers, **kwargs))
+
 
-    return debug_print
+def pprint_response_info(response):
+    return str(ResponseInfo(response))
 
 
 def dict_of_str(json_dict):
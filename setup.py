@@ -47,6 +47,11 @@ INSTALLATION_REQUIREMENTS = [
     "requests-toolbelt>=1.0.0",
 ]
 
+EXTRAS_REQUIREMENTS = {
+    "async": ["aiohttp>=3.9.0"],
+    "orjson": ["orjson>=3.6.0"],
+}
+
 
 project_root = os.path.abspath(os.path.dirname(__file__))
 
@@ -77,4 +82,5 @@ setup(
     keywords=" ".join(PACKAGE_KEYWORDS),
     packages=find_packages(include=[PACKAGE_NAME, PACKAGE_NAME + ".*"]),
     install_requires=INSTALLATION_REQUIREMENTS,
+    extras_require=EXTRAS_REQUIREMENTS,
 )
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+import importlib
+import sys
+
+import pytest
+
+from dnacentersdk.api import _API_WRAPPERS, DNACenterAPI
+
+
+def _make_api(version):
+    return DNACenterAPI(username="user", password="pass", version=version)
+
+
+def _loaded_wrapper_modules(package):
+    prefix = "dnacentersdk.api.{}.".format(package)
+    return {name for name in sys.modules if name.startswith(prefix)}
+
+
+def test_wrappers_are_created_on_first_access():
+    for name in _loaded_wrapper_modules("v2_3_5_3"):
+        sys.modules.pop(name)
+    api = _make_api("2.3.5.3")
+
+    assert "devices" not in vars(api)
+    assert _loaded_wrapper_modules("v2_3_5_3") == set()
+
+    devices = api.devices
+
+    assert type(devices).__name__ == "Devices"
+    assert type(devices).__module__ == "dnacentersdk.api.v2_3_5_3.devices"
+    assert vars(api)["devices"] is devices
+    assert api.devices is devices
+    assert _loaded_wrapper_modules("v2_3_5_3") == {"dnacentersdk.api.v2_3_5_3.devices"}
+    api.close()
+
+
+@pytest.mark.parametrize("version", sorted(_API_WRAPPERS))
+def test_every_registered_wrapper_can_be_created(version):
+    api = _make_api(version)
+
+    package = "dnacentersdk.api.v" + version.replace(".", "_")
+    for name, (module_name, class_name) in _API_WRAPPERS[version].items():
+        module = importlib.import_module("{}.{}".format(package, module_name))
+        wrapper = getattr(api, name)
+        assert isinstance(wrapper, getattr(module, class_name))
+        assert wrapper._session is api.session
+        assert name in dir(api)
+    api.close()
+
+
+def test_unknown_attribute_raises_attribute_error():
+    api = _make_api("3.1.6.0")
+
+    with pytest.raises(AttributeError):
+        api.platform_configuration
+    assert not hasattr(api, "not_an_api")
+    api.close()
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import io
+import json
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from dnacentersdk.api.async_api import AsyncDNACenterAPI
+from dnacentersdk.exceptions import ApiError
+from tests.mock.mock import HOST, get_free_port
+
+
+FILE_CONTENT = bytes(range(256)) * 400
+
+
+class AsyncMockHandler(BaseHTTPRequestHandler):
+    tokens = 0
+    responses = []
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body, headers=None):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        if self.path == "/dna/system/api/v1/auth/token":
+            type(self).tokens += 1
+            return self._reply(200, {"Token": "token-{}".format(self.tokens)})
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"null")
+        return self._reply(202, {"response": {"taskId": "1"}, "request": body})
+
+    def do_GET(self):
+        if self.path.startswith("/dna/intent/api/v1/file/"):
+            self.send_response(200)
+            self.send_header("Content-Disposition", 'attachment; filename="file.bin"')
+            self.send_header("Content-Length", str(len(FILE_CONTENT)))
+            self.end_headers()
+            self.wfile.write(FILE_CONTENT)
+            return
+        if self.path == "/dna/intent/api/v1/task/1":
+            return self._reply(200, {"response": {"id": "1", "endTime": 1}})
+        status, headers = (200, None)
+        if self.responses:
+            status, headers = self.responses.pop(0)
+            return self._reply(status, {"response": {"message": "error"}}, headers)
+        return self._reply(
+            status,
+            {
+                "response": [{"id": "1"}],
+                "path": self.path,
+                "token": self.headers.get("X-Auth-Token"),
+            },
+            headers,
+        )
+
+
+@pytest.fixture
+def base_url():
+    AsyncMockHandler.tokens = 0
+    AsyncMockHandler.responses = []
+    port = get_free_port()
+    server = HTTPServer((HOST, port), AsyncMockHandler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://{}:{}".format(HOST, port)
+    server.shutdown()
+    server.server_close()
+
+
+def _run(base_url, coro_fn, **kwargs):
+    async def main():
+        async with AsyncDNACenterAPI(
+            username="user",
+            password="pass",
+            base_url=base_url,
+            version="3.1.6.0",
+            verify=False,
+            **kwargs
+        ) as api:
+            return await coro_fn(api)
+
+    return asyncio.run(main())
+
+
+def test_api_calls_are_awaitable(base_url):
+    async def calls(api):
+        return await asyncio.gather(
+            api.devices.get_device_list(hostname="edge-1"),
+            api.devices.add_device(ipAddress=["10.0.0.1"]),
+            api.custom_caller.call_api("GET", "/dna/intent/api/v1/custom"),
+        )
+
+    devices, task, custom = _run(base_url, calls)
+
+    assert devices.response[0].id == "1"
+    assert devices.path == "/dna/intent/api/v1/network-device?hostname=edge-1"
+    assert devices.token == "token-1"
+    assert task.request.ipAddress == ["10.0.0.1"]
+    assert custom.path == "/dna/intent/api/v1/custom"
+    assert AsyncMockHandler.tokens == 1
+
+
+def test_expired_token_is_refreshed(base_url):
+    AsyncMockHandler.responses = [(401, None)]
+
+    result = _run(base_url, lambda api: api.devices.get_device_list())
+
+    assert result.token == "token-2"
+    assert AsyncMockHandler.tokens == 2
+
+
+def test_rate_limited_request_is_retried(base_url):
+    AsyncMockHandler.responses = [(429, {"Retry-After": "0"})]
+
+    with pytest.warns(Warning):
+        result = _run(
+            base_url, lambda api: api.devices.get_device_list(), wait_on_rate_limit=True
+        )
+
+    assert result.response[0].id == "1"
+
+
+def test_error_response_raises_api_error(base_url):
+    AsyncMockHandler.responses = [(500, None)]
+
+    with pytest.raises(ApiError):
+        _run(base_url, lambda api: api.devices.get_device_list())
+
+
+def test_download_streams_to_file_and_sink(base_url, tmp_path):
+    sink = io.BytesIO()
+    progress = []
+
+    async def download(api):
+        with api.session.download_options(
+            sink=sink,
+            chunk_size=4096,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        ):
+            return await api.file.download_a_file_by_file_id(
+                "1", save_file=True, dirpath=str(tmp_path)
+            )
+
+    result = _run(base_url, download)
+
+    assert result.filename == "file.bin"
+    assert (tmp_path / "file.bin").read_bytes() == FILE_CONTENT
+    assert sink.getvalue() == FILE_CONTENT
+    assert result.data == FILE_CONTENT
+    assert progress[-1] == (len(FILE_CONTENT), len(FILE_CONTENT))
+
+
+def test_operations_return_awaitable_futures(base_url):
+    async def operation(api):
+        with api.operations():
+            future = await api.compliance.run_compliance(deviceUuids=["uuid"])
+        return await future
+
+    task = _run(base_url, operation)
+
+    assert task == {"id": "1", "endTime": 1}
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+import json
+import threading
+
+from dnacentersdk.commands import (
+    COMMAND_ERROR,
+    CommandBatchRunner,
+    CommandOutput,
+    file_id_of,
+)
+from dnacentersdk.tasks import TaskWaiter
+
+
+class _Namespace(object):
+    def __init__(self, **methods):
+        self.__dict__.update(methods)
+
+
+class _Download(object):
+    def __init__(self, data):
+        self.data = data
+
+
+class FakeCommandRunnerAPI(object):
+    """Command Runner, task and file APIs whose tasks are done after two
+    status checks, and fail for the devices in `failing`. The devices in
+    `missing` are left out of the results files."""
+
+    def __init__(self, failing=(), missing=()):
+        self.failing = set(failing)
+        self.missing = set(missing)
+        self.requests = []
+        self.checks = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self.command_runner = _Namespace(
+            run_read_only_commands_on_devices=self.run_read_only_commands_on_devices
+        )
+        self.task = _Namespace(get_task_by_id=self.get_task_by_id)
+        self.file = _Namespace(download_a_file_by_file_id=self.download)
+
+    def run_read_only_commands_on_devices(self, commands=None, deviceUuids=None):
+        with self._lock:
+            task_id = "task-{}".format(len(self.requests))
+            self.requests.append((deviceUuids, commands))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return {"response": {"taskId": task_id, "url": "/task/" + task_id}}
+
+    def get_task_by_id(self, task_id):
+        devices, _ = self.requests[int(task_id.split("-")[1])]
+        with self._lock:
+            self.checks[task_id] = self.checks.get(task_id, 0) + 1
+            done = self.checks[task_id] >= 2
+        task = {"id": task_id, "progress": "CLI Runner request creation"}
+        if done:
+            task["endTime"] = 1
+            if self.failing & set(devices):
+                with self._lock:
+                    self.in_flight -= 1
+                task["isError"] = True
+                task["failureReason"] = "Device unreachable"
+            else:
+                task["progress"] = json.dumps({"fileId": "file-" + task_id})
+        return {"response": task}
+
+    def download(self, file_id):
+        devices, commands = self.requests[int(file_id.split("-")[2])]
+        with self._lock:
+            self.in_flight -= 1
+        results = [
+            {
+                "deviceUuid": device,
+                "commandResponses": {
+                    "SUCCESS": {
+                        command: device + " " + command for command in commands
+                    },
+                    "FAILURE": {},
+                    "BLACKLISTED": {},
+                },
+            }
+            for device in devices
+            if device not in self.missing
+        ]
+        return _Download(json.dumps(results).encode("utf-8"))
+
+
+def test_file_id_of():
+    assert file_id_of({"progress": '{"fileId": "f1"}'}) == "f1"
+    assert file_id_of({"additionalStatusURL": "/api/v1/file/f2"}) == "f2"
+    assert file_id_of({"progress": "CLI Runner request creation"}) is None
+
+
+def test_batches():
+    runner = CommandBatchRunner(
+        FakeCommandRunnerAPI(), batch_size=2, max_commands=2, waiter=object()
+    )
+
+    assert runner.batches(["d1", "d2", "d3"], ["a", "b", "c"]) == [
+        (["d1", "d2"], ["a", "b"]),
+        (["d3"], ["a", "b"]),
+        (["d1", "d2"], ["c"]),
+        (["d3"], ["c"]),
+    ]
+
+
+def test_run_streams_the_outputs_of_every_device_and_command():
+    api = FakeCommandRunnerAPI(failing={"d4"})
+    waiter = TaskWaiter(api, interval=0.001, max_interval=0.001)
+    runner = CommandBatchRunner(api, batch_size=2, workers=2, waiter=waiter)
+    devices = ["d{}".format(i) for i in range(7)]
+
+    outputs = list(runner.run(devices, ["show version", "show clock"]))
+
+    assert len(api.requests) == 4
+    assert api.max_in_flight == 2
+    failed = [output for output in outputs if output.status == COMMAND_ERROR]
+    assert sorted(output[:2] for output in failed) == [
+        ("d4", "show clock"),
+        ("d4", "show version"),
+        ("d5", "show clock"),
+        ("d5", "show version"),
+    ]
+    assert all("Device unreachable" in output.output for output in failed)
+    assert sorted(set(outputs) - set(failed)) == sorted(
+        CommandOutput(device, command, "SUCCESS", device + " " + command)
+        for device in devices
+        if device not in ("d4", "d5")
+        for command in ("show version", "show clock")
+    )
+
+
+def test_run_reports_the_devices_missing_from_the_results():
+    api = FakeCommandRunnerAPI(missing={"d1"})
+    waiter = TaskWaiter(api, interval=0.001, max_interval=0.001)
+    runner = CommandBatchRunner(api, waiter=waiter)
+
+    outputs = list(runner.run(["d0", "d1"], ["show version"]))
+
+    assert sorted(outputs) == [
+        CommandOutput("d0", "show version", "SUCCESS", "d0 show version"),
+        CommandOutput(
+            "d1",
+            "show version",
+            COMMAND_ERROR,
+            "No result in the results file file-task-0",
+        ),
+    ]
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+from unittest.mock import patch
+
+import requests
+
+from dnacentersdk.restsession import RestSession
+from dnacentersdk.utils import RequestInfo, ResponseInfo
+
+
+def _response(content, content_type="application/json", headers=None):
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response.headers["Content-Type"] = content_type
+    response.headers.update(headers or {})
+    response._content = content
+    response._content_consumed = True
+    response.request = requests.Request("GET", "https://dnac/").prepare()
+    return response
+
+
+def _session(**kwargs):
+    return RestSession(
+        get_access_token=lambda: "secret-token",
+        base_url="https://dnac",
+        version="3.1.6.0",
+        user_agent="dnacentersdk",
+        **kwargs
+    )
+
+
+def test_request_info_redacts_the_token():
+    info = RequestInfo(
+        "https://dnac/dna/intent/api/v1/site",
+        "POST",
+        {"X-Auth-Token": "secret-token", "Content-type": "application/json"},
+        headers={"x-auth-token": "other-token"},
+        json={"name": "site"},
+    )
+
+    text = str(info)
+    assert "secret-token" not in text and "other-token" not in text
+    assert info.to_dict()["headers"]["X-Auth-Token"] == "<redacted>"
+    assert json.loads(info.to_dict()["body"]) == {"name": "site"}
+
+
+def test_request_info_truncates_the_body():
+    info = RequestInfo("https://dnac/", "POST", {}, body_limit=10, data=b"x" * 25)
+
+    assert info.to_dict()["body"] == "x" * 10 + "... [15 bytes truncated]"
+
+
+def test_response_info_pretty_prints_small_json_bodies():
+    info = ResponseInfo(_response(b'{"response": [1]}'))
+
+    assert json.loads(info.body) == {"response": [1]}
+    assert "Status: 200 - OK" in str(info)
+
+
+def test_response_info_truncates_large_bodies_without_parsing_them():
+    content = json.dumps({"response": list(range(1000))}).encode("utf-8")
+    info = ResponseInfo(_response(content), body_limit=20)
+
+    with patch("dnacentersdk.utils.json.loads") as loads:
+        body = info.body
+    loads.assert_not_called()
+    assert body == content[:20].decode("utf-8") + "... [{} bytes truncated]".format(
+        len(content) - 20
+    )
+
+
+def test_response_info_does_not_read_streamed_responses():
+    response = _response(False, content_type="application/octet-stream")
+
+    assert ResponseInfo(response).body is None
+    assert response._content is False
+
+
+def test_session_does_not_format_records_when_debug_is_off():
+    session = _session()
+    logging.getLogger("dnacentersdk.restsession").setLevel(logging.INFO)
+
+    with patch.object(
+        session._req_session, "request", return_value=_response(b"{}")
+    ), patch.object(RequestInfo, "__str__") as request_str, patch.object(
+        ResponseInfo, "__str__"
+    ) as response_str:
+        session.get("/dna/intent/api/v1/site")
+
+    request_str.assert_not_called()
+    response_str.assert_not_called()
+
+
+def test_session_logs_records_when_debug_is_on(caplog):
+    session = _session(debug=True)
+
+    with patch.object(
+        session._req_session, "request", return_value=_response(b'{"response": 1}')
+    ), caplog.at_level(logging.DEBUG, logger="dnacentersdk.restsession"):
+        session.get("/dna/intent/api/v1/site")
+
+    records = [
+        record.msg
+        for record in caplog.records
+        if isinstance(record.msg, (RequestInfo, ResponseInfo))
+    ]
+    assert [type(record) for record in records] == [RequestInfo, ResponseInfo]
+    assert records[0].to_dict()["url"] == "https://dnac/dna/intent/api/v1/site"
+    assert "secret-token" not in caplog.text
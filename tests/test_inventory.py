@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from dnacentersdk.inventory import InventorySync, device_fingerprint
+
+
+class FakeDevices(object):
+    """Devices list and count endpoints over an inventory."""
+
+    def __init__(self, count, nulls_first=False):
+        self.nulls_first = nulls_first
+        self.devices = {
+            "d{:02}".format(i): {
+                "id": "d{:02}".format(i),
+                "hostname": "switch{}".format(i),
+                "lastUpdateTime": 1000 + i,
+                "resyncEndTime": 1000 + i,
+                "upTime": "1 day",
+            }
+            for i in range(count)
+        }
+        self.requests = []
+
+    def update(self, device_id, time, **fields):
+        self.devices[device_id].update(
+            lastUpdateTime=time, resyncEndTime=time, **fields
+        )
+
+    def get_device_list(self, offset=None, limit=None, **kwargs):
+        """Returns list of network devices.
+
+        Args:
+            offset(int): offset query parameter. offset >= 1 [X gives results from Xth device onwards].
+            limit(int): limit query parameter. The number of records to show for this page. Min: 1, Max: 500.
+        """
+        return self.retrieve_network_devices(offset=offset, limit=limit)
+
+    def retrieve_network_devices(
+        self, offset=None, limit=None, sort_by=None, order=None, views=None
+    ):
+        """Retrieve Network Devices.
+
+        Args:
+            offset(int): offset query parameter. The first record to show for this page; the first record is numbered 1. Minimum value is 1.
+            limit(int): limit query parameter. The number of records to show for this page. Minimum value is 1. Maximum value is 500.
+            sort_by(str): sortBy query parameter.
+            order(str): order query parameter.
+        """
+        self.requests.append((offset, sort_by))
+        devices = sorted(self.devices.values(), key=lambda d: d["id"])
+        if sort_by:
+            devices.sort(
+                key=lambda d: (
+                    (d[sort_by] is None) == self.nulls_first,
+                    d[sort_by] or 0,
+                ),
+                reverse=order == "desc",
+            )
+        return {"response": [dict(d) for d in devices[offset - 1 : offset - 1 + limit]]}
+
+    def count_the_number_of_network_devices(self, views=None):
+        return {"response": len(self.devices)}
+
+    def get_device_count(self, **kwargs):
+        return {"response": len(self.devices)}
+
+
+def test_device_fingerprint():
+    assert device_fingerprint({"lastUpdateTime": 1, "upTime": "1"}) == (
+        "lastUpdateTime=1"
+    )
+    assert device_fingerprint({"id": "1", "upTime": "1"}) == device_fingerprint(
+        {"id": "1", "upTime": "2"}
+    )
+    assert device_fingerprint({"id": "1"}) != device_fingerprint({"id": "2"})
+
+
+def test_full_refreshes_find_the_deltas(tmp_path):
+    path = str(tmp_path / "inventory.db")
+    api = FakeDevices(12)
+    sync = InventorySync(api.get_device_list, path, page_size=5)
+
+    delta = sync.refresh()
+    assert len(delta.added) == 12 and not delta.changed and not delta.removed
+
+    api.update("d03", 2000, hostname="renamed")
+    del api.devices["d11"]
+    api.devices["d12"] = {"id": "d12", "lastUpdateTime": 2000}
+    delta = sync.refresh()
+    sync.close()
+
+    assert [device["id"] for device in delta.added] == ["d12"]
+    assert [device["hostname"] for device in delta.changed] == ["renamed"]
+    assert [device["id"] for device in delta.removed] == ["d11"]
+
+    # The snapshot persists and unchanged pages are skipped
+    sync = InventorySync(api.get_device_list, path, page_size=5)
+    compared = []
+    sync._compare = lambda device, *args: compared.append(device["id"])
+    assert sync.refresh() == ([], [], [])
+    assert compared == []
+    assert len(list(sync.devices())) == 12
+
+
+def test_incremental_refreshes_request_the_changed_devices(tmp_path):
+    api = FakeDevices(12)
+    sync = InventorySync(
+        api.retrieve_network_devices,
+        str(tmp_path / "inventory.db"),
+        count=api.count_the_number_of_network_devices,
+        changed_by="resyncEndTime",
+        page_size=5,
+    )
+    sync.refresh()
+
+    api.update("d02", 2000, hostname="renamed")
+    api.devices["d12"] = {"id": "d12", "resyncEndTime": 2001}
+    api.requests = []
+    delta = sync.refresh()
+
+    assert api.requests == [(1, "resyncEndTime")]
+    assert [device["id"] for device in delta.added] == ["d12"]
+    assert [device["id"] for device in delta.changed] == ["d02"]
+
+    # A removed device is not in the changed devices: full refresh
+    del api.devices["d05"]
+    api.requests = []
+    delta = sync.refresh()
+
+    assert api.requests[0] == (1, "resyncEndTime")
+    assert [offset for offset, sort_by in api.requests[1:]] == [1, 6, 11]
+    assert [device["id"] for device in delta.removed] == ["d05"]
+    assert not delta.added and not delta.changed
+
+
+def test_every_full_every_refresh_is_a_full_one(tmp_path):
+    api = FakeDevices(4)
+    sync = InventorySync(
+        api.retrieve_network_devices,
+        str(tmp_path / "inventory.db"),
+        count=api.count_the_number_of_network_devices,
+        changed_by="resyncEndTime",
+        full_every=2,
+    )
+    sync.refresh()
+
+    # A device not resynced yet replaces a removed one: the count matches
+    # the snapshot, and the incremental refresh misses both
+    del api.devices["d01"]
+    api.devices["d04"] = {"id": "d04", "resyncEndTime": None}
+    assert sync.refresh() == ([], [], [])
+
+    api.requests = []
+    delta = sync.refresh()
+    assert {sort_by for offset, sort_by in api.requests} == {None}
+    assert [device["id"] for device in delta.added] == ["d04"]
+    assert [device["id"] for device in delta.removed] == ["d01"]
+
+
+def test_incremental_refreshes_need_sorting_and_a_count(tmp_path):
+    api = FakeDevices(1)
+    path = str(tmp_path / "inventory.db")
+
+    with pytest.raises(ValueError):
+        InventorySync(api.get_device_list, path, changed_by="resyncEndTime")
+    with pytest.raises(ValueError):
+        InventorySync(api.retrieve_network_devices, path, changed_by="resyncEndTime")
+
+
+def test_devices_without_a_changed_by_value_do_not_end_the_scan(tmp_path):
+    # The controller sorts the null values first in descending order
+    api = FakeDevices(4, nulls_first=True)
+    api.devices["d00"]["resyncEndTime"] = None
+    sync = InventorySync(
+        api.retrieve_network_devices,
+        str(tmp_path / "inventory.db"),
+        count=api.count_the_number_of_network_devices,
+        changed_by="resyncEndTime",
+    )
+    sync.refresh()
+
+    api.update("d02", 2000, hostname="renamed")
+    api.requests = []
+    delta = sync.refresh()
+
+    assert api.requests == [(1, "resyncEndTime")]
+    assert [device["id"] for device in delta.changed] == ["d02"]
+    assert not delta.added and not delta.removed
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+import json
+from collections import OrderedDict
+from unittest.mock import patch
+
+import pytest
+import requests
+
+import dnacentersdk.utils
+from dnacentersdk.restsession import RestSession
+from dnacentersdk.utils import extract_and_parse_json, json_decoder_loads
+
+
+def _response(content):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response._content = content
+    response.request = requests.Request("GET", "https://dnac/").prepare()
+    return response
+
+
+@pytest.mark.parametrize("json_decoder", ["auto", "json", "orjson"])
+def test_decoders_parse_bytes_to_plain_dicts(json_decoder):
+    pytest.importorskip("orjson")
+    content = '{"response": [{"hostname": "swé", "id": 1}], "version": "1.0"}'
+
+    data = extract_and_parse_json(
+        _response(content.encode("utf-8")), json_decoder_loads(json_decoder)
+    )
+
+    assert data == json.loads(content)
+    assert type(data) is dict and type(data["response"][0]) is dict
+    assert list(data) == ["response", "version"]
+
+
+def test_ordered_decoder_and_callables():
+    content = b'{"b": 1, "a": {"c": 2}}'
+
+    data = extract_and_parse_json(_response(content), json_decoder_loads("ordered"))
+    assert type(data) is OrderedDict and type(data["a"]) is OrderedDict
+
+    loads = lambda content: {"raw": content}
+    assert extract_and_parse_json(_response(content), json_decoder_loads(loads)) == {
+        "raw": content
+    }
+
+
+@pytest.mark.parametrize("content", [b"", b"  \n"])
+def test_empty_content_is_none(content):
+    assert extract_and_parse_json(_response(content)) is None
+
+
+def test_unknown_or_missing_decoders_are_rejected():
+    with pytest.raises(ValueError):
+        json_decoder_loads("simdjson")
+    with patch.object(dnacentersdk.utils, "orjson", None):
+        assert json_decoder_loads("auto") is json.loads
+        with pytest.raises(ImportError):
+            json_decoder_loads("orjson")
+
+
+def test_session_uses_its_decoder():
+    calls = []
+
+    def loads(content):
+        calls.append(content)
+        return json.loads(content)
+
+    session = RestSession(
+        get_access_token=lambda: "token",
+        base_url="https://dnac",
+        version="3.1.6.0",
+        user_agent="dnacentersdk",
+        json_decoder=loads,
+    )
+
+    with patch.object(
+        session._req_session, "request", return_value=_response(b'{"response": []}')
+    ):
+        assert session.get("/dna/intent/api/v1/network-device") == {"response": []}
+    assert calls == [b'{"response": []}']
+    assert session.json_decoder is loads
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from dnacentersdk.exceptions import ApiError
+from dnacentersdk.metrics import (
+    MetricsAggregator,
+    MetricsHook,
+    RequestMetrics,
+    prometheus_text,
+    serve_prometheus,
+)
+from dnacentersdk.restsession import RestSession
+from dnacentersdk.retry import RetryPolicy
+from dnacentersdk.utils import apply_path_params
+
+
+def _response(status_code, content=b'{"response": {}}'):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers["Content-Type"] = "application/json"
+    response._content = content
+    response._content_consumed = True
+    response.request = requests.Request("GET", "https://dnac/").prepare()
+    return response
+
+
+def _session(**kwargs):
+    return RestSession(
+        get_access_token=lambda: "token",
+        base_url="https://dnac",
+        version="3.1.6.0",
+        user_agent="dnacentersdk",
+        **kwargs
+    )
+
+
+def _metrics(latency, status_code=200, ttfb=0.01):
+    return RequestMetrics(
+        "GET", "/dna/intent/api/v1/network-device", status_code, 0, 10, ttfb,
+        latency, 0, 0.0, None,
+    )
+
+
+def test_aggregator_histograms_and_slowest():
+    metrics = MetricsAggregator(buckets=(0.1, 1))
+    for latency in (0.05, 0.5, 2):
+        metrics.request_started(None)
+        metrics.request_finished(_metrics(latency))
+    metrics.request_started(None)
+    metrics.request_finished(_metrics(3, status_code=None, ttfb=None))
+
+    endpoints = metrics.endpoints()
+    ok = endpoints[("GET", "/dna/intent/api/v1/network-device", "200")]
+    assert ok.latency.cumulative_counts() == [1, 2, 3]
+    assert ok.ttfb.count == 3
+    assert ok.bytes_in == 30
+    assert endpoints[("GET", "/dna/intent/api/v1/network-device", "error")].ttfb.count == 0
+    assert metrics.in_flight == 0
+    assert metrics.slowest(1) == [
+        ("GET", "/dna/intent/api/v1/network-device", "error", 3.0)
+    ]
+
+    metrics.reset()
+    assert metrics.endpoints() == {}
+
+
+def test_prometheus_text():
+    metrics = MetricsAggregator(buckets=(0.1, 1))
+    metrics.request_finished(_metrics(0.5))
+
+    text = prometheus_text(metrics, prefix="dnac")
+
+    labels = 'method="GET",endpoint="/dna/intent/api/v1/network-device",status="200"'
+    assert "# TYPE dnac_request_duration_seconds histogram" in text
+    assert 'dnac_request_duration_seconds_bucket{%s,le="0.1"} 0' % labels in text
+    assert 'dnac_request_duration_seconds_bucket{%s,le="+Inf"} 1' % labels in text
+    assert "dnac_request_duration_seconds_count{%s} 1" % labels in text
+    assert "dnac_request_bytes_received_total{%s} 10" % labels in text
+    assert "dnac_requests_in_flight -1" in text
+
+
+def test_session_reports_endpoint_template_retries_and_status():
+    metrics = MetricsAggregator()
+    session = _session(
+        retry_policy=RetryPolicy(backoff_factor=0), metrics_hook=metrics
+    )
+    url = apply_path_params(
+        "/dna/intent/api/v1/network-device/{id}", {"id": "1234"}
+    )
+
+    with patch.object(
+        session._req_session,
+        "request",
+        side_effect=[_response(503), _response(200)],
+    ):
+        session.get(url)
+
+    (key, endpoint), = metrics.endpoints().items()
+    assert key == ("GET", "/dna/intent/api/v1/network-device/{id}", "200")
+    assert endpoint.retries == 1
+    assert endpoint.bytes_in == len(b'{"response": {}}')
+    assert metrics.in_flight == 0
+
+
+def test_session_reports_failed_requests():
+    hook = MetricsHook()
+    finished = []
+    hook.request_finished = finished.append
+    session = _session(metrics_hook=hook)
+
+    with patch.object(session._req_session, "request", return_value=_response(404)):
+        with pytest.raises(ApiError):
+            session.get("/dna/intent/api/v1/site")
+
+    assert finished[0].url_template == "/dna/intent/api/v1/site"
+    assert finished[0].status_code == 404
+    assert isinstance(finished[0].exception, ApiError)
+
+
+def test_serve_prometheus():
+    metrics = MetricsAggregator()
+    metrics.request_finished(_metrics(0.5))
+    server = serve_prometheus(metrics, port=0)
+    try:
+        url = "http://127.0.0.1:{}/metrics".format(server.server_address[1])
+        with urllib.request.urlopen(url) as response:
+            body = response.read().decode("utf-8")
+    finally:
+        server.shutdown()
+
+    assert body == prometheus_text(metrics)
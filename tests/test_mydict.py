@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+import json
+import pickle
+
+from dnacentersdk.models.mydict import MyDict, MyList, mydict_data_factory
+
+
+def _data():
+    return {
+        "response": [{"id": "1", "interface": {"name": "Gi1/0/1"}}, {"id": "2"}],
+        "version": "1.0",
+    }
+
+
+def test_nested_containers_are_wrapped_when_accessed():
+    data = _data()
+    result = mydict_data_factory("devices", data)
+
+    assert dict.__getitem__(result, "response") is data["response"]
+    assert isinstance(result.response, MyList)
+    assert result.response[0].interface.name == "Gi1/0/1"
+    assert result["response"][0]["interface"].name == "Gi1/0/1"
+    assert [device.id for device in result.response] == ["1", "2"]
+    assert result.get("response.0") is None
+    assert result.has_path("version") and not result.has_path("count")
+    assert result == data
+
+
+def test_get_dict_and_to_json_do_not_copy_untouched_members():
+    data = _data()
+    result = mydict_data_factory("devices", data)
+    result.response[0].interface.speed = 1000
+
+    plain = result.get_dict()
+
+    assert type(plain) is dict and type(plain["response"][0]["interface"]) is dict
+    assert plain["response"][0]["interface"] == {"name": "Gi1/0/1", "speed": 1000}
+    assert plain["response"][1] is data["response"][1]
+    assert json.loads(result.to_json()) == plain
+    assert mydict_data_factory("devices", {"version": "1.0"}).get_dict()["version"] == "1.0"
+
+
+def test_assigned_members_and_list_responses():
+    result = MyDict()
+    result.foo = {"bar": [{"baz": 1}]}
+
+    assert result.foo.bar[0].baz == 1
+    assert result.has_path("foo.bar")
+    assert all(isinstance(value, MyDict) for value in result.values())
+    assert mydict_data_factory("list", [{"a": 1}])[0].a == 1
+    assert mydict_data_factory("empty", None) == {}
+
+
+def test_pickle():
+    result = mydict_data_factory("devices", _data())
+
+    assert pickle.loads(pickle.dumps(result)) == _data()
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+
+import random
+import threading
+import time
+
+import pytest
+
+from dnacentersdk.api.v3_1_6_0.devices import Devices
+from dnacentersdk.api.v3_1_6_0.sda import Sda
+from dnacentersdk.models.mydict import mydict_data_factory
+from dnacentersdk.pagination import (
+    PaginationInfo,
+    Paginator,
+    PrefetchPaginator,
+    count_method,
+    paginate,
+    pagination_info,
+    prefetch,
+    total_count,
+)
+
+
+class FakeEndpoint(object):
+    """Serves `records` like an offset/limit endpoint of the given base."""
+
+    def __init__(self, records, offset_base=1, max_page_size=None, server_cap=None):
+        self.records = records
+        self.offset_base = offset_base
+        self.max_page_size = max_page_size
+        self.server_cap = server_cap
+        self.calls = []
+
+    def __call__(self, family=None, offset=None, limit=None):
+        self.calls.append((family, offset, limit))
+        assert offset >= self.offset_base
+        if self.max_page_size is not None:
+            assert limit <= self.max_page_size
+        start = offset - self.offset_base
+        limit = min(limit, self.server_cap or limit)
+        return mydict_data_factory(
+            "list", {"response": self.records[start:start + limit], "version": "1.0"}
+        )
+
+
+def zero_based_method(offset=None, limit=None):
+    """Get records.
+
+    Args:
+        offset(int): offset query parameter. Record offset to start data
+            fetch at. Offset starts at zero.
+        limit(int): limit query parameter. The number of records to show for
+            this page. Min: 1, Max: 3.
+    """
+
+
+def test_pagination_info_is_read_from_the_documentation():
+    assert pagination_info(Devices.get_device_list) == PaginationInfo(1, 500, False)
+    assert pagination_info(zero_based_method) == PaginationInfo(0, 3, False)
+    assert pagination_info(lambda: None) == PaginationInfo(None, None, False)
+    # The offset base of the SDA endpoints is not documented
+    assert pagination_info(Sda.get_anycast_gateways) == PaginationInfo(
+        None, 500, False
+    )
+
+
+@pytest.mark.parametrize("offset_base", [0, 1])
+@pytest.mark.parametrize(
+    "count, offsets", [(0, [0]), (1, [0, 1]), (6, [0, 3, 6]), (7, [0, 3, 6])]
+)
+def test_paginator_yields_every_record_once(offset_base, count, offsets):
+    endpoint = FakeEndpoint(list(range(count)), offset_base, max_page_size=3)
+
+    items = list(Paginator(endpoint, page_size=3, offset_base=offset_base)(family="x"))
+
+    assert items == list(range(count))
+    assert [call[1] for call in endpoint.calls] == [
+        offset_base + offset for offset in offsets
+    ]
+
+
+def test_paginator_follows_the_page_size_of_the_server():
+    endpoint = FakeEndpoint(list(range(12)), server_cap=5)
+
+    items = list(Paginator(endpoint, page_size=10, offset_base=1)())
+
+    assert items == list(range(12))
+    assert [call[1] for call in endpoint.calls] == [1, 6, 11]
+
+
+def test_paginator_is_lazy_and_uses_the_documented_limits():
+    endpoint = FakeEndpoint([{"id": i} for i in range(10)], offset_base=0)
+    endpoint.__doc__ = zero_based_method.__doc__
+    items = paginate(endpoint, offset=5, limit=1)
+
+    assert endpoint.calls == []
+    assert next(items).id == 0
+    assert endpoint.calls == [(None, 0, 3)]
+    assert [item.id for item in items] == list(range(1, 10))
+
+
+def test_paginator_counts_pages_for_page_offsets():
+    def method(offset=None, limit=None):
+        """Get records.
+
+        Args:
+            offset(int): offset query parameter. The page offset for the
+                response. E.g. if limit=100, offset=0 will return first 100
+                records, offset=1 will return next 100 records, etc.
+        """
+        return [offset] * limit if offset < 2 else []
+
+    paginator = Paginator(method, page_size=2)
+
+    assert list(paginator.pages()) == [[0, 0], [1, 1]]
+
+
+def test_paginator_rejects_invalid_settings():
+    with pytest.raises(ValueError):
+        Paginator(zero_based_method, page_size=0)
+    with pytest.raises(ValueError):
+        Paginator(zero_based_method, offset_base=2)
+
+
+def test_paginator_needs_the_undocumented_settings():
+    endpoint = FakeEndpoint([])
+
+    with pytest.raises(ValueError, match="pass offset_base"):
+        Paginator(endpoint, page_size=10)
+    with pytest.raises(ValueError, match="pass page_size"):
+        Paginator(endpoint, offset_base=1)
+    assert Paginator(endpoint, page_size=10, offset_base=1).page_size == 10
+
+
+class FakeDevices(object):
+    """Devices wrapper whose list endpoint answers slowly and out of order."""
+
+    def __init__(self, count, added=0, server_cap=None):
+        self.records = list(range(count))
+        self.added = added
+        self.server_cap = server_cap
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.count_calls = []
+        self.lock = threading.Lock()
+
+    def get_device_list(self, family=None, offset=None, limit=None, **kwargs):
+        """Returns list of network devices.
+
+        Args:
+            offset(int): offset query parameter. offset >= 1 [X gives results from Xth device onwards].
+            limit(int): limit query parameter. The number of records to show for this page. Min: 1, Max: 500.
+        """
+        limit = min(limit, self.server_cap or limit)
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(random.uniform(0, 0.01))
+        with self.lock:
+            self.in_flight -= 1
+        return {"response": self.records[offset - 1:offset - 1 + limit]}
+
+    def get_device_count(self, family=None, hostname=None):
+        self.count_calls.append(family)
+        count = len(self.records)
+        self.records += list(range(count, count + self.added))
+        return {"response": count, "version": "1.0"}
+
+
+def test_count_methods_and_counts():
+    devices = FakeDevices(0)
+
+    assert count_method(devices.get_device_list) == devices.get_device_count
+    assert count_method(devices.get_device_count) is None
+    assert total_count({"response": 3}) == 3
+    assert total_count({"response": {"count": 4}}) == 4
+    with pytest.raises(ValueError):
+        total_count({"response": []})
+
+
+@pytest.mark.parametrize("count", [0, 5, 95, 100])
+def test_prefetch_yields_pages_in_order_with_bounded_concurrency(count):
+    devices = FakeDevices(count)
+
+    paginator = PrefetchPaginator(devices.get_device_list, page_size=5, workers=3)
+    items = list(paginator(family="Switches and Hubs", hostname_filter="x"))
+
+    assert items == list(range(count))
+    assert devices.count_calls == ["Switches and Hubs"]
+    assert devices.max_in_flight <= 3
+
+
+def test_prefetch_follows_the_page_size_of_the_server():
+    devices = FakeDevices(23, server_cap=4)
+
+    items = list(PrefetchPaginator(devices.get_device_list, page_size=10)())
+
+    assert items == list(range(23))
+
+
+def test_prefetch_gets_records_added_after_the_count():
+    devices = FakeDevices(10, added=7)
+
+    items = list(prefetch(devices.get_device_list))
+
+    assert items == list(range(17))
+
+
+def test_prefetch_needs_a_count_method():
+    with pytest.raises(ValueError):
+        PrefetchPaginator(zero_based_method)
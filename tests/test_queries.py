@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+
+from dnacentersdk.api.v3_1_6_0.sites import Sites
+from dnacentersdk.exceptions import ApiError
+from dnacentersdk.queries import (
+    AsyncQueryRunner,
+    QueryRunner,
+    query_pairs,
+    result_method,
+)
+
+
+class FakeSites(object):
+    """Assurance queries over 7 sites, whose results are ready after two
+    polls."""
+
+    def __init__(self, rows=7, polls=2):
+        self.sites = [{"id": str(i)} for i in range(rows)]
+        self.polls = polls
+        self.tasks = {}
+        self.submissions = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def submit_request_to_query_sites_energy(
+        self, startTime=None, page=None, headers=None, **request_parameters
+    ):
+        with self._lock:
+            task_id = str(len(self.submissions))
+            self.submissions.append(page)
+            self.tasks[task_id] = page
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return {"response": {"taskId": task_id, "taskLocation": "/" + task_id}}
+
+    def query_sites_energy_for_the_given_task_id(self, task_id=None, headers=None):
+        page = self.tasks[task_id]
+        if page.setdefault("polls", 0) < self.polls:
+            page["polls"] += 1
+            if page["polls"] == 1:
+                raise ApiError(_not_found())
+            return {"version": "1.0"}
+        with self._lock:
+            self.in_flight -= 1
+        offset = page["offset"] - 1
+        return {
+            "response": self.sites[offset : offset + page["limit"]],
+            "page": dict(page, count=len(self.sites)),
+        }
+
+
+def _not_found():
+    response = requests.Response()
+    response.status_code = 404
+    response.reason = "Not Found"
+    response._content = b""
+    response._content_consumed = True
+    response.request = requests.Request("GET", "https://dnac/").prepare()
+    return response
+
+
+class AsyncFakeSites(FakeSites):
+    async def submit_request_to_query_sites_energy(self, page=None):
+        return super(AsyncFakeSites, self).submit_request_to_query_sites_energy(
+            page=page
+        )
+
+    async def query_sites_energy_for_the_given_task_id(self, task_id=None):
+        await asyncio.sleep(0)
+        return super(AsyncFakeSites, self).query_sites_energy_for_the_given_task_id(
+            task_id=task_id
+        )
+
+
+def test_query_pairs_of_the_assurance_apis():
+    pairs = query_pairs(Sites(None, None, None))
+
+    assert pairs["submit_request_to_query_sites_energy"] == (
+        "query_sites_energy_for_the_given_task_id"
+    )
+    assert pairs["submit_request_to_count_sites_energy_from_query"] == (
+        "count_sites_energy_for_the_given_task_id"
+    )
+    assert pairs["submit_request_for_site_analytics_summary_data"] == (
+        "get_site_analytics_summary_data_for_the_given_task_id"
+    )
+    sites = FakeSites()
+    assert result_method(sites.submit_request_to_query_sites_energy) == (
+        sites.query_sites_energy_for_the_given_task_id
+    )
+
+
+def test_rows_are_polled_and_paged():
+    sites = FakeSites()
+    runner = QueryRunner(page_size=3, interval=0.001, max_interval=0.001)
+
+    rows = list(runner.rows(sites.submit_request_to_query_sites_energy, startTime=1))
+
+    assert [row["id"] for row in rows] == [str(i) for i in range(7)]
+    assert [(page["offset"], page["limit"]) for page in sites.submissions] == [
+        (1, 3),
+        (4, 3),
+        (7, 3),
+    ]
+
+
+def test_rows_time_out():
+    sites = FakeSites(polls=1000)
+    runner = QueryRunner(interval=0.001, max_interval=0.001, timeout=0.05)
+
+    with pytest.raises(TimeoutError):
+        list(runner.rows(sites.submit_request_to_query_sites_energy))
+
+
+def test_stream_shares_the_concurrency_limit():
+    sites = FakeSites(rows=2)
+    runner = QueryRunner(concurrency=2, interval=0.001, max_interval=0.001)
+    queries = {
+        key: (sites.submit_request_to_query_sites_energy, dict(startTime=key))
+        for key in range(6)
+    }
+
+    rows = list(runner.stream(queries))
+
+    assert sorted((key, row["id"]) for key, row in rows) == [
+        (key, str(i)) for key in range(6) for i in range(2)
+    ]
+    assert sites.max_in_flight == 2
+
+
+def test_async_stream_shares_the_concurrency_limit():
+    sites = AsyncFakeSites(rows=4)
+
+    async def stream():
+        runner = AsyncQueryRunner(
+            concurrency=3, page_size=2, interval=0.001, max_interval=0.001
+        )
+        queries = {
+            key: (sites.submit_request_to_query_sites_energy, None)
+            for key in range(5)
+        }
+        return [row async for row in runner.stream(queries)]
+
+    rows = asyncio.run(stream())
+
+    assert len(rows) == 20
+    assert sites.max_in_flight == 3
+
+
+def test_stream_buffers_a_bounded_number_of_rows():
+    sites = FakeSites(rows=50)
+    runner = QueryRunner(
+        page_size=10, interval=0.001, max_interval=0.001, buffer_size=2
+    )
+    threads = set(threading.enumerate())
+    rows = runner.stream({"sites": (sites.submit_request_to_query_sites_energy, None)})
+
+    assert next(rows)[1]["id"] == "0"
+    time.sleep(0.1)
+    assert len(sites.submissions) < 5
+
+    # Closing the generator ends the query waiting for room in the buffer
+    rows.close()
+    deadline = time.monotonic() + 5
+    while set(threading.enumerate()) - threads and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not set(threading.enumerate()) - threads
+
+
+class FailingSites(FakeSites):
+    def submit_request_to_query_sites_energy(self, **kwargs):
+        time.sleep(0.1)
+        raise ValueError("Invalid query")
+
+
+def test_stream_abandons_the_polled_queries_after_an_error():
+    sites = FakeSites(polls=10**6)
+    runner = QueryRunner(interval=60, max_interval=60)
+    threads = set(threading.enumerate())
+    queries = {
+        "sites": (sites.submit_request_to_query_sites_energy, None),
+        "failing": (FailingSites().submit_request_to_query_sites_energy, None),
+    }
+
+    with pytest.raises(ValueError):
+        list(runner.stream(queries))
+
+    # The query waiting for its result stops polling
+    deadline = time.monotonic() + 5
+    while set(threading.enumerate()) - threads and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not set(threading.enumerate()) - threads
+    assert len(sites.submissions) == 1
+
+
+def test_async_stream_buffers_a_bounded_number_of_rows():
+    sites = AsyncFakeSites(rows=50)
+
+    async def stream():
+        runner = AsyncQueryRunner(
+            page_size=10, interval=0.001, max_interval=0.001, buffer_size=2
+        )
+        rows = runner.stream(
+            {"sites": (sites.submit_request_to_query_sites_energy, None)}
+        )
+        first = await rows.__anext__()
+        await asyncio.sleep(0.1)
+        await rows.aclose()
+        return first
+
+    assert asyncio.run(stream())[1]["id"] == "0"
+    assert len(sites.submissions) < 5
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from dnacentersdk.rate_limiter import RateLimiter, TokenBucket, url_template_pattern
+from dnacentersdk.restsession import RestSession
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_reserves_tokens_in_order():
+    clock = FakeClock()
+    bucket = TokenBucket(2, capacity=2, clock=clock)
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    clock.now += 1.5
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.5
+
+
+def test_token_bucket_rejects_non_positive_rates():
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+    with pytest.raises(TypeError):
+        TokenBucket("10")
+
+
+@pytest.mark.parametrize(
+    "template, path, matches",
+    [
+        ("/dna/intent/api/v1/network-device/{id}", "/dna/intent/api/v1/network-device/1", True),
+        ("/dna/intent/api/v1/network-device/{id}", "/dna/intent/api/v1/network-device/1/vlan", False),
+        ("/dna/intent/api/v1/network-device/{id}", "/dna/intent/api/v1/network-device", False),
+        ("/dna/intent/api/v1/network-device*", "/dna/intent/api/v1/network-device/1/vlan", True),
+        ("/dna/intent/api/v1/site", "/dna/intent/api/v1/site-health", False),
+    ],
+)
+def test_url_template_pattern(template, path, matches):
+    assert bool(url_template_pattern(template).match(path)) is matches
+
+
+def test_rate_limiter_applies_global_and_first_matching_endpoint_limit():
+    clock = FakeClock()
+    limiter = RateLimiter(
+        rate=10,
+        endpoint_limits={
+            "/dna/intent/api/v1/network-device/{id}": (1, 1),
+            "/dna/intent/api/v1/network-device*": 100,
+        },
+        clock=clock,
+    )
+    device_url = "https://dnac/dna/intent/api/v1/network-device/1?x=1"
+
+    assert limiter.url_template(device_url) == "/dna/intent/api/v1/network-device/{id}"
+    assert limiter.url_template("https://dnac/dna/intent/api/v1/site") is None
+    assert limiter.reserve("GET", device_url) == 0.0
+    assert limiter.reserve("GET", device_url) == pytest.approx(1.0)
+    assert limiter.reserve("GET", "https://dnac/dna/intent/api/v1/site") == 0.0
+
+
+def test_session_paces_requests():
+    response = Mock(status_code=200, headers={"Content-Type": "application/json"})
+    response.json.return_value = {}
+    session = RestSession(
+        get_access_token=lambda: "token",
+        base_url="https://dnac",
+        version="3.1.6.0",
+        user_agent="dnacentersdk",
+        rate_limiter=RateLimiter(rate=20, burst=1),
+    )
+
+    with patch.object(session._req_session, "request", return_value=response):
+        start = time.monotonic()
+        for _ in range(5):
+            session.get("/dna/intent/api/v1/network-device")
+
+    assert time.monotonic() - start >= 0.19
+    session.close()
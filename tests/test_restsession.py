@@ -22,10 +22,20 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import base64
+import io
+import json
 import logging
+import threading
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
 
 import dnacentersdk
+from dnacentersdk.connection_pool import PoolStatsHTTPAdapter
+import requests
 from dnacentersdk.restsession import RestSession
 import pytest
 from unittest.mock import Mock, patch
@@ -96,4 +106,328 @@ def test_lazy_authentication():
         assert auth_call_count == 1
         assert session._authenticated is True
         assert session._access_token == "mock-token-1"
-        assert mock_request.called
\ No newline at end of file
+        assert mock_request.called
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        time.sleep(0.05)
+        body = b'{"response": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def keep_alive_url():
+    server = ThreadingHTTPServer(("localhost", 0), KeepAliveHandler)
+    server.daemon_threads = True
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://localhost:{}".format(server.server_address[1])
+    server.shutdown()
+    server.server_close()
+
+
+def _pooled_session(base_url, **kwargs):
+    return RestSession(
+        get_access_token=lambda: "token",
+        base_url=base_url,
+        version="3.1.6.0",
+        user_agent="dnacentersdk",
+        **kwargs
+    )
+
+
+def test_pool_stats_count_reused_connections(keep_alive_url):
+    session = _pooled_session(keep_alive_url)
+
+    for _ in range(3):
+        session.get("/dna/intent/api/v1/network-device")
+
+    assert session.pool_stats == (1, 2, 0)
+    session.close()
+
+
+@pytest.mark.parametrize("pool_block, discards", [(False, True), (True, False)])
+def test_pool_stats_count_discarded_connections(keep_alive_url, pool_block, discards):
+    session = _pooled_session(keep_alive_url, pool_maxsize=1, pool_block=pool_block)
+
+    with ThreadPoolExecutor(4) as executor:
+        list(
+            executor.map(
+                lambda _: session.get("/dna/intent/api/v1/network-device"), range(8)
+            )
+        )
+
+    stats = session.pool_stats
+    assert stats.created + stats.reused == 8
+    assert (stats.discarded > 0) is discards
+    if pool_block:
+        assert stats.created == 1
+    session.close()
+
+
+def test_pool_stats_count_the_connections_the_pool_closes():
+    adapter = PoolStatsHTTPAdapter(pool_maxsize=1)
+    pool = adapter.poolmanager.connection_from_url("http://127.0.0.1:1")
+    connections = [pool._get_conn(), pool._get_conn()]
+
+    pool._put_conn(connections[0])
+    assert adapter.pool_stats.snapshot().discarded == 0
+    pool._put_conn(connections[1])
+    pool._put_conn(None)
+
+    assert adapter.pool_stats.snapshot() == (2, 0, 1)
+    adapter.close()
+
+
+def test_injected_session_is_not_mounted():
+    injected = requests.Session()
+    session = _pooled_session("https://httpbin.org", session=injected, pool_maxsize=50)
+
+    assert session._req_session is injected
+    assert injected.get_adapter("https://httpbin.org")._pool_maxsize == 10
+    assert session.pool_stats == (0, 0, 0)
+
+
+def _response(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers["Content-Type"] = "application/json"
+    response._content = b'{"response": {}}'
+    response.request = requests.Request("GET", "https://dnac/").prepare()
+    return response
+
+
+def _jwt(exp):
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode())
+    return "e30.{}.sig".format(payload.decode().rstrip("="))
+
+
+def test_concurrent_401_responses_refresh_the_token_once():
+    tokens = []
+    lock = threading.Lock()
+
+    def get_token():
+        time.sleep(0.05)
+        with lock:
+            tokens.append("token-{}".format(len(tokens) + 1))
+            return tokens[-1]
+
+    session = _pooled_session("https://dnac", session=requests.Session())
+    session._get_access_token = get_token
+    session._ensure_authenticated()
+
+    def request(method, url, **kwargs):
+        token = session._req_session.headers["X-Auth-Token"]
+        time.sleep(0.02)
+        return _response(401 if token == "token-1" else 200)
+
+    with patch.object(session._req_session, "request", side_effect=request):
+        with ThreadPoolExecutor(20) as executor:
+            results = list(executor.map(lambda _: session.get("/devices"), range(20)))
+
+    assert results == [{"response": {}}] * 20
+    assert tokens == ["token-1", "token-2"]
+
+
+def test_token_is_refreshed_before_it_expires():
+    tokens = [_jwt(time.time() + 30), _jwt(time.time() + 3600)]
+    session = _pooled_session(
+        "https://dnac", session=requests.Session(), token_refresh_margin=60
+    )
+    session._get_access_token = Mock(side_effect=tokens)
+
+    with patch.object(
+        session._req_session, "request", return_value=_response(200)
+    ) as mock_request:
+        session.get("/devices")
+        session.get("/devices")
+        session.get("/devices")
+
+    assert session._get_access_token.call_count == 2
+    assert session.access_token == tokens[1]
+    assert mock_request.call_count == 3
+
+
+def _download_response(content, headers=None):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers.update(headers or {})
+    response.headers["Content-Length"] = str(len(content))
+    response.raw = io.BytesIO(content)
+    response.request = requests.Request("GET", "https://dnac/").prepare()
+    return response
+
+
+def test_download_streams_to_file_without_buffering(tmp_path):
+    content = bytes(range(256)) * 1000
+    progress = []
+    session = _pooled_session("https://dnac", session=requests.Session())
+    response = _download_response(
+        content, {"Content-Disposition": 'attachment; filename="image.bin"'}
+    )
+
+    with patch.object(session._req_session, "request", return_value=response):
+        download = session.get(
+            "/dna/intent/api/v1/file/1",
+            stream=True,
+            save_file=True,
+            dirpath=str(tmp_path),
+            chunk_size=10000,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+    assert download.path == str(tmp_path / "image.bin")
+    assert (tmp_path / "image.bin").read_bytes() == content
+    assert download._collected_data is None
+    assert download.data == content
+    assert len(progress) == 26
+    assert progress[-1] == (len(content), len(content))
+
+
+def test_download_options_apply_to_downloads_in_the_block():
+    content = b"x" * 5000
+    sink = io.BytesIO()
+    session = _pooled_session("https://dnac", session=requests.Session())
+
+    with patch.object(
+        session._req_session, "request", return_value=_download_response(content)
+    ):
+        with session.download_options(sink=sink, chunk_size=1000):
+            download = session.get("/dna/intent/api/v1/file/1", stream=True)
+
+    assert sink.getvalue() == content
+    assert download.data == b""
+    with pytest.raises(TypeError):
+        with session.download_options(sinks=sink):
+            pass
+
+
+def test_download_buffers_in_memory_by_default():
+    content = b"config" * 1000
+    session = _pooled_session("https://dnac", session=requests.Session())
+
+    with patch.object(
+        session._req_session, "request", return_value=_download_response(content)
+    ):
+        download = session.get("/dna/intent/api/v1/file/1", stream=True)
+
+    assert download.data == content
+
+
+class _Body(io.BytesIO):
+    """Slowly read response body, counted by its server while open."""
+
+    def __init__(self, server, content):
+        super(_Body, self).__init__(content)
+        self.server = server
+        with server.lock:
+            server.open += 1
+            server.max_open = max(server.max_open, server.open)
+
+    def read(self, *args):
+        time.sleep(0.001)
+        return super(_Body, self).read(*args)
+
+    def close(self):
+        if not self.closed:
+            with self.server.lock:
+                self.server.open -= 1
+        super(_Body, self).close()
+
+
+class RangedServer(object):
+    """Serves a file by byte ranges, failing the ranges listed in `fail`."""
+
+    def __init__(self, content, fail=()):
+        self.content = content
+        self.fail = set(fail)
+        self.ranges = []
+        self.open = 0
+        self.max_open = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, method, url, headers=None, **kwargs):
+        requested = (headers or {}).get("Range")
+        headers = {
+            "Content-Disposition": 'attachment; filename="image.bin"',
+            "Accept-Ranges": "bytes",
+            "ETag": '"v1"',
+        }
+        if requested is None:
+            response = _download_response(self.content, headers)
+            response.raw = _Body(self, self.content)
+            return response
+        start, end = (int(i) for i in requested[len("bytes="):].split("-"))
+        with self.lock:
+            self.ranges.append(start)
+        if start in self.fail:
+            raise requests.ConnectionError("reset")
+        response = _download_response(self.content[start:end + 1], headers)
+        response.raw = _Body(self, self.content[start:end + 1])
+        response.status_code = 206
+        response.headers["Content-Range"] = "bytes {}-{}/{}".format(
+            start, end, len(self.content)
+        )
+        return response
+
+
+def test_ranged_download_fetches_segments_in_parallel(tmp_path):
+    content = bytes(range(256)) * 400
+    server = RangedServer(content)
+    session = _pooled_session("https://dnac", session=requests.Session())
+
+    with patch.object(session._req_session, "request", side_effect=server):
+        download = session.get(
+            "/dna/intent/api/v1/file/1",
+            stream=True,
+            save_file=True,
+            dirpath=str(tmp_path),
+            segments=4,
+            segment_size=10000,
+        )
+
+    assert sorted(server.ranges) == list(range(10000, len(content), 10000))
+    assert server.max_open == 4
+    assert (tmp_path / "image.bin").read_bytes() == content
+    assert download.data == content
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["image.bin"]
+
+
+def test_ranged_download_resumes_from_saved_segments(tmp_path):
+    content = bytes(range(256)) * 400
+    server = RangedServer(content, fail=[50000])
+    session = _pooled_session("https://dnac", session=requests.Session())
+
+    with patch.object(session._req_session, "request", side_effect=server):
+        with session.download_options(segments=2, segment_size=10000, resume=True):
+            with pytest.raises(dnacentersdk.exceptions.DownloadFailure):
+                session.get(
+                    "/dna/intent/api/v1/file/1",
+                    stream=True,
+                    save_file=True,
+                    dirpath=str(tmp_path),
+                )
+            assert (tmp_path / "image.bin.part").exists()
+
+            server.fail.clear()
+            server.ranges = []
+            session.get(
+                "/dna/intent/api/v1/file/1",
+                stream=True,
+                save_file=True,
+                dirpath=str(tmp_path),
+            )
+
+    assert server.ranges == [50000]
+    assert (tmp_path / "image.bin").read_bytes() == content
+    assert not (tmp_path / "image.bin.part.json").exists()
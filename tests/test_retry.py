@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from dnacentersdk.exceptions import ApiError, dnacentersdkException
+from dnacentersdk.restsession import RestSession
+from dnacentersdk.retry import RetryAttempt, RetryPolicy
+
+
+def _response(status_code, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers["Content-Type"] = "application/json"
+    response.headers.update(headers or {})
+    response._content = b'{"response": {}}'
+    response._content_consumed = True
+    response.request = requests.Request("GET", "https://dnac/").prepare()
+    return response
+
+
+def _session(**kwargs):
+    return RestSession(
+        get_access_token=lambda: "token",
+        base_url="https://dnac",
+        version="3.1.6.0",
+        user_agent="dnacentersdk",
+        **kwargs
+    )
+
+
+def test_backoff_doubles_up_to_max_backoff():
+    policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+
+    assert [policy.backoff(n) for n in range(1, 6)] == [0.5, 1, 2, 3, 3]
+
+
+def test_backoff_jitter_stays_below_the_backoff():
+    policy = RetryPolicy(backoff_factor=1)
+
+    assert all(0 <= policy.backoff(3) <= 4 for _ in range(100))
+
+
+@pytest.mark.parametrize(
+    "method, status_code, attempt, retried",
+    [
+        ("GET", 503, 1, True),
+        ("get", 502, 2, True),
+        ("GET", 503, 3, False),
+        ("GET", 500, 1, False),
+        ("PUT", 504, 1, True),
+        ("POST", 503, 1, False),
+    ],
+)
+def test_next_delay(method, status_code, attempt, retried):
+    policy = RetryPolicy(max_attempts=3, jitter=False)
+
+    delay = policy.next_delay(method, "/url", attempt, response=_response(status_code))
+
+    assert (delay is not None) is retried
+
+
+def test_next_delay_uses_retry_after_and_opt_in_for_post():
+    policy = RetryPolicy(retry_non_idempotent=True)
+
+    assert policy.next_delay("POST", "/url", 1, response=_response(503, {"Retry-After": "7"})) == 7
+    assert policy.next_delay("POST", "/url", 1, exception=requests.ConnectionError()) is not None
+
+
+def test_retry_after_is_capped_by_max_backoff():
+    policy = RetryPolicy(max_backoff=10)
+
+    assert policy.next_delay("GET", "/url", 1, response=_response(503, {"Retry-After": "3600"})) == 10
+    assert policy.next_delay("GET", "/url", 1, response=_response(503, {"Retry-After": "-5"})) == 0
+
+
+def test_session_retries_transient_errors_and_reports_attempts():
+    attempts = []
+    session = _session(
+        retry_policy=RetryPolicy(backoff_factor=0, on_attempt=attempts.append)
+    )
+    responses = [requests.ReadTimeout("timeout"), _response(503), _response(200)]
+
+    with patch.object(session._req_session, "request", side_effect=responses):
+        assert session.get("/dna/intent/api/v1/network-device") == {"response": {}}
+
+    url = "https://dnac/dna/intent/api/v1/network-device"
+    assert attempts == [
+        RetryAttempt("GET", url, 1, None, responses[0], 0),
+        RetryAttempt("GET", url, 2, 503, None, 0),
+        RetryAttempt("GET", url, 3, 200, None, None),
+    ]
+
+
+def test_session_does_not_retry_non_idempotent_requests():
+    session = _session(retry_policy=RetryPolicy(backoff_factor=0))
+
+    with patch.object(
+        session._req_session, "request", return_value=_response(503)
+    ) as request:
+        with pytest.raises(ApiError):
+            session.post("/dna/intent/api/v1/network-device", json={})
+    assert request.call_count == 1
+
+
+def test_default_policy_retries_a_failed_connection_once():
+    session = _session()
+
+    with patch.object(
+        session._req_session, "request", side_effect=requests.ConnectionError("reset")
+    ) as request:
+        with pytest.raises(dnacentersdkException):
+            session.post("/dna/intent/api/v1/network-device", json={})
+    assert request.call_count == 2
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import os
+from unittest.mock import patch
+
+import fastjsonschema
+import pytest
+
+from dnacentersdk.models import schema_cache
+from dnacentersdk.models.schema_cache import (
+    compile_schema,
+    schema_cache_key,
+    set_schema_cache_dir,
+)
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"name": {"type": "string", "pattern": "^[a-z]+$"}},
+}
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    set_schema_cache_dir(str(tmp_path))
+    yield tmp_path
+    set_schema_cache_dir(None)
+
+
+def test_compile_schema_without_cache_dir():
+    assert schema_cache.get_schema_cache_dir() is None
+    with patch.object(fastjsonschema, "compile_to_code") as compile_to_code:
+        validate = compile_schema(SCHEMA)
+    compile_to_code.assert_not_called()
+    assert validate({"name": "abc"}) == {"name": "abc"}
+
+
+def test_compile_schema_writes_and_reuses_cached_code(cache_dir):
+    validate = compile_schema(SCHEMA)
+    cached_file = cache_dir / "jsd_{}.py".format(schema_cache_key(SCHEMA))
+
+    assert os.path.isfile(cached_file)
+    assert validate({"name": "abc"}) == {"name": "abc"}
+    with pytest.raises(fastjsonschema.JsonSchemaException):
+        validate({"name": "ABC"})
+
+    with patch.object(fastjsonschema, "compile_to_code") as compile_to_code:
+        cached_validate = compile_schema(SCHEMA)
+    compile_to_code.assert_not_called()
+    with pytest.raises(fastjsonschema.JsonSchemaException):
+        cached_validate({"name": 1})
+
+
+def test_schema_cache_key_depends_on_schema_and_library_version():
+    assert schema_cache_key(SCHEMA) == schema_cache_key(dict(reversed(SCHEMA.items())))
+    assert schema_cache_key(SCHEMA) != schema_cache_key({"type": "object"})
+    key = schema_cache_key(SCHEMA)
+    with patch.object(fastjsonschema, "VERSION", "0.0.0"):
+        assert schema_cache_key(SCHEMA) != key
+
+
+def test_compile_schema_falls_back_when_cache_is_unusable(cache_dir):
+    with patch.object(
+        schema_cache, "_write_validator_code", side_effect=OSError("read-only")
+    ):
+        validate = compile_schema(SCHEMA)
+    assert validate({"name": "abc"}) == {"name": "abc"}
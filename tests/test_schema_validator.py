@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+import sys
+
+import pytest
+
+from dnacentersdk.api import DNACenterAPI
+from dnacentersdk.exceptions import MalformedRequest
+from dnacentersdk.models import schema_validator
+from dnacentersdk.models.schema_validator import (
+    NO_OP_VALIDATOR,
+    SchemaValidator,
+    get_json_schema_validator,
+    no_op_json_schema_validate,
+)
+
+ADD_DEVICE_MODEL = "jsd_fe3ec7651e79d891fce37a0d860_v3_1_6_0"
+ADD_DEVICE_MODULE = (
+    "dnacentersdk.models.validators.v3_1_6_0.jsd_fe3ec7651e79d891fce37a0d860"
+)
+
+
+def test_validators_are_loaded_on_first_use():
+    schema_validator._json_schema_validators.pop(("3.1.6.0", ADD_DEVICE_MODEL), None)
+    sys.modules.pop(ADD_DEVICE_MODULE, None)
+
+    validator = SchemaValidator("3.1.6.0")
+
+    assert validator.json_schema_validators == {}
+    assert ADD_DEVICE_MODULE not in sys.modules
+
+    json_schema_validator = validator.json_schema_validate(ADD_DEVICE_MODEL)
+
+    assert ADD_DEVICE_MODULE in sys.modules
+    with pytest.raises(MalformedRequest):
+        json_schema_validator.validate({"ipAddress": "10.0.0.1"})
+
+
+def test_validators_are_shared_between_instances():
+    first = SchemaValidator("3.1.6.0")
+    second = SchemaValidator("3.1.6.0")
+
+    assert first.json_schema_validate(ADD_DEVICE_MODEL) is first.json_schema_validate(
+        ADD_DEVICE_MODEL
+    )
+    assert (
+        first.json_schema_validate(ADD_DEVICE_MODEL)._validator
+        is second.json_schema_validate(ADD_DEVICE_MODEL)._validator
+        is get_json_schema_validator("3.1.6.0", ADD_DEVICE_MODEL)
+    )
+
+
+def test_unknown_model_falls_back_to_no_op_validator():
+    validator = SchemaValidator("3.1.6.0")
+
+    assert get_json_schema_validator("3.1.6.0", "jsd_unknown_v3_1_6_0") is None
+    assert validator.json_schema_validate("unknown") is NO_OP_VALIDATOR
+    assert (
+        validator.json_schema_validate("jsd_fe3ec7651e79d891fce37a0d860_v2_3_5_3")
+        is NO_OP_VALIDATOR
+    )
+    assert validator.validation_stats() == {}
+
+
+def test_load_validators_preloads_a_version():
+    validator = SchemaValidator("2.3.5.3")
+    validator.load_validators("2.3.5.3")
+
+    assert len(validator.json_schema_validators) == 165
+    assert all(
+        model.endswith("_v2_3_5_3") for model in validator.json_schema_validators
+    )
+
+
+def test_validation_stats_count_each_validation():
+    validator = SchemaValidator("3.1.6.0")
+    json_schema_validator = validator.json_schema_validate(ADD_DEVICE_MODEL)
+
+    json_schema_validator.validate({"ipAddress": ["10.0.0.1"]})
+    with pytest.raises(MalformedRequest):
+        json_schema_validator.validate({"ipAddress": "10.0.0.1"})
+
+    stats = validator.validation_stats()
+    assert list(stats) == [ADD_DEVICE_MODEL]
+    assert stats[ADD_DEVICE_MODEL].count == 2
+    assert stats[ADD_DEVICE_MODEL].total_time >= stats[ADD_DEVICE_MODEL].max_time > 0
+
+
+@pytest.mark.parametrize(
+    "validation, debug, validates",
+    [
+        ("full", False, True),
+        ("debug", True, True),
+        ("debug", False, False),
+        ("none", True, False),
+    ],
+)
+def test_api_validation_policy(validation, debug, validates):
+    api = DNACenterAPI(
+        username="user",
+        password="pass",
+        base_url="https://sandboxdnac.cisco.com:443",
+        version="3.1.6.0",
+        debug=debug,
+        validation=validation,
+    )
+
+    assert api.validation == validation
+    assert (api.devices._request_validator is no_op_json_schema_validate) is not validates
+    if not validates:
+        api.devices._request_validator(ADD_DEVICE_MODEL).validate({"ipAddress": 1})
+        assert api.validation_stats == {}
+    api.close()
+
+
+def test_api_rejects_unknown_validation_policy():
+    with pytest.raises(ValueError):
+        DNACenterAPI(username="user", password="pass", validation="sometimes")
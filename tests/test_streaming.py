@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+from collections import OrderedDict
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from dnacentersdk.models.mydict import MyDict
+from dnacentersdk.restsession import RestSession
+from dnacentersdk.streaming import StreamedItems, iter_json_items
+
+
+def _chunks(text, size):
+    data = text.encode("utf-8")
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+DOCUMENT = json.dumps(
+    {
+        "version": {"major": 1, "list": [1, "]"]},
+        "response": [
+            {"hostname": "sw-é-{}".format(i), "uptime": 12345678901 + i, "up": True}
+            for i in range(50)
+        ] + [3.25, None, "x,]", {"note": 'q"]}\\', "list": [[], {}]}, -1e-05],
+    },
+    indent=1,
+)
+
+
+@pytest.mark.parametrize("size", [1, 7, 4096])
+def test_items_are_parsed_across_chunk_boundaries(size):
+    items = list(iter_json_items(_chunks(DOCUMENT, size)))
+
+    assert items == json.loads(DOCUMENT)["response"]
+
+
+def test_items_are_parsed_once_with_loads():
+    loads = Mock(side_effect=json.loads)
+
+    items = list(iter_json_items(_chunks(DOCUMENT, 7), loads=loads))
+
+    assert items == json.loads(DOCUMENT)["response"]
+    assert loads.call_count == len(items)
+
+
+@pytest.mark.parametrize(
+    "text, items",
+    [
+        ('[1, {"a": 2}]', [1, {"a": 2}]),
+        ('{"response": []}', []),
+        ('{"response": {"id": 1}, "version": "1.0"}', [{"id": 1}]),
+        ('{"version": "1.0"}', []),
+        ("[]", []),
+    ],
+)
+def test_documents_without_a_response_array(text, items):
+    assert list(iter_json_items(_chunks(text, 3))) == items
+
+
+def test_invalid_documents_raise():
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_items(_chunks('{"response": [1, 2', 3)))
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_items(_chunks('{"response": [1 2]}', 3)))
+
+
+def _response(content):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response.raw = io.BytesIO(content)
+    response.request = requests.Request("GET", "https://dnac/").prepare()
+    return response
+
+
+def _session(**kwargs):
+    return RestSession(
+        get_access_token=lambda: "token",
+        base_url="https://dnac",
+        version="3.1.6.0",
+        user_agent="dnacentersdk",
+        **kwargs
+    )
+
+
+def test_session_streams_items_in_the_block():
+    session = _session()
+    response = _response(DOCUMENT.encode("utf-8"))
+    response.close = Mock(wraps=response.close)
+
+    with patch.object(session._req_session, "request", return_value=response) as request:
+        with session.stream_items(chunk_size=100):
+            items = session.get("/dna/intent/api/v1/network-device")
+
+    assert request.call_args[1]["stream"] is True
+    assert isinstance(items, StreamedItems)
+    first = next(items)
+    assert isinstance(first, MyDict) and first.hostname == "sw-é-0"
+    assert len(list(items)) == 54
+    response.close.assert_called()
+
+
+def test_post_returns_the_parsed_response():
+    session = _session()
+    response = _response(b'{"response": [{"id": 1}]}')
+
+    with patch.object(session._req_session, "request", return_value=response):
+        result = session.post("/dna/intent/api/v1/networkDevices/query", json={})
+
+    assert result == {"response": [{"id": 1}]}
+
+
+def test_post_streams_items_in_the_block():
+    session = _session()
+    response = _response(DOCUMENT.encode("utf-8"))
+
+    with patch.object(
+        session._req_session, "request", return_value=response
+    ) as request:
+        with session.stream_items():
+            items = session.post("/dna/intent/api/v1/networkDevices/query", json={})
+
+    assert request.call_args[1]["stream"] is True
+    assert isinstance(items, StreamedItems)
+    assert list(items)[:50] == json.loads(DOCUMENT)["response"][:50]
+
+
+def test_streamed_items_use_the_decoder_and_factory_of_the_session():
+    session = _session(
+        json_decoder="ordered",
+        object_factory=lambda model, json_data: ("wrapped", json_data),
+    )
+    response = _response(b'{"response": [{"b": 1, "a": 2}]}')
+
+    with patch.object(session._req_session, "request", return_value=response):
+        with session.stream_items():
+            items = list(session.get("/dna/intent/api/v1/network-device"))
+
+    assert items == [("wrapped", OrderedDict([("b", 1), ("a", 2)]))]
+    assert type(items[0][1]) is OrderedDict
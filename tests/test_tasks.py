@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from dnacentersdk.exceptions import TaskError
+from dnacentersdk.restsession import RestSession
+from dnacentersdk.tasks import AsyncTaskWaiter, TaskWaiter, task_id_of, task_status
+
+
+class FakeTaskAPI(object):
+    """The task APIs over tasks that are done after a number of ticks."""
+
+    def __init__(self, ticks, errors=()):
+        self.ticks = dict(ticks)
+        self.errors = set(errors)
+        self.bulk_calls = 0
+        self.task_calls = []
+
+    def tick(self):
+        for task_id in self.ticks:
+            self.ticks[task_id] -= 1
+
+    def _task(self, task_id):
+        task = {"id": task_id, "startTime": 1700000000000}
+        if self.ticks[task_id] <= 0:
+            task["endTime"] = 1700000001000
+            if task_id in self.errors:
+                task["isError"] = True
+                task["failureReason"] = "Device unreachable"
+        return task
+
+    def get_tasks(self, offset=None, limit=None, status=None, start_time=None, **kwargs):
+        """Returns task(s) based on filter criteria.
+
+        Args:
+            offset(int): offset query parameter. The first record to show for this page; the first record is
+                numbered 1.
+            limit(int): limit query parameter. The number of records to show for this page;The minimum is 1, and the
+                maximum is 500.
+        """
+        if offset == 1:
+            self.bulk_calls += 1
+        pending = [
+            {"id": task_id, "status": "PENDING"}
+            for task_id, left in sorted(self.ticks.items())
+            if left > 0
+        ]
+        return {"response": pending[offset - 1 : offset - 1 + limit]}
+
+    def get_task_by_id(self, task_id):
+        self.task_calls.append(task_id)
+        return {"response": self._task(task_id)}
+
+
+class TickingTaskAPI(FakeTaskAPI):
+    """FakeTaskAPI whose tasks tick at every status request of a task."""
+
+    def get_task_by_id(self, task_id):
+        self.ticks[task_id] -= 1
+        return super(TickingTaskAPI, self).get_task_by_id(task_id)
+
+
+def test_task_id_of_and_task_status():
+    assert task_id_of({"response": {"taskId": "t1", "url": "/task/t1"}}) == "t1"
+    assert task_id_of({"taskId": "t2"}) == "t2"
+    assert task_id_of({"response": []}) is None
+    assert task_status({"status": "success"}) == "SUCCESS"
+    assert task_status({"isError": True, "endTime": 1}) == "FAILURE"
+    assert task_status({"endTime": 1}) == "SUCCESS"
+    assert task_status({"progress": "running"}) == "PENDING"
+
+
+def test_waiter_batches_status_checks_and_yields_in_completion_order():
+    api = FakeTaskAPI({"slow": 3, "fast": 1, "failing": 2}, errors={"failing"})
+    waiter = TaskWaiter(api, interval=3600)
+    futures = [waiter.submit(task_id) for task_id in ("slow", "fast", "failing")]
+
+    completed = []
+    for _ in range(3):
+        api.tick()
+        assert waiter.poll() == 1
+        completed += [
+            f.task_id for f in futures if f.done() and f.task_id not in completed
+        ]
+    waiter.close()
+
+    assert completed == ["fast", "failing", "slow"]
+    assert futures[1].result()["endTime"] == 1700000001000
+    with pytest.raises(TaskError, match="Device unreachable"):
+        futures[2].result()
+    # A bulk query per check while several tasks are tracked, and each task
+    # fetched once, when done
+    assert api.bulk_calls == 2
+    assert sorted(api.task_calls) == ["failing", "fast", "slow"]
+    assert waiter.pending == []
+
+
+def test_waiter_polls_in_the_background():
+    api = TickingTaskAPI({"t1": 2, "t2": 3})
+    waiter = TaskWaiter(api, interval=0.001, max_interval=0.001, bulk=False)
+
+    futures = list(waiter.as_completed(["t2", "t1"]))
+
+    assert [future.task_id for future in futures] == ["t1", "t2"]
+    assert futures[1].result()["id"] == "t2"
+    assert waiter.wait("t1")["id"] == "t1"
+
+
+def test_waiter_times_out():
+    api = TickingTaskAPI({"t1": 1000})
+    waiter = TaskWaiter(api, interval=0.001, max_interval=0.001, bulk=False)
+
+    with pytest.raises(TimeoutError):
+        waiter.wait("t1", timeout=0.05)
+
+
+def test_waiter_backs_off_without_completions():
+    api = FakeTaskAPI({"t1": 1000})
+    waiter = TaskWaiter(api, interval=0.001, max_interval=0.004, backoff=2)
+    delays = []
+    original_wait = waiter._wakeup.wait
+
+    def wait(delay):
+        delays.append(delay)
+        if len(delays) == 5:
+            waiter.close()
+        return original_wait(0)
+
+    waiter._wakeup.wait = wait
+    future = waiter.submit("t1")
+    waiter._poller.join(5)
+
+    assert future.cancelled()
+    # The interval goes back to 0.001 after the task is submitted
+    assert delays[:5] == [0.001, 0.001, 0.002, 0.004, 0.004]
+
+
+def test_new_tasks_wake_the_poller():
+    api = TickingTaskAPI({"t1": 1000, "t2": 1})
+    waiter = TaskWaiter(api, interval=3600, bulk=False)
+    waiter.submit("t1")
+
+    assert waiter.submit("t2").result(5)["id"] == "t2"
+    waiter.close()
+
+
+class AsyncTickingTaskAPI(TickingTaskAPI):
+    async def get_task_by_id(self, task_id):
+        return super(AsyncTickingTaskAPI, self).get_task_by_id(task_id)
+
+
+def test_new_tasks_wake_the_async_poller():
+    api = AsyncTickingTaskAPI({"t1": 1000, "t2": 1})
+
+    async def wait():
+        waiter = AsyncTaskWaiter(api, interval=3600, bulk=False)
+        waiter.submit("t1")
+        await asyncio.sleep(0)
+        try:
+            return await asyncio.wait_for(waiter.wait("t2"), 5)
+        finally:
+            waiter.close()
+
+    assert asyncio.run(wait())["id"] == "t2"
+
+
+def test_operation_futures_block_returns_the_futures_of_tasks():
+    api = TickingTaskAPI({"t1": 1})
+    waiter = TaskWaiter(api, interval=0.001, max_interval=0.001)
+    session = RestSession(
+        get_access_token=lambda: "token",
+        base_url="https://dnac",
+        version="3.1.6.0",
+        user_agent="dnacentersdk",
+    )
+
+    def _response(body):
+        response = requests.Response()
+        response.status_code = 202
+        response.headers["Content-Type"] = "application/json"
+        response._content = body
+        response._content_consumed = True
+        response.request = requests.Request("POST", "https://dnac/").prepare()
+        return response
+
+    with patch.object(
+        session._req_session,
+        "request",
+        side_effect=[
+            _response(b'{"response": {"taskId": "t1", "url": "/task/t1"}}'),
+            _response(b'{"response": {"message": "no task"}}'),
+            _response(b'{"response": {"taskId": "t1", "url": "/task/t1"}}'),
+        ],
+    ):
+        with session.operation_futures(waiter):
+            future = session.post("/dna/intent/api/v1/compliance/", json={})
+            no_task = session.post("/dna/intent/api/v1/other", json={})
+        outside = session.post("/dna/intent/api/v1/compliance/", json={})
+
+    assert future.result(5)["id"] == "t1"
+    assert no_task == {"response": {"message": "no task"}}
+    assert outside["response"]["taskId"] == "t1"
+
+
+def test_waiter_tracks_business_api_executions():
+    class ExecutionAPI(object):
+        def get_business_api_execution_details(self, execution_id):
+            return {
+                "bapiExecutionId": execution_id,
+                "status": "FAILURE",
+                "bapiError": "Invalid site",
+            }
+
+    waiter = TaskWaiter(ExecutionAPI(), interval=0.001)
+
+    future = waiter.future_of({"executionId": "e1", "executionStatusUrl": "/e1"})
+
+    with pytest.raises(TaskError, match="Invalid site"):
+        future.result(5)
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+import json
+import multiprocessing
+import os
+import stat
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from unittest.mock import patch
+
+import pytest
+
+from dnacentersdk.api.authentication import Authentication
+from dnacentersdk.models.mydict import mydict_data_factory
+from dnacentersdk.token_store import (
+    CachedToken,
+    FileTokenStore,
+    MemoryTokenStore,
+    TokenStore,
+    token_store_key,
+)
+
+
+class AuthHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        self.server.auth_calls += 1
+        time.sleep(0.1)
+        body = json.dumps({"Token": "token-{}".format(self.server.auth_calls)})
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body.encode("utf-8"))
+
+
+@pytest.fixture
+def auth_server():
+    server = ThreadingHTTPServer(("localhost", 0), AuthHandler)
+    server.auth_calls = 0
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _authenticate(base_url, directory):
+    authentication = Authentication(
+        base_url, mydict_data_factory, token_store=FileTokenStore(directory)
+    )
+    return authentication.authentication_api("user", "pass").Token
+
+
+def test_file_token_store(tmp_path):
+    store = FileTokenStore(str(tmp_path / "tokens"))
+    key = token_store_key("https://dnac", "user", "pass")
+
+    assert store.get(key) is None
+    store.set(key, "token", 123.0)
+    assert store.get(key) == CachedToken("token", 123.0)
+    assert stat.S_IMODE(os.stat(tmp_path / "tokens" / (key + ".json")).st_mode) == 0o600
+    store.delete(key)
+    store.delete(key)
+    assert store.get(key) is None
+
+
+def test_token_store_key_depends_on_url_and_credentials():
+    key = token_store_key("https://dnac", "user", "pass")
+
+    assert "pass" not in key
+    assert key != token_store_key("https://dnac", "user", "other")
+    assert key != token_store_key("https://other", "user", "pass")
+    assert key != token_store_key("https://dnac", encoded_auth="dXNlcjpwYXNz")
+
+
+def test_clients_share_a_valid_token():
+    store = MemoryTokenStore()
+    tokens = iter([{"Token": "token-1"}, {"Token": "token-2"}])
+    first = Authentication("https://dnac", mydict_data_factory, token_store=store)
+    second = Authentication("https://dnac", mydict_data_factory, token_store=store)
+
+    with patch.object(
+        Authentication, "_request_access_token", side_effect=lambda *a: next(tokens)
+    ) as request_access_token:
+        assert first.authentication_api("user", "pass").Token == "token-1"
+        assert second.authentication_api("user", "pass").Token == "token-1"
+        assert request_access_token.call_count == 1
+
+        # Asking again means the token was rejected, get and share a new one
+        assert second.authentication_api("user", "pass").Token == "token-2"
+        assert first.authentication_api("user", "pass").Token == "token-2"
+        assert request_access_token.call_count == 2
+
+
+def test_expired_tokens_are_not_shared():
+    store = MemoryTokenStore()
+    key = token_store_key("https://dnac", "user", "pass")
+    store.set(key, "expired", time.time() + 10)
+    authentication = Authentication(
+        "https://dnac", mydict_data_factory, token_store=store
+    )
+
+    with patch.object(
+        Authentication, "_request_access_token", return_value={"Token": "new"}
+    ):
+        assert authentication.authentication_api("user", "pass").Token == "new"
+    assert store.get(key).token == "new"
+
+
+def test_stored_tokens_expire_with_the_margin_of_the_session():
+    store = MemoryTokenStore()
+    key = token_store_key("https://dnac", "user", "pass")
+    store.set(key, "stored", time.time() + 120)
+    first = Authentication("https://dnac", mydict_data_factory, token_store=store)
+    second = Authentication("https://dnac", mydict_data_factory, token_store=store)
+
+    with patch.object(
+        Authentication, "_request_access_token", return_value={"Token": "new"}
+    ):
+        assert first.authentication_api("user", "pass").Token == "stored"
+        token = second.authentication_api(
+            "user", "pass", token_refresh_margin=300
+        ).Token
+    assert token == "new"
+
+
+def test_incomplete_token_stores_cannot_be_created():
+    class GetOnlyTokenStore(TokenStore):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnlyTokenStore()
+
+
+def test_processes_share_one_authentication(auth_server, tmp_path):
+    base_url = "http://localhost:{}".format(auth_server.server_address[1])
+    context = multiprocessing.get_context("spawn")
+
+    with context.Pool(4) as pool:
+        tokens = pool.starmap(_authenticate, [(base_url, str(tmp_path))] * 4)
+
+    assert tokens == ["token-1"] * 4
+    assert auth_server.auth_calls == 1
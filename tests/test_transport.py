@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from dnacentersdk.exceptions import ReplayError
+from dnacentersdk.restsession import RestSession
+from dnacentersdk.transport import (
+    exchange_key,
+    recording_session,
+    replay_session,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.startswith("/dna/intent/api/v1/network-device"):
+            body = json.dumps({"response": [{"id": "1"}], "path": self.path})
+            content_type = "application/json"
+        else:
+            body = b"\x00\xff binary"
+            content_type = "application/octet-stream"
+        body = body.encode("utf-8") if isinstance(body, str) else body
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        body = json.dumps({"Token": "secret-token"}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Set-Cookie", "JSESSIONID=secret-session")
+        self.send_header("X-Auth-Token", "secret-token")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield "http://127.0.0.1:{}".format(server.server_address[1])
+    server.shutdown()
+
+
+def _session(base_url, session):
+    return RestSession(
+        get_access_token=lambda: "token",
+        base_url=base_url,
+        version="3.1.6.0",
+        user_agent="dnacentersdk",
+        session=session,
+    )
+
+
+def test_exchange_key_ignores_the_host_and_query_order():
+    assert exchange_key("get", "https://a/x?b=2&a=1") == exchange_key(
+        "GET", "http://b:8080/x?a=1&b=2"
+    )
+
+
+@pytest.mark.parametrize("filename", ["exchanges.jsonl", "exchanges.jsonl.gz"])
+def test_record_and_replay(server, tmp_path, filename):
+    path = str(tmp_path / filename)
+    recording = recording_session(path)
+    session = _session(server, recording)
+    recorded = session.get(
+        "/dna/intent/api/v1/network-device", params={"offset": 1, "limit": 2}
+    )
+    recording.post(server + "/dna/system/api/v1/auth/token")
+    recorded_file = recording.get(server + "/file").content
+    session.close()
+
+    replay = replay_session(path)
+    session = _session("https://dnac", replay)
+    assert (
+        session.get(
+            "/dna/intent/api/v1/network-device", params={"limit": 2, "offset": 1}
+        )
+        == recorded
+    )
+    token = replay.post("https://dnac/dna/system/api/v1/auth/token")
+    assert token.json() == {"Token": "<redacted>"}
+    assert token.headers["Set-Cookie"] == "<redacted>"
+    assert token.headers["X-Auth-Token"] == "<redacted>"
+    assert token.headers["Content-Type"] == "application/json"
+    assert replay.get("https://dnac/file").content == recorded_file
+    assert recorded_file == b"\x00\xff binary"
+
+    with pytest.raises(ReplayError):
+        session.get(
+            "/dna/intent/api/v1/network-device", params={"offset": 1, "limit": 2}
+        )
+
+
+def test_replay_repeats(tmp_path):
+    path = tmp_path / "exchanges.jsonl"
+    path.write_text(
+        json.dumps(
+            {
+                "method": "GET",
+                "path": "/dna/intent/api/v1/site",
+                "query": "",
+                "status": 200,
+                "reason": "OK",
+                "headers": {"Content-Type": "application/json"},
+                "body": '{"response": []}',
+                "encoding": None,
+                "elapsed": 0.5,
+            }
+        )
+        + "\n"
+    )
+    session = _session("https://dnac", replay_session(str(path), repeat=True))
+
+    for _ in range(3):
+        assert session.get("/dna/intent/api/v1/site") == {"response": []}